@@ -70,6 +70,9 @@ export interface ConfigExportResponse {
     max_tokens: number;
     top_p?: number;
     top_k?: number;
+    cache_responses?: boolean;
+    hedge_requests?: boolean;
+    fallbacks?: { provider: string; model: string; api_key_id: string }[];
     enabled: boolean;
   }>;
 }
@@ -507,7 +510,14 @@ function mapBackendConfigToFrontend(data: Record<string, unknown>): AgentLLMConf
       maxTokens: (data.settings as Record<string, unknown>)?.max_tokens as number ?? data.max_tokens as number ?? 4096,
       topP: (data.settings as Record<string, unknown>)?.top_p as number ?? data.top_p as number,
       topK: (data.settings as Record<string, unknown>)?.top_k as number ?? data.top_k as number,
+      cacheResponses: (data.settings as Record<string, unknown>)?.cache_responses as boolean ?? data.cache_responses as boolean,
+      hedgeRequests: (data.settings as Record<string, unknown>)?.hedge_requests as boolean ?? data.hedge_requests as boolean,
     },
+    fallbacks: ((data.fallbacks as Record<string, unknown>[]) ?? []).map((target) => ({
+      provider: target.provider as LLMProvider,
+      model: target.model as string,
+      apiKeyId: (target.api_key_id as string) || '',
+    })),
     enabled: data.enabled as boolean ?? true,
   };
 }
@@ -540,6 +550,13 @@ function mapConfigToBackend(config: Partial<AgentLLMConfig>): Record<string, unk
   if (config.model !== undefined) result.model = config.model;
   if (config.apiKeyId !== undefined) result.api_key_id = config.apiKeyId;
   if (config.enabled !== undefined) result.enabled = config.enabled;
+  if (config.fallbacks !== undefined) {
+    result.fallbacks = config.fallbacks.map((target) => ({
+      provider: target.provider,
+      model: target.model,
+      api_key_id: target.apiKeyId,
+    }));
+  }
 
   if (config.settings) {
     // Settings must be a nested object with snake_case keys
@@ -548,6 +565,8 @@ function mapConfigToBackend(config: Partial<AgentLLMConfig>): Record<string, unk
     if (config.settings.maxTokens !== undefined) settings.max_tokens = config.settings.maxTokens;
     if (config.settings.topP !== undefined) settings.top_p = config.settings.topP;
     if (config.settings.topK !== undefined) settings.top_k = config.settings.topK;
+    if (config.settings.cacheResponses !== undefined) settings.cache_responses = config.settings.cacheResponses;
+    if (config.settings.hedgeRequests !== undefined) settings.hedge_requests = config.settings.hedgeRequests;
     result.settings = settings;
   }
 
@@ -629,6 +648,13 @@ export async function exportConfig(): Promise<ConfigExportResponse> {
         max_tokens: config.settings.maxTokens,
         top_p: config.settings.topP,
         top_k: config.settings.topK,
+        cache_responses: config.settings.cacheResponses,
+        hedge_requests: config.settings.hedgeRequests,
+        fallbacks: config.fallbacks?.map((target) => ({
+          provider: target.provider,
+          model: target.model,
+          api_key_id: target.apiKeyId,
+        })),
         enabled: config.enabled,
       };
     }
@@ -700,7 +726,14 @@ export async function importConfig(config: ConfigExportResponse): Promise<Import
           maxTokens: agentConfig.max_tokens,
           topP: agentConfig.top_p,
           topK: agentConfig.top_k,
+          cacheResponses: agentConfig.cache_responses,
+          hedgeRequests: agentConfig.hedge_requests,
         },
+        fallbacks: agentConfig.fallbacks?.map((target) => ({
+          provider: target.provider as LLMProvider,
+          model: target.model,
+          apiKeyId: target.api_key_id,
+        })),
         enabled: agentConfig.enabled,
       });
       count++;
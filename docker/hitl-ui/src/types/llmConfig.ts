@@ -172,6 +172,10 @@ export interface AgentLLMSettings {
   topP?: number;
   /** Top K for sampling (optional) */
   topK?: number;
+  /** Reuse responses to repeated deterministic calls (optional) */
+  cacheResponses?: boolean;
+  /** Send a backup request when the first one is slow (optional) */
+  hedgeRequests?: boolean;
 }
 
 /** Default settings for agents */
@@ -181,6 +185,16 @@ export const DEFAULT_AGENT_SETTINGS: AgentLLMSettings = {
   topP: 1.0,
 };
 
+/** Fallback provider and model for an agent */
+export interface LLMTarget {
+  /** Provider to use */
+  provider: LLMProvider;
+  /** Model ID to use */
+  model: string;
+  /** API key ID to use */
+  apiKeyId: string;
+}
+
 /** Per-agent LLM configuration */
 export interface AgentLLMConfig {
   /** Agent role */
@@ -193,6 +207,8 @@ export interface AgentLLMConfig {
   apiKeyId: string;
   /** LLM settings */
   settings: AgentLLMSettings;
+  /** Fallback targets, in order of preference (optional) */
+  fallbacks?: LLMTarget[];
   /** Whether this agent is enabled */
   enabled: boolean;
 }
@@ -1,4 +1,4 @@
-"""Core domain models for aSDLC.
+"""Context pack models for aSDLC.
 
 Shared models used across multiple modules.
 """
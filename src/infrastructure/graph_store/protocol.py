@@ -6,6 +6,7 @@ by different backends (Redis, Neo4j, etc.).
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import Protocol
 
 
@@ -21,6 +22,7 @@ class GraphStore(Protocol):
     - GRAPH:EDGE:{from_id}:{to_id}:{edge_type} -> Hash with edge properties
     - GRAPH:NEIGHBORS:{node_id}:{edge_type} -> Set of connected node IDs
     - GRAPH:ALL_NODES -> Set of all node IDs
+    - GRAPH:REMOVED_EDGES -> Set of removed {from_id}:{to_id}:{edge_type} edges
     """
 
     async def add_node(self, node_id: str, properties: dict) -> None:
@@ -52,6 +54,28 @@ class GraphStore(Protocol):
         """
         ...
 
+    async def add_edges(
+        self,
+        edges: list[tuple[str, str, str, dict | None]],
+        *,
+        creator: str | None = None,
+        refresh: Collection[str] = (),
+    ) -> None:
+        """Add many edges at once.
+
+        Equivalent to calling add_edge() for each edge, but lets backends
+        write them in one round trip.
+
+        Args:
+            edges: (from_id, to_id, edge_type, properties) tuples.
+            creator: If set, edges are written on behalf of this creator:
+                removed edges and edges with another created_by are left
+                alone, and existing edges only get their ``refresh``
+                properties overwritten.
+            refresh: Properties overwritten on existing edges of creator.
+        """
+        ...
+
     async def remove_edge(
         self,
         from_id: str,
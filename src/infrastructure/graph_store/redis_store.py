@@ -8,16 +8,21 @@ Key patterns:
 - GRAPH:EDGE:{from_id}:{to_id}:{edge_type} -> Hash with edge properties
 - GRAPH:NEIGHBORS:{node_id}:{edge_type} -> Set of connected node IDs
 - GRAPH:ALL_NODES -> Set of all node IDs
+- GRAPH:REMOVED_EDGES -> Set of removed {from_id}:{to_id}:{edge_type} edges,
+  in both directions, so automatic correlation does not add them back
 """
 
 from __future__ import annotations
 
 import json
 import os
+from collections.abc import Collection
 from typing import Any
 
 from redis.asyncio import Redis
 
+REMOVED_EDGES_KEY = "GRAPH:REMOVED_EDGES"
+
 
 class RedisGraphStore:
     """Store correlation graph in Redis using sets and hashes.
@@ -127,6 +132,82 @@ class RedisGraphStore:
                 mapping={k: self._serialize_value(v) for k, v in properties.items()},
             )
 
+    async def add_edges(
+        self,
+        edges: list[tuple[str, str, str, dict | None]],
+        *,
+        creator: str | None = None,
+        refresh: Collection[str] = (),
+    ) -> None:
+        """Add many edges in one pipelined round trip.
+
+        With a creator, the edges are first checked in one more round
+        trip; properties outside ``refresh`` are then written with HSETNX
+        so existing edges keep them.
+
+        Args:
+            edges: (from_id, to_id, edge_type, properties) tuples, as for
+                add_edge().
+            creator: If set, edges are written on behalf of this creator:
+                removed edges and edges with another created_by are left
+                alone, and existing edges only get their ``refresh``
+                properties overwritten.
+            refresh: Properties overwritten on existing edges of creator.
+        """
+        redis = await self._get_redis()
+        if edges and creator is not None:
+            edges = await self._writable_edges(redis, edges, creator)
+        if not edges:
+            return
+        async with redis.pipeline(transaction=False) as pipe:
+            for from_id, to_id, edge_type, properties in edges:
+                pipe.sadd(f"GRAPH:NEIGHBORS:{from_id}:{edge_type}", to_id)
+                pipe.sadd(f"GRAPH:NEIGHBORS:{to_id}:{edge_type}", from_id)
+                if not properties:
+                    continue
+                edge_key = f"GRAPH:EDGE:{from_id}:{to_id}:{edge_type}"
+                mapping = {k: self._serialize_value(v) for k, v in properties.items()}
+                if creator is None:
+                    pipe.hset(edge_key, mapping=mapping)
+                    continue
+                refreshed = {k: v for k, v in mapping.items() if k in refresh}
+                if refreshed:
+                    pipe.hset(edge_key, mapping=refreshed)
+                for key, value in mapping.items():
+                    if key not in refreshed:
+                        pipe.hsetnx(edge_key, key, value)
+            await pipe.execute()
+
+    async def _writable_edges(
+        self,
+        redis: Redis,
+        edges: list[tuple[str, str, str, dict | None]],
+        creator: str,
+    ) -> list[tuple[str, str, str, dict | None]]:
+        """Drop edges that were removed or were created by someone else.
+
+        Args:
+            redis: The Redis client.
+            edges: (from_id, to_id, edge_type, properties) tuples.
+            creator: Creator the edges are written for.
+
+        Returns:
+            list: The edges creator may write.
+        """
+        async with redis.pipeline(transaction=False) as pipe:
+            for from_id, to_id, edge_type, _ in edges:
+                pipe.sismember(REMOVED_EDGES_KEY, f"{from_id}:{to_id}:{edge_type}")
+                pipe.hget(f"GRAPH:EDGE:{from_id}:{to_id}:{edge_type}", "created_by")
+                pipe.hget(f"GRAPH:EDGE:{to_id}:{from_id}:{edge_type}", "created_by")
+            replies = await pipe.execute()
+
+        writable = []
+        for i, edge in enumerate(edges):
+            removed, *created_by = replies[3 * i : 3 * i + 3]
+            if not removed and all(c is None or c == creator for c in created_by):
+                writable.append(edge)
+        return writable
+
     async def remove_edge(
         self,
         from_id: str,
@@ -148,6 +229,12 @@ class RedisGraphStore:
         await redis.srem(f"GRAPH:NEIGHBORS:{to_id}:{edge_type}", from_id)
         await redis.delete(f"GRAPH:EDGE:{from_id}:{to_id}:{edge_type}")
         await redis.delete(f"GRAPH:EDGE:{to_id}:{from_id}:{edge_type}")
+        if removed > 0:
+            await redis.sadd(
+                REMOVED_EDGES_KEY,
+                f"{from_id}:{to_id}:{edge_type}",
+                f"{to_id}:{from_id}:{edge_type}",
+            )
         return removed > 0
 
     async def get_neighbors(
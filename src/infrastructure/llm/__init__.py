@@ -3,23 +3,98 @@
 This package provides infrastructure for LLM integration including:
 - Model discovery for vendor APIs
 - Base client interface and implementations
+- Prompt segments with provider prompt-caching hints
 - Client factory for role-based configuration
+- Shared rate limiting for provider calls
+- Response caching for deterministic calls
+- Latency-aware routing, failover and hedged requests across targets
+- Streaming structured (JSON) output with early validation
+- Offline batch execution for bulk workloads
+- Metrics and tracing for LLM calls
 """
 
-from src.infrastructure.llm.model_discovery import ModelDiscoveryService
-from src.infrastructure.llm.base_client import BaseLLMClient, LLMResponse, StreamChunk
+from src.infrastructure.llm.base_client import (
+    BaseLLMClient,
+    LLMResponse,
+    PromptSegment,
+    StreamChunk,
+)
+from src.infrastructure.llm.batch import (
+    BatchConfig,
+    BatchItemResult,
+    BatchRequest,
+    LLMBatchManager,
+    LocalBatchProvider,
+    batch_provider_for,
+)
 from src.infrastructure.llm.factory import (
-    LLMClientFactory,
     LLMClientError,
+    LLMClientFactory,
     get_llm_client_factory,
 )
+from src.infrastructure.llm.instrumentation import (
+    InstrumentedLLMClient,
+    llm_call_context,
+)
+from src.infrastructure.llm.model_discovery import ModelDiscoveryService
+from src.infrastructure.llm.rate_limiter import (
+    LLMPriority,
+    LLMRateLimiter,
+    RateLimitConfig,
+    get_llm_rate_limiter,
+    llm_priority,
+)
+from src.infrastructure.llm.response_cache import (
+    CachingLLMClient,
+    LLMResponseCache,
+    ResponseCacheConfig,
+    get_llm_response_cache,
+)
+from src.infrastructure.llm.routing import (
+    LatencyTracker,
+    RoutingConfig,
+    RoutingLLMClient,
+)
+from src.infrastructure.llm.structured_output import (
+    IncrementalJSONParser,
+    JSONStreamError,
+    RedisProgressPublisher,
+    StructuredProgress,
+    generate_structured,
+)
 
 __all__ = [
     "ModelDiscoveryService",
     "BaseLLMClient",
     "LLMResponse",
+    "PromptSegment",
     "StreamChunk",
     "LLMClientFactory",
     "LLMClientError",
     "get_llm_client_factory",
+    "LLMPriority",
+    "LLMRateLimiter",
+    "RateLimitConfig",
+    "get_llm_rate_limiter",
+    "llm_priority",
+    "CachingLLMClient",
+    "LLMResponseCache",
+    "ResponseCacheConfig",
+    "get_llm_response_cache",
+    "InstrumentedLLMClient",
+    "llm_call_context",
+    "LatencyTracker",
+    "RoutingConfig",
+    "RoutingLLMClient",
+    "IncrementalJSONParser",
+    "JSONStreamError",
+    "RedisProgressPublisher",
+    "StructuredProgress",
+    "generate_structured",
+    "BatchConfig",
+    "BatchItemResult",
+    "BatchRequest",
+    "LLMBatchManager",
+    "LocalBatchProvider",
+    "batch_provider_for",
 ]
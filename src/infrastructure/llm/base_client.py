@@ -2,23 +2,100 @@
 
 This module defines the abstract base class for LLM client implementations.
 All provider-specific clients (Anthropic, OpenAI, Google) must implement this interface.
+
+Clients given an LLMRateLimiter wait for their provider budget before each
+call and retry transient provider errors, honouring ``retry-after``.
+
+System prompts and user prompts may be given as a list of PromptSegment
+instead of a string. Segments marked ``cache=True`` end a prefix that is
+stable across calls, which clients map to the provider's prompt caching.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+from src.infrastructure.llm.rate_limiter import (
+    RateLimitScope,
+    is_rate_limit_error,
+    is_retryable_error,
+    resolve_priority,
+    retry_after_seconds,
+)
+
+if TYPE_CHECKING:
+    from src.infrastructure.llm.rate_limiter import LLMPriority, LLMRateLimiter
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PromptSegment:
+    """A piece of a system prompt or user prompt.
+
+    Attributes:
+        text: Segment text.
+        cache: Whether the prompt up to and including this segment is the
+            same across calls and should be cached by the provider.
+    """
+
+    text: str
+    cache: bool = False
+
+
+PromptInput = str | Sequence[PromptSegment]
+
+
+def prompt_text(value: PromptInput | None) -> str:
+    """Flatten a prompt into plain text.
+
+    Args:
+        value: A prompt string or a list of segments.
+
+    Returns:
+        str: The prompt, with segments separated by blank lines.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return "\n\n".join(segment.text for segment in value if segment.text)
+
+
+def cache_ordered(value: PromptInput | None) -> PromptInput | None:
+    """Move cacheable segments ahead of the others.
+
+    Providers with automatic prefix caching only reuse a prefix that is
+    identical across calls, so stable segments must come first. The
+    relative order within each group is kept.
+
+    Args:
+        value: A prompt string or a list of segments.
+
+    Returns:
+        The prompt with cacheable segments first; strings are unchanged.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return [s for s in value if s.cache] + [s for s in value if not s.cache]
+
+
 @dataclass
 class LLMResponse:
     """Response from an LLM call.
 
+    ``usage`` holds ``input_tokens`` (all prompt tokens, cached or not) and
+    ``output_tokens``. Providers with prompt caching add
+    ``cache_read_input_tokens`` and ``cache_creation_input_tokens``, the
+    parts of ``input_tokens`` read from and written to the cache.
+
     Attributes:
         content: Text content of the response.
         model: Model that generated the response.
@@ -33,6 +110,15 @@ class LLMResponse:
     usage: dict[str, int] = field(default_factory=dict)
     stop_reason: str | None = None
 
+    @property
+    def cached_input_tokens(self) -> int:
+        """Return the prompt tokens served from the provider's cache.
+
+        Returns:
+            int: Cached input tokens, 0 if none or not reported.
+        """
+        return self.usage.get("cache_read_input_tokens", 0)
+
 
 @dataclass
 class StreamChunk:
@@ -63,6 +149,7 @@ class BaseLLMClient(ABC):
         max_tokens: Maximum tokens in response.
         top_p: Nucleus sampling parameter.
         top_k: Top-k sampling parameter.
+        rate_limiter: Shared rate limiter, if calls are budgeted.
     """
 
     def __init__(
@@ -73,6 +160,8 @@ class BaseLLMClient(ABC):
         max_tokens: int = 16384,
         top_p: float | None = None,
         top_k: int | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
+        max_retries: int | None = None,
     ) -> None:
         """Initialize the base LLM client.
 
@@ -83,6 +172,12 @@ class BaseLLMClient(ABC):
             max_tokens: Maximum tokens in response.
             top_p: Nucleus sampling parameter.
             top_k: Top-k sampling parameter.
+            rate_limiter: Optional shared rate limiter. When given, calls
+                wait for budget and transient errors are retried here
+                instead of in the provider SDK.
+            max_retries: Retries of transient errors per call. Defaults to
+                the rate limiter's configuration; 0 raises them at once,
+                e.g. so a router can fail over.
         """
         self._api_key = api_key
         self._model = model
@@ -90,6 +185,8 @@ class BaseLLMClient(ABC):
         self._max_tokens = max_tokens
         self._top_p = top_p
         self._top_k = top_k
+        self._rate_limiter = rate_limiter
+        self._max_retries = max_retries
 
     @property
     @abstractmethod
@@ -128,11 +225,29 @@ class BaseLLMClient(ABC):
         """
         return self._max_tokens
 
+    @property
+    def rate_limiter(self) -> LLMRateLimiter | None:
+        """Return the shared rate limiter, if any.
+
+        Returns:
+            LLMRateLimiter | None: The rate limiter.
+        """
+        return self._rate_limiter
+
+    @property
+    def rate_limit_scope(self) -> RateLimitScope:
+        """Return the budget this client's calls draw on.
+
+        Returns:
+            RateLimitScope: Provider, model and API key digest.
+        """
+        return RateLimitScope.for_client(self.provider, self._model, self._api_key)
+
     @abstractmethod
     async def generate(
         self,
-        prompt: str = "",
-        system: str | None = None,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
         messages: list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         **kwargs: Any,
@@ -140,8 +255,10 @@ class BaseLLMClient(ABC):
         """Generate a response from the LLM.
 
         Args:
-            prompt: The user prompt (for simple single-turn).
-            system: Optional system message.
+            prompt: The user prompt (for simple single-turn), as a string
+                or a list of PromptSegment.
+            system: Optional system message, as a string or a list of
+                PromptSegment.
             messages: Optional conversation history.
             tools: Optional tool definitions.
             **kwargs: Additional model-specific parameters.
@@ -154,8 +271,8 @@ class BaseLLMClient(ABC):
     @abstractmethod
     async def generate_stream(
         self,
-        prompt: str = "",
-        system: str | None = None,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
         messages: list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         **kwargs: Any,
@@ -163,8 +280,10 @@ class BaseLLMClient(ABC):
         """Generate a streaming response from the LLM.
 
         Args:
-            prompt: The user prompt (for simple single-turn).
-            system: Optional system message.
+            prompt: The user prompt (for simple single-turn), as a string
+                or a list of PromptSegment.
+            system: Optional system message, as a string or a list of
+                PromptSegment.
             messages: Optional conversation history.
             tools: Optional tool definitions.
             **kwargs: Additional model-specific parameters.
@@ -176,8 +295,8 @@ class BaseLLMClient(ABC):
 
     def _build_messages(
         self,
-        prompt: str,
-        system: str | None,
+        prompt: PromptInput,
+        system: PromptInput | None,
         messages: list[dict[str, Any]] | None,
     ) -> list[dict[str, Any]]:
         """Build a message list from prompt and optional conversation history.
@@ -195,7 +314,249 @@ class BaseLLMClient(ABC):
         if messages:
             result.extend(messages)
 
-        if prompt:
-            result.append({"role": "user", "content": prompt})
+        text = prompt_text(prompt)
+        if text:
+            result.append({"role": "user", "content": text})
 
         return result
+
+    def _sdk_options(self) -> dict[str, Any]:
+        """Return options for the provider SDK client.
+
+        With a rate limiter, retries are handled by this client, so the
+        SDK's own retries are disabled. Without one, an explicit
+        ``max_retries`` is passed on to the SDK.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for the SDK client.
+        """
+        if self._rate_limiter is not None:
+            return {"max_retries": 0}
+        if self._max_retries is not None:
+            return {"max_retries": self._max_retries}
+        return {}
+
+    async def _call_with_rate_limit(
+        self,
+        call: Callable[[], Awaitable[LLMResponse]],
+        estimated_tokens: int,
+        priority: LLMPriority | str | None = None,
+    ) -> LLMResponse:
+        """Run an API call within the rate limit, retrying transient errors.
+
+        Args:
+            call: Performs the API call and returns the parsed response.
+            estimated_tokens: Estimated tokens the call will consume.
+            priority: Priority class; defaults to the context priority.
+
+        Returns:
+            LLMResponse: The model's response.
+        """
+        limiter = self._rate_limiter
+        if limiter is None:
+            return await call()
+
+        scope = self.rate_limit_scope
+        resolved = resolve_priority(priority)
+        attempt = 0
+        while True:
+            await limiter.acquire(scope, estimated_tokens, resolved)
+            try:
+                response = await call()
+            except Exception as exc:
+                await limiter.record_usage(scope, estimated_tokens, 0)
+                await self._before_retry(exc, attempt)
+                attempt += 1
+                continue
+
+            used = response.usage.get("input_tokens", 0) + response.usage.get(
+                "output_tokens", 0
+            )
+            await limiter.record_usage(scope, estimated_tokens, used)
+            return response
+
+    async def _stream_with_rate_limit(
+        self,
+        open_stream: Callable[[], AsyncIterator[StreamChunk]],
+        estimated_tokens: int,
+        priority: LLMPriority | str | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a response within the rate limit.
+
+        Transient errors are retried only until the first chunk arrives;
+        later errors are raised, since the caller has consumed output.
+
+        Args:
+            open_stream: Starts the streaming API call.
+            estimated_tokens: Estimated tokens the call will consume.
+            priority: Priority class; defaults to the context priority.
+
+        Yields:
+            StreamChunk: Chunks of the response as they arrive.
+        """
+        limiter = self._rate_limiter
+        if limiter is None:
+            async for chunk in open_stream():
+                yield chunk
+            return
+
+        scope = self.rate_limit_scope
+        resolved = resolve_priority(priority)
+        attempt = 0
+        while True:
+            await limiter.acquire(scope, estimated_tokens, resolved)
+            started = False
+            used = 0
+            try:
+                async for chunk in open_stream():
+                    started = True
+                    if chunk.usage:
+                        used = chunk.usage.get("input_tokens", 0) + chunk.usage.get(
+                            "output_tokens", 0
+                        )
+                    yield chunk
+            except Exception as exc:
+                await limiter.record_usage(scope, estimated_tokens, used)
+                if started:
+                    raise
+                await self._before_retry(exc, attempt)
+                attempt += 1
+                continue
+
+            await limiter.record_usage(scope, estimated_tokens, used or estimated_tokens)
+            return
+
+    async def _before_retry(self, exc: Exception, attempt: int) -> None:
+        """Decide whether to retry a failed call and wait before retrying.
+
+        Rate limit errors hold back every caller of the same budget for the
+        ``retry-after`` period, also when they are not retried. Other
+        transient errors back off exponentially with jitter.
+
+        Args:
+            exc: The error raised by the call.
+            attempt: Number of retries already made.
+
+        Raises:
+            Exception: *exc*, if it is not retryable, retries are exhausted,
+                or the provider asks for a longer wait than allowed.
+        """
+        limiter = self._rate_limiter
+        if limiter is None or not is_retryable_error(exc):
+            raise exc
+        max_retries = (
+            limiter.config.max_retries if self._max_retries is None else self._max_retries
+        )
+
+        delay = retry_after_seconds(exc)
+        if delay is None:
+            delay = limiter.config.backoff_base_seconds * 2**attempt
+            delay *= random.uniform(0.5, 1.0)
+        retry = attempt < max_retries and delay <= limiter.config.max_retry_wait_seconds
+        if is_rate_limit_error(exc):
+            # acquire() waits out the penalty for this and every other caller
+            await limiter.penalize(
+                self.rate_limit_scope, min(delay, limiter.config.max_retry_wait_seconds)
+            )
+        if not retry:
+            raise exc
+
+        logger.warning(
+            f"{self.provider} call failed ({type(exc).__name__}), "
+            f"retry {attempt + 1}/{max_retries} in {delay:.1f}s"
+        )
+        if not is_rate_limit_error(exc):
+            await asyncio.sleep(delay)
+
+
+class DelegatingLLMClient(BaseLLMClient):
+    """BaseLLMClient that forwards calls to another client.
+
+    Base for wrappers that add behaviour around a provider client, such
+    as caching or instrumentation. Provider, model, settings and rate
+    limit scope are those of the wrapped client.
+    """
+
+    def __init__(self, inner: BaseLLMClient) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            inner: The client calls are forwarded to.
+        """
+        super().__init__(
+            api_key=inner._api_key,
+            model=inner.model,
+            temperature=inner.temperature,
+            max_tokens=inner.max_tokens,
+            top_p=inner._top_p,
+            top_k=inner._top_k,
+            rate_limiter=inner.rate_limiter,
+        )
+        self._inner = inner
+
+    @property
+    def provider(self) -> str:
+        """Return the provider name of the wrapped client.
+
+        Returns:
+            str: Provider name.
+        """
+        return self._inner.provider
+
+    @property
+    def inner(self) -> BaseLLMClient:
+        """Return the wrapped client.
+
+        Returns:
+            BaseLLMClient: The client calls are forwarded to.
+        """
+        return self._inner
+
+    async def generate(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a response with the wrapped client.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to the wrapped client).
+
+        Returns:
+            LLMResponse: The model's response.
+        """
+        return await self._inner.generate(
+            prompt=prompt, system=system, messages=messages, tools=tools, **kwargs
+        )
+
+    async def generate_stream(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a response from the wrapped client.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to the wrapped client).
+
+        Yields:
+            StreamChunk: Chunks of the response as they arrive.
+        """
+        async for chunk in self._inner.generate_stream(
+            prompt=prompt, system=system, messages=messages, tools=tools, **kwargs
+        ):
+            yield chunk
@@ -0,0 +1,882 @@
+"""Offline batch execution for bulk LLM workloads.
+
+Bulk jobs such as classifying hundreds of ideas do not need answers within
+seconds. LLMBatchManager submits them as provider batch jobs instead of
+one call per item:
+
+- AnthropicBatchProvider uses the Message Batches API.
+- OpenAIBatchProvider uses the Batch API with a JSONL input file.
+- LocalBatchProvider runs items in-process, through a client at BATCH
+  rate limit priority or a stub responder. It serves providers without a
+  batch API and tests without network.
+
+Provider batches are billed at about half the price of interactive calls
+and do not count against the interactive rate limits. Results usually
+arrive within minutes and at most within 24 hours.
+
+Batches are tracked in Redis, so a restarted worker resumes polling. When
+a batch ends, each item's result goes to the handler the batch was
+submitted with. Handlers are registered by name, since functions cannot
+be stored in Redis. Completion is detected by polling with run() or
+poll_once(). A webhook endpoint can call process() directly.
+
+Key patterns:
+    - {prefix}{batch_id} - Hash: provider, model, provider_batch_id,
+      handler, status, counts and timestamps
+    - {prefix}{batch_id}:items - Hash: custom_id -> item metadata JSON
+    - {prefix}{batch_id}:lock - Claim held while results are fetched and
+      dispatched, so processes rarely fetch the same results twice
+    - {prefix}{batch_id}:dispatched - Hash: custom_id -> outcome, set with
+      HSETNX before an item's result goes to the handler, so each result
+      is dispatched once even if the claim expires mid-dispatch
+    - {prefix}active:{namespace} - Set of batch ids still running
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from src.infrastructure.llm.base_client import (
+    BaseLLMClient,
+    DelegatingLLMClient,
+    LLMResponse,
+    PromptInput,
+    prompt_text,
+)
+from src.infrastructure.llm.instrumentation import estimate_cost
+from src.infrastructure.llm.rate_limiter import LLMPriority
+from src.infrastructure.metrics.definitions import LLM_BATCH_ITEMS, LLM_COST, LLM_TOKENS
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+    from src.infrastructure.llm.clients.anthropic_client import AnthropicClient
+    from src.infrastructure.llm.clients.openai_client import OpenAIClient
+
+
+logger = logging.getLogger(__name__)
+
+# Price of batch calls relative to interactive calls
+BATCH_PRICE_FACTOR = 0.5
+
+# OpenAI batch endpoint and completion window
+OPENAI_BATCH_ENDPOINT = "/v1/chat/completions"
+OPENAI_COMPLETION_WINDOW = "24h"
+
+
+@dataclass(frozen=True)
+class BatchConfig:
+    """Batch execution configuration.
+
+    Attributes:
+        enabled: Run bulk workloads as batches.
+        min_items: Smallest workload worth submitting as a batch.
+        max_batch_size: Most items per provider batch; larger workloads
+            are split.
+        poll_interval_seconds: Time between status checks of running batches.
+        lock_seconds: How long a process may hold a batch while
+            dispatching its results. Another process may then resume the
+            dispatch; items already dispatched are skipped.
+        result_ttl_seconds: Lifetime of a batch record once it ends.
+        key_prefix: Redis key prefix.
+    """
+
+    enabled: bool = False
+    min_items: int = 20
+    max_batch_size: int = 10000
+    poll_interval_seconds: float = 60.0
+    lock_seconds: int = 600
+    result_ttl_seconds: int = 7 * 86400
+    key_prefix: str = "asdlc:llm:batch:"
+
+    @classmethod
+    def from_env(cls) -> BatchConfig:
+        """Create batch configuration from environment variables.
+
+        Environment variables:
+            LLM_BATCH_ENABLED: Run bulk workloads as batches (default: false)
+            LLM_BATCH_MIN_ITEMS: Smallest batched workload (default: 20)
+            LLM_BATCH_MAX_SIZE: Most items per provider batch (default: 10000)
+            LLM_BATCH_POLL_INTERVAL_SECONDS: Status check interval (default: 60)
+            LLM_BATCH_LOCK_SECONDS: Result dispatch claim (default: 600)
+            LLM_BATCH_RESULT_TTL_SECONDS: Ended batch lifetime (default: 7 days)
+            LLM_BATCH_KEY_PREFIX: Redis key prefix
+        """
+        return cls(
+            enabled=os.getenv("LLM_BATCH_ENABLED", "false").lower() == "true",
+            min_items=int(os.getenv("LLM_BATCH_MIN_ITEMS", "20")),
+            max_batch_size=int(os.getenv("LLM_BATCH_MAX_SIZE", "10000")),
+            poll_interval_seconds=float(os.getenv("LLM_BATCH_POLL_INTERVAL_SECONDS", "60")),
+            lock_seconds=int(os.getenv("LLM_BATCH_LOCK_SECONDS", "600")),
+            result_ttl_seconds=int(
+                os.getenv("LLM_BATCH_RESULT_TTL_SECONDS", str(7 * 86400))
+            ),
+            key_prefix=os.getenv("LLM_BATCH_KEY_PREFIX", "asdlc:llm:batch:"),
+        )
+
+
+@dataclass
+class BatchRequest:
+    """One item of a batch.
+
+    Attributes:
+        custom_id: Identifier of the item, unique within the batch.
+        prompt: The user prompt.
+        system: Optional system message.
+        max_tokens: Maximum response tokens; the client default if None.
+        temperature: Sampling temperature; the client default if None.
+        metadata: JSON-serializable data handed back with the result.
+    """
+
+    custom_id: str
+    prompt: PromptInput
+    system: PromptInput | None = None
+    max_tokens: int | None = None
+    temperature: float | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def call_kwargs(self) -> dict[str, Any]:
+        """Return the generation parameters set on this request."""
+        kwargs: dict[str, Any] = {}
+        if self.max_tokens is not None:
+            kwargs["max_tokens"] = self.max_tokens
+        if self.temperature is not None:
+            kwargs["temperature"] = self.temperature
+        return kwargs
+
+
+@dataclass
+class BatchItemResult:
+    """Result of one batch item.
+
+    Attributes:
+        custom_id: Identifier of the item.
+        response: The response, if the item succeeded.
+        error: Why the item failed, if it did.
+        metadata: Metadata the item was submitted with.
+    """
+
+    custom_id: str
+    response: LLMResponse | None = None
+    error: str | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        """Return whether the item produced a response."""
+        return self.response is not None
+
+
+class BatchStatus(str, Enum):
+    """Status of a batch."""
+
+    PROCESSING = "processing"
+    ENDED = "ended"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+BatchResultHandler = Callable[[BatchItemResult], Awaitable[None] | None]
+
+
+class BatchProvider(ABC):
+    """Submits batches to one provider and model and collects their results."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the provider name."""
+
+    @property
+    @abstractmethod
+    def model(self) -> str:
+        """Return the model the batches run on."""
+
+    @abstractmethod
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        """Submit a batch.
+
+        Args:
+            requests: The items of the batch.
+
+        Returns:
+            str: The provider's batch id.
+        """
+
+    @abstractmethod
+    async def poll(self, batch_id: str) -> BatchStatus:
+        """Return the status of a batch.
+
+        ENDED means results can be fetched, even if some items failed.
+
+        Args:
+            batch_id: The provider's batch id.
+        """
+
+    @abstractmethod
+    async def results(self, batch_id: str) -> list[BatchItemResult]:
+        """Return the results of an ended batch.
+
+        Args:
+            batch_id: The provider's batch id.
+        """
+
+    @abstractmethod
+    async def cancel(self, batch_id: str) -> None:
+        """Cancel a running batch.
+
+        Args:
+            batch_id: The provider's batch id.
+        """
+
+
+class AnthropicBatchProvider(BatchProvider):
+    """Batches through the Anthropic Message Batches API.
+
+    Requests are built as AnthropicClient builds them, including prompt
+    cache breakpoints.
+    """
+
+    def __init__(self, client: AnthropicClient) -> None:
+        """Initialize the provider.
+
+        Args:
+            client: Client whose API key, model and settings are used.
+        """
+        self._client = client
+
+    @property
+    def name(self) -> str:
+        """Return the provider name."""
+        return "anthropic"
+
+    @property
+    def model(self) -> str:
+        """Return the model the batches run on."""
+        return self._client.model
+
+    def _batches(self) -> Any:
+        """Return the SDK's message batches resource."""
+        return self._client.sdk_client.messages.batches
+
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        """Submit a message batch."""
+        items = [
+            {
+                "custom_id": request.custom_id,
+                "params": self._client._build_request(
+                    request.prompt, request.system, None, None, request.call_kwargs()
+                ),
+            }
+            for request in requests
+        ]
+        batch = await self._batches().create(requests=items)
+        return batch.id
+
+    async def poll(self, batch_id: str) -> BatchStatus:
+        """Return the status of a message batch."""
+        batch = await self._batches().retrieve(batch_id)
+        if batch.processing_status == "ended":
+            return BatchStatus.ENDED
+        return BatchStatus.PROCESSING
+
+    async def results(self, batch_id: str) -> list[BatchItemResult]:
+        """Return the results of an ended message batch."""
+        from src.infrastructure.llm.clients.anthropic_client import response_from_message
+
+        results = []
+        async for entry in await self._batches().results(batch_id):
+            outcome = entry.result
+            if outcome.type == "succeeded":
+                results.append(
+                    BatchItemResult(
+                        custom_id=entry.custom_id,
+                        response=response_from_message(outcome.message),
+                    )
+                )
+            else:
+                error = getattr(outcome, "error", None)
+                results.append(
+                    BatchItemResult(
+                        custom_id=entry.custom_id,
+                        error=f"{outcome.type}: {error}" if error else outcome.type,
+                    )
+                )
+        return results
+
+    async def cancel(self, batch_id: str) -> None:
+        """Cancel a message batch."""
+        await self._batches().cancel(batch_id)
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """Batches through the OpenAI Batch API.
+
+    Requests are uploaded as a JSONL file of chat completion calls; results
+    are read from the batch's output and error files.
+    """
+
+    def __init__(self, client: OpenAIClient) -> None:
+        """Initialize the provider.
+
+        Args:
+            client: Client whose API key, model and settings are used.
+        """
+        self._client = client
+
+    @property
+    def name(self) -> str:
+        """Return the provider name."""
+        return "openai"
+
+    @property
+    def model(self) -> str:
+        """Return the model the batches run on."""
+        return self._client.model
+
+    def _body(self, request: BatchRequest) -> dict[str, Any]:
+        """Build the chat completion body of one item."""
+        body: dict[str, Any] = {
+            "model": self._client.model,
+            "max_tokens": request.max_tokens or self._client.max_tokens,
+            "temperature": (
+                request.temperature
+                if request.temperature is not None
+                else self._client.temperature
+            ),
+            "messages": self._client._build_openai_messages(
+                request.prompt, request.system, None
+            ),
+        }
+        if self._client._top_p is not None:
+            body["top_p"] = self._client._top_p
+        return body
+
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        """Upload the input file and create a batch."""
+        sdk = self._client.sdk_client
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": OPENAI_BATCH_ENDPOINT,
+                    "body": self._body(request),
+                }
+            )
+            for request in requests
+        ]
+        input_file = await sdk.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = await sdk.batches.create(
+            input_file_id=input_file.id,
+            endpoint=OPENAI_BATCH_ENDPOINT,
+            completion_window=OPENAI_COMPLETION_WINDOW,
+        )
+        return batch.id
+
+    async def poll(self, batch_id: str) -> BatchStatus:
+        """Return the status of a batch.
+
+        Expired and cancelled batches count as ended when they produced
+        output, so the items that finished are not lost.
+        """
+        batch = await self._client.sdk_client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            return BatchStatus.ENDED
+        if batch.status in ("expired", "cancelled"):
+            if batch.output_file_id or batch.error_file_id:
+                return BatchStatus.ENDED
+            return BatchStatus.CANCELLED
+        if batch.status == "failed":
+            return BatchStatus.FAILED
+        return BatchStatus.PROCESSING
+
+    async def results(self, batch_id: str) -> list[BatchItemResult]:
+        """Return the results of an ended batch."""
+        from openai.types.chat import ChatCompletion
+
+        from src.infrastructure.llm.clients.openai_client import response_from_completion
+
+        sdk = self._client.sdk_client
+        batch = await sdk.batches.retrieve(batch_id)
+        results = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await sdk.files.content(file_id)
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    completion = ChatCompletion.model_validate(response["body"])
+                    results.append(
+                        BatchItemResult(
+                            custom_id=entry["custom_id"],
+                            response=response_from_completion(completion),
+                        )
+                    )
+                else:
+                    error = entry.get("error") or response.get("body", {}).get("error")
+                    results.append(
+                        BatchItemResult(
+                            custom_id=entry["custom_id"],
+                            error=json.dumps(error) if error else "request failed",
+                        )
+                    )
+        return results
+
+    async def cancel(self, batch_id: str) -> None:
+        """Cancel a batch."""
+        await self._client.sdk_client.batches.cancel(batch_id)
+
+
+class LocalBatchProvider(BatchProvider):
+    """Runs batches in-process.
+
+    With a client, items are sent through it at BATCH rate limit priority,
+    for providers without a batch API. Without one, a responder produces
+    each response, which lets batch workloads be tested without network.
+
+    Running batches live in memory and are lost when the process exits.
+    """
+
+    def __init__(
+        self,
+        client: BaseLLMClient | None = None,
+        responder: Callable[[BatchRequest], str] | None = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            client: Client to send items through.
+            responder: Produces the response content of an item when there
+                is no client; the default echoes the prompt.
+            max_concurrency: Items of a batch run at the same time.
+        """
+        self._client = client
+        self._responder = responder or (lambda request: prompt_text(request.prompt))
+        self._max_concurrency = max_concurrency
+        self._batches: dict[str, asyncio.Task[list[BatchItemResult]]] = {}
+
+    @property
+    def name(self) -> str:
+        """Return the provider name."""
+        return "local"
+
+    @property
+    def model(self) -> str:
+        """Return the model the batches run on."""
+        return self._client.model if self._client is not None else "local"
+
+    async def submit(self, requests: Sequence[BatchRequest]) -> str:
+        """Start running a batch in the background."""
+        batch_id = f"local-{uuid.uuid4().hex[:12]}"
+        self._batches[batch_id] = asyncio.create_task(self._run(list(requests)))
+        return batch_id
+
+    async def _run(self, requests: list[BatchRequest]) -> list[BatchItemResult]:
+        """Run every item of a batch."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run_one(request: BatchRequest) -> BatchItemResult:
+            async with semaphore:
+                try:
+                    if self._client is None:
+                        response = LLMResponse(
+                            content=self._responder(request), model=self.model
+                        )
+                    else:
+                        response = await self._client.generate(
+                            prompt=request.prompt,
+                            system=request.system,
+                            priority=LLMPriority.BATCH,
+                            **request.call_kwargs(),
+                        )
+                except Exception as e:
+                    return BatchItemResult(custom_id=request.custom_id, error=str(e))
+                return BatchItemResult(custom_id=request.custom_id, response=response)
+
+        return list(await asyncio.gather(*(run_one(r) for r in requests)))
+
+    def _task(self, batch_id: str) -> asyncio.Task[list[BatchItemResult]]:
+        """Return the task running a batch."""
+        task = self._batches.get(batch_id)
+        if task is None:
+            raise KeyError(f"Unknown local batch: {batch_id}")
+        return task
+
+    async def poll(self, batch_id: str) -> BatchStatus:
+        """Return the status of a local batch."""
+        task = self._batches.get(batch_id)
+        if task is None:
+            # Lost with a previous process
+            return BatchStatus.FAILED
+        if not task.done():
+            return BatchStatus.PROCESSING
+        if task.cancelled():
+            return BatchStatus.CANCELLED
+        return BatchStatus.ENDED
+
+    async def results(self, batch_id: str) -> list[BatchItemResult]:
+        """Return the results of a finished local batch."""
+        task = self._task(batch_id)
+        del self._batches[batch_id]
+        return task.result()
+
+    async def cancel(self, batch_id: str) -> None:
+        """Cancel a local batch."""
+        self._task(batch_id).cancel()
+
+
+def batch_provider_for(client: BaseLLMClient) -> BatchProvider:
+    """Return the batch provider for a client's provider and model.
+
+    Wrappers are looked through; a routing client batches on its primary
+    target. Providers without a batch API get a LocalBatchProvider that
+    sends items through the client at BATCH priority.
+
+    Args:
+        client: A client from the LLM client factory.
+
+    Returns:
+        BatchProvider: Provider for the client's API key and model.
+    """
+    from src.infrastructure.llm.clients.anthropic_client import AnthropicClient
+    from src.infrastructure.llm.clients.openai_client import OpenAIClient
+    from src.infrastructure.llm.routing import RoutingLLMClient
+
+    target = client
+    while True:
+        if isinstance(target, DelegatingLLMClient):
+            target = target.inner
+        elif isinstance(target, RoutingLLMClient):
+            target = target.targets[0]
+        else:
+            break
+
+    if isinstance(target, AnthropicClient):
+        return AnthropicBatchProvider(target)
+    if isinstance(target, OpenAIClient):
+        return OpenAIBatchProvider(target)
+    return LocalBatchProvider(client)
+
+
+class LLMBatchManager:
+    """Submits batches, tracks them in Redis and dispatches their results.
+
+    Each manager serves one provider and model. Its namespace separates
+    its running batches from those of other managers sharing Redis.
+
+    Usage:
+        manager = LLMBatchManager(redis_client, batch_provider_for(client), "classification")
+        manager.register_handler("classify", on_result)
+        await manager.submit(requests, handler="classify")
+        await manager.run()  # polls until cancelled
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        provider: BatchProvider,
+        namespace: str = "default",
+        config: BatchConfig | None = None,
+    ) -> None:
+        """Initialize the batch manager.
+
+        Args:
+            redis_client: Redis client for batch tracking.
+            provider: Provider batches are submitted to.
+            namespace: Name of the workload, also used as the metric role.
+            config: Batch configuration; read from the environment if None.
+        """
+        self._redis = redis_client
+        self._provider = provider
+        self._namespace = namespace
+        self._config = config or BatchConfig.from_env()
+        self._handlers: dict[str, BatchResultHandler] = {}
+
+    @property
+    def config(self) -> BatchConfig:
+        """Return the batch configuration."""
+        return self._config
+
+    @property
+    def provider(self) -> BatchProvider:
+        """Return the batch provider."""
+        return self._provider
+
+    def _key(self, batch_id: str, suffix: str = "") -> str:
+        """Return a Redis key of a batch."""
+        return f"{self._config.key_prefix}{batch_id}{suffix}"
+
+    @property
+    def _active_key(self) -> str:
+        """Return the key of the set of running batches."""
+        return f"{self._config.key_prefix}active:{self._namespace}"
+
+    def register_handler(self, name: str, handler: BatchResultHandler) -> None:
+        """Register a handler for the results of batches.
+
+        Args:
+            name: Name batches are submitted with.
+            handler: Called with each item's result, sync or async.
+        """
+        self._handlers[name] = handler
+
+    async def submit(self, requests: Sequence[BatchRequest], handler: str) -> list[str]:
+        """Submit items as one or more batches.
+
+        Args:
+            requests: The items; custom ids must be unique.
+            handler: Name of the registered handler for the results.
+
+        Returns:
+            list[str]: Ids of the submitted batches.
+
+        Raises:
+            ValueError: If the handler is unknown or custom ids repeat.
+        """
+        if handler not in self._handlers:
+            raise ValueError(f"No batch result handler registered as '{handler}'")
+        if len({r.custom_id for r in requests}) != len(requests):
+            raise ValueError("Batch custom ids must be unique")
+
+        batch_ids = []
+        size = self._config.max_batch_size
+        for start in range(0, len(requests), size):
+            chunk = requests[start : start + size]
+            provider_batch_id = await self._provider.submit(chunk)
+            batch_id = f"batch-{uuid.uuid4().hex[:12]}"
+            await self._redis.hset(
+                self._key(batch_id, ":items"),
+                mapping={r.custom_id: json.dumps(r.metadata) for r in chunk},
+            )
+            await self._redis.hset(
+                self._key(batch_id),
+                mapping={
+                    "batch_id": batch_id,
+                    "namespace": self._namespace,
+                    "provider": self._provider.name,
+                    "model": self._provider.model,
+                    "provider_batch_id": provider_batch_id,
+                    "handler": handler,
+                    "status": BatchStatus.PROCESSING.value,
+                    "total": len(chunk),
+                    "succeeded": 0,
+                    "failed": 0,
+                    "created_at": datetime.now(UTC).isoformat(),
+                },
+            )
+            await self._redis.sadd(self._active_key, batch_id)
+            batch_ids.append(batch_id)
+            logger.info(
+                f"Submitted {self._provider.name} batch {batch_id} "
+                f"({provider_batch_id}) with {len(chunk)} items for '{handler}'"
+            )
+        return batch_ids
+
+    async def get_batch(self, batch_id: str) -> dict[str, str] | None:
+        """Return the record of a batch.
+
+        Args:
+            batch_id: The batch id returned by submit().
+
+        Returns:
+            dict | None: Batch fields, or None if unknown or expired.
+        """
+        raw = await self._redis.hgetall(self._key(batch_id))
+        if not raw:
+            return None
+        return {_decode(k): _decode(v) for k, v in raw.items()}
+
+    async def poll_once(self) -> int:
+        """Check every running batch and dispatch the results of ended ones.
+
+        Returns:
+            int: Number of batches that ended.
+        """
+        ended = 0
+        for member in await self._redis.smembers(self._active_key):
+            batch_id = _decode(member)
+            try:
+                if await self.process(batch_id):
+                    ended += 1
+            except Exception as e:
+                logger.error(f"Failed to process batch {batch_id}: {e}")
+        return ended
+
+    async def process(self, batch_id: str) -> bool:
+        """Check a batch and dispatch its results if it ended.
+
+        Safe to call from several processes and repeatedly, e.g. from a
+        provider webhook: each item's dispatch is recorded with HSETNX
+        before its handler runs, so results are dispatched once.
+
+        Args:
+            batch_id: The batch id returned by submit().
+
+        Returns:
+            bool: True if the batch has ended.
+        """
+        record = await self.get_batch(batch_id)
+        if record is None:
+            await self._redis.srem(self._active_key, batch_id)
+            return True
+        if record["status"] != BatchStatus.PROCESSING.value:
+            await self._redis.srem(self._active_key, batch_id)
+            return True
+        if record["provider"] != self._provider.name:
+            logger.warning(
+                f"Batch {batch_id} belongs to provider {record['provider']}, "
+                f"not {self._provider.name}"
+            )
+            return False
+
+        provider_batch_id = record["provider_batch_id"]
+        status = await self._provider.poll(provider_batch_id)
+        if status == BatchStatus.PROCESSING:
+            return False
+
+        claimed = await self._redis.set(
+            self._key(batch_id, ":lock"), "1", nx=True, ex=self._config.lock_seconds
+        )
+        if not claimed:
+            return False
+
+        items = {
+            _decode(k): json.loads(_decode(v))
+            for k, v in (await self._redis.hgetall(self._key(batch_id, ":items"))).items()
+        }
+        if status == BatchStatus.ENDED:
+            results = await self._provider.results(provider_batch_id)
+        else:
+            results = []
+        seen = {r.custom_id for r in results}
+        results += [
+            BatchItemResult(custom_id=custom_id, error=f"batch {status.value}")
+            for custom_id in items
+            if custom_id not in seen
+        ]
+
+        handler = self._handlers.get(record["handler"])
+        dispatched_key = self._key(batch_id, ":dispatched")
+        succeeded = failed = 0
+        for result in results:
+            result.metadata = items.get(result.custom_id, {})
+            outcome = "succeeded" if result.succeeded else "failed"
+            if result.succeeded:
+                succeeded += 1
+            else:
+                failed += 1
+            if not await self._redis.hsetnx(dispatched_key, result.custom_id, outcome):
+                # Dispatched by a process whose claim expired
+                continue
+            if result.succeeded:
+                self._record_usage(result.response)
+            LLM_BATCH_ITEMS.labels(
+                provider=self._provider.name,
+                model=self._provider.model,
+                status="success" if result.succeeded else "error",
+            ).inc()
+            if handler is None:
+                continue
+            try:
+                handled = handler(result)
+                if inspect.isawaitable(handled):
+                    await handled
+            except Exception as e:
+                logger.error(
+                    f"Batch {batch_id} handler failed for item {result.custom_id}: {e}"
+                )
+        if handler is None:
+            logger.error(
+                f"No handler registered as '{record['handler']}'; "
+                f"results of batch {batch_id} were dropped"
+            )
+
+        final_status = status if status != BatchStatus.ENDED or succeeded else BatchStatus.FAILED
+        await self._redis.hset(
+            self._key(batch_id),
+            mapping={
+                "status": final_status.value,
+                "succeeded": succeeded,
+                "failed": failed,
+                "completed_at": datetime.now(UTC).isoformat(),
+            },
+        )
+        for suffix in ("", ":items", ":dispatched"):
+            await self._redis.expire(self._key(batch_id, suffix), self._config.result_ttl_seconds)
+        await self._redis.srem(self._active_key, batch_id)
+        logger.info(
+            f"Batch {batch_id} {final_status.value}: {succeeded} succeeded, {failed} failed"
+        )
+        return True
+
+    def _record_usage(self, response: LLMResponse | None) -> None:
+        """Count the tokens and batch-priced cost of a response."""
+        if response is None or not response.usage:
+            return
+        labels = {
+            "role": self._namespace,
+            "provider": self._provider.name,
+            "model": self._provider.model,
+        }
+        for kind, key in (
+            ("input", "input_tokens"),
+            ("output", "output_tokens"),
+            ("cache_read", "cache_read_input_tokens"),
+            ("cache_creation", "cache_creation_input_tokens"),
+        ):
+            count = response.usage.get(key, 0)
+            if count:
+                LLM_TOKENS.labels(**labels, type=kind).inc(count)
+        cost = estimate_cost(self._provider.name, self._provider.model, response.usage)
+        if cost:
+            LLM_COST.labels(**labels).inc(cost * BATCH_PRICE_FACTOR)
+
+    async def cancel(self, batch_id: str) -> None:
+        """Cancel a running batch.
+
+        Items that had not finished are reported to the handler as failed
+        when the batch is next processed.
+
+        Args:
+            batch_id: The batch id returned by submit().
+        """
+        record = await self.get_batch(batch_id)
+        if record is None or record["status"] != BatchStatus.PROCESSING.value:
+            return
+        await self._provider.cancel(record["provider_batch_id"])
+
+    async def run(self) -> None:
+        """Poll running batches until cancelled."""
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Batch polling failed: {e}")
+            await asyncio.sleep(self._config.poll_interval_seconds)
+
+
+def _decode(value: bytes | str) -> str:
+    """Decode a Redis value."""
+    return value.decode() if isinstance(value, bytes) else value
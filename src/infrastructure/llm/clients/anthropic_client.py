@@ -2,22 +2,34 @@
 
 This module provides the Anthropic (Claude) implementation of BaseLLMClient.
 Uses the anthropic SDK for API calls.
+
+Prompt segments marked for caching become ``cache_control`` breakpoints.
+A plain system string is cached as a whole unless ``cache_system=False``.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from src.infrastructure.llm.base_client import (
     BaseLLMClient,
     LLMResponse,
+    PromptInput,
+    PromptSegment,
     StreamChunk,
 )
+from src.infrastructure.llm.rate_limiter import estimate_tokens
+
+if TYPE_CHECKING:
+    from src.infrastructure.llm.rate_limiter import LLMRateLimiter
 
 
 logger = logging.getLogger(__name__)
 
+# The API accepts at most this many cache_control blocks per request
+MAX_CACHE_BREAKPOINTS = 4
+
 
 class AnthropicClient(BaseLLMClient):
     """Anthropic API client for Claude models.
@@ -40,6 +52,9 @@ class AnthropicClient(BaseLLMClient):
         max_tokens: int = 16384,
         top_p: float | None = None,
         top_k: int | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
+        sdk_client: Any | None = None,
+        max_retries: int | None = None,
     ) -> None:
         """Initialize the Anthropic client.
 
@@ -50,6 +65,11 @@ class AnthropicClient(BaseLLMClient):
             max_tokens: Maximum tokens in response.
             top_p: Nucleus sampling parameter.
             top_k: Top-k sampling parameter.
+            rate_limiter: Optional shared rate limiter.
+            sdk_client: Optional anthropic.AsyncAnthropic to share, with its
+                connection pool, between clients using the same API key.
+            max_retries: Retries of transient errors per call; defaults to
+                the rate limiter's configuration.
         """
         super().__init__(
             api_key=api_key,
@@ -58,8 +78,10 @@ class AnthropicClient(BaseLLMClient):
             max_tokens=max_tokens,
             top_p=top_p,
             top_k=top_k,
+            rate_limiter=rate_limiter,
+            max_retries=max_retries,
         )
-        self._client = None
+        self._client = sdk_client
 
     def _get_client(self) -> Any:
         """Get or create the anthropic client.
@@ -70,9 +92,20 @@ class AnthropicClient(BaseLLMClient):
         if self._client is None:
             import anthropic
 
-            self._client = anthropic.AsyncAnthropic(api_key=self._api_key)
+            self._client = anthropic.AsyncAnthropic(
+                api_key=self._api_key, **self._sdk_options()
+            )
         return self._client
 
+    @property
+    def sdk_client(self) -> Any:
+        """Return the SDK client, creating it if needed.
+
+        Returns:
+            anthropic.AsyncAnthropic: The client instance.
+        """
+        return self._get_client()
+
     @property
     def provider(self) -> str:
         """Return the provider name.
@@ -82,32 +115,36 @@ class AnthropicClient(BaseLLMClient):
         """
         return "anthropic"
 
-    async def generate(
+    def _build_request(
         self,
-        prompt: str = "",
-        system: str | None = None,
-        messages: list[dict[str, Any]] | None = None,
-        tools: list[dict[str, Any]] | None = None,
-        **kwargs: Any,
-    ) -> LLMResponse:
-        """Generate a response from Claude.
+        prompt: PromptInput,
+        system: PromptInput | None,
+        messages: list[dict[str, Any]] | None,
+        tools: list[dict[str, Any]] | None,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build request parameters with prompt cache breakpoints.
 
         Args:
             prompt: The user prompt.
             system: Optional system message.
             messages: Optional conversation history.
             tools: Optional tool definitions.
-            **kwargs: Additional parameters (passed to API).
+            kwargs: Additional call parameters.
 
         Returns:
-            LLMResponse: The model's response.
+            dict[str, Any]: Keyword arguments for the messages API.
         """
-        client = self._get_client()
+        api_messages = list(messages or [])
+        prompt_blocks: list[dict[str, Any]] = []
+        if isinstance(prompt, str):
+            if prompt:
+                api_messages.append({"role": "user", "content": prompt})
+        else:
+            prompt_blocks = _text_blocks(prompt)
+            if prompt_blocks:
+                api_messages.append({"role": "user", "content": prompt_blocks})
 
-        # Build messages
-        api_messages = self._build_messages(prompt, system, messages)
-
-        # Build request parameters
         params: dict[str, Any] = {
             "model": self._model,
             "max_tokens": kwargs.get("max_tokens", self._max_tokens),
@@ -115,8 +152,15 @@ class AnthropicClient(BaseLLMClient):
             "messages": api_messages,
         }
 
+        system_blocks: list[dict[str, Any]] = []
         if system:
-            params["system"] = system
+            if isinstance(system, str):
+                system = [PromptSegment(system, cache=kwargs.get("cache_system", True))]
+            system_blocks = _text_blocks(system)
+        if system_blocks:
+            params["system"] = system_blocks
+
+        _limit_breakpoints(system_blocks + prompt_blocks)
 
         if self._top_p is not None:
             params["top_p"] = self._top_p
@@ -127,39 +171,51 @@ class AnthropicClient(BaseLLMClient):
         if tools:
             params["tools"] = tools
 
+        return params
+
+    async def generate(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a response from Claude.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to API). ``priority``
+                sets the rate limit priority class; ``cache_system=False``
+                stops a plain system string being cached.
+
+        Returns:
+            LLMResponse: The model's response.
+        """
+        client = self._get_client()
+
+        params = self._build_request(prompt, system, messages, tools, kwargs)
+        api_messages = params["messages"]
+
         logger.debug(f"Anthropic API call: model={self._model}, messages={len(api_messages)}")
 
-        response = await client.messages.create(**params)
-
-        # Extract content
-        content = ""
-        tool_calls = []
-
-        for block in response.content:
-            if hasattr(block, "text"):
-                content += block.text
-            elif hasattr(block, "type") and block.type == "tool_use":
-                tool_calls.append({
-                    "id": block.id,
-                    "name": block.name,
-                    "input": block.input,
-                })
-
-        return LLMResponse(
-            content=content,
-            model=response.model,
-            tool_calls=tool_calls,
-            usage={
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
-            },
-            stop_reason=response.stop_reason,
+        async def call() -> LLMResponse:
+            response = await client.messages.create(**params)
+            return response_from_message(response)
+
+        return await self._call_with_rate_limit(
+            call,
+            estimated_tokens=estimate_tokens(system, api_messages, tools),
+            priority=kwargs.get("priority"),
         )
 
     async def generate_stream(
         self,
-        prompt: str = "",
-        system: str | None = None,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
         messages: list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         **kwargs: Any,
@@ -171,49 +227,124 @@ class AnthropicClient(BaseLLMClient):
             system: Optional system message.
             messages: Optional conversation history.
             tools: Optional tool definitions.
-            **kwargs: Additional parameters (passed to API).
+            **kwargs: Additional parameters (passed to API). ``priority``
+                sets the rate limit priority class; ``cache_system=False``
+                stops a plain system string being cached.
 
         Yields:
             StreamChunk: Chunks of the response as they arrive.
         """
         client = self._get_client()
 
-        # Build messages
-        api_messages = self._build_messages(prompt, system, messages)
+        params = self._build_request(prompt, system, messages, tools, kwargs)
+        api_messages = params["messages"]
 
-        # Build request parameters
-        params: dict[str, Any] = {
-            "model": self._model,
-            "max_tokens": kwargs.get("max_tokens", self._max_tokens),
-            "temperature": kwargs.get("temperature", self._temperature),
-            "messages": api_messages,
-        }
+        logger.debug(f"Anthropic streaming API call: model={self._model}")
 
-        if system:
-            params["system"] = system
+        async def open_stream() -> AsyncIterator[StreamChunk]:
+            async with client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    yield StreamChunk(content=text, is_final=False)
 
-        if self._top_p is not None:
-            params["top_p"] = self._top_p
+                # Get final message for usage stats
+                final_message = await stream.get_final_message()
+                yield StreamChunk(
+                    content="",
+                    is_final=True,
+                    usage=_usage(final_message.usage),
+                )
 
-        if self._top_k is not None:
-            params["top_k"] = self._top_k
+        async for chunk in self._stream_with_rate_limit(
+            open_stream,
+            estimated_tokens=estimate_tokens(system, api_messages, tools),
+            priority=kwargs.get("priority"),
+        ):
+            yield chunk
 
-        if tools:
-            params["tools"] = tools
 
-        logger.debug(f"Anthropic streaming API call: model={self._model}")
+def response_from_message(message: Any) -> LLMResponse:
+    """Convert an Anthropic message to an LLMResponse.
 
-        async with client.messages.stream(**params) as stream:
-            async for text in stream.text_stream:
-                yield StreamChunk(content=text, is_final=False)
-
-            # Get final message for usage stats
-            final_message = await stream.get_final_message()
-            yield StreamChunk(
-                content="",
-                is_final=True,
-                usage={
-                    "input_tokens": final_message.usage.input_tokens,
-                    "output_tokens": final_message.usage.output_tokens,
-                },
-            )
+    Args:
+        message: A ``Message`` returned by the messages API or a batch.
+
+    Returns:
+        LLMResponse: Text content, tool calls and usage of the message.
+    """
+    content = ""
+    tool_calls = []
+
+    for block in message.content:
+        if hasattr(block, "text"):
+            content += block.text
+        elif hasattr(block, "type") and block.type == "tool_use":
+            tool_calls.append({
+                "id": block.id,
+                "name": block.name,
+                "input": block.input,
+            })
+
+    return LLMResponse(
+        content=content,
+        model=message.model,
+        tool_calls=tool_calls,
+        usage=_usage(message.usage),
+        stop_reason=message.stop_reason,
+    )
+
+
+def _text_blocks(segments: PromptInput) -> list[dict[str, Any]]:
+    """Convert prompt segments to text content blocks.
+
+    Args:
+        segments: Prompt segments, in order.
+
+    Returns:
+        list[dict[str, Any]]: Text blocks, with ``cache_control`` on the
+            segments marked for caching.
+    """
+    blocks: list[dict[str, Any]] = []
+    for segment in segments:
+        if not segment.text:
+            continue
+        block: dict[str, Any] = {"type": "text", "text": segment.text}
+        if segment.cache:
+            block["cache_control"] = {"type": "ephemeral"}
+        blocks.append(block)
+    return blocks
+
+
+def _limit_breakpoints(blocks: list[dict[str, Any]]) -> None:
+    """Drop the earliest cache breakpoints beyond the API limit.
+
+    Later breakpoints cover longer prefixes, so they are the ones kept.
+
+    Args:
+        blocks: System and prompt blocks in request order, modified in place.
+    """
+    marked = [b for b in blocks if "cache_control" in b]
+    for block in marked[: max(0, len(marked) - MAX_CACHE_BREAKPOINTS)]:
+        del block["cache_control"]
+
+
+def _usage(usage: Any) -> dict[str, int]:
+    """Normalize Anthropic token usage.
+
+    The API reports cache reads and writes separately from
+    ``input_tokens``; they are added back so ``input_tokens`` counts the
+    whole prompt, as for other providers.
+
+    Args:
+        usage: The ``usage`` object of a message.
+
+    Returns:
+        dict[str, int]: Token usage for LLMResponse.
+    """
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+    return {
+        "input_tokens": usage.input_tokens + cache_read + cache_write,
+        "output_tokens": usage.output_tokens,
+        "cache_read_input_tokens": cache_read,
+        "cache_creation_input_tokens": cache_write,
+    }
@@ -7,13 +7,20 @@ Uses the google-generativeai SDK for API calls.
 from __future__ import annotations
 
 import logging
-from typing import Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from src.infrastructure.llm.base_client import (
     BaseLLMClient,
     LLMResponse,
+    PromptInput,
     StreamChunk,
+    cache_ordered,
+    prompt_text,
 )
+from src.infrastructure.llm.rate_limiter import estimate_tokens
+
+if TYPE_CHECKING:
+    from src.infrastructure.llm.rate_limiter import LLMRateLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -40,6 +47,8 @@ class GoogleClient(BaseLLMClient):
         max_tokens: int = 16384,
         top_p: float | None = None,
         top_k: int | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
+        max_retries: int | None = None,
     ) -> None:
         """Initialize the Google client.
 
@@ -50,6 +59,9 @@ class GoogleClient(BaseLLMClient):
             max_tokens: Maximum tokens in response.
             top_p: Nucleus sampling parameter.
             top_k: Top-k sampling parameter.
+            rate_limiter: Optional shared rate limiter.
+            max_retries: Retries of transient errors per call; defaults to
+                the rate limiter's configuration.
         """
         super().__init__(
             api_key=api_key,
@@ -58,6 +70,8 @@ class GoogleClient(BaseLLMClient):
             max_tokens=max_tokens,
             top_p=top_p,
             top_k=top_k,
+            rate_limiter=rate_limiter,
+            max_retries=max_retries,
         )
         self._model_instance = None
 
@@ -85,12 +99,15 @@ class GoogleClient(BaseLLMClient):
 
     def _build_google_content(
         self,
-        prompt: str,
-        system: str | None,
+        prompt: PromptInput,
+        system: PromptInput | None,
         messages: list[dict[str, Any]] | None,
     ) -> list[dict[str, Any]]:
         """Build Google-formatted content.
 
+        Cacheable prompt segments are moved ahead of the others, so
+        implicit prefix caching can reuse them.
+
         Args:
             prompt: The user prompt.
             system: Optional system message (prepended to first user message).
@@ -100,6 +117,8 @@ class GoogleClient(BaseLLMClient):
             list[dict[str, Any]]: Google-formatted content.
         """
         result: list[dict[str, Any]] = []
+        system = prompt_text(cache_ordered(system))
+        prompt = prompt_text(cache_ordered(prompt))
 
         if messages:
             for msg in messages:
@@ -128,8 +147,8 @@ class GoogleClient(BaseLLMClient):
 
     async def generate(
         self,
-        prompt: str = "",
-        system: str | None = None,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
         messages: list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         **kwargs: Any,
@@ -141,7 +160,8 @@ class GoogleClient(BaseLLMClient):
             system: Optional system message.
             messages: Optional conversation history.
             tools: Optional tool definitions.
-            **kwargs: Additional parameters (passed to API).
+            **kwargs: Additional parameters (passed to API). ``priority``
+                sets the rate limit priority class.
 
         Returns:
             LLMResponse: The model's response.
@@ -167,37 +187,43 @@ class GoogleClient(BaseLLMClient):
 
         logger.debug(f"Google API call: model={self._model}, content_parts={len(content)}")
 
-        # Make async call
-        response = await model.generate_content_async(
-            content,
-            generation_config=generation_config,
-        )
-
-        # Extract content
-        text_content = ""
-        if response.text:
-            text_content = response.text
-
-        # Get usage stats if available
-        usage = {}
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            usage = {
-                "input_tokens": response.usage_metadata.prompt_token_count or 0,
-                "output_tokens": response.usage_metadata.candidates_token_count or 0,
-            }
-
-        return LLMResponse(
-            content=text_content,
-            model=self._model,
-            tool_calls=[],
-            usage=usage,
-            stop_reason=response.candidates[0].finish_reason.name if response.candidates else None,
+        async def call() -> LLMResponse:
+            # Make async call
+            response = await model.generate_content_async(
+                content,
+                generation_config=generation_config,
+            )
+
+            # Extract content
+            text_content = ""
+            if response.text:
+                text_content = response.text
+
+            # Get usage stats if available
+            usage = _usage(getattr(response, "usage_metadata", None))
+
+            return LLMResponse(
+                content=text_content,
+                model=self._model,
+                tool_calls=[],
+                usage=usage,
+                stop_reason=(
+                    response.candidates[0].finish_reason.name
+                    if response.candidates
+                    else None
+                ),
+            )
+
+        return await self._call_with_rate_limit(
+            call,
+            estimated_tokens=estimate_tokens(content),
+            priority=kwargs.get("priority"),
         )
 
     async def generate_stream(
         self,
-        prompt: str = "",
-        system: str | None = None,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
         messages: list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         **kwargs: Any,
@@ -209,7 +235,8 @@ class GoogleClient(BaseLLMClient):
             system: Optional system message.
             messages: Optional conversation history.
             tools: Optional tool definitions.
-            **kwargs: Additional parameters (passed to API).
+            **kwargs: Additional parameters (passed to API). ``priority``
+                sets the rate limit priority class.
 
         Yields:
             StreamChunk: Chunks of the response as they arrive.
@@ -235,27 +262,48 @@ class GoogleClient(BaseLLMClient):
 
         logger.debug(f"Google streaming API call: model={self._model}")
 
-        # Make streaming call
-        response = await model.generate_content_async(
-            content,
-            generation_config=generation_config,
-            stream=True,
-        )
+        async def open_stream() -> AsyncIterator[StreamChunk]:
+            # Make streaming call
+            response = await model.generate_content_async(
+                content,
+                generation_config=generation_config,
+                stream=True,
+            )
 
-        async for chunk in response:
-            if chunk.text:
-                yield StreamChunk(content=chunk.text, is_final=False)
-
-        # Final chunk with usage
-        usage = {}
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            usage = {
-                "input_tokens": response.usage_metadata.prompt_token_count or 0,
-                "output_tokens": response.usage_metadata.candidates_token_count or 0,
-            }
-
-        yield StreamChunk(
-            content="",
-            is_final=True,
-            usage=usage if usage else None,
-        )
+            async for chunk in response:
+                if chunk.text:
+                    yield StreamChunk(content=chunk.text, is_final=False)
+
+            # Final chunk with usage
+            usage = _usage(getattr(response, "usage_metadata", None))
+
+            yield StreamChunk(
+                content="",
+                is_final=True,
+                usage=usage if usage else None,
+            )
+
+        async for chunk in self._stream_with_rate_limit(
+            open_stream,
+            estimated_tokens=estimate_tokens(content),
+            priority=kwargs.get("priority"),
+        ):
+            yield chunk
+
+
+def _usage(metadata: Any) -> dict[str, int]:
+    """Normalize Gemini token usage.
+
+    Args:
+        metadata: The ``usage_metadata`` of a response, or None.
+
+    Returns:
+        dict[str, int]: Token usage for LLMResponse, empty if not reported.
+    """
+    if not metadata:
+        return {}
+    return {
+        "input_tokens": metadata.prompt_token_count or 0,
+        "output_tokens": metadata.candidates_token_count or 0,
+        "cache_read_input_tokens": getattr(metadata, "cached_content_token_count", 0) or 0,
+    }
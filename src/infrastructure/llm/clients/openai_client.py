@@ -2,18 +2,29 @@
 
 This module provides the OpenAI (GPT) implementation of BaseLLMClient.
 Uses the openai SDK for API calls.
+
+OpenAI caches long prompt prefixes automatically. Prompt segments marked
+for caching are sent ahead of the others so the prefix stays identical
+across calls.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from src.infrastructure.llm.base_client import (
     BaseLLMClient,
     LLMResponse,
+    PromptInput,
     StreamChunk,
+    cache_ordered,
+    prompt_text,
 )
+from src.infrastructure.llm.rate_limiter import estimate_tokens
+
+if TYPE_CHECKING:
+    from src.infrastructure.llm.rate_limiter import LLMRateLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -40,6 +51,9 @@ class OpenAIClient(BaseLLMClient):
         max_tokens: int = 16384,
         top_p: float | None = None,
         top_k: int | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
+        sdk_client: Any | None = None,
+        max_retries: int | None = None,
     ) -> None:
         """Initialize the OpenAI client.
 
@@ -50,6 +64,11 @@ class OpenAIClient(BaseLLMClient):
             max_tokens: Maximum tokens in response.
             top_p: Nucleus sampling parameter.
             top_k: Top-k sampling parameter (not used by OpenAI, ignored).
+            rate_limiter: Optional shared rate limiter.
+            sdk_client: Optional openai.AsyncOpenAI to share, with its
+                connection pool, between clients using the same API key.
+            max_retries: Retries of transient errors per call; defaults to
+                the rate limiter's configuration.
         """
         super().__init__(
             api_key=api_key,
@@ -58,8 +77,10 @@ class OpenAIClient(BaseLLMClient):
             max_tokens=max_tokens,
             top_p=top_p,
             top_k=top_k,
+            rate_limiter=rate_limiter,
+            max_retries=max_retries,
         )
-        self._client = None
+        self._client = sdk_client
 
     def _get_client(self) -> Any:
         """Get or create the OpenAI client.
@@ -70,9 +91,20 @@ class OpenAIClient(BaseLLMClient):
         if self._client is None:
             import openai
 
-            self._client = openai.AsyncOpenAI(api_key=self._api_key)
+            self._client = openai.AsyncOpenAI(
+                api_key=self._api_key, **self._sdk_options()
+            )
         return self._client
 
+    @property
+    def sdk_client(self) -> Any:
+        """Return the SDK client, creating it if needed.
+
+        Returns:
+            openai.AsyncOpenAI: The client instance.
+        """
+        return self._get_client()
+
     @property
     def provider(self) -> str:
         """Return the provider name.
@@ -84,12 +116,14 @@ class OpenAIClient(BaseLLMClient):
 
     def _build_openai_messages(
         self,
-        prompt: str,
-        system: str | None,
+        prompt: PromptInput,
+        system: PromptInput | None,
         messages: list[dict[str, Any]] | None,
     ) -> list[dict[str, Any]]:
         """Build OpenAI-formatted messages.
 
+        Cacheable prompt segments are moved ahead of the others.
+
         Args:
             prompt: The user prompt.
             system: Optional system message.
@@ -100,21 +134,23 @@ class OpenAIClient(BaseLLMClient):
         """
         result: list[dict[str, Any]] = []
 
-        if system:
-            result.append({"role": "system", "content": system})
+        system_text = prompt_text(cache_ordered(system))
+        if system_text:
+            result.append({"role": "system", "content": system_text})
 
         if messages:
             result.extend(messages)
 
-        if prompt:
-            result.append({"role": "user", "content": prompt})
+        prompt_str = prompt_text(cache_ordered(prompt))
+        if prompt_str:
+            result.append({"role": "user", "content": prompt_str})
 
         return result
 
     async def generate(
         self,
-        prompt: str = "",
-        system: str | None = None,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
         messages: list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         **kwargs: Any,
@@ -126,7 +162,8 @@ class OpenAIClient(BaseLLMClient):
             system: Optional system message.
             messages: Optional conversation history.
             tools: Optional tool definitions.
-            **kwargs: Additional parameters (passed to API).
+            **kwargs: Additional parameters (passed to API). ``priority``
+                sets the rate limit priority class.
 
         Returns:
             LLMResponse: The model's response.
@@ -159,37 +196,20 @@ class OpenAIClient(BaseLLMClient):
 
         logger.debug(f"OpenAI API call: model={self._model}, messages={len(api_messages)}")
 
-        response = await client.chat.completions.create(**params)
-
-        # Extract content
-        choice = response.choices[0]
-        content = choice.message.content or ""
-
-        # Extract tool calls if present
-        tool_calls = []
-        if choice.message.tool_calls:
-            for tc in choice.message.tool_calls:
-                tool_calls.append({
-                    "id": tc.id,
-                    "name": tc.function.name,
-                    "input": tc.function.arguments,
-                })
-
-        return LLMResponse(
-            content=content,
-            model=response.model,
-            tool_calls=tool_calls,
-            usage={
-                "input_tokens": response.usage.prompt_tokens if response.usage else 0,
-                "output_tokens": response.usage.completion_tokens if response.usage else 0,
-            },
-            stop_reason=choice.finish_reason,
+        async def call() -> LLMResponse:
+            response = await client.chat.completions.create(**params)
+            return response_from_completion(response)
+
+        return await self._call_with_rate_limit(
+            call,
+            estimated_tokens=estimate_tokens(api_messages, tools),
+            priority=kwargs.get("priority"),
         )
 
     async def generate_stream(
         self,
-        prompt: str = "",
-        system: str | None = None,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
         messages: list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         **kwargs: Any,
@@ -201,7 +221,8 @@ class OpenAIClient(BaseLLMClient):
             system: Optional system message.
             messages: Optional conversation history.
             tools: Optional tool definitions.
-            **kwargs: Additional parameters (passed to API).
+            **kwargs: Additional parameters (passed to API). ``priority``
+                sets the rate limit priority class.
 
         Yields:
             StreamChunk: Chunks of the response as they arrive.
@@ -235,20 +256,78 @@ class OpenAIClient(BaseLLMClient):
 
         logger.debug(f"OpenAI streaming API call: model={self._model}")
 
-        async for chunk in await client.chat.completions.create(**params):
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield StreamChunk(
-                    content=chunk.choices[0].delta.content,
-                    is_final=False,
-                )
-
-            # Check for usage in final chunk
-            if chunk.usage:
-                yield StreamChunk(
-                    content="",
-                    is_final=True,
-                    usage={
-                        "input_tokens": chunk.usage.prompt_tokens,
-                        "output_tokens": chunk.usage.completion_tokens,
-                    },
-                )
+        async def open_stream() -> AsyncIterator[StreamChunk]:
+            async for chunk in await client.chat.completions.create(**params):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield StreamChunk(
+                        content=chunk.choices[0].delta.content,
+                        is_final=False,
+                    )
+
+                # Check for usage in final chunk
+                if chunk.usage:
+                    yield StreamChunk(
+                        content="",
+                        is_final=True,
+                        usage=_usage(chunk.usage),
+                    )
+
+        async for chunk in self._stream_with_rate_limit(
+            open_stream,
+            estimated_tokens=estimate_tokens(api_messages, tools),
+            priority=kwargs.get("priority"),
+        ):
+            yield chunk
+
+
+def response_from_completion(completion: Any) -> LLMResponse:
+    """Convert an OpenAI chat completion to an LLMResponse.
+
+    Args:
+        completion: A ``ChatCompletion`` returned by the API or a batch.
+
+    Returns:
+        LLMResponse: Content, tool calls and usage of the first choice.
+    """
+    choice = completion.choices[0]
+    content = choice.message.content or ""
+
+    # Extract tool calls if present
+    tool_calls = []
+    if choice.message.tool_calls:
+        for tc in choice.message.tool_calls:
+            tool_calls.append({
+                "id": tc.id,
+                "name": tc.function.name,
+                "input": tc.function.arguments,
+            })
+
+    return LLMResponse(
+        content=content,
+        model=completion.model,
+        tool_calls=tool_calls,
+        usage=_usage(completion.usage),
+        stop_reason=choice.finish_reason,
+    )
+
+
+def _usage(usage: Any) -> dict[str, int]:
+    """Normalize OpenAI token usage.
+
+    Args:
+        usage: The ``usage`` object of a completion, or None.
+
+    Returns:
+        dict[str, int]: Token usage for LLMResponse, including the prompt
+            tokens served from the prefix cache.
+    """
+    if usage is None:
+        return {"input_tokens": 0, "output_tokens": 0}
+
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) or 0
+    return {
+        "input_tokens": usage.prompt_tokens,
+        "output_tokens": usage.completion_tokens,
+        "cache_read_input_tokens": cached,
+    }
@@ -6,11 +6,23 @@ based on agent role and admin configuration.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import os
+import time
 from typing import Any, TYPE_CHECKING
 
 from src.core.exceptions import ASDLCError
 from src.infrastructure.llm.base_client import BaseLLMClient
+from src.infrastructure.llm.instrumentation import InstrumentedLLMClient
+from src.infrastructure.llm.rate_limiter import LLMRateLimiter, get_llm_rate_limiter
+from src.infrastructure.llm.response_cache import (
+    CachingLLMClient,
+    LLMResponseCache,
+    get_llm_response_cache,
+)
+from src.infrastructure.llm.routing import LatencyTracker, RoutingLLMClient
 from src.orchestrator.api.models.llm_config import (
     AgentLLMConfig,
     AgentRole,
@@ -35,7 +47,17 @@ class LLMClientFactory:
 
     Reads configuration from LLMConfigService and creates appropriate
     client instances for each agent role. Caches clients per role to
-    avoid recreating them.
+    avoid recreating them; concurrent first calls for a role share one
+    construction. Roles whose configuration version has changed in
+    LLMConfigService are rebuilt, so config updates apply without a
+    restart. Roles using the same provider API key share one SDK client
+    and its connection pool. All clients share one rate limiter, so calls
+    for the same provider, model and API key draw on one budget. Calls
+    are instrumented with metrics labelled by role. Roles with fallback
+    targets or ``hedge_requests`` get a client that routes calls by
+    observed latency and errors, fails over and hedges slow calls. Roles
+    with ``cache_responses`` enabled get a client that reuses responses to
+    repeated deterministic calls.
 
     Usage:
         factory = LLMClientFactory()
@@ -49,15 +71,38 @@ class LLMClientFactory:
     def __init__(
         self,
         config_service: LLMConfigService | None = None,
+        rate_limiter: LLMRateLimiter | None = None,
+        response_cache: LLMResponseCache | None = None,
+        config_check_interval: float | None = None,
+        latency_tracker: LatencyTracker | None = None,
     ) -> None:
         """Initialize the factory.
 
         Args:
             config_service: Optional LLMConfigService instance. If not provided,
                 will use the global singleton.
+            rate_limiter: Optional rate limiter shared by the created clients.
+                If not provided, will use the global singleton.
+            response_cache: Optional response cache for roles that enable it.
+                If not provided, will use the global singleton.
+            config_check_interval: Seconds between checks for changed
+                configuration. Defaults to LLM_CONFIG_CHECK_INTERVAL_SECONDS
+                or 5.
+            latency_tracker: Optional target statistics for routed roles.
+                A new tracker is created if not provided.
         """
         self._config_service = config_service
+        self._rate_limiter = rate_limiter or get_llm_rate_limiter()
+        self._response_cache = response_cache
+        if config_check_interval is None:
+            config_check_interval = float(os.getenv("LLM_CONFIG_CHECK_INTERVAL_SECONDS", "5"))
+        self._config_check_interval = config_check_interval
         self._client_cache: dict[AgentRole, BaseLLMClient] = {}
+        self._client_versions: dict[AgentRole, int | None] = {}
+        self._build_locks: dict[AgentRole, asyncio.Lock] = {}
+        self._sdk_clients: dict[tuple[str, str], Any] = {}
+        self._versions_checked_at = 0.0
+        self._latency_tracker = latency_tracker or LatencyTracker()
 
     def _get_config_service(self) -> LLMConfigService:
         """Get the config service, creating if needed.
@@ -97,12 +142,39 @@ class LLMClientFactory:
             except ValueError as e:
                 raise LLMClientError(f"Invalid agent role: {role}") from e
 
+        await self._drop_outdated_clients()
+
         # Check cache first
-        if role in self._client_cache:
-            return self._client_cache[role]
+        client = self._client_cache.get(role)
+        if client is not None:
+            return client
+
+        # One construction per role, however many callers arrive at once
+        lock = self._build_locks.setdefault(role, asyncio.Lock())
+        async with lock:
+            client = self._client_cache.get(role)
+            if client is None:
+                client = await self._build_client(role)
+                self._client_cache[role] = client
+        return client
+
+    async def _build_client(self, role: AgentRole) -> BaseLLMClient:
+        """Create the client for a role from its current configuration.
 
-        # Get config from service
+        Args:
+            role: The agent role.
+
+        Returns:
+            BaseLLMClient: The new client.
+
+        Raises:
+            LLMClientError: If config is missing, disabled, or the API key
+                is not found.
+        """
         config_service = self._get_config_service()
+
+        # Read the version first, so a change made while building is seen
+        versions = await self._get_config_versions()
         config = await config_service.get_agent_config(role)
 
         # Validate config
@@ -117,25 +189,129 @@ class LLMClientFactory:
         if not api_key:
             raise LLMClientError(f"API key not found: {config.api_key_id}")
 
-        # Create the appropriate client
-        client = self._create_client(config, api_key)
-
-        # Cache and return
-        self._client_cache[role] = client
+        # Routed targets retry nothing, so the router fails over at once
+        routed = bool(config.fallbacks or config.settings.hedge_requests)
+        client: BaseLLMClient = InstrumentedLLMClient(
+            self._create_client(config, api_key, max_retries=0 if routed else None),
+            role.value,
+        )
+        if routed:
+            targets = [client] + await self._build_fallbacks(config)
+            client = RoutingLLMClient(
+                targets,
+                role.value,
+                hedge=config.settings.hedge_requests,
+                tracker=self._latency_tracker,
+            )
+        if config.settings.cache_responses:
+            if self._response_cache is None:
+                self._response_cache = get_llm_response_cache()
+            client = CachingLLMClient(client, self._response_cache)
+
+        self._client_versions[role] = (
+            versions.get(role.value, 0) if versions is not None else None
+        )
         logger.info(f"Created LLM client for {role.value}: {config.provider.value}/{config.model}")
 
         return client
 
+    async def _build_fallbacks(self, config: AgentLLMConfig) -> list[BaseLLMClient]:
+        """Create the clients for a role's fallback targets.
+
+        Fallbacks whose API key is missing are skipped, so they never
+        prevent the primary target from being used. Like the primary
+        target of a routed role, they do not retry errors themselves.
+
+        Args:
+            config: Agent LLM configuration.
+
+        Returns:
+            list[BaseLLMClient]: Fallback clients, in order of preference.
+        """
+        config_service = self._get_config_service()
+        clients: list[BaseLLMClient] = []
+        for target in config.fallbacks:
+            api_key = await config_service.get_decrypted_key(target.api_key_id)
+            if not api_key:
+                logger.warning(
+                    f"Skipping {config.role.value} fallback {target.provider.value}/"
+                    f"{target.model}: API key not found: {target.api_key_id}"
+                )
+                continue
+            target_config = config.model_copy(
+                update={
+                    "provider": target.provider,
+                    "model": target.model,
+                    "api_key_id": target.api_key_id,
+                }
+            )
+            clients.append(
+                InstrumentedLLMClient(
+                    self._create_client(target_config, api_key, max_retries=0),
+                    config.role.value,
+                )
+            )
+        return clients
+
+    async def _get_config_versions(self) -> dict[str, int] | None:
+        """Read role configuration versions from the config service.
+
+        Returns:
+            dict[str, int] | None: Version per role value, or None if the
+                versions cannot be read.
+        """
+        try:
+            return await self._get_config_service().get_config_versions()
+        except Exception as e:
+            logger.debug(f"Could not read LLM config versions: {e}")
+            return None
+
+    async def _drop_outdated_clients(self) -> None:
+        """Drop cached clients whose role configuration has changed.
+
+        Checks at most once per ``config_check_interval``; one Redis read
+        covers all roles. Dropped clients are rebuilt on next use.
+        """
+        if not self._client_cache:
+            return
+        now = time.monotonic()
+        if now - self._versions_checked_at < self._config_check_interval:
+            return
+        self._versions_checked_at = now
+
+        versions = await self._get_config_versions()
+        if versions is None:
+            return
+        for role in list(self._client_cache):
+            if versions.get(role.value, 0) != self._client_versions.get(role):
+                logger.info(f"LLM config for {role.value} changed, rebuilding client")
+                self.remove_from_cache(role)
+
+    def _shared_sdk_client(self, provider: LLMProvider, api_key: str) -> Any | None:
+        """Return the SDK client already created for a provider API key.
+
+        Args:
+            provider: The provider.
+            api_key: Decrypted API key.
+
+        Returns:
+            The shared SDK client, or None if there is none yet.
+        """
+        return self._sdk_clients.get(_sdk_client_key(provider, api_key))
+
     def _create_client(
         self,
         config: AgentLLMConfig,
         api_key: str,
+        max_retries: int | None = None,
     ) -> BaseLLMClient:
         """Create a client instance based on provider.
 
         Args:
             config: Agent LLM configuration.
             api_key: Decrypted API key.
+            max_retries: Retries of transient errors per call; None uses
+                the rate limiter's configuration.
 
         Returns:
             BaseLLMClient: The created client instance.
@@ -146,24 +322,38 @@ class LLMClientFactory:
         if config.provider == LLMProvider.ANTHROPIC:
             from src.infrastructure.llm.clients.anthropic_client import AnthropicClient
 
-            return AnthropicClient(
+            client = AnthropicClient(
                 api_key=api_key,
                 model=config.model,
                 temperature=config.settings.temperature,
                 max_tokens=config.settings.max_tokens,
                 top_p=config.settings.top_p,
                 top_k=config.settings.top_k,
+                rate_limiter=self._rate_limiter,
+                max_retries=max_retries,
+                sdk_client=self._shared_sdk_client(config.provider, api_key),
+            )
+            self._sdk_clients.setdefault(
+                _sdk_client_key(config.provider, api_key), client.sdk_client
             )
+            return client
         elif config.provider == LLMProvider.OPENAI:
             from src.infrastructure.llm.clients.openai_client import OpenAIClient
 
-            return OpenAIClient(
+            client = OpenAIClient(
                 api_key=api_key,
                 model=config.model,
                 temperature=config.settings.temperature,
                 max_tokens=config.settings.max_tokens,
                 top_p=config.settings.top_p,
+                rate_limiter=self._rate_limiter,
+                max_retries=max_retries,
+                sdk_client=self._shared_sdk_client(config.provider, api_key),
+            )
+            self._sdk_clients.setdefault(
+                _sdk_client_key(config.provider, api_key), client.sdk_client
             )
+            return client
         elif config.provider == LLMProvider.GOOGLE:
             from src.infrastructure.llm.clients.google_client import GoogleClient
 
@@ -174,6 +364,8 @@ class LLMClientFactory:
                 max_tokens=config.settings.max_tokens,
                 top_p=config.settings.top_p,
                 top_k=config.settings.top_k,
+                rate_limiter=self._rate_limiter,
+                max_retries=max_retries,
             )
         else:
             raise LLMClientError(f"Unsupported provider: {config.provider}")
@@ -184,6 +376,7 @@ class LLMClientFactory:
         Useful when configuration has changed and clients need to be recreated.
         """
         self._client_cache.clear()
+        self._client_versions.clear()
         logger.info("Cleared LLM client cache")
 
     def remove_from_cache(self, role: AgentRole) -> bool:
@@ -197,11 +390,17 @@ class LLMClientFactory:
         """
         if role in self._client_cache:
             del self._client_cache[role]
+            self._client_versions.pop(role, None)
             logger.info(f"Removed {role.value} from LLM client cache")
             return True
         return False
 
 
+def _sdk_client_key(provider: LLMProvider, api_key: str) -> tuple[str, str]:
+    """Key SDK clients by provider and a hash of the API key."""
+    return provider.value, hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
 # Global factory instance
 _llm_client_factory: LLMClientFactory | None = None
 
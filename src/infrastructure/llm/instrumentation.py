@@ -0,0 +1,412 @@
+"""Instrumentation for LLM calls.
+
+InstrumentedLLMClient wraps a BaseLLMClient and records, per agent role,
+provider and model:
+
+- call latency and, for streams, time to first token;
+- input, output and cached tokens, and estimated cost;
+- errors by type (rate_limit, timeout, server_error, ...).
+
+Metrics are the Prometheus LLM_* metrics in
+src.infrastructure.metrics.definitions. When opentelemetry is installed,
+each call is also traced as a span carrying the task and session set with
+:func:`llm_call_context`.
+
+Latency includes time spent waiting for rate limit budget and retrying
+transient errors, since that is the latency agents see.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Generator, Iterator, Mapping
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any
+
+from src.infrastructure.llm.base_client import (
+    BaseLLMClient,
+    DelegatingLLMClient,
+    LLMResponse,
+    PromptInput,
+    StreamChunk,
+)
+from src.infrastructure.llm.rate_limiter import _status_code, is_rate_limit_error
+from src.infrastructure.metrics.definitions import (
+    LLM_COST,
+    LLM_ERRORS,
+    LLM_REQUEST_COUNT,
+    LLM_REQUEST_LATENCY,
+    LLM_TIME_TO_FIRST_TOKEN,
+    LLM_TOKENS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Try to import opentelemetry, but make it optional
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None  # type: ignore[assignment]
+
+
+# USD per million (input, output) tokens, matched by longest model prefix
+MODEL_PRICING: dict[str, tuple[float, float]] = {
+    "claude-opus-4": (15.0, 75.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-3-7-sonnet": (3.0, 15.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-haiku-4": (1.0, 5.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "claude-3-haiku": (0.25, 1.25),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4.1-nano": (0.1, 0.4),
+    "gpt-4.1-mini": (0.4, 1.6),
+    "gpt-4.1": (2.0, 8.0),
+    "gpt-4-turbo": (10.0, 30.0),
+    "o3-mini": (1.1, 4.4),
+    "o4-mini": (1.1, 4.4),
+    "gemini-2.5-pro": (1.25, 10.0),
+    "gemini-2.5-flash": (0.3, 2.5),
+    "gemini-2.0-flash": (0.1, 0.4),
+    "gemini-1.5-pro": (1.25, 5.0),
+    "gemini-1.5-flash": (0.075, 0.3),
+}
+
+# Price of cache reads and cache writes relative to uncached input
+CACHE_PRICE_FACTORS: dict[str, tuple[float, float]] = {
+    "anthropic": (0.1, 1.25),
+    "openai": (0.5, 1.0),
+    "google": (0.25, 1.0),
+}
+
+_call_context: contextvars.ContextVar[Mapping[str, str]] = contextvars.ContextVar(
+    "llm_call_context", default=MappingProxyType({})
+)
+
+
+@contextmanager
+def llm_call_context(**attributes: str | None) -> Generator[None, None, None]:
+    """Attach identifiers such as task_id and session_id to LLM calls.
+
+    Calls made inside the block carry the attributes on their trace spans.
+    Nested blocks add to the outer attributes.
+
+    Args:
+        **attributes: Identifiers to attach; None values are skipped.
+
+    Example:
+        with llm_call_context(task_id=context.task_id, session_id=context.session_id):
+            result = await agent.execute(context, event_metadata)
+    """
+    merged = dict(_call_context.get())
+    merged.update({k: str(v) for k, v in attributes.items() if v is not None})
+    token = _call_context.set(merged)
+    try:
+        yield
+    finally:
+        _call_context.reset(token)
+
+
+def get_llm_call_context() -> Mapping[str, str]:
+    """Return the identifiers set with :func:`llm_call_context`.
+
+    Returns:
+        Mapping[str, str]: Identifiers such as task_id and session_id.
+    """
+    return _call_context.get()
+
+
+def classify_error(exc: BaseException) -> str:
+    """Classify a provider error for the error counter.
+
+    Args:
+        exc: Exception raised by a provider SDK.
+
+    Returns:
+        One of rate_limit, timeout, connection, server_error, client_error
+        or other.
+    """
+    if is_rate_limit_error(exc):
+        return "rate_limit"
+    name = type(exc).__name__
+    status = _status_code(exc)
+    if isinstance(exc, TimeoutError) or name in ("APITimeoutError", "DeadlineExceeded"):
+        return "timeout"
+    if status == 408:
+        return "timeout"
+    if name == "APIConnectionError":
+        return "connection"
+    if status is not None and status >= 500:
+        return "server_error"
+    if status is not None and status >= 400:
+        return "client_error"
+    return "other"
+
+
+def _load_pricing() -> dict[str, tuple[float, float]]:
+    """Return the pricing table, with overrides from LLM_MODEL_PRICING.
+
+    LLM_MODEL_PRICING is a JSON object mapping a model prefix to
+    [input, output] USD per million tokens.
+    """
+    pricing = dict(MODEL_PRICING)
+    raw = os.getenv("LLM_MODEL_PRICING")
+    if raw:
+        try:
+            pricing.update(
+                {prefix: (float(p[0]), float(p[1])) for prefix, p in json.loads(raw).items()}
+            )
+        except (ValueError, TypeError, IndexError, AttributeError) as e:
+            logger.warning(f"Ignoring invalid LLM_MODEL_PRICING: {e}")
+    return pricing
+
+
+_pricing: dict[str, tuple[float, float]] | None = None
+
+
+def estimate_cost(provider: str, model: str, usage: dict[str, int]) -> float:
+    """Estimate the cost of a call from its token usage.
+
+    Args:
+        provider: Provider name.
+        model: Model identifier.
+        usage: Token usage as reported in LLMResponse.
+
+    Returns:
+        Estimated cost in USD; 0.0 for models without a known price.
+    """
+    global _pricing
+    if _pricing is None:
+        _pricing = _load_pricing()
+
+    matches = [prefix for prefix in _pricing if model.startswith(prefix)]
+    if not matches:
+        return 0.0
+    input_price, output_price = _pricing[max(matches, key=len)]
+    read_factor, write_factor = CACHE_PRICE_FACTORS.get(provider, (1.0, 1.0))
+
+    cache_read = usage.get("cache_read_input_tokens", 0)
+    cache_write = usage.get("cache_creation_input_tokens", 0)
+    uncached = max(0, usage.get("input_tokens", 0) - cache_read - cache_write)
+    input_cost = input_price * (
+        uncached + cache_read * read_factor + cache_write * write_factor
+    )
+    return (input_cost + output_price * usage.get("output_tokens", 0)) / 1_000_000
+
+
+class InstrumentedLLMClient(DelegatingLLMClient):
+    """BaseLLMClient wrapper that records metrics and traces for each call.
+
+    Usage:
+        client = InstrumentedLLMClient(AnthropicClient(...), role="coding")
+        response = await client.generate(prompt="Hello")
+    """
+
+    def __init__(self, inner: BaseLLMClient, role: str) -> None:
+        """Initialize the instrumented client.
+
+        Args:
+            inner: The client that performs the calls.
+            role: Agent role the client is configured for.
+        """
+        super().__init__(inner)
+        self._role = role
+
+    @property
+    def role(self) -> str:
+        """Return the agent role used as a metric label.
+
+        Returns:
+            str: Agent role.
+        """
+        return self._role
+
+    def _labels(self) -> dict[str, str]:
+        """Return the role, provider and model labels."""
+        return {"role": self._role, "provider": self.provider, "model": self._model}
+
+    @contextmanager
+    def _span(self, operation: str, current: bool) -> Iterator[Any]:
+        """Start a trace span for a call, if tracing is available.
+
+        Args:
+            operation: "generate" or "stream".
+            current: Make the span current, so nested spans attach to it.
+                Streams cannot, since the generator is suspended between
+                chunks.
+
+        Yields:
+            The span, or None without opentelemetry.
+        """
+        if trace is None:
+            yield None
+            return
+
+        attributes: dict[str, Any] = {
+            "gen_ai.system": self.provider,
+            "gen_ai.request.model": self._model,
+            "asdlc.agent_role": self._role,
+        }
+        attributes.update({f"asdlc.{k}": v for k, v in _call_context.get().items()})
+        tracer = trace.get_tracer(__name__)
+        name = f"llm.{operation}"
+        if current:
+            with tracer.start_as_current_span(
+                name, attributes=attributes, record_exception=False
+            ) as span:
+                yield span
+        else:
+            span = tracer.start_span(name, attributes=attributes)
+            try:
+                yield span
+            finally:
+                span.end()
+
+    def _record(
+        self,
+        operation: str,
+        status: str,
+        elapsed: float,
+        usage: dict[str, int] | None,
+        span: Any,
+    ) -> None:
+        """Record metrics and span attributes for a finished call.
+
+        Args:
+            operation: "generate" or "stream".
+            status: "success", "error" or "cancelled".
+            elapsed: Call latency in seconds.
+            usage: Token usage, if reported.
+            span: The call's span, or None.
+        """
+        labels = self._labels()
+        LLM_REQUEST_COUNT.labels(**labels, operation=operation, status=status).inc()
+        LLM_REQUEST_LATENCY.labels(**labels, operation=operation).observe(elapsed)
+        if not usage:
+            return
+
+        for kind, key in (
+            ("input", "input_tokens"),
+            ("output", "output_tokens"),
+            ("cache_read", "cache_read_input_tokens"),
+            ("cache_creation", "cache_creation_input_tokens"),
+        ):
+            count = usage.get(key, 0)
+            if count:
+                LLM_TOKENS.labels(**labels, type=kind).inc(count)
+        cost = estimate_cost(self.provider, self._model, usage)
+        if cost:
+            LLM_COST.labels(**labels).inc(cost)
+
+        if span is not None:
+            span.set_attribute("gen_ai.usage.input_tokens", usage.get("input_tokens", 0))
+            span.set_attribute("gen_ai.usage.output_tokens", usage.get("output_tokens", 0))
+            span.set_attribute(
+                "asdlc.cache_read_input_tokens", usage.get("cache_read_input_tokens", 0)
+            )
+            span.set_attribute("asdlc.cost_usd", cost)
+
+    def _record_error(self, exc: BaseException, span: Any) -> None:
+        """Count a failed call and mark its span.
+
+        Args:
+            exc: The error raised by the call.
+            span: The call's span, or None.
+        """
+        error_type = classify_error(exc)
+        LLM_ERRORS.labels(**self._labels(), error_type=error_type).inc()
+        if span is not None:
+            span.record_exception(exc)
+            span.set_attribute("error.type", error_type)
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(exc)))
+
+    async def generate(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a response, recording latency, usage and errors.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to the wrapped client).
+
+        Returns:
+            LLMResponse: The model's response.
+        """
+        with self._span("generate", current=True) as span:
+            start = time.perf_counter()
+            try:
+                response = await self._inner.generate(
+                    prompt=prompt, system=system, messages=messages, tools=tools, **kwargs
+                )
+            except asyncio.CancelledError:
+                self._record("generate", "cancelled", time.perf_counter() - start, None, span)
+                raise
+            except Exception as exc:
+                self._record_error(exc, span)
+                self._record("generate", "error", time.perf_counter() - start, None, span)
+                raise
+
+            self._record("generate", "success", time.perf_counter() - start, response.usage, span)
+            return response
+
+    async def generate_stream(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a response, recording time to first token, usage and errors.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to the wrapped client).
+
+        Yields:
+            StreamChunk: Chunks of the response as they arrive.
+        """
+        with self._span("stream", current=False) as span:
+            start = time.perf_counter()
+            first_token = False
+            usage: dict[str, int] | None = None
+            status = "success"
+            try:
+                async for chunk in self._inner.generate_stream(
+                    prompt=prompt, system=system, messages=messages, tools=tools, **kwargs
+                ):
+                    if not first_token and chunk.content:
+                        first_token = True
+                        LLM_TIME_TO_FIRST_TOKEN.labels(**self._labels()).observe(
+                            time.perf_counter() - start
+                        )
+                    if chunk.usage:
+                        usage = chunk.usage
+                    yield chunk
+            except (asyncio.CancelledError, GeneratorExit):
+                status = "cancelled"
+                raise
+            except Exception as exc:
+                status = "error"
+                self._record_error(exc, span)
+                raise
+            finally:
+                self._record("stream", status, time.perf_counter() - start, usage, span)
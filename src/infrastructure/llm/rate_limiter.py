@@ -0,0 +1,753 @@
+"""Client-side rate limiting for LLM provider calls.
+
+Every LLM client created by the factory shares one LLMRateLimiter. It keeps
+a requests-per-minute and a tokens-per-minute budget per
+(provider, model, API key) and makes callers wait for budget before a
+request is sent, instead of letting bursts run into provider 429s.
+
+Budgets are enforced with GCRA (generic cell rate algorithm). When Redis is
+available the GCRA state lives in Redis and is updated by a Lua script, so
+all worker processes draw on the same budget. Without Redis, or when Redis
+fails, the same algorithm runs in process.
+
+Callers have a priority. Within a process, callers trying the same budget
+take turns in priority order; a caller told to wait gives up its turn while
+it sleeps and queues again afterwards, so a higher priority caller the
+budget admits is never held up behind it. Across processes, lower
+priorities may only use part of the burst capacity, which leaves headroom
+for HITL-blocking calls.
+
+A 429 blocks the scope for every process through the block key, even when
+no RPM or TPM budget is configured.
+
+Key patterns:
+    - {prefix}:{provider}:{model}:{key_digest}:rpm - Request TAT (ms)
+    - {prefix}:{provider}:{model}:{key_digest}:tpm - Token TAT (ms)
+    - {prefix}:{provider}:{model}:{key_digest}:block - Set after a 429
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import hashlib
+import heapq
+import itertools
+import logging
+import os
+import random
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+
+logger = logging.getLogger(__name__)
+
+# Window the RPM and TPM budgets refer to
+_PERIOD_MS = 60_000
+
+# HTTP statuses worth retrying (timeouts, conflicts, rate limits, 5xx)
+_RETRYABLE_STATUSES = frozenset({408, 409, 429})
+
+# SDK exception names for connection failures (anthropic and openai)
+_CONNECTION_ERRORS = frozenset({"APIConnectionError", "APITimeoutError"})
+
+# Approximate characters per token, for request size estimates
+_CHARS_PER_TOKEN = 4
+
+# Reserve a request and its tokens if both budgets allow it. A request
+# costing more than the allowance is admitted once its budget is idle.
+# KEYS: request TAT, token TAT, block marker
+# ARGV: request interval ms, token interval ms (0 = unlimited), tokens,
+#       allowance ms
+# Returns 0 when admitted, otherwise milliseconds to wait.
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local blocked = redis.call('PTTL', KEYS[3])
+if blocked > 0 then
+  return blocked
+end
+local allowance = tonumber(ARGV[4])
+local wait = 0
+local updates = {}
+for i = 1, 2 do
+  local interval = tonumber(ARGV[i])
+  if interval > 0 then
+    local cost = interval
+    if i == 2 then
+      cost = math.ceil(interval * tonumber(ARGV[3]))
+    end
+    local tat = tonumber(redis.call('GET', KEYS[i]) or now)
+    if tat < now then
+      tat = now
+    end
+    local new_tat = tat + cost
+    local limit = allowance
+    if cost > limit then
+      limit = cost
+    end
+    local over = new_tat - now - limit
+    if over > wait then
+      wait = over
+    end
+    updates[i] = new_tat
+  end
+end
+if wait > 0 then
+  return math.ceil(wait)
+end
+for i, new_tat in pairs(updates) do
+  redis.call('SET', KEYS[i], new_tat, 'PX', new_tat - now + 1000)
+end
+return 0
+"""
+
+# Move a token TAT by a signed number of milliseconds, never below now.
+# KEYS: token TAT; ARGV: delta ms
+_ADJUST_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+  tat = now
+end
+local new_tat = tat + tonumber(ARGV[1])
+if new_tat <= now then
+  redis.call('DEL', KEYS[1])
+  return 0
+end
+redis.call('SET', KEYS[1], new_tat, 'PX', new_tat - now + 1000)
+return 0
+"""
+
+
+class LLMPriority(IntEnum):
+    """Priority classes for LLM calls; lower values are served first."""
+
+    HITL = 0
+    INTERACTIVE = 1
+    NORMAL = 2
+    BATCH = 3
+
+
+# Share of the burst capacity each priority may use
+PRIORITY_HEADROOM: dict[LLMPriority, float] = {
+    LLMPriority.HITL: 1.0,
+    LLMPriority.INTERACTIVE: 0.9,
+    LLMPriority.NORMAL: 0.75,
+    LLMPriority.BATCH: 0.5,
+}
+
+_priority: contextvars.ContextVar[LLMPriority] = contextvars.ContextVar(
+    "llm_priority", default=LLMPriority.NORMAL
+)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority | str) -> Generator[None, None, None]:
+    """Run LLM calls in this context with the given priority.
+
+    Args:
+        priority: Priority class, or its name (e.g. ``"hitl"``).
+
+    Yields:
+        None
+
+    Example:
+        with llm_priority(LLMPriority.HITL):
+            response = await client.generate(prompt=question)
+    """
+    token = _priority.set(resolve_priority(priority))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def resolve_priority(priority: LLMPriority | str | int | None = None) -> LLMPriority:
+    """Resolve an explicit priority, falling back to the context priority.
+
+    Args:
+        priority: Priority class, its name or value, or None.
+
+    Returns:
+        The priority class to use.
+
+    Raises:
+        ValueError: If *priority* names no priority class.
+    """
+    if priority is None:
+        return _priority.get()
+    if isinstance(priority, str):
+        try:
+            return LLMPriority[priority.upper()]
+        except KeyError as e:
+            raise ValueError(f"Unknown LLM priority: {priority}") from e
+    return LLMPriority(priority)
+
+
+def estimate_tokens(*parts: Any) -> int:
+    """Estimate the token count of request content without a tokenizer.
+
+    Args:
+        *parts: Strings, message lists or other content. Non-string parts
+            are measured by their string form.
+
+    Returns:
+        Approximate token count.
+    """
+    chars = 0
+    for part in parts:
+        if part is None:
+            continue
+        chars += len(part) if isinstance(part, str) else len(str(part))
+    return (chars + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _status_code(exc: BaseException) -> int | None:
+    """Return the HTTP status carried by a provider SDK exception."""
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Check whether a provider error is a rate limit (HTTP 429).
+
+    Args:
+        exc: Exception raised by a provider SDK.
+
+    Returns:
+        True for rate limit errors.
+    """
+    return _status_code(exc) == 429 or type(exc).__name__ == "ResourceExhausted"
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Check whether a provider error is transient and worth retrying.
+
+    Args:
+        exc: Exception raised by a provider SDK.
+
+    Returns:
+        True for rate limits, overload, server errors and connection
+        failures.
+    """
+    if is_rate_limit_error(exc) or type(exc).__name__ in _CONNECTION_ERRORS:
+        return True
+    status = _status_code(exc)
+    return status is not None and (status in _RETRYABLE_STATUSES or status >= 500)
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Read the server-requested delay from a provider error.
+
+    Supports ``retry-after-ms`` and ``retry-after`` given as seconds or as
+    an HTTP date.
+
+    Args:
+        exc: Exception raised by a provider SDK.
+
+    Returns:
+        Seconds to wait, or None if the error carries no delay.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable."""
+    return int(os.getenv(name, str(default)))
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """Rate limiting and retry configuration for LLM calls.
+
+    Attributes:
+        enabled: Whether budgets are enforced at all.
+        requests_per_minute: Default RPM budget per scope (0 = unlimited).
+        tokens_per_minute: Default TPM budget per scope (0 = unlimited).
+        provider_limits: Per-provider (rpm, tpm) overriding the defaults.
+        use_redis: Share budgets across processes through Redis.
+        key_prefix: Redis key prefix.
+        max_retries: Retries of transient provider errors per call.
+        max_retry_wait_seconds: Longest single wait before a retry. Errors
+            asking for a longer wait are raised to the caller.
+        backoff_base_seconds: First backoff when no retry-after is given.
+    """
+
+    enabled: bool = True
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    provider_limits: dict[str, tuple[int, int]] = field(default_factory=dict)
+    use_redis: bool = True
+    key_prefix: str = "asdlc:llm:ratelimit"
+    max_retries: int = 2
+    max_retry_wait_seconds: float = 60.0
+    backoff_base_seconds: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> RateLimitConfig:
+        """Create rate limit configuration from environment variables.
+
+        Environment variables:
+            LLM_RATE_LIMIT_ENABLED: Enforce budgets (default: true)
+            LLM_RATE_LIMIT_RPM: Default requests per minute (default: 0)
+            LLM_RATE_LIMIT_TPM: Default tokens per minute (default: 0)
+            LLM_RATE_LIMIT_{PROVIDER}_RPM: Per-provider requests per minute
+            LLM_RATE_LIMIT_{PROVIDER}_TPM: Per-provider tokens per minute
+            LLM_RATE_LIMIT_BACKEND: "redis" or "local" (default: redis)
+            LLM_RATE_LIMIT_KEY_PREFIX: Redis key prefix
+            LLM_MAX_RETRIES: Retries of transient errors (default: 2)
+            LLM_MAX_RETRY_WAIT_SECONDS: Longest wait before a retry (default: 60)
+        """
+        rpm = _env_int("LLM_RATE_LIMIT_RPM", 0)
+        tpm = _env_int("LLM_RATE_LIMIT_TPM", 0)
+        provider_limits = {
+            provider: (
+                _env_int(f"LLM_RATE_LIMIT_{provider.upper()}_RPM", rpm),
+                _env_int(f"LLM_RATE_LIMIT_{provider.upper()}_TPM", tpm),
+            )
+            for provider in ("anthropic", "openai", "google")
+        }
+        return cls(
+            enabled=os.getenv("LLM_RATE_LIMIT_ENABLED", "true").lower()
+            in ("true", "1", "yes"),
+            requests_per_minute=rpm,
+            tokens_per_minute=tpm,
+            provider_limits=provider_limits,
+            use_redis=os.getenv("LLM_RATE_LIMIT_BACKEND", "redis").lower() == "redis",
+            key_prefix=os.getenv("LLM_RATE_LIMIT_KEY_PREFIX", "asdlc:llm:ratelimit"),
+            max_retries=_env_int("LLM_MAX_RETRIES", 2),
+            max_retry_wait_seconds=float(os.getenv("LLM_MAX_RETRY_WAIT_SECONDS", "60")),
+        )
+
+    def limits_for(self, provider: str) -> tuple[int, int]:
+        """Return the (rpm, tpm) budget for a provider.
+
+        Args:
+            provider: Provider name.
+
+        Returns:
+            Requests and tokens per minute; 0 means unlimited.
+        """
+        if not self.enabled:
+            return 0, 0
+        return self.provider_limits.get(
+            provider, (self.requests_per_minute, self.tokens_per_minute)
+        )
+
+
+@dataclass(frozen=True)
+class RateLimitScope:
+    """The budget a call draws on: one provider, model and API key.
+
+    Attributes:
+        provider: Provider name.
+        model: Model identifier.
+        key_digest: Short hash of the API key. The key itself never leaves
+            the process.
+    """
+
+    provider: str
+    model: str
+    key_digest: str
+
+    @classmethod
+    def for_client(cls, provider: str, model: str, api_key: str) -> RateLimitScope:
+        """Build the scope for a client.
+
+        Args:
+            provider: Provider name.
+            model: Model identifier.
+            api_key: The client's API key.
+
+        Returns:
+            The scope.
+        """
+        digest = hashlib.sha256(api_key.encode()).hexdigest()[:12]
+        return cls(provider=provider, model=model, key_digest=digest)
+
+    @property
+    def bucket_id(self) -> str:
+        """Identifier of the scope's budget, used in Redis keys."""
+        return f"{self.provider}:{self.model}:{self.key_digest}"
+
+
+@dataclass
+class _LocalBucket:
+    """In-process GCRA state for one scope (all times in ms)."""
+
+    request_tat: float = 0.0
+    token_tat: float = 0.0
+    blocked_until: float = 0.0
+
+
+@dataclass
+class _Lane:
+    """Priority-ordered admission to one scope's budget within a process."""
+
+    busy: bool = False
+    waiters: list[tuple[int, int, asyncio.Future[None]]] = field(default_factory=list)
+
+
+class LLMRateLimiter:
+    """Shared RPM/TPM budgets for LLM calls, per provider, model and API key.
+
+    Not thread-safe; share one instance per event loop (the factory does).
+
+    Example:
+        >>> limiter = LLMRateLimiter(RateLimitConfig(requests_per_minute=50))
+        >>> await limiter.acquire(scope, tokens=1200, priority=LLMPriority.HITL)
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig | None = None,
+        redis_client: redis.Redis | None = None,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            config: Rate limit configuration. Defaults to the environment.
+            redis_client: Optional async Redis client. When omitted and
+                ``config.use_redis`` is set, the shared client is used.
+        """
+        self._config = config or RateLimitConfig.from_env()
+        self._redis = redis_client
+        self._redis_resolved = redis_client is not None or not self._config.use_redis
+        self._scripts: dict[str, Any] = {}
+        self._buckets: dict[str, _LocalBucket] = {}
+        self._lanes: dict[str, _Lane] = {}
+        self._sequence = itertools.count()
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._penalties = 0
+        self._redis_errors = 0
+
+    @property
+    def config(self) -> RateLimitConfig:
+        """The rate limit configuration."""
+        return self._config
+
+    def _key(self, scope: RateLimitScope, kind: str) -> str:
+        """Generate a Redis key for a scope.
+
+        Args:
+            scope: The budget scope.
+            kind: Key kind (rpm, tpm or block).
+
+        Returns:
+            Redis key in format {prefix}:{provider}:{model}:{key_digest}:{kind}.
+        """
+        return f"{self._config.key_prefix}:{scope.bucket_id}:{kind}"
+
+    async def acquire(
+        self,
+        scope: RateLimitScope,
+        tokens: int = 0,
+        priority: LLMPriority = LLMPriority.NORMAL,
+    ) -> float:
+        """Wait until the scope's budget admits one request of *tokens*.
+
+        Args:
+            scope: The budget to draw on.
+            tokens: Estimated tokens the request will consume.
+            priority: Priority class of the call.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        rpm, tpm = self._config.limits_for(scope.provider)
+        start = time.monotonic()
+        if rpm or tpm:
+            lane = self._lanes.setdefault(scope.bucket_id, _Lane())
+            while True:
+                await self._enter(lane, priority)
+                try:
+                    wait_ms = await self._take(scope, rpm, tpm, tokens, priority)
+                finally:
+                    self._leave(lane)
+                if wait_ms <= 0:
+                    break
+                await self._back_off(wait_ms)
+        else:
+            # No budgets, but a 429 seen by any process still holds calls back
+            while (wait_ms := await self._blocked_ms(scope)) > 0:
+                await self._back_off(wait_ms)
+
+        waited = time.monotonic() - start
+        self._wait_seconds += waited
+        if waited >= 1.0:
+            logger.info(
+                f"Waited {waited:.1f}s for LLM budget {scope.bucket_id} "
+                f"(priority {priority.name})"
+            )
+        return waited
+
+    async def record_usage(
+        self, scope: RateLimitScope, reserved: int, actual: int
+    ) -> None:
+        """Correct a reservation once the real token usage is known.
+
+        Args:
+            scope: The budget the call drew on.
+            reserved: Tokens reserved by :meth:`acquire`.
+            actual: Tokens the call consumed (0 if it failed).
+        """
+        _, tpm = self._config.limits_for(scope.provider)
+        if not tpm or actual == reserved:
+            return
+        delta_ms = (actual - reserved) * _PERIOD_MS / tpm
+
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                await self._script(client, "adjust")(
+                    keys=[self._key(scope, "tpm")], args=[round(delta_ms)]
+                )
+                return
+            except Exception as e:
+                self._redis_failed(e)
+
+        bucket = self._buckets.setdefault(scope.bucket_id, _LocalBucket())
+        bucket.token_tat = max(_now_ms(), bucket.token_tat) + delta_ms
+
+    async def penalize(self, scope: RateLimitScope, retry_after: float) -> None:
+        """Hold back all calls on a scope after the provider returned 429.
+
+        Args:
+            scope: The budget that was rate limited.
+            retry_after: Seconds the provider asked callers to wait.
+        """
+        self._penalties += 1
+        delay_ms = max(1, round(retry_after * 1000))
+        bucket = self._buckets.setdefault(scope.bucket_id, _LocalBucket())
+        bucket.blocked_until = max(bucket.blocked_until, _now_ms() + delay_ms)
+
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                await client.set(self._key(scope, "block"), "1", px=delay_ms)
+            except Exception as e:
+                self._redis_failed(e)
+
+    def is_blocked(self, scope: RateLimitScope) -> bool:
+        """Check whether a 429 penalty seen by this process blocks a scope.
+
+        Args:
+            scope: The budget to check.
+
+        Returns:
+            True while the scope's local penalty lasts.
+        """
+        bucket = self._buckets.get(scope.bucket_id)
+        return bucket is not None and bucket.blocked_until > _now_ms()
+
+    async def _take(
+        self,
+        scope: RateLimitScope,
+        rpm: int,
+        tpm: int,
+        tokens: int,
+        priority: LLMPriority,
+    ) -> float:
+        """Try to reserve budget once.
+
+        Returns:
+            0 if admitted, otherwise milliseconds to wait before retrying.
+        """
+        headroom = PRIORITY_HEADROOM[priority]
+        allowance = _PERIOD_MS * headroom
+        request_interval = _PERIOD_MS / rpm if rpm else 0.0
+        token_interval = _PERIOD_MS / tpm if tpm else 0.0
+
+        bucket = self._buckets.setdefault(scope.bucket_id, _LocalBucket())
+        local_block = bucket.blocked_until - _now_ms()
+        if local_block > 0:
+            return local_block
+
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                return int(
+                    await self._script(client, "acquire")(
+                        keys=[
+                            self._key(scope, "rpm"),
+                            self._key(scope, "tpm"),
+                            self._key(scope, "block"),
+                        ],
+                        args=[
+                            max(1, round(request_interval)) if rpm else 0,
+                            token_interval,
+                            tokens,
+                            round(allowance),
+                        ],
+                    )
+                )
+            except Exception as e:
+                self._redis_failed(e)
+
+        now = _now_ms()
+        token_cost = token_interval * tokens
+        new_request_tat = max(bucket.request_tat, now) + request_interval
+        new_token_tat = max(bucket.token_tat, now) + token_cost
+        # A request costing more than the allowance goes once the budget is idle
+        wait = max(
+            new_request_tat - now - max(allowance, request_interval) if rpm else 0.0,
+            new_token_tat - now - max(allowance, token_cost) if tpm else 0.0,
+        )
+        if wait > 0:
+            return wait
+        if rpm:
+            bucket.request_tat = new_request_tat
+        if tpm:
+            bucket.token_tat = new_token_tat
+        return 0.0
+
+    async def _blocked_ms(self, scope: RateLimitScope) -> float:
+        """Return how long a 429 penalty still blocks the scope.
+
+        Returns:
+            Milliseconds left on the local or shared block, 0 if none.
+        """
+        bucket = self._buckets.get(scope.bucket_id)
+        local_block = bucket.blocked_until - _now_ms() if bucket is not None else 0.0
+
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                shared_block = await client.pttl(self._key(scope, "block"))
+                return max(local_block, float(shared_block))
+            except Exception as e:
+                self._redis_failed(e)
+        return max(local_block, 0.0)
+
+    async def _back_off(self, wait_ms: float) -> None:
+        """Sleep for a wait the budget asked for, with jitter."""
+        self._waits += 1
+        await asyncio.sleep(wait_ms / 1000 * random.uniform(1.0, 1.1))
+
+    async def _enter(self, lane: _Lane, priority: LLMPriority) -> None:
+        """Wait for this caller's turn on a lane, highest priority first."""
+        if not lane.busy and not lane.waiters:
+            lane.busy = True
+            return
+
+        turn: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(lane.waiters, (priority, next(self._sequence), turn))
+        try:
+            await turn
+        except asyncio.CancelledError:
+            # The turn may have been handed over just before cancellation
+            if turn.done() and not turn.cancelled():
+                self._leave(lane)
+            raise
+
+    @staticmethod
+    def _leave(lane: _Lane) -> None:
+        """Hand the lane to the next live waiter, or mark it free."""
+        while lane.waiters:
+            _, _, turn = heapq.heappop(lane.waiters)
+            if not turn.done():
+                turn.set_result(None)
+                return
+        lane.busy = False
+
+    async def _get_redis(self) -> redis.Redis | None:
+        """Return the Redis client for shared budgets, if any."""
+        if not self._redis_resolved:
+            self._redis_resolved = True
+            try:
+                from src.core.redis_client import get_redis_client
+
+                self._redis = await get_redis_client()
+            except Exception as e:
+                logger.warning(f"LLM rate limiter falling back to local budgets: {e}")
+                self._redis = None
+        return self._redis
+
+    def _script(self, client: redis.Redis, name: str) -> Any:
+        """Return a registered Lua script."""
+        script = self._scripts.get(name)
+        if script is None:
+            source = _ACQUIRE_SCRIPT if name == "acquire" else _ADJUST_SCRIPT
+            script = client.register_script(source)
+            self._scripts[name] = script
+        return script
+
+    def _redis_failed(self, error: Exception) -> None:
+        """Log a Redis failure; the caller continues with local budgets."""
+        self._redis_errors += 1
+        if self._redis_errors == 1 or self._redis_errors % 100 == 0:
+            logger.warning(
+                f"LLM rate limiter Redis error ({self._redis_errors} so far), "
+                f"using local budgets: {error}"
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dictionary with wait, penalty and Redis error counters.
+        """
+        return {
+            "scopes": len(self._buckets),
+            "waits": self._waits,
+            "wait_seconds": round(self._wait_seconds, 3),
+            "penalties": self._penalties,
+            "redis_errors": self._redis_errors,
+        }
+
+
+def _now_ms() -> float:
+    """Current wall-clock time in milliseconds."""
+    return time.time() * 1000
+
+
+# Global rate limiter instance
+_llm_rate_limiter: LLMRateLimiter | None = None
+
+
+def get_llm_rate_limiter() -> LLMRateLimiter:
+    """Get the global LLM rate limiter instance.
+
+    Returns:
+        LLMRateLimiter: The rate limiter, configured from the environment.
+    """
+    global _llm_rate_limiter
+    if _llm_rate_limiter is None:
+        _llm_rate_limiter = LLMRateLimiter()
+    return _llm_rate_limiter
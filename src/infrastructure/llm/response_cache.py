@@ -0,0 +1,447 @@
+"""Response cache for deterministic LLM calls.
+
+Agents often repeat a call verbatim: retries after a JSON parse failure,
+re-runs of unchanged pipeline stages after a HITL rejection, classification
+of re-submitted ideas. CachingLLMClient wraps a BaseLLMClient and answers
+such repeats from LLMResponseCache instead of calling the provider again.
+
+Only deterministic calls are cached: those at temperature 0, or those that
+ask for caching explicitly with ``cache=True``. ``cache=False`` always
+bypasses the cache. A streaming call is answered from the cache too, and
+its response is cached once the stream has been read to the end; streams
+closed early are not cached.
+
+The cache has a bounded in-memory LRU tier and, when Redis is available, a
+shared Redis tier with a TTL.
+
+Key patterns:
+    - {prefix}{sha256 of the request} - Response JSON
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from src.infrastructure.llm.base_client import (
+    BaseLLMClient,
+    DelegatingLLMClient,
+    LLMResponse,
+    PromptInput,
+    StreamChunk,
+)
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResponseCacheConfig:
+    """Response cache configuration.
+
+    Attributes:
+        ttl_seconds: Lifetime of a cached response.
+        max_memory_bytes: Total size of responses held in memory.
+        max_entry_bytes: Largest response that is cached.
+        use_redis: Share cached responses across processes through Redis.
+        key_prefix: Redis key prefix.
+    """
+
+    ttl_seconds: int = 86400
+    max_memory_bytes: int = 64 * 1024 * 1024
+    max_entry_bytes: int = 1024 * 1024
+    use_redis: bool = True
+    key_prefix: str = "asdlc:llm:response:"
+
+    @classmethod
+    def from_env(cls) -> ResponseCacheConfig:
+        """Create response cache configuration from environment variables.
+
+        Environment variables:
+            LLM_RESPONSE_CACHE_TTL_SECONDS: Entry lifetime (default: 86400)
+            LLM_RESPONSE_CACHE_MAX_MEMORY_BYTES: In-memory size (default: 64 MiB)
+            LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES: Largest entry (default: 1 MiB)
+            LLM_RESPONSE_CACHE_BACKEND: "redis" or "local" (default: redis)
+            LLM_RESPONSE_CACHE_KEY_PREFIX: Redis key prefix
+        """
+        return cls(
+            ttl_seconds=int(os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", "86400")),
+            max_memory_bytes=int(
+                os.getenv("LLM_RESPONSE_CACHE_MAX_MEMORY_BYTES", str(64 * 1024 * 1024))
+            ),
+            max_entry_bytes=int(
+                os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES", str(1024 * 1024))
+            ),
+            use_redis=os.getenv("LLM_RESPONSE_CACHE_BACKEND", "redis").lower() == "redis",
+            key_prefix=os.getenv("LLM_RESPONSE_CACHE_KEY_PREFIX", "asdlc:llm:response:"),
+        )
+
+
+def request_key(**request: Any) -> str:
+    """Hash the parts of a request that determine its response.
+
+    Args:
+        **request: Provider, model, prompts and sampling settings.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form of the request.
+    """
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier cache of LLM responses keyed by request hash.
+
+    Cache errors are logged and treated as misses; they never fail a call.
+
+    Example:
+        >>> cache = LLMResponseCache()
+        >>> await cache.put(key, response)
+        >>> cached = await cache.get(key)
+    """
+
+    def __init__(
+        self,
+        config: ResponseCacheConfig | None = None,
+        redis_client: redis.Redis | None = None,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            config: Cache configuration. Defaults to the environment.
+            redis_client: Optional async Redis client. When omitted and
+                ``config.use_redis`` is set, the shared client is used.
+        """
+        self._config = config or ResponseCacheConfig.from_env()
+        self._redis = redis_client
+        self._redis_resolved = redis_client is not None or not self._config.use_redis
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._memory_bytes = 0
+        self._hits = 0
+        self._remote_hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    async def get(self, key: str) -> LLMResponse | None:
+        """Look up a cached response.
+
+        Args:
+            key: Request hash from :func:`request_key`.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, raw = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return _decode(raw)
+            self._forget(key)
+
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                raw = await client.get(self._config.key_prefix + key)
+            except Exception as e:
+                logger.warning(f"LLM response cache lookup failed: {e}")
+                raw = None
+            if raw:
+                if isinstance(raw, bytes):
+                    raw = raw.decode("utf-8")
+                response = _decode(raw)
+                if response is not None:
+                    self._remember(key, raw)
+                    self._remote_hits += 1
+                    return response
+
+        self._misses += 1
+        return None
+
+    async def put(self, key: str, response: LLMResponse) -> bool:
+        """Cache a response.
+
+        Args:
+            key: Request hash from :func:`request_key`.
+            response: The response to cache.
+
+        Returns:
+            True if the response was cached, False if it is too large.
+        """
+        raw = json.dumps(dataclasses.asdict(response))
+        if len(raw) > self._config.max_entry_bytes:
+            return False
+
+        self._remember(key, raw)
+        self._stores += 1
+
+        client = await self._get_redis()
+        if client is not None:
+            try:
+                await client.set(
+                    self._config.key_prefix + key, raw, ex=self._config.ttl_seconds
+                )
+            except Exception as e:
+                logger.warning(f"LLM response cache store failed: {e}")
+        return True
+
+    def _remember(self, key: str, raw: str) -> None:
+        """Add an entry to the in-memory tier, evicting the oldest."""
+        self._forget(key)
+        self._entries[key] = (time.monotonic() + self._config.ttl_seconds, raw)
+        self._memory_bytes += len(raw)
+        while self._memory_bytes > self._config.max_memory_bytes and self._entries:
+            self._forget(next(iter(self._entries)))
+
+    def _forget(self, key: str) -> None:
+        """Drop an entry from the in-memory tier."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= len(entry[1])
+
+    async def _get_redis(self) -> redis.Redis | None:
+        """Return the Redis client for the shared tier, if any."""
+        if not self._redis_resolved:
+            self._redis_resolved = True
+            try:
+                from src.core.redis_client import get_redis_client
+
+                self._redis = await get_redis_client()
+            except Exception as e:
+                logger.warning(f"LLM response cache using memory only: {e}")
+                self._redis = None
+        return self._redis
+
+    def clear(self) -> None:
+        """Remove all in-memory entries."""
+        self._entries.clear()
+        self._memory_bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get response cache statistics.
+
+        Returns:
+            Dictionary with entry count, memory use and hit/miss counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "memory_bytes": self._memory_bytes,
+            "hits": self._hits,
+            "remote_hits": self._remote_hits,
+            "misses": self._misses,
+            "stores": self._stores,
+        }
+
+
+def _decode(raw: str) -> LLMResponse | None:
+    """Rebuild a cached response, or None if the entry is corrupt."""
+    try:
+        return LLMResponse(**json.loads(raw))
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning(f"Discarding corrupt LLM response cache entry: {e}")
+        return None
+
+
+class CachingLLMClient(DelegatingLLMClient):
+    """BaseLLMClient wrapper that answers repeated deterministic calls from cache.
+
+    Concurrent identical calls share one provider call.
+
+    Usage:
+        client = CachingLLMClient(AnthropicClient(...), LLMResponseCache())
+        response = await client.generate(prompt="Classify...", temperature=0)
+    """
+
+    def __init__(self, inner: BaseLLMClient, cache: LLMResponseCache) -> None:
+        """Initialize the caching client.
+
+        Args:
+            inner: The client that performs uncached calls.
+            cache: The response cache.
+        """
+        super().__init__(inner)
+        self._cache = cache
+        self._in_flight: dict[str, asyncio.Future[LLMResponse]] = {}
+
+    def _cache_key(
+        self,
+        prompt: PromptInput,
+        system: PromptInput | None,
+        messages: list[dict[str, Any]] | None,
+        tools: list[dict[str, Any]] | None,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """Return the cache key for a call, or None if it must not be cached.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            kwargs: Additional call parameters.
+
+        Returns:
+            The request hash, or None for calls that are not deterministic
+            and did not ask for caching.
+        """
+        requested = kwargs.get("cache")
+        temperature = kwargs.get("temperature", self._temperature)
+        if requested is False or (requested is None and temperature != 0):
+            return None
+
+        return request_key(
+            provider=self.provider,
+            model=self._model,
+            system=system,
+            prompt=prompt,
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=kwargs.get("max_tokens", self._max_tokens),
+            top_p=self._top_p,
+            top_k=self._top_k,
+        )
+
+    async def generate(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a response, reusing a cached one for repeated calls.
+
+        Identical calls in flight wait for the first one. If that call is
+        cancelled, the waiting calls are not: one of them issues the call
+        again and the others wait for it.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to the wrapped client).
+                ``cache`` forces caching on (True) or off (False).
+
+        Returns:
+            LLMResponse: The cached or freshly generated response.
+        """
+        key = self._cache_key(prompt, system, messages, tools, kwargs)
+        call_kwargs = {k: v for k, v in kwargs.items() if k != "cache"}
+        if key is None:
+            return await self._inner.generate(
+                prompt=prompt, system=system, messages=messages, tools=tools, **call_kwargs
+            )
+
+        while (pending := self._in_flight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # The leading call was cancelled; take over or follow the next one
+
+        cached = await self._cache.get(key)
+        if cached is not None:
+            logger.debug(f"LLM response cache hit: {self.provider}/{self._model}")
+            return cached
+
+        future: asyncio.Future[LLMResponse] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await self._inner.generate(
+                prompt=prompt, system=system, messages=messages, tools=tools, **call_kwargs
+            )
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Mark the exception retrieved when nobody else was waiting
+                future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+        future.set_result(response)
+        if response.content or response.tool_calls:
+            await self._cache.put(key, response)
+        return response
+
+    async def generate_stream(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a response, replaying a cached one for repeated calls.
+
+        A cached response is replayed as a single chunk. A fresh response
+        is cached when its final chunk arrives.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to the wrapped client).
+                ``cache`` forces caching on (True) or off (False).
+
+        Yields:
+            StreamChunk: Chunks of the response as they arrive.
+        """
+        key = self._cache_key(prompt, system, messages, tools, kwargs)
+        call_kwargs = {k: v for k, v in kwargs.items() if k != "cache"}
+        if key is not None:
+            cached = await self._cache.get(key)
+            if cached is not None and not cached.tool_calls:
+                logger.debug(f"LLM response cache hit: {self.provider}/{self._model}")
+                yield StreamChunk(content=cached.content)
+                yield StreamChunk(content="", is_final=True, usage=cached.usage)
+                return
+
+        parts: list[str] = []
+        async for chunk in self._inner.generate_stream(
+            prompt=prompt, system=system, messages=messages, tools=tools, **call_kwargs
+        ):
+            parts.append(chunk.content)
+            if chunk.is_final and key is not None and any(parts):
+                response = LLMResponse(
+                    content="".join(parts), model=self._model, usage=chunk.usage or {}
+                )
+                await self._cache.put(key, response)
+            yield chunk
+
+
+# Global response cache instance
+_llm_response_cache: LLMResponseCache | None = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Get the global LLM response cache instance.
+
+    Returns:
+        LLMResponseCache: The cache, configured from the environment.
+    """
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        _llm_response_cache = LLMResponseCache()
+    return _llm_response_cache
@@ -0,0 +1,520 @@
+"""Latency-aware routing and hedged requests across LLM targets.
+
+RoutingLLMClient wraps an ordered list of clients, the primary provider
+and model of an agent role followed by its fallbacks, and tracks the
+rolling latency and error rate of each target:
+
+- Calls go to the first target in preference order that is neither
+  erroring nor much slower than the fastest healthy target.
+- With hedging enabled, a backup request is sent to the next target once
+  the first has run longer than its p95 latency. The first success wins
+  and the slower call is cancelled.
+- Rate limit, overload and server errors fail over to the next target.
+  Other errors, such as invalid requests, are raised. Targets retry
+  nothing themselves (the factory builds them with max_retries=0), so
+  failover is immediate, and targets whose rate limit scope is blocked
+  after a 429 are tried after the others.
+
+Streams fail over only until their first chunk arrives and are not
+hedged, since the caller consumes output as it is produced.
+
+Target statistics are kept in a LatencyTracker keyed by provider, model
+and API key, so roles sharing a target share what is known about it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.infrastructure.llm.base_client import (
+    BaseLLMClient,
+    LLMResponse,
+    PromptInput,
+    StreamChunk,
+)
+from src.infrastructure.llm.rate_limiter import is_retryable_error
+from src.infrastructure.metrics.definitions import LLM_ROUTING_EVENTS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RoutingConfig:
+    """Configuration for latency tracking and hedged requests.
+
+    Attributes:
+        ewma_alpha: Weight of the newest sample in latency and error
+            moving averages.
+        latency_window: Number of recent latencies kept per target for
+            the p95 estimate.
+        min_samples: Latencies needed before a target's p95 is trusted.
+        initial_hedge_delay_seconds: Hedge delay for targets without
+            enough samples.
+        min_hedge_delay_seconds: Lower bound of the hedge delay.
+        max_hedge_delay_seconds: Upper bound of the hedge delay.
+        max_hedges: Backup requests sent per call, at most.
+        error_threshold: Error rate at which a target is avoided.
+        error_half_life_seconds: Time for an idle target's error rate to
+            halve, so avoided targets are tried again.
+        slow_factor: A target whose average latency exceeds the fastest
+            healthy target's by this factor is tried after it.
+    """
+
+    ewma_alpha: float = 0.2
+    latency_window: int = 100
+    min_samples: int = 5
+    initial_hedge_delay_seconds: float = 10.0
+    min_hedge_delay_seconds: float = 0.5
+    max_hedge_delay_seconds: float = 60.0
+    max_hedges: int = 1
+    error_threshold: float = 0.5
+    error_half_life_seconds: float = 60.0
+    slow_factor: float = 2.0
+
+    @classmethod
+    def from_env(cls) -> RoutingConfig:
+        """Create configuration from environment variables.
+
+        Environment variables:
+            LLM_ROUTING_EWMA_ALPHA: Moving average weight (default: 0.2)
+            LLM_ROUTING_LATENCY_WINDOW: Latencies kept per target (default: 100)
+            LLM_ROUTING_MIN_SAMPLES: Samples before p95 is used (default: 5)
+            LLM_ROUTING_INITIAL_HEDGE_DELAY_SECONDS: Default hedge delay (default: 10)
+            LLM_ROUTING_MIN_HEDGE_DELAY_SECONDS: Minimum hedge delay (default: 0.5)
+            LLM_ROUTING_MAX_HEDGE_DELAY_SECONDS: Maximum hedge delay (default: 60)
+            LLM_ROUTING_MAX_HEDGES: Backup requests per call (default: 1)
+            LLM_ROUTING_ERROR_THRESHOLD: Error rate that avoids a target (default: 0.5)
+            LLM_ROUTING_ERROR_HALF_LIFE_SECONDS: Error rate half-life (default: 60)
+            LLM_ROUTING_SLOW_FACTOR: Latency factor that demotes a target (default: 2)
+
+        Returns:
+            RoutingConfig: Configuration instance.
+        """
+        return cls(
+            ewma_alpha=float(os.getenv("LLM_ROUTING_EWMA_ALPHA", "0.2")),
+            latency_window=int(os.getenv("LLM_ROUTING_LATENCY_WINDOW", "100")),
+            min_samples=int(os.getenv("LLM_ROUTING_MIN_SAMPLES", "5")),
+            initial_hedge_delay_seconds=float(
+                os.getenv("LLM_ROUTING_INITIAL_HEDGE_DELAY_SECONDS", "10")
+            ),
+            min_hedge_delay_seconds=float(
+                os.getenv("LLM_ROUTING_MIN_HEDGE_DELAY_SECONDS", "0.5")
+            ),
+            max_hedge_delay_seconds=float(
+                os.getenv("LLM_ROUTING_MAX_HEDGE_DELAY_SECONDS", "60")
+            ),
+            max_hedges=int(os.getenv("LLM_ROUTING_MAX_HEDGES", "1")),
+            error_threshold=float(os.getenv("LLM_ROUTING_ERROR_THRESHOLD", "0.5")),
+            error_half_life_seconds=float(
+                os.getenv("LLM_ROUTING_ERROR_HALF_LIFE_SECONDS", "60")
+            ),
+            slow_factor=float(os.getenv("LLM_ROUTING_SLOW_FACTOR", "2")),
+        )
+
+
+class TargetStats:
+    """Rolling latency and error statistics of one target."""
+
+    def __init__(self, config: RoutingConfig) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            config: Routing configuration.
+        """
+        self._config = config
+        self._latencies: deque[float] = deque(maxlen=config.latency_window)
+        self._latency_ewma: float | None = None
+        self._error_ewma = 0.0
+        self._error_updated_at = time.monotonic()
+
+    @property
+    def latency_ewma(self) -> float | None:
+        """Return the moving average latency, None before the first sample."""
+        return self._latency_ewma
+
+    @property
+    def samples(self) -> int:
+        """Return the number of latencies in the window."""
+        return len(self._latencies)
+
+    def error_rate(self, now: float | None = None) -> float:
+        """Return the moving average error rate, decayed while idle.
+
+        Args:
+            now: Current monotonic time; defaults to now.
+
+        Returns:
+            float: Error rate between 0 and 1.
+        """
+        if now is None:
+            now = time.monotonic()
+        idle = max(0.0, now - self._error_updated_at)
+        return self._error_ewma * 0.5 ** (idle / self._config.error_half_life_seconds)
+
+    def p95(self) -> float | None:
+        """Return the 95th percentile latency, None with too few samples."""
+        if len(self._latencies) < self._config.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def record_latency(self, seconds: float) -> None:
+        """Add a latency sample.
+
+        Args:
+            seconds: Call latency.
+        """
+        self._latencies.append(seconds)
+        alpha = self._config.ewma_alpha
+        if self._latency_ewma is None:
+            self._latency_ewma = seconds
+        else:
+            self._latency_ewma = alpha * seconds + (1 - alpha) * self._latency_ewma
+
+    def record_outcome(self, failed: bool) -> None:
+        """Update the error rate with a call outcome.
+
+        Args:
+            failed: Whether the call failed.
+        """
+        now = time.monotonic()
+        alpha = self._config.ewma_alpha
+        self._error_ewma = alpha * float(failed) + (1 - alpha) * self.error_rate(now)
+        self._error_updated_at = now
+
+
+class LatencyTracker:
+    """Statistics of every target, keyed by provider, model and API key."""
+
+    def __init__(self, config: RoutingConfig | None = None) -> None:
+        """Initialize the tracker.
+
+        Args:
+            config: Routing configuration. Defaults to RoutingConfig.from_env().
+        """
+        self._config = config or RoutingConfig.from_env()
+        self._stats: dict[str, TargetStats] = {}
+
+    @property
+    def config(self) -> RoutingConfig:
+        """Return the routing configuration."""
+        return self._config
+
+    def stats_for(self, client: BaseLLMClient) -> TargetStats:
+        """Return the statistics of a target, creating them if needed.
+
+        Args:
+            client: The target's client.
+
+        Returns:
+            TargetStats: The target's statistics.
+        """
+        key = client.rate_limit_scope.bucket_id
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = TargetStats(self._config)
+        return stats
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get latency and error statistics per target.
+
+        Returns:
+            dict[str, Any]: Statistics keyed by provider:model:key digest.
+        """
+        now = time.monotonic()
+        return {
+            key: {
+                "latency_ewma": stats.latency_ewma,
+                "p95": stats.p95(),
+                "error_rate": round(stats.error_rate(now), 4),
+                "samples": stats.samples,
+            }
+            for key, stats in self._stats.items()
+        }
+
+
+class RoutingLLMClient(BaseLLMClient):
+    """BaseLLMClient that routes, hedges and fails over across targets.
+
+    Provider, model and settings reported are those of the primary
+    target; ``LLMResponse.model`` tells which target answered.
+
+    Usage:
+        client = RoutingLLMClient([primary, fallback], role="coding", hedge=True)
+        response = await client.generate(prompt="Hello")
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[BaseLLMClient],
+        role: str,
+        hedge: bool = False,
+        tracker: LatencyTracker | None = None,
+    ) -> None:
+        """Initialize the routing client.
+
+        Args:
+            targets: Clients in order of preference; the first is primary.
+            role: Agent role, used as a metric label.
+            hedge: Send backup requests to calls slower than usual. With a
+                single target, the backup goes to the same target.
+            tracker: Target statistics, shared across routing clients.
+
+        Raises:
+            ValueError: If no targets are given.
+        """
+        if not targets:
+            raise ValueError("RoutingLLMClient needs at least one target")
+        primary = targets[0]
+        super().__init__(
+            api_key=primary._api_key,
+            model=primary.model,
+            temperature=primary.temperature,
+            max_tokens=primary.max_tokens,
+            top_p=primary._top_p,
+            top_k=primary._top_k,
+            rate_limiter=primary.rate_limiter,
+        )
+        self._targets = list(targets)
+        self._role = role
+        self._hedge = hedge
+        self._tracker = tracker or LatencyTracker()
+
+    @property
+    def provider(self) -> str:
+        """Return the provider name of the primary target.
+
+        Returns:
+            str: Provider name.
+        """
+        return self._targets[0].provider
+
+    @property
+    def targets(self) -> list[BaseLLMClient]:
+        """Return the targets in order of preference.
+
+        Returns:
+            list[BaseLLMClient]: The targets.
+        """
+        return list(self._targets)
+
+    def ranked_targets(self) -> list[BaseLLMClient]:
+        """Order targets for the next call.
+
+        Healthy targets keep their preference order, but a target much
+        slower than the fastest healthy one moves behind the others.
+        Targets blocked by the rate limiter after a 429 come next, and
+        targets with a high error rate go last.
+
+        Returns:
+            list[BaseLLMClient]: Targets in the order to try them.
+        """
+        config = self._tracker.config
+        now = time.monotonic()
+        healthy: list[BaseLLMClient] = []
+        blocked: list[BaseLLMClient] = []
+        failing: list[BaseLLMClient] = []
+        for target in self._targets:
+            limiter = target.rate_limiter
+            if self._tracker.stats_for(target).error_rate(now) >= config.error_threshold:
+                failing.append(target)
+            elif limiter is not None and limiter.is_blocked(target.rate_limit_scope):
+                blocked.append(target)
+            else:
+                healthy.append(target)
+
+        latencies = [self._tracker.stats_for(t).latency_ewma for t in healthy]
+        known = [latency for latency in latencies if latency is not None]
+        if not known:
+            return healthy + blocked + failing
+        limit = min(known) * config.slow_factor
+        slow = [
+            t for t, lat in zip(healthy, latencies, strict=True) if lat is not None and lat > limit
+        ]
+        fast = [t for t in healthy if t not in slow]
+        return fast + slow + blocked + failing
+
+    def hedge_delay(self, target: BaseLLMClient) -> float:
+        """Return how long to wait on a target before sending a backup.
+
+        Args:
+            target: The target called first.
+
+        Returns:
+            float: The target's p95 latency, clamped to the configured
+                bounds, or the initial delay for targets with few samples.
+        """
+        config = self._tracker.config
+        p95 = self._tracker.stats_for(target).p95()
+        if p95 is None:
+            return config.initial_hedge_delay_seconds
+        return min(max(p95, config.min_hedge_delay_seconds), config.max_hedge_delay_seconds)
+
+    def _event(self, event: str) -> None:
+        """Count a routing event."""
+        LLM_ROUTING_EVENTS.labels(role=self._role, event=event).inc()
+
+    async def generate(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a response from the first target to succeed.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to the targets).
+
+        Returns:
+            LLMResponse: The first successful response.
+
+        Raises:
+            Exception: The error of the last target tried, when every
+                target failed, or the first error that is not transient.
+        """
+        ranked = self.ranked_targets()
+        pending: dict[asyncio.Task[LLMResponse], tuple[BaseLLMClient, float]] = {}
+        hedges = 0
+        last_target = ranked[0]
+        last_started = 0.0
+
+        def launch(target: BaseLLMClient) -> None:
+            nonlocal last_target, last_started
+            task = asyncio.create_task(
+                target.generate(
+                    prompt=prompt, system=system, messages=messages, tools=tools, **kwargs
+                )
+            )
+            last_target, last_started = target, time.monotonic()
+            pending[task] = (target, last_started)
+
+        launch(ranked[0])
+        next_index = 1
+        try:
+            while True:
+                timeout = None
+                can_hedge = next_index < len(ranked) or len(ranked) == 1
+                if self._hedge and can_hedge and hedges < self._tracker.config.max_hedges:
+                    deadline = last_started + self.hedge_delay(last_target)
+                    timeout = max(0.0, deadline - time.monotonic())
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedges += 1
+                    self._event("hedge")
+                    if next_index < len(ranked):
+                        launch(ranked[next_index])
+                        next_index += 1
+                    else:
+                        launch(ranked[0])
+                    continue
+
+                errors: list[BaseException] = []
+                for task in done:
+                    target, started = pending.pop(task)
+                    stats = self._tracker.stats_for(target)
+                    exc = task.exception()
+                    if exc is None:
+                        stats.record_latency(time.monotonic() - started)
+                        stats.record_outcome(failed=False)
+                        if target is not ranked[0]:
+                            self._event("backup_won")
+                        return task.result()
+                    stats.record_outcome(failed=True)
+                    errors.append(exc)
+
+                error = errors[-1]
+                if not is_retryable_error(error):
+                    raise error
+                if next_index < len(ranked):
+                    logger.warning(
+                        f"{self._role} LLM call failed ({type(error).__name__}), "
+                        f"failing over to {ranked[next_index].provider}/"
+                        f"{ranked[next_index].model}"
+                    )
+                    self._event("failover")
+                    launch(ranked[next_index])
+                    next_index += 1
+                elif not pending:
+                    raise error
+        finally:
+            await self._cancel(pending)
+
+    async def _cancel(
+        self, pending: dict[asyncio.Task[LLMResponse], tuple[BaseLLMClient, float]]
+    ) -> None:
+        """Cancel calls that lost the race.
+
+        A loser's running time is recorded as a latency sample. It is a
+        lower bound, but enough to demote a target that keeps losing.
+
+        Args:
+            pending: Calls still running, with their target and start time.
+        """
+        if not pending:
+            return
+        now = time.monotonic()
+        for task, (target, started) in pending.items():
+            task.cancel()
+            self._tracker.stats_for(target).record_latency(now - started)
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def generate_stream(
+        self,
+        prompt: PromptInput = "",
+        system: PromptInput | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream a response, failing over until the first chunk arrives.
+
+        Args:
+            prompt: The user prompt.
+            system: Optional system message.
+            messages: Optional conversation history.
+            tools: Optional tool definitions.
+            **kwargs: Additional parameters (passed to the targets).
+
+        Yields:
+            StreamChunk: Chunks of the response as they arrive.
+        """
+        ranked = self.ranked_targets()
+        for index, target in enumerate(ranked):
+            stats = self._tracker.stats_for(target)
+            started = False
+            try:
+                async for chunk in target.generate_stream(
+                    prompt=prompt, system=system, messages=messages, tools=tools, **kwargs
+                ):
+                    started = True
+                    yield chunk
+            except Exception as exc:
+                stats.record_outcome(failed=True)
+                if started or not is_retryable_error(exc) or index == len(ranked) - 1:
+                    raise
+                logger.warning(
+                    f"{self._role} LLM stream failed ({type(exc).__name__}), "
+                    f"failing over to {ranked[index + 1].provider}/{ranked[index + 1].model}"
+                )
+                self._event("failover")
+                continue
+
+            stats.record_outcome(failed=False)
+            return
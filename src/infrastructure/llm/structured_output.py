@@ -0,0 +1,612 @@
+"""Streaming structured (JSON) output from LLM clients.
+
+generate_structured() streams a completion with BaseLLMClient.generate_stream
+and checks it while it arrives:
+
+- IncrementalJSONParser validates the JSON object character by character,
+  so malformed output is detected at the first bad character.
+- Top-level fields are checked against the expected types as soon as their
+  value starts, e.g. ``{"tasks": list}`` rejects ``"tasks": "none"`` before
+  the rest of the object is generated.
+- An invalid stream is closed at once, which cancels the provider call,
+  and the model is re-prompted with the reason. A failed attempt costs the
+  tokens generated until the mistake, not a full max_tokens completion.
+- Reading stops as soon as the object is complete; trailing prose and
+  code fences are never waited for.
+
+Partial objects are reported to an optional progress callback, for example
+RedisProgressPublisher, which publishes them for the UI.
+
+Streaming is only used when a progress callback is given. Without one, and
+for clients without streaming (such as test stubs), the client is called
+with generate(), which CachingLLMClient can answer from its cache, and the
+full response goes through the same checks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.infrastructure.llm.base_client import BaseLLMClient, PromptInput, PromptSegment
+from src.infrastructure.llm.instrumentation import get_llm_call_context
+
+logger = logging.getLogger(__name__)
+
+
+_NUMBER_RE = re.compile(r"-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_LITERALS = {"t": ("true", bool), "f": ("false", bool), "n": ("null", type(None))}
+_ESCAPES = frozenset('"\\/bfnrtu')
+_HEX = frozenset("0123456789abcdefABCDEF")
+
+# Parser states
+_VALUE = "value"
+_VALUE_OR_END = "value_or_end"
+_KEY = "key"
+_KEY_OR_END = "key_or_end"
+_COLON = "colon"
+_AFTER_VALUE = "after_value"
+_STRING = "string"
+_NUMBER = "number"
+_LITERAL = "literal"
+
+
+class JSONStreamError(ValueError):
+    """Raised when streamed output cannot become the expected JSON object."""
+
+
+class IncrementalJSONParser:
+    """Validates a JSON object incrementally as text is fed in.
+
+    Text before the first ``{`` (prose, a code fence) is skipped, as is
+    anything after the object closes.
+
+    Usage:
+        parser = IncrementalJSONParser()
+        for piece in pieces:
+            parser.feed(piece)  # raises JSONStreamError on invalid JSON
+        if parser.complete:
+            data = parser.result()
+    """
+
+    def __init__(self, max_preamble_chars: int = 4000) -> None:
+        """Initialize the parser.
+
+        Args:
+            max_preamble_chars: Characters allowed before the object starts.
+        """
+        self._max_preamble = max_preamble_chars
+        self._preamble = 0
+        self._buf: list[str] = []
+        self._stack: list[str] = []
+        self._state = _VALUE
+        self._complete = False
+        self._string_is_key = False
+        self._escape = 0
+        self._token: list[str] = []
+        self._key: list[str] = []
+        self._current_key: str | None = None
+        self._member_types: dict[str, type] = {}
+        self._safe_end = 0
+        self._safe_stack: tuple[str, ...] = ()
+        self._partial: dict[str, Any] | None = None
+        self._partial_end = -1
+
+    @property
+    def started(self) -> bool:
+        """Return whether the object has started."""
+        return bool(self._buf)
+
+    @property
+    def complete(self) -> bool:
+        """Return whether the object has been closed."""
+        return self._complete
+
+    @property
+    def chars(self) -> int:
+        """Return the number of characters of the object seen so far."""
+        return len(self._buf)
+
+    @property
+    def member_types(self) -> dict[str, type]:
+        """Return the JSON type of each top-level field started so far.
+
+        Numbers are reported as float, booleans as bool and null as NoneType.
+        """
+        return dict(self._member_types)
+
+    def feed(self, text: str) -> None:
+        """Consume more output.
+
+        Args:
+            text: The next piece of the completion.
+
+        Raises:
+            JSONStreamError: If the text cannot continue a valid object.
+        """
+        for char in text:
+            if self._complete:
+                return
+            if not self._buf:
+                if char != "{":
+                    self._preamble += 1
+                    if self._preamble > self._max_preamble:
+                        raise JSONStreamError(
+                            f"no JSON object in the first {self._max_preamble} characters"
+                        )
+                    continue
+            self._buf.append(char)
+            self._step(char)
+
+    def partial(self) -> dict[str, Any] | None:
+        """Return the object parsed so far, with open containers closed.
+
+        Only complete values are included: a string, number or field that
+        is still arriving is left out.
+
+        Returns:
+            dict | None: The partial object, or None before it starts.
+        """
+        if not self._buf:
+            return None
+        if self._partial_end != self._safe_end:
+            closers = "".join("}" if c == "o" else "]" for c in reversed(self._safe_stack))
+            self._partial = json.loads("".join(self._buf[: self._safe_end]) + closers)
+            self._partial_end = self._safe_end
+        return self._partial
+
+    def result(self) -> dict[str, Any]:
+        """Return the complete object.
+
+        Raises:
+            JSONStreamError: If the object is not complete.
+        """
+        if not self._complete:
+            if not self._buf:
+                raise JSONStreamError("response contains no JSON object")
+            raise JSONStreamError("response ended before the JSON object was complete")
+        return json.loads("".join(self._buf))
+
+    def _step(self, char: str) -> None:
+        """Advance the state machine by one character of the object."""
+        state = self._state
+        if state == _STRING:
+            self._string_char(char)
+            return
+        if state == _NUMBER:
+            if char in _NUMBER_CHARS:
+                self._token.append(char)
+                return
+            number = "".join(self._token)
+            if not _NUMBER_RE.fullmatch(number):
+                raise JSONStreamError(f"invalid number {number!r}")
+            self._value_done(len(self._buf) - 1)
+            self._step(char)
+            return
+        if state == _LITERAL:
+            self._token.append(char)
+            literal = "".join(self._token)
+            expected = _LITERALS[literal[0]][0]
+            if not expected.startswith(literal):
+                raise JSONStreamError(f"invalid literal {literal!r}")
+            if literal == expected:
+                self._value_done(len(self._buf))
+            return
+
+        if char in " \t\r\n":
+            return
+
+        if state in (_VALUE, _VALUE_OR_END):
+            if state == _VALUE_OR_END and char == "]":
+                self._close()
+                return
+            self._start_value(char)
+        elif state in (_KEY, _KEY_OR_END):
+            if state == _KEY_OR_END and char == "}":
+                self._close()
+            elif char == '"':
+                self._string_is_key = True
+                self._key = []
+                self._state = _STRING
+            else:
+                raise JSONStreamError(f"expected a field name, got {char!r}")
+        elif state == _COLON:
+            if char != ":":
+                raise JSONStreamError(f"expected ':', got {char!r}")
+            self._state = _VALUE
+        elif state == _AFTER_VALUE:
+            top = self._stack[-1]
+            if char == ",":
+                self._state = _KEY if top == "o" else _VALUE
+            elif char == "}" and top == "o":
+                self._close()
+            elif char == "]" and top == "a":
+                self._close()
+            else:
+                raise JSONStreamError(f"unexpected {char!r} after a value")
+
+    def _start_value(self, char: str) -> None:
+        """Begin a value whose first character is *char*."""
+        if char == "{":
+            value_type: type = dict
+        elif char == "[":
+            value_type = list
+        elif char == '"':
+            value_type = str
+        elif char == "-" or char.isdigit():
+            value_type = float
+        elif char in _LITERALS:
+            value_type = _LITERALS[char][1]
+        else:
+            raise JSONStreamError(f"unexpected {char!r} where a value was expected")
+
+        if len(self._stack) == 1 and self._current_key is not None:
+            self._member_types[self._current_key] = value_type
+
+        if char in "{[":
+            self._stack.append("o" if char == "{" else "a")
+            self._state = _KEY_OR_END if char == "{" else _VALUE_OR_END
+            self._mark_safe(len(self._buf))
+        elif char == '"':
+            self._string_is_key = False
+            self._state = _STRING
+        elif value_type is float:
+            self._token = [char]
+            self._state = _NUMBER
+        else:
+            self._token = [char]
+            self._state = _LITERAL
+
+    def _string_char(self, char: str) -> None:
+        """Consume one character inside a string."""
+        if self._escape:
+            if self._escape == 1:
+                if char not in _ESCAPES:
+                    raise JSONStreamError(f"invalid escape '\\{char}'")
+                self._escape = 2 if char == "u" else 0
+            elif char not in _HEX:
+                raise JSONStreamError("invalid unicode escape")
+            else:
+                self._escape = self._escape + 1 if self._escape < 5 else 0
+        elif char == "\\":
+            self._escape = 1
+        elif char == '"':
+            if self._string_is_key:
+                if len(self._stack) == 1:
+                    self._current_key = json.loads('"' + "".join(self._key) + '"')
+                self._state = _COLON
+            else:
+                self._value_done(len(self._buf))
+            return
+        elif ord(char) < 0x20:
+            raise JSONStreamError("unescaped control character in string")
+        if self._string_is_key and len(self._stack) == 1:
+            self._key.append(char)
+
+    def _close(self) -> None:
+        """Close the innermost container."""
+        self._stack.pop()
+        self._value_done(len(self._buf))
+
+    def _value_done(self, end: int) -> None:
+        """Record that a value ended just before buffer index *end*."""
+        if not self._stack:
+            self._complete = True
+            self._mark_safe(end)
+            return
+        self._state = _AFTER_VALUE
+        self._mark_safe(end)
+
+    def _mark_safe(self, end: int) -> None:
+        """Remember a point up to which the text is a valid prefix."""
+        self._safe_end = end
+        self._safe_stack = tuple(self._stack)
+
+
+@dataclass
+class StructuredProgress:
+    """Progress of a structured generation.
+
+    Attributes:
+        stage: Name of the generation step, e.g. "task_breakdown".
+        attempt: Attempt number, starting at 1.
+        chars: Characters of the JSON object received.
+        partial: The object received so far.
+        complete: Whether the object is complete and valid.
+    """
+
+    stage: str
+    attempt: int
+    chars: int
+    partial: dict[str, Any] = field(default_factory=dict)
+    complete: bool = False
+
+    def summary(self) -> dict[str, int]:
+        """Summarize the partial object: item counts of list and object fields.
+
+        Returns:
+            dict[str, int]: Item count per field; 1 for scalar fields.
+        """
+        return {
+            key: len(value) if isinstance(value, (list, dict)) else 1
+            for key, value in self.partial.items()
+        }
+
+
+ProgressCallback = Callable[[StructuredProgress], Awaitable[None] | None]
+
+
+def check_member_types(parser: IncrementalJSONParser, required: Mapping[str, type]) -> None:
+    """Check the type of each started top-level field.
+
+    Args:
+        parser: Parser fed with the output so far.
+        required: Expected type per required field.
+
+    Raises:
+        JSONStreamError: If a field has the wrong type.
+    """
+    for key, actual in parser.member_types.items():
+        expected = required.get(key)
+        if expected is None or actual is expected:
+            continue
+        if actual is float and expected in (int, float):
+            continue
+        raise JSONStreamError(
+            f'field "{key}" must be {_json_type_name(expected)}, got {_json_type_name(actual)}'
+        )
+
+
+def _json_type_name(value_type: type) -> str:
+    """Name a Python type by its JSON equivalent."""
+    return {
+        dict: "an object",
+        list: "an array",
+        str: "a string",
+        int: "a number",
+        float: "a number",
+        bool: "a boolean",
+        type(None): "null",
+    }.get(value_type, value_type.__name__)
+
+
+def _with_correction(prompt: PromptInput, reason: str) -> PromptInput:
+    """Append the reason a response was rejected to the prompt."""
+    note = (
+        f"Your previous response was rejected: {reason}. "
+        "Respond with a single JSON object in the requested format and nothing else."
+    )
+    if isinstance(prompt, str):
+        return f"{prompt}\n\n{note}"
+    return [*prompt, PromptSegment(text=note)]
+
+
+async def _report(
+    on_progress: ProgressCallback | None, progress: StructuredProgress
+) -> None:
+    """Deliver progress, never letting a callback failure stop generation."""
+    if on_progress is None:
+        return
+    try:
+        result = on_progress(progress)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.debug(f"Structured output progress callback failed: {e}")
+
+
+async def generate_structured(
+    client: Any,
+    prompt: PromptInput,
+    system: PromptInput | None = None,
+    required: Mapping[str, type] | None = None,
+    max_attempts: int = 3,
+    retry_delay_seconds: float = 1.0,
+    stage: str = "structured_output",
+    on_progress: ProgressCallback | None = None,
+    progress_interval_seconds: float = 1.0,
+    **kwargs: Any,
+) -> dict[str, Any] | None:
+    """Generate a JSON object, validating it while it streams.
+
+    With a progress callback the completion is streamed, and invalid
+    output is abandoned as soon as it is detected. Either way the model is
+    re-prompted immediately with the reason. Provider errors are retried
+    after ``retry_delay_seconds``.
+
+    Args:
+        client: A BaseLLMClient (streamed) or any client with generate().
+        prompt: The user prompt.
+        system: Optional system message.
+        required: Fields the object must contain, with their expected type,
+            e.g. ``{"tasks": list}``.
+        max_attempts: Attempts before giving up.
+        retry_delay_seconds: Delay before retrying a provider error.
+        stage: Name of the step, reported with progress.
+        on_progress: Optional callback receiving partial objects.
+        progress_interval_seconds: Minimum time between progress reports.
+        **kwargs: Additional parameters for the client (max_tokens, ...).
+
+    Returns:
+        dict | None: The validated object, or None if every attempt failed.
+    """
+    required = required or {}
+    attempt_prompt = prompt
+    for attempt in range(1, max_attempts + 1):
+        parser = IncrementalJSONParser()
+        try:
+            if on_progress is not None and isinstance(client, BaseLLMClient):
+                await _stream_into(
+                    client,
+                    parser,
+                    required,
+                    stage,
+                    attempt,
+                    on_progress,
+                    progress_interval_seconds,
+                    prompt=attempt_prompt,
+                    system=system,
+                    **kwargs,
+                )
+            else:
+                response = await client.generate(prompt=attempt_prompt, system=system, **kwargs)
+                parser.feed(response.content)
+                check_member_types(parser, required)
+
+            result = parser.result()
+            missing = [key for key in required if key not in result]
+            if missing:
+                raise JSONStreamError(f"missing fields: {', '.join(missing)}")
+
+            await _report(
+                on_progress,
+                StructuredProgress(
+                    stage=stage,
+                    attempt=attempt,
+                    chars=parser.chars,
+                    partial=result,
+                    complete=True,
+                ),
+            )
+            return result
+
+        except JSONStreamError as e:
+            logger.warning(
+                f"Invalid {stage} output on attempt {attempt} "
+                f"after {parser.chars} characters: {e}"
+            )
+            attempt_prompt = _with_correction(prompt, str(e))
+        except Exception as e:
+            logger.warning(f"{stage} attempt {attempt} failed: {e}")
+            if attempt < max_attempts:
+                await asyncio.sleep(retry_delay_seconds)
+
+    return None
+
+
+async def _stream_into(
+    client: BaseLLMClient,
+    parser: IncrementalJSONParser,
+    required: Mapping[str, type],
+    stage: str,
+    attempt: int,
+    on_progress: ProgressCallback | None,
+    progress_interval_seconds: float,
+    **call: Any,
+) -> None:
+    """Feed a streamed completion into the parser until done or invalid.
+
+    The stream is closed on exit, cancelling the provider call if the
+    output was rejected or the object completed early.
+
+    Args:
+        client: The streaming client.
+        parser: Parser for this attempt.
+        required: Expected type per required field.
+        stage: Name of the step, reported with progress.
+        attempt: Attempt number, reported with progress.
+        on_progress: Optional progress callback.
+        progress_interval_seconds: Minimum time between progress reports.
+        **call: Arguments for generate_stream().
+
+    Raises:
+        JSONStreamError: As soon as the output is invalid.
+    """
+    stream = client.generate_stream(**call)
+    reported_at = time.monotonic()
+    try:
+        async for chunk in stream:
+            if not chunk.content:
+                continue
+            parser.feed(chunk.content)
+            check_member_types(parser, required)
+            if parser.complete:
+                return
+
+            now = time.monotonic()
+            if on_progress is not None and now - reported_at >= progress_interval_seconds:
+                reported_at = now
+                progress = StructuredProgress(
+                    stage=stage,
+                    attempt=attempt,
+                    chars=parser.chars,
+                    partial=parser.partial() or {},
+                )
+                await _report(on_progress, progress)
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class RedisProgressPublisher:
+    """Progress callback that publishes structured output progress to Redis.
+
+    Each report is added to the ``{key_prefix}{session_id}`` stream with the
+    task id, stage, attempt, characters received and a per-field item
+    count. Session and task are read from :func:`llm_call_context`, which
+    the worker pool sets for each dispatched task; reports outside a
+    session are dropped.
+
+    Usage:
+        agent = PlannerAgent(..., on_progress=RedisProgressPublisher(redis_client))
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        key_prefix: str = "asdlc:agent_progress:",
+        ttl_seconds: int = 3600,
+        maxlen: int = 1000,
+    ) -> None:
+        """Initialize the publisher.
+
+        Args:
+            redis_client: Redis client.
+            key_prefix: Prefix of the per-session progress stream.
+            ttl_seconds: Expiry of the stream after the last report.
+            maxlen: Approximate maximum stream length.
+        """
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+        self._maxlen = maxlen
+
+    async def __call__(self, progress: StructuredProgress) -> None:
+        """Publish one progress report.
+
+        Args:
+            progress: The progress to publish.
+        """
+        context = get_llm_call_context()
+        session_id = context.get("session_id")
+        if not session_id:
+            return
+
+        key = f"{self._key_prefix}{session_id}"
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(
+                key,
+                {
+                    "task_id": context.get("task_id", ""),
+                    "stage": progress.stage,
+                    "attempt": str(progress.attempt),
+                    "chars": str(progress.chars),
+                    "complete": "1" if progress.complete else "0",
+                    "summary": json.dumps(progress.summary()),
+                },
+                maxlen=self._maxlen,
+                approximate=True,
+            )
+            pipe.expire(key, self._ttl_seconds)
+            await pipe.execute()
@@ -37,6 +37,14 @@ from src.infrastructure.metrics.definitions import (
     ACTIVE_TASKS,
     ACTIVE_WORKERS,
     EVENTS_PROCESSED,
+    LLM_BATCH_ITEMS,
+    LLM_COST,
+    LLM_ERRORS,
+    LLM_REQUEST_COUNT,
+    LLM_REQUEST_LATENCY,
+    LLM_ROUTING_EVENTS,
+    LLM_TIME_TO_FIRST_TOKEN,
+    LLM_TOKENS,
     PROCESS_CPU_PERCENT,
     PROCESS_MEMORY_BYTES,
     REDIS_CONNECTION_UP,
@@ -70,6 +78,14 @@ __all__ = [
     "ACTIVE_WORKERS",
     "REDIS_CONNECTION_UP",
     "REDIS_LATENCY",
+    "LLM_REQUEST_COUNT",
+    "LLM_REQUEST_LATENCY",
+    "LLM_TIME_TO_FIRST_TOKEN",
+    "LLM_TOKENS",
+    "LLM_COST",
+    "LLM_ERRORS",
+    "LLM_ROUTING_EVENTS",
+    "LLM_BATCH_ITEMS",
     "PROCESS_MEMORY_BYTES",
     "PROCESS_CPU_PERCENT",
     # Middleware
@@ -81,6 +81,60 @@ REDIS_LATENCY = Histogram(
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5],
 )
 
+# =============================================================================
+# LLM Call Metrics
+# =============================================================================
+
+LLM_REQUEST_COUNT = Counter(
+    "asdlc_llm_requests_total",
+    "Total number of LLM provider calls",
+    ["role", "provider", "model", "operation", "status"],
+)
+
+LLM_REQUEST_LATENCY = Histogram(
+    "asdlc_llm_request_duration_seconds",
+    "LLM call latency in seconds, until the full response is received",
+    ["role", "provider", "model", "operation"],
+    buckets=[0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0],
+)
+
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "asdlc_llm_time_to_first_token_seconds",
+    "Time from an LLM streaming call until the first content chunk, in seconds",
+    ["role", "provider", "model"],
+    buckets=[0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+)
+
+LLM_TOKENS = Counter(
+    "asdlc_llm_tokens_total",
+    "Total LLM tokens by type (input, output, cache_read, cache_creation)",
+    ["role", "provider", "model", "type"],
+)
+
+LLM_COST = Counter(
+    "asdlc_llm_cost_usd_total",
+    "Estimated LLM spend in US dollars",
+    ["role", "provider", "model"],
+)
+
+LLM_ERRORS = Counter(
+    "asdlc_llm_errors_total",
+    "Total LLM call errors by type",
+    ["role", "provider", "model", "error_type"],
+)
+
+LLM_ROUTING_EVENTS = Counter(
+    "asdlc_llm_routing_events_total",
+    "Hedged requests, failovers and backup wins of routed LLM calls",
+    ["role", "event"],
+)
+
+LLM_BATCH_ITEMS = Counter(
+    "asdlc_llm_batch_items_total",
+    "Total items of offline LLM batches by outcome",
+    ["provider", "model", "status"],
+)
+
 # =============================================================================
 # Process Resource Metrics
 # =============================================================================
@@ -110,6 +164,13 @@ __all__ = [
     "ACTIVE_WORKERS",
     "REDIS_CONNECTION_UP",
     "REDIS_LATENCY",
+    "LLM_REQUEST_COUNT",
+    "LLM_REQUEST_LATENCY",
+    "LLM_TIME_TO_FIRST_TOKEN",
+    "LLM_TOKENS",
+    "LLM_COST",
+    "LLM_ERRORS",
+    "LLM_ROUTING_EVENTS",
     "PROCESS_MEMORY_BYTES",
     "PROCESS_CPU_PERCENT",
 ]
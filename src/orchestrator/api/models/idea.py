@@ -105,11 +105,85 @@ class IdeaListResponse(BaseModel):
         total: Total number of matching ideas (for pagination).
         limit: Maximum number of ideas returned.
         offset: Number of ideas skipped.
+        total_relation: "eq" if total is exact, "gte" if it is a lower
+            bound because total counting was limited.
+        next_cursor: Cursor of the next page in cursor pagination, None on
+            the last page.
     """
 
     ideas: list[Idea]
     total: int
     limit: int
     offset: int
+    total_relation: str = "eq"
+    next_cursor: str | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class IdeaFacetCounts(BaseModel):
+    """Idea counts per filter value, for filter sidebars.
+
+    Attributes:
+        total: Number of matching ideas.
+        status: Count per status.
+        classification: Count per classification.
+        labels: Count per label, for the most used labels.
+    """
+
+    total: int
+    status: dict[str, int] = Field(default_factory=dict)
+    classification: dict[str, int] = Field(default_factory=dict)
+    labels: dict[str, int] = Field(default_factory=dict)
+
+    model_config = {"populate_by_name": True}
+
+
+# Most ideas accepted in one bulk create request body
+MAX_BULK_IDEAS = 5000
+
+
+class BulkCreateIdeasRequest(BaseModel):
+    """Request to create many ideas at once.
+
+    Attributes:
+        ideas: The ideas to create.
+    """
+
+    ideas: list[CreateIdeaRequest] = Field(..., min_length=1, max_length=MAX_BULK_IDEAS)
+
+    model_config = {"populate_by_name": True}
+
+
+class BulkIdeaResult(BaseModel):
+    """Outcome of one idea in a bulk create.
+
+    Attributes:
+        index: Position of the idea in the request.
+        success: Whether the idea was created.
+        id: ID of the created idea.
+        error: Why the idea was not created.
+    """
+
+    index: int
+    success: bool
+    id: str | None = None
+    error: str | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class BulkCreateIdeasResponse(BaseModel):
+    """Response for a bulk create.
+
+    Attributes:
+        results: Outcome of each idea, in request order.
+        created: Number of ideas created.
+        failed: Number of ideas not created.
+    """
+
+    results: list[BulkIdeaResult]
+    created: int
+    failed: int
 
     model_config = {"populate_by_name": True}
@@ -102,12 +102,33 @@ class AgentSettings(BaseModel):
         max_tokens: Maximum tokens in response.
         top_p: Nucleus sampling parameter.
         top_k: Top-k sampling parameter.
+        cache_responses: Reuse responses to repeated deterministic calls.
+        hedge_requests: Send a backup request when the first one is slower
+            than usual, and use whichever answers first.
     """
 
     temperature: float = Field(default=0.2, ge=0.0, le=1.0)
     max_tokens: int = Field(default=16384, ge=1024, le=32768)
     top_p: float | None = Field(default=None, ge=0.0, le=1.0)
     top_k: int | None = Field(default=None, ge=1, le=100)
+    cache_responses: bool = False
+    hedge_requests: bool = False
+
+    model_config = {"populate_by_name": True}
+
+
+class LLMTarget(BaseModel):
+    """A provider and model an agent can be routed to.
+
+    Attributes:
+        provider: The LLM provider to use.
+        model: The model ID to use.
+        api_key_id: Reference to the API key to use.
+    """
+
+    provider: LLMProvider
+    model: str
+    api_key_id: str
 
     model_config = {"populate_by_name": True}
 
@@ -121,6 +142,7 @@ class AgentLLMConfig(BaseModel):
         model: The model ID to use.
         api_key_id: Reference to the API key to use.
         settings: Generation settings for this agent.
+        fallbacks: Targets to fail over or hedge to, in order of preference.
         enabled: Whether this agent is enabled.
     """
 
@@ -129,6 +151,7 @@ class AgentLLMConfig(BaseModel):
     model: str
     api_key_id: str
     settings: AgentSettings = Field(default_factory=AgentSettings)
+    fallbacks: list[LLMTarget] = Field(default_factory=list)
     enabled: bool = True
 
     model_config = {"populate_by_name": True}
@@ -147,6 +170,7 @@ class AgentConfigUpdate(BaseModel):
         api_key_id: Reference to the API key to use.
         enabled: Whether this agent is enabled.
         settings: Generation settings for this agent.
+        fallbacks: Targets to fail over or hedge to, in order of preference.
     """
 
     provider: LLMProvider | None = None
@@ -154,6 +178,7 @@ class AgentConfigUpdate(BaseModel):
     api_key_id: str | None = None
     enabled: bool | None = None
     settings: AgentSettings | None = None
+    fallbacks: list[LLMTarget] | None = None
 
     model_config = {"populate_by_name": True}
 
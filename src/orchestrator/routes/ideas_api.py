@@ -2,7 +2,9 @@
 
 Provides CRUD endpoints for ideas:
 - POST /api/brainflare/ideas - Create idea
-- GET /api/brainflare/ideas - List ideas
+- POST /api/brainflare/ideas/bulk - Create many ideas (JSON or NDJSON stream)
+- GET /api/brainflare/ideas - List ideas (offset or cursor pagination)
+- GET /api/brainflare/ideas/facets - Count ideas per filter value
 - GET /api/brainflare/ideas/{idea_id} - Get idea
 - PUT /api/brainflare/ideas/{idea_id} - Update idea
 - DELETE /api/brainflare/ideas/{idea_id} - Delete idea
@@ -11,15 +13,23 @@ Provides CRUD endpoints for ideas:
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from src.orchestrator.api.models.idea import (
+    MAX_BULK_IDEAS,
+    BulkCreateIdeasRequest,
+    BulkCreateIdeasResponse,
+    BulkIdeaResult,
     CreateIdeaRequest,
     Idea,
     IdeaClassification,
+    IdeaFacetCounts,
     IdeaListResponse,
     IdeaStatus,
     UpdateIdeaRequest,
@@ -27,6 +37,9 @@ from src.orchestrator.api.models.idea import (
 
 logger = logging.getLogger(__name__)
 
+# Longest line accepted in an NDJSON bulk create body
+MAX_NDJSON_LINE_BYTES = 16 * 1024
+
 router = APIRouter(prefix="/api/brainflare/ideas", tags=["ideas"])
 
 
@@ -139,6 +152,163 @@ async def create_idea(request: CreateIdeaRequest) -> Idea:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/bulk", response_model=BulkCreateIdeasResponse)
+async def bulk_create_ideas(request: Request) -> BulkCreateIdeasResponse:
+    """Create many ideas at once, e.g. for an import.
+
+    The body is either a JSON BulkCreateIdeasRequest or, with content type
+    application/x-ndjson, a stream of CreateIdeaRequest objects, one per
+    line. Streamed ideas are written while the body is still arriving;
+    invalid lines are reported as failed items. A stream stops being read
+    after MAX_BULK_IDEAS lines, with a failed item for the first line
+    over the limit.
+
+    Args:
+        request: The HTTP request.
+
+    Returns:
+        BulkCreateIdeasResponse: Outcome of each idea, in request order.
+
+    Raises:
+        HTTPException: 500 if the ideas cannot be stored.
+    """
+    results: list[BulkIdeaResult] = []
+    positions: list[int] = []
+    if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+        ideas = _ndjson_ideas(request, results, positions)
+    else:
+        try:
+            body = BulkCreateIdeasRequest.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(e.errors()) from e
+        ideas = _json_ideas(body, positions)
+
+    service = _get_service()
+    try:
+        if service is None:
+            # Mock response
+            created = []
+            async for _ in ideas:
+                created.append(
+                    BulkIdeaResult(
+                        index=len(created), success=True, id=f"idea-{uuid4().hex[:12]}"
+                    )
+                )
+        else:
+            created = await service.create_ideas(ideas)
+    except Exception as e:
+        logger.error(f"Failed to bulk create ideas: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+    # Map service positions back to positions in the request
+    results.extend(
+        result.model_copy(update={"index": positions[result.index]}) for result in created
+    )
+    results.sort(key=lambda result: result.index)
+    succeeded = sum(result.success for result in results)
+    return BulkCreateIdeasResponse(
+        results=results,
+        created=succeeded,
+        failed=len(results) - succeeded,
+    )
+
+
+async def _json_ideas(
+    body: BulkCreateIdeasRequest,
+    positions: list[int],
+) -> AsyncIterator[CreateIdeaRequest]:
+    """Yield the ideas of a JSON bulk request.
+
+    Args:
+        body: The parsed request body.
+        positions: Receives the request position of each yielded idea.
+    """
+    for index, idea in enumerate(body.ideas):
+        positions.append(index)
+        yield idea
+
+
+async def _ndjson_ideas(
+    request: Request,
+    results: list[BulkIdeaResult],
+    positions: list[int],
+) -> AsyncIterator[CreateIdeaRequest]:
+    """Yield the ideas of an NDJSON request body as it streams in.
+
+    Args:
+        request: The HTTP request.
+        results: Receives a failed result for each invalid or overlong
+            line, and for the first line over MAX_BULK_IDEAS.
+        positions: Receives the request position of each yielded idea.
+    """
+    index = 0
+    async for line in _ndjson_lines(request.stream()):
+        if index >= MAX_BULK_IDEAS:
+            results.append(
+                BulkIdeaResult(
+                    index=index,
+                    success=False,
+                    error=f"Too many ideas: at most {MAX_BULK_IDEAS} per request",
+                )
+            )
+            return
+        if line is None:
+            results.append(
+                BulkIdeaResult(
+                    index=index,
+                    success=False,
+                    error=f"Line longer than {MAX_NDJSON_LINE_BYTES} bytes",
+                )
+            )
+            index += 1
+            continue
+        try:
+            idea = CreateIdeaRequest.model_validate_json(line)
+        except ValidationError as e:
+            first = e.errors()[0]
+            location = ".".join(str(part) for part in first["loc"])
+            error = f"{location}: {first['msg']}" if location else first["msg"]
+            results.append(BulkIdeaResult(index=index, success=False, error=error))
+        else:
+            positions.append(index)
+            yield idea
+        index += 1
+
+
+async def _ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int = MAX_NDJSON_LINE_BYTES,
+) -> AsyncIterator[bytes | None]:
+    """Split a byte stream into its non-empty lines.
+
+    A line longer than max_line_bytes is discarded as it arrives and
+    yielded as None, so it is never held in memory whole.
+    """
+    buffer = bytearray()
+    overlong = False
+    async for chunk in chunks:
+        # The buffered bytes hold no newline; only the new chunk is searched
+        scanned = len(buffer)
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", max(start, scanned))) != -1:
+            line = bytes(buffer[start:end])
+            start = end + 1
+            if overlong or len(line) > max_line_bytes:
+                overlong = False
+                yield None
+            elif line.strip():
+                yield line
+        del buffer[:start]
+        if len(buffer) > max_line_bytes:
+            overlong = True
+            buffer.clear()
+    if overlong or len(buffer) > max_line_bytes:
+        yield None
+    elif buffer.strip():
+        yield bytes(buffer)
+
+
 @router.get("", response_model=IdeaListResponse)
 async def list_ideas(
     status: IdeaStatus | None = Query(None, description="Filter by status"),
@@ -148,18 +318,33 @@ async def list_ideas(
     search: str | None = Query(None, description="Search in content"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None, description="Page cursor; empty for the first page of cursor pagination"
+    ),
+    total_limit: int | None = Query(
+        None, ge=0, description="Stop counting the total at this many ideas"
+    ),
 ) -> IdeaListResponse:
     """List ideas with optional filters.
 
+    Offset pagination is used unless a cursor or total_limit is given.
+    Cursor pagination starts with an empty cursor and follows next_cursor;
+    it stays fast on deep pages.
+
     Args:
         status: Filter by idea status (active/archived).
         classification: Filter by classification type.
         search: Full-text search in content.
         limit: Maximum number of ideas to return (1-100).
         offset: Number of ideas to skip for pagination.
+        cursor: Cursor of the page to return in cursor pagination.
+        total_limit: Count the total only up to this many ideas.
 
     Returns:
         IdeaListResponse: List of matching ideas with pagination info.
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid or expired.
     """
     service = _get_service()
     if service is None:
@@ -176,6 +361,30 @@ async def list_ideas(
             offset=offset,
         )
 
+    if cursor is not None or total_limit is not None:
+        try:
+            page = await service.list_ideas_page(
+                status=status,
+                classification=classification,
+                search=search,
+                limit=limit,
+                cursor=cursor,
+                track_total_hits=True if total_limit is None else total_limit,
+            )
+            return IdeaListResponse(
+                ideas=page.ideas,
+                total=page.total,
+                limit=limit,
+                offset=0,
+                total_relation=page.total_relation,
+                next_cursor=page.next_cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"Failed to list ideas: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
     try:
         ideas, total = await service.list_ideas(
             status=status,
@@ -190,6 +399,51 @@ async def list_ideas(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/facets", response_model=IdeaFacetCounts)
+async def get_idea_facets(
+    status: IdeaStatus | None = Query(None, description="Filter by status"),
+    classification: IdeaClassification | None = Query(
+        None, description="Filter by classification"
+    ),
+    search: str | None = Query(None, description="Search in content"),
+) -> IdeaFacetCounts:
+    """Count ideas per status, classification and label.
+
+    Args:
+        status: Filter by idea status (active/archived).
+        classification: Filter by classification type.
+        search: Full-text search in content.
+
+    Returns:
+        IdeaFacetCounts: Counts of the matching ideas per filter value.
+    """
+    service = _get_service()
+    if service is None:
+        # Mock response
+        filtered = MOCK_IDEAS.copy()
+        if status:
+            filtered = [i for i in filtered if i.status == status]
+        if classification:
+            filtered = [i for i in filtered if i.classification == classification]
+        facets = IdeaFacetCounts(total=len(filtered))
+        for idea in filtered:
+            facets.status[idea.status.value] = facets.status.get(idea.status.value, 0) + 1
+            facets.classification[idea.classification.value] = (
+                facets.classification.get(idea.classification.value, 0) + 1
+            )
+            for label in idea.labels:
+                facets.labels[label] = facets.labels.get(label, 0) + 1
+        return facets
+
+    try:
+        return await service.get_facet_counts(
+            status=status, classification=classification, search=search
+        )
+    except Exception as e:
+        logger.error(f"Failed to count idea facets: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/{idea_id}", response_model=Idea)
 async def get_idea(
     idea_id: str = Path(..., description="Idea ID"),
@@ -23,6 +23,7 @@ from src.infrastructure.llm.factory import (
     LLMClientFactory,
     get_llm_client_factory,
 )
+from src.infrastructure.llm.rate_limiter import LLMPriority
 
 
 logger = logging.getLogger(__name__)
@@ -100,7 +101,10 @@ async def stream_generator(
     client = await factory.get_client(role)
 
     total_tokens = 0
-    async for chunk in client.generate_stream(prompt=prompt, system=system_prompt):
+    # A user is watching the tokens arrive, so this call jumps the queue
+    async for chunk in client.generate_stream(
+        prompt=prompt, system=system_prompt, priority=LLMPriority.HITL
+    ):
         if chunk.is_final:
             # Extract total tokens from usage
             if chunk.usage:
@@ -5,20 +5,25 @@ Provides REST API endpoints for triggering and monitoring parallel code reviews.
 Endpoints:
 - POST /api/swarm/review - Trigger a parallel review swarm
 - GET /api/swarm/review/{swarm_id} - Get swarm status and results
+- GET /api/swarm/review/{swarm_id}/events - Stream swarm progress using SSE
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from src.workers.swarm.config import SwarmConfig
 from src.workers.swarm.config import get_swarm_config as _get_swarm_config
-from src.workers.swarm.models import UnifiedReport
+from src.workers.swarm.incremental import is_valid_base_ref
+from src.workers.swarm.models import SwarmStatus, UnifiedReport
 from src.workers.swarm.reviewers import ReviewerRegistry, default_registry
 
 if TYPE_CHECKING:
@@ -49,6 +54,8 @@ class SwarmReviewRequest(BaseModel):
             ['security', 'performance', 'style'] if not provided.
         timeout_seconds: Optional timeout in seconds. Must be between 30 and 600.
             Defaults to 300 if not provided.
+        base_ref: Optional git ref. When given, only the changes since this
+            ref are reviewed. Local targets only.
     """
 
     target_path: str = Field(
@@ -66,6 +73,11 @@ class SwarmReviewRequest(BaseModel):
         le=600,
         description="Timeout in seconds. Defaults to 300.",
     )
+    base_ref: str | None = Field(
+        None,
+        min_length=1,
+        description="Git ref to review changes against. Reviews everything if omitted.",
+    )
 
 
 class SwarmReviewResponse(BaseModel):
@@ -124,6 +136,81 @@ class SwarmStatusResponse(BaseModel):
     error_message: str | None = Field(None, description="Error message if failed")
 
 
+# =============================================================================
+# Event Streaming
+# =============================================================================
+
+# Session statuses after which no further events are published
+_TERMINAL_STATUSES = {SwarmStatus.COMPLETE.value, SwarmStatus.FAILED.value}
+
+# Numeric fields of reviewer_complete events (stream fields are strings)
+_NUMERIC_EVENT_FIELDS = {"findings": int, "files_reviewed": int, "duration_seconds": float}
+
+
+def format_swarm_event(
+    event: str,
+    data: dict[str, Any],
+    event_id: str | None = None,
+) -> str:
+    """Format a swarm progress event as an SSE message.
+
+    Args:
+        event: SSE event name (e.g. 'status', 'reviewer_complete').
+        data: Event payload, sent as JSON.
+        event_id: Stream ID of the event, used by clients to resume.
+
+    Returns:
+        str: Formatted SSE message.
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def swarm_event_generator(
+    swarm_id: str,
+    status: str,
+    redis_store: SwarmRedisStore,
+    last_event_id: str,
+    timeout_seconds: float,
+) -> AsyncIterator[str]:
+    """Generate SSE messages for a swarm session's progress.
+
+    Emits the current session status first, then replays and follows the
+    session event stream until the swarm completes or fails.
+
+    Args:
+        swarm_id: The swarm session ID.
+        status: Session status when the stream was opened.
+        redis_store: Store holding the session event stream.
+        last_event_id: Stream ID to resume after ("0-0" replays all events).
+        timeout_seconds: Maximum time to follow the stream.
+
+    Yields:
+        str: SSE formatted messages.
+    """
+    yield format_swarm_event("status", {"status": status})
+    if status in _TERMINAL_STATUSES:
+        return
+
+    try:
+        async for event_id, fields in redis_store.iter_events(
+            swarm_id, last_event_id, timeout_seconds
+        ):
+            data: dict[str, Any] = dict(fields)
+            event = data.pop("event", "message")
+            for name, cast in _NUMERIC_EVENT_FIELDS.items():
+                if name in data:
+                    data[name] = cast(data[name])
+            yield format_swarm_event(event, data, event_id)
+    except Exception as exc:
+        logger.warning(f"Event stream for {swarm_id} interrupted: {exc}")
+        yield format_swarm_event("error", {"message": "Event stream interrupted"})
+
+
 # =============================================================================
 # Dependency Injection
 # =============================================================================
@@ -202,7 +289,9 @@ async def _ensure_swarm_components() -> (
             # Wire up real LLM executor for code reviews
             llm_config_service = LLMConfigService(redis_client=redis_client)
             llm_factory = LLMClientFactory(config_service=llm_config_service)
-            review_executor = ReviewExecutor(factory=llm_factory)
+            review_executor = ReviewExecutor.from_config(
+                llm_factory, config, redis_client
+            )
 
             _cached_dispatcher = _Dispatcher(
                 session_manager=_cached_session_manager,
@@ -291,6 +380,34 @@ def validate_target_path(path: str, config: SwarmConfig) -> str:
     return path
 
 
+def validate_base_ref(base_ref: str | None, target_path: str) -> str | None:
+    """Validate the git ref for an incremental review.
+
+    Args:
+        base_ref: Git ref to review changes against, or None.
+        target_path: The validated target path.
+
+    Returns:
+        The validated ref, or None for a full review.
+
+    Raises:
+        HTTPException: 400 if the ref is malformed or the target is a URL.
+    """
+    if base_ref is None:
+        return None
+
+    if not is_valid_base_ref(base_ref):
+        raise HTTPException(status_code=400, detail=f"Invalid base_ref: {base_ref}")
+
+    if target_path.startswith("http://") or target_path.startswith("https://"):
+        raise HTTPException(
+            status_code=400,
+            detail="base_ref is only supported for local targets",
+        )
+
+    return base_ref
+
+
 def validate_reviewer_types(
     types: list[str] | None, registry: ReviewerRegistry
 ) -> list[str] | None:
@@ -449,6 +566,7 @@ async def trigger_swarm_review(
     # Validate inputs
     validated_path = validate_target_path(request.target_path, config)
     validated_types = validate_reviewer_types(request.reviewer_types, registry)
+    validated_ref = validate_base_ref(request.base_ref, validated_path)
 
     # Check if dispatcher is available
     if dispatcher is None:
@@ -462,6 +580,7 @@ async def trigger_swarm_review(
         target_path=validated_path,
         reviewer_types=validated_types,
         timeout_seconds=request.timeout_seconds,
+        base_ref=validated_ref,
     )
 
     # Register for rate limiting
@@ -564,3 +683,58 @@ async def get_swarm_status(
         duration_seconds=duration_seconds,
         error_message=None,  # TODO: Store error message in session
     )
+
+
+@router.get("/review/{swarm_id}/events")
+async def stream_swarm_events(
+    swarm_id: str,
+    last_event_id: str | None = Header(None),
+    config: SwarmConfig = Depends(get_swarm_config),  # noqa: B008
+    session_manager: SwarmSessionManager | None = Depends(get_swarm_session_manager),  # noqa: B008
+    redis_store: SwarmRedisStore | None = Depends(get_swarm_redis_store),  # noqa: B008
+) -> StreamingResponse:
+    """Stream per-reviewer progress of a swarm review using SSE.
+
+    The first event carries the current session status. It is followed by a
+    ``reviewer_complete`` event for each finished reviewer and ``status``
+    events for session status changes. The stream ends once the swarm is
+    complete or failed; fetch the final report from the status endpoint.
+    Reconnecting clients resume after the ``Last-Event-ID`` header.
+
+    Args:
+        swarm_id: The swarm session ID.
+        last_event_id: Stream ID of the last event the client received.
+        config: Swarm configuration.
+        session_manager: Session manager instance.
+        redis_store: Redis store instance.
+
+    Returns:
+        StreamingResponse: SSE stream of progress events.
+
+    Raises:
+        HTTPException: 404 if swarm not found.
+        HTTPException: 503 if session manager or store unavailable.
+    """
+    if session_manager is None or redis_store is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Swarm store not available",
+        )
+
+    session = await session_manager.get_session(swarm_id)
+    if session is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Swarm not found: {swarm_id}",
+        )
+
+    return StreamingResponse(
+        swarm_event_generator(
+            swarm_id=session.id,
+            status=SwarmStatus(session.status).value,
+            redis_store=redis_store,
+            last_event_id=last_event_id or "0-0",
+            timeout_seconds=config.task_timeout_seconds + config.aggregate_timeout_seconds,
+        ),
+        media_type="text/event-stream",
+    )
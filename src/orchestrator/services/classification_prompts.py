@@ -15,16 +15,8 @@ from src.orchestrator.api.models.classification import LabelTaxonomy
 PROMPT_VERSION = "1.0.0"
 
 
-# Main classification prompt template
-CLASSIFICATION_PROMPT = """You are an expert product analyst tasked with classifying product ideas.
-
-Analyze the following idea and classify it based on the criteria below.
-
-## IDEA TO CLASSIFY
-
-{idea_content}
-
-## CLASSIFICATION GUIDELINES
+# Classification guidelines shared by the single and multi-idea prompts
+CLASSIFICATION_GUIDELINES = """## CLASSIFICATION GUIDELINES
 
 1. **Functional Requirements** (classification: "functional")
    - Describe WHAT the system should do
@@ -43,7 +35,19 @@ Analyze the following idea and classify it based on the criteria below.
    - Contains both functional and non-functional aspects equally
    - Lacks sufficient detail for accurate classification
 
-## LABEL TAXONOMY
+"""
+
+
+# Main classification prompt template
+CLASSIFICATION_PROMPT = """You are an expert product analyst tasked with classifying product ideas.
+
+Analyze the following idea and classify it based on the criteria below.
+
+## IDEA TO CLASSIFY
+
+{idea_content}
+
+""" + CLASSIFICATION_GUIDELINES + """## LABEL TAXONOMY
 
 {taxonomy_text}
 
@@ -94,6 +98,39 @@ Response:
 Now classify the idea provided above."""
 
 
+# Prompt classifying several short ideas at once, one result per idea
+MULTI_CLASSIFICATION_PROMPT = """You are an expert product analyst tasked with classifying product ideas.
+
+Analyze each of the following ideas independently and classify it based on the criteria below.
+
+## IDEAS TO CLASSIFY
+
+{ideas_text}
+
+""" + CLASSIFICATION_GUIDELINES + """## LABEL TAXONOMY
+
+{taxonomy_text}
+
+## RESPONSE FORMAT
+
+Respond with ONLY a JSON object with one entry per idea, using the idea's id:
+
+{{
+    "classifications": [
+        {{
+            "id": "1",
+            "classification": "functional" | "non_functional" | "undetermined",
+            "confidence": 0.0-1.0,
+            "reasoning": "Brief explanation of why this classification was chosen",
+            "labels": ["label1", "label2"],
+            "label_scores": {{"label1": 0.9, "label2": 0.7}}
+        }}
+    ]
+}}
+
+Now classify each idea provided above."""
+
+
 # Few-shot examples for functional classification
 FUNCTIONAL_EXAMPLES = [
     {
@@ -196,6 +233,30 @@ def build_classification_prompt(
     )
 
 
+def build_multi_classification_prompt(
+    idea_contents: list[str],
+    taxonomy_text: str,
+) -> str:
+    """Build a prompt classifying several ideas at once.
+
+    Ideas are numbered from 1; the response refers to them by number.
+
+    Args:
+        idea_contents: The contents of the ideas to classify.
+        taxonomy_text: Formatted taxonomy text for the prompt.
+
+    Returns:
+        str: Complete prompt ready for LLM submission.
+    """
+    ideas_text = "\n\n".join(
+        f"### Idea {i}\n{content}" for i, content in enumerate(idea_contents, start=1)
+    )
+    return MULTI_CLASSIFICATION_PROMPT.format(
+        ideas_text=ideas_text,
+        taxonomy_text=taxonomy_text,
+    )
+
+
 def get_prompt_version() -> str:
     """Get the current prompt version.
 
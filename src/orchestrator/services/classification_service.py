@@ -6,26 +6,35 @@ as functional or non-functional requirements and assigning labels.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 import re
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 import redis.asyncio as redis
 
+from src.infrastructure.llm.batch import BatchItemResult, BatchRequest
+from src.infrastructure.llm.structured_output import generate_structured
 from src.orchestrator.api.models.classification import (
     ClassificationResult,
     ClassificationType,
     LabelDefinition,
     LabelTaxonomy,
 )
-from src.orchestrator.api.models.idea import IdeaClassification
+from src.orchestrator.api.models.idea import Idea, IdeaClassification
 from src.orchestrator.api.models.llm_config import AgentRole
 from src.orchestrator.services.classification_prompts import (
     build_classification_prompt,
+    build_multi_classification_prompt,
     get_prompt_version,
 )
+from src.orchestrator.services.label_taxonomy_service import (
+    CompiledTaxonomy,
+    KeywordMatcher,
+)
 
 if TYPE_CHECKING:
     from src.infrastructure.llm.factory import LLMClientFactory
@@ -48,6 +57,42 @@ CLASSIFICATION_MAX_TOKENS = 500
 # Max retries for LLM calls
 MAX_LLM_RETRIES = 3
 
+# Ideas classified together in one prompt by classify_ideas()
+MICRO_BATCH_SIZE = 8
+
+# Longest idea (in characters) classified together with others
+MICRO_BATCH_MAX_CHARS = 500
+
+# Keywords matched one-sidedly for rule-based pre-classification to skip
+# the LLM
+RULE_SHORT_CIRCUIT_MIN_MATCHES = 3
+
+# Keywords indicating each classification in rule-based classification
+NON_FUNCTIONAL_KEYWORDS = KeywordMatcher([
+    "performance",
+    "speed",
+    "fast",
+    "slow",
+    "security",
+    "encrypt",
+    "scale",
+    "concurrent",
+    "reliability",
+    "uptime",
+    "latency",
+])
+FUNCTIONAL_KEYWORDS = KeywordMatcher([
+    "add",
+    "create",
+    "build",
+    "implement",
+    "feature",
+    "allow",
+    "enable",
+    "user can",
+    "ability to",
+])
+
 
 class ClassificationService:
     """Service for classifying ideas using LLM and rule-based fallback.
@@ -72,6 +117,7 @@ class ClassificationService:
         taxonomy_service: LabelTaxonomyService | None = None,
         ideas_service: IdeasService | None = None,
         llm_factory: LLMClientFactory | None = None,
+        rule_short_circuit: bool | None = None,
     ) -> None:
         """Initialize the classification service.
 
@@ -80,11 +126,20 @@ class ClassificationService:
             taxonomy_service: Optional taxonomy service for label management.
             ideas_service: Optional ideas service for retrieving ideas.
             llm_factory: Optional LLM factory for creating LLM clients.
+            rule_short_circuit: If True, ideas the keyword rules classify
+                unambiguously skip the LLM. Defaults to the
+                CLASSIFICATION_RULE_SHORT_CIRCUIT environment variable.
         """
         self._redis_client = redis_client
         self._taxonomy_service = taxonomy_service
         self._ideas_service = ideas_service
         self._llm_factory = llm_factory
+        if rule_short_circuit is None:
+            rule_short_circuit = (
+                os.environ.get("CLASSIFICATION_RULE_SHORT_CIRCUIT", "false").lower()
+                == "true"
+            )
+        self._rule_short_circuit = rule_short_circuit
 
     async def _get_redis(self) -> redis.Redis:
         """Get or create the Redis client.
@@ -175,19 +230,23 @@ class ClassificationService:
                 return existing
 
         # Get taxonomy
-        taxonomy_service = self._get_taxonomy_service()
-        taxonomy = await taxonomy_service.get_taxonomy()
-        taxonomy_text = await taxonomy_service.to_prompt_format()
+        compiled = await self._get_taxonomy_service().get_compiled_taxonomy()
+
+        # Obvious cases need no LLM call
+        result = self._pre_classify(idea_id, idea.content, compiled)
+        if result is not None:
+            await self._save_result(idea, result)
+            return result
 
         # Build prompt
-        prompt = self.build_classification_prompt(idea.content, taxonomy_text)
+        prompt = self.build_classification_prompt(idea.content, compiled.prompt_text)
 
         # Try LLM classification
         try:
             result = await self._classify_with_llm(
                 idea_id=idea_id,
                 prompt=prompt,
-                taxonomy=taxonomy,
+                taxonomy=compiled.taxonomy,
             )
         except Exception as e:
             logger.warning(
@@ -196,9 +255,212 @@ class ClassificationService:
             result = self._classify_with_rules(
                 idea_id=idea_id,
                 content=idea.content,
-                taxonomy=taxonomy,
+                compiled=compiled,
+            )
+
+        await self._save_result(idea, result)
+        return result
+
+    async def classify_ideas(
+        self,
+        idea_ids: list[str],
+        force: bool = False,
+        group_size: int = MICRO_BATCH_SIZE,
+    ) -> dict[str, ClassificationResult]:
+        """Classify several ideas, sharing LLM calls between short ones.
+
+        Ideas of up to MICRO_BATCH_MAX_CHARS characters are classified
+        ``group_size`` at a time in one prompt with a result per idea.
+        Longer ideas, and ideas missing from a group's response, are
+        classified one by one as in classify_idea().
+
+        Args:
+            idea_ids: The IDs of the ideas to classify.
+            force: If True, reclassify even if already classified.
+            group_size: Most ideas classified in one prompt.
+
+        Returns:
+            dict[str, ClassificationResult]: Result per idea ID. Ideas that
+                are not found are left out.
+        """
+        ideas_service = self._get_ideas_service()
+        ideas = await asyncio.gather(
+            *(ideas_service.get_idea(idea_id) for idea_id in dict.fromkeys(idea_ids))
+        )
+
+        results: dict[str, ClassificationResult] = {}
+        pending: list[Idea] = []
+        for idea in ideas:
+            if idea is None:
+                continue
+            if (
+                not force
+                and idea.classification != IdeaClassification.UNDETERMINED
+            ):
+                existing = await self.get_classification_result(idea.id)
+                if existing is not None:
+                    results[idea.id] = existing
+                    continue
+            pending.append(idea)
+
+        if not pending:
+            return results
+
+        compiled = await self._get_taxonomy_service().get_compiled_taxonomy()
+
+        # Obvious cases need no LLM call
+        for idea in list(pending):
+            result = self._pre_classify(idea.id, idea.content, compiled)
+            if result is not None:
+                await self._save_result(idea, result)
+                results[idea.id] = result
+                pending.remove(idea)
+
+        short = [idea for idea in pending if len(idea.content) <= MICRO_BATCH_MAX_CHARS]
+        grouped: dict[str, ClassificationResult] = {}
+        for start in range(0, len(short), max(1, group_size)):
+            group = short[start : start + group_size]
+            if len(group) < 2:
+                continue
+            try:
+                grouped.update(
+                    await self._classify_group_with_llm(group, compiled)
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Grouped classification of {len(group)} ideas failed, "
+                    f"classifying them one by one: {e}"
+                )
+
+        for idea in pending:
+            result = grouped.get(idea.id)
+            if result is None:
+                prompt = self.build_classification_prompt(idea.content, compiled.prompt_text)
+                try:
+                    result = await self._classify_with_llm(
+                        idea_id=idea.id,
+                        prompt=prompt,
+                        taxonomy=compiled.taxonomy,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"LLM classification failed for {idea.id}, "
+                        f"using rule-based fallback: {e}"
+                    )
+                    result = self._classify_with_rules(
+                        idea_id=idea.id,
+                        content=idea.content,
+                        compiled=compiled,
+                    )
+            await self._save_result(idea, result)
+            results[idea.id] = result
+
+        return results
+
+    async def prepare_batch_request(
+        self,
+        idea_id: str,
+        force: bool = False,
+        metadata: dict[str, Any] | None = None,
+    ) -> BatchRequest | ClassificationResult:
+        """Prepare an idea for classification in an offline LLM batch.
+
+        Args:
+            idea_id: The ID of the idea to classify.
+            force: If True, reclassify even if already classified.
+            metadata: Additional metadata returned with the batch result.
+
+        Returns:
+            BatchRequest | ClassificationResult: The batch item, or the
+                stored result if the idea is already classified or needs
+                no LLM call.
+
+        Raises:
+            ValueError: If the idea is not found.
+        """
+        ideas_service = self._get_ideas_service()
+        idea = await ideas_service.get_idea(idea_id)
+
+        if idea is None:
+            raise ValueError(f"Idea not found: {idea_id}")
+
+        if (
+            not force
+            and idea.classification != IdeaClassification.UNDETERMINED
+        ):
+            existing = await self.get_classification_result(idea_id)
+            if existing is not None:
+                return existing
+
+        compiled = await self._get_taxonomy_service().get_compiled_taxonomy()
+
+        # Obvious cases need no LLM call
+        result = self._pre_classify(idea_id, idea.content, compiled)
+        if result is not None:
+            await self._save_result(idea, result)
+            return result
+
+        return BatchRequest(
+            custom_id=idea_id,
+            prompt=self.build_classification_prompt(idea.content, compiled.prompt_text),
+            temperature=CLASSIFICATION_TEMPERATURE,
+            max_tokens=CLASSIFICATION_MAX_TOKENS,
+            metadata={**(metadata or {}), "idea_id": idea_id},
+        )
+
+    async def complete_batch_result(self, item: BatchItemResult) -> ClassificationResult:
+        """Store the classification from an offline LLM batch result.
+
+        Failed items fall back to rule-based classification, as failed
+        LLM calls do in classify_idea().
+
+        Args:
+            item: The batch result of an item from prepare_batch_request().
+
+        Returns:
+            ClassificationResult: The stored classification result.
+
+        Raises:
+            ValueError: If the idea is not found.
+        """
+        idea_id = item.metadata.get("idea_id", item.custom_id)
+        ideas_service = self._get_ideas_service()
+        idea = await ideas_service.get_idea(idea_id)
+
+        if idea is None:
+            raise ValueError(f"Idea not found: {idea_id}")
+
+        compiled = await self._get_taxonomy_service().get_compiled_taxonomy()
+
+        try:
+            if item.response is None:
+                raise ValueError(item.error or "no response")
+            result = self._result_from_response(
+                idea_id=idea_id,
+                content=item.response.content,
+                model=item.response.model,
+                taxonomy=compiled.taxonomy,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batch classification failed for {idea_id}, using rule-based fallback: {e}"
+            )
+            result = self._classify_with_rules(
+                idea_id=idea_id,
+                content=idea.content,
+                compiled=compiled,
             )
 
+        await self._save_result(idea, result)
+        return result
+
+    async def _save_result(self, idea: Idea, result: ClassificationResult) -> None:
+        """Store a classification result and apply it to the idea.
+
+        Args:
+            idea: The classified idea.
+            result: The classification result.
+        """
         # Store the result
         await self.store_classification_result(result)
 
@@ -209,9 +471,7 @@ class ClassificationService:
             classification=IdeaClassification(result.classification.value),
             labels=list(set(idea.labels + result.labels)),
         )
-        await ideas_service.update_idea(idea_id, update_request)
-
-        return result
+        await self._get_ideas_service().update_idea(idea.id, update_request)
 
     async def _classify_with_llm(
         self,
@@ -238,9 +498,56 @@ class ClassificationService:
             max_tokens=CLASSIFICATION_MAX_TOKENS,
         )
 
-        # Parse the response
-        parsed = self.parse_classification_response(response.content)
+        return self._result_from_response(
+            idea_id=idea_id,
+            content=response.content,
+            model=client.model,
+            taxonomy=taxonomy,
+        )
+
+    def _result_from_response(
+        self,
+        idea_id: str,
+        content: str,
+        model: str,
+        taxonomy: LabelTaxonomy,
+    ) -> ClassificationResult:
+        """Build a classification result from an LLM response.
+
+        Args:
+            idea_id: The ID of the idea.
+            content: The LLM response content.
+            model: The model that produced the response.
+            taxonomy: The label taxonomy for validation.
 
+        Returns:
+            ClassificationResult: The classification result.
+        """
+        return self._result_from_parsed(
+            idea_id=idea_id,
+            parsed=self.parse_classification_response(content),
+            model_version=f"{model}:{get_prompt_version()}",
+            taxonomy=taxonomy,
+        )
+
+    def _result_from_parsed(
+        self,
+        idea_id: str,
+        parsed: dict[str, Any],
+        model_version: str,
+        taxonomy: LabelTaxonomy,
+    ) -> ClassificationResult:
+        """Build a classification result from parsed classification data.
+
+        Args:
+            idea_id: The ID of the idea.
+            parsed: Data as returned by parse_classification_response().
+            model_version: Model and prompt version of the result.
+            taxonomy: The label taxonomy for validation.
+
+        Returns:
+            ClassificationResult: The classification result.
+        """
         # Validate labels
         valid_labels = self.validate_labels(parsed.get("labels", []), taxonomy)
 
@@ -253,14 +560,63 @@ class ClassificationService:
             confidence=parsed["confidence"],
             labels=valid_labels,
             reasoning=parsed.get("reasoning", ""),
-            model_version=f"{client.model}:{get_prompt_version()}",
+            model_version=model_version,
+        )
+
+    async def _classify_group_with_llm(
+        self,
+        ideas: list[Idea],
+        compiled: CompiledTaxonomy,
+    ) -> dict[str, ClassificationResult]:
+        """Classify several ideas in one LLM call.
+
+        Args:
+            ideas: The ideas to classify.
+            compiled: The compiled label taxonomy.
+
+        Returns:
+            dict[str, ClassificationResult]: Result per idea ID, for the
+                ideas the response covered.
+        """
+        llm_factory = self._get_llm_factory()
+        client = await llm_factory.get_client(AgentRole.DISCOVERY)
+
+        data = await generate_structured(
+            client,
+            prompt=build_multi_classification_prompt(
+                [idea.content for idea in ideas], compiled.prompt_text
+            ),
+            required={"classifications": list},
+            max_attempts=MAX_LLM_RETRIES,
+            stage="classification",
+            temperature=CLASSIFICATION_TEMPERATURE,
+            max_tokens=CLASSIFICATION_MAX_TOKENS * len(ideas),
         )
+        if data is None:
+            raise ValueError("No valid response for grouped classification")
+
+        by_number = {str(i): idea for i, idea in enumerate(ideas, start=1)}
+        model_version = f"{client.model}:{get_prompt_version()}:grouped"
+        results: dict[str, ClassificationResult] = {}
+        for entry in data["classifications"]:
+            if not isinstance(entry, dict):
+                continue
+            idea = by_number.get(str(entry.get("id")))
+            if idea is None or idea.id in results:
+                continue
+            results[idea.id] = self._result_from_parsed(
+                idea_id=idea.id,
+                parsed=self._normalize_classification(entry),
+                model_version=model_version,
+                taxonomy=compiled.taxonomy,
+            )
+        return results
 
     def _classify_with_rules(
         self,
         idea_id: str,
         content: str,
-        taxonomy: LabelTaxonomy,
+        compiled: CompiledTaxonomy,
     ) -> ClassificationResult:
         """Classify an idea using rule-based keyword matching.
 
@@ -269,55 +625,79 @@ class ClassificationService:
         Args:
             idea_id: The ID of the idea.
             content: The idea content.
-            taxonomy: The label taxonomy.
+            compiled: The compiled label taxonomy.
 
         Returns:
             ClassificationResult: The classification result.
         """
-        content_lower = content.lower()
+        return self._rule_result(
+            idea_id,
+            content,
+            compiled,
+            reasoning="Classification based on keyword matching (LLM fallback).",
+        )[0]
 
-        # Match labels based on keywords
-        matched_labels: list[str] = []
-        label_scores: dict[str, float] = {}
+    def _pre_classify(
+        self,
+        idea_id: str,
+        content: str,
+        compiled: CompiledTaxonomy,
+    ) -> ClassificationResult | None:
+        """Classify an obvious case by keyword rules, without the LLM.
 
-        for label in taxonomy.labels:
-            if label.keywords:
-                matches = sum(
-                    1 for keyword in label.keywords if keyword.lower() in content_lower
-                )
-                if matches > 0:
-                    score = min(0.3 + (matches * 0.1), 0.7)  # Cap at 0.7 for rule-based
-                    matched_labels.append(label.id)
-                    label_scores[label.id] = score
+        An idea is obvious when it matches at least one label and
+        RULE_SHORT_CIRCUIT_MIN_MATCHES keywords of one classification
+        and none of the other.
+
+        Args:
+            idea_id: The ID of the idea.
+            content: The idea content.
+            compiled: The compiled label taxonomy.
+
+        Returns:
+            ClassificationResult | None: The rule-based result, or None if
+                pre-classification is disabled or the case is not obvious.
+        """
+        if not self._rule_short_circuit:
+            return None
+        result, f_matches, nf_matches = self._rule_result(
+            idea_id,
+            content,
+            compiled,
+            reasoning="Classification based on keyword matching (unambiguous keywords).",
+        )
+        if not result.labels or min(f_matches, nf_matches) > 0:
+            return None
+        if max(f_matches, nf_matches) < RULE_SHORT_CIRCUIT_MIN_MATCHES:
+            return None
+        logger.info(f"Classified {idea_id} by keyword rules without an LLM call")
+        return result
+
+    def _rule_result(
+        self,
+        idea_id: str,
+        content: str,
+        compiled: CompiledTaxonomy,
+        reasoning: str,
+    ) -> tuple[ClassificationResult, int, int]:
+        """Apply the keyword rules to an idea.
+
+        Args:
+            idea_id: The ID of the idea.
+            content: The idea content.
+            compiled: The compiled label taxonomy.
+            reasoning: Reasoning recorded on the result.
+
+        Returns:
+            tuple: The result, and the functional and non-functional
+                keyword match counts.
+        """
+        # Match labels based on keywords
+        matched_labels = list(compiled.match_labels(content))
 
         # Determine classification based on keywords
-        non_functional_keywords = [
-            "performance",
-            "speed",
-            "fast",
-            "slow",
-            "security",
-            "encrypt",
-            "scale",
-            "concurrent",
-            "reliability",
-            "uptime",
-            "latency",
-        ]
-        functional_keywords = [
-            "add",
-            "create",
-            "build",
-            "implement",
-            "feature",
-            "allow",
-            "enable",
-            "user can",
-            "ability to",
-        ]
-
-        nf_matches = sum(1 for kw in non_functional_keywords if kw in content_lower)
-        f_matches = sum(1 for kw in functional_keywords if kw in content_lower)
+        nf_matches = len(NON_FUNCTIONAL_KEYWORDS.find(content))
+        f_matches = len(FUNCTIONAL_KEYWORDS.find(content))
 
         if nf_matches > f_matches:
             classification = ClassificationType.NON_FUNCTIONAL
@@ -329,14 +709,15 @@ class ClassificationService:
             classification = ClassificationType.UNDETERMINED
             confidence = 0.3
 
-        return ClassificationResult(
+        result = ClassificationResult(
             idea_id=idea_id,
             classification=classification,
             confidence=confidence,
             labels=matched_labels,
-            reasoning="Classification based on keyword matching (LLM fallback).",
+            reasoning=reasoning,
             model_version=f"rule-based:{get_prompt_version()}",
         )
+        return result, f_matches, nf_matches
 
     def build_classification_prompt(
         self,
@@ -388,8 +769,19 @@ class ClassificationService:
                 "label_scores": {},
             }
 
+        return self._normalize_classification(data)
+
+    def _normalize_classification(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Normalize the classification data of one idea.
+
+        Args:
+            data: Classification data from an LLM response.
+
+        Returns:
+            dict: Classification data with defaults for missing fields.
+        """
         # Normalize classification value
-        classification = data.get("classification", "undetermined").lower()
+        classification = str(data.get("classification", "undetermined")).lower()
         if classification not in ["functional", "non_functional", "undetermined"]:
             classification = "undetermined"
 
@@ -0,0 +1,310 @@
+"""Correlation Service for automatic idea correlation (Brainflare Hub).
+
+Proposes "similar" correlations between ideas without comparing every
+pair. Each idea is embedded with the shared EmbeddingService and its
+vector stored in the ideas index; the nearest neighbours of an idea then
+come from an Elasticsearch kNN (HNSW) query, so correlating n ideas costs
+about O(n log n) instead of O(n^2).
+
+Neighbours at or above a cosine similarity threshold become "similar"
+edges in the graph store, written in one pipelined round trip per batch.
+Correlating a pair again only refreshes the score of its engine edge;
+edges created by users, and edges that were removed, are left alone.
+New ideas are correlated incrementally by the CorrelationWorker, and
+recompute_all() re-embeds and re-correlates every active idea.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from src.orchestrator.api.models.correlation import CorrelationType
+from src.orchestrator.api.models.idea import IdeaStatus
+
+if TYPE_CHECKING:
+    from src.infrastructure.graph_store.protocol import GraphStore
+    from src.infrastructure.knowledge_store.embedding_service import EmbeddingService
+    from src.orchestrator.api.models.idea import Idea
+    from src.orchestrator.services.ideas_service import IdeasService
+
+logger = logging.getLogger(__name__)
+
+# Creator recorded on engine edges, as for other auto-generated correlations
+CORRELATION_CREATOR = "system"
+
+# Namespace of the stable ids of engine edges
+CORRELATION_ID_NAMESPACE = uuid.UUID("5b0e6c1e-8f0a-4d8e-9a51-6c0f3d1b2a47")
+
+
+@dataclass(frozen=True)
+class CorrelationConfig:
+    """Correlation engine configuration.
+
+    Attributes:
+        enabled: Correlate new ideas in the background.
+        top_k: Nearest neighbours considered per idea.
+        min_similarity: Lowest cosine similarity that makes an edge.
+        batch_size: Queued ideas correlated together.
+        recompute_interval_seconds: Time between full recomputes; 0
+            disables them.
+    """
+
+    enabled: bool = False
+    top_k: int = 5
+    min_similarity: float = 0.75
+    batch_size: int = 32
+    recompute_interval_seconds: float = 86400.0
+
+    @classmethod
+    def from_env(cls) -> CorrelationConfig:
+        """Create correlation configuration from environment variables.
+
+        Environment variables:
+            CORRELATION_ENGINE_ENABLED: Correlate new ideas (default: false)
+            CORRELATION_TOP_K: Neighbours per idea (default: 5)
+            CORRELATION_MIN_SIMILARITY: Edge threshold (default: 0.75)
+            CORRELATION_BATCH_SIZE: Ideas correlated together (default: 32)
+            CORRELATION_RECOMPUTE_INTERVAL_SECONDS: Full recompute interval
+                (default: 86400, 0 disables)
+        """
+        return cls(
+            enabled=os.getenv("CORRELATION_ENGINE_ENABLED", "false").lower() == "true",
+            top_k=int(os.getenv("CORRELATION_TOP_K", "5")),
+            min_similarity=float(os.getenv("CORRELATION_MIN_SIMILARITY", "0.75")),
+            batch_size=int(os.getenv("CORRELATION_BATCH_SIZE", "32")),
+            recompute_interval_seconds=float(
+                os.getenv("CORRELATION_RECOMPUTE_INTERVAL_SECONDS", "86400")
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class CorrelationCandidate:
+    """A pair of ideas similar enough to correlate.
+
+    Attributes:
+        source_idea_id: ID of one idea; the lower of the two IDs.
+        target_idea_id: ID of the other idea.
+        similarity: Cosine similarity of their embeddings.
+    """
+
+    source_idea_id: str
+    target_idea_id: str
+    similarity: float
+
+
+class CorrelationService:
+    """Service proposing correlations between similar ideas.
+
+    Usage:
+        service = CorrelationService()
+
+        # Correlate new ideas
+        candidates = await service.correlate_ideas(["idea-1", "idea-2"])
+
+        # Re-correlate every active idea
+        count = await service.recompute_all()
+    """
+
+    def __init__(
+        self,
+        ideas_service: IdeasService | None = None,
+        graph_store: GraphStore | None = None,
+        embedding_service: EmbeddingService | None = None,
+        config: CorrelationConfig | None = None,
+    ) -> None:
+        """Initialize the correlation service.
+
+        Args:
+            ideas_service: Service storing ideas and their embeddings.
+                Defaults to the global instance.
+            graph_store: Store receiving the edges. Defaults to the global
+                Redis graph store.
+            embedding_service: Service embedding idea content. Created
+                lazily if not provided.
+            config: Engine configuration. Defaults to environment values.
+        """
+        self._ideas_service = ideas_service
+        self._graph_store = graph_store
+        self._embedding_service = embedding_service
+        self._config = config or CorrelationConfig.from_env()
+
+    @property
+    def config(self) -> CorrelationConfig:
+        """Get the engine configuration.
+
+        Returns:
+            CorrelationConfig: The configuration in use.
+        """
+        return self._config
+
+    def _get_ideas_service(self) -> IdeasService:
+        """Get the ideas service, using the global instance if needed."""
+        if self._ideas_service is None:
+            from src.orchestrator.services.ideas_service import get_ideas_service
+
+            self._ideas_service = get_ideas_service()
+        return self._ideas_service
+
+    def _get_graph_store(self) -> GraphStore:
+        """Get the graph store, using the global instance if needed."""
+        if self._graph_store is None:
+            from src.infrastructure.graph_store import get_graph_store
+
+            self._graph_store = get_graph_store()
+        return self._graph_store
+
+    def _get_embedding_service(self) -> EmbeddingService:
+        """Get the embedding service, creating it lazily if needed."""
+        if self._embedding_service is None:
+            from src.infrastructure.knowledge_store.embedding_service import (
+                EmbeddingService,
+            )
+
+            self._embedding_service = EmbeddingService()
+        return self._embedding_service
+
+    async def correlate_ideas(self, idea_ids: list[str]) -> list[CorrelationCandidate]:
+        """Embed ideas and correlate them with their nearest neighbours.
+
+        Args:
+            idea_ids: IDs of the ideas to correlate. Unknown IDs are skipped.
+
+        Returns:
+            list[CorrelationCandidate]: The correlations written.
+        """
+        ideas_service = self._get_ideas_service()
+        ideas = await asyncio.gather(*(ideas_service.get_idea(i) for i in idea_ids))
+        return await self._correlate([idea for idea in ideas if idea is not None])
+
+    async def recompute_all(self, batch_size: int | None = None) -> int:
+        """Re-embed and re-correlate every active idea.
+
+        Ideas are read a page at a time with cursor pagination. Engine
+        edge scores are refreshed and missing edges added; existing edges
+        are not removed, and removed edges are not added back.
+
+        Args:
+            batch_size: Ideas per page. Defaults to the configured batch size.
+
+        Returns:
+            int: Number of ideas correlated.
+        """
+        ideas_service = self._get_ideas_service()
+        cursor: str | None = ""
+        count = 0
+        while cursor is not None:
+            page = await ideas_service.list_ideas_page(
+                status=IdeaStatus.ACTIVE,
+                limit=batch_size or self._config.batch_size,
+                cursor=cursor,
+                track_total_hits=False,
+            )
+            if page.ideas:
+                await self._correlate(page.ideas)
+                count += len(page.ideas)
+            cursor = page.next_cursor
+
+        logger.info(f"Recomputed correlations for {count} ideas")
+        return count
+
+    async def _correlate(self, ideas: list[Idea]) -> list[CorrelationCandidate]:
+        """Embed ideas, find their neighbours and write the edges.
+
+        Args:
+            ideas: The ideas to correlate.
+
+        Returns:
+            list[CorrelationCandidate]: The correlations written.
+        """
+        if not ideas:
+            return []
+        ideas_service = self._get_ideas_service()
+
+        # Embedding is CPU-bound; keep it off the event loop
+        vectors = await asyncio.to_thread(
+            self._get_embedding_service().embed_batch, [idea.content for idea in ideas]
+        )
+        embeddings = {idea.id: vector for idea, vector in zip(ideas, vectors, strict=True)}
+        await ideas_service.store_embeddings(embeddings)
+
+        neighbours = await ideas_service.find_similar(embeddings, k=self._config.top_k)
+        candidates = self._score_candidates(neighbours)
+
+        now = datetime.now(UTC).isoformat()
+        await self._get_graph_store().add_edges(
+            [
+                (
+                    c.source_idea_id,
+                    c.target_idea_id,
+                    CorrelationType.SIMILAR.value,
+                    {
+                        "id": _correlation_id(c.source_idea_id, c.target_idea_id),
+                        "score": round(c.similarity, 4),
+                        "created_by": CORRELATION_CREATOR,
+                        "created_at": now,
+                    },
+                )
+                for c in candidates
+            ],
+            creator=CORRELATION_CREATOR,
+            refresh=("score",),
+        )
+        logger.info(f"Correlated {len(ideas)} ideas: {len(candidates)} similar pairs")
+        return candidates
+
+    def _score_candidates(
+        self,
+        neighbours: dict[str, list[tuple[str, float]]],
+    ) -> list[CorrelationCandidate]:
+        """Turn kNN neighbours into correlation candidates.
+
+        Pairs below the similarity threshold are dropped. A pair found from
+        both of its ideas is kept once, with its highest similarity.
+
+        Args:
+            neighbours: (neighbour ID, similarity) pairs per idea ID.
+
+        Returns:
+            list[CorrelationCandidate]: One candidate per pair of ideas.
+        """
+        pairs: dict[tuple[str, str], float] = {}
+        for idea_id, hits in neighbours.items():
+            for neighbour_id, similarity in hits:
+                if similarity < self._config.min_similarity or neighbour_id == idea_id:
+                    continue
+                pair = (min(idea_id, neighbour_id), max(idea_id, neighbour_id))
+                pairs[pair] = max(similarity, pairs.get(pair, similarity))
+
+        return [
+            CorrelationCandidate(source_idea_id=a, target_idea_id=b, similarity=similarity)
+            for (a, b), similarity in pairs.items()
+        ]
+
+
+def _correlation_id(source_idea_id: str, target_idea_id: str) -> str:
+    """Stable correlation id of an engine edge, kept across recomputes."""
+    name = f"{source_idea_id}:{target_idea_id}:{CorrelationType.SIMILAR.value}"
+    return f"corr-{uuid.uuid5(CORRELATION_ID_NAMESPACE, name).hex[:12]}"
+
+
+# Global service instance
+_correlation_service: CorrelationService | None = None
+
+
+def get_correlation_service() -> CorrelationService:
+    """Get global correlation service instance.
+
+    Returns:
+        CorrelationService: The singleton service instance.
+    """
+    global _correlation_service
+    if _correlation_service is None:
+        _correlation_service = CorrelationService()
+    return _correlation_service
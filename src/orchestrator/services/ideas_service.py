@@ -1,33 +1,119 @@
 """Ideas Service for Brainflare Hub.
 
 Handles CRUD operations for ideas with Elasticsearch storage.
+
+Bulk imports go through create_ideas(), which writes ideas with the
+Elasticsearch _bulk API in bounded batches and queues each batch for
+classification in one Redis round trip.
+
+Deep lists page with list_ideas_page(), which follows search_after cursors
+instead of from/size offsets; pages after the first read a point-in-time.
+Facet counts come from one aggregation query cached briefly in process.
+Every write bumps an ideas revision in Redis, so writes from any process,
+such as the classification worker, drop the cached counts.
+
+Idea embeddings for the correlation engine are kept in an HNSW-indexed
+dense_vector field, so nearest neighbours come from kNN queries. Reads
+leave the vectors out of the returned documents.
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
+import contextlib
+import json
 import logging
 import os
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from elasticsearch import AsyncElasticsearch
+from elasticsearch import AsyncElasticsearch, NotFoundError
 
 from src.orchestrator.api.models.idea import (
+    BulkIdeaResult,
     CreateIdeaRequest,
     Idea,
     IdeaClassification,
+    IdeaFacetCounts,
     IdeaStatus,
     UpdateIdeaRequest,
 )
 
 if TYPE_CHECKING:
     from src.workers.classification_worker import ClassificationWorker
+    from src.workers.correlation_worker import CorrelationWorker
 
 logger = logging.getLogger(__name__)
 
 IDEAS_INDEX = "brainflare_ideas"
 
+# Ideas written per Elasticsearch _bulk request in create_ideas()
+BULK_BATCH_SIZE = 500
+
+# How long the point-in-time behind a list cursor stays open between pages
+PIT_KEEP_ALIVE = "2m"
+
+# Sort of cursor pages; the id makes it total
+CURSOR_SORT = [{"created_at": {"order": "desc"}}, {"id": {"order": "asc"}}]
+
+# Sort of cursor pages read from a point-in-time, with its cheap tiebreaker
+PIT_CURSOR_SORT = [*CURSOR_SORT, {"_shard_doc": {"order": "asc"}}]
+
+# Largest _shard_doc value; continuing a first page after it skips only
+# the last idea of that page, as ids are unique
+MAX_SHARD_DOC = 2**63 - 1
+
+# Seconds facet counts are cached
+FACET_CACHE_TTL_SECONDS = 30.0
+
+# Most filter combinations whose facet counts are cached
+FACET_CACHE_MAX_ENTRIES = 256
+
+# Redis key of the ideas revision, incremented on every write
+REDIS_IDEAS_REVISION_KEY = "ideas:revision"
+
+# Most labels counted in facet counts
+FACET_LABELS_SIZE = 50
+
+# Idea embedding field; dims match the EmbeddingService default model
+EMBEDDING_FIELD = "embedding"
+EMBEDDING_DIMENSIONS = 384
+EMBEDDING_MAPPING = {
+    "type": "dense_vector",
+    "dims": EMBEDDING_DIMENSIONS,
+    "index": True,
+    "similarity": "cosine",
+}
+
+# kNN candidates considered per shard for each neighbour returned
+KNN_CANDIDATES_PER_RESULT = 10
+MIN_KNN_CANDIDATES = 100
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class IdeaPage:
+    """A page of ideas from list_ideas_page().
+
+    Attributes:
+        ideas: The ideas of the page.
+        total: Number of matching ideas.
+        total_relation: "eq" if total is exact, "gte" if it is a lower bound.
+        next_cursor: Cursor of the next page, None on the last page.
+    """
+
+    ideas: list[Idea]
+    total: int
+    total_relation: str
+    next_cursor: str | None
+
 
 class IdeasService:
     """Service for managing ideas in Elasticsearch.
@@ -39,12 +125,17 @@ class IdeasService:
         service = IdeasService()
         idea = await service.create_idea(CreateIdeaRequest(content="My idea"))
         ideas, total = await service.list_ideas(status=IdeaStatus.ACTIVE)
+
+        page = await service.list_ideas_page(cursor="")
+        page = await service.list_ideas_page(cursor=page.next_cursor)
     """
 
     def __init__(
         self,
         es_client: AsyncElasticsearch | None = None,
         auto_classify: bool = True,
+        facet_cache_ttl: float = FACET_CACHE_TTL_SECONDS,
+        auto_correlate: bool | None = None,
     ) -> None:
         """Initialize the ideas service.
 
@@ -53,10 +144,23 @@ class IdeasService:
                        will be created lazily using ELASTICSEARCH_URL env var.
             auto_classify: If True, automatically queue ideas for classification
                           on creation. Defaults to True.
+            facet_cache_ttl: Seconds facet counts are cached.
+            auto_correlate: If True, queue new ideas for the correlation
+                engine. Defaults to the CORRELATION_ENGINE_ENABLED env var.
         """
         self._es = es_client
         self._auto_classify = auto_classify
+        if auto_correlate is None:
+            auto_correlate = os.environ.get("CORRELATION_ENGINE_ENABLED", "false").lower() == "true"
+        self._auto_correlate = auto_correlate
+        self._redis = None
         self._classification_worker: ClassificationWorker | None = None
+        self._correlation_worker: CorrelationWorker | None = None
+        self._embedding_mapping_ready = False
+        self._facet_cache_ttl = facet_cache_ttl
+        self._facet_cache: OrderedDict[
+            tuple[Any, ...], tuple[float, int | None, IdeaFacetCounts]
+        ] = OrderedDict()
 
     def _get_es(self) -> AsyncElasticsearch:
         """Get the Elasticsearch client, creating it lazily if needed.
@@ -77,24 +181,15 @@ class IdeasService:
         """
         if self._classification_worker is None and self._auto_classify:
             try:
-                import redis.asyncio as redis
-
                 from src.orchestrator.services.classification_service import (
                     get_classification_service,
                 )
                 from src.workers.classification_worker import ClassificationWorker
 
-                redis_url = os.environ.get("REDIS_URL")
-                if not redis_url:
-                    redis_host = os.environ.get("REDIS_HOST", "localhost")
-                    redis_port = os.environ.get("REDIS_PORT", "6379")
-                    redis_url = f"redis://{redis_host}:{redis_port}"
-
-                redis_client = redis.from_url(redis_url)
                 classification_service = get_classification_service()
 
                 self._classification_worker = ClassificationWorker(
-                    redis_client=redis_client,
+                    redis_client=self._get_redis(),
                     classification_service=classification_service,
                 )
             except Exception as e:
@@ -103,6 +198,47 @@ class IdeasService:
 
         return self._classification_worker
 
+    def _get_correlation_worker(self) -> CorrelationWorker | None:
+        """Get the correlation worker, creating it lazily if needed.
+
+        Returns:
+            CorrelationWorker | None: The worker instance, or None if unavailable.
+        """
+        if self._correlation_worker is None and self._auto_correlate:
+            try:
+                from src.orchestrator.services.correlation_service import (
+                    get_correlation_service,
+                )
+                from src.workers.correlation_worker import CorrelationWorker
+
+                self._correlation_worker = CorrelationWorker(
+                    redis_client=self._get_redis(),
+                    correlation_service=get_correlation_service(),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to initialize correlation worker: {e}")
+                self._correlation_worker = None
+
+        return self._correlation_worker
+
+    def _get_redis(self):
+        """Get the Redis client of the workers, creating it lazily if needed.
+
+        Returns:
+            redis.asyncio.Redis: The Redis client.
+        """
+        if self._redis is None:
+            import redis.asyncio as redis
+
+            redis_url = os.environ.get("REDIS_URL")
+            if not redis_url:
+                redis_host = os.environ.get("REDIS_HOST", "localhost")
+                redis_port = os.environ.get("REDIS_PORT", "6379")
+                redis_url = f"redis://{redis_host}:{redis_port}"
+
+            self._redis = redis.from_url(redis_url)
+        return self._redis
+
     async def ensure_index(self) -> None:
         """Ensure the ideas index exists with proper mappings.
 
@@ -126,6 +262,7 @@ class IdeasService:
                             "created_at": {"type": "date"},
                             "updated_at": {"type": "date"},
                             "word_count": {"type": "integer"},
+                            EMBEDDING_FIELD: EMBEDDING_MAPPING,
                         }
                     }
                 },
@@ -160,6 +297,34 @@ class IdeasService:
         es = self._get_es()
         await self.ensure_index()
 
+        idea = self._new_idea(request)
+
+        await es.index(
+            index=IDEAS_INDEX,
+            id=idea.id,
+            document=idea.model_dump(mode="json"),
+        )
+        await es.indices.refresh(index=IDEAS_INDEX)
+        await self._invalidate_facets()
+
+        # Queue for async classification and correlation (non-blocking)
+        await self._enqueue_classification(idea.id)
+        await self._enqueue_correlation([idea.id])
+
+        return idea
+
+    def _new_idea(self, request: CreateIdeaRequest) -> Idea:
+        """Build a new idea from a creation request.
+
+        Args:
+            request: The idea creation request.
+
+        Returns:
+            Idea: The idea, not yet stored.
+
+        Raises:
+            ValueError: If the content exceeds 144 words.
+        """
         # Validate word count
         word_count = self._count_words(request.content)
         if word_count > 144:
@@ -173,7 +338,7 @@ class IdeasService:
         if self._auto_classify and initial_classification == IdeaClassification.UNDETERMINED:
             initial_classification = IdeaClassification.UNDETERMINED
 
-        idea = Idea(
+        return Idea(
             id=idea_id,
             content=request.content,
             author_id=request.author_id,
@@ -186,17 +351,95 @@ class IdeasService:
             word_count=word_count,
         )
 
-        await es.index(
-            index=IDEAS_INDEX,
-            id=idea_id,
-            document=idea.model_dump(mode="json"),
+    async def create_ideas(
+        self,
+        requests: Iterable[CreateIdeaRequest] | AsyncIterable[CreateIdeaRequest],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> list[BulkIdeaResult]:
+        """Create many ideas, e.g. for an import.
+
+        Requests are consumed as they arrive and written ``batch_size`` at
+        a time with one _bulk request each, without a refresh per batch.
+        The ideas of each batch are queued for classification as one
+        batch job. The index is refreshed once at the end.
+
+        Args:
+            requests: The idea creation requests, possibly streamed.
+            batch_size: Ideas per _bulk request.
+
+        Returns:
+            list[BulkIdeaResult]: Outcome of each request, in order.
+        """
+        es = self._get_es()
+        await self.ensure_index()
+
+        results: list[BulkIdeaResult] = []
+        batch: list[tuple[int, CreateIdeaRequest]] = []
+        async for index, request in _aenumerate(requests):
+            batch.append((index, request))
+            if len(batch) >= batch_size:
+                results.extend(await self._create_idea_batch(batch))
+                batch = []
+        if batch:
+            results.extend(await self._create_idea_batch(batch))
+
+        if any(result.success for result in results):
+            await es.indices.refresh(index=IDEAS_INDEX)
+            await self._invalidate_facets()
+
+        logger.info(
+            f"Bulk created {sum(r.success for r in results)} of {len(results)} ideas"
         )
-        await es.indices.refresh(index=IDEAS_INDEX)
+        return results
 
-        # Queue for async classification (non-blocking)
-        await self._enqueue_classification(idea_id)
+    async def _create_idea_batch(
+        self,
+        batch: list[tuple[int, CreateIdeaRequest]],
+    ) -> list[BulkIdeaResult]:
+        """Write one batch of new ideas with a single _bulk request.
 
-        return idea
+        Args:
+            batch: Creation requests with their position in the import.
+
+        Returns:
+            list[BulkIdeaResult]: Outcome of each request, in order.
+        """
+        results: dict[int, BulkIdeaResult] = {}
+        ideas: list[tuple[int, Idea]] = []
+        for index, request in batch:
+            try:
+                ideas.append((index, self._new_idea(request)))
+            except ValueError as e:
+                results[index] = BulkIdeaResult(index=index, success=False, error=str(e))
+
+        if ideas:
+            operations: list[dict] = []
+            for _, idea in ideas:
+                operations.append({"index": {"_index": IDEAS_INDEX, "_id": idea.id}})
+                operations.append(idea.model_dump(mode="json"))
+
+            try:
+                response = await self._get_es().bulk(operations=operations, refresh=False)
+                items = response["items"]
+            except Exception as e:
+                logger.error(f"Bulk indexing of {len(ideas)} ideas failed: {e}")
+                items = [{"index": {"error": str(e)}}] * len(ideas)
+
+            created: list[str] = []
+            for (index, idea), item in zip(ideas, items, strict=True):
+                error = item["index"].get("error")
+                if error:
+                    reason = error.get("reason", str(error)) if isinstance(error, dict) else error
+                    results[index] = BulkIdeaResult(index=index, success=False, error=reason)
+                else:
+                    results[index] = BulkIdeaResult(index=index, success=True, id=idea.id)
+                    created.append(idea.id)
+
+            # Queue for async classification (non-blocking)
+            await self._enqueue_classification_batch(created)
+            await self._enqueue_correlation(created)
+
+        return [results[index] for index, _ in batch]
 
     async def _enqueue_classification(self, idea_id: str) -> None:
         """Enqueue an idea for async classification.
@@ -222,6 +465,55 @@ class IdeasService:
             # Non-blocking - log and continue
             logger.warning(f"Failed to queue classification for {idea_id}: {e}")
 
+    async def _enqueue_classification_batch(self, idea_ids: list[str]) -> None:
+        """Enqueue ideas for async classification as one batch job.
+
+        Like _enqueue_classification(), failures are logged, not raised.
+
+        Args:
+            idea_ids: The IDs of the ideas to classify.
+        """
+        if not self._auto_classify or not idea_ids:
+            return
+
+        worker = self._get_classification_worker()
+        if worker is None:
+            logger.debug(
+                f"Skipping auto-classification for {len(idea_ids)} ideas: worker unavailable"
+            )
+            return
+
+        try:
+            job_id = await worker.enqueue_batch(idea_ids)
+            logger.info(f"Queued classification job {job_id} for {len(idea_ids)} ideas")
+        except Exception as e:
+            # Non-blocking - log and continue
+            logger.warning(f"Failed to queue classification for {len(idea_ids)} ideas: {e}")
+
+    async def _enqueue_correlation(self, idea_ids: list[str]) -> None:
+        """Enqueue new ideas for the correlation engine.
+
+        Like _enqueue_classification(), failures are logged, not raised.
+
+        Args:
+            idea_ids: The IDs of the ideas to correlate.
+        """
+        if not self._auto_correlate or not idea_ids:
+            return
+
+        worker = self._get_correlation_worker()
+        if worker is None:
+            logger.debug(
+                f"Skipping auto-correlation for {len(idea_ids)} ideas: worker unavailable"
+            )
+            return
+
+        try:
+            await worker.enqueue(idea_ids)
+        except Exception as e:
+            # Non-blocking - log and continue
+            logger.warning(f"Failed to queue correlation for {len(idea_ids)} ideas: {e}")
+
     async def get_idea(self, idea_id: str) -> Idea | None:
         """Get an idea by ID.
 
@@ -233,7 +525,9 @@ class IdeasService:
         """
         es = self._get_es()
         try:
-            result = await es.get(index=IDEAS_INDEX, id=idea_id)
+            result = await es.get(
+                index=IDEAS_INDEX, id=idea_id, source_excludes=[EMBEDDING_FIELD]
+            )
             return Idea(**result["_source"])
         except Exception:
             return None
@@ -279,6 +573,7 @@ class IdeasService:
             doc=update_data,
         )
         await es.indices.refresh(index=IDEAS_INDEX)
+        await self._invalidate_facets()
 
         return await self.get_idea(idea_id)
 
@@ -294,9 +589,10 @@ class IdeasService:
         es = self._get_es()
         try:
             await es.delete(index=IDEAS_INDEX, id=idea_id)
-            return True
         except Exception:
             return False
+        await self._invalidate_facets()
+        return True
 
     async def list_ideas(
         self,
@@ -321,23 +617,14 @@ class IdeasService:
         es = self._get_es()
         await self.ensure_index()
 
-        query: dict = {"bool": {"must": []}}
-
-        if status:
-            query["bool"]["must"].append({"term": {"status": status.value}})
-        if classification:
-            query["bool"]["must"].append({"term": {"classification": classification.value}})
-        if search:
-            query["bool"]["must"].append({"match": {"content": search}})
-
-        if not query["bool"]["must"]:
-            query = {"match_all": {}}
+        query = self._build_query(status, classification, search)
 
         result = await es.search(
             index=IDEAS_INDEX,
             body={
                 "query": query,
                 "sort": [{"created_at": {"order": "desc"}}],
+                "_source": {"excludes": [EMBEDDING_FIELD]},
                 "from": offset,
                 "size": limit,
             },
@@ -348,6 +635,371 @@ class IdeasService:
 
         return ideas, total
 
+    async def list_ideas_page(
+        self,
+        status: IdeaStatus | None = None,
+        classification: IdeaClassification | None = None,
+        search: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        track_total_hits: bool | int = True,
+    ) -> IdeaPage:
+        """List ideas with cursor pagination.
+
+        Pages are read with search_after, so every page costs the same
+        however deep it is. The first page is a plain search; a
+        point-in-time is only opened when the second page is requested,
+        keeping the later pages consistent with each other, and is closed
+        after the last page.
+
+        Args:
+            status: Filter by idea status.
+            classification: Filter by classification type.
+            search: Full-text search in content.
+            limit: Maximum number of ideas to return.
+            cursor: None or empty for the first page, otherwise the
+                next_cursor of the previous page. The filters must not
+                change between pages.
+            track_total_hits: True to count all matches, or the count at
+                which to stop counting.
+
+        Returns:
+            IdeaPage: The ideas and the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is invalid, expired, or was made for
+                other filters.
+        """
+        es = self._get_es()
+        await self.ensure_index()
+
+        filters = [
+            status.value if status else None,
+            classification.value if classification else None,
+            search,
+        ]
+        body: dict[str, Any] = {
+            "query": self._build_query(status, classification, search),
+            "sort": CURSOR_SORT,
+            "_source": {"excludes": [EMBEDDING_FIELD]},
+            "size": limit,
+            "track_total_hits": track_total_hits,
+        }
+        pit_id: str | None = None
+        if cursor:
+            state = _decode_cursor(cursor)
+            if state.get("filters") != filters:
+                raise ValueError("Cursor does not match the list filters")
+            pit_id = state["pit"]
+            body["search_after"] = state["after"]
+            if pit_id is None:
+                # Second page: continue the first one from a new point-in-time
+                response = await es.open_point_in_time(
+                    index=IDEAS_INDEX, keep_alive=PIT_KEEP_ALIVE
+                )
+                pit_id = response["id"]
+                body["search_after"] = [*state["after"], MAX_SHARD_DOC]
+            body["pit"] = {"id": pit_id, "keep_alive": PIT_KEEP_ALIVE}
+            body["sort"] = PIT_CURSOR_SORT
+
+        try:
+            if pit_id is None:
+                result = await es.search(index=IDEAS_INDEX, body=body)
+            else:
+                result = await es.search(body=body)
+        except NotFoundError as e:
+            raise ValueError("Cursor has expired") from e
+        # The point-in-time id may change between pages
+        pit_id = result.get("pit_id", pit_id)
+
+        hits = result["hits"]["hits"]
+        next_cursor = None
+        if hits and len(hits) == limit:
+            next_cursor = _encode_cursor(
+                {"filters": filters, "after": hits[-1]["sort"], "pit": pit_id}
+            )
+        elif pit_id is not None:
+            with contextlib.suppress(Exception):
+                await es.close_point_in_time(id=pit_id)
+
+        total = result["hits"].get("total", {"value": len(hits), "relation": "gte"})
+        return IdeaPage(
+            ideas=[Idea(**hit["_source"]) for hit in hits],
+            total=total["value"],
+            total_relation=total["relation"],
+            next_cursor=next_cursor,
+        )
+
+    async def get_facet_counts(
+        self,
+        status: IdeaStatus | None = None,
+        classification: IdeaClassification | None = None,
+        search: str | None = None,
+    ) -> IdeaFacetCounts:
+        """Count ideas per status, classification and label.
+
+        The counts come from one aggregation query and are cached for
+        ``facet_cache_ttl`` seconds, or until the ideas revision in Redis
+        changes. The least recently used counts are evicted beyond
+        FACET_CACHE_MAX_ENTRIES filter combinations.
+
+        Args:
+            status: Filter by idea status.
+            classification: Filter by classification type.
+            search: Full-text search in content.
+
+        Returns:
+            IdeaFacetCounts: Counts per filter value.
+        """
+        key = (status, classification, search)
+        # Read the revision first, so a write made meanwhile is seen
+        revision = await self._get_revision()
+        cached = self._facet_cache.get(key)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < self._facet_cache_ttl
+            and cached[1] == revision
+        ):
+            self._facet_cache.move_to_end(key)
+            return cached[2]
+
+        es = self._get_es()
+        await self.ensure_index()
+
+        result = await es.search(
+            index=IDEAS_INDEX,
+            body={
+                "query": self._build_query(status, classification, search),
+                "size": 0,
+                "track_total_hits": True,
+                "aggs": {
+                    "status": {"terms": {"field": "status"}},
+                    "classification": {"terms": {"field": "classification"}},
+                    "labels": {"terms": {"field": "labels", "size": FACET_LABELS_SIZE}},
+                },
+            },
+        )
+
+        aggregations = result["aggregations"]
+        facets = IdeaFacetCounts(
+            total=result["hits"]["total"]["value"],
+            **{
+                name: {
+                    bucket["key"]: bucket["doc_count"]
+                    for bucket in aggregations[name]["buckets"]
+                }
+                for name in ("status", "classification", "labels")
+            },
+        )
+        self._remember_facets(key, revision, facets)
+        return facets
+
+    def _remember_facets(
+        self, key: tuple[Any, ...], revision: int | None, facets: IdeaFacetCounts
+    ) -> None:
+        """Cache facet counts, dropping expired and least recently used ones.
+
+        Args:
+            key: The filters the counts were made with.
+            revision: Ideas revision read before the query.
+            facets: The counts.
+        """
+        now = time.monotonic()
+        self._facet_cache[key] = (now, revision, facets)
+        self._facet_cache.move_to_end(key)
+        expired = [
+            cached_key
+            for cached_key, (cached_at, _, _) in self._facet_cache.items()
+            if now - cached_at >= self._facet_cache_ttl
+        ]
+        for cached_key in expired:
+            del self._facet_cache[cached_key]
+        while len(self._facet_cache) > FACET_CACHE_MAX_ENTRIES:
+            self._facet_cache.popitem(last=False)
+
+    async def _invalidate_facets(self) -> None:
+        """Drop cached facet counts in this and every other process."""
+        self._facet_cache.clear()
+        try:
+            await self._get_redis().incr(REDIS_IDEAS_REVISION_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to bump the ideas revision: {e}")
+
+    async def _get_revision(self) -> int | None:
+        """Read the ideas revision.
+
+        Returns:
+            int | None: The revision, 0 if ideas were never written, or
+                None if Redis is unavailable, in which case cached counts
+                only expire with their TTL.
+        """
+        try:
+            revision = await self._get_redis().get(REDIS_IDEAS_REVISION_KEY)
+        except Exception as e:
+            logger.debug(f"Failed to read the ideas revision: {e}")
+            return None
+        return int(revision) if revision else 0
+
+    async def store_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        """Store idea embeddings for kNN search.
+
+        The vectors are written with one _bulk request and the index is
+        refreshed once, so the ideas can be found by the next kNN query.
+
+        Args:
+            embeddings: Embedding vector per idea ID.
+        """
+        if not embeddings:
+            return
+        es = self._get_es()
+        await self._ensure_embedding_mapping()
+
+        operations: list[dict] = []
+        for idea_id, vector in embeddings.items():
+            operations.append({"update": {"_index": IDEAS_INDEX, "_id": idea_id}})
+            operations.append({"doc": {EMBEDDING_FIELD: vector}})
+
+        response = await es.bulk(operations=operations, refresh=True)
+        if response.get("errors"):
+            failed = [
+                item["update"]["_id"]
+                for item in response["items"]
+                if "error" in item.get("update", {})
+            ]
+            logger.warning(f"Failed to store embeddings for ideas: {failed}")
+
+    async def find_similar(
+        self,
+        embeddings: dict[str, list[float]],
+        k: int,
+    ) -> dict[str, list[tuple[str, float]]]:
+        """Find the nearest active ideas to each embedding.
+
+        Runs one kNN query per embedding in a single _msearch request.
+        Each idea is excluded from its own results.
+
+        Args:
+            embeddings: Query embedding per idea ID.
+            k: Neighbours to return per idea.
+
+        Returns:
+            dict: Per idea ID, (neighbour ID, cosine similarity) pairs with
+                the most similar first. Ideas whose query failed have no
+                neighbours.
+        """
+        if not embeddings:
+            return {}
+        es = self._get_es()
+
+        searches: list[dict] = []
+        for idea_id, vector in embeddings.items():
+            searches.append({"index": IDEAS_INDEX})
+            searches.append({
+                "knn": {
+                    "field": EMBEDDING_FIELD,
+                    "query_vector": vector,
+                    "k": k,
+                    "num_candidates": max(k * KNN_CANDIDATES_PER_RESULT, MIN_KNN_CANDIDATES),
+                    "filter": {
+                        "bool": {
+                            "must_not": [
+                                {"term": {"id": idea_id}},
+                                {"term": {"status": IdeaStatus.ARCHIVED.value}},
+                            ]
+                        }
+                    },
+                },
+                "size": k,
+                "_source": False,
+            })
+
+        result = await es.msearch(searches=searches)
+
+        neighbours: dict[str, list[tuple[str, float]]] = {}
+        for idea_id, response in zip(embeddings, result["responses"], strict=True):
+            if "error" in response:
+                logger.warning(f"kNN search failed for idea {idea_id}: {response['error']}")
+                neighbours[idea_id] = []
+                continue
+            # Elasticsearch scores cosine similarity as (1 + cosine) / 2
+            neighbours[idea_id] = [
+                (hit["_id"], 2 * hit["_score"] - 1) for hit in response["hits"]["hits"]
+            ]
+        return neighbours
+
+    async def _ensure_embedding_mapping(self) -> None:
+        """Add the embedding field to an ideas index created without it."""
+        if self._embedding_mapping_ready:
+            return
+        es = self._get_es()
+        await self.ensure_index()
+        await es.indices.put_mapping(
+            index=IDEAS_INDEX, properties={EMBEDDING_FIELD: EMBEDDING_MAPPING}
+        )
+        self._embedding_mapping_ready = True
+
+    def _build_query(
+        self,
+        status: IdeaStatus | None,
+        classification: IdeaClassification | None,
+        search: str | None,
+    ) -> dict:
+        """Build the search query for list filters.
+
+        Args:
+            status: Filter by idea status.
+            classification: Filter by classification type.
+            search: Full-text search in content.
+
+        Returns:
+            dict: The Elasticsearch query.
+        """
+        query: dict = {"bool": {"must": []}}
+
+        if status:
+            query["bool"]["must"].append({"term": {"status": status.value}})
+        if classification:
+            query["bool"]["must"].append({"term": {"classification": classification.value}})
+        if search:
+            query["bool"]["must"].append({"match": {"content": search}})
+
+        if not query["bool"]["must"]:
+            query = {"match_all": {}}
+
+        return query
+
+
+def _encode_cursor(state: dict[str, Any]) -> str:
+    """Encode list cursor state as an opaque string."""
+    return base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> dict[str, Any]:
+    """Decode a list cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(state, dict) or "pit" not in state or "after" not in state:
+        raise ValueError("Invalid cursor")
+    return state
+
+
+async def _aenumerate(items: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[tuple[int, T]]:
+    """Enumerate a sync or async iterable asynchronously."""
+    if isinstance(items, AsyncIterable):
+        index = 0
+        async for item in items:
+            yield index, item
+            index += 1
+    else:
+        for index, item in enumerate(items):
+            yield index, item
+
 
 # Global service instance
 _ideas_service: IdeasService | None = None
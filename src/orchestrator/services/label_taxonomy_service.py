@@ -2,12 +2,22 @@
 
 This module provides the service layer for managing label taxonomies
 used in idea classification. Data is stored in Redis.
+
+Classification reads the taxonomy through get_compiled_taxonomy(), an
+in-process snapshot with the prompt text pre-rendered and the label
+keywords compiled into one matcher. The snapshot is rebuilt when the
+taxonomy revision in Redis changes.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
@@ -25,6 +35,12 @@ logger = logging.getLogger(__name__)
 # Redis key for taxonomy storage
 REDIS_TAXONOMY_KEY = "classification:taxonomy:default"
 
+# Redis key of the taxonomy revision, incremented on every change
+REDIS_TAXONOMY_REVISION_KEY = "classification:taxonomy:default:revision"
+
+# Seconds between checks of the taxonomy revision
+DEFAULT_REVISION_CHECK_INTERVAL = 5.0
+
 
 # Default label definitions
 DEFAULT_LABELS: list[LabelDefinition] = [
@@ -119,6 +135,150 @@ def _create_default_taxonomy() -> LabelTaxonomy:
     )
 
 
+class KeywordMatcher:
+    """Finds which of a set of keywords occur in a text in one regex pass.
+
+    Keywords match case-insensitively anywhere in the text, like
+    ``keyword in text.lower()``, including keywords that overlap or are
+    prefixes of one another.
+
+    Usage:
+        matcher = KeywordMatcher(["fix", "fixture", "bug"])
+        matcher.find("Fixture bug")  # {"fix", "fixture", "bug"}
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """Compile the keywords.
+
+        Args:
+            keywords: Keywords to look for.
+        """
+        # Longest first, so each position reports its longest keyword
+        unique = sorted({k.lower() for k in keywords if k}, key=len, reverse=True)
+        self._pattern = (
+            re.compile("(?=(" + "|".join(re.escape(k) for k in unique) + "))")
+            if unique
+            else None
+        )
+        # Keywords at the same position are prefixes of the longest one
+        self._prefixes = {
+            keyword: frozenset(k for k in unique if keyword.startswith(k))
+            for keyword in unique
+        }
+
+    def find(self, text: str) -> frozenset[str]:
+        """Find the keywords that occur in a text.
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            frozenset[str]: Lowercased keywords found.
+        """
+        if self._pattern is None:
+            return frozenset()
+        longest = {match.group(1) for match in self._pattern.finditer(text.lower())}
+        found: set[str] = set()
+        for keyword in longest:
+            found |= self._prefixes[keyword]
+        return frozenset(found)
+
+
+@dataclass(frozen=True)
+class CompiledTaxonomy:
+    """A taxonomy snapshot prepared for classification.
+
+    Attributes:
+        taxonomy: The taxonomy.
+        revision: Taxonomy revision the snapshot was built from.
+        prompt_text: The taxonomy formatted for LLM prompts.
+        matcher: Matcher for the keywords of all labels.
+        label_keywords: Lowercased keywords per label ID.
+    """
+
+    taxonomy: LabelTaxonomy
+    revision: int
+    prompt_text: str
+    matcher: KeywordMatcher
+    label_keywords: dict[str, tuple[str, ...]]
+
+    @classmethod
+    def compile(cls, taxonomy: LabelTaxonomy, revision: int = 0) -> CompiledTaxonomy:
+        """Compile a taxonomy.
+
+        Args:
+            taxonomy: The taxonomy to compile.
+            revision: Taxonomy revision it was read at.
+
+        Returns:
+            CompiledTaxonomy: The compiled taxonomy.
+        """
+        label_keywords = {
+            label.id: tuple(k.lower() for k in label.keywords)
+            for label in taxonomy.labels
+            if label.keywords
+        }
+        return cls(
+            taxonomy=taxonomy,
+            revision=revision,
+            prompt_text=format_taxonomy_prompt(taxonomy),
+            matcher=KeywordMatcher(k for kws in label_keywords.values() for k in kws),
+            label_keywords=label_keywords,
+        )
+
+    def match_labels(self, content: str) -> dict[str, int]:
+        """Count the keywords of each label that occur in a text.
+
+        Args:
+            content: The text to match.
+
+        Returns:
+            dict[str, int]: Matching keyword count per label ID, for labels
+                with at least one match.
+        """
+        found = self.matcher.find(content)
+        if not found:
+            return {}
+        counts: dict[str, int] = {}
+        for label_id, keywords in self.label_keywords.items():
+            matches = sum(1 for keyword in keywords if keyword in found)
+            if matches:
+                counts[label_id] = matches
+        return counts
+
+
+def format_taxonomy_prompt(taxonomy: LabelTaxonomy) -> str:
+    """Format a taxonomy for use in an LLM prompt.
+
+    Args:
+        taxonomy: The taxonomy to format.
+
+    Returns:
+        str: Formatted taxonomy text for LLM prompts.
+    """
+    lines = [
+        "Available labels for classification:",
+        "",
+    ]
+
+    for label in taxonomy.labels:
+        # Label header
+        lines.append(f"- {label.id} ({label.name})")
+
+        # Description
+        if label.description:
+            lines.append(f"  Description: {label.description}")
+
+        # Keywords
+        if label.keywords:
+            keywords_str = ", ".join(label.keywords)
+            lines.append(f"  Keywords: {keywords_str}")
+
+        lines.append("")
+
+    return "\n".join(lines)
+
+
 class LabelTaxonomyService:
     """Service for managing label taxonomies.
 
@@ -135,16 +295,28 @@ class LabelTaxonomyService:
         await service.delete_label("feature")
         
         prompt_text = await service.to_prompt_format()
+        compiled = await service.get_compiled_taxonomy()
     """
 
-    def __init__(self, redis_client: redis.Redis | None = None) -> None:
+    def __init__(
+        self,
+        redis_client: redis.Redis | None = None,
+        revision_check_interval: float = DEFAULT_REVISION_CHECK_INTERVAL,
+    ) -> None:
         """Initialize the label taxonomy service.
 
         Args:
             redis_client: Optional Redis client. If not provided, will
                 create a default client when needed.
+            revision_check_interval: Seconds between checks of the taxonomy
+                revision; changes made by other processes are picked up
+                within this time.
         """
         self._redis_client = redis_client
+        self._revision_check_interval = revision_check_interval
+        self._compiled: CompiledTaxonomy | None = None
+        self._revision_checked_at = 0.0
+        self._compile_lock = asyncio.Lock()
 
     async def _get_redis(self) -> redis.Redis:
         """Get or create the Redis client.
@@ -242,6 +414,8 @@ class LabelTaxonomyService:
         }
 
         await redis_client.set(REDIS_TAXONOMY_KEY, json.dumps(taxonomy_dict))
+        await redis_client.incr(REDIS_TAXONOMY_REVISION_KEY)
+        self._compiled = None
         return updated_taxonomy
 
     async def add_label(self, label: LabelDefinition) -> LabelTaxonomy:
@@ -381,29 +555,52 @@ class LabelTaxonomyService:
         Returns:
             str: Formatted taxonomy text for LLM prompts.
         """
-        taxonomy = await self.get_taxonomy()
+        return format_taxonomy_prompt(await self.get_taxonomy())
 
-        lines = [
-            "Available labels for classification:",
-            "",
-        ]
+    async def get_compiled_taxonomy(self) -> CompiledTaxonomy:
+        """Get the compiled snapshot of the current taxonomy.
 
-        for label in taxonomy.labels:
-            # Label header
-            lines.append(f"- {label.id} ({label.name})")
-            
-            # Description
-            if label.description:
-                lines.append(f"  Description: {label.description}")
-            
-            # Keywords
-            if label.keywords:
-                keywords_str = ", ".join(label.keywords)
-                lines.append(f"  Keywords: {keywords_str}")
-            
-            lines.append("")
-
-        return "\n".join(lines)
+        The snapshot is reused until the taxonomy revision changes. The
+        revision is read at most once per ``revision_check_interval``, and
+        changes made through this service are seen immediately.
+
+        Returns:
+            CompiledTaxonomy: The compiled taxonomy.
+        """
+        compiled = self._compiled
+        if (
+            compiled is not None
+            and time.monotonic() - self._revision_checked_at < self._revision_check_interval
+        ):
+            return compiled
+
+        async with self._compile_lock:
+            compiled = self._compiled
+            if (
+                compiled is not None
+                and time.monotonic() - self._revision_checked_at
+                < self._revision_check_interval
+            ):
+                return compiled
+
+            # Read the revision first, so a change made meanwhile is seen
+            revision = await self._get_revision()
+            self._revision_checked_at = time.monotonic()
+            if compiled is None or compiled.revision != revision:
+                compiled = CompiledTaxonomy.compile(await self.get_taxonomy(), revision)
+                self._compiled = compiled
+                logger.debug(f"Compiled label taxonomy at revision {revision}")
+            return compiled
+
+    async def _get_revision(self) -> int:
+        """Read the taxonomy revision.
+
+        Returns:
+            int: The revision, 0 if the taxonomy was never changed.
+        """
+        redis_client = await self._get_redis()
+        revision = await redis_client.get(REDIS_TAXONOMY_REVISION_KEY)
+        return int(revision) if revision else 0
 
 
 # Global service instance
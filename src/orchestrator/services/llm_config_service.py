@@ -24,6 +24,7 @@ from src.orchestrator.api.models.llm_config import (
     APIKeyCreate,
     LLMModel,
     LLMProvider,
+    LLMTarget,
 )
 from src.orchestrator.utils.encryption import EncryptionService
 
@@ -35,6 +36,8 @@ logger = logging.getLogger(__name__)
 REDIS_KEY_PREFIX = "llm:keys:"
 REDIS_AGENT_PREFIX = "llm:agents:"
 REDIS_MODELS_PREFIX = "llm:models:"
+# Hash of role -> config version, bumped on every change that affects clients
+REDIS_CONFIG_VERSIONS_KEY = "llm:config:versions"
 
 # Cache TTL for discovered models (24 hours)
 MODELS_CACHE_TTL = 86400
@@ -370,6 +373,9 @@ class LLMConfigService:
         """
         redis_client = await self._get_redis()
         deleted = await redis_client.delete(f"{REDIS_KEY_PREFIX}{key_id}")
+        if deleted > 0:
+            # Clients built with the key must be dropped, whichever role
+            await self._bump_config_versions(list(AgentRole))
         return deleted > 0
 
     async def get_decrypted_key(self, key_id: str) -> str | None:
@@ -436,6 +442,7 @@ class LLMConfigService:
             model=config_dict["model"],
             api_key_id=config_dict["api_key_id"],
             settings=AgentSettings(**config_dict.get("settings", {})),
+            fallbacks=[LLMTarget(**t) for t in config_dict.get("fallbacks", [])],
             enabled=config_dict.get("enabled", True),
         )
 
@@ -470,6 +477,7 @@ class LLMConfigService:
             "model": config.model,
             "api_key_id": config.api_key_id,
             "settings": config.settings.model_dump(),
+            "fallbacks": [t.model_dump(mode="json") for t in config.fallbacks],
             "enabled": config.enabled,
         }
 
@@ -477,9 +485,36 @@ class LLMConfigService:
             f"{REDIS_AGENT_PREFIX}{config.role.value}",
             json.dumps(config_dict),
         )
+        await self._bump_config_versions([config.role])
 
         return config
 
+    async def get_config_versions(self) -> dict[str, int]:
+        """Get the configuration version of each agent role.
+
+        A role's version changes whenever its configuration or API key
+        changes, so LLM client caches can rebuild only affected clients.
+        Roles that were never changed are absent.
+
+        Returns:
+            dict[str, int]: Version per role value.
+        """
+        redis_client = await self._get_redis()
+        raw = await redis_client.hgetall(REDIS_CONFIG_VERSIONS_KEY)
+        return {
+            (k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()
+        }
+
+    async def _bump_config_versions(self, roles: list[AgentRole]) -> None:
+        """Increment the configuration version of agent roles.
+
+        Args:
+            roles: Roles whose clients are out of date.
+        """
+        redis_client = await self._get_redis()
+        for role in roles:
+            await redis_client.hincrby(REDIS_CONFIG_VERSIONS_KEY, role.value, 1)
+
     async def partial_update_agent_config(
         self,
         role: AgentRole,
@@ -509,6 +544,7 @@ class LLMConfigService:
                 model=existing.model,
                 api_key_id=existing.api_key_id,
                 settings=existing.settings,
+                fallbacks=existing.fallbacks,
                 enabled=existing.enabled,
             )
         if update.model is not None:
@@ -518,6 +554,7 @@ class LLMConfigService:
                 model=update.model,
                 api_key_id=existing.api_key_id,
                 settings=existing.settings,
+                fallbacks=existing.fallbacks,
                 enabled=existing.enabled,
             )
         if update.api_key_id is not None:
@@ -527,6 +564,7 @@ class LLMConfigService:
                 model=existing.model,
                 api_key_id=update.api_key_id,
                 settings=existing.settings,
+                fallbacks=existing.fallbacks,
                 enabled=existing.enabled,
             )
         if update.enabled is not None:
@@ -536,6 +574,7 @@ class LLMConfigService:
                 model=existing.model,
                 api_key_id=existing.api_key_id,
                 settings=existing.settings,
+                fallbacks=existing.fallbacks,
                 enabled=update.enabled,
             )
         if update.settings is not None:
@@ -545,6 +584,17 @@ class LLMConfigService:
                 model=existing.model,
                 api_key_id=existing.api_key_id,
                 settings=update.settings,
+                fallbacks=existing.fallbacks,
+                enabled=existing.enabled,
+            )
+        if update.fallbacks is not None:
+            existing = AgentLLMConfig(
+                role=existing.role,
+                provider=existing.provider,
+                model=existing.model,
+                api_key_id=existing.api_key_id,
+                settings=existing.settings,
+                fallbacks=update.fallbacks,
                 enabled=existing.enabled,
             )
 
@@ -646,6 +696,9 @@ class LLMConfigService:
                 "max_tokens": config.settings.max_tokens,
                 "top_p": config.settings.top_p,
                 "top_k": config.settings.top_k,
+                "cache_responses": config.settings.cache_responses,
+                "hedge_requests": config.settings.hedge_requests,
+                "fallbacks": [t.model_dump(mode="json") for t in config.fallbacks],
                 "enabled": config.enabled,
             }
 
@@ -688,6 +741,8 @@ class LLMConfigService:
                     max_tokens=agent_config.get("max_tokens", 16384),
                     top_p=agent_config.get("top_p"),
                     top_k=agent_config.get("top_k"),
+                    cache_responses=agent_config.get("cache_responses", False),
+                    hedge_requests=agent_config.get("hedge_requests", False),
                 )
 
                 # Create config
@@ -697,6 +752,7 @@ class LLMConfigService:
                     model=agent_config.get("model", "claude-sonnet-4-20250514"),
                     api_key_id=agent_config.get("api_key_id", ""),
                     settings=settings,
+                    fallbacks=[LLMTarget(**t) for t in agent_config.get("fallbacks", [])],
                     enabled=agent_config.get("enabled", True),
                 )
 
@@ -845,6 +901,7 @@ class LLMConfigService:
             LLMClientFactory,
             LLMClientError,
         )
+        from src.infrastructure.llm.rate_limiter import LLMPriority
 
         factory = LLMClientFactory(config_service=self)
 
@@ -857,6 +914,7 @@ class LLMConfigService:
             await client.generate(
                 prompt="Say hello",
                 max_tokens=10,
+                priority=LLMPriority.INTERACTIVE,
             )
             end_time = time.perf_counter()
 
@@ -30,6 +30,12 @@ Example:
     )
 """
 
+import redis.asyncio as redis
+
+from src.infrastructure.llm.structured_output import (
+    ProgressCallback,
+    RedisProgressPublisher,
+)
 from src.workers.agents.design.config import DesignConfig, ConfigValidationError
 from src.workers.agents.design.models import (
     TechnologyChoice,
@@ -155,6 +161,7 @@ def create_surveyor_agent(
     config: DesignConfig | None = None,
     rlm_integration: "RLMIntegration | None" = None,
     repo_mapper: "RepoMapper | None" = None,
+    on_progress: ProgressCallback | None = None,
 ) -> SurveyorAgent:
     """Factory function to create a Surveyor agent.
 
@@ -164,6 +171,7 @@ def create_surveyor_agent(
         config: Optional configuration.
         rlm_integration: Optional RLM integration for deep research.
         repo_mapper: Optional RepoMapper for context pack.
+        on_progress: Optional callback receiving partial structured output.
 
     Returns:
         SurveyorAgent: Configured Surveyor agent instance.
@@ -174,6 +182,7 @@ def create_surveyor_agent(
         config=config or DesignConfig(),
         rlm_integration=rlm_integration,
         repo_mapper=repo_mapper,
+        on_progress=on_progress,
     )
 
 
@@ -181,6 +190,7 @@ def create_architect_agent(
     llm_client: "LLMClient",
     artifact_writer: "ArtifactWriter",
     config: DesignConfig | None = None,
+    on_progress: ProgressCallback | None = None,
 ) -> ArchitectAgent:
     """Factory function to create an Architect agent.
 
@@ -188,6 +198,7 @@ def create_architect_agent(
         llm_client: LLM client for generation.
         artifact_writer: Writer for artifacts.
         config: Optional configuration.
+        on_progress: Optional callback receiving partial structured output.
 
     Returns:
         ArchitectAgent: Configured Architect agent instance.
@@ -196,6 +207,7 @@ def create_architect_agent(
         llm_client=llm_client,
         artifact_writer=artifact_writer,
         config=config or DesignConfig(),
+        on_progress=on_progress,
     )
 
 
@@ -203,6 +215,7 @@ def create_planner_agent(
     llm_client: "LLMClient",
     artifact_writer: "ArtifactWriter",
     config: DesignConfig | None = None,
+    on_progress: ProgressCallback | None = None,
 ) -> PlannerAgent:
     """Factory function to create a Planner agent.
 
@@ -210,6 +223,7 @@ def create_planner_agent(
         llm_client: LLM client for generation.
         artifact_writer: Writer for artifacts.
         config: Optional configuration.
+        on_progress: Optional callback receiving partial structured output.
 
     Returns:
         PlannerAgent: Configured Planner agent instance.
@@ -218,6 +232,7 @@ def create_planner_agent(
         llm_client=llm_client,
         artifact_writer=artifact_writer,
         config=config or DesignConfig(),
+        on_progress=on_progress,
     )
 
 
@@ -228,6 +243,7 @@ def create_design_coordinator(
     config: DesignConfig | None = None,
     rlm_integration: "RLMIntegration | None" = None,
     repo_mapper: "RepoMapper | None" = None,
+    redis_client: "redis.Redis | None" = None,
 ) -> DesignCoordinator:
     """Factory function to create a Design coordinator.
 
@@ -238,6 +254,8 @@ def create_design_coordinator(
         config: Optional configuration.
         rlm_integration: Optional RLM integration.
         repo_mapper: Optional RepoMapper for context pack.
+        redis_client: Optional Redis client the agents publish their
+            structured output progress to.
 
     Returns:
         DesignCoordinator: Configured coordinator instance.
@@ -249,4 +267,7 @@ def create_design_coordinator(
         config=config or DesignConfig(),
         rlm_integration=rlm_integration,
         repo_mapper=repo_mapper,
+        on_progress=(
+            RedisProgressPublisher(redis_client) if redis_client is not None else None
+        ),
     )
@@ -6,11 +6,14 @@ architectures with clear interfaces and Mermaid diagrams.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from typing import Any, TYPE_CHECKING
 
+from src.infrastructure.llm.structured_output import (
+    ProgressCallback,
+    generate_structured,
+)
 from src.workers.agents.protocols import AgentContext, AgentResult, BaseAgent
 from src.workers.agents.design.config import DesignConfig
 from src.workers.agents.design.models import (
@@ -64,6 +67,7 @@ class ArchitectAgent:
         llm_client: LLMClient,
         artifact_writer: ArtifactWriter,
         config: DesignConfig,
+        on_progress: ProgressCallback | None = None,
     ) -> None:
         """Initialize the Architect agent.
 
@@ -71,10 +75,13 @@ class ArchitectAgent:
             llm_client: LLM client for text generation.
             artifact_writer: Writer for persisting artifacts.
             config: Agent configuration.
+            on_progress: Optional callback receiving partial structured
+                output while it streams, e.g. for UI progress.
         """
         self._llm_client = llm_client
         self._artifact_writer = artifact_writer
         self._config = config
+        self._on_progress = on_progress
 
     @property
     def agent_type(self) -> str:
@@ -226,30 +233,20 @@ class ArchitectAgent:
             tech_survey, prd_content, context_pack_summary
         )
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=ARCHITECT_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                design = self._parse_json_from_response(response.content)
-
-                if design and "components" in design:
-                    return design
-
-                logger.warning(f"Invalid component design on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.warning(f"Component design attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        design = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=ARCHITECT_SYSTEM_PROMPT,
+            required={"components": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="component_design",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-        return None
+        return design
 
     async def _generate_diagrams(
         self,
@@ -265,28 +262,21 @@ class ArchitectAgent:
         """
         prompt = format_diagram_generation_prompt(json.dumps(architecture))
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=ARCHITECT_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                result = self._parse_json_from_response(response.content)
-
-                if result and "diagrams" in result:
-                    return result["diagrams"]
-
-                logger.warning(f"Invalid diagram response on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        result = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=ARCHITECT_SYSTEM_PROMPT,
+            required={"diagrams": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="diagram_generation",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-            except Exception as e:
-                logger.warning(f"Diagram generation attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        if result:
+            return result["diagrams"]
 
         # Return empty list on failure - diagrams are optional
         return []
@@ -307,30 +297,20 @@ class ArchitectAgent:
         """
         prompt = format_nfr_validation_prompt(architecture, nfr_requirements)
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=ARCHITECT_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                result = self._parse_json_from_response(response.content)
-
-                if result and "nfr_evaluation" in result:
-                    return result
-
-                logger.warning(f"Invalid NFR validation on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.warning(f"NFR validation attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        result = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=ARCHITECT_SYSTEM_PROMPT,
+            required={"nfr_evaluation": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="nfr_validation",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-        return None
+        return result
 
     def _build_architecture(
         self,
@@ -510,47 +490,6 @@ class ArchitectAgent:
 
         return "\n".join(lines) if lines else ""
 
-    def _parse_json_from_response(self, content: str) -> dict[str, Any] | None:
-        """Parse JSON from LLM response, handling code blocks.
-
-        Args:
-            content: Raw LLM response content.
-
-        Returns:
-            dict | None: Parsed JSON or None if parsing fails.
-        """
-        # Try direct JSON parse first
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            pass
-
-        # Try extracting from code blocks
-        import re
-
-        patterns = [
-            r'```json\s*\n?(.*?)\n?```',
-            r'```\s*\n?(.*?)\n?```',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                try:
-                    return json.loads(match.group(1).strip())
-                except json.JSONDecodeError:
-                    continue
-
-        # Try finding JSON-like content
-        json_start = content.find('{')
-        json_end = content.rfind('}')
-        if json_start != -1 and json_end != -1 and json_end > json_start:
-            try:
-                return json.loads(content[json_start:json_end + 1])
-            except json.JSONDecodeError:
-                pass
-
-        return None
 
     def validate_context(self, context: AgentContext) -> bool:
         """Validate that context is suitable for execution.
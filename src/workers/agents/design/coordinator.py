@@ -11,6 +11,7 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any, TYPE_CHECKING
 
+from src.infrastructure.llm.structured_output import ProgressCallback
 from src.workers.agents.design.config import DesignConfig
 from src.workers.agents.design.models import (
     Architecture,
@@ -87,6 +88,7 @@ class DesignCoordinator:
     rlm_integration: RLMIntegration | None = None
     repo_mapper: RepoMapper | None = None
     hitl_dispatcher: HITLDispatcher | None = None
+    on_progress: ProgressCallback | None = None
 
     def __post_init__(self) -> None:
         """Initialize agents."""
@@ -96,16 +98,19 @@ class DesignCoordinator:
             config=self.config,
             rlm_integration=self.rlm_integration,
             repo_mapper=self.repo_mapper,
+            on_progress=self.on_progress,
         )
         self._architect = ArchitectAgent(
             llm_client=self.llm_client,
             artifact_writer=self.artifact_writer,
             config=self.config,
+            on_progress=self.on_progress,
         )
         self._planner = PlannerAgent(
             llm_client=self.llm_client,
             artifact_writer=self.artifact_writer,
             config=self.config,
+            on_progress=self.on_progress,
         )
 
     async def run(
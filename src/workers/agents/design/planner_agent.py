@@ -6,11 +6,14 @@ estimates complexity, and calculates critical path.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from typing import Any, TYPE_CHECKING
 
+from src.infrastructure.llm.structured_output import (
+    ProgressCallback,
+    generate_structured,
+)
 from src.workers.agents.protocols import AgentContext, AgentResult, BaseAgent
 from src.workers.agents.design.config import DesignConfig
 from src.workers.agents.design.models import (
@@ -61,6 +64,7 @@ class PlannerAgent:
         llm_client: LLMClient,
         artifact_writer: ArtifactWriter,
         config: DesignConfig,
+        on_progress: ProgressCallback | None = None,
     ) -> None:
         """Initialize the Planner agent.
 
@@ -68,10 +72,13 @@ class PlannerAgent:
             llm_client: LLM client for text generation.
             artifact_writer: Writer for persisting artifacts.
             config: Agent configuration.
+            on_progress: Optional callback receiving partial structured
+                output while it streams, e.g. for UI progress.
         """
         self._llm_client = llm_client
         self._artifact_writer = artifact_writer
         self._config = config
+        self._on_progress = on_progress
 
     @property
     def agent_type(self) -> str:
@@ -230,30 +237,20 @@ class PlannerAgent:
             architecture, prd_content, acceptance_criteria
         )
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=PLANNER_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                result = self._parse_json_from_response(response.content)
-
-                if result and "tasks" in result:
-                    return result
-
-                logger.warning(f"Invalid task breakdown on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.warning(f"Task breakdown attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        result = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=PLANNER_SYSTEM_PROMPT,
+            required={"tasks": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="task_breakdown",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-        return None
+        return result
 
     async def _analyze_dependencies(
         self,
@@ -271,30 +268,20 @@ class PlannerAgent:
         """
         prompt = format_dependency_analysis_prompt(tasks, architecture)
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=PLANNER_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                result = self._parse_json_from_response(response.content)
-
-                if result and "refined_dependencies" in result:
-                    return result
-
-                logger.warning(f"Invalid dependency analysis on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.warning(f"Dependency analysis attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        result = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=PLANNER_SYSTEM_PROMPT,
+            required={"refined_dependencies": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="dependency_analysis",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-        return None
+        return result
 
     async def _estimate_complexity(
         self,
@@ -312,30 +299,20 @@ class PlannerAgent:
         """
         prompt = format_complexity_estimation_prompt(tasks, tech_survey)
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=PLANNER_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                result = self._parse_json_from_response(response.content)
-
-                if result and "estimations" in result:
-                    return result
-
-                logger.warning(f"Invalid complexity estimation on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.warning(f"Complexity estimation attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        result = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=PLANNER_SYSTEM_PROMPT,
+            required={"estimations": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="complexity_estimation",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-        return None
+        return result
 
     async def _calculate_critical_path(
         self,
@@ -353,30 +330,20 @@ class PlannerAgent:
         """
         prompt = format_critical_path_prompt(tasks, dependency_graph)
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=PLANNER_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                result = self._parse_json_from_response(response.content)
-
-                if result and "critical_path" in result:
-                    return result
-
-                logger.warning(f"Invalid critical path on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.warning(f"Critical path calculation attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        result = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=PLANNER_SYSTEM_PROMPT,
+            required={"critical_path": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="critical_path",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-        return None
+        return result
 
     def _apply_dependency_refinements(
         self,
@@ -540,47 +507,6 @@ class PlannerAgent:
 
         return json_path
 
-    def _parse_json_from_response(self, content: str) -> dict[str, Any] | None:
-        """Parse JSON from LLM response, handling code blocks.
-
-        Args:
-            content: Raw LLM response content.
-
-        Returns:
-            dict | None: Parsed JSON or None if parsing fails.
-        """
-        # Try direct JSON parse first
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            pass
-
-        # Try extracting from code blocks
-        import re
-
-        patterns = [
-            r'```json\s*\n?(.*?)\n?```',
-            r'```\s*\n?(.*?)\n?```',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.DOTALL)
-            if match:
-                try:
-                    return json.loads(match.group(1).strip())
-                except json.JSONDecodeError:
-                    continue
-
-        # Try finding JSON-like content
-        json_start = content.find('{')
-        json_end = content.rfind('}')
-        if json_start != -1 and json_end != -1 and json_end > json_start:
-            try:
-                return json.loads(content[json_start:json_end + 1])
-            except json.JSONDecodeError:
-                pass
-
-        return None
 
     def validate_context(self, context: AgentContext) -> bool:
         """Validate that context is suitable for execution.
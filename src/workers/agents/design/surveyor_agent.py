@@ -7,11 +7,14 @@ with recommendations.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from typing import Any, TYPE_CHECKING
 
+from src.infrastructure.llm.structured_output import (
+    ProgressCallback,
+    generate_structured,
+)
 from src.workers.agents.protocols import AgentContext, AgentResult, BaseAgent
 from src.workers.agents.design.config import DesignConfig
 from src.workers.agents.design.models import (
@@ -66,6 +69,7 @@ class SurveyorAgent:
         config: DesignConfig,
         rlm_integration: RLMIntegration | None = None,
         repo_mapper: RepoMapper | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> None:
         """Initialize the Surveyor agent.
 
@@ -75,12 +79,15 @@ class SurveyorAgent:
             config: Agent configuration.
             rlm_integration: Optional RLM integration for deep research.
             repo_mapper: Optional repo mapper for context pack generation.
+            on_progress: Optional callback receiving partial structured
+                output while it streams, e.g. for UI progress.
         """
         self._llm_client = llm_client
         self._artifact_writer = artifact_writer
         self._config = config
         self._rlm_integration = rlm_integration
         self._repo_mapper = repo_mapper
+        self._on_progress = on_progress
 
     @property
     def agent_type(self) -> str:
@@ -229,30 +236,20 @@ class SurveyorAgent:
             prd_content, context_pack_summary, existing_patterns
         )
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=SURVEYOR_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                analysis = self._parse_json_from_response(response.content)
-
-                if analysis and "technology_needs" in analysis:
-                    return analysis
-
-                logger.warning(f"Invalid analysis response on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.warning(f"Technology analysis attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        analysis = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=SURVEYOR_SYSTEM_PROMPT,
+            required={"technology_needs": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="technology_analysis",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-        return None
+        return analysis
 
     async def _explore_with_rlm(
         self,
@@ -341,30 +338,20 @@ class SurveyorAgent:
             json.dumps(tech_needs), rlm_findings, additional_context
         )
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=SURVEYOR_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                evaluations = self._parse_json_from_response(response.content)
-
-                if evaluations and "evaluations" in evaluations:
-                    return evaluations
-
-                logger.warning(f"Invalid evaluations response on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.warning(f"Research synthesis attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        evaluations = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=SURVEYOR_SYSTEM_PROMPT,
+            required={"evaluations": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="research_synthesis",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-        return None
+        return evaluations
 
     async def _generate_recommendations(
         self,
@@ -392,28 +379,21 @@ class SurveyorAgent:
             json.dumps(evaluations), prd_reference, constraints_summary
         )
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=SURVEYOR_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                rec_data = self._parse_json_from_response(response.content)
-
-                if rec_data and "technologies" in rec_data:
-                    return self._build_tech_survey(rec_data, prd_reference)
-
-                logger.warning(f"Invalid recommendations response on attempt {attempt + 1}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        rec_data = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=SURVEYOR_SYSTEM_PROMPT,
+            required={"technologies": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="recommendations",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-            except Exception as e:
-                logger.warning(f"Recommendation generation attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        if rec_data:
+            return self._build_tech_survey(rec_data, prd_reference)
 
         # Fallback: create minimal survey from evaluations
         return self._create_fallback_survey(evaluations, prd_reference)
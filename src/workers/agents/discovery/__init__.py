@@ -31,6 +31,12 @@ Example:
     )
 """
 
+import redis.asyncio as redis
+
+from src.infrastructure.llm.structured_output import (
+    ProgressCallback,
+    RedisProgressPublisher,
+)
 from src.workers.agents.discovery.config import DiscoveryConfig, ConfigValidationError
 from src.workers.agents.discovery.models import (
     Requirement,
@@ -132,6 +138,7 @@ def create_prd_agent(
     artifact_writer: "ArtifactWriter",
     config: DiscoveryConfig | None = None,
     rlm_integration: "RLMIntegration | None" = None,
+    on_progress: ProgressCallback | None = None,
 ) -> PRDAgent:
     """Factory function to create a PRD agent.
 
@@ -140,6 +147,7 @@ def create_prd_agent(
         artifact_writer: Writer for artifacts.
         config: Optional configuration.
         rlm_integration: Optional RLM integration.
+        on_progress: Optional callback receiving partial structured output.
 
     Returns:
         PRDAgent: Configured PRD agent instance.
@@ -149,6 +157,7 @@ def create_prd_agent(
         artifact_writer=artifact_writer,
         config=config or DiscoveryConfig(),
         rlm_integration=rlm_integration,
+        on_progress=on_progress,
     )
 
 
@@ -180,6 +189,7 @@ def create_discovery_coordinator(
     hitl_dispatcher: "HITLDispatcher | None" = None,
     config: DiscoveryConfig | None = None,
     rlm_integration: "RLMIntegration | None" = None,
+    redis_client: "redis.Redis | None" = None,
 ) -> DiscoveryCoordinator:
     """Factory function to create a Discovery coordinator.
 
@@ -189,6 +199,8 @@ def create_discovery_coordinator(
         hitl_dispatcher: Optional HITL dispatcher.
         config: Optional configuration.
         rlm_integration: Optional RLM integration.
+        redis_client: Optional Redis client the PRD agent publishes its
+            structured output progress to.
 
     Returns:
         DiscoveryCoordinator: Configured coordinator instance.
@@ -199,4 +211,7 @@ def create_discovery_coordinator(
         hitl_dispatcher=hitl_dispatcher,
         config=config or DiscoveryConfig(),
         rlm_integration=rlm_integration,
+        on_progress=(
+            RedisProgressPublisher(redis_client) if redis_client is not None else None
+        ),
     )
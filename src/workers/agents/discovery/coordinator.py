@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
+from src.infrastructure.llm.structured_output import ProgressCallback
 from src.workers.agents.protocols import AgentContext, AgentResult
 from src.workers.agents.discovery.config import DiscoveryConfig
 from src.workers.agents.discovery.models import (
@@ -87,6 +88,7 @@ class DiscoveryCoordinator:
         hitl_dispatcher: HITLDispatcher | None = None,
         config: DiscoveryConfig | None = None,
         rlm_integration: RLMIntegration | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> None:
         """Initialize the Discovery Coordinator.
 
@@ -96,6 +98,8 @@ class DiscoveryCoordinator:
             hitl_dispatcher: Dispatcher for HITL gate requests.
             config: Configuration for discovery agents.
             rlm_integration: Optional RLM integration for exploration.
+            on_progress: Optional callback receiving partial structured
+                output of the PRD agent.
         """
         self._config = config or DiscoveryConfig()
         self._artifact_writer = artifact_writer
@@ -107,6 +111,7 @@ class DiscoveryCoordinator:
             artifact_writer=artifact_writer,
             config=self._config,
             rlm_integration=rlm_integration,
+            on_progress=on_progress,
         )
 
         self._acceptance_agent = AcceptanceAgent(
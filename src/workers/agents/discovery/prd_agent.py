@@ -6,11 +6,14 @@ following the BaseAgent protocol.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from typing import Any, TYPE_CHECKING
 
+from src.infrastructure.llm.structured_output import (
+    ProgressCallback,
+    generate_structured,
+)
 from src.workers.agents.protocols import AgentContext, AgentResult, BaseAgent
 from src.workers.agents.discovery.config import DiscoveryConfig
 from src.workers.agents.discovery.models import (
@@ -62,6 +65,7 @@ class PRDAgent:
         artifact_writer: ArtifactWriter,
         config: DiscoveryConfig,
         rlm_integration: RLMIntegration | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> None:
         """Initialize the PRD agent.
 
@@ -70,11 +74,14 @@ class PRDAgent:
             artifact_writer: Writer for persisting artifacts.
             config: Agent configuration.
             rlm_integration: Optional RLM integration for exploration.
+            on_progress: Optional callback receiving partial structured
+                output while it streams, e.g. for UI progress.
         """
         self._llm_client = llm_client
         self._artifact_writer = artifact_writer
         self._config = config
         self._rlm_integration = rlm_integration
+        self._on_progress = on_progress
 
     @property
     def agent_type(self) -> str:
@@ -187,51 +194,41 @@ class PRDAgent:
         """
         prompt = format_requirements_extraction_prompt(raw_requirements, project_context)
 
-        for attempt in range(self._config.max_retries):
+        requirements_data = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=PRD_SYSTEM_PROMPT,
+            required={"requirements": list},
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="requirements_extraction",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
+        if not requirements_data:
+            return []
+
+        # Convert to Requirement objects
+        requirements = []
+        for req_data in requirements_data["requirements"]:
             try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=PRD_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
+                req = Requirement(
+                    id=req_data.get("id", f"REQ-{len(requirements) + 1:03d}"),
+                    description=req_data.get("description", ""),
+                    priority=RequirementPriority(
+                        req_data.get("priority", "should_have")
+                    ),
+                    type=RequirementType(req_data.get("type", "functional")),
+                    rationale=req_data.get("rationale", ""),
+                    source=req_data.get("source", ""),
                 )
+                requirements.append(req)
+            except (AttributeError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping invalid requirement: {e}")
+                continue
 
-                # Parse JSON from response
-                requirements_data = self._parse_json_from_response(response.content)
-
-                if not requirements_data or "requirements" not in requirements_data:
-                    logger.warning(f"Invalid requirements response on attempt {attempt + 1}")
-                    if attempt < self._config.max_retries - 1:
-                        await asyncio.sleep(self._config.retry_delay_seconds)
-                    continue
-
-                # Convert to Requirement objects
-                requirements = []
-                for req_data in requirements_data["requirements"]:
-                    try:
-                        req = Requirement(
-                            id=req_data.get("id", f"REQ-{len(requirements) + 1:03d}"),
-                            description=req_data.get("description", ""),
-                            priority=RequirementPriority(
-                                req_data.get("priority", "should_have")
-                            ),
-                            type=RequirementType(req_data.get("type", "functional")),
-                            rationale=req_data.get("rationale", ""),
-                            source=req_data.get("source", ""),
-                        )
-                        requirements.append(req)
-                    except (ValueError, KeyError) as e:
-                        logger.warning(f"Skipping invalid requirement: {e}")
-                        continue
-
-                return requirements
-
-            except Exception as e:
-                logger.warning(f"Requirements extraction attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
-
-        return []
+        return requirements
 
     async def _generate_prd(
         self,
@@ -255,31 +252,20 @@ class PRDAgent:
 
         prompt = format_prd_prompt(requirements_json, project_title, additional_context)
 
-        for attempt in range(self._config.max_retries):
-            try:
-                response = await self._llm_client.generate(
-                    prompt=prompt,
-                    system=PRD_SYSTEM_PROMPT,
-                    max_tokens=self._config.max_tokens,
-                    temperature=self._config.temperature,
-                )
-
-                prd_data = self._parse_json_from_response(response.content)
-
-                if not prd_data:
-                    logger.warning(f"Invalid PRD response on attempt {attempt + 1}")
-                    if attempt < self._config.max_retries - 1:
-                        await asyncio.sleep(self._config.retry_delay_seconds)
-                    continue
-
-                # Build PRD document from response
-                prd = self._build_prd_from_response(prd_data, requirements)
-                return prd
+        prd_data = await generate_structured(
+            self._llm_client,
+            prompt=prompt,
+            system=PRD_SYSTEM_PROMPT,
+            max_attempts=self._config.max_retries,
+            retry_delay_seconds=self._config.retry_delay_seconds,
+            stage="prd_generation",
+            on_progress=self._on_progress,
+            max_tokens=self._config.max_tokens,
+            temperature=self._config.temperature,
+        )
 
-            except Exception as e:
-                logger.warning(f"PRD generation attempt {attempt + 1} failed: {e}")
-                if attempt < self._config.max_retries - 1:
-                    await asyncio.sleep(self._config.retry_delay_seconds)
+        if prd_data:
+            return self._build_prd_from_response(prd_data, requirements)
 
         # Fallback: create minimal PRD from requirements
         return self._create_fallback_prd(requirements, project_title)
@@ -2,15 +2,27 @@
 
 This module provides a worker that processes classification jobs from a Redis
 queue, enabling non-blocking classification of ideas.
+
+Several jobs are processed at once. In micro-batching mode, queued ideas are
+taken in groups and short ones are classified together in one prompt.
+Job progress is kept in a Redis hash updated with HINCRBY, so concurrent
+jobs never overwrite each other's counts. The hashes live under their own
+key prefix and expire after REDIS_JOB_TTL_SECONDS; jobs created before
+them, stored as JSON strings, can still be read.
+
+With an LLMBatchManager, large batch jobs are classified in offline provider
+batches instead of one LLM call per idea from the queue. Enqueueing such a
+job only records it; the worker prepares and submits the LLM batch.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import uuid
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
@@ -22,6 +34,7 @@ from src.orchestrator.api.models.classification import (
 )
 
 if TYPE_CHECKING:
+    from src.infrastructure.llm.batch import BatchItemResult, BatchRequest, LLMBatchManager
     from src.orchestrator.services.classification_service import ClassificationService
 
 
@@ -30,20 +43,31 @@ logger = logging.getLogger(__name__)
 
 # Redis keys
 REDIS_QUEUE_KEY = "classification:queue"
-REDIS_JOB_KEY_PREFIX = "classification:job:"
+REDIS_JOB_KEY_PREFIX = "classification:jobs:"
+REDIS_JOB_RESULTS_SUFFIX = ":results"
+REDIS_JOB_ERRORS_SUFFIX = ":errors"
+# Jobs created before the hashes, as JSON strings
+REDIS_LEGACY_JOB_KEY_PREFIX = "classification:job:"
+REDIS_JOB_TTL_SECONDS = 7 * 24 * 3600  # job status kept after the last update
 
 # Worker configuration
 DEFAULT_TIMEOUT = 30  # seconds to wait for queue item
+DEFAULT_CONCURRENCY = 4  # jobs processed at once
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0  # seconds
 MAX_BACKOFF = 60.0  # seconds
+PREPARE_CONCURRENCY = 16  # ideas prepared at once for an LLM batch
+
+# Name of the LLM batch result handler
+BATCH_RESULT_HANDLER = "classification"
 
 
 class ClassificationWorker:
     """Worker for processing classification jobs from a Redis queue.
 
-    Consumes classification jobs from a Redis list and processes them
-    asynchronously, with support for retry logic and graceful shutdown.
+    Consumes classification jobs from a Redis list and processes up to
+    ``concurrency`` of them at once, with support for retry logic and
+    graceful shutdown.
 
     Usage:
         worker = ClassificationWorker(redis_client, classification_service)
@@ -62,17 +86,33 @@ class ClassificationWorker:
         self,
         redis_client: redis.Redis,
         classification_service: ClassificationService,
+        batch_manager: LLMBatchManager | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        micro_batch_size: int = 1,
     ) -> None:
         """Initialize the classification worker.
 
         Args:
             redis_client: Redis client for queue operations.
             classification_service: Service for performing classifications.
+            batch_manager: Optional LLM batch manager. Batch jobs of at
+                least its configured minimum size are classified in
+                offline LLM batches.
+            concurrency: Jobs, or groups of jobs, processed at once.
+            micro_batch_size: Jobs taken from the queue at a time and
+                classified together; 1 disables micro-batching.
         """
         self._redis_client = redis_client
         self._classification_service = classification_service
+        self._batch_manager = batch_manager
+        self._concurrency = max(1, concurrency)
+        self._micro_batch_size = max(1, micro_batch_size)
+        self._in_flight: set[asyncio.Task[None]] = set()
         self._running = False
 
+        if batch_manager is not None:
+            batch_manager.register_handler(BATCH_RESULT_HANDLER, self._handle_batch_result)
+
     async def enqueue(
         self,
         idea_id: str,
@@ -88,7 +128,7 @@ class ClassificationWorker:
             str: The job ID for tracking.
         """
         job_id = f"job-{uuid.uuid4().hex[:12]}"
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
 
         job_data = {
             "job_id": job_id,
@@ -98,24 +138,15 @@ class ClassificationWorker:
             "queued_at": now.isoformat(),
         }
 
-        # Store job metadata
-        job_meta = {
-            "job_id": job_id,
-            "status": ClassificationJobStatus.PENDING.value,
-            "total": 1,
-            "completed": 0,
-            "failed": 0,
-            "idea_ids": [idea_id],
-            "created_at": now.isoformat(),
-        }
-
-        await self._redis_client.set(
-            f"{REDIS_JOB_KEY_PREFIX}{job_id}",
-            json.dumps(job_meta),
-        )
-
-        # Add to queue
-        await self._redis_client.lpush(REDIS_QUEUE_KEY, json.dumps(job_data))
+        # Store job metadata and add to queue in one round trip
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                f"{REDIS_JOB_KEY_PREFIX}{job_id}",
+                mapping=_job_meta(job_id, [idea_id], now),
+            )
+            pipe.expire(f"{REDIS_JOB_KEY_PREFIX}{job_id}", REDIS_JOB_TTL_SECONDS)
+            pipe.lpush(REDIS_QUEUE_KEY, json.dumps(job_data))
+            await pipe.execute()
 
         logger.info(f"Enqueued classification job {job_id} for idea {idea_id}")
         return job_id
@@ -131,59 +162,221 @@ class ClassificationWorker:
             idea_ids: List of idea IDs to classify.
             force: If True, reclassify even if already classified.
 
+        Jobs large enough for an LLM batch are queued as a single entry;
+        the worker taking it prepares and submits the batch.
+
         Returns:
             str: The batch job ID for tracking.
         """
         job_id = f"job-{uuid.uuid4().hex[:12]}"
-        now = datetime.now(timezone.utc)
-
-        # Store batch job metadata
-        job_meta = {
-            "job_id": job_id,
-            "status": ClassificationJobStatus.PENDING.value,
-            "total": len(idea_ids),
-            "completed": 0,
-            "failed": 0,
-            "idea_ids": idea_ids,
-            "results": [],
-            "created_at": now.isoformat(),
-        }
+        now = datetime.now(UTC)
 
-        await self._redis_client.set(
-            f"{REDIS_JOB_KEY_PREFIX}{job_id}",
-            json.dumps(job_meta),
+        use_llm_batch = (
+            self._batch_manager is not None
+            and len(idea_ids) >= self._batch_manager.config.min_items
         )
 
-        # Add each idea to queue with batch job reference
-        for idea_id in idea_ids:
-            job_data = {
-                "job_id": job_id,
-                "idea_id": idea_id,
-                "force": force,
-                "retry_count": 0,
-                "batch_job_id": job_id,
-                "queued_at": now.isoformat(),
-            }
-            await self._redis_client.lpush(REDIS_QUEUE_KEY, json.dumps(job_data))
+        # Store batch job metadata and queue the ideas in one round trip
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                f"{REDIS_JOB_KEY_PREFIX}{job_id}",
+                mapping=_job_meta(job_id, idea_ids, now),
+            )
+            pipe.expire(f"{REDIS_JOB_KEY_PREFIX}{job_id}", REDIS_JOB_TTL_SECONDS)
+            if use_llm_batch:
+                pipe.lpush(
+                    REDIS_QUEUE_KEY,
+                    json.dumps({
+                        "job_id": job_id,
+                        "idea_ids": idea_ids,
+                        "force": force,
+                        "llm_batch": True,
+                        "queued_at": now.isoformat(),
+                    }),
+                )
+            else:
+                self._queue_ideas(pipe, job_id, idea_ids, force, now)
+            await pipe.execute()
 
         logger.info(
             f"Enqueued batch classification job {job_id} for {len(idea_ids)} ideas"
         )
         return job_id
 
+    def _queue_ideas(
+        self,
+        pipe: Any,
+        job_id: str,
+        idea_ids: list[str],
+        force: bool,
+        now: datetime,
+    ) -> None:
+        """Add the ideas of a batch job to the queue in a pipeline.
+
+        Args:
+            pipe: Redis pipeline the push is added to.
+            job_id: The batch job ID.
+            idea_ids: The ideas to queue.
+            force: If True, reclassify even if already classified.
+            now: Time the job was created.
+        """
+        if not idea_ids:
+            return
+        pipe.lpush(
+            REDIS_QUEUE_KEY,
+            *(
+                json.dumps({
+                    "job_id": job_id,
+                    "idea_id": idea_id,
+                    "force": force,
+                    "retry_count": 0,
+                    "batch_job_id": job_id,
+                    "queued_at": now.isoformat(),
+                })
+                for idea_id in idea_ids
+            ),
+        )
+
+    async def _process_llm_batch_job(self, job_data: dict[str, Any]) -> None:
+        """Submit a queued batch job as an offline LLM batch.
+
+        Ideas that cannot go into the LLM batch, and all of them if this
+        worker has no batch manager, are queued one by one instead.
+
+        Args:
+            job_data: The job data from the queue.
+        """
+        job_id = job_data["job_id"]
+        idea_ids = job_data["idea_ids"]
+        force = job_data.get("force", False)
+
+        queued_ids = idea_ids
+        if self._batch_manager is not None:
+            queued_ids = await self._submit_llm_batch(
+                self._batch_manager, job_id, idea_ids, force
+            )
+        if queued_ids:
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                self._queue_ideas(
+                    pipe,
+                    job_id,
+                    queued_ids,
+                    force,
+                    datetime.fromisoformat(job_data["queued_at"]),
+                )
+                await pipe.execute()
+
+    async def _submit_llm_batch(
+        self,
+        batch_manager: LLMBatchManager,
+        job_id: str,
+        idea_ids: list[str],
+        force: bool,
+    ) -> list[str]:
+        """Submit the ideas of a batch job as an offline LLM batch.
+
+        Up to PREPARE_CONCURRENCY ideas are prepared at once. Ideas that
+        are already classified or missing are recorded on the job
+        immediately.
+
+        Args:
+            batch_manager: The LLM batch manager.
+            job_id: The batch job ID.
+            idea_ids: The ideas to classify.
+            force: If True, reclassify even if already classified.
+
+        Returns:
+            list[str]: Ideas to classify through the queue instead, because
+                the LLM batch could not be submitted.
+        """
+        slots = asyncio.Semaphore(PREPARE_CONCURRENCY)
+
+        async def prepare(idea_id: str) -> BatchRequest | None:
+            async with slots:
+                try:
+                    prepared = await self._classification_service.prepare_batch_request(
+                        idea_id,
+                        force=force,
+                        metadata={"job_id": job_id},
+                    )
+                except Exception as e:
+                    await self._mark_job_failed(job_id, idea_id, str(e))
+                    return None
+                if isinstance(prepared, ClassificationResult):
+                    await self._mark_job_success(job_id, idea_id, prepared)
+                    return None
+                return prepared
+
+        requests = [
+            request
+            for request in await asyncio.gather(*(prepare(i) for i in idea_ids))
+            if request is not None
+        ]
+        if not requests:
+            return []
+
+        try:
+            await batch_manager.submit(requests, handler=BATCH_RESULT_HANDLER)
+        except Exception as e:
+            logger.warning(
+                f"Could not submit LLM batch for job {job_id}, using the queue: {e}"
+            )
+            return [request.custom_id for request in requests]
+
+        await self._update_job_status(job_id, ClassificationJobStatus.PROCESSING)
+        logger.info(f"Submitted {len(requests)} ideas of job {job_id} as an LLM batch")
+        return []
+
+    async def _handle_batch_result(self, item: BatchItemResult) -> None:
+        """Record the classification of one idea from an LLM batch.
+
+        Args:
+            item: The batch result of the idea.
+        """
+        job_id = item.metadata["job_id"]
+        idea_id = item.metadata.get("idea_id", item.custom_id)
+        try:
+            result = await self._classification_service.complete_batch_result(item)
+        except Exception as e:
+            logger.error(f"Batch classification failed for {idea_id}: {e}")
+            await self._mark_job_failed(job_id, idea_id, str(e))
+            return
+        await self._mark_job_success(job_id, idea_id, result)
+
     async def get_job_status(self, job_id: str) -> dict[str, Any] | None:
         """Get the status of a classification job.
 
         Args:
             job_id: The job ID to check.
 
+        Jobs created before job hashes are read from their JSON string.
+
         Returns:
             dict | None: Job status data if found, None otherwise.
         """
-        data = await self._redis_client.get(f"{REDIS_JOB_KEY_PREFIX}{job_id}")
-        if data is None:
-            return None
-        return json.loads(data)
+        key = f"{REDIS_JOB_KEY_PREFIX}{job_id}"
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(key)
+            pipe.lrange(f"{key}{REDIS_JOB_RESULTS_SUFFIX}", 0, -1)
+            pipe.lrange(f"{key}{REDIS_JOB_ERRORS_SUFFIX}", 0, -1)
+            meta, results, errors = await pipe.execute()
+
+        if not meta:
+            legacy = await self._redis_client.get(f"{REDIS_LEGACY_JOB_KEY_PREFIX}{job_id}")
+            return json.loads(legacy) if legacy else None
+
+        meta = {_decode(k): _decode(v) for k, v in meta.items()}
+        return {
+            "job_id": meta["job_id"],
+            "status": meta["status"],
+            "total": int(meta["total"]),
+            "completed": int(meta.get("completed", 0)),
+            "failed": int(meta.get("failed", 0)),
+            "idea_ids": json.loads(meta.get("idea_ids", "[]")),
+            "created_at": meta.get("created_at"),
+            "results": [json.loads(r) for r in results],
+            "errors": [json.loads(e) for e in errors],
+        }
 
     async def start(self) -> None:
         """Start the worker.
@@ -192,12 +385,22 @@ class ClassificationWorker:
         """
         self._running = True
         logger.info("Classification worker started")
-        await self.process_queue()
+        if self._batch_manager is None:
+            await self.process_queue()
+            return
+
+        poller = asyncio.create_task(self._batch_manager.run())
+        try:
+            await self.process_queue()
+        finally:
+            poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await poller
 
     async def stop(self) -> None:
         """Stop the worker gracefully.
 
-        Allows the current job to complete before stopping.
+        Allows the jobs in progress to complete before stopping.
         """
         self._running = False
         logger.info("Classification worker stopping")
@@ -205,32 +408,118 @@ class ClassificationWorker:
     async def process_queue(self) -> None:
         """Process classification jobs from the queue.
 
-        Runs until _running is set to False or an unrecoverable error occurs.
+        Up to ``concurrency`` jobs, or groups of jobs in micro-batching
+        mode, run at once; a job is only taken from the queue when one of
+        them finishes. Runs until _running is set to False or an
+        unrecoverable error occurs, then waits for the jobs in progress.
         """
-        while self._running:
-            try:
-                # Wait for a job from the queue
-                result = await self._redis_client.brpop(
-                    REDIS_QUEUE_KEY,
-                    timeout=DEFAULT_TIMEOUT,
-                )
+        slots = asyncio.Semaphore(self._concurrency)
+        try:
+            while self._running:
+                await slots.acquire()
+                try:
+                    jobs = await self._next_jobs()
+                except asyncio.CancelledError:
+                    slots.release()
+                    logger.info("Classification worker cancelled")
+                    raise
+                except Exception as e:
+                    slots.release()
+                    logger.error(f"Error in classification worker: {e}")
+                    # Brief delay before retrying
+                    await asyncio.sleep(1)
+                    continue
 
-                if result is None:
+                if not jobs:
                     # Timeout, continue waiting
+                    slots.release()
                     continue
 
-                _, job_data_str = result
-                job_data = json.loads(job_data_str)
+                task = asyncio.create_task(self._process_jobs(jobs))
+                self._in_flight.add(task)
+                task.add_done_callback(lambda t: self._job_done(t, slots))
+        finally:
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def _next_jobs(self) -> list[dict[str, Any]]:
+        """Wait for the next job, and in micro-batching mode take more.
 
-                await self._process_job(job_data)
+        Returns:
+            list[dict]: Job data, empty if the wait timed out.
+        """
+        result = await self._redis_client.brpop(
+            REDIS_QUEUE_KEY,
+            timeout=DEFAULT_TIMEOUT,
+        )
+        if result is None:
+            return []
+
+        _, job_data_str = result
+        raw_jobs = [job_data_str]
+        if self._micro_batch_size > 1:
+            more = await self._redis_client.rpop(REDIS_QUEUE_KEY, self._micro_batch_size - 1)
+            raw_jobs.extend(more or [])
+        return [json.loads(raw) for raw in raw_jobs]
+
+    def _job_done(self, task: asyncio.Task[None], slots: asyncio.Semaphore) -> None:
+        """Release the slot of a finished job and log unexpected errors."""
+        self._in_flight.discard(task)
+        slots.release()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error in classification worker: {task.exception()}")
+
+    async def _process_jobs(self, jobs: list[dict[str, Any]]) -> None:
+        """Process jobs taken from the queue together.
+
+        Ideas with the same force flag are classified in one call to
+        ClassificationService.classify_ideas(). Ideas it returns no result
+        for, and every idea if it fails, are processed one by one.
 
-            except asyncio.CancelledError:
-                logger.info("Classification worker cancelled")
-                raise
+        Args:
+            jobs: Job data from the queue.
+        """
+        for job_data in jobs:
+            if job_data.get("llm_batch"):
+                await self._process_llm_batch_job(job_data)
+        jobs = [job_data for job_data in jobs if not job_data.get("llm_batch")]
+        if not jobs:
+            return
+
+        if len(jobs) == 1:
+            await self._process_job(jobs[0])
+            return
+
+        by_force: dict[bool, list[dict[str, Any]]] = {}
+        for job_data in jobs:
+            by_force.setdefault(job_data.get("force", False), []).append(job_data)
+
+        for force, group in by_force.items():
+            results: dict[str, ClassificationResult] = {}
+            try:
+                for job_id in {j.get("batch_job_id") or j["job_id"] for j in group}:
+                    await self._update_job_status(job_id, ClassificationJobStatus.PROCESSING)
+                results = await self._classification_service.classify_ideas(
+                    [j["idea_id"] for j in group],
+                    force=force,
+                    group_size=self._micro_batch_size,
+                )
             except Exception as e:
-                logger.error(f"Error in classification worker: {e}")
-                # Brief delay before retrying
-                await asyncio.sleep(1)
+                logger.warning(
+                    f"Grouped classification of {len(group)} ideas failed, "
+                    f"processing them one by one: {e}"
+                )
+
+            for job_data in group:
+                result = results.get(job_data["idea_id"])
+                if result is None:
+                    await self._process_job(job_data)
+                else:
+                    await self._mark_job_success(
+                        job_data.get("batch_job_id") or job_data["job_id"],
+                        job_data["idea_id"],
+                        result,
+                    )
 
     async def _process_job(self, job_data: dict[str, Any]) -> None:
         """Process a single classification job.
@@ -292,11 +581,8 @@ class ClassificationWorker:
             status: The new status.
         """
         key = f"{REDIS_JOB_KEY_PREFIX}{job_id}"
-        data = await self._redis_client.get(key)
-        if data:
-            job_meta = json.loads(data)
-            job_meta["status"] = status.value
-            await self._redis_client.set(key, json.dumps(job_meta))
+        if await self._redis_client.exists(key):
+            await self._redis_client.hset(key, "status", status.value)
 
     async def _mark_job_success(
         self,
@@ -311,25 +597,16 @@ class ClassificationWorker:
             idea_id: The idea ID that was classified.
             result: The classification result.
         """
-        key = f"{REDIS_JOB_KEY_PREFIX}{job_id}"
-        data = await self._redis_client.get(key)
-        if data:
-            job_meta = json.loads(data)
-            job_meta["completed"] = job_meta.get("completed", 0) + 1
-
-            # Store result for batch jobs
-            if "results" in job_meta:
-                job_meta["results"].append({
-                    "idea_id": idea_id,
-                    "classification": result.classification.value,
-                    "confidence": result.confidence,
-                })
-
-            # Check if job is complete
-            if job_meta["completed"] + job_meta.get("failed", 0) >= job_meta["total"]:
-                job_meta["status"] = ClassificationJobStatus.COMPLETED.value
-
-            await self._redis_client.set(key, json.dumps(job_meta))
+        await self._record_outcome(
+            job_id,
+            "completed",
+            REDIS_JOB_RESULTS_SUFFIX,
+            {
+                "idea_id": idea_id,
+                "classification": result.classification.value,
+                "confidence": result.confidence,
+            },
+        )
 
     async def _mark_job_failed(
         self,
@@ -344,28 +621,58 @@ class ClassificationWorker:
             idea_id: The idea ID that failed.
             error: The error message.
         """
-        key = f"{REDIS_JOB_KEY_PREFIX}{job_id}"
-        data = await self._redis_client.get(key)
-        if data:
-            job_meta = json.loads(data)
-            job_meta["failed"] = job_meta.get("failed", 0) + 1
-
-            # Store error for batch jobs
-            if "errors" not in job_meta:
-                job_meta["errors"] = []
-            job_meta["errors"].append({
+        await self._record_outcome(
+            job_id,
+            "failed",
+            REDIS_JOB_ERRORS_SUFFIX,
+            {
                 "idea_id": idea_id,
                 "error": error,
-            })
+            },
+        )
 
-            # Check if job is complete (all items processed, some failed)
-            if job_meta["completed"] + job_meta["failed"] >= job_meta["total"]:
-                if job_meta["failed"] == job_meta["total"]:
-                    job_meta["status"] = ClassificationJobStatus.FAILED.value
-                else:
-                    job_meta["status"] = ClassificationJobStatus.COMPLETED.value
+    async def _record_outcome(
+        self,
+        job_id: str,
+        counter: str,
+        list_suffix: str,
+        entry: dict[str, Any],
+    ) -> None:
+        """Count an idea's outcome on its job and set the final status.
+
+        The counter is incremented with HINCRBY in a transaction that also
+        reads the totals, so exactly one outcome sees the job finish. Each
+        outcome renews the expiry of the job and its list.
 
-            await self._redis_client.set(key, json.dumps(job_meta))
+        Args:
+            job_id: The job ID.
+            counter: "completed" or "failed".
+            list_suffix: Key suffix of the job's results or errors list.
+            entry: The result or error entry to record.
+        """
+        key = f"{REDIS_JOB_KEY_PREFIX}{job_id}"
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            pipe.hincrby(key, counter, 1)
+            pipe.rpush(f"{key}{list_suffix}", json.dumps(entry))
+            pipe.expire(key, REDIS_JOB_TTL_SECONDS)
+            pipe.expire(f"{key}{list_suffix}", REDIS_JOB_TTL_SECONDS)
+            pipe.hmget(key, "total", "completed", "failed")
+            *_, (total, completed, failed) = await pipe.execute()
+
+        if total is None:
+            # The job expired or never existed
+            await self._redis_client.delete(key, f"{key}{list_suffix}")
+            return
+
+        completed, failed = int(completed or 0), int(failed or 0)
+        if completed + failed == int(total):
+            # All items processed; failed only if none succeeded
+            status = (
+                ClassificationJobStatus.FAILED
+                if completed == 0
+                else ClassificationJobStatus.COMPLETED
+            )
+            await self._redis_client.hset(key, "status", status.value)
 
     def _should_retry(self, error: Exception) -> bool:
         """Determine if an error should trigger a retry.
@@ -409,6 +716,33 @@ class ClassificationWorker:
         await self._redis_client.lpush(REDIS_QUEUE_KEY, json.dumps(job_data))
 
 
+def _job_meta(job_id: str, idea_ids: list[str], now: datetime) -> dict[str, Any]:
+    """Build the Redis hash fields of a new job.
+
+    Args:
+        job_id: The job ID.
+        idea_ids: The ideas of the job.
+        now: Time the job was created.
+
+    Returns:
+        dict: Hash fields of the job.
+    """
+    return {
+        "job_id": job_id,
+        "status": ClassificationJobStatus.PENDING.value,
+        "total": len(idea_ids),
+        "completed": 0,
+        "failed": 0,
+        "idea_ids": json.dumps(idea_ids),
+        "created_at": now.isoformat(),
+    }
+
+
+def _decode(value: bytes | str) -> str:
+    """Decode a Redis value."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
 # Factory function for creating workers
 async def create_classification_worker(
     redis_url: str | None = None,
@@ -438,7 +772,32 @@ async def create_classification_worker(
 
     classification_service = get_classification_service()
 
+    from src.infrastructure.llm.batch import (
+        BatchConfig,
+        LLMBatchManager,
+        batch_provider_for,
+    )
+
+    batch_manager = None
+    batch_config = BatchConfig.from_env()
+    if batch_config.enabled:
+        from src.infrastructure.llm.factory import get_llm_client_factory
+        from src.orchestrator.api.models.llm_config import AgentRole
+
+        client = await get_llm_client_factory().get_client(AgentRole.DISCOVERY)
+        batch_manager = LLMBatchManager(
+            redis_client,
+            batch_provider_for(client),
+            namespace="classification",
+            config=batch_config,
+        )
+
     return ClassificationWorker(
         redis_client=redis_client,
         classification_service=classification_service,
+        batch_manager=batch_manager,
+        concurrency=int(
+            os.environ.get("CLASSIFICATION_WORKER_CONCURRENCY", str(DEFAULT_CONCURRENCY))
+        ),
+        micro_batch_size=int(os.environ.get("CLASSIFICATION_MICRO_BATCH_SIZE", "1")),
     )
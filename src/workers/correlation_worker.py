@@ -0,0 +1,210 @@
+"""Correlation Worker for background idea correlation.
+
+This module provides a worker that takes new ideas from a Redis queue and
+correlates them with the CorrelationService a batch at a time, so the
+embedding model and Elasticsearch see few large requests instead of one
+per idea.
+
+The worker also recomputes all correlations periodically. Every worker
+checks whether a recompute is due shortly after it starts and then on a
+short tick; a Redis lock held for the recompute interval lets only one
+worker recompute per interval. A failed recompute shortens the lock so
+it is retried soon instead of a full interval later.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+import redis.asyncio as redis
+
+if TYPE_CHECKING:
+    from src.orchestrator.services.correlation_service import CorrelationService
+
+
+logger = logging.getLogger(__name__)
+
+
+# Redis keys
+REDIS_QUEUE_KEY = "correlation:queue"
+REDIS_RECOMPUTE_LOCK_KEY = "correlation:recompute:lock"
+
+# Worker configuration
+DEFAULT_TIMEOUT = 30  # seconds to wait for queue item
+RECOMPUTE_CHECK_INTERVAL = 300  # seconds between checks whether a recompute is due
+RECOMPUTE_RETRY_DELAY = 900  # seconds before a failed recompute is retried
+
+
+class CorrelationWorker:
+    """Worker correlating queued ideas in batches.
+
+    Usage:
+        worker = CorrelationWorker(redis_client, correlation_service)
+
+        # Queue new ideas
+        await worker.enqueue(["idea-123", "idea-124"])
+
+        # Start processing (runs until stopped)
+        await worker.start()
+
+        # Stop gracefully
+        await worker.stop()
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        correlation_service: CorrelationService,
+        batch_size: int | None = None,
+        recompute_interval: float | None = None,
+    ) -> None:
+        """Initialize the correlation worker.
+
+        Args:
+            redis_client: Redis client for queue operations.
+            correlation_service: Service correlating the ideas.
+            batch_size: Most queued ideas correlated together. Defaults to
+                the service configuration.
+            recompute_interval: Seconds between full recomputes; 0
+                disables them. Defaults to the service configuration.
+        """
+        config = correlation_service.config
+        self._redis_client = redis_client
+        self._correlation_service = correlation_service
+        self._batch_size = max(1, batch_size or config.batch_size)
+        self._recompute_interval = (
+            config.recompute_interval_seconds
+            if recompute_interval is None
+            else recompute_interval
+        )
+        self._running = False
+
+    async def enqueue(self, idea_ids: list[str]) -> None:
+        """Queue ideas for correlation.
+
+        Args:
+            idea_ids: IDs of the ideas to correlate.
+        """
+        if idea_ids:
+            await self._redis_client.lpush(REDIS_QUEUE_KEY, *idea_ids)
+
+    async def start(self) -> None:
+        """Start the worker.
+
+        Processes the queue, and runs periodic recomputes if enabled,
+        until stop() is called.
+        """
+        self._running = True
+        logger.info("Correlation worker started")
+        if self._recompute_interval <= 0:
+            await self.process_queue()
+            return
+
+        recompute = asyncio.create_task(self._recompute_periodically())
+        try:
+            await self.process_queue()
+        finally:
+            recompute.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await recompute
+
+    async def stop(self) -> None:
+        """Stop the worker gracefully.
+
+        Lets the batch in progress complete before stopping.
+        """
+        self._running = False
+        logger.info("Correlation worker stopping")
+
+    async def process_queue(self) -> None:
+        """Correlate queued ideas a batch at a time.
+
+        Runs until _running is set to False. Failed batches are logged and
+        dropped; the next full recompute picks their ideas up.
+        """
+        while self._running:
+            try:
+                idea_ids = await self._next_batch()
+            except asyncio.CancelledError:
+                logger.info("Correlation worker cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Error in correlation worker: {e}")
+                # Brief delay before retrying
+                await asyncio.sleep(1)
+                continue
+
+            if not idea_ids:
+                # Timeout, continue waiting
+                continue
+
+            try:
+                await self._correlation_service.correlate_ideas(idea_ids)
+            except Exception as e:
+                logger.error(f"Failed to correlate {len(idea_ids)} ideas: {e}")
+
+    async def recompute(self) -> bool:
+        """Recompute all correlations unless another worker did recently.
+
+        The lock taken for the recompute interval is shortened to the
+        retry delay if the recompute fails.
+
+        Returns:
+            bool: True if this worker ran the recompute.
+        """
+        interval = max(1, int(self._recompute_interval))
+        acquired = await self._redis_client.set(
+            REDIS_RECOMPUTE_LOCK_KEY, "1", nx=True, ex=interval
+        )
+        if not acquired:
+            return False
+        try:
+            await self._correlation_service.recompute_all()
+        except BaseException:
+            with contextlib.suppress(Exception):
+                await self._redis_client.expire(
+                    REDIS_RECOMPUTE_LOCK_KEY, min(RECOMPUTE_RETRY_DELAY, interval)
+                )
+            raise
+        return True
+
+    async def _recompute_periodically(self) -> None:
+        """Check on a short tick whether a recompute is due and run it.
+
+        The recompute lock, not this loop, spaces recomputes by the
+        recompute interval, so a restarted worker catches up on a missed
+        recompute at once.
+        """
+        tick = min(RECOMPUTE_CHECK_INTERVAL, self._recompute_interval)
+        while True:
+            try:
+                await self.recompute()
+            except Exception as e:
+                logger.error(f"Correlation recompute failed: {e}")
+            await asyncio.sleep(tick)
+
+    async def _next_batch(self) -> list[str]:
+        """Wait for a queued idea, then take up to a batch of them.
+
+        Returns:
+            list[str]: Idea IDs, empty if the wait timed out.
+        """
+        result = await self._redis_client.brpop(REDIS_QUEUE_KEY, timeout=DEFAULT_TIMEOUT)
+        if result is None:
+            return []
+
+        _, idea_id = result
+        raw_ids = [idea_id]
+        if self._batch_size > 1:
+            more = await self._redis_client.rpop(REDIS_QUEUE_KEY, self._batch_size - 1)
+            raw_ids.extend(more or [])
+        # An idea queued twice is correlated once
+        return list(dict.fromkeys(_decode(raw) for raw in raw_ids))
+
+
+def _decode(value: bytes | str) -> str:
+    """Decode a Redis value to str."""
+    return value.decode() if isinstance(value, bytes) else value
@@ -32,6 +32,8 @@ from src.workers.agents.stub_agent import StubAgent
 from src.workers.config import get_worker_config
 from src.workers.pool.worker_pool import WorkerPool
 from src.workers.classification_worker import ClassificationWorker
+from src.workers.correlation_worker import CorrelationWorker
+from src.workers.repo_mapper.config import get_repo_mapper_config
 
 # Configure logging
 logging.basicConfig(
@@ -45,6 +47,7 @@ logger = logging.getLogger(__name__)
 _worker_pool: WorkerPool | None = None
 _health_server: HTTPServer | None = None
 _classification_worker: ClassificationWorker | None = None
+_correlation_worker: CorrelationWorker | None = None
 
 
 class HealthHandler(BaseHTTPRequestHandler):
@@ -218,7 +221,7 @@ async def _run_health_cache_updater(
 
 async def async_main() -> None:
     """Async main function that runs the worker pool."""
-    global _worker_pool, _health_server, _classification_worker
+    global _worker_pool, _health_server, _classification_worker, _correlation_worker
 
     logger.info("Starting aSDLC Workers Service")
 
@@ -257,12 +260,21 @@ async def async_main() -> None:
     # Create dispatcher with registered agents
     dispatcher = create_dispatcher()
 
+    # Agents get their context packs from the shared repo mapper service
+    repo_mapper_config = get_repo_mapper_config()
+    repo_mapper_client = None
+    if repo_mapper_config.service_enabled:
+        from src.workers.repo_mapper.service import RepoMapperClient
+
+        repo_mapper_client = RepoMapperClient(repo_mapper_config.service_socket_path)
+
     # Create worker pool
     _worker_pool = WorkerPool(
         redis_client=redis_client,
         config=worker_config,
         dispatcher=dispatcher,
         workspace_path=workspace_path,
+        repo_mapper_client=repo_mapper_client,
     )
 
     # Initialize health checker
@@ -323,10 +335,57 @@ async def async_main() -> None:
     except Exception as e:
         logger.error(f"Failed to start classification worker: {e}")
 
+    # Start correlation worker if the correlation engine is enabled
+    correlation_task = None
+    try:
+        from src.orchestrator.services.correlation_service import (
+            get_correlation_service,
+        )
+
+        correlation_service = get_correlation_service()
+        if correlation_service.config.enabled:
+            _correlation_worker = CorrelationWorker(
+                redis_client=redis_client,
+                correlation_service=correlation_service,
+            )
+            correlation_task = asyncio.create_task(
+                _correlation_worker.start(),
+                name="correlation-worker",
+            )
+            logger.info("Correlation worker started")
+    except Exception as e:
+        logger.error(f"Failed to start correlation worker: {e}")
+
+    # Start the shared repo mapper service if enabled
+    repo_mapper_task = None
+    if repo_mapper_config.service_enabled:
+        try:
+            from src.workers.repo_mapper.service import RepoMapperService
+
+            repo_mapper_service = RepoMapperService(repo_path=workspace_path)
+            repo_mapper_task = asyncio.create_task(
+                repo_mapper_service.serve_forever(),
+                name="repo-mapper-service",
+            )
+            logger.info(
+                f"Repo mapper service started on "
+                f"{repo_mapper_config.service_socket_path}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to start repo mapper service: {e}")
+
     # Run worker pool
     try:
         await run_worker_pool(_worker_pool)
     finally:
+        # Stop repo mapper service
+        if repo_mapper_task:
+            repo_mapper_task.cancel()
+            try:
+                await repo_mapper_task
+            except asyncio.CancelledError:
+                pass
+
         # Cancel health cache updater
         health_cache_task.cancel()
         try:
@@ -343,10 +402,19 @@ async def async_main() -> None:
             except asyncio.CancelledError:
                 pass
 
+        # Stop correlation worker
+        if correlation_task and _correlation_worker:
+            await _correlation_worker.stop()
+            correlation_task.cancel()
+            try:
+                await correlation_task
+            except asyncio.CancelledError:
+                pass
+
 
 def handle_shutdown(signum: int, frame: Any) -> None:
     """Handle shutdown signals."""
-    global _worker_pool, _health_server, _classification_worker
+    global _worker_pool, _health_server, _classification_worker, _correlation_worker
 
     logger.info(f"Received signal {signum}, shutting down...")
 
@@ -360,6 +428,12 @@ def handle_shutdown(signum: int, frame: Any) -> None:
         if loop.is_running():
             asyncio.create_task(_classification_worker.stop())
 
+    # Stop correlation worker
+    if _correlation_worker:
+        loop = asyncio.get_event_loop()
+        if loop.is_running():
+            asyncio.create_task(_correlation_worker.stop())
+
     # Stop worker pool (needs to be done in the event loop)
     if _worker_pool:
         # Create a task to stop the pool
@@ -10,17 +10,22 @@ import asyncio
 import logging
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import redis.asyncio as redis
 
 from src.core.events import ASDLCEvent, EventType
+from src.core.exceptions import RepoMapperError
+from src.infrastructure.llm.instrumentation import llm_call_context
 from src.workers.agents.dispatcher import AgentDispatcher, AgentNotFoundError
 from src.workers.agents.protocols import AgentContext, AgentResult
 from src.workers.config import WorkerConfig
 from src.workers.pool.event_consumer import EventConsumer
 from src.workers.pool.idempotency import WorkerIdempotencyTracker
 
+if TYPE_CHECKING:
+    from src.workers.repo_mapper.service import RepoMapperClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +67,7 @@ class WorkerPool:
         dispatcher: AgentDispatcher,
         workspace_path: str,
         tenant_id: str | None = None,
+        repo_mapper_client: RepoMapperClient | None = None,
     ) -> None:
         """Initialize the worker pool.
 
@@ -71,12 +77,16 @@ class WorkerPool:
             dispatcher: Agent dispatcher for routing events.
             workspace_path: Path to the workspace directory.
             tenant_id: Optional tenant ID for multi-tenancy.
+            repo_mapper_client: Optional client of the repo mapper service,
+                used to attach a context pack to events that carry a
+                task_description.
         """
         self._redis = redis_client
         self._config = config
         self._dispatcher = dispatcher
         self._workspace_path = workspace_path
         self._tenant_id = tenant_id
+        self._repo_mapper_client = repo_mapper_client
 
         # Components
         self._consumer = EventConsumer(
@@ -237,10 +247,12 @@ class WorkerPool:
                     "epic_id": event.epic_id,
                     "mode": event.mode,
                 },
+                context_pack=await self._load_context_pack(event),
             )
 
-            # Dispatch to agent
-            result = await self._dispatcher.dispatch(event, context)
+            # Dispatch to agent, tagging its LLM calls with the task and session
+            with llm_call_context(task_id=context.task_id, session_id=context.session_id):
+                result = await self._dispatcher.dispatch(event, context)
 
             # Update metrics
             self._events_processed += 1
@@ -269,6 +281,36 @@ class WorkerPool:
             await self._publish_error(event, str(e))
             await self._consumer.acknowledge(event.event_id)
 
+    async def _load_context_pack(self, event: ASDLCEvent) -> dict[str, Any] | None:
+        """Request a context pack for an event from the repo mapper service.
+
+        Args:
+            event: The AGENT_STARTED event being processed.
+
+        Returns:
+            dict | None: The context pack, or None if the event has no task
+                description or the service cannot provide one.
+        """
+        task_description = event.metadata.get("task_description")
+        if self._repo_mapper_client is None or not task_description:
+            return None
+
+        try:
+            pack = await self._repo_mapper_client.generate_context_pack(
+                task_description=task_description,
+                target_files=event.metadata.get("target_files"),
+            )
+            return pack.to_dict()
+        except RepoMapperError as e:
+            logger.warning(f"No context pack for event {event.event_id}: {e}")
+        except Exception as e:
+            # The pack is optional; never hold back the dispatch for it
+            logger.warning(
+                f"Failed to load context pack for event {event.event_id}: {e}",
+                exc_info=True,
+            )
+        return None
+
     async def _publish_result(
         self,
         original_event: ASDLCEvent,
@@ -19,6 +19,9 @@ class RepoMapperConfig:
         max_dependency_depth: Maximum depth for dependency tracing
         min_relevance_score: Minimum relevance score to include content
         repo_path: Path to the repository being analyzed
+        service_enabled: Run the long-lived repo mapper service in the worker
+        service_socket_path: Unix socket the repo mapper service listens on
+        watch_interval: Seconds between workspace change scans
     """
 
     context_pack_dir: Path
@@ -27,6 +30,9 @@ class RepoMapperConfig:
     max_dependency_depth: int
     min_relevance_score: float
     repo_path: Path
+    service_enabled: bool = False
+    service_socket_path: str = "/tmp/asdlc-repo-mapper.sock"
+    watch_interval: float = 1.0
 
     @classmethod
     def from_env(cls) -> RepoMapperConfig:
@@ -42,6 +48,9 @@ class RepoMapperConfig:
             MAX_DEPENDENCY_DEPTH: Max dependency depth (default: 3)
             MIN_RELEVANCE_SCORE: Min relevance score (default: 0.2)
             REPO_PATH: Repository path (default: current directory)
+            REPO_MAPPER_SERVICE_ENABLED: Run the repo mapper service (default: false)
+            REPO_MAPPER_SOCKET: Service socket path (default: /tmp/asdlc-repo-mapper.sock)
+            REPO_MAPPER_WATCH_INTERVAL: Change scan interval in seconds (default: 1.0)
         """
         return cls(
             context_pack_dir=Path(
@@ -52,6 +61,13 @@ class RepoMapperConfig:
             max_dependency_depth=int(os.getenv("MAX_DEPENDENCY_DEPTH", "3")),
             min_relevance_score=float(os.getenv("MIN_RELEVANCE_SCORE", "0.2")),
             repo_path=Path(os.getenv("REPO_PATH", ".")),
+            service_enabled=os.getenv(
+                "REPO_MAPPER_SERVICE_ENABLED", "false"
+            ).lower() == "true",
+            service_socket_path=os.getenv(
+                "REPO_MAPPER_SOCKET", "/tmp/asdlc-repo-mapper.sock"
+            ),
+            watch_interval=float(os.getenv("REPO_MAPPER_WATCH_INTERVAL", "1.0")),
         )
 
     def __post_init__(self) -> None:
@@ -68,6 +84,9 @@ class RepoMapperConfig:
         if not 0 <= self.min_relevance_score <= 1:
             raise ValueError("min_relevance_score must be between 0 and 1")
 
+        if self.watch_interval <= 0:
+            raise ValueError("watch_interval must be positive")
+
 
 @lru_cache(maxsize=1)
 def get_repo_mapper_config() -> RepoMapperConfig:
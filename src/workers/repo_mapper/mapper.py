@@ -59,6 +59,7 @@ class RepoMapper:
         )
         self.token_counter = TokenCounter()
         self.symbol_extractor = SymbolExtractor()
+        self._ast_context: Optional[ASTContext] = None
 
         logger.info(f"RepoMapper initialized for {self.repo_path}")
 
@@ -198,6 +199,7 @@ class RepoMapper:
 
             # Cache it
             self.cache.save(ast_context)
+            self._ast_context = ast_context
 
             logger.info("AST context refreshed successfully")
             return ast_context
@@ -206,6 +208,82 @@ class RepoMapper:
             logger.error(f"Failed to refresh AST context: {e}")
             raise RepoMapperError(f"AST context refresh failed: {e}") from e
 
+    def update_files(
+        self,
+        changed_files: list[str],
+        removed_files: Optional[list[str]] = None,
+    ) -> ASTContext:
+        """Incrementally update the in-memory AST context.
+
+        Only the changed files are re-parsed; the dependency graph is rebuilt
+        from the already parsed files, which is cheap compared to parsing.
+        The on-disk cache is not rewritten (call ``persist_ast_context``).
+
+        Args:
+            changed_files: Absolute paths of files that were added or modified
+            removed_files: Absolute paths of files that were deleted
+
+        Returns:
+            The updated ASTContext
+
+        Raises:
+            RepoMapperError: If the update fails
+        """
+        try:
+            ast_context = self._get_or_build_ast_context()
+            registry = ParserRegistry.default()
+
+            for file_path in removed_files or []:
+                ast_context.files.pop(file_path, None)
+
+            for file_path in changed_files:
+                parser = registry.get_parser_for_file(file_path)
+                if parser is None:
+                    continue
+                try:
+                    ast_context.files[file_path] = parser.parse_file(file_path)
+                except (SyntaxError, IOError, OSError) as e:
+                    logger.debug(f"Skipping {file_path}: {e}")
+                    ast_context.files.pop(file_path, None)
+
+            dep_graph = DependencyGraph()
+            for parsed_file in ast_context.files.values():
+                dep_graph.add_file(parsed_file)
+
+            ast_context.dependency_graph = dep_graph.to_dict()
+            ast_context.token_estimate = sum(
+                self.token_counter.count_parsed_file(pf)
+                for pf in ast_context.files.values()
+            )
+            ast_context.git_sha = self._get_git_sha()
+
+            logger.debug(
+                f"AST context updated: {len(changed_files)} changed, "
+                f"{len(removed_files or [])} removed"
+            )
+            return ast_context
+
+        except Exception as e:
+            logger.error(f"Failed to update AST context: {e}")
+            raise RepoMapperError(f"AST context update failed: {e}") from e
+
+    def persist_ast_context(self) -> None:
+        """Write the in-memory AST context to the on-disk cache."""
+        if self._ast_context is not None:
+            self.cache.save(self._ast_context)
+
+    def list_source_files(self) -> list[Path]:
+        """List repository files that have a registered parser.
+
+        Returns:
+            Paths of all parseable files under the repository root
+        """
+        registry = ParserRegistry.default()
+        files: list[Path] = []
+        for ext in set(registry.list_supported_extensions()):
+            files.extend(self.repo_path.rglob(f"*{ext}"))
+        return files
+
     def save_context_pack(self, context_pack: ContextPack, output_path: str) -> None:
         """Save a context pack to a JSON file.
 
@@ -237,11 +315,16 @@ class RepoMapper:
         Returns:
             ASTContext instance
         """
+        # Reuse the context already held by this instance
+        if self._ast_context is not None:
+            return self._ast_context
+
         # Try to get from cache
         cached = self.cache.get(str(self.repo_path), validate_sha=False)
 
         if cached is not None:
             logger.debug("Using cached AST context")
+            self._ast_context = cached
             return cached
 
         logger.debug("Building new AST context")
@@ -249,6 +332,7 @@ class RepoMapper:
 
         # Save to cache
         self.cache.save(ast_context)
+        self._ast_context = ast_context
 
         return ast_context
 
@@ -265,11 +349,7 @@ class RepoMapper:
         dep_graph = DependencyGraph()
 
         # Find all supported files
-        supported_extensions = set(registry.list_supported_extensions())
-
-        files_to_parse = []
-        for ext in supported_extensions:
-            files_to_parse.extend(self.repo_path.rglob(f"*{ext}"))
+        files_to_parse = self.list_source_files()
 
         logger.info(f"Parsing {len(files_to_parse)} files")
 
@@ -0,0 +1,439 @@
+"""Long-lived Repo Mapper service.
+
+Holds a warm, in-memory AST context for one workspace, keeps it current by
+scanning the workspace for changed files, and answers context pack requests
+over a local Unix socket. Agents on the same workspace share one index
+instead of each loading or rebuilding the AST context.
+
+Protocol: one JSON object per line in each direction.
+
+    request:  {"method": "generate_context_pack", "params": {...}}
+    response: {"result": {...}} or {"error": "message"}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from src.core.exceptions import RepoMapperError
+from src.core.models import AgentRole, ContextPack
+from src.workers.repo_mapper.config import get_repo_mapper_config
+from src.workers.repo_mapper.mapper import RepoMapper
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single request or response line
+_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+class WorkspaceWatcher:
+    """Detects changed source files by comparing stat snapshots.
+
+    Tracks (mtime_ns, size) for every parseable file in the repository and
+    reports the files added, modified or removed since the previous scan.
+
+    Attributes:
+        mapper: RepoMapper whose source files are watched
+    """
+
+    def __init__(self, mapper: RepoMapper) -> None:
+        """Initialize the watcher.
+
+        Args:
+            mapper: RepoMapper whose source files are watched
+        """
+        self.mapper = mapper
+        self._snapshot: dict[str, tuple[int, int]] = {}
+
+    def snapshot(self) -> dict[str, tuple[int, int]]:
+        """Take a stat snapshot of all source files.
+
+        Returns:
+            Mapping of absolute file path to (mtime_ns, size)
+        """
+        result: dict[str, tuple[int, int]] = {}
+        for path in self.mapper.list_source_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            result[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return result
+
+    def prime(self) -> dict[str, tuple[int, int]]:
+        """Record the current state without reporting changes.
+
+        Returns:
+            The recorded snapshot
+        """
+        self._snapshot = self.snapshot()
+        return self._snapshot
+
+    def poll(self) -> tuple[list[str], list[str]]:
+        """Scan the workspace and report changes since the last scan.
+
+        Returns:
+            Tuple of (changed_files, removed_files)
+        """
+        return self.apply(self.snapshot())
+
+    def apply(
+        self, current: dict[str, tuple[int, int]]
+    ) -> tuple[list[str], list[str]]:
+        """Record a snapshot and report changes since the previous one.
+
+        Args:
+            current: Snapshot taken with snapshot()
+
+        Returns:
+            Tuple of (changed_files, removed_files)
+        """
+        changed = [
+            path for path, sig in current.items() if self._snapshot.get(path) != sig
+        ]
+        removed = [path for path in self._snapshot if path not in current]
+        self._snapshot = current
+        return changed, removed
+
+
+class RepoMapperService:
+    """Serves context packs from a warm in-memory AST context.
+
+    Attributes:
+        mapper: RepoMapper holding the AST context
+        watcher: Workspace change detector
+        socket_path: Unix socket path the service listens on
+        watch_interval: Seconds between workspace scans; requests arriving
+            within this interval of the last scan reuse it
+    """
+
+    def __init__(
+        self,
+        repo_path: str,
+        socket_path: str | None = None,
+        watch_interval: float | None = None,
+        cache_dir: str | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            repo_path: Path to the repository root
+            socket_path: Unix socket path (defaults to config value)
+            watch_interval: Scan interval in seconds (defaults to config value)
+            cache_dir: Optional AST cache directory passed to RepoMapper
+        """
+        config = get_repo_mapper_config()
+        self.mapper = RepoMapper(repo_path=repo_path, cache_dir=cache_dir)
+        self.watcher = WorkspaceWatcher(self.mapper)
+        self.socket_path = socket_path or config.service_socket_path
+        self.watch_interval = watch_interval or config.watch_interval
+
+        self._lock = asyncio.Lock()
+        self._scan_lock = asyncio.Lock()
+        self._last_scan = 0.0
+        self._server: asyncio.AbstractServer | None = None
+        self._watch_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Load the AST context, start the watcher and open the socket."""
+        async with self._lock:
+            await asyncio.to_thread(self._warm)
+
+        socket_file = Path(self.socket_path)
+        socket_file.parent.mkdir(parents=True, exist_ok=True)
+        socket_file.unlink(missing_ok=True)
+
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection,
+            path=self.socket_path,
+            limit=_MAX_MESSAGE_BYTES,
+        )
+        self._watch_task = asyncio.create_task(
+            self._watch_loop(), name="repo-mapper-watch"
+        )
+        logger.info(
+            f"Repo mapper service for {self.mapper.repo_path} "
+            f"listening on {self.socket_path}"
+        )
+
+    async def stop(self) -> None:
+        """Stop serving and persist the AST context."""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        Path(self.socket_path).unlink(missing_ok=True)
+
+        async with self._lock:
+            await asyncio.to_thread(self.mapper.persist_ast_context)
+        logger.info("Repo mapper service stopped")
+
+    async def serve_forever(self) -> None:
+        """Start the service and run until cancelled."""
+        await self.start()
+        try:
+            assert self._server is not None
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def sync(self, max_age: float = 0.0) -> tuple[list[str], list[str]]:
+        """Scan for workspace changes and re-parse changed files.
+
+        The stat scan runs in a thread without holding the mapper lock, so
+        requests are only held up while changed files are re-parsed.
+
+        Args:
+            max_age: Skip the scan if the last one finished less than this
+                many seconds ago
+
+        Returns:
+            Tuple of (changed_files, removed_files) that were applied
+        """
+        async with self._scan_lock:
+            if time.monotonic() - self._last_scan < max_age:
+                return [], []
+            current = await asyncio.to_thread(self.watcher.snapshot)
+            async with self._lock:
+                result = await asyncio.to_thread(self._sync, current)
+            self._last_scan = time.monotonic()
+            return result
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one protocol request.
+
+        Args:
+            request: Decoded request with ``method`` and optional ``params``
+
+        Returns:
+            Response dictionary with ``result`` or ``error``
+        """
+        method = request.get("method")
+        params = request.get("params") or {}
+
+        try:
+            if method == "ping":
+                return {"result": {"repo_path": str(self.mapper.repo_path)}}
+
+            if method == "generate_context_pack":
+                # Pick up edits made since the last scan before answering,
+                # unless the watcher has just scanned
+                await self.sync(max_age=self.watch_interval)
+                async with self._lock:
+                    pack = await asyncio.to_thread(
+                        self._generate_context_pack, params
+                    )
+                return {"result": pack.to_dict()}
+
+            if method == "refresh":
+                async with self._lock:
+                    files = await asyncio.to_thread(self._warm, True)
+                return {"result": {"files": files}}
+
+            return {"error": f"Unknown method: {method}"}
+
+        except (RepoMapperError, KeyError, ValueError, TypeError) as e:
+            return {"error": str(e)}
+
+    def _warm(self, force: bool = False) -> int:
+        """Load or rebuild the AST context and prime the watcher.
+
+        Returns:
+            Number of source files being watched
+        """
+        current = self.watcher.prime()
+        self._last_scan = time.monotonic()
+        if force:
+            self.mapper.refresh_ast_context()
+            return len(current)
+
+        # The cached context may predate edits; reconcile once on startup
+        ast_context = self.mapper._get_or_build_ast_context()
+        stale = [
+            path
+            for path, (mtime_ns, _) in current.items()
+            if path not in ast_context.files
+            or mtime_ns > ast_context.created_at.timestamp() * 1e9
+        ]
+        removed = [path for path in ast_context.files if path not in current]
+        if stale or removed:
+            self.mapper.update_files(stale, removed)
+        return len(current)
+
+    def _sync(
+        self, current: dict[str, tuple[int, int]]
+    ) -> tuple[list[str], list[str]]:
+        """Apply workspace changes to the AST context (runs in a thread)."""
+        changed, removed = self.watcher.apply(current)
+        if changed or removed:
+            self.mapper.update_files(changed, removed)
+            logger.debug(
+                f"Re-parsed {len(changed)} changed files, dropped {len(removed)}"
+            )
+        return changed, removed
+
+    def _generate_context_pack(self, params: dict[str, Any]) -> ContextPack:
+        """Build a context pack from request parameters (runs in a thread)."""
+        return self.mapper.generate_context_pack(
+            task_description=params["task_description"],
+            target_files=params.get("target_files"),
+            role=AgentRole(params.get("role", AgentRole.CODING.value)),
+            token_budget=params.get("token_budget", 100_000),
+            include_dependencies=params.get("include_dependencies", True),
+            dependency_depth=params.get("dependency_depth", 2),
+        )
+
+    async def _watch_loop(self) -> None:
+        """Periodically apply workspace changes until cancelled."""
+        while True:
+            await asyncio.sleep(self.watch_interval)
+            try:
+                # A request may have scanned while we slept
+                await self.sync(max_age=self.watch_interval / 2)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Workspace scan failed: {e}")
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve newline-delimited JSON requests on one connection."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    response: dict[str, Any] = {"error": f"Invalid request: {e}"}
+                else:
+                    response = await self.handle_request(request)
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            logger.error(f"Repo mapper connection error: {e}")
+        finally:
+            writer.close()
+
+
+class RepoMapperClient:
+    """Client for a running RepoMapperService.
+
+    Attributes:
+        socket_path: Unix socket path of the service
+    """
+
+    def __init__(self, socket_path: str | None = None) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Unix socket path (defaults to config value)
+        """
+        self.socket_path = socket_path or get_repo_mapper_config().service_socket_path
+
+    def is_available(self) -> bool:
+        """Check whether the service socket exists.
+
+        Returns:
+            True if a service socket is present
+        """
+        return os.path.exists(self.socket_path)
+
+    async def ping(self) -> dict[str, Any]:
+        """Check that the service is responding.
+
+        Returns:
+            Service info including the served repo_path
+        """
+        return await self._call("ping", {})
+
+    async def generate_context_pack(
+        self,
+        task_description: str,
+        target_files: list[str] | None = None,
+        role: AgentRole = AgentRole.CODING,
+        token_budget: int = 100_000,
+        include_dependencies: bool = True,
+        dependency_depth: int = 2,
+    ) -> ContextPack:
+        """Request a context pack from the service.
+
+        Arguments match RepoMapper.generate_context_pack.
+
+        Returns:
+            ContextPack built from the service's warm index
+
+        Raises:
+            RepoMapperError: If the service is unreachable or returns an error
+        """
+        result = await self._call(
+            "generate_context_pack",
+            {
+                "task_description": task_description,
+                "target_files": target_files,
+                "role": role.value if isinstance(role, AgentRole) else role,
+                "token_budget": token_budget,
+                "include_dependencies": include_dependencies,
+                "dependency_depth": dependency_depth,
+            },
+        )
+        return ContextPack.from_dict(result)
+
+    async def _call(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send one request and wait for its response.
+
+        Raises:
+            RepoMapperError: If the service is unreachable, drops the
+                connection, or answers with an error or invalid response.
+        """
+        try:
+            reader, writer = await asyncio.open_unix_connection(
+                self.socket_path, limit=_MAX_MESSAGE_BYTES
+            )
+        except OSError as e:
+            raise RepoMapperError(f"Repo mapper service unavailable: {e}") from e
+
+        try:
+            request = {"method": method, "params": params}
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            line = await reader.readline()
+        except (OSError, asyncio.LimitOverrunError, ValueError) as e:
+            # Connection reset mid-exchange, or a response over the limit
+            raise RepoMapperError(f"Repo mapper request failed: {e}") from e
+        finally:
+            writer.close()
+
+        if not line:
+            raise RepoMapperError("Repo mapper service closed the connection")
+
+        try:
+            response = json.loads(line)
+        except ValueError as e:
+            raise RepoMapperError(f"Invalid repo mapper response: {e}") from e
+        if not isinstance(response, dict) or not ("error" in response or "result" in response):
+            raise RepoMapperError("Invalid repo mapper response")
+        if "error" in response:
+            raise RepoMapperError(response["error"])
+        return response["result"]
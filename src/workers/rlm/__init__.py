@@ -9,7 +9,12 @@ from __future__ import annotations
 from src.workers.rlm.agent import AgentIteration, RLMAgent
 from src.workers.rlm.audit import AuditEntry, RLMAuditor
 from src.workers.rlm.budget_manager import BudgetSnapshot, SubCallBudgetManager
-from src.workers.rlm.cache import CacheEntry, CacheStats, SubCallCache
+from src.workers.rlm.cache import (
+    CacheEntry,
+    CacheStats,
+    RedisSubCallCacheTier,
+    SubCallCache,
+)
 from src.workers.rlm.config import RLMConfig
 from src.workers.rlm.integration import RLMIntegration, RLMIntegrationResult
 from src.workers.rlm.orchestrator import RLMOrchestrator
@@ -38,6 +43,7 @@ __all__ = [
     # Cache
     "CacheEntry",
     "CacheStats",
+    "RedisSubCallCacheTier",
     "SubCallCache",
     # Config
     "RLMConfig",
@@ -6,6 +6,7 @@ using tool calls and LLM reasoning.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -14,6 +15,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, TYPE_CHECKING
 
+from src.workers.rlm.cache import CacheStats
+from src.workers.rlm.llm_adapter import create_message
 from src.workers.rlm.models import (
     ExplorationStep,
     Finding,
@@ -73,6 +76,26 @@ If you have gathered enough information and want to conclude, set next_direction
 - Cite file paths and line numbers when referencing code
 """
 
+# Appended to the system prompt when the orchestrator can fan out
+SPAWN_INSTRUCTIONS = """
+## Parallel Sub-Explorations
+
+If the query splits into independent sub-questions (for example "where is X
+constructed" and "what calls Y"), you may delegate them. Each sub-question is
+explored concurrently by its own agent and its findings are added to yours
+before your next step:
+
+<spawn>
+[
+  {{"query": "Where is X constructed?", "context_hints": ["src/x/"]}},
+  {{"query": "What calls Y?"}}
+]
+</spawn>
+
+Spawn at most {max_spawn} sub-questions at a time, only for work that does not
+depend on other sub-questions.
+"""
+
 
 @dataclass
 class AgentIteration:
@@ -85,6 +108,8 @@ class AgentIteration:
         next_direction: Planned next direction
         raw_response: Raw LLM response
         is_done: Whether agent signaled completion
+        spawn: Sub-explorations requested, as dicts with ``query`` and
+            optional ``context_hints``
     """
 
     thought: str
@@ -93,6 +118,7 @@ class AgentIteration:
     next_direction: str
     raw_response: str
     is_done: bool
+    spawn: list[dict[str, Any]] = field(default_factory=list)
 
     def to_exploration_step(self, iteration: int, subcalls_used: int) -> ExplorationStep:
         """Convert to ExplorationStep model."""
@@ -126,10 +152,13 @@ class RLMAgent:
     and tool calls.
 
     Attributes:
-        client: Anthropic client for LLM calls
+        client: BaseLLMClient or Anthropic SDK client for LLM calls
         tool_surface: REPLToolSurface for tool execution
         model: Model to use for exploration
         max_tokens: Maximum tokens per response
+        max_concurrent_tools: Maximum tool calls executed at once per iteration
+        max_spawn: Sub-explorations the agent may request per iteration
+            (0 = spawn directive not offered)
 
     Example:
         agent = RLMAgent(
@@ -138,21 +167,23 @@ class RLMAgent:
             model="claude-sonnet-4-20250514",
         )
 
-        iteration = agent.run_iteration(
+        iteration = await agent.run_iteration(
             query="How does the authentication work?",
             context="Looking at auth module",
             history=[],
         )
     """
 
-    client: Any  # Anthropic client
+    client: Any  # BaseLLMClient or Anthropic client
     tool_surface: REPLToolSurface
     model: str = "claude-sonnet-4-20250514"
     max_tokens: int = 4096
+    max_concurrent_tools: int = 8
+    max_spawn: int = 0
     _total_iterations: int = field(default=0, init=False)
     _total_tokens: int = field(default=0, init=False)
 
-    def run_iteration(
+    async def run_iteration(
         self,
         query: str,
         context: str = "",
@@ -185,13 +216,13 @@ class RLMAgent:
         )
 
         # Call the LLM
-        response = self._call_llm(system_prompt, user_message)
+        response = await self._call_llm(system_prompt, user_message)
 
         # Parse the response
         iteration = self._parse_response(response)
 
         # Execute tool calls
-        iteration = self._execute_tool_calls(iteration)
+        iteration = await self._execute_tool_calls(iteration)
 
         duration_ms = (time.perf_counter() - start_time) * 1000
         logger.debug(
@@ -211,7 +242,10 @@ class RLMAgent:
             f"- {name}: {desc}" for name, desc in tool_descriptions.items()
         )
 
-        return EXPLORATION_SYSTEM_PROMPT.format(tool_descriptions=tool_desc_text)
+        prompt = EXPLORATION_SYSTEM_PROMPT.format(tool_descriptions=tool_desc_text)
+        if self.max_spawn > 0:
+            prompt += SPAWN_INSTRUCTIONS.format(max_spawn=self.max_spawn)
+        return prompt
 
     def _build_user_message(
         self,
@@ -260,30 +294,20 @@ class RLMAgent:
             )
         return "\n".join(summaries)
 
-    def _call_llm(self, system_prompt: str, user_message: str) -> str:
+    async def _call_llm(self, system_prompt: str, user_message: str) -> str:
         """Call the LLM and return the response."""
-        response = self.client.messages.create(
+        result = await create_message(
+            self.client,
             model=self.model,
             max_tokens=self.max_tokens,
             system=system_prompt,
-            messages=[{"role": "user", "content": user_message}],
+            user_content=user_message,
         )
 
         # Track tokens
-        if hasattr(response, "usage"):
-            self._total_tokens += (
-                getattr(response.usage, "input_tokens", 0)
-                + getattr(response.usage, "output_tokens", 0)
-            )
+        self._total_tokens += result.tokens_used
 
-        # Extract text
-        response_text = ""
-        if response.content:
-            for block in response.content:
-                if hasattr(block, "text"):
-                    response_text += block.text
-
-        return response_text
+        return result.text
 
     def _parse_response(self, response: str) -> AgentIteration:
         """Parse LLM response into structured format."""
@@ -315,6 +339,10 @@ class RLMAgent:
         # Check if done
         is_done = next_direction.strip().upper() == "DONE"
 
+        spawn: list[dict[str, Any]] = []
+        if self.max_spawn > 0:
+            spawn = self._parse_spawn(self._extract_tag(response, "spawn"))
+
         return AgentIteration(
             thought=thought,
             tool_calls=tool_calls,
@@ -322,8 +350,37 @@ class RLMAgent:
             next_direction=next_direction,
             raw_response=response,
             is_done=is_done,
+            spawn=spawn,
         )
 
+    def _parse_spawn(self, spawn_json: str) -> list[dict[str, Any]]:
+        """Parse a spawn directive into sub-exploration requests."""
+        if not spawn_json:
+            return []
+
+        try:
+            parsed = json.loads(spawn_json)
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse spawn JSON: {spawn_json[:100]}")
+            return []
+
+        if not isinstance(parsed, list):
+            return []
+
+        requests: list[dict[str, Any]] = []
+        for item in parsed:
+            if isinstance(item, str):
+                item = {"query": item}
+            if not isinstance(item, dict) or not item.get("query"):
+                continue
+            hints = item.get("context_hints") or []
+            requests.append({
+                "query": str(item["query"]),
+                "context_hints": [str(h) for h in hints] if isinstance(hints, list) else [],
+            })
+
+        return requests[: self.max_spawn]
+
     def _extract_tag(self, text: str, tag: str) -> str:
         """Extract content between XML-style tags."""
         pattern = rf"<{tag}>(.*?)</{tag}>"
@@ -332,33 +389,43 @@ class RLMAgent:
             return match.group(1).strip()
         return ""
 
-    def _execute_tool_calls(self, iteration: AgentIteration) -> AgentIteration:
-        """Execute tool calls and add results."""
-        executed_calls = []
+    async def _execute_tool_calls(self, iteration: AgentIteration) -> AgentIteration:
+        """Execute tool calls concurrently and add results.
+
+        Tool calls within one iteration are independent, so they run
+        concurrently (bounded by max_concurrent_tools). Results keep the
+        order in which the agent requested them.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_tools)
 
-        for tc in iteration.tool_calls:
+        async def execute(tc: dict[str, Any]) -> dict[str, Any]:
             tool_name = tc.get("tool", "")
             args = tc.get("args", {})
 
-            start_time = time.perf_counter()
-            result, error = self.tool_surface.invoke_safe(tool_name, **args)
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            async with semaphore:
+                start_time = time.perf_counter()
+                result, error = await self.tool_surface.ainvoke_safe(tool_name, **args)
+                duration_ms = (time.perf_counter() - start_time) * 1000
 
             if error:
                 result_str = f"Error: {error}"
             else:
                 result_str = self._format_tool_result(result)
 
-            executed_calls.append({
+            return {
                 "tool": tool_name,
                 "args": args,
                 "result": result_str,
                 "duration_ms": duration_ms,
                 "success": error is None,
-            })
+            }
+
+        executed_calls = await asyncio.gather(
+            *(execute(tc) for tc in iteration.tool_calls)
+        )
 
         # Replace tool calls with executed versions
-        iteration.tool_calls = executed_calls
+        iteration.tool_calls = list(executed_calls)
         return iteration
 
     def _format_tool_result(self, result: Any, max_length: int = 2000) -> str:
@@ -421,6 +488,14 @@ class RLMAgent:
         """Return total tokens used."""
         return self._total_tokens
 
+    @property
+    def cache_usage(self) -> CacheStats:
+        """Return sub-call cache lookups and hits made by this agent's tools."""
+        llm_query_tool = self.tool_surface.llm_query_tool
+        if llm_query_tool is None:
+            return CacheStats()
+        return llm_query_tool.cache_usage()
+
     def get_stats(self) -> dict[str, Any]:
         """Get agent statistics."""
         return {
@@ -1,14 +1,26 @@
 """Audit trail generation for RLM exploration.
 
 Provides persistence and replay capabilities for exploration trajectories.
+
+Each result is written once as a compact (optionally gzip-compressed) JSON
+blob. Entries are indexed in a SQLite database in the audit directory,
+with indexes on task_id and creation time. Saving a result is one
+append-only insert rather than a rewrite of the whole index. WAL mode and
+a busy timeout let several processes write to the same audit directory.
 """
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +32,38 @@ from src.workers.rlm.models import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds a writer waits for another process's lock on the index
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+# Minimum seconds between opportunistic retention sweeps on save
+_PRUNE_INTERVAL_SECONDS = 300.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    query TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    findings_count INTEGER NOT NULL,
+    iterations INTEGER NOT NULL,
+    subcalls_used INTEGER NOT NULL,
+    wall_time_seconds REAL NOT NULL,
+    file_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audits_task_id ON audits (task_id, id);
+CREATE INDEX IF NOT EXISTS idx_audits_created_at ON audits (created_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_ENTRY_COLUMNS = (
+    "task_id, created_at, query, success, findings_count, iterations, "
+    "subcalls_used, wall_time_seconds, file_path"
+)
+
 
 @dataclass
 class AuditEntry:
@@ -82,10 +126,16 @@ class RLMAuditor:
     """Audit trail generator for RLM exploration.
 
     Saves exploration results and trajectories for analysis and replay.
+    Result blobs are immutable files; the SQLite index is append-only
+    apart from deletions and retention sweeps.
 
     Attributes:
         audit_dir: Directory for saving audit files
-        index_file: Path to the audit index file
+        index_file: Name of the SQLite index database
+        compress: Write result blobs gzip-compressed
+        retention_days: Delete audits older than this many days on save
+            (0 = keep forever)
+        legacy_index_file: Pre-SQLite JSON index imported on first open
 
     Example:
         auditor = RLMAuditor(audit_dir="telemetry/rlm")
@@ -101,9 +151,13 @@ class RLMAuditor:
     """
 
     audit_dir: str = "telemetry/rlm"
-    index_file: str = "index.json"
-    _index: list[AuditEntry] = field(default_factory=list, init=False)
-    _loaded: bool = field(default=False, init=False)
+    index_file: str = "index.db"
+    compress: bool = False
+    retention_days: float = 0
+    legacy_index_file: str = "index.json"
+    _conn: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _last_prune: float = field(default=0.0, init=False)
 
     def __post_init__(self) -> None:
         """Ensure audit directory exists."""
@@ -116,33 +170,100 @@ class RLMAuditor:
         return path
 
     def _get_index_path(self) -> Path:
-        """Get path to index file."""
+        """Get path to index database."""
         return Path(self.audit_dir) / self.index_file
 
-    def _load_index(self) -> None:
-        """Load audit index from disk."""
-        if self._loaded:
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database on first use (lock held)."""
+        if self._conn is not None:
+            return self._conn
+
+        self._ensure_dir()
+        conn = sqlite3.connect(
+            self._get_index_path(),
+            timeout=_BUSY_TIMEOUT_SECONDS,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+        self._import_legacy_index(conn)
+        return conn
+
+    def _import_legacy_index(self, conn: sqlite3.Connection) -> None:
+        """Import entries from a pre-SQLite index.json once (lock held)."""
+        legacy_path = Path(self.audit_dir) / self.legacy_index_file
+        if not legacy_path.exists():
             return
 
-        index_path = self._get_index_path()
-        if index_path.exists():
-            try:
-                with open(index_path) as f:
-                    data = json.load(f)
-                    self._index = [AuditEntry.from_dict(e) for e in data]
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Failed to load audit index: {e}")
-                self._index = []
-        else:
-            self._index = []
-
-        self._loaded = True
-
-    def _save_index(self) -> None:
-        """Save audit index to disk."""
-        index_path = self._get_index_path()
-        with open(index_path, "w") as f:
-            json.dump([e.to_dict() for e in self._index], f, indent=2)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            done = conn.execute(
+                "SELECT 1 FROM meta WHERE key = 'legacy_imported'"
+            ).fetchone()
+            if done is None:
+                try:
+                    with open(legacy_path) as f:
+                        entries = [AuditEntry.from_dict(e) for e in json.load(f)]
+                except (json.JSONDecodeError, KeyError, OSError) as e:
+                    logger.warning(f"Failed to import legacy audit index: {e}")
+                    entries = []
+                conn.executemany(
+                    f"INSERT INTO audits ({_ENTRY_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [_entry_to_row(e) for e in entries],
+                )
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('legacy_imported', ?)",
+                    (str(len(entries)),),
+                )
+                logger.info(f"Imported {len(entries)} entries from {legacy_path}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _query(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a read query against the index."""
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def _execute(self, sql: str, params: tuple[Any, ...] = ()) -> int:
+        """Run a single write statement and return the affected row count."""
+        with self._lock:
+            return self._connect().execute(sql, params).rowcount
+
+    def _write_blob(self, data: dict[str, Any], stem: str) -> Path:
+        """Atomically write a compact JSON blob.
+
+        The blob is written to a temporary file and renamed into place, so
+        concurrent readers never observe a partial file.
+        """
+        directory = self._ensure_dir()
+        payload = json.dumps(data, separators=(",", ":")).encode()
+        suffix = ".json"
+        if self.compress:
+            payload = gzip.compress(payload, compresslevel=6)
+            suffix = ".json.gz"
+
+        file_path = directory / f"{stem}{suffix}"
+        tmp_path = directory / f".{stem}{suffix}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+        return file_path
+
+    @staticmethod
+    def _blob_stem(timestamp: datetime, task_id: str, kind: str = "") -> str:
+        """Build a unique file stem for a blob."""
+        safe_task_id = task_id.replace("/", "_").replace("\\", "_")
+        unique = uuid.uuid4().hex[:8]
+        suffix = f"_{kind}" if kind else ""
+        return (
+            f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{safe_task_id}_{unique}{suffix}"
+        )
 
     def save_result(self, result: RLMResult) -> str:
         """Save an RLM result to the audit trail.
@@ -153,20 +274,11 @@ class RLMAuditor:
         Returns:
             Path to the saved file
         """
-        self._ensure_dir()
-        self._load_index()
-
-        # Generate filename
-        timestamp = datetime.now(timezone.utc)
-        safe_task_id = result.task_id.replace("/", "_").replace("\\", "_")
-        filename = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{safe_task_id}.json"
-        file_path = Path(self.audit_dir) / filename
-
-        # Save full result
-        with open(file_path, "w") as f:
-            json.dump(result.to_dict(), f, indent=2)
+        timestamp = datetime.now(UTC)
+        file_path = self._write_blob(
+            result.to_dict(), self._blob_stem(timestamp, result.task_id)
+        )
 
-        # Create index entry
         entry = AuditEntry(
             task_id=result.task_id,
             timestamp=timestamp,
@@ -178,17 +290,21 @@ class RLMAuditor:
             wall_time_seconds=result.usage.wall_time_seconds,
             file_path=str(file_path),
         )
-
-        self._index.append(entry)
-        self._save_index()
+        self._execute(
+            f"INSERT INTO audits ({_ENTRY_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _entry_to_row(entry),
+        )
 
         logger.info(f"Saved audit for task {result.task_id} to {file_path}")
 
+        self._maybe_prune()
         return str(file_path)
 
     def save_trajectory(self, trajectory: ExplorationTrajectory, task_id: str) -> str:
         """Save just an exploration trajectory.
 
+        Trajectories saved this way are not indexed.
+
         Args:
             trajectory: The trajectory to save
             task_id: Task identifier
@@ -196,16 +312,10 @@ class RLMAuditor:
         Returns:
             Path to the saved file
         """
-        self._ensure_dir()
-        self._load_index()
-
-        timestamp = datetime.now(timezone.utc)
-        safe_task_id = task_id.replace("/", "_").replace("\\", "_")
-        filename = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{safe_task_id}_trajectory.json"
-        file_path = Path(self.audit_dir) / filename
-
-        with open(file_path, "w") as f:
-            json.dump(trajectory.to_dict(), f, indent=2)
+        timestamp = datetime.now(UTC)
+        file_path = self._write_blob(
+            trajectory.to_dict(), self._blob_stem(timestamp, task_id, "trajectory")
+        )
 
         logger.info(f"Saved trajectory for task {task_id} to {file_path}")
 
@@ -220,15 +330,7 @@ class RLMAuditor:
         Returns:
             RLMResult if found, None otherwise
         """
-        self._load_index()
-
-        # Find entry in index
-        entry = None
-        for e in reversed(self._index):  # Most recent first
-            if e.task_id == task_id:
-                entry = e
-                break
-
+        entry = self.get_audit_by_task_id(task_id)
         if entry is None:
             logger.warning(f"No audit found for task {task_id}")
             return None
@@ -239,7 +341,7 @@ class RLMAuditor:
         """Load an RLM result from a specific file.
 
         Args:
-            file_path: Path to the audit file
+            file_path: Path to the audit file (plain or gzip-compressed JSON)
 
         Returns:
             RLMResult if successful, None otherwise
@@ -250,10 +352,11 @@ class RLMAuditor:
             return None
 
         try:
-            with open(path) as f:
-                data = json.load(f)
-                return RLMResult.from_dict(data)
-        except (json.JSONDecodeError, KeyError) as e:
+            raw = path.read_bytes()
+            if path.suffix == ".gz":
+                raw = gzip.decompress(raw)
+            return RLMResult.from_dict(json.loads(raw))
+        except (json.JSONDecodeError, KeyError, OSError) as e:
             logger.error(f"Failed to load audit from {file_path}: {e}")
             return None
 
@@ -275,30 +378,38 @@ class RLMAuditor:
         self,
         limit: int | None = None,
         success_only: bool = False,
+        since: datetime | None = None,
     ) -> list[AuditEntry]:
         """List audit entries.
 
         Args:
             limit: Maximum number to return (newest first)
             success_only: Only return successful explorations
+            since: Only return audits created at or after this time
 
         Returns:
             List of AuditEntry objects
         """
-        self._load_index()
-
-        entries = list(reversed(self._index))  # Newest first
-
+        clauses: list[str] = []
+        params: list[Any] = []
         if success_only:
-            entries = [e for e in entries if e.success]
-
+            clauses.append("success = 1")
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since.timestamp())
+
+        sql = f"SELECT {_ENTRY_COLUMNS} FROM audits"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC"
         if limit:
-            entries = entries[:limit]
+            sql += " LIMIT ?"
+            params.append(limit)
 
-        return entries
+        return [_row_to_entry(row) for row in self._query(sql, tuple(params))]
 
     def get_audit_by_task_id(self, task_id: str) -> AuditEntry | None:
-        """Get audit entry by task ID.
+        """Get the most recent audit entry for a task ID.
 
         Args:
             task_id: Task identifier
@@ -306,12 +417,12 @@ class RLMAuditor:
         Returns:
             AuditEntry if found, None otherwise
         """
-        self._load_index()
-
-        for entry in reversed(self._index):
-            if entry.task_id == task_id:
-                return entry
-        return None
+        rows = self._query(
+            f"SELECT {_ENTRY_COLUMNS} FROM audits WHERE task_id = ? "
+            "ORDER BY id DESC LIMIT 1",
+            (task_id,),
+        )
+        return _row_to_entry(rows[0]) if rows else None
 
     def delete_audit(self, task_id: str) -> bool:
         """Delete an audit entry and its file.
@@ -322,23 +433,72 @@ class RLMAuditor:
         Returns:
             True if deleted, False if not found
         """
-        self._load_index()
+        rows = self._query(
+            "SELECT id, file_path FROM audits WHERE task_id = ? ORDER BY id LIMIT 1",
+            (task_id,),
+        )
+        if not rows:
+            return False
+
+        row_id, file_path = rows[0]
+        self._execute("DELETE FROM audits WHERE id = ?", (row_id,))
+        Path(file_path).unlink(missing_ok=True)
 
-        for i, entry in enumerate(self._index):
-            if entry.task_id == task_id:
-                # Delete file
-                path = Path(entry.file_path)
-                if path.exists():
-                    path.unlink()
+        logger.info(f"Deleted audit for task {task_id}")
+        return True
 
-                # Remove from index
-                del self._index[i]
-                self._save_index()
+    def prune(self, older_than: datetime | None = None) -> int:
+        """Delete audits created before a cutoff, with their files.
 
-                logger.info(f"Deleted audit for task {task_id}")
-                return True
+        Args:
+            older_than: Cutoff time (defaults to now minus retention_days)
 
-        return False
+        Returns:
+            Number of entries deleted
+        """
+        if older_than is None:
+            if self.retention_days <= 0:
+                return 0
+            older_than = datetime.now(UTC) - timedelta(
+                days=self.retention_days
+            )
+        cutoff = older_than.timestamp()
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                paths = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT file_path FROM audits WHERE created_at < ?", (cutoff,)
+                    )
+                ]
+                conn.execute("DELETE FROM audits WHERE created_at < ?", (cutoff,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        for file_path in paths:
+            Path(file_path).unlink(missing_ok=True)
+
+        if paths:
+            logger.info(f"Pruned {len(paths)} audit entries older than {older_than}")
+        return len(paths)
+
+    def _maybe_prune(self) -> None:
+        """Apply the retention policy at most once per prune interval."""
+        if self.retention_days <= 0:
+            return
+        now = time.monotonic()
+        if self._last_prune and now - self._last_prune < _PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_prune = now
+        try:
+            self.prune()
+        except sqlite3.Error as e:
+            logger.warning(f"Audit retention sweep failed: {e}")
 
     def get_stats(self) -> dict[str, Any]:
         """Get audit statistics.
@@ -346,9 +506,14 @@ class RLMAuditor:
         Returns:
             Dictionary with audit statistics
         """
-        self._load_index()
-
-        if not self._index:
+        total, successful, iterations, wall_time, subcalls, findings = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(success), 0), "
+            "COALESCE(SUM(iterations), 0), COALESCE(SUM(wall_time_seconds), 0), "
+            "COALESCE(SUM(subcalls_used), 0), COALESCE(SUM(findings_count), 0) "
+            "FROM audits"
+        )[0]
+
+        if not total:
             return {
                 "total_audits": 0,
                 "successful": 0,
@@ -358,19 +523,15 @@ class RLMAuditor:
                 "avg_wall_time": 0.0,
             }
 
-        successful = sum(1 for e in self._index if e.success)
-        total_iterations = sum(e.iterations for e in self._index)
-        total_wall_time = sum(e.wall_time_seconds for e in self._index)
-
         return {
-            "total_audits": len(self._index),
+            "total_audits": total,
             "successful": successful,
-            "failed": len(self._index) - successful,
-            "success_rate": (successful / len(self._index)) * 100,
-            "avg_iterations": total_iterations / len(self._index),
-            "avg_wall_time": total_wall_time / len(self._index),
-            "total_subcalls": sum(e.subcalls_used for e in self._index),
-            "total_findings": sum(e.findings_count for e in self._index),
+            "failed": total - successful,
+            "success_rate": (successful / total) * 100,
+            "avg_iterations": iterations / total,
+            "avg_wall_time": wall_time / total,
+            "total_subcalls": subcalls,
+            "total_findings": findings,
         }
 
     def clear_all(self) -> int:
@@ -379,23 +540,67 @@ class RLMAuditor:
         Returns:
             Number of entries cleared
         """
-        self._load_index()
-        count = len(self._index)
-
-        # Delete all files
-        for entry in self._index:
-            path = Path(entry.file_path)
-            if path.exists():
-                path.unlink()
-
-        # Clear index
-        self._index = []
-        self._save_index()
-
-        logger.info(f"Cleared {count} audit entries")
-        return count
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                paths = [row[0] for row in conn.execute("SELECT file_path FROM audits")]
+                conn.execute("DELETE FROM audits")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        for file_path in paths:
+            Path(file_path).unlink(missing_ok=True)
+
+        logger.info(f"Cleared {len(paths)} audit entries")
+        return len(paths)
+
+    def close(self) -> None:
+        """Close the index database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        """Return number of indexed audits."""
+        return self._query("SELECT COUNT(*) FROM audits")[0][0]
 
     def __repr__(self) -> str:
         """Return string representation."""
-        self._load_index()
-        return f"RLMAuditor(dir={self.audit_dir}, entries={len(self._index)})"
+        return f"RLMAuditor(dir={self.audit_dir}, entries={len(self)})"
+
+
+def _entry_to_row(entry: AuditEntry) -> tuple[Any, ...]:
+    """Convert an AuditEntry to an index row."""
+    timestamp = entry.timestamp
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return (
+        entry.task_id,
+        timestamp.timestamp(),
+        entry.query,
+        int(entry.success),
+        entry.findings_count,
+        entry.iterations,
+        entry.subcalls_used,
+        entry.wall_time_seconds,
+        entry.file_path,
+    )
+
+
+def _row_to_entry(row: tuple[Any, ...]) -> AuditEntry:
+    """Convert an index row to an AuditEntry."""
+    return AuditEntry(
+        task_id=row[0],
+        timestamp=datetime.fromtimestamp(row[1], tz=UTC),
+        query=row[2],
+        success=bool(row[3]),
+        findings_count=row[4],
+        iterations=row[5],
+        subcalls_used=row[6],
+        wall_time_seconds=row[7],
+        file_path=row[8],
+    )
@@ -46,6 +46,10 @@ class SubCallBudgetManager:
         iteration_used: Sub-calls used in current iteration
         iteration_count: Number of iterations completed
 
+    A budget can be split into child slices for concurrent
+    sub-explorations; calls recorded against a slice also count against
+    its parent.
+
     Example:
         budget = SubCallBudgetManager(max_total=50, max_per_iteration=8)
 
@@ -64,6 +68,7 @@ class SubCallBudgetManager:
     iteration_used: int = field(default=0, init=False)
     iteration_count: int = field(default=0, init=False)
     _history: list[BudgetSnapshot] = field(default_factory=list, init=False)
+    _parent: SubCallBudgetManager | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -135,6 +140,8 @@ class SubCallBudgetManager:
 
         self.total_used += count
         self.iteration_used += count
+        if self._parent is not None:
+            self._parent._record_child_calls(count)
 
         logger.debug(
             f"Recorded {count} sub-call(s): total={self.total_used}/{self.max_total}, "
@@ -156,8 +163,51 @@ class SubCallBudgetManager:
             return False
         self.total_used += count
         self.iteration_used += count
+        if self._parent is not None:
+            self._parent._record_child_calls(count)
         return True
 
+    def split(self, count: int, share: float = 1.0) -> list[SubCallBudgetManager]:
+        """Carve child budgets out of the remaining budget.
+
+        Each child gets an equal slice of ``share`` of the remaining calls.
+        Fewer than ``count`` children are returned when the remaining budget
+        cannot give every child at least one call.
+
+        Args:
+            count: Number of child budgets wanted
+            share: Fraction of the remaining budget to hand out (0-1]
+
+        Returns:
+            List of child budget managers linked to this one
+        """
+        available = int(self.remaining * max(0.0, min(share, 1.0)))
+        count = min(count, available)
+        if count < 1:
+            return []
+
+        per_child = available // count
+        children: list[SubCallBudgetManager] = []
+        for _ in range(count):
+            child = SubCallBudgetManager(
+                max_total=per_child,
+                max_per_iteration=min(self.max_per_iteration, per_child),
+            )
+            child._parent = self
+            children.append(child)
+
+        logger.debug(
+            f"Split {count} child budgets of {per_child} sub-calls "
+            f"(remaining={self.remaining})"
+        )
+        return children
+
+    def _record_child_calls(self, count: int) -> None:
+        """Count calls made against a child slice towards this budget."""
+        self.total_used += count
+        if self._parent is not None:
+            self._parent._record_child_calls(count)
+
     def reset_iteration(self) -> None:
         """Reset the iteration counter and start a new iteration.
 
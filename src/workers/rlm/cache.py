@@ -1,18 +1,26 @@
 """Sub-call caching for RLM exploration.
 
 Caches LLM sub-call results to avoid redundant API calls and reduce costs.
+The in-process tier is an O(1) LRU with optional TTL and byte limits; an
+optional shared tier (Redis) lets identical sub-calls be reused across
+tasks, retries and worker pods.
 """
 
 from __future__ import annotations
 
 import hashlib
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
+# Redis key prefix for the shared sub-call cache tier
+SUBCALL_CACHE_KEY_PREFIX = "asdlc:rlm:subcall:"
+
 
 @dataclass
 class CacheEntry:
@@ -25,6 +33,9 @@ class CacheEntry:
         result: Cached result
         created_at: When entry was created
         hit_count: Number of times this entry was accessed
+        size_bytes: Approximate memory footprint of the stored strings
+        expires_at: Monotonic deadline after which the entry is stale
+            (None = never expires)
     """
 
     key: str
@@ -33,6 +44,14 @@ class CacheEntry:
     result: str
     created_at: datetime
     hit_count: int = 0
+    size_bytes: int = 0
+    expires_at: float | None = None
+
+    def is_expired(self, now: float | None = None) -> bool:
+        """Check whether the entry has outlived its TTL."""
+        if self.expires_at is None:
+            return False
+        return (now if now is not None else time.monotonic()) >= self.expires_at
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -43,6 +62,7 @@ class CacheEntry:
             "result": self.result,
             "created_at": self.created_at.isoformat(),
             "hit_count": self.hit_count,
+            "size_bytes": self.size_bytes,
         }
 
 
@@ -56,6 +76,9 @@ class CacheStats:
         misses: Number of cache misses
         entries: Current number of entries
         evictions: Number of entries evicted
+        expirations: Number of entries dropped because their TTL passed
+        remote_hits: Hits served by the shared tier (subset of hits)
+        bytes: Current approximate size of all entries in bytes
     """
 
     total_requests: int = 0
@@ -63,6 +86,9 @@ class CacheStats:
     misses: int = 0
     entries: int = 0
     evictions: int = 0
+    expirations: int = 0
+    remote_hits: int = 0
+    bytes: int = 0
 
     @property
     def hit_rate(self) -> float:
@@ -79,20 +105,93 @@ class CacheStats:
             "misses": self.misses,
             "entries": self.entries,
             "evictions": self.evictions,
+            "expirations": self.expirations,
+            "remote_hits": self.remote_hits,
+            "bytes": self.bytes,
             "hit_rate": self.hit_rate,
         }
 
 
+class SharedCacheTier(Protocol):
+    """Protocol for a shared second-level sub-call cache."""
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached result for a key, or None."""
+        ...
+
+    async def set(self, key: str, result: str) -> None:
+        """Store a result under a key."""
+        ...
+
+
+class RedisSubCallCacheTier:
+    """Redis-backed shared tier for SubCallCache.
+
+    Stores results under the same SHA-256 key the in-process tier uses, so
+    any worker that asks the same sub-question about the same context can
+    reuse the answer. Redis errors are logged and treated as misses.
+
+    Attributes:
+        redis_client: Async Redis client
+        ttl_seconds: Expiry for stored results (0 = no expiry)
+        key_prefix: Prefix for Redis keys
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        ttl_seconds: int = 86400,
+        key_prefix: str = SUBCALL_CACHE_KEY_PREFIX,
+    ) -> None:
+        """Initialize the Redis tier.
+
+        Args:
+            redis_client: Async Redis client (redis.asyncio.Redis)
+            ttl_seconds: Expiry for stored results (0 = no expiry)
+            key_prefix: Prefix for Redis keys
+        """
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached result for a key, or None on miss or error."""
+        try:
+            value = await self.redis_client.get(f"{self.key_prefix}{key}")
+        except Exception as e:
+            logger.warning(f"Shared sub-call cache read failed: {e}")
+            return None
+        if value is None:
+            return None
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set(self, key: str, result: str) -> None:
+        """Store a result, ignoring Redis errors."""
+        try:
+            await self.redis_client.set(
+                f"{self.key_prefix}{key}",
+                result,
+                ex=self.ttl_seconds or None,
+            )
+        except Exception as e:
+            logger.warning(f"Shared sub-call cache write failed: {e}")
+
+
 @dataclass
 class SubCallCache:
     """Cache for RLM sub-call results.
 
     Caches LLM query results based on prompt and context hash to avoid
-    redundant API calls during exploration.
+    redundant API calls during exploration. Entries are kept in LRU order,
+    so lookups, inserts and evictions are all O(1).
 
     Attributes:
         max_entries: Maximum number of cache entries (0 = unlimited)
         enabled: Whether caching is enabled
+        ttl_seconds: Entry lifetime in seconds (0 = no expiry)
+        max_bytes: Maximum total entry size in bytes (0 = unlimited)
+        shared_tier: Optional shared second-level tier (e.g. Redis),
+            consulted by aget()/aset()
 
     Example:
         cache = SubCallCache(max_entries=1000)
@@ -106,7 +205,12 @@ class SubCallCache:
 
     max_entries: int = 0
     enabled: bool = True
-    _cache: dict[str, CacheEntry] = field(default_factory=dict, init=False)
+    ttl_seconds: float = 0
+    max_bytes: int = 0
+    shared_tier: SharedCacheTier | None = None
+    _cache: OrderedDict[str, CacheEntry] = field(
+        default_factory=OrderedDict, init=False
+    )
     _stats: CacheStats = field(default_factory=CacheStats, init=False)
 
     @staticmethod
@@ -139,7 +243,7 @@ class SubCallCache:
         self._stats.total_requests += 1
         key = self._generate_key(prompt, context)
 
-        entry = self._cache.get(key)
+        entry = self._lookup(key)
         if entry is not None:
             self._stats.hits += 1
             entry.hit_count += 1
@@ -150,6 +254,55 @@ class SubCallCache:
         logger.debug(f"Cache miss for key {key[:16]}...")
         return None
 
+    async def aget(self, prompt: str, context: str) -> str | None:
+        """Get cached result, falling back to the shared tier.
+
+        A shared-tier hit is copied into the in-process tier.
+
+        Args:
+            prompt: The prompt to look up
+            context: The context to look up
+
+        Returns:
+            Cached result if found, None otherwise
+        """
+        result, _ = await self.alookup(prompt, context)
+        return result
+
+    async def alookup(self, prompt: str, context: str) -> tuple[str | None, bool]:
+        """Like aget(), also reporting whether the shared tier served the hit.
+
+        Args:
+            prompt: The prompt to look up
+            context: The context to look up
+
+        Returns:
+            Tuple of (cached result or None, whether it came from the shared tier)
+        """
+        if not self.enabled:
+            return None, False
+
+        self._stats.total_requests += 1
+        key = self._generate_key(prompt, context)
+
+        entry = self._lookup(key)
+        if entry is not None:
+            self._stats.hits += 1
+            entry.hit_count += 1
+            return entry.result, False
+
+        if self.shared_tier is not None:
+            result = await self.shared_tier.get(key)
+            if result is not None:
+                self._stats.hits += 1
+                self._stats.remote_hits += 1
+                self._store(key, prompt, context, result)
+                logger.debug(f"Shared cache hit for key {key[:16]}...")
+                return result, True
+
+        self._stats.misses += 1
+        return None, False
+
     def set(self, prompt: str, context: str, result: str) -> None:
         """Store result in cache.
 
@@ -162,9 +315,65 @@ class SubCallCache:
             return
 
         key = self._generate_key(prompt, context)
+        self._store(key, prompt, context, result)
+
+        logger.debug(f"Cached result for key {key[:16]}... (entries: {len(self._cache)})")
+
+    async def aset(self, prompt: str, context: str, result: str) -> None:
+        """Store result in the in-process tier and the shared tier.
+
+        Args:
+            prompt: The prompt text
+            context: The context text
+            result: The result to cache
+        """
+        if not self.enabled:
+            return
+
+        key = self._generate_key(prompt, context)
+        self._store(key, prompt, context, result)
 
-        # Check if we need to evict entries
-        if self.max_entries > 0 and len(self._cache) >= self.max_entries:
+        if self.shared_tier is not None:
+            await self.shared_tier.set(key, result)
+
+    def _lookup(self, key: str) -> CacheEntry | None:
+        """Return a live entry and mark it most recently used."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        if entry.is_expired():
+            self._discard(key)
+            self._stats.expirations += 1
+            return None
+
+        self._cache.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, prompt: str, context: str, result: str) -> None:
+        """Insert or replace an entry and enforce the size limits.
+
+        An entry larger than max_bytes on its own is not cached, rather than
+        evicting everything else to make room for it.
+        """
+        if key in self._cache:
+            self._discard(key)
+
+        size_bytes = len(prompt.encode()) + len(context.encode()) + len(result.encode())
+        if self.max_bytes > 0 and size_bytes > self.max_bytes:
+            logger.debug(
+                f"Not caching {size_bytes} byte entry (max_bytes={self.max_bytes})"
+            )
+            return
+        expires_at = (
+            time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        )
+
+        # Make room before inserting
+        while self._cache and (
+            (self.max_entries > 0 and len(self._cache) >= self.max_entries)
+            or (self.max_bytes > 0 and self._stats.bytes + size_bytes > self.max_bytes)
+        ):
             self._evict_oldest()
 
         self._cache[key] = CacheEntry(
@@ -173,21 +382,28 @@ class SubCallCache:
             context=context,
             result=result,
             created_at=datetime.now(timezone.utc),
+            size_bytes=size_bytes,
+            expires_at=expires_at,
         )
+        self._stats.bytes += size_bytes
         self._stats.entries = len(self._cache)
 
-        logger.debug(f"Cached result for key {key[:16]}... (entries: {len(self._cache)})")
+    def _discard(self, key: str) -> CacheEntry | None:
+        """Remove an entry and update byte accounting."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._stats.bytes -= entry.size_bytes
+            self._stats.entries = len(self._cache)
+        return entry
 
     def _evict_oldest(self) -> None:
-        """Evict the oldest entry from cache."""
+        """Evict the least recently used entry from cache."""
         if not self._cache:
             return
 
-        # Find oldest entry by created_at
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].created_at)
-        del self._cache[oldest_key]
+        oldest_key = next(iter(self._cache))
+        self._discard(oldest_key)
         self._stats.evictions += 1
-        self._stats.entries = len(self._cache)
 
         logger.debug(f"Evicted oldest cache entry {oldest_key[:16]}...")
 
@@ -206,7 +422,8 @@ class SubCallCache:
         if not self.enabled:
             return False
         key = self._generate_key(prompt, context)
-        return key in self._cache
+        entry = self._cache.get(key)
+        return entry is not None and not entry.is_expired()
 
     def clear(self) -> int:
         """Clear all cache entries.
@@ -217,6 +434,7 @@ class SubCallCache:
         count = len(self._cache)
         self._cache.clear()
         self._stats.entries = 0
+        self._stats.bytes = 0
         logger.info(f"Cleared {count} cache entries")
         return count
 
@@ -243,7 +461,10 @@ class SubCallCache:
         if not self.enabled:
             return None
         key = self._generate_key(prompt, context)
-        return self._cache.get(key)
+        entry = self._cache.get(key)
+        if entry is None or entry.is_expired():
+            return None
+        return entry
 
     def remove(self, prompt: str, context: str) -> bool:
         """Remove specific entry from cache.
@@ -256,11 +477,7 @@ class SubCallCache:
             True if entry was removed, False if not found
         """
         key = self._generate_key(prompt, context)
-        if key in self._cache:
-            del self._cache[key]
-            self._stats.entries = len(self._cache)
-            return True
-        return False
+        return self._discard(key) is not None
 
     def get_all_entries(self) -> list[CacheEntry]:
         """Get all cache entries.
@@ -279,6 +496,8 @@ class SubCallCache:
         return {
             "max_entries": self.max_entries,
             "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "max_bytes": self.max_bytes,
             "entries": [entry.to_dict() for entry in self._cache.values()],
             "stats": self._stats.to_dict(),
         }
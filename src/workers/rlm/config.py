@@ -21,7 +21,21 @@ class RLMConfig:
         model: Model to use for sub-calls
         max_tokens_per_subcall: Token limit per sub-query
         cache_enabled: Whether to enable sub-call caching
+        cache_max_entries: Maximum in-process cache entries (0 = unlimited)
+        cache_max_bytes: Maximum in-process cache size in bytes (0 = unlimited)
+        cache_ttl_seconds: Sub-call cache entry lifetime (0 = no expiry)
+        cache_shared: Whether to also use the shared Redis cache tier
+        grep_use_ripgrep: Shortlist grep candidates with ripgrep if installed
+        symbol_cache_max_entries: Parsed files kept by symbol tools (0 = unlimited)
+        symbol_cache_seed: Seed the parsed-file cache from the repo mapper's
+            persisted AST context when one exists
+        max_fanout: Sub-explorations the agent may spawn at once (0 = disabled)
+        max_spawn_depth: How many levels of sub-explorations may be nested
+        fanout_budget_share: Fraction of the remaining budget given to a fan-out
+        child_max_iterations: Iteration limit for each sub-exploration
         audit_dir: Directory for audit logs
+        audit_compress: Gzip-compress saved audit blobs
+        audit_retention_days: Delete audits older than this (0 = keep forever)
         repo_root: Root path of the repository being explored
     """
 
@@ -31,7 +45,20 @@ class RLMConfig:
     model: str = "claude-3-5-haiku-20241022"
     max_tokens_per_subcall: int = 500
     cache_enabled: bool = True
+    cache_max_entries: int = 1000
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_ttl_seconds: int = 86400
+    cache_shared: bool = False
+    grep_use_ripgrep: bool = False
+    symbol_cache_max_entries: int = 512
+    symbol_cache_seed: bool = True
+    max_fanout: int = 0
+    max_spawn_depth: int = 1
+    fanout_budget_share: float = 0.5
+    child_max_iterations: int = 5
     audit_dir: str = "telemetry/rlm"
+    audit_compress: bool = False
+    audit_retention_days: float = 0
     repo_root: str = "."
 
     @classmethod
@@ -45,7 +72,20 @@ class RLMConfig:
             RLM_MODEL: Sub-call model (default: claude-3-5-haiku-20241022)
             RLM_MAX_TOKENS_PER_SUBCALL: Token limit per call (default: 500)
             RLM_CACHE_ENABLED: Enable caching (default: true)
+            RLM_CACHE_MAX_ENTRIES: In-process cache entries (default: 1000)
+            RLM_CACHE_MAX_BYTES: In-process cache bytes (default: 67108864)
+            RLM_CACHE_TTL: Cache entry TTL in seconds (default: 86400)
+            RLM_CACHE_SHARED: Use the shared Redis cache tier (default: false)
+            RLM_GREP_USE_RIPGREP: Use ripgrep for grep shortlisting (default: false)
+            RLM_SYMBOL_CACHE_MAX_ENTRIES: Parsed files cached (default: 512)
+            RLM_SYMBOL_CACHE_SEED: Seed from repo mapper AST cache (default: true)
+            RLM_MAX_FANOUT: Concurrent sub-explorations per spawn (default: 0)
+            RLM_MAX_SPAWN_DEPTH: Nesting depth of sub-explorations (default: 1)
+            RLM_FANOUT_BUDGET_SHARE: Budget share for a fan-out (default: 0.5)
+            RLM_CHILD_MAX_ITERATIONS: Iterations per sub-exploration (default: 5)
             RLM_AUDIT_DIR: Audit log directory (default: telemetry/rlm)
+            RLM_AUDIT_COMPRESS: Gzip-compress audit blobs (default: false)
+            RLM_AUDIT_RETENTION_DAYS: Audit retention in days (default: 0)
             RLM_REPO_ROOT: Repository root path (default: .)
 
         Returns:
@@ -58,7 +98,20 @@ class RLMConfig:
             model=os.getenv("RLM_MODEL", "claude-3-5-haiku-20241022"),
             max_tokens_per_subcall=int(os.getenv("RLM_MAX_TOKENS_PER_SUBCALL", "500")),
             cache_enabled=os.getenv("RLM_CACHE_ENABLED", "true").lower() == "true",
+            cache_max_entries=int(os.getenv("RLM_CACHE_MAX_ENTRIES", "1000")),
+            cache_max_bytes=int(os.getenv("RLM_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            cache_ttl_seconds=int(os.getenv("RLM_CACHE_TTL", "86400")),
+            cache_shared=os.getenv("RLM_CACHE_SHARED", "false").lower() == "true",
+            grep_use_ripgrep=os.getenv("RLM_GREP_USE_RIPGREP", "false").lower() == "true",
+            symbol_cache_max_entries=int(os.getenv("RLM_SYMBOL_CACHE_MAX_ENTRIES", "512")),
+            symbol_cache_seed=os.getenv("RLM_SYMBOL_CACHE_SEED", "true").lower() == "true",
+            max_fanout=int(os.getenv("RLM_MAX_FANOUT", "0")),
+            max_spawn_depth=int(os.getenv("RLM_MAX_SPAWN_DEPTH", "1")),
+            fanout_budget_share=float(os.getenv("RLM_FANOUT_BUDGET_SHARE", "0.5")),
+            child_max_iterations=int(os.getenv("RLM_CHILD_MAX_ITERATIONS", "5")),
             audit_dir=os.getenv("RLM_AUDIT_DIR", "telemetry/rlm"),
+            audit_compress=os.getenv("RLM_AUDIT_COMPRESS", "false").lower() == "true",
+            audit_retention_days=float(os.getenv("RLM_AUDIT_RETENTION_DAYS", "0")),
             repo_root=os.getenv("RLM_REPO_ROOT", "."),
         )
 
@@ -100,6 +153,33 @@ class RLMConfig:
         if not self.model:
             errors.append("model cannot be empty")
 
+        if self.cache_max_entries < 0:
+            errors.append("cache_max_entries cannot be negative")
+
+        if self.cache_max_bytes < 0:
+            errors.append("cache_max_bytes cannot be negative")
+
+        if self.cache_ttl_seconds < 0:
+            errors.append("cache_ttl_seconds cannot be negative")
+
+        if self.symbol_cache_max_entries < 0:
+            errors.append("symbol_cache_max_entries cannot be negative")
+
+        if self.max_fanout < 0:
+            errors.append("max_fanout cannot be negative")
+
+        if self.max_spawn_depth < 0:
+            errors.append("max_spawn_depth cannot be negative")
+
+        if not 0 < self.fanout_budget_share <= 1:
+            errors.append("fanout_budget_share must be in (0, 1]")
+
+        if self.child_max_iterations < 1:
+            errors.append("child_max_iterations must be at least 1")
+
+        if self.audit_retention_days < 0:
+            errors.append("audit_retention_days cannot be negative")
+
         return errors
 
     def to_dict(self) -> dict:
@@ -115,6 +195,19 @@ class RLMConfig:
             "model": self.model,
             "max_tokens_per_subcall": self.max_tokens_per_subcall,
             "cache_enabled": self.cache_enabled,
+            "cache_max_entries": self.cache_max_entries,
+            "cache_max_bytes": self.cache_max_bytes,
+            "cache_ttl_seconds": self.cache_ttl_seconds,
+            "cache_shared": self.cache_shared,
+            "grep_use_ripgrep": self.grep_use_ripgrep,
+            "symbol_cache_max_entries": self.symbol_cache_max_entries,
+            "symbol_cache_seed": self.symbol_cache_seed,
+            "max_fanout": self.max_fanout,
+            "max_spawn_depth": self.max_spawn_depth,
+            "fanout_budget_share": self.fanout_budget_share,
+            "child_max_iterations": self.child_max_iterations,
             "audit_dir": self.audit_dir,
+            "audit_compress": self.audit_compress,
+            "audit_retention_days": self.audit_retention_days,
             "repo_root": self.repo_root,
         }
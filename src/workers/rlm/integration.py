@@ -7,19 +7,25 @@ once P03-F01 is complete.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, TYPE_CHECKING
 
+from src.workers.repo_mapper.cache import ASTContextCache
+from src.workers.repo_mapper.config import get_repo_mapper_config
 from src.workers.rlm.agent import RLMAgent
 from src.workers.rlm.audit import RLMAuditor
 from src.workers.rlm.budget_manager import SubCallBudgetManager
-from src.workers.rlm.cache import SubCallCache
+from src.workers.rlm.cache import RedisSubCallCacheTier, SubCallCache
 from src.workers.rlm.config import RLMConfig
 from src.workers.rlm.models import RLMResult
 from src.workers.rlm.orchestrator import RLMOrchestrator
 from src.workers.rlm.tools.file_tools import FileTools
+from src.workers.rlm.tools.grep_index import GrepIndex
 from src.workers.rlm.tools.llm_query import LLMQueryTool
+from src.workers.rlm.tools.parse_cache import ParsedFileCache
 from src.workers.rlm.tools.registry import REPLToolSurface
 from src.workers.rlm.tools.symbol_tools import SymbolTools
 from src.workers.rlm.trigger import RLMTriggerDetector, TriggerResult
@@ -68,10 +74,12 @@ class RLMIntegration:
     orchestration, and result formatting.
 
     Attributes:
-        client: Anthropic client for LLM calls
+        client: BaseLLMClient or Anthropic client for LLM calls
         config: RLM configuration
         repo_root: Repository root path for file operations
         auto_trigger: Whether to auto-detect when to use RLM
+        redis_client: Optional async Redis client for the shared sub-call
+            cache tier (used when config.cache_shared is set)
 
     Example:
         integration = RLMIntegration(
@@ -86,12 +94,17 @@ class RLMIntegration:
             formatted = result.formatted_output
     """
 
-    client: Any  # Anthropic client
+    client: Any  # BaseLLMClient or Anthropic client
     config: RLMConfig
     repo_root: str = "."
     auto_trigger: bool = True
+    redis_client: Any = None
     _trigger_detector: RLMTriggerDetector = field(init=False)
     _auditor: RLMAuditor = field(init=False)
+    _cache: SubCallCache = field(init=False)
+    _grep_index: GrepIndex = field(init=False)
+    _parse_cache: ParsedFileCache = field(init=False)
+    _parse_cache_seeded: bool = field(default=False, init=False)
     _exploration_count: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
@@ -101,7 +114,31 @@ class RLMIntegration:
             fail_count_threshold=4,
             multi_file_threshold=10,
         )
-        self._auditor = RLMAuditor(audit_dir=self.config.audit_dir)
+        self._auditor = RLMAuditor(
+            audit_dir=self.config.audit_dir,
+            compress=self.config.audit_compress,
+            retention_days=self.config.audit_retention_days,
+        )
+
+        # One sub-call cache shared by every exploration of this integration
+        shared_tier = None
+        if self.config.cache_shared and self.redis_client is not None:
+            shared_tier = RedisSubCallCacheTier(
+                self.redis_client, ttl_seconds=self.config.cache_ttl_seconds
+            )
+        self._cache = SubCallCache(
+            max_entries=self.config.cache_max_entries,
+            enabled=self.config.cache_enabled,
+            ttl_seconds=self.config.cache_ttl_seconds,
+            max_bytes=self.config.cache_max_bytes,
+            shared_tier=shared_tier,
+        )
+        self._grep_index = GrepIndex(
+            self.repo_root, use_ripgrep=self.config.grep_use_ripgrep
+        )
+        self._parse_cache = ParsedFileCache(
+            max_entries=self.config.symbol_cache_max_entries
+        )
 
     def should_use_rlm(
         self,
@@ -165,9 +202,9 @@ class RLMIntegration:
                 task_id=task_id,
             )
 
-            # Save audit if requested
+            # Save audit if requested (gzip and file I/O, off the event loop)
             if save_audit:
-                self._auditor.save_result(rlm_result)
+                await asyncio.to_thread(self._auditor.save_result, rlm_result)
 
             # Format output for agent consumption
             formatted = self._format_for_agent(rlm_result)
@@ -263,9 +300,34 @@ class RLMIntegration:
         Returns:
             RLMIntegrationResult
         """
-        import asyncio
         return asyncio.run(self.explore(query, context_hints, task_id))
 
+    def _seed_parse_cache(self, extensions: list[str]) -> None:
+        """Seed the parsed-file cache from the repo mapper's AST cache.
+
+        Args:
+            extensions: File extensions the symbol tools can parse
+        """
+        mapper_config = get_repo_mapper_config()
+        cache_dir = mapper_config.context_pack_dir / ".cache"
+        if not cache_dir.is_dir():
+            return
+
+        try:
+            ast_cache = ASTContextCache(
+                cache_dir=str(cache_dir),
+                ttl_hours=mapper_config.ast_cache_ttl // 3600,
+            )
+            seeded = self._parse_cache.seed_from_ast_cache(
+                ast_cache, str(Path(self.repo_root).resolve()), extensions
+            )
+        except Exception as e:
+            logger.warning(f"Could not seed symbol cache from repo mapper: {e}")
+            return
+
+        if seeded:
+            logger.info(f"Seeded symbol cache with {seeded} files from repo mapper")
+
     def _create_orchestrator(self) -> RLMOrchestrator:
         """Create a fresh orchestrator for exploration."""
         # Create budget manager
@@ -274,34 +336,45 @@ class RLMIntegration:
             max_per_iteration=self.config.max_subcalls_per_iteration,
         )
 
-        # Create cache
-        cache = SubCallCache(enabled=self.config.cache_enabled)
+        # Reuse the shared cache so repeated sub-questions hit across tasks
+        cache = self._cache
 
-        # Create tools
-        file_tools = FileTools(repo_root=self.repo_root)
-        symbol_tools = SymbolTools(repo_root=self.repo_root)
-
-        # Create LLM query tool (for sub-calls)
-        llm_query_tool = LLMQueryTool(
-            client=self.client,
-            budget_manager=budget,
-            cache=cache,
-            model=self.config.model,
-            max_tokens=self.config.max_tokens_per_subcall,
+        # Create tools (the grep index outlives individual explorations)
+        file_tools = FileTools(repo_root=self.repo_root, grep_index=self._grep_index)
+        symbol_tools = SymbolTools(
+            repo_root=self.repo_root,
+            parse_cache=self._parse_cache,
+            file_index=self._grep_index,
         )
+        if self.config.symbol_cache_seed and not self._parse_cache_seeded:
+            self._parse_cache_seeded = True
+            self._seed_parse_cache(symbol_tools.get_supported_extensions())
+
+        def build_agent(budget_manager: SubCallBudgetManager) -> RLMAgent:
+            """Build an agent whose sub-calls are charged to budget_manager."""
+            # Create LLM query tool (for sub-calls)
+            llm_query_tool = LLMQueryTool(
+                client=self.client,
+                budget_manager=budget_manager,
+                cache=cache,
+                model=self.config.model,
+                max_tokens=self.config.max_tokens_per_subcall,
+            )
 
-        # Create tool surface
-        tool_surface = REPLToolSurface(
-            file_tools=file_tools,
-            symbol_tools=symbol_tools,
-            llm_query_tool=llm_query_tool,
-        )
+            # Create tool surface
+            tool_surface = REPLToolSurface(
+                file_tools=file_tools,
+                symbol_tools=symbol_tools,
+                llm_query_tool=llm_query_tool,
+            )
+
+            return RLMAgent(
+                client=self.client,
+                tool_surface=tool_surface,
+            )
 
         # Create agent
-        agent = RLMAgent(
-            client=self.client,
-            tool_surface=tool_surface,
-        )
+        agent = build_agent(budget)
 
         # Create orchestrator
         return RLMOrchestrator(
@@ -309,6 +382,7 @@ class RLMIntegration:
             budget_manager=budget,
             cache=cache,
             config=self.config,
+            child_factory=build_agent if self.config.max_fanout > 0 else None,
         )
 
     def _format_for_agent(self, result: RLMResult) -> str:
@@ -375,6 +449,7 @@ class RLMIntegration:
             "config": self.config.to_dict(),
             "trigger_thresholds": self._trigger_detector.get_thresholds(),
             "audit_stats": self._auditor.get_stats(),
+            "cache_stats": self._cache.get_stats().to_dict(),
         }
 
     def __repr__(self) -> str:
@@ -0,0 +1,98 @@
+"""Async LLM call adapter for RLM exploration.
+
+RLM components accept either a ``BaseLLMClient`` from
+``src.infrastructure.llm`` or a raw Anthropic SDK client. This module
+gives them a single non-blocking entry point: async clients are awaited
+directly, synchronous SDK clients are run in a worker thread so they
+never block the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import Any
+
+from src.infrastructure.llm.base_client import BaseLLMClient
+
+
+@dataclass
+class MessageResult:
+    """Normalized result of a single LLM message call.
+
+    Attributes:
+        text: Concatenated text content of the response
+        tokens_used: Input plus output tokens reported by the provider
+    """
+
+    text: str
+    tokens_used: int
+
+
+async def create_message(
+    client: Any,
+    model: str,
+    max_tokens: int,
+    system: str,
+    user_content: str,
+) -> MessageResult:
+    """Send a single-turn message without blocking the event loop.
+
+    Args:
+        client: BaseLLMClient, AsyncAnthropic or Anthropic client
+        model: Model identifier (ignored for BaseLLMClient, which is bound
+            to its configured model)
+        max_tokens: Maximum tokens for the response
+        system: System prompt
+        user_content: User message content
+
+    Returns:
+        MessageResult with response text and token usage
+    """
+    if isinstance(client, BaseLLMClient):
+        response = await client.generate(
+            prompt=user_content,
+            system=system,
+            max_tokens=max_tokens,
+        )
+        usage = response.usage or {}
+        return MessageResult(
+            text=response.content,
+            tokens_used=usage.get("input_tokens", 0) + usage.get("output_tokens", 0),
+        )
+
+    params = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "system": system,
+        "messages": [{"role": "user", "content": user_content}],
+    }
+
+    create = client.messages.create
+    if inspect.iscoroutinefunction(create):
+        response = await create(**params)
+    else:
+        response = await asyncio.to_thread(create, **params)
+        if inspect.isawaitable(response):
+            response = await response
+
+    return _normalize_sdk_response(response)
+
+
+def _normalize_sdk_response(response: Any) -> MessageResult:
+    """Extract text and token usage from an Anthropic SDK response."""
+    text = ""
+    if response.content:
+        for block in response.content:
+            if hasattr(block, "text"):
+                text += block.text
+
+    tokens_used = 0
+    if hasattr(response, "usage"):
+        tokens_used = (
+            getattr(response.usage, "input_tokens", 0)
+            + getattr(response.usage, "output_tokens", 0)
+        )
+
+    return MessageResult(text=text, tokens_used=tokens_used)
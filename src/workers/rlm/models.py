@@ -338,6 +338,9 @@ class RLMUsage:
         model_calls: Number of LLM model API calls
         budget_limit: Maximum sub-calls allowed
         budget_remaining: Sub-calls remaining in budget
+        cache_lookups: Number of sub-call cache lookups
+        shared_cache_hits: Cache hits served by the shared (Redis) tier
+        cache_bytes: In-process cache size in bytes at the end of execution
     """
 
     subcall_count: int
@@ -347,6 +350,9 @@ class RLMUsage:
     model_calls: int
     budget_limit: int = 50
     budget_remaining: int = 50
+    cache_lookups: int = 0
+    shared_cache_hits: int = 0
+    cache_bytes: int = 0
 
     @property
     def cache_hit_rate(self) -> float:
@@ -355,6 +361,13 @@ class RLMUsage:
             return 0.0
         return (self.cached_subcalls / self.subcall_count) * 100
 
+    @property
+    def cache_lookup_hit_rate(self) -> float:
+        """Calculate the share of cache lookups that hit, as a percentage."""
+        if self.cache_lookups == 0:
+            return 0.0
+        return (self.cached_subcalls / self.cache_lookups) * 100
+
     @property
     def budget_used_percentage(self) -> float:
         """Calculate percentage of budget used."""
@@ -372,7 +385,11 @@ class RLMUsage:
             "model_calls": self.model_calls,
             "budget_limit": self.budget_limit,
             "budget_remaining": self.budget_remaining,
+            "cache_lookups": self.cache_lookups,
+            "shared_cache_hits": self.shared_cache_hits,
+            "cache_bytes": self.cache_bytes,
             "cache_hit_rate": self.cache_hit_rate,
+            "cache_lookup_hit_rate": self.cache_lookup_hit_rate,
             "budget_used_percentage": self.budget_used_percentage,
         }
 
@@ -387,6 +404,9 @@ class RLMUsage:
             model_calls=data["model_calls"],
             budget_limit=data.get("budget_limit", 50),
             budget_remaining=data.get("budget_remaining", 50),
+            cache_lookups=data.get("cache_lookups", 0),
+            shared_cache_hits=data.get("shared_cache_hits", 0),
+            cache_bytes=data.get("cache_bytes", 0),
         )
 
 
@@ -10,14 +10,15 @@ import asyncio
 import logging
 import time
 import uuid
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
 from typing import Any, TYPE_CHECKING
 
 from src.core.exceptions import BudgetExceededError, RLMTimeoutError
 from src.workers.rlm.agent import RLMAgent
 from src.workers.rlm.budget_manager import SubCallBudgetManager
-from src.workers.rlm.cache import SubCallCache
+from src.workers.rlm.cache import CacheStats, SubCallCache
 from src.workers.rlm.config import RLMConfig
 from src.workers.rlm.models import (
     Citation,
@@ -26,6 +27,7 @@ from src.workers.rlm.models import (
     Finding,
     RLMResult,
     RLMUsage,
+    ToolCall,
 )
 
 if TYPE_CHECKING:
@@ -34,6 +36,34 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SubExplorationResult:
+    """Outcome of one child exploration spawned by a fan-out.
+
+    Attributes:
+        query: Sub-question the child explored
+        findings: Finding descriptions gathered by the child
+        citations: Citations gathered by the child
+        iterations: Iterations the child ran
+        subcalls_used: Sub-calls charged to the child's budget slice
+        tokens_used: LLM tokens used by the child and its descendants
+        model_calls: Agent iterations of the child and its descendants
+        error: Error message if the child failed
+        cache_usage: Sub-call cache lookups and hits of the child and its
+            descendants
+    """
+
+    query: str
+    findings: list[str]
+    citations: list[Citation]
+    iterations: int
+    subcalls_used: int
+    tokens_used: int
+    model_calls: int
+    error: str | None = None
+    cache_usage: CacheStats = field(default_factory=CacheStats)
+
+
 @dataclass
 class RLMOrchestrator:
     """Orchestrates RLM exploration sessions.
@@ -44,9 +74,19 @@ class RLMOrchestrator:
     Attributes:
         agent: RLMAgent for running iterations
         budget_manager: Budget manager for sub-call limits
-        cache: Cache for sub-call results
+        cache: Cache for sub-call results (may be shared across explorations;
+            hits are counted by each exploration's own llm_query tool)
         config: RLM configuration
         max_iterations: Maximum exploration iterations
+        child_factory: Builds an agent bound to a child budget slice;
+            enables the agent's spawn directive when set and
+            config.max_fanout > 0
+        spawn_depth: Nesting level of this orchestrator (0 = top level)
+
+    When the agent emits a spawn directive, the orchestrator runs one child
+    exploration per sub-question concurrently. Each child gets an equal
+    slice of the remaining sub-call budget and shares this orchestrator's
+    cache; child findings and citations are merged into this trajectory.
 
     Example:
         orchestrator = RLMOrchestrator(
@@ -67,7 +107,22 @@ class RLMOrchestrator:
     cache: SubCallCache
     config: RLMConfig
     max_iterations: int = 10
+    child_factory: Callable[[SubCallBudgetManager], RLMAgent] | None = None
+    spawn_depth: int = 0
     _exploration_count: int = field(default=0, init=False)
+    _cache_baseline: CacheStats = field(default_factory=CacheStats, init=False)
+    _child_tokens: int = field(default=0, init=False)
+    _child_model_calls: int = field(default=0, init=False)
+    _child_cache_usage: CacheStats = field(default_factory=CacheStats, init=False)
+
+    @property
+    def can_spawn(self) -> bool:
+        """Whether this orchestrator may fan out sub-explorations."""
+        return (
+            self.child_factory is not None
+            and self.config.max_fanout > 0
+            and self.spawn_depth < self.config.max_spawn_depth
+        )
 
     async def explore(
         self,
@@ -92,6 +147,11 @@ class RLMOrchestrator:
         task_id = task_id or str(uuid.uuid4())
         self._exploration_count += 1
         start_time = time.perf_counter()
+        self._cache_baseline = replace(self.agent.cache_usage)
+        self._child_tokens = 0
+        self._child_model_calls = 0
+        self._child_cache_usage = CacheStats()
+        self.agent.max_spawn = self.config.max_fanout if self.can_spawn else 0
 
         logger.info(
             f"Starting exploration {task_id}: {query[:100]}... "
@@ -108,7 +168,7 @@ class RLMOrchestrator:
         # Create trajectory
         trajectory = ExplorationTrajectory(
             steps=[],
-            start_time=datetime.now(timezone.utc),
+            start_time=datetime.now(UTC),
             end_time=None,
             total_subcalls=0,
             cached_hits=0,
@@ -132,9 +192,9 @@ class RLMOrchestrator:
 
             # Update trajectory
             trajectory.steps = steps
-            trajectory.end_time = datetime.now(timezone.utc)
+            trajectory.end_time = datetime.now(UTC)
             trajectory.total_subcalls = self.budget_manager.total_used
-            trajectory.cached_hits = self.cache.get_stats().hits
+            trajectory.cached_hits = self._exploration_cache_usage().hits
 
             # Build usage
             wall_time = time.perf_counter() - start_time
@@ -164,7 +224,7 @@ class RLMOrchestrator:
             # Handle timeout
             wall_time = time.perf_counter() - start_time
             trajectory.steps = steps
-            trajectory.end_time = datetime.now(timezone.utc)
+            trajectory.end_time = datetime.now(UTC)
             trajectory.total_subcalls = self.budget_manager.total_used
 
             usage = self._build_usage(wall_time)
@@ -184,7 +244,7 @@ class RLMOrchestrator:
             # Handle budget exhaustion
             wall_time = time.perf_counter() - start_time
             trajectory.steps = steps
-            trajectory.end_time = datetime.now(timezone.utc)
+            trajectory.end_time = datetime.now(UTC)
             trajectory.total_subcalls = self.budget_manager.total_used
 
             usage = self._build_usage(wall_time)
@@ -221,7 +281,7 @@ class RLMOrchestrator:
             # Handle unexpected errors
             wall_time = time.perf_counter() - start_time
             trajectory.steps = steps
-            trajectory.end_time = datetime.now(timezone.utc)
+            trajectory.end_time = datetime.now(UTC)
             trajectory.total_subcalls = self.budget_manager.total_used
 
             usage = self._build_usage(wall_time)
@@ -271,7 +331,7 @@ class RLMOrchestrator:
 
             # Run iteration
             logger.debug(f"Running iteration {iteration}")
-            iteration_result = self.agent.run_iteration(
+            iteration_result = await self.agent.run_iteration(
                 query=query,
                 context=context,
                 history=steps,
@@ -302,6 +362,18 @@ class RLMOrchestrator:
                 if citation:
                     citations.append(citation)
 
+            # Run requested sub-explorations concurrently
+            if iteration_result.spawn and self.can_spawn:
+                fan_out_start = time.perf_counter()
+                sub_results = await self._fan_out(iteration_result.spawn)
+                self._merge_sub_explorations(
+                    sub_results,
+                    step,
+                    accumulated_findings,
+                    citations,
+                    duration_ms=(time.perf_counter() - fan_out_start) * 1000,
+                )
+
             # Reset iteration budget
             self.budget_manager.reset_iteration()
 
@@ -317,6 +389,153 @@ class RLMOrchestrator:
         logger.info(f"Max iterations ({self.max_iterations}) reached")
         return "Max iterations reached"
 
+    async def run_subexploration(
+        self,
+        query: str,
+        context_hints: list[str] | None = None,
+    ) -> SubExplorationResult:
+        """Run this orchestrator as a child of a fan-out.
+
+        Unlike explore(), budget exhaustion and errors are reported in the
+        result rather than raised, so one failing child does not cancel its
+        siblings. The parent's timeout bounds the child's wall time.
+
+        Args:
+            query: Sub-question to explore
+            context_hints: Optional hints about where to look
+
+        Returns:
+            SubExplorationResult with the child's findings and usage
+        """
+        self._cache_baseline = replace(self.agent.cache_usage)
+        self._child_tokens = 0
+        self._child_model_calls = 0
+        self._child_cache_usage = CacheStats()
+        self.agent.max_spawn = self.config.max_fanout if self.can_spawn else 0
+
+        steps: list[ExplorationStep] = []
+        accumulated_findings: list[str] = []
+        citations: list[Citation] = []
+        error: str | None = None
+
+        try:
+            await self._exploration_loop(
+                query=query,
+                context_hints=context_hints or [],
+                steps=steps,
+                accumulated_findings=accumulated_findings,
+                all_findings=[],
+                citations=citations,
+            )
+        except BudgetExceededError:
+            logger.debug(f"Sub-exploration used its budget slice: {query[:60]}")
+        except Exception as e:
+            logger.warning(f"Sub-exploration failed ({query[:60]}): {e}")
+            error = str(e)
+
+        return SubExplorationResult(
+            query=query,
+            findings=accumulated_findings,
+            citations=citations,
+            iterations=len(steps),
+            subcalls_used=self.budget_manager.total_used,
+            tokens_used=self.agent.total_tokens + self._child_tokens,
+            model_calls=self.agent.total_iterations + self._child_model_calls,
+            error=error,
+            cache_usage=self._exploration_cache_usage(),
+        )
+
+    async def _fan_out(
+        self, requests: list[dict[str, Any]]
+    ) -> list[SubExplorationResult]:
+        """Run one child exploration per spawn request concurrently.
+
+        Args:
+            requests: Spawn requests with ``query`` and ``context_hints``
+
+        Returns:
+            Results for the children that fit in the remaining budget
+        """
+        assert self.child_factory is not None
+        budgets = self.budget_manager.split(
+            len(requests), share=self.config.fanout_budget_share
+        )
+        if len(budgets) < len(requests):
+            logger.info(
+                f"Budget allows {len(budgets)} of {len(requests)} sub-explorations"
+            )
+
+        children = [
+            RLMOrchestrator(
+                agent=self.child_factory(budget),
+                budget_manager=budget,
+                cache=self.cache,
+                config=self.config,
+                max_iterations=self.config.child_max_iterations,
+                child_factory=self.child_factory,
+                spawn_depth=self.spawn_depth + 1,
+            )
+            for budget in budgets
+        ]
+
+        logger.info(
+            f"Spawning {len(children)} sub-explorations at depth {self.spawn_depth + 1}"
+        )
+        return list(
+            await asyncio.gather(
+                *(
+                    child.run_subexploration(
+                        request["query"], request.get("context_hints")
+                    )
+                    for child, request in zip(children, requests, strict=True)
+                )
+            )
+        )
+
+    def _merge_sub_explorations(
+        self,
+        results: list[SubExplorationResult],
+        step: ExplorationStep,
+        accumulated_findings: list[str],
+        citations: list[Citation],
+        duration_ms: float = 0.0,
+    ) -> None:
+        """Merge child findings, citations and usage into this exploration.
+
+        The fan-out is recorded on the spawning step as a ``spawn`` tool call
+        summarising each child.
+        """
+        summary: list[str] = []
+        for result in results:
+            self._child_tokens += result.tokens_used
+            self._child_model_calls += result.model_calls
+            self._child_cache_usage = _add_cache_usage(
+                self._child_cache_usage, result.cache_usage
+            )
+
+            for finding in result.findings:
+                if finding not in accumulated_findings:
+                    accumulated_findings.append(finding)
+            citations.extend(result.citations)
+
+            status = f"error: {result.error}" if result.error else (
+                f"{len(result.findings)} findings"
+            )
+            summary.append(
+                f"- {result.query}: {status} "
+                f"({result.iterations} iterations, {result.subcalls_used} sub-calls)"
+            )
+
+        step.tool_calls.append(
+            ToolCall(
+                tool_name="spawn",
+                arguments={"queries": [result.query for result in results]},
+                result="\n".join(summary),
+                duration_ms=duration_ms,
+                timestamp=datetime.now(UTC),
+            )
+        )
+
     def _build_initial_context(self, context_hints: list[str]) -> str:
         """Build initial context from hints."""
         if not context_hints:
@@ -358,18 +577,40 @@ class RLMOrchestrator:
 
         return "\n".join(parts)
 
+    def _exploration_cache_usage(self) -> CacheStats:
+        """Cache lookups and hits of this exploration and its children.
+
+        Counted by the exploration's own llm_query tools rather than from the
+        cache's global stats, which other explorations sharing the cache
+        also move.
+        """
+        own = self.agent.cache_usage
+        baseline = self._cache_baseline
+        return _add_cache_usage(
+            CacheStats(
+                total_requests=own.total_requests - baseline.total_requests,
+                hits=own.hits - baseline.hits,
+                misses=own.misses - baseline.misses,
+                remote_hits=own.remote_hits - baseline.remote_hits,
+            ),
+            self._child_cache_usage,
+        )
+
     def _build_usage(self, wall_time: float) -> RLMUsage:
         """Build usage metrics."""
-        cache_stats = self.cache.get_stats()
+        cache_usage = self._exploration_cache_usage()
 
         return RLMUsage(
             subcall_count=self.budget_manager.total_used,
-            cached_subcalls=cache_stats.hits,
-            total_tokens=self.agent.total_tokens,
+            cached_subcalls=cache_usage.hits,
+            total_tokens=self.agent.total_tokens + self._child_tokens,
             wall_time_seconds=wall_time,
-            model_calls=self.agent.total_iterations,
+            model_calls=self.agent.total_iterations + self._child_model_calls,
             budget_limit=self.budget_manager.max_total,
             budget_remaining=self.budget_manager.remaining,
+            cache_lookups=cache_usage.total_requests,
+            shared_cache_hits=cache_usage.remote_hits,
+            cache_bytes=self.cache.get_stats().bytes,
         )
 
     def explore_sync(
@@ -411,3 +652,13 @@ class RLMOrchestrator:
             f"RLMOrchestrator(explorations={self._exploration_count}, "
             f"budget={self.budget_manager.remaining}/{self.budget_manager.max_total})"
         )
+
+
+def _add_cache_usage(a: CacheStats, b: CacheStats) -> CacheStats:
+    """Sum the lookup and hit counters of two cache usage records."""
+    return CacheStats(
+        total_requests=a.total_requests + b.total_requests,
+        hits=a.hits + b.hits,
+        misses=a.misses + b.misses,
+        remote_hits=a.remote_hits + b.remote_hits,
+    )
@@ -6,14 +6,18 @@ Provides a restricted set of read-only tools for codebase exploration.
 from __future__ import annotations
 
 from src.workers.rlm.tools.file_tools import FileTools
+from src.workers.rlm.tools.grep_index import GrepIndex
 from src.workers.rlm.tools.llm_query import LLMQueryResult, LLMQueryTool
+from src.workers.rlm.tools.parse_cache import ParsedFileCache
 from src.workers.rlm.tools.registry import REPLToolSurface, ToolInvocation
 from src.workers.rlm.tools.symbol_tools import SymbolTools
 
 __all__ = [
     "FileTools",
+    "GrepIndex",
     "LLMQueryResult",
     "LLMQueryTool",
+    "ParsedFileCache",
     "REPLToolSurface",
     "SymbolTools",
     "ToolInvocation",
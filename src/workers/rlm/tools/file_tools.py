@@ -15,6 +15,7 @@ from typing import Any
 
 from src.core.exceptions import RLMToolError
 from src.workers.rlm.models import GrepMatch
+from src.workers.rlm.tools.grep_index import GrepIndex
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,8 @@ class FileTools:
 
     Attributes:
         repo_root: Root path of the repository (sandbox boundary)
+        grep_index: Grep engine for the repository; pass a shared instance
+            to reuse its file list and index across tool instances
 
     Example:
         tools = FileTools(repo_root="/path/to/repo")
@@ -37,12 +40,15 @@ class FileTools:
     """
 
     repo_root: str
+    grep_index: GrepIndex | None = None
 
     def __post_init__(self) -> None:
         """Validate and normalize repo root."""
         self._root = Path(self.repo_root).resolve()
         if not self._root.is_dir():
             raise RLMToolError(f"Repository root does not exist: {self.repo_root}")
+        if self.grep_index is None:
+            self.grep_index = GrepIndex(self._root)
 
     def _validate_path(self, path: str) -> Path:
         """Validate path is within repository root.
@@ -213,6 +219,9 @@ class FileTools:
     ) -> list[GrepMatch]:
         """Search for pattern in files.
 
+        Directories are searched recursively, skipping ignored paths
+        (.gitignore rules and VCS/cache directories) and binary files.
+
         Args:
             pattern: Regular expression pattern to search for
             paths: List of file paths or directories to search
@@ -232,55 +241,19 @@ class FileTools:
         except re.error as e:
             raise RLMToolError(f"Invalid regex pattern: {pattern}") from e
 
-        matches: list[GrepMatch] = []
-
-        # Collect files to search
-        files_to_search: list[Path] = []
+        targets: list[Path] = []
         for path in paths:
             validated = self._validate_path(path)
-            if validated.is_file():
-                files_to_search.append(validated)
-            elif validated.is_dir():
-                # Search all files in directory recursively
-                for file_path in validated.rglob("*"):
-                    if file_path.is_file():
-                        files_to_search.append(file_path)
-
-        # Search files
-        for file_path in files_to_search:
-            if len(matches) >= max_matches:
-                break
-
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="replace")
-                lines = content.splitlines()
-            except (OSError, UnicodeDecodeError):
-                continue  # Skip unreadable files
-
-            for i, line in enumerate(lines):
-                if regex.search(line):
-                    # Get context lines
-                    start = max(0, i - context_lines)
-                    end = min(len(lines), i + context_lines + 1)
-
-                    context_before = lines[start:i]
-                    context_after = lines[i + 1 : end]
-
-                    rel_path = str(file_path.relative_to(self._root))
-                    match = GrepMatch(
-                        file_path=rel_path,
-                        line_number=i + 1,  # 1-indexed
-                        line_content=line,
-                        context_before=context_before,
-                        context_after=context_after,
-                    )
-                    matches.append(match)
-
-                    if len(matches) >= max_matches:
-                        logger.warning(f"grep hit max_matches ({max_matches})")
-                        break
-
-        return matches
+            if validated.is_file() or validated.is_dir():
+                targets.append(validated)
+
+        assert self.grep_index is not None
+        return self.grep_index.search(
+            regex,
+            targets,
+            context_lines=context_lines,
+            max_matches=max_matches,
+        )
 
     def file_exists(self, path: str) -> bool:
         """Check if file exists.
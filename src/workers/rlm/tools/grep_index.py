@@ -0,0 +1,839 @@
+"""Indexed grep engine for RLM file tools.
+
+RLM agents grep the same tree many times per exploration. GrepIndex keeps
+that cheap by:
+
+- caching the list of searchable files (honouring .gitignore files and
+  skipping VCS/cache directories), revalidated by directory mtimes;
+- remembering which files are binary so they are never read again;
+- checking literals every match requires against the raw file bytes
+  before decoding or running the regex;
+- keeping a per-file trigram signature (a small bitmap of hashed byte
+  trigrams) used to skip files without reading them. Signatures are built
+  by a background warm-up after a search, never on the request path;
+- scanning candidates through mmap, searching the whole buffer and
+  computing line numbers only around matches.
+
+When ripgrep is installed and enabled it is used instead of the trigram
+signatures to shortlist files by a literal the pattern requires. Matching
+semantics stay those of Python ``re`` applied line by line.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import logging
+import mmap
+import os
+import re
+import shutil
+import string
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.workers.rlm.models import GrepMatch
+
+logger = logging.getLogger(__name__)
+
+# Directories never searched when walking the tree
+DEFAULT_IGNORED_DIRS = frozenset({
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    "node_modules",
+    ".venv",
+    "venv",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+})
+
+# Bytes inspected for NUL when deciding whether a file is binary
+_BINARY_SNIFF_BYTES = 8192
+
+# Signature size bounds in bits (powers of two)
+_MIN_SIGNATURE_BITS = 1 << 10
+_MAX_SIGNATURE_BITS = 1 << 17
+
+# Characters that never contribute to a required literal. Under IGNORECASE
+# "i", "k" and "s" also match non-ASCII letters (dotless i, Kelvin sign,
+# long s), so their lowercase byte trigrams are not reliable.
+_UNINDEXABLE_CHARS = frozenset("\r\n\x00\ufffd")
+_FOLDING_CHARS = frozenset("iks")
+
+# Counted repetition, e.g. "{2}", "{1,3}", "{,5}"
+_COUNTED_REPEAT = re.compile(r"\{(\d*),?(\d*)\}")
+_LOOKAROUNDS = ("(?=", "(?!", "(?<=", "(?<!")
+
+
+@dataclass
+class _IgnoreRule:
+    """One pattern from a .gitignore file."""
+
+    pattern: str
+    base: str
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """Check the rule against a repo-relative POSIX path."""
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1 :]
+        if self.anchored:
+            return fnmatch.fnmatchcase(rel_path, self.pattern)
+        return fnmatch.fnmatchcase(rel_path.rsplit("/", 1)[-1], self.pattern)
+
+
+def _parse_gitignore(path: Path, base: str) -> list[_IgnoreRule]:
+    """Parse a .gitignore file into rules relative to ``base``."""
+    try:
+        text = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+
+    rules: list[_IgnoreRule] = []
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if line.startswith("**/"):
+            line = line[3:]
+        anchored = "/" in line
+        line = line.lstrip("/")
+        if line:
+            rules.append(_IgnoreRule(line, base, negate, dir_only, anchored))
+    return rules
+
+
+def _is_ignored(rules: list[_IgnoreRule], rel_path: str, is_dir: bool) -> bool:
+    """Apply rules in order; the last matching rule wins."""
+    ignored = False
+    for rule in rules:
+        if rule.matches(rel_path, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+def _scan_pattern(pattern: str, flags: int) -> tuple[list[tuple[str, bool]], bool]:
+    """Find literal runs every match contains and check line safety.
+
+    A deliberately small scanner rather than a full regex parser: only
+    literals outside groups are collected, and anything it does not
+    understand ends the current run, so the runs it returns are always
+    required. A top-level alternation means no literal is required.
+
+    Args:
+        pattern: Regex source
+        flags: Compiled flags, including inline ones
+
+    Returns:
+        Tuple of ((text, ignore_case) runs, whether the pattern may be
+        searched over a whole buffer)
+    """
+    if flags & re.VERBOSE:
+        return [], False
+
+    icase = bool(flags & re.IGNORECASE)
+    runs: list[tuple[str, bool]] = []
+    current: list[str] = []
+    line_safe = True
+    alternation = False
+    depth = 0
+    i = 0
+    length = len(pattern)
+
+    def flush() -> None:
+        if current:
+            runs.append(("".join(current), icase))
+            current.clear()
+
+    def literal(char: str) -> None:
+        usable = char not in _UNINDEXABLE_CHARS and not (
+            icase and (not char.isascii() or char.lower() in _FOLDING_CHARS)
+        )
+        if depth == 0 and usable:
+            current.append(char)
+        else:
+            flush()
+
+    while i < length:
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            i += 2
+            if escaped in ("A", "Z"):
+                line_safe = False
+            if escaped and not escaped.isalnum():
+                literal(escaped)
+            else:
+                # Skip the body of numeric and named escapes (\x41, \N{...})
+                i = _escape_end(pattern, i, escaped)
+                flush()
+        elif char == "[":
+            i = _class_end(pattern, i)
+            flush()
+        elif char == "(":
+            if pattern.startswith(_LOOKAROUNDS, i):
+                line_safe = False
+            depth += 1
+            i += 1
+            flush()
+        elif char == ")":
+            depth -= 1
+            i += 1
+            flush()
+        elif char == "|":
+            alternation = alternation or depth == 0
+            i += 1
+            flush()
+        elif char in "*?":
+            # The preceding literal is optional
+            if current:
+                current.pop()
+            i += 1
+            flush()
+        elif char == "+":
+            i += 1
+            flush()
+        elif char == "{" and (repeat := _COUNTED_REPEAT.match(pattern, i)):
+            if current and not int(repeat.group(1) or 0):
+                current.pop()
+            i = repeat.end()
+            flush()
+        elif char in ".^$":
+            i += 1
+            flush()
+        else:
+            literal(char)
+            i += 1
+    flush()
+
+    return ([] if alternation else runs), line_safe
+
+
+def _escape_end(pattern: str, start: int, escaped: str) -> int:
+    """Return the index just past the body of the escape ending at ``start``."""
+    if escaped == "N" and pattern.startswith("{", start):
+        end = pattern.find("}", start)
+        return len(pattern) if end == -1 else end + 1
+    if escaped.isdigit():
+        width, digits = 2, string.digits
+    else:
+        width, digits = {"x": 2, "u": 4, "U": 8}.get(escaped, 0), string.hexdigits
+    end = start
+    while end < min(start + width, len(pattern)) and pattern[end] in digits:
+        end += 1
+    return end
+
+
+def _class_end(pattern: str, start: int) -> int:
+    """Return the index just past the character class opening at ``start``."""
+    i = start + 1
+    if pattern.startswith("^", i):
+        i += 1
+    if pattern.startswith("]", i):
+        i += 1
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _trigrams(data: bytes) -> set[bytes]:
+    """Return the distinct byte trigrams of ``data``."""
+    return {data[i : i + 3] for i in range(len(data) - 2)}
+
+
+def _signature_bits(distinct: int) -> int:
+    """Pick a signature size giving roughly 4 bits per distinct trigram."""
+    bits = _MIN_SIGNATURE_BITS
+    while bits < distinct * 4 and bits < _MAX_SIGNATURE_BITS:
+        bits <<= 1
+    return bits
+
+
+def _signature(grams: set[bytes] | frozenset[bytes], bits: int) -> int:
+    """Hash trigrams into a bitmap of ``bits`` bits, returned as an int."""
+    buf = bytearray(bits // 8)
+    mask = bits - 1
+    for gram in grams:
+        bit = hash(gram) & mask
+        buf[bit >> 3] |= 1 << (bit & 7)
+    return int.from_bytes(buf, "little")
+
+
+@dataclass
+class _FileEntry:
+    """Cached facts about one file, valid while (mtime_ns, size) hold."""
+
+    mtime_ns: int
+    size: int
+    binary: bool
+    signature: int | None = None
+    signature_bits: int = 0
+
+
+@dataclass
+class _GrepQuery:
+    """A compiled pattern plus what the index can use to prune files.
+
+    Attributes:
+        regex: Pattern applied to each line (the matching semantics)
+        buffer_regex: MULTILINE variant used to locate candidate lines in a
+            whole buffer, or None when the pattern must be run per line
+        literals: (text, ignore_case) literal runs every matching line
+            must contain
+        trigrams: Lowercased byte trigrams of those literals
+    """
+
+    regex: re.Pattern[str]
+    buffer_regex: re.Pattern[str] | None
+    literals: list[tuple[str, bool]]
+    trigrams: frozenset[bytes]
+    _masks: dict[int, int] = field(default_factory=dict)
+
+    @classmethod
+    def plan(cls, regex: re.Pattern[str]) -> _GrepQuery:
+        """Analyse a compiled pattern for literals and line safety."""
+        runs, line_safe = _scan_pattern(regex.pattern, regex.flags)
+        literals = [run for run in runs if len(run[0].encode("utf-8")) >= 3]
+        trigrams = frozenset(
+            gram
+            for text, _ in literals
+            for gram in _trigrams(text.encode("utf-8").lower())
+        )
+        buffer_regex = None
+        if line_safe:
+            buffer_regex = re.compile(regex.pattern, regex.flags | re.MULTILINE)
+        return cls(regex, buffer_regex, literals, trigrams)
+
+    def mask(self, bits: int) -> int:
+        """Signature mask of the required trigrams for a given size."""
+        mask = self._masks.get(bits)
+        if mask is None:
+            mask = _signature(self.trigrams, bits)
+            self._masks[bits] = mask
+        return mask
+
+
+class GrepIndex:
+    """Cached, ignore-aware grep engine for one repository root.
+
+    Safe to share between FileTools instances and threads; the file list is
+    rebuilt only when a directory or .gitignore file changes, and per-file
+    entries are rebuilt only when a file's (mtime_ns, size) changes.
+
+    Attributes:
+        root: Resolved repository root
+        max_file_bytes: Files larger than this are not searched
+        use_ripgrep: Shortlist files with ripgrep when it is installed
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        max_file_bytes: int = 10_000_000,
+        use_ripgrep: bool = False,
+        background_warm_up: bool = True,
+    ) -> None:
+        """Initialize the index. The tree is scanned lazily on first use.
+
+        Args:
+            root: Repository root path
+            max_file_bytes: Maximum size of a searched file
+            use_ripgrep: Whether to use ripgrep for shortlisting when present
+            background_warm_up: Build trigram signatures of searched files
+                in a background thread after a search
+        """
+        self.root = Path(root).resolve()
+        self.max_file_bytes = max_file_bytes
+        self.use_ripgrep = use_ripgrep
+        self._rg_path = shutil.which("rg") if use_ripgrep else None
+        self.background_warm_up = background_warm_up
+        self._warm_up_thread: threading.Thread | None = None
+
+        self._lock = threading.Lock()
+        self._files: list[str] = []
+        self._watched: dict[str, int] = {}
+        self._pruned_dirs: set[str] = set()
+        self._scanned = False
+        self._entries: dict[str, _FileEntry] = {}
+        self._stats = {
+            "rescans": 0,
+            "files_scanned": 0,
+            "files_pruned": 0,
+        }
+
+    def search(
+        self,
+        regex: re.Pattern[str],
+        targets: list[Path],
+        context_lines: int = 2,
+        max_matches: int = 100,
+    ) -> list[GrepMatch]:
+        """Search files and directories for a compiled pattern.
+
+        Args:
+            regex: Compiled pattern, applied line by line
+            targets: Validated absolute files or directories inside root
+            context_lines: Number of context lines before/after a match
+            max_matches: Maximum number of matches to return
+
+        Returns:
+            List of GrepMatch objects in file order
+        """
+        query = _GrepQuery.plan(regex)
+        candidates = self._candidate_files(targets, query)
+
+        matches: list[GrepMatch] = []
+        for rel_path in candidates:
+            remaining = max_matches - len(matches)
+            if remaining <= 0:
+                logger.warning(f"grep hit max_matches ({max_matches})")
+                break
+            matches.extend(self._search_file(rel_path, query, context_lines, remaining))
+
+        if self.background_warm_up and self._rg_path is None:
+            self._start_warm_up()
+        return matches
+
+    def warm_up(self) -> int:
+        """Build trigram signatures for text files searched so far.
+
+        Returns:
+            Number of signatures built
+        """
+        built = 0
+        for rel_path, entry in list(self._entries.items()):
+            if entry.binary or entry.signature is not None:
+                continue
+            if self._build_signature(rel_path, entry):
+                built += 1
+        return built
+
+    def files_under(self, rel_dir: str) -> list[str]:
+        """List searchable files under a directory.
+
+        Args:
+            rel_dir: Directory relative to root ("." for the root)
+
+        Returns:
+            Sorted repo-relative file paths
+        """
+        self._refresh_if_stale()
+        rel_dir = "" if rel_dir in ("", ".") else Path(rel_dir).as_posix()
+
+        if rel_dir and self._inside_pruned(rel_dir):
+            # Explicitly requested ignored directory: walk it uncached
+            files, _, _ = self._walk(rel_dir, apply_rules=False)
+            return sorted(files)
+
+        if not rel_dir:
+            return list(self._files)
+        prefix = rel_dir + "/"
+        start = bisect.bisect_left(self._files, prefix)
+        end = bisect.bisect_left(self._files, prefix + "\U0010ffff")
+        return self._files[start:end]
+
+    def invalidate(self) -> None:
+        """Drop the cached file list and all per-file entries."""
+        with self._lock:
+            self._scanned = False
+            self._files = []
+            self._watched = {}
+            self._pruned_dirs = set()
+            self._entries = {}
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get index statistics.
+
+        Returns:
+            Dictionary of counters and cache sizes
+        """
+        return {
+            **self._stats,
+            "files": len(self._files),
+            "entries": len(self._entries),
+            "signatures": sum(
+                1 for entry in self._entries.values() if entry.signature is not None
+            ),
+            "ripgrep": self._rg_path is not None,
+        }
+
+    def _start_warm_up(self) -> None:
+        """Run warm_up() in a daemon thread unless one is running."""
+        with self._lock:
+            if self._warm_up_thread is not None and self._warm_up_thread.is_alive():
+                return
+            if all(e.binary or e.signature is not None for e in self._entries.values()):
+                return
+            self._warm_up_thread = threading.Thread(
+                target=self.warm_up, name="grep-index-warm-up", daemon=True
+            )
+            self._warm_up_thread.start()
+
+    def _build_signature(self, rel_path: str, entry: _FileEntry) -> bool:
+        """Compute a file's signature if the entry still describes it."""
+        path = self.root / rel_path
+        try:
+            stat = path.stat()
+            if (stat.st_mtime_ns, stat.st_size) != (entry.mtime_ns, entry.size):
+                return False
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buf:
+                grams = _trigrams(buf[:].lower())
+        except (OSError, ValueError):
+            return False
+        bits = _signature_bits(len(grams))
+        signature = _signature(grams, bits)
+        # Set the size first: a signature is only used once it is not None
+        entry.signature_bits = bits
+        entry.signature = signature
+        return True
+
+    def _candidate_files(self, targets: list[Path], query: _GrepQuery) -> list[str]:
+        """Expand targets to an ordered, de-duplicated file list."""
+        candidates: list[str] = []
+        seen: set[str] = set()
+        rg_targets: list[str] = []
+        for target in targets:
+            rel = target.relative_to(self.root).as_posix()
+            rel = "." if rel in ("", ".") else rel
+            rg_targets.append(rel)
+            files = [rel] if target.is_file() else self.files_under(rel)
+            for rel_path in files:
+                if rel_path not in seen:
+                    seen.add(rel_path)
+                    candidates.append(rel_path)
+
+        if self._rg_path and query.literals:
+            shortlist = self._ripgrep_shortlist(query, rg_targets)
+            if shortlist is not None:
+                self._stats["files_pruned"] += sum(
+                    1 for rel_path in candidates if rel_path not in shortlist
+                )
+                candidates = [p for p in candidates if p in shortlist]
+        return candidates
+
+    def _ripgrep_shortlist(
+        self, query: _GrepQuery, rel_targets: list[str]
+    ) -> set[str] | None:
+        """Ask ripgrep which files contain the longest required literal.
+
+        Returns:
+            Set of repo-relative paths, or None if ripgrep failed
+        """
+        literal, ignore_case = max(query.literals, key=lambda run: len(run[0]))
+        cmd = [
+            str(self._rg_path),
+            "--files-with-matches",
+            "--fixed-strings",
+            "--no-ignore",
+            "--hidden",
+            "--text",
+            "--no-messages",
+        ]
+        if ignore_case:
+            cmd.append("--ignore-case")
+        cmd += ["--", literal, *rel_targets]
+
+        try:
+            proc = subprocess.run(
+                cmd, cwd=self.root, capture_output=True, text=True, timeout=60
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"ripgrep failed, falling back to index: {e}")
+            return None
+
+        if proc.returncode == 1:
+            return set()
+        if proc.returncode != 0:
+            logger.warning(f"ripgrep exited with {proc.returncode}: {proc.stderr.strip()}")
+            return None
+        return {
+            Path(os.path.normpath(line)).as_posix()
+            for line in proc.stdout.splitlines()
+            if line
+        }
+
+    def _search_file(
+        self,
+        rel_path: str,
+        query: _GrepQuery,
+        context_lines: int,
+        limit: int,
+    ) -> list[GrepMatch]:
+        """Search one file, using cached entries to skip it cheaply."""
+        path = self.root / rel_path
+        try:
+            stat = path.stat()
+        except OSError:
+            return []
+        if stat.st_size == 0 or stat.st_size > self.max_file_bytes:
+            return []
+
+        entry = self._entries.get(rel_path)
+        if entry is not None and (entry.mtime_ns, entry.size) != (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            entry = None
+        if entry is not None and (
+            entry.binary or not self._signature_allows(entry, query)
+        ):
+            self._stats["files_pruned"] += 1
+            return []
+
+        try:
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buf:
+                if entry is None:
+                    entry = _FileEntry(
+                        mtime_ns=stat.st_mtime_ns,
+                        size=stat.st_size,
+                        binary=buf.find(b"\x00", 0, _BINARY_SNIFF_BYTES) != -1,
+                    )
+                    self._entries[rel_path] = entry
+                    if entry.binary:
+                        return []
+
+                if any(
+                    buf.find(literal.encode("utf-8")) == -1
+                    for literal, ignore_case in query.literals
+                    if not ignore_case
+                ):
+                    self._stats["files_pruned"] += 1
+                    return []
+
+                text = str(buf, "utf-8", "replace")
+        except (OSError, ValueError):
+            return []  # Skip unreadable files
+
+        self._stats["files_scanned"] += 1
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        if query.buffer_regex is None:
+            return self._match_lines(rel_path, text, query, context_lines, limit)
+        return self._match_buffer(rel_path, text, query, context_lines, limit)
+
+    @staticmethod
+    def _signature_allows(entry: _FileEntry, query: _GrepQuery) -> bool:
+        """Check a file signature against the query's required trigrams."""
+        if entry.signature is None or not query.trigrams:
+            return True
+        mask = query.mask(entry.signature_bits)
+        return entry.signature & mask == mask
+
+    @staticmethod
+    def _match_buffer(
+        rel_path: str,
+        text: str,
+        query: _GrepQuery,
+        context_lines: int,
+        limit: int,
+    ) -> list[GrepMatch]:
+        """Locate matches in the whole buffer, then confirm per line."""
+        assert query.buffer_regex is not None
+        matches: list[GrepMatch] = []
+        length = len(text)
+        pos = 0
+        line_number = 1
+        counted_to = 0
+
+        while pos < length and len(matches) < limit:
+            found = query.buffer_regex.search(text, pos)
+            if found is None or found.start() >= length:
+                break
+            line_start = text.rfind("\n", 0, found.start()) + 1
+            line_end = text.find("\n", found.start())
+            if line_end == -1:
+                line_end = length
+            line = text[line_start:line_end]
+
+            # A buffer match may span lines; keep line-at-a-time semantics
+            if query.regex.search(line):
+                line_number += text.count("\n", counted_to, line_start)
+                counted_to = line_start
+                matches.append(
+                    GrepMatch(
+                        file_path=rel_path,
+                        line_number=line_number,
+                        line_content=line,
+                        context_before=_lines_before(text, line_start, context_lines),
+                        context_after=_lines_after(text, line_end, context_lines),
+                    )
+                )
+            pos = line_end + 1
+
+        return matches
+
+    @staticmethod
+    def _match_lines(
+        rel_path: str,
+        text: str,
+        query: _GrepQuery,
+        context_lines: int,
+        limit: int,
+    ) -> list[GrepMatch]:
+        """Run the pattern line by line (for string anchors and lookarounds)."""
+        lines = text.split("\n")
+        if text.endswith("\n"):
+            lines.pop()
+
+        matches: list[GrepMatch] = []
+        for i, line in enumerate(lines):
+            if query.regex.search(line):
+                start = max(0, i - context_lines)
+                matches.append(
+                    GrepMatch(
+                        file_path=rel_path,
+                        line_number=i + 1,
+                        line_content=line,
+                        context_before=lines[start:i],
+                        context_after=lines[i + 1 : i + context_lines + 1],
+                    )
+                )
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def _refresh_if_stale(self) -> None:
+        """Rescan the tree if any watched directory or ignore file changed."""
+        with self._lock:
+            if self._scanned and not self._tree_changed():
+                return
+            files, watched, pruned = self._walk("", apply_rules=True)
+            self._files = sorted(files)
+            self._watched = watched
+            self._pruned_dirs = pruned
+            self._scanned = True
+            self._stats["rescans"] += 1
+
+            live = set(self._files)
+            self._entries = {
+                path: entry for path, entry in self._entries.items() if path in live
+            }
+
+    def _tree_changed(self) -> bool:
+        """Compare watched directory and .gitignore mtimes with the disk."""
+        for rel_path, mtime_ns in self._watched.items():
+            try:
+                if os.stat(self.root / rel_path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _walk(
+        self, rel_start: str, apply_rules: bool
+    ) -> tuple[list[str], dict[str, int], set[str]]:
+        """Walk the tree collecting searchable files.
+
+        Returns:
+            Tuple of (files, watched mtimes, pruned directories)
+        """
+        files: list[str] = []
+        watched: dict[str, int] = {}
+        pruned: set[str] = set()
+        rules_by_dir: dict[str, list[_IgnoreRule]] = {}
+        start = self.root / rel_start if rel_start else self.root
+
+        for dirpath, dirnames, filenames in os.walk(start):
+            rel_dir = Path(dirpath).relative_to(self.root).as_posix()
+            rel_dir = "" if rel_dir == "." else rel_dir
+            try:
+                watched[rel_dir or "."] = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+
+            parent = rel_dir.rsplit("/", 1)[0] if "/" in rel_dir else ""
+            rules = list(rules_by_dir.get(parent, [])) if rel_dir else []
+            if apply_rules and ".gitignore" in filenames:
+                gitignore = Path(dirpath) / ".gitignore"
+                rules += _parse_gitignore(gitignore, rel_dir)
+                watched[f"{rel_dir}/.gitignore" if rel_dir else ".gitignore"] = (
+                    gitignore.stat().st_mtime_ns
+                )
+            rules_by_dir[rel_dir] = rules
+
+            kept: list[str] = []
+            for name in dirnames:
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                if name in DEFAULT_IGNORED_DIRS or (
+                    apply_rules and _is_ignored(rules, rel_path, is_dir=True)
+                ):
+                    pruned.add(rel_path)
+                else:
+                    kept.append(name)
+            dirnames[:] = kept
+
+            for name in filenames:
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                if apply_rules and _is_ignored(rules, rel_path, is_dir=False):
+                    continue
+                full_path = Path(dirpath) / name
+                if full_path.is_symlink() and not self._within_root(full_path):
+                    continue
+                files.append(rel_path)
+
+        return files, watched, pruned
+
+    def _inside_pruned(self, rel_dir: str) -> bool:
+        """Check whether a directory lies inside a pruned directory."""
+        parts = rel_dir.split("/")
+        return any(
+            "/".join(parts[: i + 1]) in self._pruned_dirs for i in range(len(parts))
+        )
+
+    def _within_root(self, path: Path) -> bool:
+        """Check that a symlink resolves inside the repository root."""
+        try:
+            path.resolve().relative_to(self.root)
+        except (OSError, RuntimeError, ValueError):
+            return False
+        return True
+
+
+def _lines_before(text: str, line_start: int, count: int) -> list[str]:
+    """Return up to ``count`` lines preceding the line at ``line_start``."""
+    lines: list[str] = []
+    end = line_start - 1
+    while count > 0 and end >= 0:
+        start = text.rfind("\n", 0, end) + 1
+        lines.append(text[start:end])
+        end = start - 1
+        count -= 1
+    lines.reverse()
+    return lines
+
+
+def _lines_after(text: str, line_end: int, count: int) -> list[str]:
+    """Return up to ``count`` lines following the line ending at ``line_end``."""
+    lines: list[str] = []
+    start = line_end + 1
+    length = len(text)
+    while count > 0 and start < length:
+        end = text.find("\n", start)
+        if end == -1:
+            end = length
+        lines.append(text[start:end])
+        start = end + 1
+        count -= 1
+    return lines
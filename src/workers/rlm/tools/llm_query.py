@@ -6,6 +6,7 @@ for focused analysis during exploration.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
@@ -13,7 +14,8 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from src.core.exceptions import BudgetExceededError, RLMError
 from src.workers.rlm.budget_manager import SubCallBudgetManager
-from src.workers.rlm.cache import SubCallCache
+from src.workers.rlm.cache import CacheStats, SubCallCache
+from src.workers.rlm.llm_adapter import create_message
 
 if TYPE_CHECKING:
     from anthropic import Anthropic
@@ -74,7 +76,7 @@ class LLMQueryTool:
     make focused LLM queries during exploration.
 
     Attributes:
-        client: Anthropic client for API calls
+        client: BaseLLMClient or Anthropic client for API calls
         budget_manager: Budget manager for tracking sub-calls
         cache: Cache for storing query results
         model: Model identifier to use for queries
@@ -95,13 +97,13 @@ class LLMQueryTool:
             model="claude-3-5-haiku-20241022",
         )
 
-        result = await tool.query(
+        result = await tool.aquery(
             prompt="What does this function do?",
             context="def foo(): return 42",
         )
     """
 
-    client: Any  # Anthropic client
+    client: Any  # BaseLLMClient or Anthropic client
     budget_manager: SubCallBudgetManager
     cache: SubCallCache
     model: str = "claude-3-5-haiku-20241022"
@@ -116,6 +118,12 @@ class LLMQueryTool:
     _total_tokens_used: int = field(default=0, init=False)
     _total_queries: int = field(default=0, init=False)
     _cached_queries: int = field(default=0, init=False)
+    _cache_lookups: int = field(default=0, init=False)
+    _cache_hits: int = field(default=0, init=False)
+    _shared_cache_hits: int = field(default=0, init=False)
+    _inflight: dict[tuple[str, str], asyncio.Task[LLMQueryResult]] = field(
+        default_factory=dict, init=False
+    )
 
     def query(
         self,
@@ -155,8 +163,10 @@ class LLMQueryTool:
 
         # Check cache first
         cached_result = self.cache.get(prompt, full_context)
+        self._cache_lookups += self.cache.enabled
         if cached_result is not None:
             self._cached_queries += 1
+            self._cache_hits += 1
             duration_ms = (time.perf_counter() - start_time) * 1000
             logger.debug(f"Cache hit for query (length: {len(prompt)})")
             return LLMQueryResult(
@@ -202,6 +212,114 @@ class LLMQueryTool:
             model=self.model,
         )
 
+    async def aquery(
+        self,
+        prompt: str,
+        context: str = "",
+        system_prompt: str | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMQueryResult:
+        """Execute an LLM query without blocking the event loop.
+
+        Budget is checked and recorded before the call is awaited, so
+        concurrent queries can never overrun the SubCallBudgetManager.
+        Identical queries issued concurrently share one in-flight call.
+
+        Args:
+            prompt: The question or instruction for the LLM
+            context: Additional context (code, text) to analyze
+            system_prompt: Optional override for system prompt
+            max_tokens: Optional override for max tokens
+
+        Returns:
+            LLMQueryResult with response and metadata
+
+        Raises:
+            BudgetExceededError: If sub-call budget is exhausted
+            RLMError: If the API call fails
+        """
+        start_time = time.perf_counter()
+        self._total_queries += 1
+
+        # Check budget before proceeding
+        if not self.budget_manager.can_make_call():
+            raise BudgetExceededError(
+                message="Cannot make LLM query: sub-call budget exceeded",
+                budget_limit=self.budget_manager.max_total,
+                subcalls_used=self.budget_manager.total_used,
+            )
+
+        full_context = self._build_context(prompt, context)
+
+        # Check cache first (in-process, then shared tier)
+        cached_result, shared_hit = await self.cache.alookup(prompt, full_context)
+        self._cache_lookups += self.cache.enabled
+        if cached_result is not None:
+            self._cached_queries += 1
+            self._cache_hits += 1
+            self._shared_cache_hits += shared_hit
+            logger.debug(f"Cache hit for query (length: {len(prompt)})")
+            return LLMQueryResult(
+                response=cached_result,
+                cached=True,
+                tokens_used=0,
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+                model=self.model,
+            )
+
+        key = (prompt, full_context)
+        task = self._inflight.get(key)
+        shared = task is not None
+
+        if task is None:
+            # Record the sub-call (this will raise if budget exceeded)
+            self.budget_manager.record_call()
+            task = asyncio.ensure_future(
+                self._amake_api_call(
+                    prompt=prompt,
+                    context=context,
+                    system_prompt=system_prompt or self.default_system_prompt,
+                    max_tokens=max_tokens or self.max_tokens,
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        try:
+            result = await asyncio.shield(task)
+        except Exception as e:
+            logger.error(f"LLM API call failed: {e}")
+            raise RLMError(f"LLM query failed: {e}") from e
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        if shared:
+            self._cached_queries += 1
+            return LLMQueryResult(
+                response=result.response,
+                cached=True,
+                tokens_used=0,
+                duration_ms=duration_ms,
+                model=self.model,
+            )
+
+        # Cache the result
+        await self.cache.aset(prompt, full_context, result.response)
+        self._total_tokens_used += result.tokens_used
+
+        logger.debug(
+            f"LLM query completed: {result.tokens_used} tokens, "
+            f"{duration_ms:.1f}ms, model={self.model}"
+        )
+
+        return LLMQueryResult(
+            response=result.response,
+            cached=False,
+            tokens_used=result.tokens_used,
+            duration_ms=duration_ms,
+            model=self.model,
+        )
+
     def _build_context(self, prompt: str, context: str) -> str:
         """Build the full context string for caching.
 
@@ -273,6 +391,45 @@ class LLMQueryTool:
             model=self.model,
         )
 
+    async def _amake_api_call(
+        self,
+        prompt: str,
+        context: str,
+        system_prompt: str,
+        max_tokens: int,
+    ) -> LLMQueryResult:
+        """Async variant of _make_api_call().
+
+        Args:
+            prompt: The prompt
+            context: Additional context
+            system_prompt: System prompt to use
+            max_tokens: Maximum tokens for response
+
+        Returns:
+            LLMQueryResult with response
+        """
+        if context:
+            user_content = f"Context:\n```\n{context}\n```\n\n{prompt}"
+        else:
+            user_content = prompt
+
+        message = await create_message(
+            self.client,
+            model=self.model,
+            max_tokens=max_tokens,
+            system=system_prompt,
+            user_content=user_content,
+        )
+
+        return LLMQueryResult(
+            response=message.text,
+            cached=False,
+            tokens_used=message.tokens_used,
+            duration_ms=0,  # Will be set by caller
+            model=self.model,
+        )
+
     def query_with_retry(
         self,
         prompt: str,
@@ -337,6 +494,22 @@ class LLMQueryTool:
         """Return number of queries served from cache."""
         return self._cached_queries
 
+    def cache_usage(self) -> CacheStats:
+        """Return this tool's own lookups and hits in the sub-call cache.
+
+        The cache may be shared by concurrent explorations; these counts only
+        cover queries made through this tool.
+
+        Returns:
+            CacheStats with total_requests, hits, misses and remote_hits set
+        """
+        return CacheStats(
+            total_requests=self._cache_lookups,
+            hits=self._cache_hits,
+            misses=self._cache_lookups - self._cache_hits,
+            remote_hits=self._shared_cache_hits,
+        )
+
     @property
     def cache_hit_rate(self) -> float:
         """Return cache hit rate as percentage."""
@@ -0,0 +1,270 @@
+"""Parsed-file cache for RLM symbol tools.
+
+An RLM trajectory often runs several symbol tools against the same file in
+consecutive iterations. ParsedFileCache memoises parser output keyed by
+(path, mtime_ns, size) in a bounded LRU, so a file is parsed again only
+after it changes. It also keeps a symbol name index across all files it has
+seen, which lets repo-wide find_symbol skip files that cannot match.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from src.workers.repo_mapper.cache import ASTContextCache
+from src.workers.repo_mapper.models import ASTContext, ParsedFile
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size) of a file when it was parsed
+FileSignature = tuple[int, int]
+
+
+def file_signature(path: str) -> FileSignature | None:
+    """Stat a file and return its cache signature.
+
+    Args:
+        path: Absolute file path
+
+    Returns:
+        (mtime_ns, size), or None if the file cannot be stat'ed
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class CachedParse:
+    """Memoised outcome of parsing one file.
+
+    Attributes:
+        signature: File signature the result is valid for
+        parsed: Parser output, or None if parsing raised a SyntaxError
+        error: Syntax error message when parsed is None
+    """
+
+    signature: FileSignature
+    parsed: ParsedFile | None
+    error: str | None = None
+
+
+class ParsedFileCache:
+    """Bounded LRU of parsed files plus a repo-wide symbol name index.
+
+    Thread-safe; one instance can be shared by every SymbolTools created
+    for the same repository.
+
+    Attributes:
+        max_entries: Maximum parsed files held (0 = unlimited)
+    """
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum parsed files held (0 = unlimited)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedParse] = OrderedDict()
+        self._names: dict[str, tuple[FileSignature, frozenset[str]]] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._seeded = 0
+
+    def get(self, path: str, signature: FileSignature) -> CachedParse | None:
+        """Look up a parse result that is still valid.
+
+        Args:
+            path: Absolute file path
+            signature: Current file signature
+
+        Returns:
+            CachedParse if present and current, None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry.signature != signature:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(path)
+            self._hits += 1
+            return entry
+
+    def put(
+        self,
+        path: str,
+        signature: FileSignature,
+        parsed: ParsedFile | None,
+        error: str | None = None,
+    ) -> CachedParse:
+        """Store a parse result and index its symbol names.
+
+        Args:
+            path: Absolute file path
+            signature: File signature the result is valid for
+            parsed: Parser output, or None for a syntax error
+            error: Syntax error message when parsed is None
+
+        Returns:
+            The stored CachedParse
+        """
+        entry = CachedParse(signature=signature, parsed=parsed, error=error)
+        names = frozenset(s.name for s in parsed.symbols) if parsed else frozenset()
+
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while self.max_entries > 0 and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            self._index_names(path, signature, names)
+        return entry
+
+    def indexed_names(
+        self, path: str, signature: FileSignature
+    ) -> frozenset[str] | None:
+        """Return the symbol names indexed for a file, if still current.
+
+        Args:
+            path: Absolute file path
+            signature: Current file signature
+
+        Returns:
+            Set of symbol names, or None if the file must be (re)parsed
+        """
+        with self._lock:
+            indexed = self._names.get(path)
+        if indexed is None or indexed[0] != signature:
+            return None
+        return indexed[1]
+
+    def paths_defining(self, name: str) -> set[str]:
+        """Return indexed files that define a symbol name.
+
+        Args:
+            name: Symbol name
+
+        Returns:
+            Set of absolute file paths
+        """
+        with self._lock:
+            return set(self._postings.get(name, ()))
+
+    def forget(self, path: str) -> None:
+        """Drop a file from the cache and name index.
+
+        Args:
+            path: Absolute file path
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+            self._index_names(path, None, frozenset())
+
+    def seed(self, context: ASTContext, extensions: list[str] | None = None) -> int:
+        """Seed the cache from a repo mapper AST context.
+
+        Files modified after the context was built are skipped.
+
+        Args:
+            context: AST context built by the repo mapper
+            extensions: Only seed files with these extensions (all if None)
+
+        Returns:
+            Number of files seeded
+        """
+        built_ns = int(context.created_at.timestamp() * 1e9)
+        seeded = 0
+        for path, parsed in context.files.items():
+            if extensions is not None and os.path.splitext(path)[1] not in extensions:
+                continue
+            signature = file_signature(path)
+            if signature is None or signature[0] > built_ns:
+                continue
+            self.put(path, signature, parsed)
+            seeded += 1
+
+        self._seeded += seeded
+        logger.debug(f"Seeded parsed-file cache with {seeded} files")
+        return seeded
+
+    def seed_from_ast_cache(
+        self,
+        ast_cache: ASTContextCache,
+        repo_path: str,
+        extensions: list[str] | None = None,
+    ) -> int:
+        """Seed from a persisted repo mapper context, if one exists.
+
+        Args:
+            ast_cache: Repo mapper AST context cache
+            repo_path: Resolved repository root the context was built for
+            extensions: Only seed files with these extensions (all if None)
+
+        Returns:
+            Number of files seeded (0 if no context is cached)
+        """
+        context = ast_cache.get(repo_path)
+        if context is None:
+            return 0
+        return self.seed(context, extensions)
+
+    def clear(self) -> None:
+        """Remove all entries and the name index."""
+        with self._lock:
+            self._entries.clear()
+            self._names.clear()
+            self._postings.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary of counters and sizes
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "indexed_files": len(self._names),
+                "indexed_names": len(self._postings),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "seeded": self._seeded,
+            }
+
+    def __len__(self) -> int:
+        """Return number of parsed files held."""
+        return len(self._entries)
+
+    def _index_names(
+        self,
+        path: str,
+        signature: FileSignature | None,
+        names: frozenset[str],
+    ) -> None:
+        """Replace a file's postings in the name index (lock held)."""
+        previous = self._names.pop(path, None)
+        if previous is not None:
+            for name in previous[1]:
+                paths = self._postings.get(name)
+                if paths is not None:
+                    paths.discard(path)
+                    if not paths:
+                        del self._postings[name]
+
+        if signature is None:
+            return
+        self._names[path] = (signature, names)
+        for name in names:
+            self._postings.setdefault(name, set()).add(path)
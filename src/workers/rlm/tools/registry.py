@@ -5,11 +5,12 @@ Aggregates all tools and provides unified dispatch and invocation logging.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 
 from src.core.exceptions import RLMToolError
 from src.workers.rlm.models import ToolCall
@@ -95,6 +96,9 @@ class REPLToolSurface:
     llm_query_tool: Any | None = None  # LLMQueryTool
     allowed_tools: set[str] | None = None
     _registry: ToolRegistry = field(default_factory=dict, init=False)
+    _async_registry: dict[str, Callable[..., Awaitable[Any]]] = field(
+        default_factory=dict, init=False
+    )
     _invocations: list[ToolInvocation] = field(default_factory=list, init=False)
 
     def __post_init__(self) -> None:
@@ -157,6 +161,9 @@ class REPLToolSurface:
                 self.llm_query_tool.query,
                 "Query LLM for analysis",
             )
+            aquery = getattr(self.llm_query_tool, "aquery", None)
+            if aquery is not None:
+                self._async_registry["llm_query"] = aquery
 
         logger.debug(f"Built tool registry with {len(self._registry)} tools")
 
@@ -214,67 +221,73 @@ class REPLToolSurface:
         timestamp = datetime.now(timezone.utc)
         start_time = time.perf_counter()
 
-        # Check if tool exists
-        if tool_name not in self._registry:
-            raise RLMToolError(f"Unknown tool: {tool_name}")
-
-        # Check if tool is allowed
-        if not self.is_tool_allowed(tool_name):
-            raise RLMToolError(
-                f"Tool not allowed: {tool_name}. "
-                f"Allowed tools: {self.allowed_tools}"
-            )
-
-        tool_func, _ = self._registry[tool_name]
+        tool_func = self._resolve_tool(tool_name)
 
         try:
             result = tool_func(**kwargs)
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # Format result for logging
-            result_str = self._format_result(result)
-
-            invocation = ToolInvocation(
-                tool_name=tool_name,
-                arguments=kwargs,
-                result=result_str,
-                success=True,
-                error=None,
-                duration_ms=duration_ms,
-                timestamp=timestamp,
-            )
-            self._invocations.append(invocation)
+        except Exception as e:
+            self._record_failure(tool_name, kwargs, e, start_time, timestamp)
+            raise
 
-            logger.debug(
-                f"Tool invocation: {tool_name}({self._format_args(kwargs)}) "
-                f"-> {len(result_str)} chars in {duration_ms:.1f}ms"
-            )
+        self._record_success(tool_name, kwargs, result, start_time, timestamp)
+        return result
 
-            return result
+    def invoke_safe(self, tool_name: str, **kwargs: Any) -> tuple[Any, str | None]:
+        """Invoke a tool, returning error instead of raising.
 
+        Args:
+            tool_name: Name of the tool to invoke
+            **kwargs: Arguments to pass to the tool
+
+        Returns:
+            Tuple of (result, error). If successful, error is None.
+            If failed, result is None and error contains the message.
+        """
+        try:
+            result = self.invoke(tool_name, **kwargs)
+            return result, None
         except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            invocation = ToolInvocation(
-                tool_name=tool_name,
-                arguments=kwargs,
-                result="",
-                success=False,
-                error=str(e),
-                duration_ms=duration_ms,
-                timestamp=timestamp,
-            )
-            self._invocations.append(invocation)
+            return None, str(e)
 
-            logger.warning(
-                f"Tool invocation failed: {tool_name}({self._format_args(kwargs)}) "
-                f"-> {e}"
-            )
+    async def ainvoke(self, tool_name: str, **kwargs: Any) -> Any:
+        """Invoke a tool by name without blocking the event loop.
+
+        Tools with a native async implementation (llm_query) are awaited
+        directly; blocking file and symbol tools run in a worker thread,
+        so several invocations can proceed concurrently.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            **kwargs: Arguments to pass to the tool
 
+        Returns:
+            Result from the tool
+
+        Raises:
+            RLMToolError: If tool is not found or not allowed
+        """
+        timestamp = datetime.now(timezone.utc)
+        start_time = time.perf_counter()
+
+        tool_func = self._resolve_tool(tool_name)
+        async_func = self._async_registry.get(tool_name)
+
+        try:
+            if async_func is not None:
+                result = await async_func(**kwargs)
+            else:
+                result = await asyncio.to_thread(tool_func, **kwargs)
+        except Exception as e:
+            self._record_failure(tool_name, kwargs, e, start_time, timestamp)
             raise
 
-    def invoke_safe(self, tool_name: str, **kwargs: Any) -> tuple[Any, str | None]:
-        """Invoke a tool, returning error instead of raising.
+        self._record_success(tool_name, kwargs, result, start_time, timestamp)
+        return result
+
+    async def ainvoke_safe(
+        self, tool_name: str, **kwargs: Any
+    ) -> tuple[Any, str | None]:
+        """Async variant of invoke_safe().
 
         Args:
             tool_name: Name of the tool to invoke
@@ -285,11 +298,94 @@ class REPLToolSurface:
             If failed, result is None and error contains the message.
         """
         try:
-            result = self.invoke(tool_name, **kwargs)
+            result = await self.ainvoke(tool_name, **kwargs)
             return result, None
         except Exception as e:
             return None, str(e)
 
+    def _resolve_tool(self, tool_name: str) -> Callable[..., Any]:
+        """Look up a tool, enforcing the allow-list.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            The tool callable
+
+        Raises:
+            RLMToolError: If tool is not found or not allowed
+        """
+        # Check if tool exists
+        if tool_name not in self._registry:
+            raise RLMToolError(f"Unknown tool: {tool_name}")
+
+        # Check if tool is allowed
+        if not self.is_tool_allowed(tool_name):
+            raise RLMToolError(
+                f"Tool not allowed: {tool_name}. "
+                f"Allowed tools: {self.allowed_tools}"
+            )
+
+        tool_func, _ = self._registry[tool_name]
+        return tool_func
+
+    def _record_success(
+        self,
+        tool_name: str,
+        kwargs: dict[str, Any],
+        result: Any,
+        start_time: float,
+        timestamp: datetime,
+    ) -> None:
+        """Record a successful invocation."""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        # Format result for logging
+        result_str = self._format_result(result)
+
+        invocation = ToolInvocation(
+            tool_name=tool_name,
+            arguments=kwargs,
+            result=result_str,
+            success=True,
+            error=None,
+            duration_ms=duration_ms,
+            timestamp=timestamp,
+        )
+        self._invocations.append(invocation)
+
+        logger.debug(
+            f"Tool invocation: {tool_name}({self._format_args(kwargs)}) "
+            f"-> {len(result_str)} chars in {duration_ms:.1f}ms"
+        )
+
+    def _record_failure(
+        self,
+        tool_name: str,
+        kwargs: dict[str, Any],
+        error: Exception,
+        start_time: float,
+        timestamp: datetime,
+    ) -> None:
+        """Record a failed invocation."""
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        invocation = ToolInvocation(
+            tool_name=tool_name,
+            arguments=kwargs,
+            result="",
+            success=False,
+            error=str(error),
+            duration_ms=duration_ms,
+            timestamp=timestamp,
+        )
+        self._invocations.append(invocation)
+
+        logger.warning(
+            f"Tool invocation failed: {tool_name}({self._format_args(kwargs)}) "
+            f"-> {error}"
+        )
+
     def _format_result(self, result: Any, max_length: int = 500) -> str:
         """Format a result for logging.
 
@@ -13,6 +13,12 @@ from typing import Any
 from src.core.exceptions import RLMToolError
 from src.workers.repo_mapper.models import ParsedFile, SymbolInfo
 from src.workers.repo_mapper.parsers.python_parser import PythonParser
+from src.workers.rlm.tools.grep_index import GrepIndex
+from src.workers.rlm.tools.parse_cache import (
+    CachedParse,
+    ParsedFileCache,
+    file_signature,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,16 +36,27 @@ class SymbolTools:
     Provides AST parsing and symbol extraction capabilities using
     the parsers from P03-F02.
 
+    Parse results are memoised in a ParsedFileCache keyed by
+    (path, mtime_ns, size), so repeated calls on an unchanged file do not
+    re-read or re-parse it.
+
     Attributes:
         repo_root: Root path of the repository
+        parse_cache: Parsed-file cache; pass a shared instance to reuse
+            parses across tool instances
+        file_index: File list used for repo-wide lookups; pass a shared
+            GrepIndex to reuse its cached file list
 
     Example:
         tools = SymbolTools(repo_root="/path/to/repo")
         symbols = tools.extract_symbols("src/main.py")
         parsed = tools.parse_ast("src/main.py")
+        definitions = tools.find_symbol("main")
     """
 
     repo_root: str
+    parse_cache: ParsedFileCache | None = None
+    file_index: GrepIndex | None = None
 
     def __post_init__(self) -> None:
         """Validate and normalize repo root."""
@@ -47,6 +64,10 @@ class SymbolTools:
         if not self._root.is_dir():
             raise RLMToolError(f"Repository root does not exist: {self.repo_root}")
         self._parsers: dict[str, Any] = {}
+        if self.parse_cache is None:
+            self.parse_cache = ParsedFileCache()
+        if self.file_index is None:
+            self.file_index = GrepIndex(self._root)
 
     def _get_parser(self, extension: str) -> Any:
         """Get parser for file extension.
@@ -120,43 +141,76 @@ class SymbolTools:
         extension = Path(path).suffix.lower()
         return extension in _PARSERS
 
-    def extract_symbols(self, path: str) -> list[SymbolInfo]:
-        """Extract symbols from a source file.
+    def _load(self, path: str) -> CachedParse | None:
+        """Parse a file, reusing the cached result while it is unchanged.
 
         Args:
             path: Path to file (relative to repo root)
 
         Returns:
-            List of SymbolInfo objects
+            CachedParse (with parsed=None on syntax errors), or None if the
+            file type is unsupported
 
         Raises:
-            RLMToolError: If file doesn't exist, is outside root, or unsupported
+            RLMToolError: If file doesn't exist, is outside root, or the
+                parser fails unexpectedly
         """
         file_path = self._validate_path(path)
 
         if not file_path.is_file():
             raise RLMToolError(f"Not a file: {path}")
 
-        extension = file_path.suffix.lower()
-        parser = self._get_parser(extension)
-
+        parser = self._get_parser(file_path.suffix.lower())
         if parser is None:
-            logger.warning(f"Unsupported file type for symbol extraction: {extension}")
-            return []
+            return None
+
+        assert self.parse_cache is not None
+        key = str(file_path)
+        # Stat before parsing so a concurrent edit is never cached as current
+        signature = file_signature(key)
+        if signature is not None:
+            cached = self.parse_cache.get(key, signature)
+            if cached is not None:
+                return cached
 
         try:
-            parsed = parser.parse_file(str(file_path))
-            logger.debug(
-                f"Extracted {len(parsed.symbols)} symbols from {path}"
-            )
-            return parsed.symbols
+            parsed = parser.parse_file(key)
+            entry = CachedParse(signature=signature or (0, 0), parsed=parsed)
+            logger.debug(f"Parsed {path}: {len(parsed.symbols)} symbols")
         except SyntaxError as e:
             logger.warning(f"Syntax error parsing {path}: {e}")
-            return []
+            entry = CachedParse(signature=signature or (0, 0), parsed=None, error=str(e))
         except Exception as e:
             logger.error(f"Error parsing {path}: {e}")
             raise RLMToolError(f"Failed to parse file: {path}") from e
 
+        if signature is not None:
+            self.parse_cache.put(key, signature, entry.parsed, entry.error)
+        return entry
+
+    def extract_symbols(self, path: str) -> list[SymbolInfo]:
+        """Extract symbols from a source file.
+
+        Args:
+            path: Path to file (relative to repo root)
+
+        Returns:
+            List of SymbolInfo objects
+
+        Raises:
+            RLMToolError: If file doesn't exist, is outside root, or unsupported
+        """
+        entry = self._load(path)
+
+        if entry is None:
+            extension = Path(path).suffix.lower()
+            logger.warning(f"Unsupported file type for symbol extraction: {extension}")
+            return []
+
+        if entry.parsed is None:
+            return []
+        return list(entry.parsed.symbols)
+
     def parse_ast(self, path: str) -> ParsedFile | None:
         """Parse file and return full AST information.
 
@@ -169,27 +223,14 @@ class SymbolTools:
         Raises:
             RLMToolError: If file doesn't exist or is outside root
         """
-        file_path = self._validate_path(path)
-
-        if not file_path.is_file():
-            raise RLMToolError(f"Not a file: {path}")
-
-        extension = file_path.suffix.lower()
-        parser = self._get_parser(extension)
+        entry = self._load(path)
+        extension = Path(path).suffix.lower()
 
-        if parser is None:
+        if entry is None:
             logger.warning(f"Unsupported file type for AST parsing: {extension}")
             return None
 
-        try:
-            parsed = parser.parse_file(str(file_path))
-            logger.debug(
-                f"Parsed AST for {path}: "
-                f"{len(parsed.symbols)} symbols, {len(parsed.imports)} imports"
-            )
-            return parsed
-        except SyntaxError as e:
-            logger.warning(f"Syntax error parsing {path}: {e}")
+        if entry.parsed is None:
             # Return minimal ParsedFile with error
             return ParsedFile(
                 path=path,
@@ -197,27 +238,29 @@ class SymbolTools:
                 symbols=[],
                 imports=[],
                 exports=[],
-                raw_content=f"# Syntax error: {e}",
+                raw_content=f"# Syntax error: {entry.error}",
                 line_count=0,
             )
-        except Exception as e:
-            logger.error(f"Error parsing {path}: {e}")
-            raise RLMToolError(f"Failed to parse file: {path}") from e
+        return entry.parsed
 
     def find_symbol(
         self,
         name: str,
-        paths: list[str],
+        paths: list[str] | None = None,
     ) -> list[SymbolInfo]:
         """Find symbols by name across multiple files.
 
         Args:
             name: Symbol name to search for (exact match)
-            paths: List of file paths to search
+            paths: List of file paths to search; searches every supported
+                file in the repository through the name index if omitted
 
         Returns:
             List of matching SymbolInfo objects
         """
+        if paths is None:
+            paths = self._files_defining(name)
+
         results: list[SymbolInfo] = []
 
         for path in paths:
@@ -231,6 +274,38 @@ class SymbolTools:
 
         return results
 
+    def _files_defining(self, name: str) -> list[str]:
+        """Find repository files defining a name via the name index.
+
+        Files whose indexed names are missing or stale are parsed (and so
+        indexed) first; every other file is answered from the index.
+
+        Args:
+            name: Symbol name
+
+        Returns:
+            Sorted absolute paths of files defining the name
+        """
+        assert self.parse_cache is not None and self.file_index is not None
+        supported = set(_PARSERS)
+        repo_files: set[str] = set()
+
+        for rel_path in self.file_index.files_under("."):
+            if Path(rel_path).suffix.lower() not in supported:
+                continue
+            key = str(self._root / rel_path)
+            repo_files.add(key)
+            signature = file_signature(key)
+            if signature is None:
+                continue
+            if self.parse_cache.indexed_names(key, signature) is None:
+                try:
+                    self._load(key)
+                except RLMToolError:
+                    continue
+
+        return sorted(self.parse_cache.paths_defining(name) & repo_files)
+
     def find_symbols_by_kind(
         self,
         path: str,
@@ -292,4 +367,5 @@ class SymbolTools:
         return {
             "repo_root": self.repo_root,
             "supported_extensions": self.get_supported_extensions(),
+            "parse_cache": self.parse_cache.get_stats() if self.parse_cache else None,
         }
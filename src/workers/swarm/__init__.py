@@ -7,6 +7,7 @@ in parallel and aggregating their findings into a unified report.
 from src.workers.swarm.aggregator import ResultAggregator
 from src.workers.swarm.config import SwarmConfig, get_swarm_config
 from src.workers.swarm.dispatcher import SwarmDispatcher
+from src.workers.swarm.incremental import FindingCache
 from src.workers.swarm.models import (
     ReviewerResult,
     ReviewFinding,
@@ -25,6 +26,7 @@ from src.workers.swarm.reviewers import (
     default_registry,
 )
 from src.workers.swarm.session import SwarmSessionManager
+from src.workers.swarm.snapshot import CodeSnapshotCache
 
 __all__ = [
     # Models
@@ -41,6 +43,8 @@ __all__ = [
     "SwarmRedisStore",
     # Session Management
     "SwarmSessionManager",
+    "CodeSnapshotCache",
+    "FindingCache",
     # Dispatcher
     "SwarmDispatcher",
     # Aggregator
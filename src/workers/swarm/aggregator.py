@@ -3,11 +3,19 @@
 This module provides the ResultAggregator class that merges findings from
 multiple specialized reviewers into a unified report, including duplicate
 detection and severity-based sorting.
+
+Duplicate detection indexes unique findings by file and root category, with
+each bucket sorted by start line, so a finding is only compared against
+findings whose line ranges overlap its own. Title similarity is checked
+against SequenceMatcher's cheap upper bounds before the full ratio is
+computed.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from difflib import SequenceMatcher
 
@@ -21,6 +29,111 @@ from src.workers.swarm.models import (
 )
 
 
+@dataclass
+class _IndexedFinding:
+    """A unique finding held in a :class:`_FindingIndex`.
+
+    Attributes:
+        position: Index of the finding in the unique list.
+        finding: The (possibly merged) finding.
+        matcher: SequenceMatcher with the lowercased title as its second
+            sequence, so the title is analysed once per comparison run.
+    """
+
+    position: int
+    finding: ReviewFinding
+    matcher: SequenceMatcher
+
+    @property
+    def start(self) -> int:
+        """First line covered by the finding."""
+        return self.finding.line_start
+
+    @property
+    def end(self) -> int:
+        """Last line covered by the finding."""
+        if self.finding.line_end is not None:
+            return self.finding.line_end
+        return self.finding.line_start
+
+
+def _category_key(finding: ReviewFinding) -> str | None:
+    """Return the root category, or None when the finding has no category.
+
+    Findings without a category match any category, see
+    :meth:`ResultAggregator._is_duplicate`.
+    """
+    return finding.category.split("/")[0] if finding.category else None
+
+
+class _FindingIndex:
+    """Unique findings bucketed by (file_path, root category).
+
+    Each bucket is sorted by start line and tracks its widest line span, so
+    the findings overlapping a line range are found with two bisections.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._buckets: dict[str, dict[str | None, list[_IndexedFinding]]] = defaultdict(dict)
+        self._spans: dict[tuple[str, str | None], int] = {}
+
+    def candidates(self, finding: ReviewFinding) -> list[_IndexedFinding]:
+        """Return indexed findings whose file, category and lines match.
+
+        Args:
+            finding: Finding to look up.
+
+        Returns:
+            Possible duplicates in unique-list order. Only title
+            similarity remains to be checked.
+        """
+        buckets = self._buckets.get(finding.file_path)
+        if not buckets or finding.line_start is None:
+            return []
+
+        category = _category_key(finding)
+        if category is None:
+            keys = list(buckets)
+        else:
+            keys = [key for key in (category, None) if key in buckets]
+
+        start = finding.line_start
+        end = finding.line_end if finding.line_end is not None else start
+
+        matches: list[_IndexedFinding] = []
+        for key in keys:
+            bucket = buckets[key]
+            span = self._spans[(finding.file_path, key)]
+            lo = bisect_left(bucket, start - span, key=lambda e: e.start)
+            hi = bisect_right(bucket, end, key=lambda e: e.start)
+            matches.extend(e for e in bucket[lo:hi] if e.end >= start)
+
+        matches.sort(key=lambda e: e.position)
+        return matches
+
+    def add(self, entry: _IndexedFinding) -> None:
+        """Index a unique finding.
+
+        Args:
+            entry: Entry to index.
+        """
+        file_path = entry.finding.file_path
+        category = _category_key(entry.finding)
+        insort(self._buckets[file_path].setdefault(category, []), entry, key=lambda e: e.start)
+        span_key = (file_path, category)
+        self._spans[span_key] = max(self._spans.get(span_key, 0), entry.end - entry.start)
+
+    def remove(self, entry: _IndexedFinding) -> None:
+        """Remove an indexed finding.
+
+        Args:
+            entry: Entry previously passed to :meth:`add`.
+        """
+        bucket = self._buckets[entry.finding.file_path][_category_key(entry.finding)]
+        bucket.remove(entry)
+
+
 class ResultAggregator:
     """Aggregates review results from multiple specialized reviewers.
 
@@ -121,6 +234,23 @@ class ResultAggregator:
             duplicates_removed=duplicates_removed,
         )
 
+    def merge_findings(
+        self,
+        findings: list[ReviewFinding],
+    ) -> tuple[list[ReviewFinding], int]:
+        """Merge duplicate findings from partial reviews of one target.
+
+        Used to combine the findings of a reviewer's shards before the
+        reviewer result is stored.
+
+        Args:
+            findings: Findings to merge.
+
+        Returns:
+            Tuple of (unique_findings, duplicates_removed_count).
+        """
+        return self._detect_duplicates(findings)
+
     def _text_similarity(self, text1: str, text2: str) -> float:
         """Calculate text similarity ratio between two strings.
 
@@ -266,8 +396,10 @@ class ResultAggregator:
     ) -> tuple[list[ReviewFinding], int]:
         """Identify and merge duplicate findings.
 
-        Iterates through findings, comparing each against already-seen
-        unique findings, merging duplicates when found.
+        Iterates through findings, merging each into the first already-seen
+        unique finding it duplicates (see :meth:`_is_duplicate`). Unique
+        findings are indexed by file, root category and line range, so each
+        finding is only compared against those it can duplicate.
 
         Args:
             findings: List of findings to deduplicate.
@@ -278,18 +410,42 @@ class ResultAggregator:
         if not findings:
             return [], 0
 
+        threshold = self._config.duplicate_similarity_threshold
+        index = _FindingIndex()
         unique: list[ReviewFinding] = []
         removed = 0
 
         for finding in findings:
-            merged = False
-            for i, existing in enumerate(unique):
-                if self._is_duplicate(finding, existing):
-                    unique[i] = self._merge_findings(existing, finding)
-                    removed += 1
-                    merged = True
+            title = finding.title.lower()
+            match = None
+            for entry in index.candidates(finding):
+                entry.matcher.set_seq1(title)
+                if (
+                    entry.matcher.real_quick_ratio() >= threshold
+                    and entry.matcher.quick_ratio() >= threshold
+                    and entry.matcher.ratio() >= threshold
+                ):
+                    match = entry
                     break
-            if not merged:
+
+            if match is None:
+                entry = _IndexedFinding(
+                    position=len(unique),
+                    finding=finding,
+                    matcher=SequenceMatcher(None, b=title),
+                )
                 unique.append(finding)
+                if finding.line_start is not None:
+                    index.add(entry)
+                continue
+
+            merged = self._merge_findings(match.finding, finding)
+            index.remove(match)
+            if merged.title != match.finding.title:
+                match.matcher.set_seq2(merged.title.lower())
+            match.finding = merged
+            index.add(match)
+            unique[match.position] = merged
+            removed += 1
 
         return unique, removed
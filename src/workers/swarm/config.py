@@ -24,6 +24,18 @@ class SwarmConfig(BaseModel):
         result_ttl_seconds: TTL for cached results in Redis
         duplicate_similarity_threshold: Threshold for duplicate detection (0.0-1.0)
         allowed_path_prefixes: Allowed path prefixes for review targets
+        snapshot_ttl_seconds: Lifetime of a session's shared code snapshot
+        snapshot_fetch_concurrency: Files read or downloaded at once when
+            extracting a snapshot
+        shard_token_budget: Estimated code tokens per review shard
+            (0 = review the whole target in one prompt)
+        max_concurrent_shards: Maximum review LLM calls in flight per worker
+        event_block_ms: Longest blocking read on a session event stream;
+            must stay below the Redis socket timeout
+        finding_cache_ttl_seconds: Lifetime of cached per-file findings used
+            by incremental reviews (0 disables the cache)
+        diff_context_lines: Unchanged lines reviewed around each changed
+            hunk in incremental reviews
     """
 
     task_timeout_seconds: int = Field(
@@ -64,6 +76,41 @@ class SwarmConfig(BaseModel):
         default=["src/", "docker/", "tests/"],
         description="Allowed path prefixes for review targets",
     )
+    snapshot_ttl_seconds: int = Field(
+        default=3600,
+        gt=0,
+        description="Lifetime of a session's shared code snapshot in seconds",
+    )
+    snapshot_fetch_concurrency: int = Field(
+        default=8,
+        gt=0,
+        description="Files read or downloaded at once during extraction",
+    )
+    shard_token_budget: int = Field(
+        default=0,
+        ge=0,
+        description="Estimated code tokens per review shard (0 disables sharding)",
+    )
+    max_concurrent_shards: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum review LLM calls in flight per worker",
+    )
+    event_block_ms: int = Field(
+        default=2000,
+        gt=0,
+        description="Longest blocking read on a session event stream in milliseconds",
+    )
+    finding_cache_ttl_seconds: int = Field(
+        default=604800,
+        ge=0,
+        description="TTL for cached per-file findings (default: 7 days, 0 disables)",
+    )
+    diff_context_lines: int = Field(
+        default=20,
+        ge=0,
+        description="Context lines reviewed around each changed hunk",
+    )
 
 
 def _parse_list(value: str) -> list[str]:
@@ -91,6 +138,13 @@ def get_swarm_config() -> SwarmConfig:
         - SWARM_RESULT_TTL_SECONDS
         - SWARM_DUPLICATE_SIMILARITY_THRESHOLD
         - SWARM_ALLOWED_PATH_PREFIXES (comma-separated)
+        - SWARM_SNAPSHOT_TTL_SECONDS
+        - SWARM_SNAPSHOT_FETCH_CONCURRENCY
+        - SWARM_SHARD_TOKEN_BUDGET
+        - SWARM_MAX_CONCURRENT_SHARDS
+        - SWARM_EVENT_BLOCK_MS
+        - SWARM_FINDING_CACHE_TTL_SECONDS
+        - SWARM_DIFF_CONTEXT_LINES
 
     Returns:
         SwarmConfig instance
@@ -106,6 +160,13 @@ def get_swarm_config() -> SwarmConfig:
         ("SWARM_AGGREGATE_TIMEOUT_SECONDS", "aggregate_timeout_seconds"),
         ("SWARM_MAX_CONCURRENT_SWARMS", "max_concurrent_swarms"),
         ("SWARM_RESULT_TTL_SECONDS", "result_ttl_seconds"),
+        ("SWARM_SNAPSHOT_TTL_SECONDS", "snapshot_ttl_seconds"),
+        ("SWARM_SNAPSHOT_FETCH_CONCURRENCY", "snapshot_fetch_concurrency"),
+        ("SWARM_SHARD_TOKEN_BUDGET", "shard_token_budget"),
+        ("SWARM_MAX_CONCURRENT_SHARDS", "max_concurrent_shards"),
+        ("SWARM_EVENT_BLOCK_MS", "event_block_ms"),
+        ("SWARM_FINDING_CACHE_TTL_SECONDS", "finding_cache_ttl_seconds"),
+        ("SWARM_DIFF_CONTEXT_LINES", "diff_context_lines"),
     ]
 
     for env_var, field_name in int_fields:
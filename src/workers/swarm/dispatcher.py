@@ -135,6 +135,7 @@ class SwarmDispatcher:
         target_path: str,
         reviewer_types: list[str] | None = None,
         timeout_seconds: int | None = None,
+        base_ref: str | None = None,
     ) -> str:
         """Spawn parallel reviewer tasks and return session_id.
 
@@ -147,13 +148,15 @@ class SwarmDispatcher:
                 defaults to the configured default_reviewers.
             timeout_seconds: Optional timeout for the entire dispatch operation.
                 If not provided, uses config.task_timeout_seconds.
+            base_ref: Optional git ref. Reviewers then review only the
+                changes since this ref.
 
         Returns:
             The session ID of the created swarm session.
         """
         # 1. Create session
         session = await self._session_manager.create_session(
-            target_path, reviewer_types
+            target_path, reviewer_types, base_ref=base_ref
         )
 
         # Update status to IN_PROGRESS
@@ -175,10 +178,10 @@ class SwarmDispatcher:
 
         # 4. Fire off reviewer tasks without blocking so the API can
         #    return immediately.  Each task stores its result to Redis;
-        #    ``collect_results`` polls Redis to gather them later.
+        #    ``collect_results`` waits on the session event stream.
         for reviewer in reviewers:
             asyncio.create_task(
-                self._run_reviewer(session.id, target_path, reviewer),
+                self._run_reviewer(session.id, target_path, reviewer, base_ref),
                 name=f"reviewer-{session.id}-{reviewer.reviewer_type}",
             )
 
@@ -189,6 +192,7 @@ class SwarmDispatcher:
         session_id: str,
         target_path: str,
         reviewer: SpecializedReviewer,
+        base_ref: str | None = None,
     ) -> None:
         """Run a single reviewer and store result.
 
@@ -199,9 +203,16 @@ class SwarmDispatcher:
             session_id: The swarm session ID.
             target_path: Path to the code being reviewed.
             reviewer: The specialized reviewer instance.
+            base_ref: Optional git ref for an incremental review. Only
+                passed to the executor when set.
         """
         try:
-            result = await self._executor(session_id, target_path, reviewer)
+            if base_ref is None:
+                result = await self._executor(session_id, target_path, reviewer)
+            else:
+                result = await self._executor(
+                    session_id, target_path, reviewer, base_ref=base_ref
+                )
         except Exception as e:
             # Store failed result
             logger.error(
@@ -273,25 +284,27 @@ class SwarmDispatcher:
     ) -> None:
         """Mark swarm as complete with final report.
 
-        Updates the session status to COMPLETE, sets the completion timestamp,
-        and publishes a SWARM_COMPLETE coordination message.
+        Stores the report on the session, then updates the session status to
+        COMPLETE with the completion timestamp and publishes a SWARM_COMPLETE
+        coordination message. The report is written first so that clients
+        following the session event stream can fetch it on completion.
 
         Args:
             session_id: The swarm session ID.
             unified_report: The final aggregated report.
         """
-        await self._session_manager.update_status(
-            session_id,
-            SwarmStatus.COMPLETE,
-            completed_at=datetime.now(UTC),
-        )
-
         # Store the unified report on the session
         session_key = f"{self._store._config.key_prefix}:session:{session_id}"
         await self._store._redis.hset(
             session_key, "unified_report", unified_report.model_dump_json()
         )
 
+        await self._session_manager.update_status(
+            session_id,
+            SwarmStatus.COMPLETE,
+            completed_at=datetime.now(UTC),
+        )
+
         await self._publish(
             "SWARM_COMPLETE",
             f"Swarm complete: {session_id}",
@@ -321,6 +334,7 @@ class SwarmDispatcher:
         target_path: str,
         reviewer_types: list[str] | None = None,
         timeout_seconds: int | None = None,
+        base_ref: str | None = None,
     ) -> UnifiedReport:
         """Execute full swarm flow: dispatch -> collect -> aggregate -> finalize.
 
@@ -334,6 +348,8 @@ class SwarmDispatcher:
                 defaults to the configured default_reviewers.
             timeout_seconds: Optional timeout for the dispatch operation.
                 If not provided, uses config.task_timeout_seconds.
+            base_ref: Optional git ref. Reviewers then review only the
+                changes since this ref.
 
         Returns:
             UnifiedReport containing aggregated findings from all reviewers.
@@ -343,7 +359,9 @@ class SwarmDispatcher:
             Exception: Re-raises any exception after marking the swarm as failed.
         """
         # 1. Dispatch parallel tasks
-        session_id = await self.dispatch_swarm(target_path, reviewer_types, timeout_seconds)
+        session_id = await self.dispatch_swarm(
+            target_path, reviewer_types, timeout_seconds, base_ref=base_ref
+        )
 
         try:
             # 2. Collect results
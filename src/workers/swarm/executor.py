@@ -9,15 +9,20 @@ public classes:
 * :class:`ResponseParser` -- parses LLM responses (JSON or markdown fallback)
   into :class:`ReviewFinding` instances.
 * :class:`ReviewExecutor` -- orchestrates extraction, LLM invocation, and
-  response parsing to produce a :class:`ReviewerResult`.
+  response parsing to produce a :class:`ReviewerResult`, reviewing large
+  targets shard by shard when a token budget is configured and only the
+  changed hunks when a base git ref is given.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
+import sys
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -25,11 +30,23 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from src.orchestrator.api.models.llm_config import AgentRole
-from src.workers.swarm.models import ReviewFinding, ReviewerResult, Severity
+from src.workers.swarm.aggregator import ResultAggregator
+from src.workers.swarm.config import SwarmConfig
+from src.workers.swarm.incremental import (
+    FindingCache,
+    changed_line_ranges,
+    content_hash,
+    excerpt_file,
+)
+from src.workers.swarm.models import ReviewerResult, ReviewFinding, Severity
+from src.workers.swarm.sharding import ReviewShard, estimate_tokens, plan_shards
 
 if TYPE_CHECKING:
+    import redis.asyncio as redis
+
     from src.infrastructure.llm.factory import LLMClientFactory
     from src.workers.swarm.reviewers.base import SpecializedReviewer
+    from src.workers.swarm.snapshot import CodeSnapshotCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +60,12 @@ ALLOWED_EXTENSIONS: frozenset[str] = frozenset(
 
 MAX_FILE_SIZE_BYTES: int = 500 * 1024  # 500 KB
 MAX_TOTAL_LINES: int = 5000
+DEFAULT_FETCH_CONCURRENCY: int = 8
+DEFAULT_DIFF_CONTEXT_LINES: int = 20
+
+# Bump when the prompt wording or response schema changes, so that cached
+# findings produced by the old prompt are no longer reused.
+REVIEW_PROMPT_VERSION: int = 1
 
 REVIEW_JSON_SCHEMA: str = """{
   "findings": [
@@ -76,13 +99,38 @@ class CodeFile:
 
     Attributes:
         path: Relative or absolute path of the file.
-        content: Full text content of the file.
-        lines: Number of lines in the file.
+        content: Full text content of the file, or of a line range of it.
+        lines: Number of lines in *content*.
+        start_line: Line number of the first line of *content*.
+        partial: Whether *content* is only a line range of the file.
     """
 
     path: str
     content: str
     lines: int
+    start_line: int = 1
+    partial: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serialisable dictionary."""
+        return {
+            "path": self.path,
+            "content": self.content,
+            "lines": self.lines,
+            "start_line": self.start_line,
+            "partial": self.partial,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CodeFile:
+        """Create from a dictionary produced by :meth:`to_dict`."""
+        return cls(
+            path=data["path"],
+            content=data["content"],
+            lines=data["lines"],
+            start_line=data.get("start_line", 1),
+            partial=data.get("partial", False),
+        )
 
 
 @dataclass
@@ -99,6 +147,47 @@ class CodeContext:
     total_lines: int = 0
     extraction_errors: list[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serialisable dictionary."""
+        return {
+            "files": [f.to_dict() for f in self.files],
+            "total_lines": self.total_lines,
+            "extraction_errors": list(self.extraction_errors),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CodeContext:
+        """Create from a dictionary produced by :meth:`to_dict`."""
+        return cls(
+            files=[CodeFile.from_dict(f) for f in data["files"]],
+            total_lines=data["total_lines"],
+            extraction_errors=list(data.get("extraction_errors", [])),
+        )
+
+
+@dataclass
+class _ReviewOutcome:
+    """Findings from reviewing a set of files, before they become a result.
+
+    Attributes:
+        findings: Findings parsed (and merged) from the LLM responses.
+        files_reviewed: Paths of the files that were reviewed.
+        failed_paths: Paths of files in shards whose review failed.
+        error_message: Summary of failed shards, if any.
+    """
+
+    findings: list[ReviewFinding] = field(default_factory=list)
+    files_reviewed: list[str] = field(default_factory=list)
+    failed_paths: set[str] = field(default_factory=set)
+    error_message: str | None = None
+
+
+def _count_lines(content: str) -> int:
+    """Count lines, including a final line without a trailing newline."""
+    return content.count("\n") + (
+        1 if content and not content.endswith("\n") else 0
+    )
+
 
 # ---------------------------------------------------------------------------
 # CodeExtractor
@@ -109,15 +198,32 @@ class CodeExtractor:
     """Extracts source code files from local paths or GitHub repositories.
 
     Applies extension filtering, file-size limits, and a total-line cap to
-    prevent excessive LLM costs.
+    prevent excessive LLM costs.  Local files are read in worker threads and
+    GitHub blobs are downloaded concurrently, in windows of
+    *max_concurrency* files so the line cap still stops extraction early.
 
     Args:
         workspace_root: Root directory prepended to local ``target_path``
             values.  Defaults to ``"/app/workspace"``.
+        max_concurrency: Maximum files read or downloaded at once.
+        max_total_lines: Total-line cap across all files (0 = unlimited, for
+            sharded reviews).  Defaults to ``MAX_TOTAL_LINES``.
     """
 
-    def __init__(self, workspace_root: str = "/app/workspace") -> None:
+    def __init__(
+        self,
+        workspace_root: str = "/app/workspace",
+        max_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        max_total_lines: int = MAX_TOTAL_LINES,
+    ) -> None:
         self._workspace_root = workspace_root
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_total_lines = max_total_lines or sys.maxsize
+
+    @property
+    def workspace_root(self) -> str:
+        """Root directory prepended to local target paths."""
+        return self._workspace_root
 
     # -- public API ---------------------------------------------------------
 
@@ -138,11 +244,45 @@ class CodeExtractor:
             return await self._extract_github(target_path)
         return await self._extract_local(target_path)
 
+    async def read_files(self, paths: list[Path]) -> CodeContext:
+        """Read the given local files, without the total-line cap.
+
+        Files without an allowed extension, or that no longer exist, are
+        skipped; unreadable and oversized files are reported as
+        extraction errors.
+
+        Args:
+            paths: Absolute file paths.
+
+        Returns:
+            A :class:`CodeContext` with the files read, in *paths* order.
+        """
+        context = CodeContext()
+        candidates = [p for p in paths if p.suffix in ALLOWED_EXTENSIONS]
+        window = self._max_concurrency
+        for offset in range(0, len(candidates), window):
+            outcomes = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._read_existing_file, file_path)
+                    for file_path in candidates[offset : offset + window]
+                )
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, str):
+                    context.extraction_errors.append(outcome)
+                elif outcome is not None:
+                    context.files.append(outcome)
+                    context.total_lines += outcome.lines
+        return context
+
     # -- local extraction ---------------------------------------------------
 
     async def _extract_local(self, target_path: str) -> CodeContext:
         """Extract files from the local filesystem.
 
+        The directory walk and file reads run in worker threads so the event
+        loop is never blocked on disk I/O.
+
         Args:
             target_path: Path relative to the workspace root.
 
@@ -152,74 +292,108 @@ class CodeExtractor:
         context = CodeContext()
         full_path = Path(self._workspace_root) / target_path
 
-        if not full_path.exists():
+        candidates = await asyncio.to_thread(self._list_local_files, full_path)
+        if candidates is None:
             context.extraction_errors.append(
                 f"Path does not exist: {full_path}"
             )
             return context
 
-        if full_path.is_file():
-            self._add_local_file(full_path, context)
-            return context
-
-        # Walk directory tree
-        for root, _dirs, filenames in os.walk(full_path):
-            if context.total_lines >= MAX_TOTAL_LINES:
+        window = self._max_concurrency
+        for offset in range(0, len(candidates), window):
+            if context.total_lines >= self._max_total_lines:
                 break
-            for fname in sorted(filenames):
-                if context.total_lines >= MAX_TOTAL_LINES:
+            outcomes = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._read_local_file, file_path)
+                    for file_path in candidates[offset : offset + window]
+                )
+            )
+            for outcome in outcomes:
+                if context.total_lines >= self._max_total_lines:
                     break
-                file_path = Path(root) / fname
-                self._add_local_file(file_path, context)
+                if isinstance(outcome, str):
+                    context.extraction_errors.append(outcome)
+                elif context.total_lines + outcome.lines <= self._max_total_lines:
+                    context.files.append(outcome)
+                    context.total_lines += outcome.lines
 
         return context
 
-    def _add_local_file(self, file_path: Path, context: CodeContext) -> None:
-        """Try to add a single local file to *context*.
+    @staticmethod
+    def _list_local_files(full_path: Path) -> list[Path] | None:
+        """List reviewable files under *full_path* in walk order.
 
         Args:
-            file_path: Absolute path to the file.
-            context: The :class:`CodeContext` to populate.
+            full_path: Absolute file or directory path.
+
+        Returns:
+            Files with an allowed extension, or ``None`` if the path does
+            not exist.
         """
-        if file_path.suffix not in ALLOWED_EXTENSIONS:
-            return
+        if not full_path.exists():
+            return None
+
+        if full_path.is_file():
+            paths = [full_path]
+        else:
+            paths = [
+                Path(root) / fname
+                for root, _dirs, filenames in os.walk(full_path)
+                for fname in sorted(filenames)
+            ]
+        return [p for p in paths if p.suffix in ALLOWED_EXTENSIONS]
+
+    @staticmethod
+    def _read_local_file(file_path: Path) -> CodeFile | str:
+        """Read a single local file (runs in a worker thread).
 
+        Args:
+            file_path: Absolute path to the file.
+
+        Returns:
+            The :class:`CodeFile`, or an extraction error message.
+        """
         try:
             size = file_path.stat().st_size
         except OSError as exc:
-            context.extraction_errors.append(
-                f"Could not stat {file_path}: {exc}"
-            )
-            return
+            return f"Could not stat {file_path}: {exc}"
 
         if size > MAX_FILE_SIZE_BYTES:
-            context.extraction_errors.append(
-                f"Skipped {file_path}: exceeds {MAX_FILE_SIZE_BYTES} bytes"
-            )
-            return
+            return f"Skipped {file_path}: exceeds {MAX_FILE_SIZE_BYTES} bytes"
 
         try:
             content = file_path.read_text(encoding="utf-8", errors="replace")
         except OSError as exc:
-            context.extraction_errors.append(
-                f"Could not read {file_path}: {exc}"
-            )
-            return
-
-        line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
-        if context.total_lines + line_count > MAX_TOTAL_LINES:
-            return
+            return f"Could not read {file_path}: {exc}"
 
-        context.files.append(
-            CodeFile(path=str(file_path), content=content, lines=line_count)
+        return CodeFile(
+            path=str(file_path), content=content, lines=_count_lines(content)
         )
-        context.total_lines += line_count
+
+    @classmethod
+    def _read_existing_file(cls, file_path: Path) -> CodeFile | str | None:
+        """Read a local file unless it is missing (runs in a worker thread).
+
+        Args:
+            file_path: Absolute path to the file.
+
+        Returns:
+            The :class:`CodeFile`, an extraction error message, or ``None``
+            if there is no such file.
+        """
+        if not file_path.is_file():
+            return None
+        return cls._read_local_file(file_path)
 
     # -- GitHub extraction --------------------------------------------------
 
     async def _extract_github(self, url: str) -> CodeContext:
         """Extract files from a public GitHub repository.
 
+        The tree is fetched once and blobs are downloaded concurrently over a
+        single connection pool.
+
         Args:
             url: A ``https://github.com/{owner}/{repo}`` URL.
 
@@ -241,59 +415,65 @@ class CodeExtractor:
             f"/git/trees/HEAD?recursive=1"
         )
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+        limits = httpx.Limits(max_connections=self._max_concurrency)
+        async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+            try:
                 resp = await client.get(tree_url)
                 resp.raise_for_status()
                 tree_data = resp.json()
-        except httpx.HTTPError as exc:
-            context.extraction_errors.append(
-                f"GitHub tree fetch failed: {exc}"
-            )
-            logger.warning("GitHub tree fetch failed for %s: %s", url, exc)
-            return context
-
-        tree_entries = tree_data.get("tree", [])
-        blob_paths = [
-            entry["path"]
-            for entry in tree_entries
-            if entry.get("type") == "blob"
-            and Path(entry["path"]).suffix in ALLOWED_EXTENSIONS
-            and entry.get("size", 0) <= MAX_FILE_SIZE_BYTES
-        ]
-
-        for blob_path in blob_paths:
-            if context.total_lines >= MAX_TOTAL_LINES:
-                break
-
-            raw_url = (
-                f"https://raw.githubusercontent.com/{owner}/{repo}"
-                f"/HEAD/{blob_path}"
-            )
-            try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    resp = await client.get(raw_url)
-                    resp.raise_for_status()
-                    content = resp.text
             except httpx.HTTPError as exc:
                 context.extraction_errors.append(
-                    f"Failed to fetch {blob_path}: {exc}"
+                    f"GitHub tree fetch failed: {exc}"
                 )
-                logger.warning(
-                    "Failed to fetch %s from GitHub: %s", blob_path, exc
+                logger.warning("GitHub tree fetch failed for %s: %s", url, exc)
+                return context
+
+            tree_entries = tree_data.get("tree", [])
+            blob_paths = [
+                entry["path"]
+                for entry in tree_entries
+                if entry.get("type") == "blob"
+                and Path(entry["path"]).suffix in ALLOWED_EXTENSIONS
+                and entry.get("size", 0) <= MAX_FILE_SIZE_BYTES
+            ]
+
+            async def fetch(blob_path: str) -> str | httpx.HTTPError:
+                raw_url = (
+                    f"https://raw.githubusercontent.com/{owner}/{repo}"
+                    f"/HEAD/{blob_path}"
                 )
-                continue
-
-            line_count = content.count("\n") + (
-                1 if content and not content.endswith("\n") else 0
-            )
-            if context.total_lines + line_count > MAX_TOTAL_LINES:
-                break
+                try:
+                    resp = await client.get(raw_url)
+                    resp.raise_for_status()
+                    return resp.text
+                except httpx.HTTPError as exc:
+                    return exc
 
-            context.files.append(
-                CodeFile(path=blob_path, content=content, lines=line_count)
-            )
-            context.total_lines += line_count
+            window = self._max_concurrency
+            for offset in range(0, len(blob_paths), window):
+                if context.total_lines >= self._max_total_lines:
+                    break
+                batch = blob_paths[offset : offset + window]
+                contents = await asyncio.gather(*(fetch(p) for p in batch))
+
+                for blob_path, content in zip(batch, contents, strict=True):
+                    if isinstance(content, httpx.HTTPError):
+                        context.extraction_errors.append(
+                            f"Failed to fetch {blob_path}: {content}"
+                        )
+                        logger.warning(
+                            "Failed to fetch %s from GitHub: %s", blob_path, content
+                        )
+                        continue
+
+                    line_count = _count_lines(content)
+                    if context.total_lines + line_count > self._max_total_lines:
+                        return context
+
+                    context.files.append(
+                        CodeFile(path=blob_path, content=content, lines=line_count)
+                    )
+                    context.total_lines += line_count
 
         return context
 
@@ -572,25 +752,102 @@ class ReviewExecutor:
     ``SwarmDispatcher._default_executor``.  Its :meth:`execute_review` method
     has the same signature expected by :class:`SwarmDispatcher`.
 
+    Code is obtained through a :class:`CodeSnapshotCache`, so the reviewers
+    of one swarm session share a single extraction of the target.
+
+    When *shard_token_budget* is set, targets whose code exceeds the budget
+    are reviewed map-reduce style: the files are partitioned into shards
+    (see :func:`plan_shards`), every shard is reviewed concurrently, and the
+    shard findings are merged with :meth:`ResultAggregator.merge_findings`.
+    LLM calls from all reviewers and sessions sharing this executor are
+    limited by one *max_concurrent_calls* semaphore.
+
+    When a *finding_cache* is given, the findings of every completely
+    reviewed file are cached per reviewer and file content.  Reviews of a
+    local target with a ``base_ref`` then send only the changed hunks to the
+    LLM and take the findings of unchanged files from the cache.
+
     Args:
         factory: An :class:`LLMClientFactory` used to obtain LLM clients.
         workspace_root: Root directory for local code extraction.  Defaults to
-            ``"/app/workspace"``.
+            ``"/app/workspace"``.  Ignored when *snapshot_cache* is given.
+        snapshot_cache: Optional shared snapshot cache.  If not provided, an
+            in-memory cache over a new :class:`CodeExtractor` is created.
+        shard_token_budget: Estimated code tokens per shard.  ``0`` (the
+            default) reviews everything in a single prompt.
+        max_concurrent_calls: Maximum LLM review calls in flight at once.
+        aggregator: Aggregator used to merge shard findings.  Defaults to one
+            built from a default :class:`SwarmConfig`.
+        finding_cache: Optional per-file finding cache for incremental
+            reviews.
+        diff_context_lines: Unchanged lines reviewed around each changed
+            hunk in incremental reviews.
     """
 
     def __init__(
         self,
         factory: LLMClientFactory,
         workspace_root: str = "/app/workspace",
+        snapshot_cache: CodeSnapshotCache | None = None,
+        shard_token_budget: int = 0,
+        max_concurrent_calls: int = 8,
+        aggregator: ResultAggregator | None = None,
+        finding_cache: FindingCache | None = None,
+        diff_context_lines: int = DEFAULT_DIFF_CONTEXT_LINES,
     ) -> None:
+        from src.workers.swarm.snapshot import CodeSnapshotCache
+
         self._factory = factory
-        self._extractor = CodeExtractor(workspace_root)
+        self._snapshots = snapshot_cache or CodeSnapshotCache(
+            CodeExtractor(workspace_root)
+        )
+        self._extractor = self._snapshots.extractor
+        self._shard_token_budget = shard_token_budget
+        self._call_slots = asyncio.Semaphore(max(1, max_concurrent_calls))
+        self._aggregator = aggregator or ResultAggregator(SwarmConfig())
+        self._findings = finding_cache
+        self._diff_context_lines = diff_context_lines
+
+    @classmethod
+    def from_config(
+        cls,
+        factory: LLMClientFactory,
+        config: SwarmConfig,
+        redis_client: redis.Redis | None = None,
+        workspace_root: str = "/app/workspace",
+    ) -> ReviewExecutor:
+        """Create an executor wired from swarm configuration.
+
+        Args:
+            factory: An :class:`LLMClientFactory` used to obtain LLM clients.
+            config: Swarm configuration.
+            redis_client: Optional async Redis client for shared snapshots
+                and cached findings.
+            workspace_root: Root directory for local code extraction.
+
+        Returns:
+            A configured ReviewExecutor.
+        """
+        from src.workers.swarm.snapshot import CodeSnapshotCache
+
+        return cls(
+            factory=factory,
+            snapshot_cache=CodeSnapshotCache.from_config(
+                config, redis_client, workspace_root
+            ),
+            shard_token_budget=config.shard_token_budget,
+            max_concurrent_calls=config.max_concurrent_shards,
+            aggregator=ResultAggregator(config),
+            finding_cache=FindingCache.from_config(config, redis_client),
+            diff_context_lines=config.diff_context_lines,
+        )
 
     async def execute_review(
         self,
         session_id: str,
         target_path: str,
         reviewer: SpecializedReviewer,
+        base_ref: str | None = None,
     ) -> ReviewerResult:
         """Execute a single reviewer's analysis on *target_path*.
 
@@ -601,6 +858,8 @@ class ReviewExecutor:
             session_id: The swarm session ID (for logging/tracing).
             target_path: Local path or GitHub URL to review.
             reviewer: The specialized reviewer providing prompts and checklist.
+            base_ref: Optional git ref.  When given, only changes since this
+                ref are reviewed (local targets only).
 
         Returns:
             A :class:`ReviewerResult` describing the outcome.
@@ -608,7 +867,7 @@ class ReviewExecutor:
         start = time.monotonic()
         try:
             return await self._do_review(
-                session_id, target_path, reviewer, start
+                session_id, target_path, reviewer, start, base_ref
             )
         except Exception as exc:  # noqa: BLE001 -- intentional catch-all
             duration = time.monotonic() - start
@@ -636,6 +895,7 @@ class ReviewExecutor:
         target_path: str,
         reviewer: SpecializedReviewer,
         start: float,
+        base_ref: str | None = None,
     ) -> ReviewerResult:
         """Core review logic, separated so the outer method can catch all errors.
 
@@ -644,12 +904,13 @@ class ReviewExecutor:
             target_path: Target path for code extraction.
             reviewer: The specialized reviewer.
             start: Monotonic timestamp when the review started.
+            base_ref: Optional git ref for an incremental review.
 
         Returns:
             A :class:`ReviewerResult`.
         """
-        # 1. Extract code
-        code_context = await self._extractor.extract(target_path)
+        # 1. Extract code (once per session, shared across reviewers)
+        code_context = await self._snapshots.get(session_id, target_path)
 
         if not code_context.files:
             duration = time.monotonic() - start
@@ -668,35 +929,322 @@ class ReviewExecutor:
                 error_message=None,
             )
 
-        # 2. Build prompts
-        system_prompt = self._build_system_prompt(reviewer)
-        user_prompt = self._build_user_prompt(code_context, reviewer)
+        if base_ref is not None:
+            if not target_path.startswith("https://github.com/"):
+                return await self._do_incremental_review(
+                    session_id, target_path, code_context, reviewer, base_ref, start
+                )
+            logger.warning(
+                "Incremental review is not supported for GitHub targets; "
+                "reviewing %s in full",
+                target_path,
+            )
+
+        # 2-4. Build prompts, invoke LLM, parse response
+        outcome = await self._review_code(session_id, code_context.files, reviewer)
+        await self._cache_findings(reviewer, code_context.files, outcome)
+        return self._build_result(reviewer, outcome, start)
 
-        # 3. Invoke LLM
-        client = await self._factory.get_client(AgentRole.REVIEWER)
-        response = await client.generate(
-            prompt=user_prompt, system=system_prompt
+    async def _do_incremental_review(
+        self,
+        session_id: str,
+        target_path: str,
+        code_context: CodeContext,
+        reviewer: SpecializedReviewer,
+        base_ref: str,
+        start: float,
+    ) -> ReviewerResult:
+        """Review only what changed since *base_ref*.
+
+        Changed files are read from disk, so files past the snapshot's
+        line cap are reviewed too, and sent as hunk excerpts with
+        ``diff_context_lines`` of context.  Unchanged snapshot files with
+        cached findings contribute those findings; other unchanged files
+        are not reviewed.
+
+        Args:
+            session_id: The swarm session ID.
+            target_path: Local target path, relative to the workspace root.
+            code_context: The extracted code.
+            reviewer: The specialized reviewer.
+            base_ref: Git ref to compare the working tree against.
+            start: Monotonic timestamp when the review started.
+
+        Returns:
+            A :class:`ReviewerResult` with cached and fresh findings.
+        """
+        changes = await changed_line_ranges(
+            Path(self._extractor.workspace_root) / target_path, base_ref
         )
 
-        # 4. Parse response
+        snapshot = {str(Path(f.path).resolve()): f for f in code_context.files}
+        unchanged = [f for path, f in snapshot.items() if path not in changes]
+
+        current = await self._extractor.read_files([Path(p) for p in changes])
+        for error in current.extraction_errors:
+            logger.warning("Incremental review for session=%s: %s", session_id, error)
+        changed: list[CodeFile] = []
+        for code_file in current.files:
+            ranges = changes[code_file.path]
+            # Report findings under the snapshot's path for the file
+            known = snapshot.get(code_file.path)
+            if known is not None:
+                code_file.path = known.path
+            changed.extend(excerpt_file(code_file, ranges, self._diff_context_lines))
+
+        cached_findings: list[ReviewFinding] = []
+        cached_paths: list[str] = []
+        if self._findings is not None and unchanged:
+            digests = {f.path: content_hash(f.content) for f in unchanged}
+            hits = await self._findings.get_many(
+                reviewer.reviewer_type,
+                self._prompt_version(reviewer),
+                digests.values(),
+            )
+            for code_file in unchanged:
+                cached = hits.get(digests[code_file.path])
+                if cached is None:
+                    continue
+                cached_paths.append(code_file.path)
+                cached_findings.extend(
+                    f.model_copy(update={"file_path": code_file.path}) for f in cached
+                )
+
+        logger.info(
+            "Incremental review for session=%s reviewer=%s base=%s: "
+            "%d changed pieces, %d of %d unchanged files from cache",
+            session_id,
+            reviewer.reviewer_type,
+            base_ref,
+            len(changed),
+            len(cached_paths),
+            len(unchanged),
+        )
+
+        outcome = _ReviewOutcome()
+        if changed:
+            outcome = await self._review_code(session_id, changed, reviewer)
+            await self._cache_findings(reviewer, changed, outcome)
+
+        outcome.findings = cached_findings + outcome.findings
+        outcome.files_reviewed = list(
+            dict.fromkeys(outcome.files_reviewed + cached_paths)
+        )
+        return self._build_result(reviewer, outcome, start)
+
+    async def _review_code(
+        self,
+        session_id: str,
+        files: list[CodeFile],
+        reviewer: SpecializedReviewer,
+    ) -> _ReviewOutcome:
+        """Review files in one prompt, or shard by shard if over budget.
+
+        Args:
+            session_id: The swarm session ID.
+            files: Files (or file line ranges) to review.
+            reviewer: The specialized reviewer.
+
+        Returns:
+            The findings and the files they cover.
+        """
+        code_tokens = sum(estimate_tokens(f.content) for f in files)
+        if self._shard_token_budget and code_tokens > self._shard_token_budget:
+            return await self._review_shards(session_id, files, reviewer)
+
+        findings = await self._review_files(session_id, files, reviewer)
+        return _ReviewOutcome(
+            findings=findings,
+            files_reviewed=list(dict.fromkeys(f.path for f in files)),
+        )
+
+    async def _review_files(
+        self,
+        session_id: str,
+        files: list[CodeFile],
+        reviewer: SpecializedReviewer,
+    ) -> list[ReviewFinding]:
+        """Review one prompt's worth of files with a single LLM call.
+
+        Args:
+            session_id: The swarm session ID.
+            files: Files (or file line ranges) to include in the prompt.
+            reviewer: The specialized reviewer.
+
+        Returns:
+            Findings parsed from the LLM response.
+        """
+        system_prompt = self._build_system_prompt(reviewer)
+        user_prompt = self._build_user_prompt(CodeContext(files=files), reviewer)
+
+        async with self._call_slots:
+            client = await self._factory.get_client(AgentRole.REVIEWER)
+            response = await client.generate(
+                prompt=user_prompt, system=system_prompt
+            )
+
         logger.info(
             "LLM response for session=%s reviewer=%s: %d chars",
             session_id,
             reviewer.reviewer_type,
             len(response.content),
         )
-        findings = ResponseParser.parse(
-            response.content, reviewer.reviewer_type
+        return ResponseParser.parse(response.content, reviewer.reviewer_type)
+
+    async def _review_shards(
+        self,
+        session_id: str,
+        files: list[CodeFile],
+        reviewer: SpecializedReviewer,
+    ) -> _ReviewOutcome:
+        """Review a large set of files shard by shard and merge the findings.
+
+        Shards that fail are reported in ``error_message``; the review only
+        fails outright if every shard fails.
+
+        Args:
+            session_id: The swarm session ID.
+            files: Files to review.
+            reviewer: The specialized reviewer.
+
+        Returns:
+            The merged findings of the successful shards.
+
+        Raises:
+            RuntimeError: If every shard failed.
+        """
+        shards = plan_shards(CodeContext(files=files), self._shard_token_budget)
+        logger.info(
+            "Sharded review for session=%s reviewer=%s: %d shards",
+            session_id,
+            reviewer.reviewer_type,
+            len(shards),
+        )
+
+        outcomes = await asyncio.gather(
+            *(self._review_files(session_id, s.files, reviewer) for s in shards),
+            return_exceptions=True,
+        )
+
+        findings: list[ReviewFinding] = []
+        reviewed: list[ReviewShard] = []
+        failed_paths: set[str] = set()
+        errors: list[str] = []
+        for shard, outcome in zip(shards, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                errors.append(f"shard {shard.index} ({', '.join(shard.paths)}): {outcome}")
+                failed_paths.update(shard.paths)
+                continue
+            findings.extend(outcome)
+            reviewed.append(shard)
+
+        if not reviewed:
+            raise RuntimeError(f"All {len(shards)} review shards failed: {errors[0]}")
+
+        merged, duplicates = self._aggregator.merge_findings(findings)
+        if duplicates:
+            logger.debug(
+                "Merged %d duplicate findings across shards for reviewer %s",
+                duplicates,
+                reviewer.reviewer_type,
+            )
+
+        return _ReviewOutcome(
+            findings=merged,
+            files_reviewed=list(
+                dict.fromkeys(path for shard in reviewed for path in shard.paths)
+            ),
+            failed_paths=failed_paths,
+            error_message=(
+                f"{len(errors)} of {len(shards)} shards failed: " + "; ".join(errors)
+                if errors
+                else None
+            ),
+        )
+
+    async def _cache_findings(
+        self,
+        reviewer: SpecializedReviewer,
+        files: list[CodeFile],
+        outcome: _ReviewOutcome,
+    ) -> None:
+        """Cache the findings of every file that was reviewed in full.
+
+        Partial files (hunk excerpts) and files in failed shards are not
+        cached.  Findings are attributed to files by their ``file_path``.
+
+        Args:
+            reviewer: The specialized reviewer.
+            files: Files that were submitted for review.
+            outcome: Outcome of the review.
+        """
+        if self._findings is None:
+            return
+
+        complete = {
+            f.path: f
+            for f in files
+            if not f.partial and f.path not in outcome.failed_paths
+        }
+        if not complete:
+            return
+
+        by_path: dict[str, list[ReviewFinding]] = {path: [] for path in complete}
+        for finding in outcome.findings:
+            path = _match_file_path(finding.file_path, complete)
+            if path is not None:
+                by_path[path].append(finding)
+
+        await self._findings.put_many(
+            reviewer.reviewer_type,
+            self._prompt_version(reviewer),
+            {content_hash(f.content): by_path[path] for path, f in complete.items()},
+        )
+
+    @classmethod
+    def _prompt_version(cls, reviewer: SpecializedReviewer) -> str:
+        """Identify the prompt a reviewer's findings were produced with.
+
+        Args:
+            reviewer: The specialized reviewer.
+
+        Returns:
+            Short hash of :data:`REVIEW_PROMPT_VERSION`, the system prompt
+            and the checklist.
+        """
+        material = "\0".join(
+            [
+                str(REVIEW_PROMPT_VERSION),
+                cls._build_system_prompt(reviewer),
+                *reviewer.get_checklist(),
+            ]
         )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
 
+    @staticmethod
+    def _build_result(
+        reviewer: SpecializedReviewer, outcome: _ReviewOutcome, start: float
+    ) -> ReviewerResult:
+        """Turn a review outcome into a successful :class:`ReviewerResult`.
+
+        Args:
+            reviewer: The specialized reviewer.
+            outcome: Outcome of the review.
+            start: Monotonic timestamp when the review started.
+
+        Returns:
+            The reviewer result.
+        """
         duration = time.monotonic() - start
         return ReviewerResult(
             reviewer_type=reviewer.reviewer_type,
             status="success",
-            findings=findings,
+            findings=outcome.findings,
             duration_seconds=round(duration, 3),
-            files_reviewed=[f.path for f in code_context.files],
-            error_message=None,
+            files_reviewed=outcome.files_reviewed,
+            error_message=outcome.error_message,
         )
 
     @staticmethod
@@ -741,7 +1289,14 @@ class ReviewExecutor:
         parts: list[str] = ["Review the following code files:\n"]
 
         for code_file in code_context.files:
-            parts.append(f"--- File: {code_file.path} ---")
+            if code_file.partial:
+                last_line = code_file.start_line + code_file.lines - 1
+                parts.append(
+                    f"--- File: {code_file.path} "
+                    f"(lines {code_file.start_line}-{last_line}) ---"
+                )
+            else:
+                parts.append(f"--- File: {code_file.path} ---")
             parts.append(code_file.content)
             parts.append("")
 
@@ -750,3 +1305,22 @@ class ReviewExecutor:
             parts.append(f"- {item}")
 
         return "\n".join(parts)
+
+
+def _match_file_path(finding_path: str, paths: dict[str, CodeFile]) -> str | None:
+    """Find the reviewed file a finding refers to.
+
+    Args:
+        finding_path: ``file_path`` reported by the LLM.
+        paths: Reviewed files keyed by path.
+
+    Returns:
+        The matching path, or None if the finding cannot be attributed.
+    """
+    if finding_path in paths:
+        return finding_path
+    suffix = "/" + finding_path.lstrip("./")
+    if suffix == "/":
+        return None
+    matches = [path for path in paths if path.endswith(suffix)]
+    return matches[0] if len(matches) == 1 else None
@@ -0,0 +1,448 @@
+"""Incremental (diff-only) reviews for Parallel Review Swarm.
+
+A review started with a base git ref does not send the whole target to the
+LLM. Only the changed hunks of files that differ from the base ref are
+reviewed, each with some surrounding context. Findings for the remaining,
+unchanged files come from the :class:`FindingCache`.
+
+The cache stores a reviewer's findings for one file, keyed by reviewer type,
+review prompt version and a hash of the file content. Full reviews populate
+it, so a diff review against a commit that was reviewed in full costs tokens
+in proportion to the diff rather than the repository.
+
+Key patterns:
+    - {prefix}:findings:{reviewer_type}:{prompt_version}:{content_hash} -
+      Findings JSON
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.workers.swarm.models import ReviewFinding
+from src.workers.swarm.sharding import split_lines
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+    from src.workers.swarm.config import SwarmConfig
+    from src.workers.swarm.executor import CodeFile
+
+logger = logging.getLogger(__name__)
+
+# Base refs accepted for incremental reviews (branch, tag, SHA, HEAD~2, ...)
+BASE_REF_PATTERN = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_.\-/~^@{}]*$")
+
+# Inclusive (first, last) line range in the new version of a file
+LineRange = tuple[int, int]
+
+_HUNK_HEADER_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+_GIT_TIMEOUT_SECONDS = 60.0
+
+
+def content_hash(content: str) -> str:
+    """Hash file content for the finding cache.
+
+    Args:
+        content: Full text content of a file.
+
+    Returns:
+        Hex SHA-256 digest of the UTF-8 encoded content.
+    """
+    return hashlib.sha256(content.encode("utf-8", errors="replace")).hexdigest()
+
+
+def is_valid_base_ref(base_ref: str) -> bool:
+    """Check that *base_ref* names a single commit and cannot act as an option.
+
+    Args:
+        base_ref: Candidate git ref.
+
+    Returns:
+        True if the ref is safe to pass to ``git diff``.
+    """
+    return bool(BASE_REF_PATTERN.match(base_ref)) and ".." not in base_ref
+
+
+def parse_unified_diff(diff: str) -> dict[str, list[LineRange]]:
+    """Extract the changed line ranges from ``git diff --unified=0`` output.
+
+    Deleted files are skipped. A pure deletion inside a file is reported as
+    a one-line range at the line that follows it, so it still gets context.
+
+    Args:
+        diff: Unified diff text with zero context lines.
+
+    Returns:
+        Mapping of repository-relative paths to changed line ranges in the
+        new version of each file.
+    """
+    changes: dict[str, list[LineRange]] = {}
+    current: list[LineRange] | None = None
+
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            target = line[4:]
+            if target == "/dev/null":
+                current = None
+            else:
+                path = target[2:] if target.startswith("b/") else target
+                current = changes.setdefault(path, [])
+            continue
+
+        if current is None:
+            continue
+
+        match = _HUNK_HEADER_RE.match(line)
+        if match:
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            if count == 0:
+                current.append((max(start, 1), max(start, 1)))
+            else:
+                current.append((start, start + count - 1))
+
+    return changes
+
+
+async def _run_git(cwd: Path, *args: str) -> str:
+    """Run a git command and return its standard output.
+
+    Args:
+        cwd: Working directory for git.
+        *args: Git arguments.
+
+    Returns:
+        Decoded standard output.
+
+    Raises:
+        RuntimeError: If git is missing, times out or exits non-zero.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            "-c",
+            "core.quotepath=false",
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as exc:
+        raise RuntimeError(f"Could not run git: {exc}") from exc
+
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(), timeout=_GIT_TIMEOUT_SECONDS
+        )
+    except TimeoutError as exc:
+        process.kill()
+        await process.wait()
+        raise RuntimeError(f"git {args[0]} timed out") from exc
+
+    if process.returncode != 0:
+        message = stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"git {args[0]} failed: {message}")
+    return stdout.decode("utf-8", errors="replace")
+
+
+async def changed_line_ranges(
+    target: Path, base_ref: str
+) -> dict[str, list[LineRange]]:
+    """Find the lines under *target* that changed since *base_ref*.
+
+    Compares the working tree with *base_ref*, so committed, staged and
+    unstaged changes are all included. Untracked files count as entirely
+    changed.
+
+    Args:
+        target: File or directory inside a git working tree.
+        base_ref: Git ref to compare against.
+
+    Returns:
+        Mapping of resolved absolute file paths to changed line ranges.
+        Untracked files map to an empty list, meaning the whole file.
+
+    Raises:
+        ValueError: If *base_ref* is not a valid ref name.
+        RuntimeError: If *target* is not in a git repository or git fails.
+    """
+    if not is_valid_base_ref(base_ref):
+        raise ValueError(f"Invalid base ref: {base_ref!r}")
+
+    target = target.resolve()
+    cwd = target if target.is_dir() else target.parent
+    root = Path((await _run_git(cwd, "rev-parse", "--show-toplevel")).strip())
+    pathspec = str(target.relative_to(root)) if target != root else "."
+
+    diff = await _run_git(
+        root,
+        "diff",
+        "--unified=0",
+        "--no-color",
+        "--no-ext-diff",
+        "--no-renames",
+        base_ref,
+        "--",
+        pathspec,
+    )
+    untracked = await _run_git(
+        root, "ls-files", "--others", "--exclude-standard", "--", pathspec
+    )
+
+    changes = {
+        str(root / path): ranges for path, ranges in parse_unified_diff(diff).items()
+    }
+    for path in untracked.splitlines():
+        changes.setdefault(str(root / path), [])
+    return changes
+
+
+def excerpt_file(
+    code_file: CodeFile, ranges: list[LineRange], context_lines: int
+) -> list[CodeFile]:
+    """Cut the changed hunks of a file out with surrounding context.
+
+    Overlapping or adjacent windows are merged. A file that is covered
+    completely is returned as is.
+
+    Args:
+        code_file: Full file as extracted for review.
+        ranges: Changed line ranges; empty means the whole file changed.
+        context_lines: Unchanged lines to keep before and after each hunk.
+
+    Returns:
+        The file, or line-range pieces of it marked as partial.
+    """
+    lines = split_lines(code_file.content)
+    if not ranges or not lines:
+        return [code_file]
+
+    windows: list[list[int]] = []
+    for first, last in sorted(ranges):
+        start = max(1, first - context_lines)
+        end = min(len(lines), last + context_lines)
+        if start > end:
+            continue
+        if windows and start <= windows[-1][1] + 1:
+            windows[-1][1] = max(windows[-1][1], end)
+        else:
+            windows.append([start, end])
+
+    if not windows or windows == [[1, len(lines)]]:
+        return [code_file]
+
+    return [
+        replace(
+            code_file,
+            content="".join(lines[start - 1 : end]),
+            lines=end - start + 1,
+            start_line=start,
+            partial=True,
+        )
+        for start, end in windows
+    ]
+
+
+class FindingCache:
+    """Per-file review findings, reusable while the file content is unchanged.
+
+    Entries live in a bounded in-memory LRU and, when a Redis client is
+    supplied, in Redis so that every swarm worker shares them. Cache errors
+    are logged and treated as misses; they never fail a review.
+
+    Attributes:
+        _redis: Optional async Redis client for the shared tier.
+        _key_prefix: Redis key prefix for finding keys.
+        _ttl_seconds: Lifetime of an entry in Redis.
+        _max_entries: Maximum entries held in memory.
+
+    Example:
+        >>> cache = FindingCache(redis_client)
+        >>> hits = await cache.get_many("security", version, [digest])
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis | None = None,
+        key_prefix: str = "swarm",
+        ttl_seconds: int = 604800,
+        max_entries: int = 4096,
+    ) -> None:
+        """Initialize the FindingCache.
+
+        Args:
+            redis_client: Optional async Redis client. Entries are shared
+                across processes through Redis when provided.
+            key_prefix: Redis key prefix for finding keys.
+            ttl_seconds: Lifetime of an entry in Redis.
+            max_entries: Maximum entries held in memory.
+        """
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        config: SwarmConfig,
+        redis_client: redis.Redis | None = None,
+    ) -> FindingCache | None:
+        """Create a finding cache from swarm configuration.
+
+        Args:
+            config: Swarm configuration with key prefix and cache TTL.
+            redis_client: Optional async Redis client for the shared tier.
+
+        Returns:
+            A configured FindingCache, or None if
+            ``config.finding_cache_ttl_seconds`` is 0.
+        """
+        if not config.finding_cache_ttl_seconds:
+            return None
+        return cls(
+            redis_client=redis_client,
+            key_prefix=config.key_prefix,
+            ttl_seconds=config.finding_cache_ttl_seconds,
+        )
+
+    def _key(self, reviewer_type: str, prompt_version: str, digest: str) -> str:
+        """Generate the Redis key for one file's findings.
+
+        Args:
+            reviewer_type: The reviewer that produced the findings.
+            prompt_version: Version of the review prompt.
+            digest: Content hash of the file.
+
+        Returns:
+            Redis key in format
+            {prefix}:findings:{reviewer_type}:{prompt_version}:{digest}.
+        """
+        return (
+            f"{self._key_prefix}:findings:{reviewer_type}:{prompt_version}:{digest}"
+        )
+
+    async def get_many(
+        self,
+        reviewer_type: str,
+        prompt_version: str,
+        digests: Iterable[str],
+    ) -> dict[str, list[ReviewFinding]]:
+        """Look up cached findings for several files.
+
+        Args:
+            reviewer_type: The reviewer whose findings are wanted.
+            prompt_version: Version of the review prompt.
+            digests: Content hashes of the files.
+
+        Returns:
+            Mapping of content hash to findings, for cache hits only. A hit
+            may be an empty list: the file was reviewed and had no findings.
+        """
+        requested = list(dict.fromkeys(digests))
+        found: dict[str, list[dict[str, Any]]] = {}
+        remote: list[str] = []
+
+        for digest in requested:
+            key = self._key(reviewer_type, prompt_version, digest)
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                found[digest] = cached
+            else:
+                remote.append(digest)
+
+        if remote and self._redis is not None:
+            keys = [self._key(reviewer_type, prompt_version, d) for d in remote]
+            try:
+                values = await self._redis.mget(keys)
+            except Exception as e:
+                logger.warning(f"Finding cache lookup failed: {e}")
+                values = [None] * len(keys)
+            for digest, key, raw in zip(remote, keys, values, strict=True):
+                if not raw:
+                    continue
+                try:
+                    found[digest] = json.loads(raw)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Discarding corrupt cache entry {key}: {e}")
+                    continue
+                self._remember(key, found[digest])
+
+        results: dict[str, list[ReviewFinding]] = {}
+        for digest, data in found.items():
+            try:
+                results[digest] = [ReviewFinding.model_validate(item) for item in data]
+            except ValueError as e:
+                logger.warning(f"Discarding invalid cached findings: {e}")
+
+        self._hits += len(results)
+        self._misses += len(requested) - len(results)
+        return results
+
+    async def put_many(
+        self,
+        reviewer_type: str,
+        prompt_version: str,
+        entries: dict[str, list[ReviewFinding]],
+    ) -> None:
+        """Store the findings of completely reviewed files.
+
+        Args:
+            reviewer_type: The reviewer that produced the findings.
+            prompt_version: Version of the review prompt.
+            entries: Mapping of content hash to the file's findings.
+        """
+        if not entries:
+            return
+
+        serialized = {
+            self._key(reviewer_type, prompt_version, digest): [
+                f.model_dump(mode="json") for f in findings
+            ]
+            for digest, findings in entries.items()
+        }
+        for key, data in serialized.items():
+            self._remember(key, data)
+
+        if self._redis is None:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, data in serialized.items():
+                    pipe.set(key, json.dumps(data), ex=self._ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Finding cache store failed: {e}")
+
+    def _remember(self, key: str, data: list[dict[str, Any]]) -> None:
+        """Add an entry to the in-memory tier, evicting the oldest."""
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get finding cache statistics.
+
+        Returns:
+            Dictionary with entry count and hit/miss counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
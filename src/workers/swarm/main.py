@@ -263,7 +263,9 @@ async def async_main() -> None:
     # Create LLM infrastructure for real reviews
     llm_config_service = LLMConfigService(redis_client=redis_client)
     llm_factory = LLMClientFactory(config_service=llm_config_service)
-    review_executor = ReviewExecutor(factory=llm_factory)
+    review_executor = ReviewExecutor.from_config(
+        llm_factory, swarm_config, redis_client
+    )
 
     # Create swarm components
     redis_store = SwarmRedisStore(redis_client, swarm_config)
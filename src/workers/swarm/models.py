@@ -173,6 +173,7 @@ class SwarmSession(BaseModel):
         completed_at: Session completion timestamp (optional)
         results: Results from each reviewer, keyed by reviewer_type
         unified_report: Final aggregated report (optional)
+        base_ref: Git ref for an incremental review of changes only (optional)
     """
 
     id: str = Field(..., description="Session ID (format: swarm-{uuid8})")
@@ -189,5 +190,8 @@ class SwarmSession(BaseModel):
     unified_report: UnifiedReport | None = Field(
         default=None, description="Final aggregated report"
     )
+    base_ref: str | None = Field(
+        default=None, description="Git ref to review changes against"
+    )
 
     model_config = {"use_enum_values": True}
@@ -2,6 +2,10 @@
 
 This module provides the SwarmRedisStore class for persisting swarm sessions,
 reviewer results, and tracking completion progress in Redis.
+
+Progress is also published to a per-session Redis stream, so waiters block
+on XREAD until a reviewer finishes instead of polling the progress set, and
+the status API can replay and follow a session's events.
 """
 
 from __future__ import annotations
@@ -9,8 +13,9 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from src.workers.swarm.config import SwarmConfig
 from src.workers.swarm.models import ReviewerResult, SwarmSession, SwarmStatus, UnifiedReport
@@ -20,6 +25,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Approximate cap on events kept per session stream
+EVENT_STREAM_MAXLEN = 1000
+
+# Event types published to the session stream
+EVENT_REVIEWER_COMPLETE = "reviewer_complete"
+EVENT_STATUS = "status"
+
 
 class SwarmRedisStore:
     """Redis storage for swarm session data.
@@ -31,6 +43,7 @@ class SwarmRedisStore:
         - {prefix}:session:{session_id} - Session hash
         - {prefix}:results:{session_id} - Results hash (reviewer -> JSON)
         - {prefix}:progress:{session_id} - Set of completed reviewers
+        - {prefix}:events:{session_id} - Stream of session progress events
 
     Attributes:
         _redis: Async Redis client for database operations.
@@ -86,6 +99,17 @@ class SwarmRedisStore:
         """
         return f"{self._config.key_prefix}:progress:{session_id}"
 
+    def _events_key(self, session_id: str) -> str:
+        """Generate the Redis key for a session event stream.
+
+        Args:
+            session_id: The unique session identifier.
+
+        Returns:
+            Redis key in format {prefix}:events:{session_id}.
+        """
+        return f"{self._config.key_prefix}:events:{session_id}"
+
     async def create_session(self, session: SwarmSession) -> None:
         """Store a new swarm session in Redis.
 
@@ -112,6 +136,7 @@ class SwarmRedisStore:
                 {k: v.model_dump() for k, v in session.results.items()}
             ),
             "unified_report": session.unified_report.model_dump_json() if session.unified_report else "",
+            "base_ref": session.base_ref or "",
         }
 
         await self._redis.hset(key, mapping=mapping)
@@ -147,6 +172,7 @@ class SwarmRedisStore:
             completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") not in (None, "", "None") else None,
             results=self._deserialize_results(data.get("results", "{}")),
             unified_report=self._deserialize_unified_report(data.get("unified_report", "")),
+            base_ref=data.get("base_ref") or None,
         )
 
     def _deserialize_unified_report(self, report_json: str) -> UnifiedReport | None:
@@ -207,8 +233,10 @@ class SwarmRedisStore:
     ) -> None:
         """Store a reviewer result and mark the reviewer as completed.
 
-        Stores the result JSON in the results hash and adds the reviewer type
-        to the progress set. Also sets TTL on the results and progress keys.
+        Stores the result JSON in the results hash, adds the reviewer type
+        to the progress set and publishes a ``reviewer_complete`` event, all
+        in one MULTI/EXEC transaction. Also sets TTL on the results,
+        progress and event keys.
 
         Args:
             session_id: The unique session identifier.
@@ -220,21 +248,130 @@ class SwarmRedisStore:
         """
         results_key = self._results_key(session_id)
         progress_key = self._progress_key(session_id)
+        events_key = self._events_key(session_id)
+        ttl = self._config.result_ttl_seconds
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(results_key, reviewer_type, result.model_dump_json())
+            pipe.sadd(progress_key, reviewer_type)
+            pipe.xadd(
+                events_key,
+                {
+                    "event": EVENT_REVIEWER_COMPLETE,
+                    "reviewer": reviewer_type,
+                    "status": result.status,
+                    "findings": str(len(result.findings)),
+                    "files_reviewed": str(len(result.files_reviewed)),
+                    "duration_seconds": str(result.duration_seconds),
+                },
+                maxlen=EVENT_STREAM_MAXLEN,
+                approximate=True,
+            )
+            pipe.expire(results_key, ttl)
+            pipe.expire(progress_key, ttl)
+            pipe.expire(events_key, ttl)
+            await pipe.execute()
 
-        # Store result JSON in results hash
-        await self._redis.hset(results_key, reviewer_type, result.model_dump_json())
+        logger.debug(
+            f"Stored result for reviewer {reviewer_type} in session {session_id}"
+        )
 
-        # Add reviewer to progress set
-        await self._redis.sadd(progress_key, reviewer_type)
+    async def publish_status(self, session_id: str, status: SwarmStatus) -> None:
+        """Publish a session status change to the session event stream.
 
-        # Set TTL on both keys
-        await self._redis.expire(results_key, self._config.result_ttl_seconds)
-        await self._redis.expire(progress_key, self._config.result_ttl_seconds)
+        Args:
+            session_id: The unique session identifier.
+            status: The status the session moved to.
 
-        logger.debug(
-            f"Stored result for reviewer {reviewer_type} in session {session_id}"
+        Raises:
+            redis.RedisError: If the Redis operation fails.
+        """
+        events_key = self._events_key(session_id)
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(
+                events_key,
+                {"event": EVENT_STATUS, "status": status.value},
+                maxlen=EVENT_STREAM_MAXLEN,
+                approximate=True,
+            )
+            pipe.expire(events_key, self._config.result_ttl_seconds)
+            await pipe.execute()
+
+    async def read_events(
+        self,
+        session_id: str,
+        last_id: str = "0-0",
+        block_ms: int | None = None,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Read session events published after ``last_id``.
+
+        Args:
+            session_id: The unique session identifier.
+            last_id: Stream ID to read after ("0-0" replays from the start).
+            block_ms: Milliseconds to block waiting for new events. Defaults
+                to ``config.event_block_ms``; keep it below the Redis client's
+                socket timeout.
+
+        Returns:
+            List of (event_id, fields) tuples, empty if none arrived in time.
+
+        Raises:
+            redis.RedisError: If the Redis operation fails.
+        """
+        if block_ms is None:
+            block_ms = self._config.event_block_ms
+
+        response = await self._redis.xread(
+            {self._events_key(session_id): last_id}, block=block_ms
         )
 
+        events: list[tuple[str, dict[str, Any]]] = []
+        for _stream, messages in response or []:
+            events.extend((event_id, fields) for event_id, fields in messages)
+        return events
+
+    async def iter_events(
+        self,
+        session_id: str,
+        last_id: str = "0-0",
+        timeout_seconds: float | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Follow a session's event stream.
+
+        Yields events already in the stream after ``last_id`` and then new
+        ones as they are published. Stops after a terminal status event
+        (complete or failed) or once ``timeout_seconds`` has elapsed.
+
+        Args:
+            session_id: The unique session identifier.
+            last_id: Stream ID to resume after ("0-0" replays from the start).
+            timeout_seconds: Maximum time to follow the stream (None = no limit).
+
+        Yields:
+            (event_id, fields) tuples in stream order.
+
+        Raises:
+            redis.RedisError: If a Redis operation fails.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout_seconds is None else loop.time() + timeout_seconds
+        terminal = {SwarmStatus.COMPLETE.value, SwarmStatus.FAILED.value}
+
+        while True:
+            block_ms = self._config.event_block_ms
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                block_ms = max(1, min(block_ms, int(remaining * 1000)))
+
+            for event_id, fields in await self.read_events(session_id, last_id, block_ms):
+                last_id = event_id
+                yield event_id, fields
+                if fields.get("event") == EVENT_STATUS and fields.get("status") in terminal:
+                    return
+
     async def get_reviewer_result(
         self, session_id: str, reviewer_type: str
     ) -> ReviewerResult | None:
@@ -300,18 +437,22 @@ class SwarmRedisStore:
         session_id: str,
         expected_reviewers: list[str],
         timeout_seconds: int = 300,
-        poll_interval: float = 1.0,
+        block_ms: int | None = None,
     ) -> bool:
         """Wait for all expected reviewers to complete.
 
-        Polls the progress set at the configured interval until all expected
-        reviewers are present or the timeout is reached.
+        Checks the progress set once, then blocks on the session event
+        stream and wakes as soon as a reviewer completes. The stream is read
+        from its start, so completions published before the wait began are
+        never missed. The progress set is re-checked whenever a blocking read
+        times out without events.
 
         Args:
             session_id: The unique session identifier.
             expected_reviewers: List of reviewer types to wait for.
             timeout_seconds: Maximum time to wait in seconds (default: 300).
-            poll_interval: Time between polls in seconds (default: 1.0).
+            block_ms: Longest single blocking read in milliseconds. Defaults
+                to ``config.event_block_ms``.
 
         Returns:
             True if all reviewers completed within the timeout, False otherwise.
@@ -319,24 +460,40 @@ class SwarmRedisStore:
         Raises:
             redis.RedisError: If a Redis operation fails.
         """
-        expected_set = set(expected_reviewers)
-        elapsed = 0.0
-
-        while elapsed < timeout_seconds:
-            completed = await self.get_completed_reviewers(session_id)
+        if block_ms is None:
+            block_ms = self._config.event_block_ms
 
-            if expected_set.issubset(completed):
-                logger.debug(
-                    f"All reviewers completed for session {session_id} "
-                    f"after {elapsed:.1f}s"
+        expected_set = set(expected_reviewers)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout_seconds
+        last_id = "0-0"
+
+        completed = set(await self.get_completed_reviewers(session_id))
+
+        while not expected_set.issubset(completed):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning(
+                    f"Timeout waiting for completion of session {session_id}. "
+                    f"Expected: {expected_set}, Completed: {completed}"
                 )
-                return True
+                return False
+
+            events = await self.read_events(
+                session_id, last_id, max(1, min(block_ms, int(remaining * 1000)))
+            )
+            if not events:
+                completed |= await self.get_completed_reviewers(session_id)
+                continue
 
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+            for event_id, fields in events:
+                last_id = event_id
+                if fields.get("event") == EVENT_REVIEWER_COMPLETE:
+                    completed.add(fields["reviewer"])
 
-        logger.warning(
-            f"Timeout waiting for completion of session {session_id}. "
-            f"Expected: {expected_set}, Completed: {completed}"
+        logger.debug(
+            f"All reviewers completed for session {session_id} "
+            f"after {loop.time() - started:.1f}s"
         )
-        return False
+        return True
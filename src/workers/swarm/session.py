@@ -56,6 +56,7 @@ class SwarmSessionManager:
         self,
         target_path: str,
         reviewer_types: list[str] | None = None,
+        base_ref: str | None = None,
     ) -> SwarmSession:
         """Create a new swarm session and persist to Redis.
 
@@ -66,6 +67,8 @@ class SwarmSessionManager:
             target_path: Path to the code to be reviewed.
             reviewer_types: List of reviewer types to use. If None or empty,
                 defaults to the configured default_reviewers.
+            base_ref: Optional git ref; reviewers then review only the
+                changes since this ref.
 
         Returns:
             The newly created SwarmSession.
@@ -83,6 +86,7 @@ class SwarmSessionManager:
             completed_at=None,
             results={},
             unified_report=None,
+            base_ref=base_ref,
         )
 
         await self._store.create_session(session)
@@ -108,6 +112,9 @@ class SwarmSessionManager:
     ) -> None:
         """Update session status and optionally set completion timestamp.
 
+        The change is published to the session event stream after the
+        session hash is updated.
+
         Args:
             session_id: The unique session identifier.
             status: The new status to set.
@@ -122,3 +129,5 @@ class SwarmSessionManager:
             await self._store._redis.hset(
                 session_key, "completed_at", completed_at.isoformat()
             )
+
+        await self._store.publish_status(session_id, status)
@@ -0,0 +1,184 @@
+"""Token-budgeted sharding for map-reduce swarm reviews.
+
+Large review targets do not fit a single prompt. :func:`plan_shards` splits
+a :class:`CodeContext` into shards whose code stays within a token budget,
+so each reviewer can review the shards concurrently and merge the findings.
+
+Files are packed in path order, which keeps files from the same directory
+in the same shard where possible. A shard is closed early at a directory
+boundary once it is at least half full. Files larger than the budget are
+split into consecutive line ranges, so no file is ever dropped.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.workers.swarm.executor import CodeContext, CodeFile
+
+# Approximate characters per token for source code
+CHARS_PER_TOKEN: int = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of *text* without a tokenizer.
+
+    Args:
+        text: Text to estimate.
+
+    Returns:
+        Approximate token count.
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class ReviewShard:
+    """A token-budgeted subset of the files under review.
+
+    Attributes:
+        index: Position of the shard in the plan.
+        files: Files (or line ranges of files) in this shard.
+        estimated_tokens: Estimated tokens of the shard's code.
+    """
+
+    index: int
+    files: list[CodeFile] = field(default_factory=list)
+    estimated_tokens: int = 0
+
+    @property
+    def paths(self) -> list[str]:
+        """Distinct file paths in this shard, in order."""
+        return list(dict.fromkeys(f.path for f in self.files))
+
+
+def split_lines(content: str) -> list[str]:
+    """Split *content* into lines, keeping line endings.
+
+    Only ``"\\n"`` ends a line, so the result agrees with the line counts of
+    extracted files.
+
+    Args:
+        content: Text to split.
+
+    Returns:
+        Lines of *content*; joining them gives back *content*.
+    """
+    lines = content.split("\n")
+    if lines[-1]:
+        return [line + "\n" for line in lines[:-1]] + [lines[-1]]
+    return [line + "\n" for line in lines[:-1]]
+
+
+def plan_shards(
+    context: CodeContext,
+    token_budget: int,
+    count_tokens: Callable[[str], int] = estimate_tokens,
+) -> list[ReviewShard]:
+    """Partition extracted files into token-budgeted shards.
+
+    Args:
+        context: Extracted code to partition.
+        token_budget: Maximum estimated code tokens per shard.
+        count_tokens: Token estimator applied to file contents.
+
+    Returns:
+        Shards covering every file in *context*, in path order.
+
+    Raises:
+        ValueError: If *token_budget* is not positive.
+    """
+    if token_budget <= 0:
+        raise ValueError("token_budget must be positive")
+
+    shards: list[ReviewShard] = []
+    current = ReviewShard(index=0)
+    current_dir: PurePath | None = None
+
+    def close() -> None:
+        nonlocal current
+        if current.files:
+            shards.append(current)
+            current = ReviewShard(index=len(shards))
+
+    for code_file in sorted(context.files, key=lambda f: f.path):
+        directory = PurePath(code_file.path).parent
+        tokens = count_tokens(code_file.content)
+
+        if tokens > token_budget:
+            close()
+            for piece in _split_file(code_file, token_budget, count_tokens):
+                current.files.append(piece)
+                current.estimated_tokens = count_tokens(piece.content)
+                close()
+            current_dir = directory
+            continue
+
+        over_budget = current.estimated_tokens + tokens > token_budget
+        dir_boundary = (
+            current_dir is not None
+            and directory != current_dir
+            and current.estimated_tokens * 2 >= token_budget
+        )
+        if over_budget or dir_boundary:
+            close()
+
+        current.files.append(code_file)
+        current.estimated_tokens += tokens
+        current_dir = directory
+
+    close()
+    return shards
+
+
+def _split_file(
+    code_file: CodeFile,
+    token_budget: int,
+    count_tokens: Callable[[str], int],
+) -> list[CodeFile]:
+    """Split an oversized file into line ranges that fit the budget.
+
+    A single line longer than the budget becomes its own range.
+
+    Args:
+        code_file: File whose content exceeds the budget.
+        token_budget: Maximum estimated tokens per range.
+        count_tokens: Token estimator.
+
+    Returns:
+        Consecutive line ranges of the file.
+    """
+    pieces: list[CodeFile] = []
+    buffer: list[str] = []
+    buffer_tokens = 0
+    start_line = code_file.start_line
+
+    def flush() -> None:
+        nonlocal buffer, buffer_tokens, start_line
+        if buffer:
+            pieces.append(
+                replace(
+                    code_file,
+                    content="".join(buffer),
+                    lines=len(buffer),
+                    start_line=start_line,
+                    partial=True,
+                )
+            )
+            start_line += len(buffer)
+            buffer = []
+            buffer_tokens = 0
+
+    for line in split_lines(code_file.content):
+        tokens = count_tokens(line)
+        if buffer and buffer_tokens + tokens > token_budget:
+            flush()
+        buffer.append(line)
+        buffer_tokens += tokens
+
+    flush()
+    return pieces
@@ -0,0 +1,262 @@
+"""Session-scoped code snapshots for Parallel Review Swarm.
+
+Every reviewer in a swarm session reviews the same target. Instead of each
+reviewer walking the workspace or downloading the GitHub repository again,
+the :class:`CodeSnapshotCache` extracts the code once per
+``(session_id, target_path)`` and hands the same :class:`CodeContext` to
+every reviewer.
+
+Snapshots are kept in process memory for the session TTL and, when a Redis
+client is supplied, also stored in Redis so other swarm workers serving
+the same session can reuse them.
+
+Key patterns:
+    - {prefix}:snapshot:{session_id}:{target_digest} - Snapshot JSON
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from src.workers.swarm.executor import CodeContext, CodeExtractor
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+    from src.workers.swarm.config import SwarmConfig
+
+logger = logging.getLogger(__name__)
+
+
+class CodeSnapshotCache:
+    """Extracts each swarm target once and shares it across reviewers.
+
+    Concurrent requests for the same snapshot wait on a single extraction.
+    Failed extractions are not cached, so a later reviewer can retry.
+
+    Attributes:
+        _extractor: Extractor used on a cache miss.
+        _redis: Optional async Redis client for the shared tier.
+        _key_prefix: Redis key prefix for snapshot keys.
+        _ttl_seconds: Lifetime of a snapshot in memory and in Redis.
+        _max_entries: Maximum snapshots held in memory.
+
+    Example:
+        >>> snapshots = CodeSnapshotCache(CodeExtractor(), redis_client)
+        >>> context = await snapshots.get("swarm-123", "src/workers/")
+    """
+
+    def __init__(
+        self,
+        extractor: CodeExtractor,
+        redis_client: redis.Redis | None = None,
+        key_prefix: str = "swarm",
+        ttl_seconds: int = 3600,
+        max_entries: int = 32,
+    ) -> None:
+        """Initialize the CodeSnapshotCache.
+
+        Args:
+            extractor: Extractor used on a cache miss.
+            redis_client: Optional async Redis client. Snapshots are shared
+                across processes through Redis when provided.
+            key_prefix: Redis key prefix for snapshot keys.
+            ttl_seconds: Lifetime of a snapshot in memory and in Redis.
+            max_entries: Maximum snapshots held in memory.
+        """
+        self._extractor = extractor
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[
+            tuple[str, str], tuple[float, asyncio.Future[CodeContext]]
+        ] = OrderedDict()
+        self._extractions = 0
+        self._hits = 0
+        self._remote_hits = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        config: SwarmConfig,
+        redis_client: redis.Redis | None = None,
+        workspace_root: str = "/app/workspace",
+    ) -> CodeSnapshotCache:
+        """Create a snapshot cache from swarm configuration.
+
+        Args:
+            config: Swarm configuration with key prefix and snapshot settings.
+            redis_client: Optional async Redis client for the shared tier.
+            workspace_root: Root directory for local code extraction.
+
+        Sharded reviews can cover any number of files, so the extractor's
+        total-line cap is lifted when ``config.shard_token_budget`` is set.
+
+        Returns:
+            A configured CodeSnapshotCache.
+        """
+        extractor_kwargs: dict[str, Any] = {}
+        if config.shard_token_budget:
+            extractor_kwargs["max_total_lines"] = 0
+        return cls(
+            CodeExtractor(
+                workspace_root,
+                max_concurrency=config.snapshot_fetch_concurrency,
+                **extractor_kwargs,
+            ),
+            redis_client=redis_client,
+            key_prefix=config.key_prefix,
+            ttl_seconds=config.snapshot_ttl_seconds,
+        )
+
+    @property
+    def extractor(self) -> CodeExtractor:
+        """The extractor used on a cache miss."""
+        return self._extractor
+
+    def _snapshot_key(self, session_id: str, target_path: str) -> str:
+        """Generate the Redis key for a snapshot.
+
+        Args:
+            session_id: The swarm session ID.
+            target_path: Local path or GitHub URL being reviewed.
+
+        Returns:
+            Redis key in format {prefix}:snapshot:{session_id}:{digest}.
+        """
+        digest = hashlib.sha256(target_path.encode()).hexdigest()[:16]
+        return f"{self._key_prefix}:snapshot:{session_id}:{digest}"
+
+    async def get(self, session_id: str, target_path: str) -> CodeContext:
+        """Return the code snapshot for a session, extracting it if needed.
+
+        Args:
+            session_id: The swarm session ID.
+            target_path: Local path or GitHub URL being reviewed.
+
+        Returns:
+            The shared :class:`CodeContext` for the session. Callers must
+            treat it as read-only.
+        """
+        key = (session_id, target_path)
+
+        while True:
+            now = time.monotonic()
+            cached = self._entries.get(key)
+            if cached is None:
+                break
+            created, pending = cached
+            if now - created >= self._ttl_seconds:
+                del self._entries[key]
+                break
+            self._entries.move_to_end(key)
+            self._hits += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The extracting reviewer was cancelled; extract again
+                if pending.cancelled():
+                    continue
+                raise
+
+        future: asyncio.Future[CodeContext] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._entries[key] = (now, future)
+        self._evict()
+
+        try:
+            context = await self._load(session_id, target_path)
+        except BaseException as exc:
+            if self._entries.get(key, (None, None))[1] is future:
+                del self._entries[key]
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Mark the exception retrieved when nobody else was waiting
+                future.exception()
+            raise
+
+        future.set_result(context)
+        return context
+
+    async def _load(self, session_id: str, target_path: str) -> CodeContext:
+        """Load a snapshot from Redis or extract it.
+
+        Args:
+            session_id: The swarm session ID.
+            target_path: Local path or GitHub URL being reviewed.
+
+        Returns:
+            The extracted :class:`CodeContext`.
+        """
+        redis_key = self._snapshot_key(session_id, target_path)
+
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(redis_key)
+            except Exception as e:
+                logger.warning(f"Snapshot lookup failed for {redis_key}: {e}")
+                raw = None
+            if raw:
+                try:
+                    context = CodeContext.from_dict(json.loads(raw))
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    logger.warning(f"Discarding corrupt snapshot {redis_key}: {e}")
+                else:
+                    self._remote_hits += 1
+                    return context
+
+        context = await self._extractor.extract(target_path)
+        self._extractions += 1
+        logger.info(
+            f"Extracted snapshot for session {session_id}: "
+            f"{len(context.files)} files, {context.total_lines} lines"
+        )
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(
+                    redis_key,
+                    json.dumps(context.to_dict()),
+                    ex=self._ttl_seconds,
+                )
+            except Exception as e:
+                logger.warning(f"Snapshot store failed for {redis_key}: {e}")
+
+        return context
+
+    def _evict(self) -> None:
+        """Drop the least recently used snapshots beyond max_entries."""
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def release(self, session_id: str) -> None:
+        """Drop all in-memory snapshots for a session.
+
+        Args:
+            session_id: The swarm session ID.
+        """
+        for key in [k for k in self._entries if k[0] == session_id]:
+            del self._entries[key]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get snapshot cache statistics.
+
+        Returns:
+            Dictionary with entry count, extractions and hit counters.
+        """
+        return {
+            "entries": len(self._entries),
+            "extractions": self._extractions,
+            "hits": self._hits,
+            "remote_hits": self._remote_hits,
+        }
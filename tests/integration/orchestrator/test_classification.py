@@ -31,6 +31,7 @@ from src.orchestrator.api.models.idea import (
 )
 from src.orchestrator.routes.classification_api import admin_router, router
 from src.orchestrator.services.classification_service import ClassificationService
+from src.orchestrator.services.label_taxonomy_service import CompiledTaxonomy
 
 
 @pytest.fixture
@@ -108,6 +109,11 @@ def mock_redis() -> AsyncMock:
     redis = AsyncMock()
     redis.get.return_value = None
     redis.set.return_value = True
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
     return redis
 
 
@@ -130,6 +136,7 @@ def mock_taxonomy_service(mock_taxonomy: LabelTaxonomy) -> AsyncMock:
 - security: Security-related concern (keywords: security, encrypt, auth, vulnerability)
 - ui: User interface or experience (keywords: ui, ux, interface, design, button, screen)
 """
+    service.get_compiled_taxonomy.return_value = CompiledTaxonomy.compile(mock_taxonomy)
     return service
 
 
@@ -346,17 +353,16 @@ class TestBatchClassificationProcessing:
         assert job_id.startswith("job-")
 
         # Verify job metadata was stored
-        mock_redis.set.assert_called()
-        set_call = mock_redis.set.call_args
-        job_data = json.loads(set_call[0][1])
+        pipe = mock_redis.pipeline.return_value
+        job_data = pipe.hset.call_args.kwargs["mapping"]
 
         assert job_data["total"] == 5
         assert job_data["completed"] == 0
         assert job_data["status"] == "pending"
-        assert len(job_data["idea_ids"]) == 5
+        assert len(json.loads(job_data["idea_ids"])) == 5
 
         # Verify all ideas were added to queue
-        assert mock_redis.lpush.call_count == 5
+        assert len(pipe.lpush.call_args.args[1:]) == 5
 
     @pytest.mark.asyncio
     async def test_batch_job_status_tracking(
@@ -374,20 +380,24 @@ class TestBatchClassificationProcessing:
         )
 
         # Setup mock job status
-        job_status = {
+        job_meta = {
             "job_id": "job-test-123",
             "status": "processing",
-            "total": 5,
-            "completed": 2,
-            "failed": 0,
-            "idea_ids": ["idea-1", "idea-2", "idea-3", "idea-4", "idea-5"],
-            "results": [
-                {"idea_id": "idea-1", "classification": "functional", "confidence": 0.9},
-                {"idea_id": "idea-2", "classification": "non_functional", "confidence": 0.85},
-            ],
+            "total": "5",
+            "completed": "2",
+            "failed": "0",
+            "idea_ids": json.dumps(["idea-1", "idea-2", "idea-3", "idea-4", "idea-5"]),
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
-        mock_redis.get.return_value = json.dumps(job_status)
+        results = [
+            {"idea_id": "idea-1", "classification": "functional", "confidence": 0.9},
+            {"idea_id": "idea-2", "classification": "non_functional", "confidence": 0.85},
+        ]
+        mock_redis.pipeline.return_value.execute.return_value = [
+            job_meta,
+            [json.dumps(r) for r in results],
+            [],
+        ]
 
         status = await worker.get_job_status("job-test-123")
 
@@ -417,9 +427,10 @@ class TestBatchClassificationProcessing:
         job_id = await worker.enqueue_batch(idea_ids, force=True)
 
         # Verify force flag is set on queued items
-        lpush_calls = mock_redis.lpush.call_args_list
-        for call in lpush_calls:
-            job_data = json.loads(call[0][1])
+        queued = mock_redis.pipeline.return_value.lpush.call_args.args[1:]
+        assert len(queued) == 2
+        for job in queued:
+            job_data = json.loads(job)
             assert job_data["force"] is True
 
 
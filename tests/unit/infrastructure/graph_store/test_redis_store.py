@@ -13,7 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.infrastructure.graph_store.redis_store import RedisGraphStore
+from src.infrastructure.graph_store.redis_store import REMOVED_EDGES_KEY, RedisGraphStore
 
 
 @pytest.fixture
@@ -131,6 +131,91 @@ class TestAddEdge:
         mock_redis.hset.assert_not_called()
 
 
+class TestAddEdges:
+    """Tests for add_edges method."""
+
+    @pytest.mark.asyncio
+    async def test_add_edges_uses_one_pipeline(
+        self, graph_store: RedisGraphStore, mock_redis: AsyncMock
+    ) -> None:
+        """Test that add_edges writes all edges in one pipeline."""
+        pipe = MagicMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        pipe.execute = AsyncMock()
+        mock_redis.pipeline = MagicMock(return_value=pipe)
+
+        await graph_store.add_edges(
+            [
+                ("idea-001", "idea-002", "similar", {"score": 0.9}),
+                ("idea-001", "idea-003", "similar", None),
+            ]
+        )
+
+        assert pipe.sadd.call_count == 4
+        pipe.hset.assert_called_once()
+        assert pipe.hset.call_args[0][0] == "GRAPH:EDGE:idea-001:idea-002:similar"
+        pipe.execute.assert_awaited_once()
+        mock_redis.sadd.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_edges_for_creator_keeps_other_edges(
+        self, graph_store: RedisGraphStore, mock_redis: AsyncMock
+    ) -> None:
+        """Test that a creator skips removed and foreign edges and refreshes its own."""
+        checks = MagicMock()
+        checks.__aenter__ = AsyncMock(return_value=checks)
+        checks.__aexit__ = AsyncMock(return_value=False)
+        # (removed, created_by, reverse created_by) per edge
+        checks.execute = AsyncMock(
+            return_value=[
+                False, "system", None,
+                False, None, None,
+                True, None, None,
+                False, None, "user-1",
+            ]
+        )
+        writes = MagicMock()
+        writes.__aenter__ = AsyncMock(return_value=writes)
+        writes.__aexit__ = AsyncMock(return_value=False)
+        writes.execute = AsyncMock()
+        mock_redis.pipeline = MagicMock(side_effect=[checks, writes])
+        properties = {"id": "corr-1", "score": 0.9, "created_by": "system"}
+
+        await graph_store.add_edges(
+            [
+                ("idea-001", "idea-002", "similar", properties),
+                ("idea-001", "idea-003", "similar", properties),
+                ("idea-001", "idea-004", "similar", properties),
+                ("idea-001", "idea-005", "similar", properties),
+            ],
+            creator="system",
+            refresh=("score",),
+        )
+
+        checks.sismember.assert_any_call(REMOVED_EDGES_KEY, "idea-001:idea-004:similar")
+        written = {c[0][0] for c in writes.hset.call_args_list}
+        assert written == {
+            "GRAPH:EDGE:idea-001:idea-002:similar",
+            "GRAPH:EDGE:idea-001:idea-003:similar",
+        }
+        assert all(c[1]["mapping"] == {"score": "0.9"} for c in writes.hset.call_args_list)
+        writes.hsetnx.assert_any_call("GRAPH:EDGE:idea-001:idea-002:similar", "id", "corr-1")
+        assert writes.hsetnx.call_count == 4
+        assert writes.sadd.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_add_edges_empty(
+        self, graph_store: RedisGraphStore, mock_redis: AsyncMock
+    ) -> None:
+        """Test that add_edges does nothing without edges."""
+        mock_redis.pipeline = MagicMock()
+
+        await graph_store.add_edges([])
+
+        mock_redis.pipeline.assert_not_called()
+
+
 class TestRemoveEdge:
     """Tests for remove_edge method."""
 
@@ -167,6 +252,11 @@ class TestRemoveEdge:
         deleted_keys = [c[0][0] for c in delete_calls]
         assert "GRAPH:EDGE:idea-001:idea-002:related" in deleted_keys
         assert "GRAPH:EDGE:idea-002:idea-001:related" in deleted_keys
+        mock_redis.sadd.assert_awaited_once_with(
+            REMOVED_EDGES_KEY,
+            "idea-001:idea-002:related",
+            "idea-002:idea-001:related",
+        )
 
     @pytest.mark.asyncio
     async def test_remove_edge_returns_false_if_not_exists(
@@ -182,6 +272,7 @@ class TestRemoveEdge:
         )
 
         assert result is False
+        mock_redis.sadd.assert_not_called()
 
 
 class TestGetNeighbors:
@@ -0,0 +1,315 @@
+"""Unit tests for offline LLM batch execution."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.llm.base_client import LLMResponse
+from src.infrastructure.llm.batch import (
+    AnthropicBatchProvider,
+    BatchConfig,
+    BatchItemResult,
+    BatchRequest,
+    BatchStatus,
+    LLMBatchManager,
+    LocalBatchProvider,
+    OpenAIBatchProvider,
+    batch_provider_for,
+)
+from src.infrastructure.llm.clients.anthropic_client import AnthropicClient
+from src.infrastructure.llm.clients.openai_client import OpenAIClient
+from src.infrastructure.llm.instrumentation import InstrumentedLLMClient
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands batch tracking uses."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.strings: dict[str, str] = {}
+        self.expiries: dict[str, int] = {}
+
+    async def hset(self, key: str, mapping: dict[str, Any]) -> None:
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def hsetnx(self, key: str, field: str, value: str) -> bool:
+        fields = self.hashes.setdefault(key, {})
+        if field in fields:
+            return False
+        fields[field] = value
+        return True
+
+    async def sadd(self, key: str, member: str) -> None:
+        self.sets.setdefault(key, set()).add(member)
+
+    async def srem(self, key: str, member: str) -> None:
+        self.sets.get(key, set()).discard(member)
+
+    async def smembers(self, key: str) -> set[bytes]:
+        return {m.encode() for m in self.sets.get(key, set())}
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.strings:
+            return False
+        self.strings[key] = value
+        return True
+
+    async def expire(self, key: str, seconds: int) -> None:
+        self.expiries[key] = seconds
+
+
+def _requests(count: int) -> list[BatchRequest]:
+    return [
+        BatchRequest(custom_id=f"item-{i}", prompt=f"prompt {i}", metadata={"n": i})
+        for i in range(count)
+    ]
+
+
+async def _run_to_end(manager: LLMBatchManager, batch_id: str) -> None:
+    """Process a local batch until it ends."""
+    for _ in range(100):
+        if await manager.process(batch_id):
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("batch did not end")
+
+
+class TestLLMBatchManager:
+    """Tests for batch submission, tracking and dispatch."""
+
+    async def test_results_reach_handler_with_metadata(self) -> None:
+        """Each item's result is dispatched with its submitted metadata."""
+        redis_client = FakeRedis()
+        manager = LLMBatchManager(redis_client, LocalBatchProvider(), "tests", BatchConfig())
+        received: list[BatchItemResult] = []
+        manager.register_handler("collect", received.append)
+
+        [batch_id] = await manager.submit(_requests(3), handler="collect")
+        await _run_to_end(manager, batch_id)
+
+        assert sorted(r.response.content for r in received) == [
+            "prompt 0",
+            "prompt 1",
+            "prompt 2",
+        ]
+        assert {r.metadata["n"] for r in received} == {0, 1, 2}
+        record = await manager.get_batch(batch_id)
+        assert record["status"] == "ended"
+        assert record["succeeded"] == "3"
+        assert redis_client.sets["asdlc:llm:batch:active:tests"] == set()
+
+    async def test_large_workloads_are_split(self) -> None:
+        """Workloads above the batch size limit become several batches."""
+        manager = LLMBatchManager(
+            FakeRedis(), LocalBatchProvider(), config=BatchConfig(max_batch_size=2)
+        )
+        manager.register_handler("noop", lambda result: None)
+
+        batch_ids = await manager.submit(_requests(5), handler="noop")
+
+        assert len(batch_ids) == 3
+
+    async def test_poll_once_dispatches_only_ended_batches(self) -> None:
+        """Running batches are left for the next poll."""
+        gate = asyncio.Event()
+
+        async def generate(**kwargs: Any) -> LLMResponse:
+            await gate.wait()
+            return LLMResponse(content="late", model="m")
+
+        provider = LocalBatchProvider(client=MagicMock(generate=generate, model="m"))
+        manager = LLMBatchManager(FakeRedis(), provider, config=BatchConfig())
+        received: list[BatchItemResult] = []
+
+        async def handler(result: BatchItemResult) -> None:
+            received.append(result)
+
+        manager.register_handler("collect", handler)
+        [batch_id] = await manager.submit(_requests(1), handler="collect")
+
+        assert await manager.poll_once() == 0
+        assert received == []
+
+        gate.set()
+        await _run_to_end(manager, batch_id)
+        assert [r.response.content for r in received] == ["late"]
+
+    async def test_results_are_dispatched_once(self) -> None:
+        """Processing an ended batch again does not repeat its results."""
+        manager = LLMBatchManager(FakeRedis(), LocalBatchProvider(), config=BatchConfig())
+        received: list[BatchItemResult] = []
+        manager.register_handler("collect", received.append)
+
+        [batch_id] = await manager.submit(_requests(2), handler="collect")
+        await _run_to_end(manager, batch_id)
+        assert await manager.process(batch_id)
+
+        assert len(received) == 2
+
+    async def test_expired_claim_does_not_repeat_dispatched_items(self) -> None:
+        """A process resuming after a claim expired skips dispatched items."""
+        redis_client = FakeRedis()
+        manager = LLMBatchManager(redis_client, LocalBatchProvider(), config=BatchConfig())
+        received: list[str] = []
+        manager.register_handler("collect", lambda r: received.append(r.custom_id))
+        [batch_id] = await manager.submit(_requests(3), handler="collect")
+
+        # The first process dispatched item-0, then died; its claim expired
+        await redis_client.hsetnx(f"asdlc:llm:batch:{batch_id}:dispatched", "item-0", "succeeded")
+        await _run_to_end(manager, batch_id)
+
+        assert sorted(received) == ["item-1", "item-2"]
+        assert (await manager.get_batch(batch_id))["succeeded"] == "3"
+
+    async def test_failed_items_and_handler_errors(self) -> None:
+        """Item errors reach the handler; handler errors do not stop dispatch."""
+
+        def responder(request: BatchRequest) -> str:
+            if request.custom_id == "item-0":
+                raise RuntimeError("bad item")
+            return "ok"
+
+        manager = LLMBatchManager(
+            FakeRedis(), LocalBatchProvider(responder=responder), config=BatchConfig()
+        )
+        received: list[BatchItemResult] = []
+
+        def handler(result: BatchItemResult) -> None:
+            received.append(result)
+            raise ValueError("handler failed")
+
+        manager.register_handler("collect", handler)
+        [batch_id] = await manager.submit(_requests(2), handler="collect")
+        await _run_to_end(manager, batch_id)
+
+        errors = {r.custom_id: r.error for r in received}
+        assert errors == {"item-0": "bad item", "item-1": None}
+        assert (await manager.get_batch(batch_id))["failed"] == "1"
+
+    async def test_lost_batch_fails_its_items(self) -> None:
+        """Items of a batch the provider no longer knows are reported as failed."""
+        redis_client = FakeRedis()
+        manager = LLMBatchManager(redis_client, LocalBatchProvider(), config=BatchConfig())
+        received: list[BatchItemResult] = []
+        manager.register_handler("collect", received.append)
+        [batch_id] = await manager.submit(_requests(2), handler="collect")
+
+        # A new process has a new local provider
+        restarted = LLMBatchManager(redis_client, LocalBatchProvider(), config=BatchConfig())
+        restarted.register_handler("collect", received.append)
+        assert await restarted.process(batch_id)
+
+        assert [r.error for r in received] == ["batch failed", "batch failed"]
+        assert (await manager.get_batch(batch_id))["status"] == "failed"
+
+    async def test_submit_validates_handler_and_ids(self) -> None:
+        """Unknown handlers and repeated custom ids are rejected."""
+        manager = LLMBatchManager(FakeRedis(), LocalBatchProvider(), config=BatchConfig())
+        with pytest.raises(ValueError):
+            await manager.submit(_requests(1), handler="unknown")
+
+        manager.register_handler("noop", lambda result: None)
+        with pytest.raises(ValueError):
+            await manager.submit(_requests(1) * 2, handler="noop")
+
+
+class TestProviders:
+    """Tests for the provider batch APIs."""
+
+    async def test_anthropic_submit_and_results(self) -> None:
+        """Items are submitted as message params and results converted."""
+        client = AnthropicClient(api_key="key", model="claude-haiku-4-5", sdk_client=MagicMock())
+        batches = client.sdk_client.messages.batches
+        batches.create = AsyncMock(return_value=MagicMock(id="msgbatch_1"))
+        provider = AnthropicBatchProvider(client)
+
+        batch_id = await provider.submit(
+            [BatchRequest(custom_id="a", prompt="hi", system="sys", max_tokens=50)]
+        )
+
+        assert batch_id == "msgbatch_1"
+        [item] = batches.create.call_args.kwargs["requests"]
+        assert item["custom_id"] == "a"
+        assert item["params"]["max_tokens"] == 50
+        assert item["params"]["messages"] == [{"role": "user", "content": "hi"}]
+
+        message = MagicMock(model="claude-haiku-4-5", stop_reason="end_turn")
+        message.content = [MagicMock(text="answer")]
+        message.usage = MagicMock(
+            input_tokens=10,
+            output_tokens=2,
+            cache_read_input_tokens=0,
+            cache_creation_input_tokens=0,
+        )
+        entries = [
+            MagicMock(custom_id="a", result=MagicMock(type="succeeded", message=message)),
+            MagicMock(custom_id="b", result=MagicMock(type="expired", error=None)),
+        ]
+
+        async def stream() -> Any:
+            for entry in entries:
+                yield entry
+
+        batches.results = AsyncMock(return_value=stream())
+        results = await provider.results("msgbatch_1")
+
+        assert results[0].response.content == "answer"
+        assert results[1].error == "expired"
+
+    async def test_openai_results_from_output_file(self) -> None:
+        """Output file lines become results; failed lines become errors."""
+        client = OpenAIClient(api_key="key", model="gpt-4o-mini", sdk_client=MagicMock())
+        sdk = client.sdk_client
+        sdk.batches.retrieve = AsyncMock(
+            return_value=MagicMock(status="completed", output_file_id="out", error_file_id=None)
+        )
+        completion = {
+            "id": "c1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": "answer"},
+                }
+            ],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+        }
+        lines = [
+            {"custom_id": "a", "response": {"status_code": 200, "body": completion}},
+            {"custom_id": "b", "response": None, "error": {"message": "boom"}},
+        ]
+        sdk.files.content = AsyncMock(
+            return_value=MagicMock(text="\n".join(json.dumps(line) for line in lines))
+        )
+        provider = OpenAIBatchProvider(client)
+
+        assert await provider.poll("batch_1") == BatchStatus.ENDED
+        results = await provider.results("batch_1")
+
+        assert results[0].response == LLMResponse(
+            content="answer",
+            model="gpt-4o-mini",
+            usage={"input_tokens": 5, "output_tokens": 1, "cache_read_input_tokens": 0},
+            stop_reason="stop",
+        )
+        assert "boom" in results[1].error
+
+    def test_provider_for_wrapped_client(self) -> None:
+        """Wrappers are looked through to pick the provider batch API."""
+        anthropic = InstrumentedLLMClient(AnthropicClient(api_key="k", model="m"), role="x")
+        openai = OpenAIClient(api_key="k", model="m")
+
+        assert isinstance(batch_provider_for(anthropic), AnthropicBatchProvider)
+        assert isinstance(batch_provider_for(openai), OpenAIBatchProvider)
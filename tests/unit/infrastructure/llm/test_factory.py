@@ -6,6 +6,7 @@ based on agent role and admin configuration.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -14,11 +15,20 @@ import pytest
 
 from src.infrastructure.llm.factory import LLMClientFactory, LLMClientError
 from src.infrastructure.llm.base_client import BaseLLMClient
+from src.infrastructure.llm.instrumentation import InstrumentedLLMClient
+from src.infrastructure.llm.rate_limiter import LLMRateLimiter, RateLimitConfig
+from src.infrastructure.llm.response_cache import (
+    CachingLLMClient,
+    LLMResponseCache,
+    ResponseCacheConfig,
+)
+from src.infrastructure.llm.routing import RoutingLLMClient
 from src.orchestrator.api.models.llm_config import (
     AgentLLMConfig,
     AgentRole,
     AgentSettings,
     LLMProvider,
+    LLMTarget,
 )
 
 
@@ -37,6 +47,13 @@ class TestLLMClientFactoryInit:
         assert factory._config_service is mock_service
 
 
+    def test_init_with_rate_limiter(self) -> None:
+        """Test factory uses the given rate limiter for its clients."""
+        limiter = LLMRateLimiter(RateLimitConfig(use_redis=False))
+        factory = LLMClientFactory(config_service=MagicMock(), rate_limiter=limiter)
+        assert factory._rate_limiter is limiter
+
+
 class TestGetClient:
     """Tests for get_client method."""
 
@@ -75,6 +92,8 @@ class TestGetClient:
         assert client is not None
         assert client.provider == "anthropic"
         assert client.model == "claude-sonnet-4-20250514"
+        assert isinstance(client, InstrumentedLLMClient)
+        assert client.role == "discovery"
         mock_config_service.get_agent_config.assert_called_once_with(AgentRole.DISCOVERY)
         mock_config_service.get_decrypted_key.assert_called_once_with("key-123")
 
@@ -101,6 +120,93 @@ class TestGetClient:
         assert client.provider == "openai"
         assert client.model == "gpt-4-turbo"
 
+    @pytest.mark.asyncio
+    async def test_clients_share_rate_limiter(
+        self,
+        factory: LLMClientFactory,
+        mock_config_service: MagicMock,
+    ) -> None:
+        """Test all clients from one factory draw on the same rate limiter."""
+        mock_config_service.get_agent_config.return_value = AgentLLMConfig(
+            role=AgentRole.CODING,
+            provider=LLMProvider.OPENAI,
+            model="gpt-4-turbo",
+            api_key_id="key-456",
+            settings=AgentSettings(temperature=0.2),
+            enabled=True,
+        )
+        mock_config_service.get_decrypted_key.return_value = "sk-openai-test-key"
+
+        coding = await factory.get_client(AgentRole.CODING)
+        discovery = await factory.get_client(AgentRole.DISCOVERY)
+
+        assert coding.rate_limiter is not None
+        assert coding.rate_limiter is discovery.rate_limiter
+        assert coding.rate_limit_scope == discovery.rate_limit_scope
+
+    @pytest.mark.asyncio
+    async def test_cache_responses_wraps_client(
+        self,
+        mock_config_service: MagicMock,
+    ) -> None:
+        """Test roles with cache_responses get a caching client."""
+        cache = LLMResponseCache(ResponseCacheConfig(use_redis=False))
+        factory = LLMClientFactory(
+            config_service=mock_config_service, response_cache=cache
+        )
+        mock_config_service.get_agent_config.return_value = AgentLLMConfig(
+            role=AgentRole.REVIEWER,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id="key-123",
+            settings=AgentSettings(temperature=0.0, cache_responses=True),
+            enabled=True,
+        )
+        mock_config_service.get_decrypted_key.return_value = "sk-ant-test-key"
+
+        client = await factory.get_client(AgentRole.REVIEWER)
+
+        assert isinstance(client, CachingLLMClient)
+        assert isinstance(client.inner, InstrumentedLLMClient)
+        assert client.provider == "anthropic"
+        assert client.inner.provider == "anthropic"
+
+    @pytest.mark.asyncio
+    async def test_fallbacks_build_routing_client(
+        self,
+        factory: LLMClientFactory,
+        mock_config_service: MagicMock,
+    ) -> None:
+        """Test roles with fallbacks get a routing client over all targets."""
+        mock_config_service.get_agent_config.return_value = AgentLLMConfig(
+            role=AgentRole.CODING,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id="key-123",
+            settings=AgentSettings(hedge_requests=True),
+            fallbacks=[
+                LLMTarget(provider=LLMProvider.OPENAI, model="gpt-4o", api_key_id="key-456"),
+                LLMTarget(provider=LLMProvider.OPENAI, model="gpt-4o", api_key_id="missing"),
+            ],
+            enabled=True,
+        )
+        mock_config_service.get_decrypted_key.side_effect = lambda key_id: (
+            None if key_id == "missing" else f"secret-{key_id}"
+        )
+
+        client = await factory.get_client(AgentRole.CODING)
+
+        assert isinstance(client, RoutingLLMClient)
+        assert client.provider == "anthropic"
+        # The fallback without a key is skipped
+        assert [(t.provider, t.model) for t in client.targets] == [
+            ("anthropic", "claude-sonnet-4-20250514"),
+            ("openai", "gpt-4o"),
+        ]
+        assert all(isinstance(t, InstrumentedLLMClient) for t in client.targets)
+        # Targets fail over instead of retrying themselves
+        assert all(t.inner._max_retries == 0 for t in client.targets)
+
     @pytest.mark.asyncio
     async def test_get_client_returns_google_client(
         self,
@@ -314,6 +420,117 @@ class TestClientCaching:
         assert mock_config_service.get_agent_config.call_count == 2
 
 
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_build_once(
+        self,
+        factory: LLMClientFactory,
+        mock_config_service: MagicMock,
+    ) -> None:
+        """Test concurrent first calls for a role share one construction."""
+
+        async def slow_config(role: AgentRole) -> AgentLLMConfig:
+            await asyncio.sleep(0.01)
+            return AgentLLMConfig(
+                role=role,
+                provider=LLMProvider.ANTHROPIC,
+                model="claude-sonnet-4-20250514",
+                api_key_id="key-123",
+            )
+
+        mock_config_service.get_agent_config.side_effect = slow_config
+        mock_config_service.get_decrypted_key.return_value = "sk-ant-test-key"
+
+        clients = await asyncio.gather(
+            *(factory.get_client(AgentRole.REVIEWER) for _ in range(3))
+        )
+
+        assert clients[0] is clients[1] is clients[2]
+        assert mock_config_service.get_agent_config.call_count == 1
+        assert mock_config_service.get_decrypted_key.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_config_version_rebuilds_only_that_role(
+        self,
+        mock_config_service: MagicMock,
+    ) -> None:
+        """Test a role whose config version changed is rebuilt on next use."""
+        versions = {"coding": 1, "discovery": 4}
+        mock_config_service.get_config_versions = AsyncMock(
+            side_effect=lambda: dict(versions)
+        )
+        mock_config_service.get_agent_config.side_effect = lambda role: AgentLLMConfig(
+            role=role,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id="key-123",
+        )
+        mock_config_service.get_decrypted_key.return_value = "sk-ant-test-key"
+        factory = LLMClientFactory(
+            config_service=mock_config_service, config_check_interval=0
+        )
+
+        coding = await factory.get_client(AgentRole.CODING)
+        discovery = await factory.get_client(AgentRole.DISCOVERY)
+        assert await factory.get_client(AgentRole.CODING) is coding
+
+        versions["coding"] = 2
+
+        assert await factory.get_client(AgentRole.CODING) is not coding
+        assert await factory.get_client(AgentRole.DISCOVERY) is discovery
+
+    @pytest.mark.asyncio
+    async def test_version_checks_are_throttled(
+        self,
+        mock_config_service: MagicMock,
+    ) -> None:
+        """Test versions are read at most once per check interval."""
+        mock_config_service.get_config_versions = AsyncMock(return_value={})
+        mock_config_service.get_agent_config.return_value = AgentLLMConfig(
+            role=AgentRole.CODING,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id="key-123",
+        )
+        mock_config_service.get_decrypted_key.return_value = "sk-ant-test-key"
+        factory = LLMClientFactory(
+            config_service=mock_config_service, config_check_interval=60
+        )
+
+        for _ in range(5):
+            await factory.get_client(AgentRole.CODING)
+
+        # One read while building, one check; later calls are within the interval
+        assert mock_config_service.get_config_versions.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_roles_share_sdk_client_per_api_key(
+        self,
+        factory: LLMClientFactory,
+        mock_config_service: MagicMock,
+    ) -> None:
+        """Test roles using the same provider key share one connection pool."""
+        keys = {"key-a": "sk-ant-a", "key-b": "sk-ant-b"}
+        role_keys = {
+            AgentRole.CODING: "key-a",
+            AgentRole.REVIEWER: "key-a",
+            AgentRole.DESIGN: "key-b",
+        }
+        mock_config_service.get_agent_config.side_effect = lambda role: AgentLLMConfig(
+            role=role,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id=role_keys[role],
+        )
+        mock_config_service.get_decrypted_key.side_effect = lambda key_id: keys[key_id]
+
+        coding = await factory.get_client(AgentRole.CODING)
+        reviewer = await factory.get_client(AgentRole.REVIEWER)
+        design = await factory.get_client(AgentRole.DESIGN)
+
+        assert coding.inner.sdk_client is reviewer.inner.sdk_client
+        assert coding.inner.sdk_client is not design.inner.sdk_client
+
+
 class TestGetClientForRole:
     """Tests for get_client_for_role helper method."""
 
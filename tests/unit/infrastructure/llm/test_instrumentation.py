@@ -0,0 +1,234 @@
+"""Unit tests for LLM call instrumentation."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.infrastructure.llm import instrumentation
+from src.infrastructure.llm.base_client import BaseLLMClient, LLMResponse, StreamChunk
+from src.infrastructure.llm.instrumentation import (
+    InstrumentedLLMClient,
+    classify_error,
+    estimate_cost,
+    llm_call_context,
+)
+
+
+class ProviderError(Exception):
+    """Provider SDK error carrying an HTTP status."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class APITimeoutError(Exception):
+    """Stands in for the SDK timeout error, matched by name."""
+
+
+class FakeClient(BaseLLMClient):
+    """Client returning fixed usage, or raising a configured error."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        super().__init__(api_key="key", model="claude-sonnet-4-20250514")
+        self.error = error
+        self.usage = {
+            "input_tokens": 1000,
+            "output_tokens": 100,
+            "cache_read_input_tokens": 800,
+            "cache_creation_input_tokens": 0,
+        }
+
+    @property
+    def provider(self) -> str:
+        return "anthropic"
+
+    async def generate(
+        self,
+        prompt: Any = "",
+        system: Any = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        if self.error:
+            raise self.error
+        return LLMResponse(content="ok", model=self._model, usage=dict(self.usage))
+
+    async def generate_stream(
+        self,
+        prompt: Any = "",
+        system: Any = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        yield StreamChunk(content="")
+        yield StreamChunk(content="hel")
+        if self.error:
+            raise self.error
+        yield StreamChunk(content="lo")
+        yield StreamChunk(content="", is_final=True, usage=dict(self.usage))
+
+
+def _sample(name: str, **labels: str) -> float:
+    """Read a metric sample, treating a missing series as 0."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+LABELS = {"role": "coding", "provider": "anthropic", "model": "claude-sonnet-4-20250514"}
+
+
+class TestClassifyError:
+    """Tests for error classification."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (ProviderError(429), "rate_limit"),
+            (ProviderError(503), "server_error"),
+            (ProviderError(529), "server_error"),
+            (ProviderError(408), "timeout"),
+            (ProviderError(400), "client_error"),
+            (APITimeoutError(), "timeout"),
+            (TimeoutError(), "timeout"),
+            (ValueError(), "other"),
+        ],
+    )
+    def test_classification(self, error: Exception, expected: str) -> None:
+        """Errors are grouped by status and type."""
+        assert classify_error(error) == expected
+
+
+class TestEstimateCost:
+    """Tests for cost estimation."""
+
+    def test_cache_reads_are_discounted(self) -> None:
+        """Cached input is billed at the provider's cache read rate."""
+        usage = {"input_tokens": 1_000_000, "output_tokens": 0}
+        cached = {**usage, "cache_read_input_tokens": 1_000_000}
+
+        assert estimate_cost("anthropic", "claude-sonnet-4-20250514", usage) == 3.0
+        assert estimate_cost("anthropic", "claude-sonnet-4-20250514", cached) == 0.3
+
+    def test_longest_prefix_wins(self) -> None:
+        """gpt-4o-mini is not priced as gpt-4o."""
+        usage = {"input_tokens": 0, "output_tokens": 1_000_000}
+
+        assert estimate_cost("openai", "gpt-4o-mini-2024-07-18", usage) == 0.6
+        assert estimate_cost("openai", "gpt-4o-2024-08-06", usage) == 10.0
+
+    def test_unknown_model_costs_nothing(self) -> None:
+        """Models without a price are not guessed."""
+        assert estimate_cost("openai", "mystery", {"input_tokens": 10}) == 0.0
+
+    def test_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """LLM_MODEL_PRICING adds or replaces prices."""
+        monkeypatch.setenv("LLM_MODEL_PRICING", '{"mystery": [1, 2]}')
+        monkeypatch.setattr(instrumentation, "_pricing", None)
+
+        cost = estimate_cost("openai", "mystery-1", {"input_tokens": 1_000_000})
+
+        monkeypatch.setattr(instrumentation, "_pricing", None)
+        assert cost == 1.0
+
+
+class TestInstrumentedLLMClient:
+    """Tests for the instrumented client wrapper."""
+
+    async def test_generate_records_usage(self) -> None:
+        """Latency, tokens and cost are recorded with role/provider/model labels."""
+        client = InstrumentedLLMClient(FakeClient(), role="coding")
+        before_input = _sample("asdlc_llm_tokens_total", **LABELS, type="input")
+        before_cached = _sample("asdlc_llm_tokens_total", **LABELS, type="cache_read")
+        before_calls = _sample(
+            "asdlc_llm_request_duration_seconds_count", **LABELS, operation="generate"
+        )
+        before_cost = _sample("asdlc_llm_cost_usd_total", **LABELS)
+
+        response = await client.generate(prompt="hi")
+
+        assert response.content == "ok"
+        assert _sample("asdlc_llm_tokens_total", **LABELS, type="input") - before_input == 1000
+        assert (
+            _sample("asdlc_llm_tokens_total", **LABELS, type="cache_read") - before_cached
+            == 800
+        )
+        assert (
+            _sample("asdlc_llm_request_duration_seconds_count", **LABELS, operation="generate")
+            - before_calls
+            == 1
+        )
+        assert _sample("asdlc_llm_cost_usd_total", **LABELS) - before_cost == pytest.approx(
+            (200 * 3 + 800 * 0.3 + 100 * 15) / 1_000_000
+        )
+
+    async def test_generate_counts_errors(self) -> None:
+        """Failures are counted by error type and re-raised."""
+        client = InstrumentedLLMClient(FakeClient(error=ProviderError(429)), role="coding")
+        before = _sample("asdlc_llm_errors_total", **LABELS, error_type="rate_limit")
+
+        with pytest.raises(ProviderError):
+            await client.generate(prompt="hi")
+
+        assert _sample("asdlc_llm_errors_total", **LABELS, error_type="rate_limit") - before == 1
+        assert _sample(
+            "asdlc_llm_requests_total", **LABELS, operation="generate", status="error"
+        ) >= 1
+
+    async def test_stream_records_time_to_first_token(self) -> None:
+        """TTFT is observed once, at the first chunk with content."""
+        client = InstrumentedLLMClient(FakeClient(), role="coding")
+        before_ttft = _sample("asdlc_llm_time_to_first_token_seconds_count", **LABELS)
+        before_output = _sample("asdlc_llm_tokens_total", **LABELS, type="output")
+
+        chunks = [c.content async for c in client.generate_stream(prompt="hi")]
+
+        assert "".join(chunks) == "hello"
+        assert _sample("asdlc_llm_time_to_first_token_seconds_count", **LABELS) - before_ttft == 1
+        assert _sample("asdlc_llm_tokens_total", **LABELS, type="output") - before_output == 100
+
+    async def test_stream_error_after_first_chunk(self) -> None:
+        """Errors mid-stream are counted and re-raised."""
+        client = InstrumentedLLMClient(FakeClient(error=ProviderError(500)), role="coding")
+        before = _sample("asdlc_llm_errors_total", **LABELS, error_type="server_error")
+
+        with pytest.raises(ProviderError):
+            async for _ in client.generate_stream(prompt="hi"):
+                pass
+
+        assert _sample("asdlc_llm_errors_total", **LABELS, error_type="server_error") - before == 1
+
+    async def test_spans_carry_call_context(self) -> None:
+        """Spans are tagged with the role and the task/session in context."""
+        tracer = MagicMock()
+        span = tracer.start_as_current_span.return_value.__enter__.return_value
+        client = InstrumentedLLMClient(FakeClient(), role="coding")
+
+        with patch.object(instrumentation.trace, "get_tracer", return_value=tracer):
+            with llm_call_context(task_id="task-1", session_id="sess-1"):
+                await client.generate(prompt="hi")
+
+        name = tracer.start_as_current_span.call_args.args[0]
+        attributes = tracer.start_as_current_span.call_args.kwargs["attributes"]
+        assert name == "llm.generate"
+        assert attributes["asdlc.agent_role"] == "coding"
+        assert attributes["asdlc.task_id"] == "task-1"
+        assert attributes["asdlc.session_id"] == "sess-1"
+        span.set_attribute.assert_any_call("gen_ai.usage.input_tokens", 1000)
+
+    def test_call_context_is_scoped(self) -> None:
+        """Context attributes are removed when the block exits."""
+        with llm_call_context(task_id="outer"):
+            with llm_call_context(session_id="inner", task_id=None):
+                assert instrumentation._call_context.get() == {
+                    "task_id": "outer",
+                    "session_id": "inner",
+                }
+            assert instrumentation._call_context.get() == {"task_id": "outer"}
+        assert instrumentation._call_context.get() == {}
@@ -0,0 +1,180 @@
+"""Unit tests for provider prompt caching in the LLM clients."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.llm.base_client import (
+    PromptSegment,
+    cache_ordered,
+    prompt_text,
+)
+from src.infrastructure.llm.clients.anthropic_client import AnthropicClient
+from src.infrastructure.llm.clients.openai_client import OpenAIClient
+
+CACHED = {"type": "ephemeral"}
+
+
+def _anthropic_client(**usage: Any) -> tuple[AnthropicClient, AsyncMock]:
+    """AnthropicClient with a mocked SDK returning the given usage."""
+    message = SimpleNamespace(
+        content=[SimpleNamespace(text="ok")],
+        model="claude-test",
+        stop_reason="end_turn",
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5, **usage),
+    )
+    create = AsyncMock(return_value=message)
+    client = AnthropicClient(api_key="key", model="claude-test")
+    client._client = MagicMock()
+    client._client.messages.create = create
+    return client, create
+
+
+def _openai_client(cached_tokens: int | None) -> tuple[OpenAIClient, AsyncMock]:
+    """OpenAIClient with a mocked SDK reporting the given cached tokens."""
+    details = None if cached_tokens is None else SimpleNamespace(cached_tokens=cached_tokens)
+    completion = SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(content="ok", tool_calls=None),
+                finish_reason="stop",
+            )
+        ],
+        model="gpt-test",
+        usage=SimpleNamespace(
+            prompt_tokens=2000, completion_tokens=20, prompt_tokens_details=details
+        ),
+    )
+    create = AsyncMock(return_value=completion)
+    client = OpenAIClient(api_key="key", model="gpt-test")
+    client._client = MagicMock()
+    client._client.chat.completions.create = create
+    return client, create
+
+
+class TestPromptSegments:
+    """Tests for the segment helpers."""
+
+    def test_prompt_text_joins_segments(self) -> None:
+        """Segments are joined with blank lines; strings pass through."""
+        segments = [PromptSegment("a", cache=True), PromptSegment(""), PromptSegment("b")]
+
+        assert prompt_text(segments) == "a\n\nb"
+        assert prompt_text("plain") == "plain"
+        assert prompt_text(None) == ""
+
+    def test_cache_ordered_moves_stable_segments_first(self) -> None:
+        """Cacheable segments lead, keeping their relative order."""
+        segments = [
+            PromptSegment("task"),
+            PromptSegment("pack", cache=True),
+            PromptSegment("rules", cache=True),
+        ]
+
+        assert [s.text for s in cache_ordered(segments)] == ["pack", "rules", "task"]
+        assert cache_ordered("plain") == "plain"
+
+
+class TestAnthropicPromptCaching:
+    """Tests for cache_control breakpoints."""
+
+    async def test_plain_system_prompt_is_cached(self) -> None:
+        """A system string becomes one cached block; the prompt stays a string."""
+        client, create = _anthropic_client()
+
+        await client.generate(prompt="hi", system="You are a planner.")
+
+        params = create.call_args.kwargs
+        assert params["system"] == [
+            {"type": "text", "text": "You are a planner.", "cache_control": CACHED}
+        ]
+        assert params["messages"] == [{"role": "user", "content": "hi"}]
+
+    async def test_cache_system_opt_out(self) -> None:
+        """cache_system=False sends the system prompt without a breakpoint."""
+        client, create = _anthropic_client()
+
+        await client.generate(prompt="hi", system="sys", cache_system=False)
+
+        assert create.call_args.kwargs["system"] == [{"type": "text", "text": "sys"}]
+
+    async def test_prompt_segments_become_blocks(self) -> None:
+        """Cached prompt segments carry cache_control; others do not."""
+        client, create = _anthropic_client()
+
+        await client.generate(
+            prompt=[PromptSegment("context pack", cache=True), PromptSegment("task")],
+            system=[PromptSegment("rules", cache=True), PromptSegment("today")],
+        )
+
+        params = create.call_args.kwargs
+        assert params["system"] == [
+            {"type": "text", "text": "rules", "cache_control": CACHED},
+            {"type": "text", "text": "today"},
+        ]
+        assert params["messages"][-1]["content"] == [
+            {"type": "text", "text": "context pack", "cache_control": CACHED},
+            {"type": "text", "text": "task"},
+        ]
+
+    async def test_breakpoints_limited_to_latest_four(self) -> None:
+        """Only the last four breakpoints are sent."""
+        client, create = _anthropic_client()
+
+        await client.generate(
+            prompt=[PromptSegment(f"p{i}", cache=True) for i in range(3)],
+            system=[PromptSegment(f"s{i}", cache=True) for i in range(3)],
+        )
+
+        params = create.call_args.kwargs
+        blocks = params["system"] + params["messages"][-1]["content"]
+        assert [b["text"] for b in blocks if "cache_control" in b] == ["s2", "p0", "p1", "p2"]
+
+    async def test_cached_usage_reported(self) -> None:
+        """Cache reads and writes are reported and counted as input."""
+        client, _ = _anthropic_client(
+            cache_read_input_tokens=3000, cache_creation_input_tokens=500
+        )
+
+        response = await client.generate(prompt="hi", system="sys")
+
+        assert response.usage == {
+            "input_tokens": 3510,
+            "output_tokens": 5,
+            "cache_read_input_tokens": 3000,
+            "cache_creation_input_tokens": 500,
+        }
+        assert response.cached_input_tokens == 3000
+
+
+class TestOpenAIPromptCaching:
+    """Tests for prefix ordering and cached usage."""
+
+    async def test_stable_segments_sent_first(self) -> None:
+        """Cacheable segments lead the system and user messages."""
+        client, create = _openai_client(cached_tokens=0)
+
+        await client.generate(
+            prompt=[PromptSegment("task"), PromptSegment("context pack", cache=True)],
+            system=[PromptSegment("today"), PromptSegment("rules", cache=True)],
+        )
+
+        messages = create.call_args.kwargs["messages"]
+        assert messages == [
+            {"role": "system", "content": "rules\n\ntoday"},
+            {"role": "user", "content": "context pack\n\ntask"},
+        ]
+
+    @pytest.mark.parametrize(("cached", "expected"), [(1536, 1536), (None, 0)])
+    async def test_cached_usage_reported(self, cached: int | None, expected: int) -> None:
+        """Cached prompt tokens are reported when the API includes them."""
+        client, _ = _openai_client(cached_tokens=cached)
+
+        response = await client.generate(prompt="hi", system="sys")
+
+        assert response.usage["input_tokens"] == 2000
+        assert response.cached_input_tokens == expected
@@ -0,0 +1,477 @@
+"""Unit tests for the LLM rate limiter and client retry handling."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.llm import rate_limiter as rate_limiter_module
+from src.infrastructure.llm.base_client import StreamChunk
+from src.infrastructure.llm.clients.anthropic_client import AnthropicClient
+from src.infrastructure.llm.rate_limiter import (
+    LLMPriority,
+    LLMRateLimiter,
+    RateLimitConfig,
+    RateLimitScope,
+    estimate_tokens,
+    is_rate_limit_error,
+    is_retryable_error,
+    llm_priority,
+    resolve_priority,
+    retry_after_seconds,
+)
+
+
+class FakeAPIError(Exception):
+    """Provider SDK error carrying a status code and response headers."""
+
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class FakeClock:
+    """Controls the limiter's clock and sleeps without real waiting."""
+
+    def __init__(self) -> None:
+        self.now_ms = 1_000_000.0
+        self.sleeps: list[float] = []
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now_ms += seconds * 1000
+        # Yield a few times so other tasks can queue up meanwhile
+        for _ in range(5):
+            await _real_sleep(0)
+
+
+_real_sleep = asyncio.sleep
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeClock]:
+    """Replace the limiter's clock, sleep and jitter."""
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "_now_ms", lambda: fake.now_ms)
+    monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", fake.sleep)
+    monkeypatch.setattr(rate_limiter_module.random, "uniform", lambda a, b: a)
+    yield fake
+
+
+def _limiter(rpm: int = 0, tpm: int = 0, **kwargs: Any) -> LLMRateLimiter:
+    """Create a local-only limiter with the given default budgets."""
+    return LLMRateLimiter(
+        RateLimitConfig(
+            requests_per_minute=rpm, tokens_per_minute=tpm, use_redis=False, **kwargs
+        )
+    )
+
+
+SCOPE = RateLimitScope.for_client("anthropic", "claude-test", "sk-ant-secret")
+
+
+class TestRateLimitConfig:
+    """Tests for rate limit configuration."""
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Defaults apply to every provider unless overridden."""
+        monkeypatch.setenv("LLM_RATE_LIMIT_RPM", "50")
+        monkeypatch.setenv("LLM_RATE_LIMIT_TPM", "40000")
+        monkeypatch.setenv("LLM_RATE_LIMIT_OPENAI_RPM", "500")
+        monkeypatch.setenv("LLM_RATE_LIMIT_BACKEND", "local")
+
+        config = RateLimitConfig.from_env()
+
+        assert config.limits_for("anthropic") == (50, 40000)
+        assert config.limits_for("openai") == (500, 40000)
+        assert config.use_redis is False
+
+    def test_disabled_means_unlimited(self) -> None:
+        """A disabled limiter reports no budgets."""
+        config = RateLimitConfig(enabled=False, requests_per_minute=10)
+
+        assert config.limits_for("anthropic") == (0, 0)
+
+    def test_scope_hides_api_key(self) -> None:
+        """The API key never appears in the budget identifier."""
+        assert "secret" not in SCOPE.bucket_id
+        assert SCOPE.bucket_id.startswith("anthropic:claude-test:")
+
+
+class TestPriority:
+    """Tests for priority resolution."""
+
+    def test_context_priority(self) -> None:
+        """The context manager sets the default priority for calls."""
+        assert resolve_priority() == LLMPriority.NORMAL
+        with llm_priority("hitl"):
+            assert resolve_priority() == LLMPriority.HITL
+            assert resolve_priority(LLMPriority.BATCH) == LLMPriority.BATCH
+        assert resolve_priority() == LLMPriority.NORMAL
+
+    def test_unknown_priority(self) -> None:
+        """Unknown priority names are rejected."""
+        with pytest.raises(ValueError):
+            resolve_priority("urgent")
+
+
+class TestLocalBudgets:
+    """Tests for in-process GCRA budgets."""
+
+    async def test_unlimited_never_waits(self, clock: FakeClock) -> None:
+        """Without budgets, acquire returns immediately."""
+        limiter = _limiter()
+
+        for _ in range(100):
+            await limiter.acquire(SCOPE, tokens=10_000)
+
+        assert clock.sleeps == []
+
+    async def test_requests_per_minute(self, clock: FakeClock) -> None:
+        """Requests beyond the RPM burst wait for the emission interval."""
+        limiter = _limiter(rpm=4)
+
+        for _ in range(4):
+            await limiter.acquire(SCOPE, priority=LLMPriority.HITL)
+        assert clock.sleeps == []
+
+        await limiter.acquire(SCOPE, priority=LLMPriority.HITL)
+
+        assert sum(clock.sleeps) == pytest.approx(15.0)
+
+    async def test_lower_priority_leaves_headroom(self, clock: FakeClock) -> None:
+        """Normal calls stop early, so a HITL call still gets through."""
+        limiter = _limiter(rpm=4)
+
+        for _ in range(3):
+            await limiter.acquire(SCOPE, priority=LLMPriority.NORMAL)
+        await limiter.acquire(SCOPE, priority=LLMPriority.HITL)
+        assert clock.sleeps == []
+
+        await limiter.acquire(SCOPE, priority=LLMPriority.NORMAL)
+        assert clock.sleeps
+
+    async def test_token_budget_and_refund(self, clock: FakeClock) -> None:
+        """Reservations are corrected to the real usage."""
+        limiter = _limiter(tpm=1000)
+
+        await limiter.acquire(SCOPE, tokens=1000, priority=LLMPriority.HITL)
+        await limiter.record_usage(SCOPE, reserved=1000, actual=100)
+        await limiter.acquire(SCOPE, tokens=800, priority=LLMPriority.HITL)
+
+        assert clock.sleeps == []
+
+        await limiter.acquire(SCOPE, tokens=500, priority=LLMPriority.HITL)
+        assert sum(clock.sleeps) == pytest.approx(24.0)
+
+    async def test_oversized_request_is_admitted(self, clock: FakeClock) -> None:
+        """A request larger than the whole budget is clamped, not starved."""
+        limiter = _limiter(tpm=1000)
+
+        await limiter.acquire(SCOPE, tokens=50_000, priority=LLMPriority.HITL)
+
+        assert clock.sleeps == []
+
+    async def test_penalty_blocks_scope(self, clock: FakeClock) -> None:
+        """After a 429 every caller of the scope waits out retry-after."""
+        limiter = _limiter()
+
+        await limiter.penalize(SCOPE, retry_after=2.0)
+        await limiter.acquire(SCOPE)
+
+        assert sum(clock.sleeps) == pytest.approx(2.0)
+        assert limiter.get_stats()["penalties"] == 1
+
+    async def test_sleeping_caller_does_not_hold_back_higher_priority(
+        self, clock: FakeClock
+    ) -> None:
+        """A HITL call the budget admits is not queued behind a waiting BATCH call."""
+        limiter = _limiter(rpm=60)
+        for _ in range(40):
+            await limiter.acquire(SCOPE, priority=LLMPriority.HITL)
+        order: list[LLMPriority] = []
+
+        async def call(priority: LLMPriority) -> None:
+            await limiter.acquire(SCOPE, priority=priority)
+            order.append(priority)
+
+        batch = asyncio.create_task(call(LLMPriority.BATCH))
+        await _real_sleep(0)
+        await call(LLMPriority.HITL)
+        await batch
+
+        assert order == [LLMPriority.HITL, LLMPriority.BATCH]
+
+
+class TestRedisBudgets:
+    """Tests for budgets shared through Redis."""
+
+    @staticmethod
+    def _redis(script: AsyncMock) -> MagicMock:
+        client = MagicMock()
+        client.register_script = MagicMock(return_value=script)
+        client.set = AsyncMock()
+        return client
+
+    async def test_acquire_runs_gcra_script(self, clock: FakeClock) -> None:
+        """The script is called with the scope's keys and waits as told."""
+        script = AsyncMock(side_effect=[1500, 0])
+        limiter = LLMRateLimiter(
+            RateLimitConfig(requests_per_minute=60, tokens_per_minute=60_000),
+            redis_client=self._redis(script),
+        )
+
+        await limiter.acquire(SCOPE, tokens=100, priority=LLMPriority.HITL)
+
+        keys = script.await_args.kwargs["keys"]
+        assert keys == [
+            f"asdlc:llm:ratelimit:{SCOPE.bucket_id}:rpm",
+            f"asdlc:llm:ratelimit:{SCOPE.bucket_id}:tpm",
+            f"asdlc:llm:ratelimit:{SCOPE.bucket_id}:block",
+        ]
+        assert script.await_args.kwargs["args"] == [1000, 1.0, 100, 60000]
+        assert sum(clock.sleeps) == pytest.approx(1.5)
+
+    async def test_penalty_is_shared(self, clock: FakeClock) -> None:
+        """A 429 penalty is written to Redis for other processes."""
+        client = self._redis(AsyncMock(return_value=0))
+        limiter = LLMRateLimiter(RateLimitConfig(), redis_client=client)
+
+        await limiter.penalize(SCOPE, retry_after=3.0)
+
+        client.set.assert_awaited_once_with(
+            f"asdlc:llm:ratelimit:{SCOPE.bucket_id}:block", "1", px=3000
+        )
+
+    async def test_turns_served_by_priority(self, clock: FakeClock) -> None:
+        """Callers queued for a scope try the budget highest priority first."""
+        release = asyncio.Event()
+        allowances: list[int] = []
+
+        async def script(keys: list[str], args: list[Any]) -> int:
+            allowances.append(args[3])
+            if len(allowances) == 1:
+                await release.wait()
+            return 0
+
+        limiter = LLMRateLimiter(
+            RateLimitConfig(requests_per_minute=60),
+            redis_client=self._redis(AsyncMock(side_effect=script)),
+        )
+        head = asyncio.create_task(limiter.acquire(SCOPE, priority=LLMPriority.NORMAL))
+        await _real_sleep(0)
+        rest = [
+            asyncio.create_task(limiter.acquire(SCOPE, priority=p))
+            for p in (LLMPriority.BATCH, LLMPriority.NORMAL, LLMPriority.HITL)
+        ]
+        await _real_sleep(0)
+        release.set()
+        await asyncio.gather(head, *rest)
+
+        assert allowances == [45000, 60000, 45000, 30000]
+
+    async def test_shared_block_without_budgets(self, clock: FakeClock) -> None:
+        """A 429 block set by another process holds back unlimited scopes too."""
+        client = self._redis(AsyncMock(return_value=0))
+        client.pttl = AsyncMock(side_effect=[2000, -2])
+        limiter = LLMRateLimiter(RateLimitConfig(), redis_client=client)
+
+        await limiter.acquire(SCOPE)
+
+        client.pttl.assert_awaited_with(f"asdlc:llm:ratelimit:{SCOPE.bucket_id}:block")
+        assert sum(clock.sleeps) == pytest.approx(2.0)
+
+    async def test_redis_failure_falls_back(self, clock: FakeClock) -> None:
+        """Redis errors never fail a call; local budgets are used instead."""
+        script = AsyncMock(side_effect=ConnectionError("down"))
+        limiter = LLMRateLimiter(
+            RateLimitConfig(requests_per_minute=60), redis_client=self._redis(script)
+        )
+
+        await limiter.acquire(SCOPE, priority=LLMPriority.HITL)
+
+        assert clock.sleeps == []
+        assert limiter.get_stats()["redis_errors"] == 1
+
+
+class TestRetryAfter:
+    """Tests for reading provider errors."""
+
+    def test_retry_after_seconds(self) -> None:
+        """retry-after is read in seconds."""
+        assert retry_after_seconds(FakeAPIError(429, {"retry-after": "7"})) == 7.0
+
+    def test_retry_after_ms_preferred(self) -> None:
+        """retry-after-ms is more precise and wins."""
+        error = FakeAPIError(429, {"retry-after": "1", "retry-after-ms": "250"})
+
+        assert retry_after_seconds(error) == 0.25
+
+    def test_retry_after_http_date(self) -> None:
+        """retry-after may be an HTTP date."""
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+
+        delay = retry_after_seconds(FakeAPIError(429, {"retry-after": when}))
+
+        assert delay is not None and 25 <= delay <= 30
+
+    def test_no_headers(self) -> None:
+        """Errors without a response carry no delay."""
+        assert retry_after_seconds(RuntimeError("boom")) is None
+
+    @pytest.mark.parametrize(
+        ("status", "retryable"), [(429, True), (529, True), (500, True), (400, False)]
+    )
+    def test_retryable_statuses(self, status: int, retryable: bool) -> None:
+        """Rate limits, overload and server errors are retried."""
+        assert is_retryable_error(FakeAPIError(status)) is retryable
+        assert is_rate_limit_error(FakeAPIError(status)) is (status == 429)
+
+    def test_estimate_tokens(self) -> None:
+        """Estimates cover strings and structured content."""
+        assert estimate_tokens("abcd" * 10, None) == 10
+        assert estimate_tokens([{"role": "user", "content": "hi"}]) > 0
+
+
+def _message(text: str = "ok") -> SimpleNamespace:
+    """Build a minimal Anthropic message response."""
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        model="claude-test",
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        stop_reason="end_turn",
+    )
+
+
+class TestClientRetries:
+    """Tests for rate limiting and retries in the LLM clients."""
+
+    def _client(self, limiter: LLMRateLimiter) -> tuple[AnthropicClient, MagicMock]:
+        client = AnthropicClient(
+            api_key="sk-ant-secret", model="claude-test", rate_limiter=limiter
+        )
+        sdk = MagicMock()
+        sdk.messages.create = AsyncMock()
+        client._client = sdk
+        return client, sdk
+
+    async def test_rate_limit_error_honours_retry_after(self, clock: FakeClock) -> None:
+        """A 429 holds the scope for retry-after, then the call is retried."""
+        limiter = _limiter()
+        client, sdk = self._client(limiter)
+        sdk.messages.create.side_effect = [
+            FakeAPIError(429, {"retry-after": "4"}),
+            _message("done"),
+        ]
+
+        response = await client.generate(prompt="hi")
+
+        assert response.content == "done"
+        assert sdk.messages.create.await_count == 2
+        assert sum(clock.sleeps) == pytest.approx(4.0)
+
+    async def test_non_retryable_error_is_raised(self, clock: FakeClock) -> None:
+        """Client errors are raised without retrying."""
+        limiter = _limiter()
+        client, sdk = self._client(limiter)
+        sdk.messages.create.side_effect = FakeAPIError(400)
+
+        with pytest.raises(FakeAPIError):
+            await client.generate(prompt="hi")
+
+        assert sdk.messages.create.await_count == 1
+
+    async def test_retries_are_bounded(self, clock: FakeClock) -> None:
+        """After max_retries the last error is raised."""
+        limiter = _limiter(max_retries=2)
+        client, sdk = self._client(limiter)
+        sdk.messages.create.side_effect = FakeAPIError(529)
+
+        with pytest.raises(FakeAPIError):
+            await client.generate(prompt="hi")
+
+        assert sdk.messages.create.await_count == 3
+
+    async def test_excessive_retry_after_is_raised(self, clock: FakeClock) -> None:
+        """A retry-after beyond the allowed wait goes back to the caller."""
+        limiter = _limiter(max_retry_wait_seconds=10)
+        client, sdk = self._client(limiter)
+        sdk.messages.create.side_effect = FakeAPIError(429, {"retry-after": "600"})
+
+        with pytest.raises(FakeAPIError):
+            await client.generate(prompt="hi")
+
+        assert clock.sleeps == []
+
+    async def test_disabled_retries_still_block_scope(self, clock: FakeClock) -> None:
+        """With retries off a 429 is raised at once but still blocks the scope."""
+        limiter = _limiter()
+        client = AnthropicClient(
+            api_key="sk-ant-secret",
+            model="claude-test",
+            rate_limiter=limiter,
+            max_retries=0,
+        )
+        sdk = MagicMock()
+        sdk.messages.create = AsyncMock(side_effect=FakeAPIError(429, {"retry-after": "4"}))
+        client._client = sdk
+
+        with pytest.raises(FakeAPIError):
+            await client.generate(prompt="hi")
+
+        assert sdk.messages.create.await_count == 1
+        assert clock.sleeps == []
+        assert limiter.is_blocked(client.rate_limit_scope)
+
+    async def test_usage_is_recorded(self, clock: FakeClock) -> None:
+        """The reservation is corrected to the reported usage."""
+        limiter = _limiter(tpm=10_000)
+        limiter.record_usage = AsyncMock()  # type: ignore[method-assign]
+        client, sdk = self._client(limiter)
+        sdk.messages.create.return_value = _message()
+
+        await client.generate(prompt="x" * 400, priority="batch")
+
+        estimated = estimate_tokens(None, [{"role": "user", "content": "x" * 400}], None)
+        limiter.record_usage.assert_awaited_once_with(
+            client.rate_limit_scope, estimated, 15
+        )
+
+    async def test_stream_retried_before_first_chunk(self, clock: FakeClock) -> None:
+        """A stream that fails before producing output is retried."""
+        limiter = _limiter()
+        client, _ = self._client(limiter)
+        attempts = 0
+
+        async def open_stream() -> Any:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise FakeAPIError(503)
+            yield StreamChunk(content="hello")
+            yield StreamChunk(content="", is_final=True, usage={"input_tokens": 1})
+
+        chunks = [
+            c async for c in client._stream_with_rate_limit(open_stream, estimated_tokens=1)
+        ]
+
+        assert attempts == 2
+        assert [c.content for c in chunks] == ["hello", ""]
+
+    async def test_sdk_retries_disabled_with_limiter(self) -> None:
+        """The SDK does not retry on its own when the limiter handles it."""
+        with_limiter = AnthropicClient(
+            api_key="k", model="m", rate_limiter=_limiter()
+        )
+        without = AnthropicClient(api_key="k", model="m")
+
+        assert with_limiter._sdk_options() == {"max_retries": 0}
+        assert without._sdk_options() == {}
@@ -0,0 +1,306 @@
+"""Unit tests for the LLM response cache."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.llm.base_client import BaseLLMClient, LLMResponse, StreamChunk
+from src.infrastructure.llm.response_cache import (
+    CachingLLMClient,
+    LLMResponseCache,
+    ResponseCacheConfig,
+    request_key,
+)
+
+
+class FakeClient(BaseLLMClient):
+    """Client that counts calls and returns a fixed response."""
+
+    def __init__(self, temperature: float = 0.0) -> None:
+        super().__init__(api_key="key", model="fake-model", temperature=temperature)
+        self.calls: list[dict[str, Any]] = []
+        self.delay = 0.0
+
+    @property
+    def provider(self) -> str:
+        return "fake"
+
+    async def generate(
+        self,
+        prompt: str = "",
+        system: str | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        self.calls.append({"prompt": prompt, **kwargs})
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return LLMResponse(
+            content=f"answer to {prompt}",
+            model=self._model,
+            usage={"input_tokens": 10, "output_tokens": 5},
+            stop_reason="end_turn",
+        )
+
+    async def generate_stream(
+        self,
+        prompt: str = "",
+        system: str | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        self.calls.append({"prompt": prompt, **kwargs})
+        yield StreamChunk(content="chunk")
+        yield StreamChunk(content="", is_final=True, usage={"output_tokens": 1})
+
+
+def _response(content: str = "hello") -> LLMResponse:
+    """Build an LLMResponse."""
+    return LLMResponse(content=content, model="fake-model", usage={"input_tokens": 1})
+
+
+@pytest.fixture
+def cache() -> LLMResponseCache:
+    """Memory-only response cache."""
+    return LLMResponseCache(ResponseCacheConfig(use_redis=False))
+
+
+class TestRequestKey:
+    """Tests for request hashing."""
+
+    def test_stable_and_sensitive(self) -> None:
+        """Equal requests hash equally; any differing part changes the key."""
+        base = {"provider": "fake", "model": "m", "prompt": "p", "temperature": 0}
+
+        assert request_key(**base) == request_key(**dict(reversed(base.items())))
+        assert request_key(**base) != request_key(**{**base, "prompt": "q"})
+        assert request_key(**base) != request_key(**{**base, "model": "n"})
+
+
+class TestLLMResponseCache:
+    """Tests for the two-tier cache."""
+
+    async def test_memory_round_trip(self, cache: LLMResponseCache) -> None:
+        """A stored response is returned on lookup."""
+        await cache.put("k", _response())
+
+        assert await cache.get("k") == _response()
+        assert await cache.get("other") is None
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    async def test_oversized_entries_are_not_cached(self) -> None:
+        """Responses larger than max_entry_bytes are skipped."""
+        cache = LLMResponseCache(ResponseCacheConfig(use_redis=False, max_entry_bytes=50))
+
+        assert not await cache.put("k", _response("x" * 100))
+        assert await cache.get("k") is None
+
+    async def test_memory_limit_evicts_least_recently_used(self) -> None:
+        """The oldest untouched entry is evicted when memory is full."""
+        size = len(json.dumps(dataclasses.asdict(_response("a"))))
+        cache = LLMResponseCache(
+            ResponseCacheConfig(use_redis=False, max_memory_bytes=size * 2)
+        )
+        await cache.put("a", _response("a"))
+        await cache.put("b", _response("b"))
+        await cache.get("a")
+        await cache.put("c", _response("c"))
+
+        assert await cache.get("a") is not None
+        assert await cache.get("b") is None
+        assert cache.get_stats()["memory_bytes"] <= size * 2
+
+    async def test_expired_entries_are_misses(self) -> None:
+        """Entries older than the TTL are not returned."""
+        cache = LLMResponseCache(ResponseCacheConfig(use_redis=False, ttl_seconds=0))
+        await cache.put("k", _response())
+
+        assert await cache.get("k") is None
+        assert cache.get_stats()["entries"] == 0
+
+    async def test_redis_tier(self) -> None:
+        """Entries are written with a TTL and read back from Redis."""
+        redis_client = AsyncMock()
+        config = ResponseCacheConfig(key_prefix="test:", ttl_seconds=60)
+        writer = LLMResponseCache(config, redis_client=redis_client)
+
+        await writer.put("k", _response())
+
+        key, raw = redis_client.set.call_args.args
+        assert key == "test:k"
+        assert redis_client.set.call_args.kwargs == {"ex": 60}
+
+        redis_client.get.return_value = raw.encode()
+        reader = LLMResponseCache(config, redis_client=redis_client)
+
+        assert await reader.get("k") == _response()
+        assert reader.get_stats()["remote_hits"] == 1
+
+    async def test_redis_errors_are_misses(self) -> None:
+        """Failing Redis calls never fail the caller."""
+        redis_client = AsyncMock()
+        redis_client.get.side_effect = ConnectionError("down")
+        redis_client.set.side_effect = ConnectionError("down")
+        cache = LLMResponseCache(ResponseCacheConfig(), redis_client=redis_client)
+
+        assert await cache.put("k", _response())
+        cache.clear()
+        assert await cache.get("k") is None
+
+    async def test_corrupt_entries_are_ignored(self) -> None:
+        """Unparseable Redis entries are treated as misses."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = json.dumps({"unexpected": 1})
+        cache = LLMResponseCache(ResponseCacheConfig(), redis_client=redis_client)
+
+        assert await cache.get("k") is None
+
+
+class TestCachingLLMClient:
+    """Tests for the caching client wrapper."""
+
+    async def test_deterministic_calls_are_cached(self, cache: LLMResponseCache) -> None:
+        """A repeated call at temperature 0 is answered from the cache."""
+        inner = FakeClient(temperature=0.0)
+        client = CachingLLMClient(inner, cache)
+
+        first = await client.generate(prompt="q", system="s")
+        second = await client.generate(prompt="q", system="s")
+
+        assert first == second
+        assert len(inner.calls) == 1
+
+    async def test_key_covers_request_parts(self, cache: LLMResponseCache) -> None:
+        """Changing the prompt, system or max_tokens misses the cache."""
+        inner = FakeClient(temperature=0.0)
+        client = CachingLLMClient(inner, cache)
+
+        await client.generate(prompt="q", system="s")
+        await client.generate(prompt="q2", system="s")
+        await client.generate(prompt="q", system="s2")
+        await client.generate(prompt="q", system="s", max_tokens=100)
+
+        assert len(inner.calls) == 4
+
+    async def test_sampled_calls_are_not_cached(self, cache: LLMResponseCache) -> None:
+        """Calls with a non-zero temperature go to the provider each time."""
+        inner = FakeClient(temperature=0.7)
+        client = CachingLLMClient(inner, cache)
+
+        await client.generate(prompt="q")
+        await client.generate(prompt="q")
+
+        assert len(inner.calls) == 2
+
+    async def test_explicit_cache_flag(self, cache: LLMResponseCache) -> None:
+        """cache=True opts in at any temperature; cache=False opts out."""
+        inner = FakeClient(temperature=0.7)
+        client = CachingLLMClient(inner, cache)
+
+        await client.generate(prompt="q", cache=True)
+        await client.generate(prompt="q", cache=True)
+        await client.generate(prompt="q", temperature=0, cache=False)
+        await client.generate(prompt="q", temperature=0, cache=False)
+
+        assert len(inner.calls) == 3
+        assert all("cache" not in call for call in inner.calls)
+
+    async def test_concurrent_calls_share_one_request(
+        self, cache: LLMResponseCache
+    ) -> None:
+        """Identical calls in flight at the same time make one provider call."""
+        inner = FakeClient(temperature=0.0)
+        inner.delay = 0.01
+        client = CachingLLMClient(inner, cache)
+
+        results = await asyncio.gather(*(client.generate(prompt="q") for _ in range(3)))
+
+        assert len(inner.calls) == 1
+        assert all(r == results[0] for r in results)
+
+    async def test_cancelled_leader_does_not_cancel_followers(
+        self, cache: LLMResponseCache
+    ) -> None:
+        """When the first call is cancelled, a waiting call issues it again."""
+        inner = FakeClient(temperature=0.0)
+        inner.delay = 0.01
+        client = CachingLLMClient(inner, cache)
+
+        leader = asyncio.create_task(client.generate(prompt="q"))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(client.generate(prompt="q")) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert len(inner.calls) == 2
+        assert results[0] == results[1]
+        assert results[0].content == "answer to q"
+
+    async def test_cancelled_follower_is_cancelled(self, cache: LLMResponseCache) -> None:
+        """Cancelling a waiting call cancels it without affecting the first."""
+        inner = FakeClient(temperature=0.0)
+        inner.delay = 0.01
+        client = CachingLLMClient(inner, cache)
+
+        leader = asyncio.create_task(client.generate(prompt="q"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(client.generate(prompt="q"))
+        await asyncio.sleep(0)
+        follower.cancel()
+
+        response = await leader
+
+        assert response.content == "answer to q"
+        assert follower.cancelled()
+        assert len(inner.calls) == 1
+
+    async def test_completed_streams_are_cached(self, cache: LLMResponseCache) -> None:
+        """A stream read to the end answers repeated streams and calls."""
+        inner = FakeClient(temperature=0.0)
+        client = CachingLLMClient(inner, cache)
+
+        for _ in range(2):
+            chunks = [c async for c in client.generate_stream(prompt="q")]
+            assert "".join(c.content for c in chunks) == "chunk"
+            assert chunks[-1].is_final
+            assert chunks[-1].usage == {"output_tokens": 1}
+        response = await client.generate(prompt="q")
+
+        assert response.content == "chunk"
+        assert len(inner.calls) == 1
+
+    async def test_streams_closed_early_are_not_cached(
+        self, cache: LLMResponseCache
+    ) -> None:
+        """A stream abandoned before its final chunk is not cached."""
+        inner = FakeClient(temperature=0.0)
+        client = CachingLLMClient(inner, cache)
+
+        stream = client.generate_stream(prompt="q")
+        assert (await anext(stream)).content == "chunk"
+        await stream.aclose()
+        await client.generate(prompt="q")
+
+        assert len(inner.calls) == 2
+
+    def test_exposes_wrapped_client_identity(self, cache: LLMResponseCache) -> None:
+        """Provider, model and scope match the wrapped client."""
+        inner = FakeClient()
+        client = CachingLLMClient(inner, cache)
+
+        assert client.provider == "fake"
+        assert client.model == "fake-model"
+        assert client.rate_limit_scope == inner.rate_limit_scope
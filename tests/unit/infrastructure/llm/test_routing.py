@@ -0,0 +1,260 @@
+"""Unit tests for latency-aware routing and hedged LLM requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.llm.base_client import BaseLLMClient, LLMResponse, StreamChunk
+from src.infrastructure.llm.routing import (
+    LatencyTracker,
+    RoutingConfig,
+    RoutingLLMClient,
+    TargetStats,
+)
+
+
+class ProviderError(Exception):
+    """Provider SDK error carrying an HTTP status."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FakeTarget(BaseLLMClient):
+    """Client answering after a delay, or raising a configured error."""
+
+    def __init__(
+        self, model: str, delay: float = 0.0, error: Exception | None = None
+    ) -> None:
+        super().__init__(api_key=f"key-{model}", model=model)
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    @property
+    def provider(self) -> str:
+        return "fake"
+
+    async def generate(
+        self,
+        prompt: Any = "",
+        system: Any = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return LLMResponse(content=self._model, model=self._model)
+
+    async def generate_stream(
+        self,
+        prompt: Any = "",
+        system: Any = None,
+        messages: list[dict[str, Any]] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[StreamChunk]:
+        self.calls += 1
+        if self.error:
+            raise self.error
+        yield StreamChunk(content=self._model)
+        yield StreamChunk(content="", is_final=True)
+
+
+def _config(**overrides: Any) -> RoutingConfig:
+    """Routing config with short delays for tests."""
+    values: dict[str, Any] = {
+        "initial_hedge_delay_seconds": 0.05,
+        "min_hedge_delay_seconds": 0.01,
+        "min_samples": 3,
+    }
+    values.update(overrides)
+    return RoutingConfig(**values)
+
+
+class TestTargetStats:
+    """Tests for rolling latency and error statistics."""
+
+    def test_p95_needs_min_samples(self) -> None:
+        """The p95 is only reported once enough samples exist."""
+        stats = TargetStats(_config(min_samples=3))
+        stats.record_latency(1.0)
+        stats.record_latency(2.0)
+        assert stats.p95() is None
+
+        for latency in range(3, 21):
+            stats.record_latency(float(latency))
+        assert stats.p95() == 19.0
+
+    def test_error_rate_decays_while_idle(self) -> None:
+        """An avoided target's error rate falls back over time."""
+        stats = TargetStats(_config(ewma_alpha=1.0, error_half_life_seconds=10.0))
+        stats.record_outcome(failed=True)
+        now = stats._error_updated_at
+
+        assert stats.error_rate(now) == 1.0
+        assert stats.error_rate(now + 10.0) == pytest.approx(0.5)
+
+
+class TestRanking:
+    """Tests for target ordering."""
+
+    def test_preference_order_by_default(self) -> None:
+        """Without statistics targets keep their configured order."""
+        a, b = FakeTarget("a"), FakeTarget("b")
+        client = RoutingLLMClient([a, b], role="coding", tracker=LatencyTracker(_config()))
+
+        assert client.ranked_targets() == [a, b]
+        assert client.model == "a"
+
+    def test_failing_and_slow_targets_move_back(self) -> None:
+        """Erroring targets go last; much slower targets go after faster ones."""
+        tracker = LatencyTracker(_config(ewma_alpha=1.0))
+        a, b, c = FakeTarget("a"), FakeTarget("b"), FakeTarget("c")
+        tracker.stats_for(a).record_outcome(failed=True)
+        tracker.stats_for(b).record_latency(10.0)
+        tracker.stats_for(c).record_latency(1.0)
+        client = RoutingLLMClient([a, b, c], role="coding", tracker=tracker)
+
+        assert client.ranked_targets() == [c, b, a]
+
+    def test_blocked_scope_moves_back(self) -> None:
+        """Targets whose scope the rate limiter blocked go after the others."""
+        tracker = LatencyTracker(_config(ewma_alpha=1.0))
+        a, b, c = FakeTarget("a"), FakeTarget("b"), FakeTarget("c")
+        tracker.stats_for(c).record_outcome(failed=True)
+        limiter = MagicMock()
+        limiter.is_blocked.side_effect = lambda scope: scope == a.rate_limit_scope
+        a._rate_limiter = limiter
+        client = RoutingLLMClient([a, b, c], role="coding", tracker=tracker)
+
+        assert client.ranked_targets() == [b, a, c]
+
+    def test_requires_a_target(self) -> None:
+        """An empty target list is rejected."""
+        with pytest.raises(ValueError):
+            RoutingLLMClient([], role="coding")
+
+
+class TestGenerate:
+    """Tests for hedging and failover of generate calls."""
+
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        """A primary answering within the hedge delay is the only call."""
+        primary, backup = FakeTarget("primary"), FakeTarget("backup")
+        client = RoutingLLMClient(
+            [primary, backup], role="coding", hedge=True, tracker=LatencyTracker(_config())
+        )
+
+        response = await client.generate(prompt="hi")
+
+        assert response.content == "primary"
+        assert backup.calls == 0
+
+    async def test_slow_primary_is_hedged_and_cancelled(self) -> None:
+        """A backup is sent after the hedge delay and the loser is cancelled."""
+        primary = FakeTarget("primary", delay=5.0)
+        backup = FakeTarget("backup")
+        tracker = LatencyTracker(_config())
+        client = RoutingLLMClient([primary, backup], role="coding", hedge=True, tracker=tracker)
+
+        response = await asyncio.wait_for(client.generate(prompt="hi"), timeout=2.0)
+
+        assert response.content == "backup"
+        assert primary.cancelled == 1
+        # The loser's running time counts against it
+        assert tracker.stats_for(primary).latency_ewma is not None
+
+    async def test_no_hedge_when_disabled(self) -> None:
+        """Without hedging a slow primary is waited for."""
+        primary = FakeTarget("primary", delay=0.1)
+        backup = FakeTarget("backup")
+        client = RoutingLLMClient(
+            [primary, backup], role="coding", tracker=LatencyTracker(_config())
+        )
+
+        response = await client.generate(prompt="hi")
+
+        assert response.content == "primary"
+        assert backup.calls == 0
+
+    async def test_single_target_hedges_to_itself(self) -> None:
+        """With one target the backup request goes to the same target."""
+        target = FakeTarget("only", delay=0.2)
+        client = RoutingLLMClient(
+            [target], role="coding", hedge=True, tracker=LatencyTracker(_config())
+        )
+
+        await client.generate(prompt="hi")
+
+        assert target.calls == 2
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    async def test_fails_over_on_transient_errors(self, status: int) -> None:
+        """Rate limits and server errors move on to the next target."""
+        primary = FakeTarget("primary", error=ProviderError(status))
+        backup = FakeTarget("backup")
+        tracker = LatencyTracker(_config())
+        client = RoutingLLMClient([primary, backup], role="coding", tracker=tracker)
+
+        response = await client.generate(prompt="hi")
+
+        assert response.content == "backup"
+        assert tracker.stats_for(primary).error_rate() > 0
+
+    async def test_invalid_request_is_raised(self) -> None:
+        """Errors that would repeat on any target are not failed over."""
+        primary = FakeTarget("primary", error=ProviderError(400))
+        backup = FakeTarget("backup")
+        client = RoutingLLMClient(
+            [primary, backup], role="coding", tracker=LatencyTracker(_config())
+        )
+
+        with pytest.raises(ProviderError):
+            await client.generate(prompt="hi")
+        assert backup.calls == 0
+
+    async def test_all_targets_failing_raises_last_error(self) -> None:
+        """When every target fails, the last error is raised."""
+        client = RoutingLLMClient(
+            [
+                FakeTarget("a", error=ProviderError(503)),
+                FakeTarget("b", error=ProviderError(429)),
+            ],
+            role="coding",
+            tracker=LatencyTracker(_config()),
+        )
+
+        with pytest.raises(ProviderError) as exc_info:
+            await client.generate(prompt="hi")
+        assert exc_info.value.status_code == 429
+
+
+class TestGenerateStream:
+    """Tests for streaming failover."""
+
+    async def test_fails_over_before_first_chunk(self) -> None:
+        """A stream that fails to open is retried on the next target."""
+        primary = FakeTarget("primary", error=ProviderError(529))
+        backup = FakeTarget("backup")
+        client = RoutingLLMClient(
+            [primary, backup], role="coding", tracker=LatencyTracker(_config())
+        )
+
+        chunks = [chunk.content async for chunk in client.generate_stream(prompt="hi")]
+
+        assert chunks == ["backup", ""]
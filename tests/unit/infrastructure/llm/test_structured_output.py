@@ -0,0 +1,259 @@
+"""Unit tests for streaming structured output."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.llm.base_client import BaseLLMClient, LLMResponse, StreamChunk
+from src.infrastructure.llm.instrumentation import llm_call_context
+from src.infrastructure.llm.structured_output import (
+    IncrementalJSONParser,
+    JSONStreamError,
+    RedisProgressPublisher,
+    StructuredProgress,
+    generate_structured,
+)
+
+
+class StreamingClient(BaseLLMClient):
+    """Client streaming each configured response in small chunks."""
+
+    def __init__(self, responses: list[str], chunk_size: int = 4) -> None:
+        super().__init__(api_key="test-key", model="test-model")
+        self.responses = list(responses)
+        self.chunk_size = chunk_size
+        self.prompts: list[Any] = []
+        self.chunks_sent: list[int] = []
+        self.closed = 0
+        self.generated = 0
+
+    @property
+    def provider(self) -> str:
+        return "fake"
+
+    async def generate(self, prompt: Any = "", **kwargs: Any) -> LLMResponse:
+        self.prompts.append(prompt)
+        self.generated += 1
+        return LLMResponse(content=self.responses.pop(0), model=self._model)
+
+    async def generate_stream(self, prompt: Any = "", **kwargs: Any) -> AsyncIterator[StreamChunk]:
+        self.prompts.append(prompt)
+        text = self.responses.pop(0)
+        self.chunks_sent.append(0)
+        try:
+            for i in range(0, len(text), self.chunk_size):
+                self.chunks_sent[-1] += 1
+                yield StreamChunk(content=text[i : i + self.chunk_size])
+            yield StreamChunk(content="", is_final=True)
+        finally:
+            self.closed += 1
+
+
+def _ignore(progress: StructuredProgress) -> None:
+    """Progress callback that drops reports; makes generate_structured stream."""
+
+
+def _feed(text: str, chunk_size: int = 3) -> IncrementalJSONParser:
+    """Feed text to a new parser in small pieces."""
+    parser = IncrementalJSONParser()
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i : i + chunk_size])
+    return parser
+
+
+class TestIncrementalJSONParser:
+    """Tests for the incremental parser."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"tasks": [{"id": "T1", "n": -1.5e3, "ok": True, "x": None}], "s": 'a "q" \\ é'},
+            {},
+            {"nested": {"a": [[], {}, [1, 2]]}},
+        ],
+    )
+    def test_round_trip(self, value: dict[str, Any]) -> None:
+        """Valid JSON parses to the same object however it is chunked."""
+        parser = _feed(json.dumps(value))
+
+        assert parser.complete
+        assert parser.result() == value
+
+    def test_skips_preamble_and_trailing_text(self) -> None:
+        """Prose and code fences around the object are ignored."""
+        parser = _feed('Here it is:\n```json\n{"a": 1}\n```\nDone.')
+
+        assert parser.result() == {"a": 1}
+
+    def test_partial_closes_open_containers(self) -> None:
+        """The partial object contains only values that are complete."""
+        parser = _feed('{"tasks": [{"id": "T1"}, {"id": "T')
+
+        assert not parser.complete
+        assert parser.partial() == {"tasks": [{"id": "T1"}, {}]}
+        assert parser.member_types == {"tasks": list}
+
+    @pytest.mark.parametrize(
+        "text",
+        ['{"a" 1}', '{"a": tru}', '{"a": 1,,}', '{a: 1}', '{"a": "\\x"}', '{"a": 01}'],
+    )
+    def test_invalid_json_raises(self, text: str) -> None:
+        """Malformed output is rejected."""
+        with pytest.raises(JSONStreamError):
+            parser = _feed(text)
+            parser.result()
+
+    def test_incomplete_object_raises(self) -> None:
+        """result() rejects an object that never closed."""
+        with pytest.raises(JSONStreamError):
+            _feed('{"a": [1, 2').result()
+
+    def test_long_preamble_raises(self) -> None:
+        """Output without an object is abandoned after the preamble limit."""
+        parser = IncrementalJSONParser(max_preamble_chars=10)
+
+        with pytest.raises(JSONStreamError):
+            parser.feed("no json here at all")
+
+
+class TestGenerateStructured:
+    """Tests for generate_structured."""
+
+    async def test_returns_streamed_object(self) -> None:
+        """A valid streamed object is returned and the stream closed."""
+        client = StreamingClient(['```json\n{"tasks": [1, 2]}\n```'])
+
+        result = await generate_structured(
+            client, "prompt", required={"tasks": list}, on_progress=_ignore
+        )
+
+        assert result == {"tasks": [1, 2]}
+        assert client.closed == 1
+        assert client.generated == 0
+
+    async def test_wrong_type_aborts_stream_and_reprompts(self) -> None:
+        """A field of the wrong type stops the stream early and re-prompts."""
+        bad = '{"tasks": "none yet, here is a long explanation ' + "x" * 200 + '"}'
+        client = StreamingClient([bad, '{"tasks": []}'])
+
+        result = await generate_structured(
+            client,
+            "prompt",
+            required={"tasks": list},
+            retry_delay_seconds=0,
+            on_progress=_ignore,
+        )
+
+        assert result == {"tasks": []}
+        assert client.chunks_sent[0] < len(bad) // client.chunk_size
+        assert client.closed == 2
+        assert "rejected" in client.prompts[1]
+        assert 'field "tasks" must be an array' in client.prompts[1]
+
+    async def test_missing_field_reprompts(self) -> None:
+        """An object without a required field is retried."""
+        client = StreamingClient(['{"other": 1}', '{"tasks": [1]}'])
+
+        result = await generate_structured(client, "prompt", required={"tasks": list})
+
+        assert result == {"tasks": [1]}
+        assert "missing fields: tasks" in client.prompts[1]
+
+    async def test_without_progress_uses_generate(self) -> None:
+        """Without a progress callback the cacheable generate() is used."""
+        client = StreamingClient(['```json\n{"tasks": [1]}\n```'])
+
+        result = await generate_structured(client, "prompt", required={"tasks": list})
+
+        assert result == {"tasks": [1]}
+        assert client.generated == 1
+        assert client.chunks_sent == []
+
+    async def test_returns_none_when_attempts_exhausted(self) -> None:
+        """None is returned when no attempt produces a valid object."""
+        client = StreamingClient(["not json"] * 2)
+
+        result = await generate_structured(client, "prompt", max_attempts=2)
+
+        assert result is None
+
+    async def test_non_streaming_client_uses_generate(self) -> None:
+        """Clients that are not BaseLLMClient are called with generate()."""
+        client = MagicMock()
+        client.generate = AsyncMock(
+            side_effect=[
+                Exception("provider down"),
+                MagicMock(content='{"tasks": [1]}'),
+            ]
+        )
+
+        result = await generate_structured(
+            client, "prompt", required={"tasks": list}, retry_delay_seconds=0
+        )
+
+        assert result == {"tasks": [1]}
+        assert client.generate.call_count == 2
+
+    async def test_reports_progress(self) -> None:
+        """Partial and final progress reach the callback."""
+        client = StreamingClient(['{"tasks": [1, 2, 3], "notes": "done"}'], chunk_size=2)
+        reports: list[StructuredProgress] = []
+
+        await generate_structured(
+            client,
+            "prompt",
+            stage="task_breakdown",
+            on_progress=reports.append,
+            progress_interval_seconds=0,
+        )
+
+        assert reports[-1].complete
+        assert reports[-1].summary() == {"tasks": 3, "notes": 1}
+        assert any(not r.complete for r in reports)
+        assert all(r.stage == "task_breakdown" for r in reports)
+
+
+class TestRedisProgressPublisher:
+    """Tests for publishing progress to Redis."""
+
+    def _redis(self) -> tuple[MagicMock, MagicMock]:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        redis_client = MagicMock()
+        redis_client.pipeline.return_value = pipe
+        return redis_client, pipe
+
+    async def test_publishes_to_session_stream(self) -> None:
+        """Progress is added to the session's stream with the task id."""
+        redis_client, pipe = self._redis()
+        publisher = RedisProgressPublisher(redis_client)
+        progress = StructuredProgress(
+            stage="task_breakdown", attempt=1, chars=42, partial={"tasks": [1, 2]}
+        )
+
+        with llm_call_context(session_id="s1", task_id="t1"):
+            await publisher(progress)
+
+        key, fields = pipe.xadd.call_args.args
+        assert key == "asdlc:agent_progress:s1"
+        assert fields["task_id"] == "t1"
+        assert fields["chars"] == "42"
+        assert json.loads(fields["summary"]) == {"tasks": 2}
+        pipe.expire.assert_called_once_with(key, 3600)
+        pipe.execute.assert_awaited_once()
+
+    async def test_skips_without_session(self) -> None:
+        """Progress outside a session is not published."""
+        redis_client, _ = self._redis()
+        publisher = RedisProgressPublisher(redis_client)
+
+        await publisher(StructuredProgress(stage="x", attempt=1, chars=0))
+
+        redis_client.pipeline.assert_not_called()
@@ -5,7 +5,9 @@ Tests the REST API endpoints for Ideas CRUD operations.
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -13,14 +15,22 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from src.orchestrator.api.models.idea import (
+    BulkIdeaResult,
     CreateIdeaRequest,
     Idea,
     IdeaClassification,
+    IdeaFacetCounts,
     IdeaListResponse,
     IdeaStatus,
     UpdateIdeaRequest,
 )
-from src.orchestrator.routes.ideas_api import router, get_ideas_service
+from src.orchestrator.routes.ideas_api import (
+    MAX_NDJSON_LINE_BYTES,
+    _ndjson_lines,
+    get_ideas_service,
+    router,
+)
+from src.orchestrator.services.ideas_service import IdeaPage
 
 
 @pytest.fixture
@@ -167,6 +177,137 @@ class TestCreateIdeaEndpoint:
         assert response.status_code == 500
 
 
+class TestBulkCreateIdeasEndpoint:
+    """Tests for POST /api/brainflare/ideas/bulk endpoint."""
+
+    @staticmethod
+    async def _create_ideas(requests: Any) -> list[BulkIdeaResult]:
+        """Stand-in for IdeasService.create_ideas that accepts every idea."""
+        return [
+            BulkIdeaResult(index=i, success=True, id=f"idea-{request.content}")
+            async for i, request in _aenumerate(requests)
+        ]
+
+    def test_json_body(self, client: TestClient, mock_service: AsyncMock) -> None:
+        """A JSON list of ideas is created with per-item results."""
+        mock_service.create_ideas.side_effect = self._create_ideas
+
+        response = client.post(
+            "/api/brainflare/ideas/bulk",
+            json={"ideas": [{"content": "a"}, {"content": "b"}]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 2
+        assert [r["id"] for r in data["results"]] == ["idea-a", "idea-b"]
+
+    def test_json_body_validation_error_returns_422(
+        self, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        """An invalid JSON body is rejected as a whole."""
+        response = client.post("/api/brainflare/ideas/bulk", json={"ideas": []})
+
+        assert response.status_code == 422
+        mock_service.create_ideas.assert_not_called()
+
+    def test_ndjson_stream_reports_invalid_lines(
+        self, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        """Invalid NDJSON lines fail alone and keep their positions."""
+        mock_service.create_ideas.side_effect = self._create_ideas
+        body = "\n".join([
+            json.dumps({"content": "a"}),
+            json.dumps({"content": ""}),
+            "",
+            "not json",
+            json.dumps({"content": "d"}),
+        ])
+
+        response = client.post(
+            "/api/brainflare/ideas/bulk",
+            content=body.encode(),
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["index"] for r in data["results"]] == [0, 1, 2, 3]
+        assert [r["success"] for r in data["results"]] == [True, False, False, True]
+        assert data["results"][1]["error"].startswith("content:")
+        assert data["results"][3]["id"] == "idea-d"
+        assert (data["created"], data["failed"]) == (2, 2)
+
+    def test_ndjson_overlong_line_fails_alone(
+        self, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        """A line over the length limit fails without stopping the stream."""
+        mock_service.create_ideas.side_effect = self._create_ideas
+        body = "\n".join([
+            json.dumps({"content": "x" * (MAX_NDJSON_LINE_BYTES + 1)}),
+            json.dumps({"content": "b"}),
+        ])
+
+        response = client.post(
+            "/api/brainflare/ideas/bulk",
+            content=body.encode(),
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+        data = response.json()
+        assert [r["success"] for r in data["results"]] == [False, True]
+        assert data["results"][0]["error"].startswith("Line longer than")
+
+    def test_ndjson_stream_stops_after_item_limit(
+        self, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        """Lines past the item limit are not read; the first one fails."""
+        mock_service.create_ideas.side_effect = self._create_ideas
+        body = "\n".join(json.dumps({"content": c}) for c in "abcd")
+
+        with patch("src.orchestrator.routes.ideas_api.MAX_BULK_IDEAS", 2):
+            response = client.post(
+                "/api/brainflare/ideas/bulk",
+                content=body.encode(),
+                headers={"content-type": "application/x-ndjson"},
+            )
+
+        data = response.json()
+        assert [r["success"] for r in data["results"]] == [True, True, False]
+        assert data["results"][2]["error"].startswith("Too many ideas")
+
+    @pytest.mark.asyncio
+    async def test_ndjson_lines_split_across_chunks(self) -> None:
+        """Lines are rebuilt across chunks and overlong ones dropped."""
+
+        async def chunks() -> Any:
+            for chunk in [b'{"a"', b':1}\n12', b"3456", b"789012", b"\n\n{}"]:
+                yield chunk
+
+        lines = [line async for line in _ndjson_lines(chunks(), max_line_bytes=8)]
+
+        assert lines == [b'{"a":1}', None, b"{}"]
+
+    def test_service_error_returns_500(
+        self, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        """Test bulk create returns 500 when the service fails."""
+        mock_service.create_ideas.side_effect = Exception("Database error")
+
+        response = client.post(
+            "/api/brainflare/ideas/bulk", json={"ideas": [{"content": "a"}]}
+        )
+
+        assert response.status_code == 500
+
+
+async def _aenumerate(items: Any) -> Any:
+    index = 0
+    async for item in items:
+        yield index, item
+        index += 1
+
+
 class TestListIdeasEndpoint:
     """Tests for GET /api/brainflare/ideas endpoint."""
 
@@ -280,6 +421,76 @@ class TestListIdeasEndpoint:
 
         assert response.status_code == 500
 
+    def test_list_ideas_with_cursor(
+        self, client: TestClient, mock_service: AsyncMock, sample_idea: Idea
+    ) -> None:
+        """A cursor switches to cursor pagination."""
+        mock_service.list_ideas_page.return_value = IdeaPage(
+            ideas=[sample_idea], total=10000, total_relation="gte", next_cursor="next"
+        )
+
+        response = client.get("/api/brainflare/ideas?cursor=&limit=1&total_limit=10000")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["next_cursor"] == "next"
+        assert data["total_relation"] == "gte"
+        mock_service.list_ideas_page.assert_called_once_with(
+            status=None,
+            classification=None,
+            search=None,
+            limit=1,
+            cursor="",
+            track_total_hits=10000,
+        )
+        mock_service.list_ideas.assert_not_called()
+
+    def test_list_ideas_invalid_cursor_returns_400(
+        self, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        """An invalid or expired cursor is a client error."""
+        mock_service.list_ideas_page.side_effect = ValueError("Cursor has expired")
+
+        response = client.get("/api/brainflare/ideas?cursor=stale")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Cursor has expired"
+
+
+class TestIdeaFacetsEndpoint:
+    """Tests for GET /api/brainflare/ideas/facets endpoint."""
+
+    def test_returns_facet_counts(
+        self, client: TestClient, mock_service: AsyncMock
+    ) -> None:
+        """Facet counts come from the service with the list filters."""
+        mock_service.get_facet_counts.return_value = IdeaFacetCounts(
+            total=3, status={"active": 3}, labels={"ui": 2}
+        )
+
+        response = client.get("/api/brainflare/ideas/facets?status=active")
+
+        assert response.status_code == 200
+        assert response.json()["labels"] == {"ui": 2}
+        mock_service.get_facet_counts.assert_called_once_with(
+            status=IdeaStatus.ACTIVE, classification=None, search=None
+        )
+        mock_service.get_idea.assert_not_called()
+
+    def test_mock_facet_counts(self) -> None:
+        """Without a service, facets are counted from mock ideas."""
+        app = FastAPI()
+        app.include_router(router)
+        with patch(
+            "src.orchestrator.routes.ideas_api.get_ideas_service",
+            return_value=None,
+        ):
+            response = TestClient(app).get("/api/brainflare/ideas/facets")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert sum(data["status"].values()) == data["total"]
+
 
 class TestGetIdeaEndpoint:
     """Tests for GET /api/brainflare/ideas/{idea_id} endpoint."""
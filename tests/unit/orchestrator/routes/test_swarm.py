@@ -5,6 +5,7 @@ Tests the REST API endpoints for parallel review swarm functionality (P04-F05).
 Endpoints tested:
 - POST /api/swarm/review - Trigger a swarm review
 - GET /api/swarm/review/{swarm_id} - Get swarm status and results
+- GET /api/swarm/review/{swarm_id}/events - Stream swarm progress using SSE
 """
 
 from __future__ import annotations
@@ -57,6 +58,7 @@ def mock_config() -> MagicMock:
     config.allowed_path_prefixes = ["src/", "docker/", "tests/"]
     config.default_reviewers = ["security", "performance", "style"]
     config.task_timeout_seconds = 300
+    config.aggregate_timeout_seconds = 60
     return config
 
 
@@ -160,6 +162,46 @@ class TestTriggerSwarmReview:
         call_args = mock_dispatcher.dispatch_swarm.call_args
         assert call_args.kwargs.get("timeout_seconds") == 60
 
+    def test_trigger_swarm_review_with_base_ref(
+        self, client: TestClient, mock_dispatcher: AsyncMock
+    ) -> None:
+        """Test triggering an incremental swarm against a base ref."""
+        mock_dispatcher.dispatch_swarm.return_value = "swarm-jkl22222"
+
+        response = client.post(
+            "/api/swarm/review",
+            json={"target_path": "src/workers/", "base_ref": "origin/main"},
+        )
+
+        assert response.status_code == 202
+        call_args = mock_dispatcher.dispatch_swarm.call_args
+        assert call_args.kwargs.get("base_ref") == "origin/main"
+
+    def test_trigger_swarm_review_invalid_base_ref(
+        self, client: TestClient, mock_dispatcher: AsyncMock
+    ) -> None:
+        """Test that a base ref that looks like a git option returns 400."""
+        response = client.post(
+            "/api/swarm/review",
+            json={"target_path": "src/workers/", "base_ref": "--output=/tmp/x"},
+        )
+
+        assert response.status_code == 400
+        assert "base_ref" in response.json()["detail"]
+        mock_dispatcher.dispatch_swarm.assert_not_called()
+
+    def test_trigger_swarm_review_base_ref_rejects_url(
+        self, client: TestClient, mock_dispatcher: AsyncMock
+    ) -> None:
+        """Test that incremental reviews of URL targets return 400."""
+        response = client.post(
+            "/api/swarm/review",
+            json={"target_path": "https://github.com/o/r", "base_ref": "main"},
+        )
+
+        assert response.status_code == 400
+        assert "local" in response.json()["detail"]
+
     def test_trigger_swarm_review_invalid_path_absolute(
         self, client: TestClient, mock_dispatcher: AsyncMock
     ) -> None:
@@ -447,6 +489,133 @@ class TestGetSwarmStatus:
         assert "not found" in data["detail"].lower()
 
 
+def _event_stream(*events: tuple[str, dict]):
+    """Build an iter_events stand-in yielding the given events."""
+
+    async def iter_events(swarm_id: str, last_id: str, timeout_seconds: float):
+        for event in events:
+            yield event
+
+    return MagicMock(side_effect=iter_events)
+
+
+class TestStreamSwarmEvents:
+    """Tests for GET /api/swarm/review/{swarm_id}/events endpoint."""
+
+    def _session(self, status: SwarmStatus) -> SwarmSession:
+        return SwarmSession(
+            id="swarm-abc12345",
+            target_path="src/workers/",
+            reviewers=["security", "style"],
+            status=status,
+            created_at=datetime.now(timezone.utc),
+        )
+
+    def test_stream_swarm_events_emits_reviewer_progress(
+        self,
+        client: TestClient,
+        mock_session_manager: AsyncMock,
+        mock_redis_store: AsyncMock,
+    ) -> None:
+        """Test that reviewer completions and status changes are streamed."""
+        mock_session_manager.get_session.return_value = self._session(
+            SwarmStatus.IN_PROGRESS
+        )
+        mock_redis_store.iter_events = _event_stream(
+            (
+                "1-0",
+                {
+                    "event": "reviewer_complete",
+                    "reviewer": "security",
+                    "status": "success",
+                    "findings": "2",
+                    "files_reviewed": "5",
+                    "duration_seconds": "3.5",
+                },
+            ),
+            ("2-0", {"event": "status", "status": "complete"}),
+        )
+
+        response = client.get("/api/swarm/review/swarm-abc12345/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        messages = response.text.strip().split("\n\n")
+        assert messages[0] == 'event: status\ndata: {"status": "in_progress"}'
+        assert messages[1].startswith("id: 1-0\nevent: reviewer_complete\n")
+        assert '"findings": 2' in messages[1]
+        assert '"duration_seconds": 3.5' in messages[1]
+        assert messages[2] == 'id: 2-0\nevent: status\ndata: {"status": "complete"}'
+
+    def test_stream_swarm_events_resumes_from_last_event_id(
+        self,
+        client: TestClient,
+        mock_session_manager: AsyncMock,
+        mock_redis_store: AsyncMock,
+    ) -> None:
+        """Test that Last-Event-ID and the timeout are passed to the store."""
+        mock_session_manager.get_session.return_value = self._session(
+            SwarmStatus.IN_PROGRESS
+        )
+        mock_redis_store.iter_events = _event_stream()
+
+        client.get(
+            "/api/swarm/review/swarm-abc12345/events",
+            headers={"Last-Event-ID": "7-1"},
+        )
+
+        mock_redis_store.iter_events.assert_called_once_with("swarm-abc12345", "7-1", 360)
+
+    def test_stream_swarm_events_finished_swarm_ends_immediately(
+        self,
+        client: TestClient,
+        mock_session_manager: AsyncMock,
+        mock_redis_store: AsyncMock,
+    ) -> None:
+        """Test that a finished swarm only reports its final status."""
+        mock_session_manager.get_session.return_value = self._session(SwarmStatus.COMPLETE)
+        mock_redis_store.iter_events = _event_stream()
+
+        response = client.get("/api/swarm/review/swarm-abc12345/events")
+
+        assert response.text == 'event: status\ndata: {"status": "complete"}\n\n'
+        mock_redis_store.iter_events.assert_not_called()
+
+    def test_stream_swarm_events_reports_stream_errors(
+        self,
+        client: TestClient,
+        mock_session_manager: AsyncMock,
+        mock_redis_store: AsyncMock,
+    ) -> None:
+        """Test that a Redis failure mid-stream ends with an error event."""
+        mock_session_manager.get_session.return_value = self._session(
+            SwarmStatus.IN_PROGRESS
+        )
+
+        async def failing_events(swarm_id: str, last_id: str, timeout_seconds: float):
+            raise ConnectionError("redis down")
+            yield  # pragma: no cover
+
+        mock_redis_store.iter_events = MagicMock(side_effect=failing_events)
+
+        response = client.get("/api/swarm/review/swarm-abc12345/events")
+
+        assert response.status_code == 200
+        assert response.text.endswith(
+            'event: error\ndata: {"message": "Event stream interrupted"}\n\n'
+        )
+
+    def test_stream_swarm_events_not_found(
+        self, client: TestClient, mock_session_manager: AsyncMock
+    ) -> None:
+        """Test that an unknown swarm returns 404 before streaming."""
+        mock_session_manager.get_session.return_value = None
+
+        response = client.get("/api/swarm/review/swarm-unknown/events")
+
+        assert response.status_code == 404
+
+
 class TestRouterConfiguration:
     """Tests for router configuration."""
 
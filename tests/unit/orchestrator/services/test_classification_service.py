@@ -24,6 +24,7 @@ from src.orchestrator.services.classification_service import (
     ClassificationService,
     get_classification_service,
 )
+from src.orchestrator.services.label_taxonomy_service import CompiledTaxonomy
 
 
 class TestClassificationServiceInit:
@@ -124,8 +125,9 @@ class TestClassifyIdea:
     ) -> None:
         """Test successful idea classification."""
         # Setup mocks
-        service._taxonomy_service.get_taxonomy.return_value = mock_taxonomy
-        service._taxonomy_service.to_prompt_format.return_value = "Labels: feature, bug"
+        service._taxonomy_service.get_compiled_taxonomy.return_value = (
+            CompiledTaxonomy.compile(mock_taxonomy)
+        )
         service._ideas_service.get_idea.return_value = mock_idea
 
         # Mock LLM response
@@ -171,8 +173,9 @@ class TestClassifyIdea:
         # Set idea as already classified
         mock_idea.classification = IdeaClassification.FUNCTIONAL
         service._ideas_service.get_idea.return_value = mock_idea
-        service._taxonomy_service.get_taxonomy.return_value = mock_taxonomy
-        service._taxonomy_service.to_prompt_format.return_value = "Labels: feature, bug"
+        service._taxonomy_service.get_compiled_taxonomy.return_value = (
+            CompiledTaxonomy.compile(mock_taxonomy)
+        )
 
         # Mock LLM response
         mock_llm_client = AsyncMock()
@@ -513,8 +516,9 @@ class TestLLMIntegration:
         )
 
         service._ideas_service.get_idea.return_value = mock_idea
-        service._taxonomy_service.get_taxonomy.return_value = mock_taxonomy
-        service._taxonomy_service.to_prompt_format.return_value = "Labels:"
+        service._taxonomy_service.get_compiled_taxonomy.return_value = (
+            CompiledTaxonomy.compile(mock_taxonomy)
+        )
 
         mock_llm_client = AsyncMock()
         mock_llm_client.model = "claude-sonnet-4"
@@ -561,8 +565,9 @@ class TestLLMIntegration:
         )
 
         service._ideas_service.get_idea.return_value = mock_idea
-        service._taxonomy_service.get_taxonomy.return_value = mock_taxonomy
-        service._taxonomy_service.to_prompt_format.return_value = "Labels:"
+        service._taxonomy_service.get_compiled_taxonomy.return_value = (
+            CompiledTaxonomy.compile(mock_taxonomy)
+        )
 
         mock_llm_client = AsyncMock()
         mock_llm_client.model = "claude-sonnet-4"
@@ -613,8 +618,9 @@ class TestLLMIntegration:
         )
 
         service._ideas_service.get_idea.return_value = mock_idea
-        service._taxonomy_service.get_taxonomy.return_value = mock_taxonomy
-        service._taxonomy_service.to_prompt_format.return_value = "Labels: bug"
+        service._taxonomy_service.get_compiled_taxonomy.return_value = (
+            CompiledTaxonomy.compile(mock_taxonomy)
+        )
 
         # Make LLM fail
         service._llm_factory.get_client.side_effect = Exception("LLM unavailable")
@@ -627,6 +633,276 @@ class TestLLMIntegration:
         assert "bug" in result.labels or result.classification == ClassificationType.UNDETERMINED
 
 
+class TestBatchClassification:
+    """Tests for classification through offline LLM batches."""
+
+    @pytest.fixture
+    def service(self) -> ClassificationService:
+        """Create a service instance with mocked dependencies."""
+        now = datetime.now(timezone.utc)
+        service = ClassificationService(
+            redis_client=AsyncMock(),
+            taxonomy_service=AsyncMock(),
+            ideas_service=AsyncMock(),
+            llm_factory=AsyncMock(),
+        )
+        service._ideas_service.get_idea.return_value = Idea(
+            id="idea-123",
+            content="Fix the login bug that crashes the app",
+            author_id="user-1",
+            author_name="Test",
+            status=IdeaStatus.ACTIVE,
+            classification=IdeaClassification.UNDETERMINED,
+            labels=[],
+            created_at=now,
+            updated_at=now,
+        )
+        taxonomy = LabelTaxonomy(
+            id="default",
+            name="Default",
+            labels=[
+                LabelDefinition(id="bug", name="Bug", keywords=["fix", "bug", "crash"]),
+            ],
+            version="1.0",
+            created_at=now,
+            updated_at=now,
+        )
+        service._taxonomy_service.get_compiled_taxonomy.return_value = (
+            CompiledTaxonomy.compile(taxonomy)
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_prepare_batch_request(self, service: ClassificationService) -> None:
+        """Unclassified ideas become batch items carrying their metadata."""
+        request = await service.prepare_batch_request(
+            "idea-123", metadata={"job_id": "job-1"}
+        )
+
+        assert request.custom_id == "idea-123"
+        assert "Fix the login bug" in request.prompt
+        assert request.temperature == 0.3
+        assert request.metadata == {"job_id": "job-1", "idea_id": "idea-123"}
+
+    @pytest.mark.asyncio
+    async def test_complete_batch_result(self, service: ClassificationService) -> None:
+        """A batch response is parsed, stored and applied to the idea."""
+        from src.infrastructure.llm.base_client import LLMResponse
+        from src.infrastructure.llm.batch import BatchItemResult
+
+        item = BatchItemResult(
+            custom_id="idea-123",
+            response=LLMResponse(
+                content=json.dumps({
+                    "classification": "functional",
+                    "confidence": 0.9,
+                    "labels": ["bug", "unknown"],
+                }),
+                model="claude-haiku-4-5",
+            ),
+            metadata={"idea_id": "idea-123"},
+        )
+
+        result = await service.complete_batch_result(item)
+
+        assert result.classification == ClassificationType.FUNCTIONAL
+        assert result.labels == ["bug"]
+        assert result.model_version.startswith("claude-haiku-4-5:")
+        service._redis_client.set.assert_called_once()
+        service._ideas_service.update_idea.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_item_falls_back_to_rules(
+        self, service: ClassificationService
+    ) -> None:
+        """A failed batch item is classified with the rule-based fallback."""
+        from src.infrastructure.llm.batch import BatchItemResult
+
+        result = await service.complete_batch_result(
+            BatchItemResult(custom_id="idea-123", error="expired")
+        )
+
+        assert result.model_version.startswith("rule-based:")
+        assert "bug" in result.labels
+
+
+class TestMicroBatchClassification:
+    """Tests for classifying several ideas per prompt."""
+
+    @pytest.fixture
+    def service(self) -> ClassificationService:
+        """Create a service with three unclassified ideas."""
+        now = datetime.now(timezone.utc)
+        service = ClassificationService(
+            redis_client=AsyncMock(),
+            taxonomy_service=AsyncMock(),
+            ideas_service=AsyncMock(),
+            llm_factory=AsyncMock(),
+        )
+        ideas = {
+            idea_id: Idea(
+                id=idea_id,
+                content=content,
+                author_id="user-1",
+                author_name="Test",
+                status=IdeaStatus.ACTIVE,
+                classification=IdeaClassification.UNDETERMINED,
+                labels=[],
+                created_at=now,
+                updated_at=now,
+            )
+            for idea_id, content in [
+                ("idea-1", "Fix the crash on login"),
+                ("idea-2", "Pages should load in under a second"),
+                ("idea-3", "Add dark mode " + "x" * 600),
+            ]
+        }
+        service._ideas_service.get_idea.side_effect = lambda idea_id: ideas.get(idea_id)
+        taxonomy = LabelTaxonomy(
+            id="default",
+            name="Default",
+            labels=[LabelDefinition(id="bug", name="Bug", keywords=["fix", "crash"])],
+            version="1.0",
+            created_at=now,
+            updated_at=now,
+        )
+        service._taxonomy_service.get_compiled_taxonomy.return_value = (
+            CompiledTaxonomy.compile(taxonomy)
+        )
+        return service
+
+    def _client(self, *contents: dict[str, Any]) -> MagicMock:
+        client = MagicMock()
+        client.model = "claude-haiku-4-5"
+        client.generate = AsyncMock(
+            side_effect=[MagicMock(content=json.dumps(c)) for c in contents]
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_short_ideas_share_one_prompt(
+        self, service: ClassificationService
+    ) -> None:
+        """Short ideas are classified together; long ones on their own."""
+        client = self._client(
+            {
+                "classifications": [
+                    {"id": "1", "classification": "functional", "confidence": 0.9,
+                     "labels": ["bug"]},
+                    {"id": "2", "classification": "non_functional", "confidence": 0.8,
+                     "labels": []},
+                ]
+            },
+            {"classification": "functional", "confidence": 0.7, "labels": []},
+        )
+        service._llm_factory.get_client.return_value = client
+
+        results = await service.classify_ideas(["idea-1", "idea-2", "idea-3", "missing"])
+
+        assert set(results) == {"idea-1", "idea-2", "idea-3"}
+        assert results["idea-1"].labels == ["bug"]
+        assert results["idea-1"].model_version.endswith(":grouped")
+        assert results["idea-2"].classification == ClassificationType.NON_FUNCTIONAL
+        assert not results["idea-3"].model_version.endswith(":grouped")
+        grouped_prompt = client.generate.call_args_list[0].kwargs["prompt"]
+        assert "### Idea 1" in grouped_prompt and "### Idea 2" in grouped_prompt
+        assert service._redis_client.set.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_ideas_missing_from_group_response_are_retried_alone(
+        self, service: ClassificationService
+    ) -> None:
+        """An idea the grouped response left out is classified by itself."""
+        client = self._client(
+            {
+                "classifications": [
+                    {"id": "2", "classification": "non_functional", "confidence": 0.8},
+                ]
+            },
+            {"classification": "functional", "confidence": 0.7, "labels": []},
+        )
+        service._llm_factory.get_client.return_value = client
+
+        results = await service.classify_ideas(["idea-1", "idea-2"])
+
+        assert results["idea-1"].classification == ClassificationType.FUNCTIONAL
+        assert not results["idea-1"].model_version.endswith(":grouped")
+        assert client.generate.call_count == 2
+
+
+class TestRulePreClassification:
+    """Tests for skipping the LLM for unambiguous ideas."""
+
+    def _service(self, content: str, rule_short_circuit: bool) -> ClassificationService:
+        now = datetime.now(timezone.utc)
+        service = ClassificationService(
+            redis_client=AsyncMock(),
+            taxonomy_service=AsyncMock(),
+            ideas_service=AsyncMock(),
+            llm_factory=AsyncMock(),
+            rule_short_circuit=rule_short_circuit,
+        )
+        service._ideas_service.get_idea.return_value = Idea(
+            id="idea-123",
+            content=content,
+            author_id="user-1",
+            author_name="Test",
+            status=IdeaStatus.ACTIVE,
+            classification=IdeaClassification.UNDETERMINED,
+            labels=[],
+            created_at=now,
+            updated_at=now,
+        )
+        taxonomy = LabelTaxonomy(
+            id="default",
+            name="Default",
+            labels=[LabelDefinition(id="feature", name="Feature", keywords=["add"])],
+            version="1.0",
+            created_at=now,
+            updated_at=now,
+        )
+        service._taxonomy_service.get_compiled_taxonomy.return_value = (
+            CompiledTaxonomy.compile(taxonomy)
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_unambiguous_idea_skips_llm(self) -> None:
+        """Ideas matching one classification strongly are classified by rules."""
+        service = self._service(
+            "Add a feature to create and build reports", rule_short_circuit=True
+        )
+
+        result = await service.classify_idea("idea-123")
+
+        assert result.classification == ClassificationType.FUNCTIONAL
+        assert result.labels == ["feature"]
+        assert result.model_version.startswith("rule-based:")
+        service._llm_factory.get_client.assert_not_called()
+        service._redis_client.set.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mixed_signals_use_llm(self) -> None:
+        """Ideas matching both classifications still go to the LLM."""
+        service = self._service(
+            "Add a feature to create fast, secure builds", rule_short_circuit=True
+        )
+
+        assert service._pre_classify(
+            "idea-123",
+            "Add a feature to create fast, secure builds",
+            await service._taxonomy_service.get_compiled_taxonomy(),
+        ) is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without the setting, every idea goes to the LLM."""
+        monkeypatch.delenv("CLASSIFICATION_RULE_SHORT_CIRCUIT", raising=False)
+        service = ClassificationService()
+
+        assert service._rule_short_circuit is False
+
+
 class TestGetClassificationService:
     """Tests for get_classification_service function."""
 
@@ -0,0 +1,143 @@
+"""Unit tests for Correlation Service."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.orchestrator.api.models.idea import Idea, IdeaStatus
+from src.orchestrator.services.correlation_service import (
+    CorrelationConfig,
+    CorrelationService,
+)
+from src.orchestrator.services.ideas_service import IdeaPage
+
+
+def _idea(idea_id: str) -> Idea:
+    now = datetime.now(UTC)
+    return Idea(
+        id=idea_id,
+        content=f"Content of {idea_id}",
+        author_id="user-1",
+        author_name="Alice",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def ideas_service() -> AsyncMock:
+    """Create a mocked ideas service returning ideas by ID."""
+    service = AsyncMock()
+    service.get_idea.side_effect = lambda idea_id: (
+        None if idea_id == "missing" else _idea(idea_id)
+    )
+    service.find_similar.return_value = {}
+    return service
+
+
+@pytest.fixture
+def graph_store() -> AsyncMock:
+    """Create a mocked graph store."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def service(ideas_service: AsyncMock, graph_store: AsyncMock) -> CorrelationService:
+    """Create a service with a fake embedding model."""
+    embeddings = MagicMock()
+    embeddings.embed_batch.side_effect = lambda texts: [[float(len(t))] for t in texts]
+    return CorrelationService(
+        ideas_service=ideas_service,
+        graph_store=graph_store,
+        embedding_service=embeddings,
+        config=CorrelationConfig(top_k=3, min_similarity=0.8),
+    )
+
+
+class TestCorrelateIdeas:
+    """Tests for correlate_ideas."""
+
+    @pytest.mark.asyncio
+    async def test_embeds_and_searches_in_one_batch(
+        self, service: CorrelationService, ideas_service: AsyncMock
+    ) -> None:
+        """Known ideas are embedded together and searched with one call."""
+        await service.correlate_ideas(["idea-a", "missing", "idea-b"])
+
+        service._embedding_service.embed_batch.assert_called_once_with(
+            ["Content of idea-a", "Content of idea-b"]
+        )
+        stored = ideas_service.store_embeddings.call_args.args[0]
+        assert list(stored) == ["idea-a", "idea-b"]
+        ideas_service.find_similar.assert_awaited_once_with(stored, k=3)
+
+    @pytest.mark.asyncio
+    async def test_writes_similar_edges_above_threshold(
+        self,
+        service: CorrelationService,
+        ideas_service: AsyncMock,
+        graph_store: AsyncMock,
+    ) -> None:
+        """Pairs above the threshold become one edge each, in one call."""
+        ideas_service.find_similar.return_value = {
+            "idea-b": [("idea-a", 0.91), ("idea-c", 0.5)],
+            "idea-a": [("idea-b", 0.93)],
+        }
+
+        candidates = await service.correlate_ideas(["idea-a", "idea-b"])
+
+        assert [(c.source_idea_id, c.target_idea_id, c.similarity) for c in candidates] == [
+            ("idea-a", "idea-b", 0.93)
+        ]
+        [edges] = graph_store.add_edges.call_args.args
+        [(from_id, to_id, edge_type, properties)] = edges
+        assert (from_id, to_id, edge_type) == ("idea-a", "idea-b", "similar")
+        assert properties["score"] == 0.93
+        assert properties["created_by"] == "system"
+        # Existing edges keep their metadata; user and removed edges are skipped
+        assert graph_store.add_edges.call_args.kwargs == {
+            "creator": "system",
+            "refresh": ("score",),
+        }
+
+    @pytest.mark.asyncio
+    async def test_edge_ids_are_stable(
+        self,
+        service: CorrelationService,
+        ideas_service: AsyncMock,
+        graph_store: AsyncMock,
+    ) -> None:
+        """Correlating a pair again keeps its correlation id."""
+        ideas_service.find_similar.return_value = {"idea-a": [("idea-b", 0.9)]}
+
+        await service.correlate_ideas(["idea-a"])
+        await service.correlate_ideas(["idea-a"])
+
+        ids = [c.args[0][0][3]["id"] for c in graph_store.add_edges.call_args_list]
+        assert ids[0] == ids[1]
+
+
+class TestRecomputeAll:
+    """Tests for recompute_all."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_active_ideas(
+        self, service: CorrelationService, ideas_service: AsyncMock
+    ) -> None:
+        """Every page of active ideas is correlated once."""
+        ideas_service.list_ideas_page.side_effect = [
+            IdeaPage([_idea("idea-a"), _idea("idea-b")], 2, "gte", "next"),
+            IdeaPage([_idea("idea-c")], 3, "gte", None),
+        ]
+
+        count = await service.recompute_all(batch_size=2)
+
+        assert count == 3
+        cursors = [c.kwargs["cursor"] for c in ideas_service.list_ideas_page.call_args_list]
+        assert cursors == ["", "next"]
+        call = ideas_service.list_ideas_page.call_args
+        assert call.kwargs["status"] == IdeaStatus.ACTIVE
+        assert ideas_service.store_embeddings.await_count == 2
@@ -0,0 +1,420 @@
+"""Unit tests for Ideas Service bulk ingestion, cursor pages and facets."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from elasticsearch import NotFoundError
+
+from src.orchestrator.api.models.idea import (
+    CreateIdeaRequest,
+    IdeaStatus,
+    UpdateIdeaRequest,
+)
+from src.orchestrator.services.ideas_service import (
+    CURSOR_SORT,
+    EMBEDDING_FIELD,
+    FACET_CACHE_MAX_ENTRIES,
+    IDEAS_INDEX,
+    MAX_SHARD_DOC,
+    PIT_CURSOR_SORT,
+    REDIS_IDEAS_REVISION_KEY,
+    IdeasService,
+)
+
+
+def _bulk_response(operations: list[dict], failed_ids: set[str] = frozenset()) -> dict:
+    """Build a _bulk response for index operations."""
+    items: list[dict[str, Any]] = []
+    for action in operations[::2]:
+        doc_id = action["index"]["_id"]
+        if doc_id in failed_ids:
+            items.append({
+                "index": {
+                    "_id": doc_id,
+                    "status": 400,
+                    "error": {"type": "mapper_parsing_exception", "reason": "bad doc"},
+                }
+            })
+        else:
+            items.append({"index": {"_id": doc_id, "status": 201}})
+    return {"errors": bool(failed_ids), "items": items}
+
+
+@pytest.fixture
+def es() -> MagicMock:
+    """Create a mocked Elasticsearch client."""
+    client = MagicMock()
+    client.indices.exists = AsyncMock(return_value=True)
+    client.indices.refresh = AsyncMock()
+    client.bulk = AsyncMock(side_effect=lambda operations, refresh: _bulk_response(operations))
+    client.open_point_in_time = AsyncMock(return_value={"id": "pit-1"})
+    client.close_point_in_time = AsyncMock()
+    client.search = AsyncMock()
+    client.index = AsyncMock()
+    client.update = AsyncMock()
+    return client
+
+
+def _redis(revision: int = 0) -> AsyncMock:
+    """Create a mocked Redis client holding an ideas revision."""
+    client = AsyncMock()
+    client.get.return_value = str(revision).encode()
+    return client
+
+
+@pytest.fixture
+def service(es: MagicMock) -> IdeasService:
+    """Create a service with mocked Redis and classification worker."""
+    service = IdeasService(es_client=es)
+    service._redis = _redis()
+    service._classification_worker = AsyncMock()
+    return service
+
+
+def _requests(count: int) -> list[CreateIdeaRequest]:
+    return [CreateIdeaRequest(content=f"Idea number {i}") for i in range(count)]
+
+
+class TestCreateIdeas:
+    """Tests for create_ideas."""
+
+    @pytest.mark.asyncio
+    async def test_writes_bounded_bulk_batches(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """Ideas are written in _bulk batches without refreshing per batch."""
+        results = await service.create_ideas(_requests(5), batch_size=2)
+
+        assert [r.index for r in results] == [0, 1, 2, 3, 4]
+        assert all(r.success and r.id for r in results)
+        assert es.bulk.call_count == 3
+        for call in es.bulk.call_args_list:
+            assert call.kwargs["refresh"] is False
+            assert call.kwargs["operations"][0]["index"]["_index"] == IDEAS_INDEX
+        es.indices.refresh.assert_awaited_once_with(index=IDEAS_INDEX)
+
+    @pytest.mark.asyncio
+    async def test_each_batch_is_one_classification_job(
+        self, service: IdeasService
+    ) -> None:
+        """Created ideas are queued for classification a batch at a time."""
+        results = await service.create_ideas(_requests(3), batch_size=2)
+
+        worker = service._classification_worker
+        queued = [c.args[0] for c in worker.enqueue_batch.call_args_list]
+        assert queued == [[results[0].id, results[1].id], [results[2].id]]
+        worker.enqueue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reports_per_item_failures(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """Invalid ideas and rejected documents fail without failing the rest."""
+        failed_ids: set[str] = set()
+
+        def bulk(operations: list[dict], refresh: bool) -> dict:
+            failed_ids.add(operations[0]["index"]["_id"])
+            return _bulk_response(operations, failed_ids)
+
+        es.bulk.side_effect = bulk
+        requests = [
+            CreateIdeaRequest(content="rejected by elasticsearch"),
+            CreateIdeaRequest(content=" ".join(["word"] * 145)),
+            CreateIdeaRequest(content="fine"),
+        ]
+
+        results = await service.create_ideas(requests)
+
+        assert [r.success for r in results] == [False, False, True]
+        assert results[0].error == "bad doc"
+        assert "144 word limit" in results[1].error
+        service._classification_worker.enqueue_batch.assert_called_once_with(
+            [results[2].id]
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_bulk_request_fails_its_batch(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """A _bulk request that fails marks its ideas failed and continues."""
+        es.bulk.side_effect = [
+            ConnectionError("es down"),
+            _bulk_response([{"index": {"_id": "x"}}, {}]),
+        ]
+
+        results = await service.create_ideas(_requests(2), batch_size=1)
+
+        assert results[0].success is False
+        assert "es down" in results[0].error
+        assert results[1].success is True
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_stream(self, service: IdeasService) -> None:
+        """Requests can be streamed from an async iterator."""
+
+        async def stream() -> AsyncIterator[CreateIdeaRequest]:
+            for request in _requests(3):
+                yield request
+
+        results = await service.create_ideas(stream(), batch_size=2)
+
+        assert [r.success for r in results] == [True, True, True]
+
+
+def _hit(n: int, shard_doc: int | None = None) -> dict:
+    """Build a search hit for a stored idea, from a point-in-time if shard_doc is set."""
+    source = {
+        "id": f"idea-{n}",
+        "content": f"Idea number {n}",
+        "author_id": "user-1",
+        "author_name": "Alice",
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+    sort = [1000 - n, source["id"]]
+    if shard_doc is not None:
+        sort.append(shard_doc)
+    return {"_source": source, "sort": sort}
+
+
+def _page(hits: list[dict], pit_id: str | None = None) -> dict:
+    page: dict = {"hits": {"hits": hits, "total": {"value": 3, "relation": "eq"}}}
+    if pit_id is not None:
+        page["pit_id"] = pit_id
+    return page
+
+
+class TestListIdeasPage:
+    """Tests for list_ideas_page."""
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor_over_point_in_time(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """Later pages continue over a point-in-time closed at the end."""
+        es.search.side_effect = [
+            _page([_hit(0), _hit(1)]),
+            _page([_hit(2, shard_doc=7), _hit(3, shard_doc=3)], "pit-1"),
+            _page([_hit(4, shard_doc=5)], "pit-2"),
+        ]
+
+        first = await service.list_ideas_page(status=IdeaStatus.ACTIVE, limit=2, cursor="")
+        second = await service.list_ideas_page(
+            status=IdeaStatus.ACTIVE, limit=2, cursor=first.next_cursor
+        )
+        last = await service.list_ideas_page(
+            status=IdeaStatus.ACTIVE, limit=2, cursor=second.next_cursor
+        )
+
+        assert [i.id for i in first.ideas] == ["idea-0", "idea-1"]
+        assert [i.id for i in second.ideas] == ["idea-2", "idea-3"]
+        assert [i.id for i in last.ideas] == ["idea-4"]
+        assert last.next_cursor is None
+        es.open_point_in_time.assert_awaited_once()
+        second_body = es.search.call_args_list[1].kwargs["body"]
+        assert second_body["pit"]["id"] == "pit-1"
+        assert second_body["sort"] == PIT_CURSOR_SORT
+        assert second_body["search_after"] == [*_hit(1)["sort"], MAX_SHARD_DOC]
+        last_body = es.search.call_args_list[2].kwargs["body"]
+        assert last_body["search_after"] == _hit(3, shard_doc=3)["sort"]
+        es.close_point_in_time.assert_awaited_once_with(id="pit-2")
+
+    @pytest.mark.asyncio
+    async def test_first_page_opens_no_point_in_time(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """A first page is a plain sorted search, whether or not more follow."""
+        es.search.side_effect = [_page([_hit(0), _hit(1)]), _page([_hit(0)])]
+
+        full = await service.list_ideas_page(limit=2, cursor="")
+        await service.list_ideas_page(limit=2, cursor="")
+
+        assert full.next_cursor is not None
+        body = es.search.call_args.kwargs["body"]
+        assert body["sort"] == CURSOR_SORT
+        assert "pit" not in body
+        es.open_point_in_time.assert_not_awaited()
+        es.close_point_in_time.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_limited_total(self, service: IdeasService, es: MagicMock) -> None:
+        """Total counting can stop early."""
+        es.search.return_value = {
+            "hits": {"hits": [], "total": {"value": 100, "relation": "gte"}}
+        }
+
+        page = await service.list_ideas_page(cursor="", track_total_hits=100)
+
+        assert (page.total, page.total_relation) == (100, "gte")
+        assert es.search.call_args.kwargs["body"]["track_total_hits"] == 100
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_cursors(self, service: IdeasService, es: MagicMock) -> None:
+        """Malformed, mismatched and expired cursors raise ValueError."""
+        es.search.return_value = _page([_hit(0)])
+        page = await service.list_ideas_page(limit=1, cursor="")
+
+        with pytest.raises(ValueError):
+            await service.list_ideas_page(limit=1, cursor="not a cursor")
+        with pytest.raises(ValueError):
+            await service.list_ideas_page(
+                status=IdeaStatus.ARCHIVED, limit=1, cursor=page.next_cursor
+            )
+
+        es.search.return_value = _page([_hit(1, shard_doc=1)], "pit-1")
+        page = await service.list_ideas_page(limit=1, cursor=page.next_cursor)
+        es.search.side_effect = NotFoundError("expired", MagicMock(), {})
+        with pytest.raises(ValueError, match="expired"):
+            await service.list_ideas_page(limit=1, cursor=page.next_cursor)
+
+
+class TestFacetCounts:
+    """Tests for get_facet_counts."""
+
+    @staticmethod
+    def _aggregations() -> dict:
+        return {
+            "hits": {"hits": [], "total": {"value": 3, "relation": "eq"}},
+            "aggregations": {
+                "status": {"buckets": [{"key": "active", "doc_count": 3}]},
+                "classification": {"buckets": [{"key": "functional", "doc_count": 2}]},
+                "labels": {"buckets": [{"key": "ui", "doc_count": 1}]},
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_counts_from_one_cached_query(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """One aggregation query answers repeated calls until the TTL ends."""
+        es.search.return_value = self._aggregations()
+
+        facets = await service.get_facet_counts()
+        await service.get_facet_counts()
+
+        assert facets.total == 3
+        assert facets.status == {"active": 3}
+        assert facets.classification == {"functional": 2}
+        assert facets.labels == {"ui": 1}
+        es.search.assert_awaited_once()
+        assert es.search.call_args.kwargs["body"]["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cache(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """Creating or updating an idea drops cached counts."""
+        es.search.return_value = self._aggregations()
+        es.get = AsyncMock(return_value={"_source": _hit(0)["_source"]})
+
+        await service.get_facet_counts()
+        await service.create_idea(CreateIdeaRequest(content="new idea"))
+        await service.get_facet_counts()
+        await service.update_idea("idea-0", UpdateIdeaRequest(labels=["ui"]))
+        await service.get_facet_counts()
+
+        assert es.search.await_count == 3
+        assert service._redis.incr.await_count == 2
+        service._redis.incr.assert_awaited_with(REDIS_IDEAS_REVISION_KEY)
+
+    @pytest.mark.asyncio
+    async def test_writes_by_other_processes_invalidate_cache(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """A changed ideas revision in Redis drops cached counts."""
+        es.search.return_value = self._aggregations()
+
+        await service.get_facet_counts()
+        await service.get_facet_counts()
+        service._redis.get.return_value = b"1"
+        await service.get_facet_counts()
+
+        assert es.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, service: IdeasService, es: MagicMock) -> None:
+        """The least recently used searches are evicted first."""
+        es.search.return_value = self._aggregations()
+
+        await service.get_facet_counts(search="first")
+        for i in range(FACET_CACHE_MAX_ENTRIES):
+            await service.get_facet_counts(search=f"query {i}")
+            await service.get_facet_counts(search="first")
+
+        assert len(service._facet_cache) == FACET_CACHE_MAX_ENTRIES
+        assert (None, None, "first") in service._facet_cache
+        assert (None, None, "query 0") not in service._facet_cache
+
+    @pytest.mark.asyncio
+    async def test_cache_expires(self, es: MagicMock) -> None:
+        """Counts are queried again once the TTL has passed."""
+        es.search.return_value = self._aggregations()
+        service = IdeasService(es_client=es, facet_cache_ttl=0)
+        service._redis = _redis()
+
+        await service.get_facet_counts()
+        await service.get_facet_counts()
+
+        assert es.search.await_count == 2
+
+
+class TestEmbeddings:
+    """Tests for embedding storage and kNN lookup."""
+
+    @pytest.mark.asyncio
+    async def test_store_embeddings_in_one_bulk_request(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """Vectors are written with one refreshing _bulk request."""
+        es.indices.put_mapping = AsyncMock()
+        es.bulk.side_effect = None
+        es.bulk.return_value = {"errors": False, "items": []}
+
+        await service.store_embeddings({"idea-0": [0.1], "idea-1": [0.2]})
+        await service.store_embeddings({"idea-2": [0.3]})
+
+        operations = es.bulk.call_args_list[0].kwargs["operations"]
+        assert operations[0] == {"update": {"_index": IDEAS_INDEX, "_id": "idea-0"}}
+        assert operations[1] == {"doc": {EMBEDDING_FIELD: [0.1]}}
+        assert es.bulk.call_args.kwargs["refresh"] is True
+        es.indices.put_mapping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_find_similar_uses_one_msearch(
+        self, service: IdeasService, es: MagicMock
+    ) -> None:
+        """kNN queries share one _msearch and scores become cosine similarity."""
+        es.msearch = AsyncMock(
+            return_value={
+                "responses": [
+                    {"hits": {"hits": [{"_id": "idea-1", "_score": 0.95}]}},
+                    {"error": {"type": "search_phase_execution_exception"}},
+                ]
+            }
+        )
+
+        neighbours = await service.find_similar({"idea-0": [0.1], "idea-2": [0.3]}, k=3)
+
+        assert neighbours["idea-0"] == [("idea-1", pytest.approx(0.9))]
+        assert neighbours["idea-2"] == []
+        searches = es.msearch.call_args.kwargs["searches"]
+        assert len(searches) == 4
+        knn = searches[1]["knn"]
+        assert knn["k"] == 3
+        assert {"term": {"id": "idea-0"}} in knn["filter"]["bool"]["must_not"]
+
+    @pytest.mark.asyncio
+    async def test_new_ideas_are_queued_for_correlation(self, es: MagicMock) -> None:
+        """With auto-correlation, created ideas are queued in one call."""
+        service = IdeasService(es_client=es, auto_classify=False, auto_correlate=True)
+        service._correlation_worker = AsyncMock()
+
+        results = await service.create_ideas(_requests(2))
+
+        service._correlation_worker.enqueue.assert_awaited_once_with(
+            [r.id for r in results]
+        )
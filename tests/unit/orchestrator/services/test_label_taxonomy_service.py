@@ -19,7 +19,11 @@ from src.orchestrator.api.models.classification import (
 )
 from src.orchestrator.services.label_taxonomy_service import (
     DEFAULT_LABELS,
+    REDIS_TAXONOMY_REVISION_KEY,
+    CompiledTaxonomy,
+    KeywordMatcher,
     LabelTaxonomyService,
+    _create_default_taxonomy,
     get_label_taxonomy_service,
 )
 
@@ -451,6 +455,96 @@ class TestToPromptFormat:
         assert "speed" in prompt_text.lower() or "optimize" in prompt_text.lower()
 
 
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Fix the documentation for the CI/CD pipeline",
+            "Optimize server throughput and latency",
+            "docdocumentation",
+            "",
+        ],
+    )
+    def test_matches_like_substring_checks(self, text: str) -> None:
+        """Found keywords are exactly those occurring in the text."""
+        keywords = [k for label in DEFAULT_LABELS for k in label.keywords]
+        expected = {k for k in keywords if k in text.lower()}
+
+        assert KeywordMatcher(keywords).find(text) == expected
+
+    def test_special_characters_are_literal(self) -> None:
+        """Keywords are matched literally, not as patterns."""
+        matcher = KeywordMatcher(["c++", "a.b"])
+
+        assert matcher.find("I like C++") == {"c++"}
+        assert matcher.find("axb") == frozenset()
+
+    def test_no_keywords(self) -> None:
+        """A matcher without keywords finds nothing."""
+        assert KeywordMatcher([]).find("anything") == frozenset()
+
+
+class TestCompiledTaxonomy:
+    """Tests for the compiled taxonomy snapshot."""
+
+    def test_compile(self) -> None:
+        """The snapshot renders the prompt and counts label keywords."""
+        taxonomy = _create_default_taxonomy()
+
+        compiled = CompiledTaxonomy.compile(taxonomy, revision=3)
+
+        assert compiled.revision == 3
+        assert compiled.prompt_text.startswith("Available labels for classification:")
+        assert compiled.match_labels("Fix the slow crash") == {"bug": 2, "performance": 1}
+
+    @pytest.fixture
+    def service(self) -> LabelTaxonomyService:
+        """Create a service instance with mocked Redis."""
+        mock_client = AsyncMock()
+        mock_client.get.return_value = None
+        return LabelTaxonomyService(redis_client=mock_client)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_reused(self, service: LabelTaxonomyService) -> None:
+        """The taxonomy is read once while its revision is unchanged."""
+        first = await service.get_compiled_taxonomy()
+        second = await service.get_compiled_taxonomy()
+
+        assert first is second
+        # One revision read and one taxonomy read
+        assert service._redis_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_revision_change_recompiles(
+        self, service: LabelTaxonomyService
+    ) -> None:
+        """A new revision seen at the next check rebuilds the snapshot."""
+        service._revision_check_interval = 0
+        first = await service.get_compiled_taxonomy()
+
+        service._redis_client.get.side_effect = lambda key: (
+            b"2" if key == REDIS_TAXONOMY_REVISION_KEY else None
+        )
+        second = await service.get_compiled_taxonomy()
+
+        assert second is not first
+        assert second.revision == 2
+
+    @pytest.mark.asyncio
+    async def test_update_bumps_revision_and_invalidates(
+        self, service: LabelTaxonomyService
+    ) -> None:
+        """Updating the taxonomy increments its revision and drops the snapshot."""
+        await service.get_compiled_taxonomy()
+
+        await service.update_taxonomy(_create_default_taxonomy())
+
+        service._redis_client.incr.assert_called_once_with(REDIS_TAXONOMY_REVISION_KEY)
+        assert service._compiled is None
+
+
 class TestDefaultLabels:
     """Tests for default label definitions."""
 
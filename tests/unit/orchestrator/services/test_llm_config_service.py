@@ -21,6 +21,7 @@ from src.orchestrator.api.models.llm_config import (
     APIKeyCreate,
     LLMModel,
     LLMProvider,
+    LLMTarget,
 )
 from src.orchestrator.services.llm_config_service import (
     LLMConfigService,
@@ -206,6 +207,8 @@ class TestAPIKeyOperations:
         
         assert result is True
         service._redis_client.delete.assert_called_once()
+        # Every role's clients may use the key, so all are invalidated
+        assert service._redis_client.hincrby.call_count == len(AgentRole)
 
     @pytest.mark.asyncio
     async def test_delete_key_not_found(self, service: LLMConfigService) -> None:
@@ -298,6 +301,33 @@ class TestAgentConfigOperations:
         assert result == config
         service._redis_client.set.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_agent_config_bumps_version(
+        self, service: LLMConfigService
+    ) -> None:
+        """Test that updating a role bumps only that role's config version."""
+        config = AgentLLMConfig(
+            role=AgentRole.REVIEWER,
+            provider=LLMProvider.OPENAI,
+            model="gpt-4",
+            api_key_id="key-456",
+        )
+
+        await service.update_agent_config(config)
+
+        service._redis_client.hincrby.assert_called_once_with(
+            "llm:config:versions", "reviewer", 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_config_versions(self, service: LLMConfigService) -> None:
+        """Test that config versions are decoded per role."""
+        service._redis_client.hgetall.return_value = {b"coding": b"3", b"reviewer": b"1"}
+
+        versions = await service.get_config_versions()
+
+        assert versions == {"coding": 3, "reviewer": 1}
+
     @pytest.mark.asyncio
     async def test_update_agent_config_persists_correctly(
         self, service: LLMConfigService
@@ -324,6 +354,27 @@ class TestAgentConfigOperations:
         assert value["provider"] == "anthropic"
         assert value["enabled"] is False
 
+    @pytest.mark.asyncio
+    async def test_fallbacks_round_trip(self, service: LLMConfigService) -> None:
+        """Test that fallback targets are persisted and read back."""
+        config = AgentLLMConfig(
+            role=AgentRole.CODING,
+            provider=LLMProvider.ANTHROPIC,
+            model="claude-sonnet-4-20250514",
+            api_key_id="key-1",
+            settings=AgentSettings(hedge_requests=True),
+            fallbacks=[
+                LLMTarget(provider=LLMProvider.OPENAI, model="gpt-4o", api_key_id="key-2")
+            ],
+        )
+
+        await service.update_agent_config(config)
+        service._redis_client.get.return_value = service._redis_client.set.call_args[0][1]
+        stored = await service.get_agent_config(AgentRole.CODING)
+
+        assert stored.fallbacks == config.fallbacks
+        assert stored.settings.hedge_requests is True
+
 
 class TestGetDecryptedKey:
     """Tests for get_decrypted_key method."""
@@ -0,0 +1,210 @@
+"""Tests for the long-lived RepoMapperService."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import RepoMapperError
+from src.core.models import AgentRole, ContextPack
+from src.workers.repo_mapper.mapper import RepoMapper
+from src.workers.repo_mapper.service import (
+    RepoMapperClient,
+    RepoMapperService,
+    WorkspaceWatcher,
+)
+
+
+@pytest.fixture
+def simple_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "test_repo"
+    repo.mkdir()
+    (repo / "main.py").write_text('def main():\n    print("Hello")\n')
+    return repo
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> str:
+    return str(tmp_path / "mapper.sock")
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestRepoMapperUpdateFiles:
+    def test_update_adds_new_file(self, simple_repo: Path, tmp_path: Path) -> None:
+        mapper = RepoMapper(repo_path=str(simple_repo), cache_dir=str(tmp_path / "c"))
+        mapper.refresh_ast_context()
+        new_file = simple_repo / "helper.py"
+        new_file.write_text("def helper():\n    return 1\n")
+
+        context = mapper.update_files([str(new_file)])
+
+        assert str(new_file) in context.files
+        assert context.files[str(new_file)].symbols[0].name == "helper"
+
+    def test_update_removes_deleted_file(self, simple_repo: Path, tmp_path: Path) -> None:
+        mapper = RepoMapper(repo_path=str(simple_repo), cache_dir=str(tmp_path / "c"))
+        context = mapper.refresh_ast_context()
+        main_path = next(iter(context.files))
+
+        context = mapper.update_files([], [main_path])
+
+        assert main_path not in context.files
+
+
+class TestWorkspaceWatcher:
+    def test_poll_reports_no_changes_after_prime(
+        self, simple_repo: Path, tmp_path: Path
+    ) -> None:
+        watcher = WorkspaceWatcher(
+            RepoMapper(repo_path=str(simple_repo), cache_dir=str(tmp_path / "c"))
+        )
+        watcher.prime()
+
+        assert watcher.poll() == ([], [])
+
+    def test_poll_detects_modified_added_and_removed(
+        self, simple_repo: Path, tmp_path: Path
+    ) -> None:
+        watcher = WorkspaceWatcher(
+            RepoMapper(repo_path=str(simple_repo), cache_dir=str(tmp_path / "c"))
+        )
+        watcher.prime()
+        main_file = simple_repo / "main.py"
+        main_file.write_text("def main():\n    return 2\n")
+        _bump_mtime(main_file)
+        (simple_repo / "extra.py").write_text("X = 1\n")
+
+        changed, removed = watcher.poll()
+
+        assert sorted(Path(p).name for p in changed) == ["extra.py", "main.py"]
+        assert removed == []
+
+        main_file.unlink()
+        changed, removed = watcher.poll()
+
+        assert changed == []
+        assert [Path(p).name for p in removed] == ["main.py"]
+
+
+class TestRepoMapperService:
+    async def test_client_generates_context_pack(
+        self, simple_repo: Path, tmp_path: Path, socket_path: str
+    ) -> None:
+        service = RepoMapperService(
+            repo_path=str(simple_repo),
+            socket_path=socket_path,
+            watch_interval=60,
+            cache_dir=str(tmp_path / "c"),
+        )
+        await service.start()
+        try:
+            client = RepoMapperClient(socket_path=socket_path)
+            pack = await client.generate_context_pack(
+                task_description="Implement main function",
+                target_files=["main.py"],
+                role=AgentRole.CODING,
+                token_budget=10000,
+            )
+        finally:
+            await service.stop()
+
+        assert isinstance(pack, ContextPack)
+        assert pack.task_description == "Implement main function"
+        assert len(pack.files) > 0
+
+    async def test_context_pack_reflects_recent_edit(
+        self, simple_repo: Path, tmp_path: Path, socket_path: str
+    ) -> None:
+        service = RepoMapperService(
+            repo_path=str(simple_repo),
+            socket_path=socket_path,
+            watch_interval=0.05,
+            cache_dir=str(tmp_path / "c"),
+        )
+        await service.start()
+        try:
+            main_file = simple_repo / "main.py"
+            main_file.write_text("def renamed_entry():\n    pass\n")
+            _bump_mtime(main_file)
+            await asyncio.sleep(0.1)
+
+            pack = await RepoMapperClient(socket_path).generate_context_pack(
+                task_description="Edit", target_files=["main.py"]
+            )
+        finally:
+            await service.stop()
+
+        assert "renamed_entry" in pack.files[0].content
+
+    async def test_request_reuses_recent_scan(
+        self, simple_repo: Path, tmp_path: Path, socket_path: str, monkeypatch
+    ) -> None:
+        service = RepoMapperService(
+            repo_path=str(simple_repo),
+            socket_path=socket_path,
+            watch_interval=60,
+            cache_dir=str(tmp_path / "c"),
+        )
+        await service.start()
+        scans = []
+        snapshot = service.watcher.snapshot
+        monkeypatch.setattr(
+            service.watcher, "snapshot", lambda: scans.append(1) or snapshot()
+        )
+        try:
+            await service.handle_request(
+                {"method": "generate_context_pack", "params": {"task_description": "x"}}
+            )
+            await service.sync()
+        finally:
+            await service.stop()
+
+        # The request reused the startup scan; an explicit sync still scans
+        assert len(scans) == 1
+
+    async def test_unknown_method_returns_error(
+        self, simple_repo: Path, tmp_path: Path, socket_path: str
+    ) -> None:
+        service = RepoMapperService(
+            repo_path=str(simple_repo),
+            socket_path=socket_path,
+            cache_dir=str(tmp_path / "c"),
+        )
+
+        response = await service.handle_request({"method": "nope"})
+
+        assert "error" in response
+
+    async def test_client_raises_when_service_unavailable(
+        self, socket_path: str
+    ) -> None:
+        client = RepoMapperClient(socket_path=socket_path)
+
+        assert client.is_available() is False
+        with pytest.raises(RepoMapperError):
+            await client.ping()
+
+    @pytest.mark.parametrize("reply", [b"not json\n", b"[1, 2]\n"])
+    async def test_client_raises_on_invalid_response(
+        self, socket_path: str, reply: bytes
+    ) -> None:
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            await reader.readline()
+            writer.write(reply)
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=socket_path)
+        try:
+            with pytest.raises(RepoMapperError, match="Invalid repo mapper response"):
+                await RepoMapperClient(socket_path=socket_path).ping()
+        finally:
+            server.close()
+            await server.wait_closed()
@@ -329,3 +329,36 @@ class TestRepr:
         assert "20/50" in repr_str
         assert "5/8" in repr_str
         assert "remaining=30" in repr_str
+
+
+class TestSplit:
+    """Tests for carving child budgets."""
+
+    def test_split_equal_slices_of_share(self) -> None:
+        """Test children get equal slices of the shared budget."""
+        budget = SubCallBudgetManager(max_total=20, max_per_iteration=8)
+
+        children = budget.split(3, share=0.5)
+
+        assert [c.max_total for c in children] == [3, 3, 3]
+        assert all(c.max_per_iteration == 3 for c in children)
+
+    def test_split_returns_fewer_when_budget_is_short(self) -> None:
+        """Test no child gets an empty slice."""
+        budget = SubCallBudgetManager(max_total=4, max_per_iteration=4)
+        budget.total_used = 2
+
+        assert len(budget.split(5)) == 2
+
+    def test_child_calls_count_against_parent(self) -> None:
+        """Test calls recorded on a slice propagate to all ancestors."""
+        budget = SubCallBudgetManager(max_total=40, max_per_iteration=8)
+        child = budget.split(2)[0]
+        grandchild = child.split(1)[0]
+
+        child.record_call()
+        grandchild.record_call_if_allowed(2)
+
+        assert child.total_used == 3
+        assert budget.total_used == 3
+        assert budget.iteration_used == 0
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -274,6 +275,28 @@ class TestLLMQueryToolCaching:
         # Verify API was only called once
         assert client.messages.create.call_count == 1
 
+    async def test_cache_usage_counts_only_this_tool(self) -> None:
+        """Test that hits on a shared cache are counted per tool."""
+        cache = SubCallCache()
+        first = LLMQueryTool(
+            client=create_mock_client(),
+            budget_manager=SubCallBudgetManager(max_total=10),
+            cache=cache,
+        )
+        second = LLMQueryTool(
+            client=create_mock_client(),
+            budget_manager=SubCallBudgetManager(max_total=10),
+            cache=cache,
+        )
+
+        await first.aquery("What is 2+2?")
+        await second.aquery("What is 2+2?")
+        await second.aquery("What is 2+2?")
+
+        assert (first.cache_usage().total_requests, first.cache_usage().hits) == (1, 0)
+        assert (second.cache_usage().total_requests, second.cache_usage().hits) == (2, 2)
+        assert cache.get_stats().hits == 2
+
     def test_cache_disabled(self) -> None:
         """Test behavior with cache disabled."""
         client = create_mock_client()
@@ -670,3 +693,85 @@ class TestLLMQueryToolBuildContext:
         context = tool._build_context("just the prompt", "")
 
         assert context == "just the prompt"
+
+
+class TestLLMQueryToolAsync:
+    """Tests for the non-blocking aquery() path."""
+
+    async def test_aquery_with_sync_client(self) -> None:
+        """Test that a synchronous SDK client is supported."""
+        client = create_mock_client("Async answer", tokens=80)
+        budget = SubCallBudgetManager(max_total=10, max_per_iteration=5)
+        tool = LLMQueryTool(client=client, budget_manager=budget, cache=SubCallCache())
+
+        result = await tool.aquery("What does this do?", context="def f(): pass")
+
+        assert result.response == "Async answer"
+        assert result.cached is False
+        assert result.tokens_used == 80
+        assert budget.total_used == 1
+
+    async def test_aquery_with_async_client(self) -> None:
+        """Test that an async SDK client is awaited."""
+        client = Mock()
+        client.messages.create = AsyncMock(
+            return_value=MockResponse(
+                content=[MockTextBlock(text="From async")],
+                usage=MockUsage(input_tokens=10, output_tokens=10),
+            )
+        )
+        budget = SubCallBudgetManager(max_total=10, max_per_iteration=5)
+        tool = LLMQueryTool(client=client, budget_manager=budget, cache=SubCallCache())
+
+        result = await tool.aquery("Q")
+
+        assert result.response == "From async"
+        client.messages.create.assert_awaited_once()
+
+    async def test_concurrent_identical_queries_share_one_call(self) -> None:
+        """Test that identical in-flight queries make a single API call."""
+        release = asyncio.Event()
+
+        async def slow_create(**kwargs: Any) -> MockResponse:
+            await release.wait()
+            return MockResponse(
+                content=[MockTextBlock(text="Shared")],
+                usage=MockUsage(input_tokens=5, output_tokens=5),
+            )
+
+        client = Mock()
+        client.messages.create = AsyncMock(side_effect=slow_create)
+        budget = SubCallBudgetManager(max_total=10, max_per_iteration=5)
+        tool = LLMQueryTool(client=client, budget_manager=budget, cache=SubCallCache())
+
+        first = asyncio.create_task(tool.aquery("Same"))
+        second = asyncio.create_task(tool.aquery("Same"))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second)
+
+        assert [r.response for r in results] == ["Shared", "Shared"]
+        assert client.messages.create.await_count == 1
+        assert budget.total_used == 1
+        assert sorted(r.cached for r in results) == [False, True]
+
+    async def test_aquery_budget_exceeded(self) -> None:
+        """Test that aquery enforces the sub-call budget."""
+        client = create_mock_client()
+        budget = SubCallBudgetManager(max_total=1, max_per_iteration=1)
+        tool = LLMQueryTool(client=client, budget_manager=budget, cache=SubCallCache())
+
+        await tool.aquery("First")
+
+        with pytest.raises(BudgetExceededError):
+            await tool.aquery("Second")
+
+    async def test_aquery_wraps_api_error(self) -> None:
+        """Test that API failures surface as RLMError."""
+        client = Mock()
+        client.messages.create = AsyncMock(side_effect=RuntimeError("boom"))
+        budget = SubCallBudgetManager(max_total=10, max_per_iteration=5)
+        tool = LLMQueryTool(client=client, budget_manager=budget, cache=SubCallCache())
+
+        with pytest.raises(RLMError):
+            await tool.aquery("Q")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Any
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 
 import pytest
 
@@ -679,3 +679,47 @@ class TestREPLToolSurfaceRepr:
         assert "REPLToolSurface" in repr_str
         assert "tools=" in repr_str
         assert "invocations=1" in repr_str
+
+
+class TestREPLToolSurfaceAsyncInvoke:
+    """Tests for non-blocking tool invocation."""
+
+    async def test_ainvoke_runs_sync_tool(self) -> None:
+        """Test that blocking tools are invoked via ainvoke."""
+        surface = REPLToolSurface(
+            file_tools=MockFileTools(),
+            symbol_tools=MockSymbolTools(),
+        )
+
+        result = await surface.ainvoke("read_file", file_path="a.py")
+
+        assert result == "content of a.py"
+        assert surface.get_invocation_count() == 1
+        assert surface.get_invocations()[0].success is True
+
+    async def test_ainvoke_prefers_async_llm_query(self) -> None:
+        """Test that llm_query uses the tool's async implementation."""
+        llm_tool = MockLLMQueryTool()
+        llm_tool.aquery = AsyncMock(return_value="async response")
+        surface = REPLToolSurface(
+            file_tools=MockFileTools(),
+            symbol_tools=MockSymbolTools(),
+            llm_query_tool=llm_tool,
+        )
+
+        result = await surface.ainvoke("llm_query", prompt="Q")
+
+        assert result == "async response"
+        llm_tool.aquery.assert_awaited_once_with(prompt="Q")
+
+    async def test_ainvoke_safe_returns_error(self) -> None:
+        """Test that ainvoke_safe reports unknown tools as errors."""
+        surface = REPLToolSurface(
+            file_tools=MockFileTools(),
+            symbol_tools=MockSymbolTools(),
+        )
+
+        result, error = await surface.ainvoke_safe("nonexistent")
+
+        assert result is None
+        assert "Unknown tool" in error
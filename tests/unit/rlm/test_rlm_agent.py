@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 
 import pytest
 
@@ -61,7 +62,7 @@ def create_mock_tool_surface() -> Mock:
         "read_file": "Read file contents",
         "grep": "Search for patterns",
     }
-    mock_surface.invoke_safe.return_value = (["file1.py", "file2.py"], None)
+    mock_surface.ainvoke_safe = AsyncMock(return_value=(["file1.py", "file2.py"], None))
     mock_surface.get_stats.return_value = {"total_invocations": 0}
     return mock_surface
 
@@ -161,7 +162,7 @@ class TestRLMAgentCreation:
 class TestRLMAgentRunIteration:
     """Tests for run_iteration method."""
 
-    def test_basic_iteration(self) -> None:
+    async def test_basic_iteration(self) -> None:
         """Test running a basic iteration."""
         response_text = """
 <thought>
@@ -185,7 +186,7 @@ Read the main.py file
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        iteration = agent.run_iteration(
+        iteration = await agent.run_iteration(
             query="What files are in the project?",
         )
 
@@ -195,7 +196,7 @@ Read the main.py file
         assert iteration.is_done is False
         assert agent.total_iterations == 1
 
-    def test_iteration_with_context(self) -> None:
+    async def test_iteration_with_context(self) -> None:
         """Test iteration with context provided."""
         response_text = """
 <thought>Looking at auth</thought>
@@ -208,7 +209,7 @@ Read the main.py file
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        agent.run_iteration(
+        await agent.run_iteration(
             query="How does auth work?",
             context="Focus on the OAuth implementation",
         )
@@ -218,7 +219,7 @@ Read the main.py file
         user_message = call_args.kwargs["messages"][0]["content"]
         assert "OAuth implementation" in user_message
 
-    def test_iteration_with_history(self) -> None:
+    async def test_iteration_with_history(self) -> None:
         """Test iteration with exploration history."""
         response_text = """
 <thought>Continuing exploration</thought>
@@ -241,7 +242,7 @@ Read the main.py file
             )
         ]
 
-        agent.run_iteration(
+        await agent.run_iteration(
             query="Continue investigation",
             history=history,
         )
@@ -250,7 +251,7 @@ Read the main.py file
         user_message = call_args.kwargs["messages"][0]["content"]
         assert "Exploration History" in user_message
 
-    def test_iteration_with_accumulated_findings(self) -> None:
+    async def test_iteration_with_accumulated_findings(self) -> None:
         """Test iteration with accumulated findings."""
         response_text = """
 <thought>Building on findings</thought>
@@ -263,7 +264,7 @@ Read the main.py file
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        agent.run_iteration(
+        await agent.run_iteration(
             query="Summarize findings",
             accumulated_findings=["Finding 1", "Finding 2"],
         )
@@ -273,7 +274,7 @@ Read the main.py file
         assert "Findings So Far" in user_message
         assert "Finding 1" in user_message
 
-    def test_iteration_done_detection(self) -> None:
+    async def test_iteration_done_detection(self) -> None:
         """Test that DONE is detected correctly."""
         response_text = """
 <thought>Complete</thought>
@@ -286,7 +287,7 @@ Read the main.py file
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         assert iteration.is_done is True
 
@@ -294,7 +295,7 @@ Read the main.py file
 class TestRLMAgentToolExecution:
     """Tests for tool execution during iteration."""
 
-    def test_tool_calls_executed(self) -> None:
+    async def test_tool_calls_executed(self) -> None:
         """Test that tool calls are executed."""
         response_text = """
 <thought>Running tools</thought>
@@ -309,16 +310,16 @@ class TestRLMAgentToolExecution:
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        iteration = agent.run_iteration(query="List files")
+        iteration = await agent.run_iteration(query="List files")
 
         # Verify tool was invoked
-        surface.invoke_safe.assert_called_once_with("list_files", directory="src/")
+        surface.ainvoke_safe.assert_called_once_with("list_files", directory="src/")
 
         # Verify result was captured
         assert len(iteration.tool_calls) == 1
         assert "result" in iteration.tool_calls[0]
 
-    def test_multiple_tool_calls(self) -> None:
+    async def test_multiple_tool_calls(self) -> None:
         """Test multiple tool calls in one iteration."""
         response_text = """
 <thought>Multiple tools</thought>
@@ -336,12 +337,12 @@ class TestRLMAgentToolExecution:
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         assert len(iteration.tool_calls) == 2
-        assert surface.invoke_safe.call_count == 2
+        assert surface.ainvoke_safe.call_count == 2
 
-    def test_tool_error_captured(self) -> None:
+    async def test_tool_error_captured(self) -> None:
         """Test that tool errors are captured."""
         response_text = """
 <thought>Test</thought>
@@ -353,11 +354,11 @@ class TestRLMAgentToolExecution:
 """
         client = create_mock_client(response_text)
         surface = create_mock_tool_surface()
-        surface.invoke_safe.return_value = (None, "Unknown tool: bad_tool")
+        surface.ainvoke_safe.return_value = (None, "Unknown tool: bad_tool")
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         assert "Error" in iteration.tool_calls[0]["result"]
         assert iteration.tool_calls[0]["success"] is False
@@ -366,7 +367,7 @@ class TestRLMAgentToolExecution:
 class TestRLMAgentParsing:
     """Tests for response parsing."""
 
-    def test_parse_thought(self) -> None:
+    async def test_parse_thought(self) -> None:
         """Test parsing thought tag."""
         response_text = """
 <thought>
@@ -381,12 +382,12 @@ It spans multiple lines.
         surface = create_mock_tool_surface()
 
         agent = RLMAgent(client=client, tool_surface=surface)
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         assert "reasoning about the code" in iteration.thought
         assert "multiple lines" in iteration.thought
 
-    def test_parse_findings(self) -> None:
+    async def test_parse_findings(self) -> None:
         """Test parsing findings list."""
         response_text = """
 <thought>Found things</thought>
@@ -402,12 +403,12 @@ It spans multiple lines.
         surface = create_mock_tool_surface()
 
         agent = RLMAgent(client=client, tool_surface=surface)
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         assert len(iteration.findings) == 3
         assert "First finding" in iteration.findings[0]
 
-    def test_parse_invalid_tool_calls(self) -> None:
+    async def test_parse_invalid_tool_calls(self) -> None:
         """Test parsing with invalid JSON in tool_calls."""
         response_text = """
 <thought>Test</thought>
@@ -421,12 +422,12 @@ not valid json
         surface = create_mock_tool_surface()
 
         agent = RLMAgent(client=client, tool_surface=surface)
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         # Should handle gracefully
         assert iteration.tool_calls == []
 
-    def test_parse_missing_tags(self) -> None:
+    async def test_parse_missing_tags(self) -> None:
         """Test parsing response with missing tags."""
         response_text = """
 Just some text without proper tags.
@@ -435,7 +436,7 @@ Just some text without proper tags.
         surface = create_mock_tool_surface()
 
         agent = RLMAgent(client=client, tool_surface=surface)
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         # Should handle gracefully
         assert iteration.thought == ""
@@ -443,16 +444,49 @@ Just some text without proper tags.
         assert iteration.findings == []
 
 
+    async def test_parse_spawn_directive(self) -> None:
+        """Test spawn requests are parsed and capped at max_spawn."""
+        response_text = """
+<thought>Split the question</thought>
+<tool_calls>[]</tool_calls>
+<spawn>[{"query": "Where is X built?", "context_hints": ["src/x/"]}, "What calls Y?", {"query": "Third"}]</spawn>
+<next_direction>Continue</next_direction>
+"""
+        client = create_mock_client(response_text)
+        agent = RLMAgent(
+            client=client, tool_surface=create_mock_tool_surface(), max_spawn=2
+        )
+
+        iteration = await agent.run_iteration(query="Test")
+
+        assert iteration.spawn == [
+            {"query": "Where is X built?", "context_hints": ["src/x/"]},
+            {"query": "What calls Y?", "context_hints": []},
+        ]
+        assert "<spawn>" in client.messages.create.call_args.kwargs["system"]
+
+    async def test_spawn_ignored_when_not_offered(self) -> None:
+        """Test spawn directives are dropped when max_spawn is 0."""
+        response_text = '<spawn>["q"]</spawn><next_direction>DONE</next_direction>'
+        client = create_mock_client(response_text)
+        agent = RLMAgent(client=client, tool_surface=create_mock_tool_surface())
+
+        iteration = await agent.run_iteration(query="Test")
+
+        assert iteration.spawn == []
+        assert "<spawn>" not in client.messages.create.call_args.kwargs["system"]
+
+
 class TestRLMAgentSystemPrompt:
     """Tests for system prompt generation."""
 
-    def test_system_prompt_includes_tools(self) -> None:
+    async def test_system_prompt_includes_tools(self) -> None:
         """Test that system prompt includes tool descriptions."""
         client = create_mock_client("<thought>test</thought>")
         surface = create_mock_tool_surface()
 
         agent = RLMAgent(client=client, tool_surface=surface)
-        agent.run_iteration(query="Test")
+        await agent.run_iteration(query="Test")
 
         call_args = client.messages.create.call_args
         system_prompt = call_args.kwargs["system"]
@@ -491,38 +525,38 @@ class TestRLMAgentFinding:
 class TestRLMAgentStats:
     """Tests for statistics tracking."""
 
-    def test_iteration_count(self) -> None:
+    async def test_iteration_count(self) -> None:
         """Test iteration counting."""
         client = create_mock_client("<thought>test</thought>")
         surface = create_mock_tool_surface()
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        agent.run_iteration(query="Test 1")
-        agent.run_iteration(query="Test 2")
-        agent.run_iteration(query="Test 3")
+        await agent.run_iteration(query="Test 1")
+        await agent.run_iteration(query="Test 2")
+        await agent.run_iteration(query="Test 3")
 
         assert agent.total_iterations == 3
 
-    def test_token_tracking(self) -> None:
+    async def test_token_tracking(self) -> None:
         """Test token usage tracking."""
         client = create_mock_client("<thought>test</thought>", tokens=200)
         surface = create_mock_tool_surface()
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        agent.run_iteration(query="Test")
+        await agent.run_iteration(query="Test")
 
         assert agent.total_tokens == 200
 
-    def test_get_stats(self) -> None:
+    async def test_get_stats(self) -> None:
         """Test get_stats method."""
         client = create_mock_client("<thought>test</thought>", tokens=150)
         surface = create_mock_tool_surface()
 
         agent = RLMAgent(client=client, tool_surface=surface)
 
-        agent.run_iteration(query="Test")
+        await agent.run_iteration(query="Test")
 
         stats = agent.get_stats()
 
@@ -530,7 +564,7 @@ class TestRLMAgentStats:
         assert stats["total_tokens"] == 150
         assert "tool_surface_stats" in stats
 
-    def test_repr(self) -> None:
+    async def test_repr(self) -> None:
         """Test string representation."""
         client = create_mock_client("<thought>test</thought>", tokens=100)
         surface = create_mock_tool_surface()
@@ -540,7 +574,7 @@ class TestRLMAgentStats:
             tool_surface=surface,
             model="test-model",
         )
-        agent.run_iteration(query="Test")
+        await agent.run_iteration(query="Test")
 
         repr_str = repr(agent)
 
@@ -552,7 +586,7 @@ class TestRLMAgentStats:
 class TestRLMAgentToolResultFormatting:
     """Tests for tool result formatting."""
 
-    def test_format_string_result(self) -> None:
+    async def test_format_string_result(self) -> None:
         """Test formatting string result."""
         client = create_mock_client("""
 <thought>Test</thought>
@@ -561,14 +595,14 @@ class TestRLMAgentToolResultFormatting:
 <next_direction>Continue</next_direction>
 """)
         surface = create_mock_tool_surface()
-        surface.invoke_safe.return_value = ("def hello(): pass", None)
+        surface.ainvoke_safe.return_value = ("def hello(): pass", None)
 
         agent = RLMAgent(client=client, tool_surface=surface)
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         assert iteration.tool_calls[0]["result"] == "def hello(): pass"
 
-    def test_format_list_result(self) -> None:
+    async def test_format_list_result(self) -> None:
         """Test formatting list result."""
         client = create_mock_client("""
 <thought>Test</thought>
@@ -577,15 +611,15 @@ class TestRLMAgentToolResultFormatting:
 <next_direction>Continue</next_direction>
 """)
         surface = create_mock_tool_surface()
-        surface.invoke_safe.return_value = (["a.py", "b.py"], None)
+        surface.ainvoke_safe.return_value = (["a.py", "b.py"], None)
 
         agent = RLMAgent(client=client, tool_surface=surface)
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         assert "a.py" in iteration.tool_calls[0]["result"]
         assert "b.py" in iteration.tool_calls[0]["result"]
 
-    def test_format_long_result_truncated(self) -> None:
+    async def test_format_long_result_truncated(self) -> None:
         """Test that long results are truncated."""
         client = create_mock_client("""
 <thought>Test</thought>
@@ -595,11 +629,97 @@ class TestRLMAgentToolResultFormatting:
 """)
         surface = create_mock_tool_surface()
         long_content = "x" * 5000
-        surface.invoke_safe.return_value = (long_content, None)
+        surface.ainvoke_safe.return_value = (long_content, None)
 
         agent = RLMAgent(client=client, tool_surface=surface)
-        iteration = agent.run_iteration(query="Test")
+        iteration = await agent.run_iteration(query="Test")
 
         result = iteration.tool_calls[0]["result"]
         assert len(result) < 5000
         assert "truncated" in result
+
+
+class TestRLMAgentAsyncExecution:
+    """Tests for non-blocking LLM calls and concurrent tools."""
+
+    async def test_tool_calls_run_concurrently(self) -> None:
+        """Test that independent tool calls overlap in time."""
+        client = create_mock_client("""
+<thought>Parallel</thought>
+<tool_calls>[
+  {"tool": "grep", "args": {"pattern": "a"}},
+  {"tool": "grep", "args": {"pattern": "b"}},
+  {"tool": "read_file", "args": {"file_path": "x.py"}}
+]</tool_calls>
+<findings></findings>
+<next_direction>Continue</next_direction>
+""")
+        surface = create_mock_tool_surface()
+        active = 0
+        peak = 0
+
+        async def slow_invoke(tool_name: str, **kwargs: Any) -> tuple[Any, None]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return f"{tool_name}:{kwargs}", None
+
+        surface.ainvoke_safe = AsyncMock(side_effect=slow_invoke)
+
+        agent = RLMAgent(client=client, tool_surface=surface)
+        iteration = await agent.run_iteration(query="Test")
+
+        assert peak == 3
+        # Results keep request order
+        assert [tc["tool"] for tc in iteration.tool_calls] == ["grep", "grep", "read_file"]
+        assert "'pattern': 'b'" in iteration.tool_calls[1]["result"]
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test that max_concurrent_tools caps in-flight tool calls."""
+        calls = ",".join(
+            f'{{"tool": "grep", "args": {{"pattern": "{i}"}}}}' for i in range(5)
+        )
+        client = create_mock_client(
+            f"<thought>t</thought><tool_calls>[{calls}]</tool_calls>"
+            "<next_direction>Continue</next_direction>"
+        )
+        surface = create_mock_tool_surface()
+        active = 0
+        peak = 0
+
+        async def slow_invoke(tool_name: str, **kwargs: Any) -> tuple[Any, None]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "ok", None
+
+        surface.ainvoke_safe = AsyncMock(side_effect=slow_invoke)
+
+        agent = RLMAgent(client=client, tool_surface=surface, max_concurrent_tools=2)
+        await agent.run_iteration(query="Test")
+
+        assert peak == 2
+
+    async def test_base_llm_client_supported(self) -> None:
+        """Test that a BaseLLMClient from the infrastructure layer is used."""
+        from src.infrastructure.llm.base_client import BaseLLMClient, LLMResponse
+
+        client = Mock(spec=BaseLLMClient)
+        client.generate = AsyncMock(
+            return_value=LLMResponse(
+                content="<thought>ok</thought><next_direction>DONE</next_direction>",
+                model="m",
+                usage={"input_tokens": 7, "output_tokens": 3},
+            )
+        )
+
+        agent = RLMAgent(client=client, tool_surface=create_mock_tool_surface())
+        iteration = await agent.run_iteration(query="Test")
+
+        assert iteration.is_done is True
+        assert agent.total_tokens == 10
+        client.generate.assert_awaited_once()
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import sqlite3
 import tempfile
-from datetime import datetime, timezone
+import threading
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -37,8 +40,8 @@ def create_test_result(
                 next_direction="Continue",
             )
         ],
-        start_time=datetime.now(timezone.utc),
-        end_time=datetime.now(timezone.utc),
+        start_time=datetime.now(UTC),
+        end_time=datetime.now(UTC),
         total_subcalls=5,
         cached_hits=2,
         query=query,
@@ -94,7 +97,7 @@ class TestAuditEntry:
         """Test creating an audit entry."""
         entry = AuditEntry(
             task_id="task-123",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=datetime.now(UTC),
             query="Test query",
             success=True,
             findings_count=3,
@@ -110,7 +113,7 @@ class TestAuditEntry:
 
     def test_to_dict(self) -> None:
         """Test conversion to dictionary."""
-        timestamp = datetime.now(timezone.utc)
+        timestamp = datetime.now(UTC)
         entry = AuditEntry(
             task_id="task-123",
             timestamp=timestamp,
@@ -131,7 +134,7 @@ class TestAuditEntry:
 
     def test_from_dict(self) -> None:
         """Test creation from dictionary."""
-        timestamp = datetime.now(timezone.utc)
+        timestamp = datetime.now(UTC)
         data = {
             "task_id": "task-123",
             "timestamp": timestamp.isoformat(),
@@ -159,7 +162,8 @@ class TestRLMAuditorCreation:
             auditor = RLMAuditor(audit_dir=tmpdir)
 
             assert auditor.audit_dir == tmpdir
-            assert auditor.index_file == "index.json"
+            assert auditor.index_file == "index.db"
+            assert auditor.compress is False
 
     def test_creates_directory(self) -> None:
         """Test that auditor creates directory if needed."""
@@ -192,13 +196,46 @@ class TestRLMAuditorSave:
 
             auditor.save_result(result)
 
-            index_path = Path(tmpdir) / "index.json"
+            index_path = Path(tmpdir) / "index.db"
             assert index_path.exists()
 
-            with open(index_path) as f:
-                index = json.load(f)
-                assert len(index) == 1
-                assert index[0]["task_id"] == result.task_id
+            with sqlite3.connect(index_path) as conn:
+                rows = conn.execute("SELECT task_id FROM audits").fetchall()
+            assert rows == [(result.task_id,)]
+
+    def test_save_writes_compact_json(self) -> None:
+        """Test that result blobs are written without indentation."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+
+            file_path = auditor.save_result(create_test_result())
+
+            assert "\n" not in Path(file_path).read_text()
+
+    def test_save_compressed(self) -> None:
+        """Test saving and loading gzip-compressed blobs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir, compress=True)
+            original = create_test_result()
+
+            file_path = auditor.save_result(original)
+
+            assert file_path.endswith(".json.gz")
+            json.loads(gzip.decompress(Path(file_path).read_bytes()))
+            loaded = auditor.load_result(original.task_id)
+            assert loaded is not None
+            assert loaded.synthesis == original.synthesis
+
+    def test_same_task_saved_twice_keeps_both_files(self) -> None:
+        """Test that repeated saves in the same second do not collide."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+
+            first = auditor.save_result(create_test_result(task_id="dup"))
+            second = auditor.save_result(create_test_result(task_id="dup"))
+
+            assert first != second
+            assert Path(first).exists() and Path(second).exists()
 
     def test_save_multiple_results(self) -> None:
         """Test saving multiple results."""
@@ -407,6 +444,114 @@ class TestRLMAuditorDelete:
             assert len(auditor.list_audits()) == 0
 
 
+class TestRLMAuditorRetention:
+    """Tests for time-based retention."""
+
+    def test_prune_removes_old_entries_and_files(self) -> None:
+        """Test pruning audits older than a cutoff."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            old_path = auditor.save_result(create_test_result(task_id="old"))
+            auditor._execute(
+                "UPDATE audits SET created_at = created_at - 10 * 86400 "
+                "WHERE task_id = 'old'"
+            )
+            auditor.save_result(create_test_result(task_id="new"))
+
+            removed = auditor.prune(datetime.now(UTC) - timedelta(days=1))
+
+            assert removed == 1
+            assert not Path(old_path).exists()
+            assert [e.task_id for e in auditor.list_audits()] == ["new"]
+
+    def test_prune_without_retention_is_noop(self) -> None:
+        """Test that prune() keeps everything when retention is disabled."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            auditor.save_result(create_test_result())
+
+            assert auditor.prune() == 0
+            assert len(auditor) == 1
+
+    def test_save_applies_retention(self) -> None:
+        """Test that saving sweeps expired audits when retention is set."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            seeder = RLMAuditor(audit_dir=tmpdir)
+            seeder.save_result(create_test_result(task_id="old"))
+            seeder._execute("UPDATE audits SET created_at = created_at - 10 * 86400")
+
+            auditor = RLMAuditor(audit_dir=tmpdir, retention_days=1)
+            auditor.save_result(create_test_result(task_id="new"))
+
+            assert [e.task_id for e in auditor.list_audits()] == ["new"]
+
+    def test_list_audits_since(self) -> None:
+        """Test filtering audits by creation time."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            auditor.save_result(create_test_result(task_id="old"))
+            auditor._execute("UPDATE audits SET created_at = created_at - 3600")
+            auditor.save_result(create_test_result(task_id="new"))
+
+            since = datetime.now(UTC) - timedelta(minutes=5)
+            entries = auditor.list_audits(since=since)
+
+            assert [e.task_id for e in entries] == ["new"]
+
+
+class TestRLMAuditorConcurrency:
+    """Tests for concurrent writers sharing an audit directory."""
+
+    def test_concurrent_writers(self) -> None:
+        """Test that several auditors can append to one index at once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            auditors = [RLMAuditor(audit_dir=tmpdir) for _ in range(4)]
+
+            def write(auditor: RLMAuditor, worker: int) -> None:
+                for i in range(10):
+                    auditor.save_result(create_test_result(task_id=f"w{worker}-{i}"))
+
+            threads = [
+                threading.Thread(target=write, args=(a, n))
+                for n, a in enumerate(auditors)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert len(RLMAuditor(audit_dir=tmpdir)) == 40
+
+
+class TestRLMAuditorLegacyIndex:
+    """Tests for importing a pre-SQLite JSON index."""
+
+    def test_imports_legacy_index_once(self) -> None:
+        """Test that entries from index.json are imported on first open."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = create_test_result(task_id="legacy")
+            blob = Path(tmpdir) / "legacy.json"
+            blob.write_text(json.dumps(result.to_dict()))
+            entry = AuditEntry(
+                task_id="legacy",
+                timestamp=datetime.now(UTC),
+                query="q",
+                success=True,
+                findings_count=1,
+                iterations=1,
+                subcalls_used=5,
+                wall_time_seconds=1.0,
+                file_path=str(blob),
+            )
+            (Path(tmpdir) / "index.json").write_text(json.dumps([entry.to_dict()]))
+
+            auditor = RLMAuditor(audit_dir=tmpdir)
+            assert len(auditor) == 1
+            assert auditor.load_result("legacy") is not None
+
+            assert len(RLMAuditor(audit_dir=tmpdir)) == 1
+
+
 class TestRLMAuditorStats:
     """Tests for audit statistics."""
 
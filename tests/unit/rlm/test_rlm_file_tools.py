@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import os
+import re
+import subprocess
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.core.exceptions import RLMToolError
 from src.workers.rlm.tools.file_tools import FileTools
+from src.workers.rlm.tools.grep_index import GrepIndex, _GrepQuery
 
 
 @pytest.fixture
@@ -348,3 +353,154 @@ class TestToDict:
         assert "repo_root" in d
         assert "resolved_root" in d
         assert d["repo_root"] == temp_repo
+
+
+class TestGrepIndex:
+    """Tests for the indexed grep engine behind FileTools.grep."""
+
+    def test_grep_skips_binary_files(self, temp_repo: str) -> None:
+        """Test grep ignores files containing NUL bytes."""
+        (Path(temp_repo) / "src" / "blob.bin").write_bytes(b"TODO\x00\x01\x02")
+        tools = FileTools(repo_root=temp_repo)
+
+        matches = tools.grep("TODO", ["src/"])
+
+        assert all(m.file_path.endswith(".py") for m in matches)
+
+    def test_grep_skips_vcs_and_gitignored_paths(self, temp_repo: str) -> None:
+        """Test grep honours .gitignore and skips .git directories."""
+        root = Path(temp_repo)
+        (root / ".git").mkdir()
+        (root / ".git" / "HEAD").write_text("TODO in git\n")
+        (root / ".gitignore").write_text("generated/\n*.log\n")
+        (root / "generated").mkdir()
+        (root / "generated" / "out.py").write_text("# TODO generated\n")
+        (root / "debug.log").write_text("TODO log\n")
+        tools = FileTools(repo_root=temp_repo)
+
+        paths = {m.file_path for m in tools.grep("TODO", ["."])}
+
+        assert paths == {"src/utils.py", "src/core/config.py"}
+
+    def test_grep_explicit_ignored_directory_is_searched(self, temp_repo: str) -> None:
+        """Test an ignored directory passed explicitly is still searched."""
+        root = Path(temp_repo)
+        (root / ".gitignore").write_text("generated/\n")
+        (root / "generated").mkdir()
+        (root / "generated" / "out.py").write_text("# TODO generated\n")
+        tools = FileTools(repo_root=temp_repo)
+
+        matches = tools.grep("TODO", ["generated/"])
+
+        assert [m.file_path for m in matches] == [str(Path("generated/out.py"))]
+
+    def test_grep_sees_new_and_edited_files(self, temp_repo: str) -> None:
+        """Test the cached file list and index pick up changes."""
+        tools = FileTools(repo_root=temp_repo)
+        assert tools.grep("needle_value", ["src/"]) == []
+
+        (Path(temp_repo) / "src" / "new.py").write_text("X = 'needle_value'\n")
+        utils = Path(temp_repo) / "src" / "utils.py"
+        utils.write_text("# needle_value here too\n")
+        stat = utils.stat()
+        os.utime(utils, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        paths = sorted(m.file_path for m in tools.grep("needle_value", ["src/"]))
+
+        assert paths == [str(Path("src/new.py")), str(Path("src/utils.py"))]
+
+    def test_grep_shared_index_reused_across_tools(self, temp_repo: str) -> None:
+        """Test FileTools instances can share one index."""
+        index = GrepIndex(temp_repo, background_warm_up=False)
+        FileTools(repo_root=temp_repo, grep_index=index).grep("TODO", ["src/"])
+
+        FileTools(repo_root=temp_repo, grep_index=index).grep("TODO", ["src/"])
+
+        stats = index.get_stats()
+        assert stats["rescans"] == 1
+        assert stats["entries"] > 0
+
+    def test_grep_signatures_built_by_warm_up(self, temp_repo: str) -> None:
+        """Test signatures are built off the search path and then prune files."""
+        index = GrepIndex(temp_repo, background_warm_up=False)
+        tools = FileTools(repo_root=temp_repo, grep_index=index)
+        expected = tools.grep("helper", ["src/"])
+        assert index.get_stats()["signatures"] == 0
+
+        assert index.warm_up() > 0
+        pruned_before = index.get_stats()["files_pruned"]
+
+        assert tools.grep("helper", ["src/"]) == expected
+        assert tools.grep("no_such_identifier", ["src/"]) == []
+        assert index.get_stats()["files_pruned"] > pruned_before
+
+    @pytest.mark.parametrize(
+        ("pattern", "flags", "literals", "line_safe"),
+        [
+            (r"def generate_context_pack", 0, [("def generate_context_pack", False)], True),
+            (r"foo\.bar\(\)x?", 0, [("foo.bar()", False)], True),
+            (r"abcd*ef{0,2}ghi+", 0, [("abc", False), ("e", False), ("ghi", False)], True),
+            (r"(?i)class\s+Model", 0, [("cla", True), ("Model", True)], True),
+            (r"alpha|beta", 0, [], True),
+            (r"(alpha|beta)_name[a-z]+", 0, [("_name", False)], True),
+            (r"\Aimport(?=\s)", 0, [("import", False)], False),
+            (r"hello world", re.VERBOSE, [], False),
+            (r"key\x3dvalue\u0041\101tail", 0, [("key", False), ("value", False), ("tail", False)], True),
+        ],
+    )
+    def test_query_plan_literals(
+        self,
+        pattern: str,
+        flags: int,
+        literals: list[tuple[str, bool]],
+        line_safe: bool,
+    ) -> None:
+        """Test the required literals and line safety found for patterns."""
+        query = _GrepQuery.plan(re.compile(pattern, flags))
+
+        assert query.literals == [run for run in literals if len(run[0]) >= 3]
+        assert (query.buffer_regex is not None) == line_safe
+
+    def test_grep_line_numbers_and_context_in_buffer_scan(
+        self, temp_repo: str
+    ) -> None:
+        """Test whole-buffer scanning reports per-line positions and context."""
+        tools = FileTools(repo_root=temp_repo)
+
+        matches = tools.grep(r"main\(\)", ["src/main.py"], context_lines=1)
+
+        assert [m.line_number for m in matches] == [4, 8]
+        assert matches[0].context_before == [""]
+        assert matches[0].context_after == ["    print('Hello')"]
+        assert matches[1].context_after == []
+
+    def test_grep_does_not_match_across_lines(self, temp_repo: str) -> None:
+        """Test patterns keep line-at-a-time semantics."""
+        tools = FileTools(repo_root=temp_repo)
+
+        assert tools.grep(r"utilities\s+def", ["src/"]) == []
+        assert tools.grep(r"\Adef helper", ["src/utils.py"])[0].line_number == 4
+
+    def test_grep_case_insensitive_with_folding_letters(self, temp_repo: str) -> None:
+        """Test case-insensitive literals are not over-pruned by the index."""
+        (Path(temp_repo) / "src" / "units.py").write_text("# 5 Kelvin\n")
+        tools = FileTools(repo_root=temp_repo)
+
+        matches = tools.grep("kelvin", ["src/"], case_insensitive=True)
+
+        assert [m.file_path for m in matches] == [str(Path("src/units.py"))]
+
+    def test_grep_ripgrep_shortlist(self, temp_repo: str) -> None:
+        """Test ripgrep output restricts the files that are scanned."""
+        completed = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="src/utils.py\n", stderr=""
+        )
+        with patch("shutil.which", return_value="/usr/bin/rg"):
+            index = GrepIndex(temp_repo, use_ripgrep=True)
+        tools = FileTools(repo_root=temp_repo, grep_index=index)
+
+        with patch("subprocess.run", return_value=completed) as run:
+            matches = tools.grep("TODO", ["src/"])
+
+        assert [m.file_path for m in matches] == ["src/utils.py"]
+        assert "--fixed-strings" in run.call_args.args[0]
@@ -41,6 +41,7 @@ def create_mock_agent(iterations: list[AgentIteration] | None = None) -> Mock:
     mock_agent = Mock(spec=RLMAgent)
     mock_agent.total_tokens = 0
     mock_agent.total_iterations = 0
+    mock_agent.cache_usage = CacheStats()
 
     if iterations:
         mock_agent.run_iteration.side_effect = iterations
@@ -250,9 +251,10 @@ class TestRLMOrchestratorTimeout:
             return create_mock_iteration(is_done=True)
 
         agent = Mock(spec=RLMAgent)
-        agent.run_iteration = Mock(side_effect=lambda *args, **kwargs: create_mock_iteration())
+        agent.run_iteration = AsyncMock(side_effect=lambda *args, **kwargs: create_mock_iteration())
         agent.total_tokens = 0
         agent.total_iterations = 0
+        agent.cache_usage = CacheStats()
         agent.get_stats.return_value = {}
 
         budget = create_mock_budget()
@@ -292,9 +294,10 @@ class TestRLMOrchestratorTimeout:
             return create_mock_iteration(findings=[f"Finding {call_count}"])
 
         agent = Mock(spec=RLMAgent)
-        agent.run_iteration = Mock(side_effect=iteration_factory)
+        agent.run_iteration = AsyncMock(side_effect=iteration_factory)
         agent.total_tokens = 100
         agent.total_iterations = 2
+        agent.cache_usage = CacheStats()
         agent.get_stats.return_value = {}
 
         budget = create_mock_budget()
@@ -435,6 +438,7 @@ class TestRLMOrchestratorUsage:
         agent = create_mock_agent([create_mock_iteration(is_done=True)])
         agent.total_tokens = 500
         agent.total_iterations = 1
+        agent.cache_usage = CacheStats()
 
         budget = create_mock_budget()
         budget.total_used = 3
@@ -537,6 +541,7 @@ class TestRLMOrchestratorErrorHandling:
         agent.run_iteration.side_effect = ValueError("Unexpected error")
         agent.total_tokens = 0
         agent.total_iterations = 0
+        agent.cache_usage = CacheStats()
         agent.get_stats.return_value = {}
 
         budget = create_mock_budget()
@@ -554,3 +559,157 @@ class TestRLMOrchestratorErrorHandling:
 
         assert result.success is False
         assert "Unexpected error" in result.error
+
+
+class TestRLMOrchestratorFanOut:
+    """Tests for spawn-driven parallel sub-explorations."""
+
+    @staticmethod
+    def _fanout_config() -> RLMConfig:
+        return RLMConfig(
+            max_subcalls=40,
+            max_subcalls_per_iteration=8,
+            timeout_seconds=60,
+            max_fanout=3,
+            child_max_iterations=2,
+        )
+
+    async def test_spawn_runs_children_and_merges_findings(self) -> None:
+        """Test child findings and citations reach the parent result."""
+        spawn_iteration = create_mock_iteration(findings=["parent finding"])
+        spawn_iteration.spawn = [
+            {"query": "Where is X constructed?", "context_hints": []},
+            {"query": "What calls Y?", "context_hints": []},
+        ]
+        parent = create_mock_agent([spawn_iteration, create_mock_iteration(is_done=True)])
+
+        def child_factory(budget: SubCallBudgetManager) -> Mock:
+            child = create_mock_agent()
+            child.total_tokens = 100
+            child.total_iterations = 1
+
+            async def run_iteration(query: str, **kwargs: Any) -> AgentIteration:
+                budget.record_call()
+                return create_mock_iteration(
+                    tool_calls=[{
+                        "tool": "read_file",
+                        "args": {"file_path": "X.py" if " X " in query else "Y.py"},
+                        "result": "code",
+                    }],
+                    findings=[f"answer to {query}"],
+                    is_done=True,
+                )
+
+            child.run_iteration.side_effect = run_iteration
+            return child
+
+        budget = create_mock_budget(max_total=40)
+        orchestrator = RLMOrchestrator(
+            agent=parent,
+            budget_manager=budget,
+            cache=create_mock_cache(),
+            config=self._fanout_config(),
+            child_factory=child_factory,
+        )
+
+        result = await orchestrator.explore("Debug the crash")
+
+        assert result.success is True
+        assert "answer to Where is X constructed?" in result.synthesis
+        assert "answer to What calls Y?" in result.synthesis
+        assert {c.file_path for c in result.citations} == {"X.py", "Y.py"}
+        assert result.usage.subcall_count == 2
+        assert result.usage.total_tokens == 200
+        spawn_calls = [
+            tc for tc in result.trajectory.steps[0].tool_calls if tc.tool_name == "spawn"
+        ]
+        assert len(spawn_calls) == 1
+        assert parent.max_spawn == 3
+
+    async def test_children_run_concurrently(self) -> None:
+        """Test sub-explorations overlap in time."""
+        spawn_iteration = create_mock_iteration()
+        spawn_iteration.spawn = [{"query": f"q{i}", "context_hints": []} for i in range(3)]
+        parent = create_mock_agent([spawn_iteration, create_mock_iteration(is_done=True)])
+        running = 0
+        peak = 0
+
+        def child_factory(budget: SubCallBudgetManager) -> Mock:
+            child = create_mock_agent()
+
+            async def run_iteration(**kwargs: Any) -> AgentIteration:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.05)
+                running -= 1
+                return create_mock_iteration(is_done=True)
+
+            child.run_iteration.side_effect = run_iteration
+            return child
+
+        orchestrator = RLMOrchestrator(
+            agent=parent,
+            budget_manager=create_mock_budget(max_total=40),
+            cache=create_mock_cache(),
+            config=self._fanout_config(),
+            child_factory=child_factory,
+        )
+
+        await orchestrator.explore("Parallel query")
+
+        assert peak == 3
+
+    async def test_failing_child_does_not_fail_parent(self) -> None:
+        """Test one child error is reported without cancelling siblings."""
+        spawn_iteration = create_mock_iteration()
+        spawn_iteration.spawn = [
+            {"query": "good", "context_hints": []},
+            {"query": "bad", "context_hints": []},
+        ]
+        parent = create_mock_agent([spawn_iteration, create_mock_iteration(is_done=True)])
+
+        def child_factory(budget: SubCallBudgetManager) -> Mock:
+            child = create_mock_agent()
+
+            async def run_iteration(query: str, **kwargs: Any) -> AgentIteration:
+                if query == "bad":
+                    raise RuntimeError("boom")
+                return create_mock_iteration(findings=["good result"], is_done=True)
+
+            child.run_iteration.side_effect = run_iteration
+            return child
+
+        orchestrator = RLMOrchestrator(
+            agent=parent,
+            budget_manager=create_mock_budget(max_total=40),
+            cache=create_mock_cache(),
+            config=self._fanout_config(),
+            child_factory=child_factory,
+        )
+
+        result = await orchestrator.explore("Mixed")
+
+        assert result.success is True
+        assert "good result" in result.synthesis
+        spawn_call = result.trajectory.steps[0].tool_calls[-1]
+        assert "error: boom" in spawn_call.result
+
+    async def test_spawn_ignored_without_factory(self) -> None:
+        """Test spawn directives are ignored when fan-out is disabled."""
+        spawn_iteration = create_mock_iteration(is_done=True)
+        spawn_iteration.spawn = [{"query": "q", "context_hints": []}]
+        agent = create_mock_agent([spawn_iteration])
+
+        orchestrator = RLMOrchestrator(
+            agent=agent,
+            budget_manager=create_mock_budget(),
+            cache=create_mock_cache(),
+            config=self._fanout_config(),
+        )
+
+        result = await orchestrator.explore("No fan-out")
+
+        assert result.success is True
+        assert agent.max_spawn == 0
+        assert not result.trajectory.steps[0].tool_calls
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.core.exceptions import RLMToolError
+from src.workers.rlm.tools.parse_cache import ParsedFileCache
 from src.workers.rlm.tools.symbol_tools import SymbolTools
-from src.workers.repo_mapper.models import SymbolKind
+from src.workers.repo_mapper.models import ASTContext, ParsedFile, SymbolKind
 
 
 @pytest.fixture
@@ -384,3 +388,119 @@ class TestToDict:
         assert "supported_extensions" in d
         assert d["repo_root"] == temp_repo
         assert ".py" in d["supported_extensions"]
+
+
+class TestParsedFileCache:
+    """Tests for memoised parsing."""
+
+    def test_repeated_calls_parse_once(self, temp_repo: str) -> None:
+        """Test consecutive tools on one file reuse the parse."""
+        tools = SymbolTools(repo_root=temp_repo)
+        parser = tools._get_parser(".py")
+
+        with patch.object(parser, "parse_file", wraps=parser.parse_file) as parse:
+            tools.extract_symbols("src/main.py")
+            tools.get_imports("src/main.py")
+            tools.get_function_signature("src/main.py", "main")
+            tools.find_symbols_by_kind("src/main.py", "class")
+
+        assert parse.call_count == 1
+
+    def test_edit_invalidates_entry(self, temp_repo: str) -> None:
+        """Test a changed file is parsed again."""
+        tools = SymbolTools(repo_root=temp_repo)
+        assert tools.find_symbol("renamed", ["src/core/utils.py"]) == []
+
+        utils = Path(temp_repo) / "src" / "core" / "utils.py"
+        utils.write_text("def renamed():\n    pass\n")
+        stat = utils.stat()
+        os.utime(utils, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert len(tools.find_symbol("renamed", ["src/core/utils.py"])) == 1
+
+    def test_lru_bound(self, temp_repo: str) -> None:
+        """Test the cache holds at most max_entries parsed files."""
+        cache = ParsedFileCache(max_entries=1)
+        tools = SymbolTools(repo_root=temp_repo, parse_cache=cache)
+
+        tools.extract_symbols("src/main.py")
+        tools.extract_symbols("src/core/utils.py")
+
+        assert len(cache) == 1
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_syntax_error_is_cached(self, temp_repo: str) -> None:
+        """Test syntax errors are memoised like successful parses."""
+        tools = SymbolTools(repo_root=temp_repo)
+        tools.extract_symbols("src/broken.py")
+
+        parsed = tools.parse_ast("src/broken.py")
+
+        assert parsed is not None
+        assert "Syntax error" in parsed.raw_content
+        assert tools.parse_cache is not None
+        assert tools.parse_cache.get_stats()["hits"] == 1
+
+
+class TestRepoWideFindSymbol:
+    """Tests for find_symbol without explicit paths."""
+
+    def test_find_symbol_across_repo(self, temp_repo: str) -> None:
+        """Test find_symbol searches every supported file."""
+        tools = SymbolTools(repo_root=temp_repo)
+
+        results = tools.find_symbol("helper")
+
+        assert [s.name for s in results] == ["helper"]
+        assert results[0].file_path.endswith("utils.py")
+
+    def test_repeat_lookup_uses_name_index(self, temp_repo: str) -> None:
+        """Test a second lookup parses only files defining the name."""
+        cache = ParsedFileCache(max_entries=0)
+        tools = SymbolTools(repo_root=temp_repo, parse_cache=cache)
+        tools.find_symbol("helper")
+        cache._entries.clear()  # Keep only the name index
+        parser = tools._get_parser(".py")
+
+        with patch.object(parser, "parse_file", wraps=parser.parse_file) as parse:
+            results = tools.find_symbol("Application")
+
+        assert len(results) == 1
+        assert parse.call_count == 1
+        assert parse.call_args.args[0].endswith("main.py")
+
+
+class TestSeedFromRepoMapper:
+    """Tests for seeding from a repo mapper AST context."""
+
+    def test_seed_skips_files_newer_than_context(self, temp_repo: str) -> None:
+        """Test only files unchanged since the context was built are seeded."""
+        root = Path(temp_repo).resolve()
+        main_path = str(root / "src" / "main.py")
+        utils_path = str(root / "src" / "core" / "utils.py")
+        fake = ParsedFile(
+            path=main_path,
+            language="python",
+            symbols=[],
+            imports=[],
+            exports=[],
+            raw_content="",
+            line_count=0,
+        )
+        context = ASTContext(
+            repo_path=str(root),
+            git_sha="",
+            files={main_path: fake, utils_path: fake},
+            dependency_graph={},
+            created_at=datetime.now(),
+            token_estimate=0,
+        )
+        utils = Path(utils_path)
+        stat = utils.stat()
+        os.utime(utils, ns=(stat.st_atime_ns, stat.st_mtime_ns + 60_000_000_000))
+        cache = ParsedFileCache()
+
+        assert cache.seed(context, [".py"]) == 1
+
+        tools = SymbolTools(repo_root=temp_repo, parse_cache=cache)
+        assert tools.parse_ast("src/main.py") is fake
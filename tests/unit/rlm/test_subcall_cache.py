@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 
-from src.workers.rlm.cache import SubCallCache, CacheStats
+from src.workers.rlm.cache import CacheStats, RedisSubCallCacheTier, SubCallCache
 
 
 class TestSubCallCacheInit:
@@ -379,3 +381,120 @@ class TestCacheStats:
         assert d["entries"] == 50
         assert d["evictions"] == 10
         assert d["hit_rate"] == 80.0
+
+
+class FakeSharedTier:
+    """In-memory stand-in for a shared cache tier."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, result: str) -> None:
+        self.data[key] = result
+
+
+class TestBoundedCache:
+    """Tests for LRU, TTL and byte bounds."""
+
+    def test_eviction_follows_recency(self) -> None:
+        """Test that a recently read entry survives eviction."""
+        cache = SubCallCache(max_entries=2)
+        cache.set("a", "", "1")
+        cache.set("b", "", "2")
+        cache.get("a", "")
+
+        cache.set("c", "", "3")
+
+        assert cache.contains("a", "")
+        assert not cache.contains("b", "")
+        assert cache.get_stats().evictions == 1
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Test that entries past their TTL are dropped on lookup."""
+        cache = SubCallCache(ttl_seconds=60)
+        cache.set("q", "ctx", "answer")
+        entry = cache.get_entry("q", "ctx")
+        assert entry is not None
+        entry.expires_at = 0.0
+
+        assert cache.get("q", "ctx") is None
+        assert len(cache) == 0
+        assert cache.get_stats().expirations == 1
+
+    def test_byte_limit_evicts_oldest(self) -> None:
+        """Test that max_bytes bounds the cache size."""
+        cache = SubCallCache(max_bytes=250)
+        cache.set("a", "", "x" * 100)
+        cache.set("b", "", "y" * 100)
+        cache.set("c", "", "z" * 100)
+
+        assert not cache.contains("a", "")
+        assert cache.contains("c", "")
+        assert cache.get_stats().bytes <= 250
+
+    def test_entry_larger_than_byte_limit_is_not_cached(self) -> None:
+        """Test that an oversize entry neither evicts others nor gets stored."""
+        cache = SubCallCache(max_bytes=250)
+        cache.set("a", "", "x" * 100)
+
+        cache.set("big", "", "y" * 300)
+
+        assert cache.contains("a", "")
+        assert not cache.contains("big", "")
+        assert cache.get_stats().evictions == 0
+        assert cache.get_stats().bytes <= 250
+
+    def test_clear_resets_bytes(self) -> None:
+        """Test that clear resets byte accounting."""
+        cache = SubCallCache()
+        cache.set("a", "", "result")
+
+        cache.clear()
+
+        assert cache.get_stats().bytes == 0
+
+
+class TestSharedTier:
+    """Tests for the async API backed by a shared tier."""
+
+    async def test_aset_writes_through_to_shared_tier(self) -> None:
+        """Test that aset stores locally and in the shared tier."""
+        tier = FakeSharedTier()
+        cache = SubCallCache(shared_tier=tier)
+
+        await cache.aset("q", "ctx", "answer")
+
+        assert cache.get("q", "ctx") == "answer"
+        assert list(tier.data.values()) == ["answer"]
+
+    async def test_aget_populates_local_tier_from_shared(self) -> None:
+        """Test that a shared hit is promoted into the local tier."""
+        tier = FakeSharedTier()
+        await SubCallCache(shared_tier=tier).aset("q", "ctx", "answer")
+        cache = SubCallCache(shared_tier=tier)
+
+        assert await cache.aget("q", "ctx") == "answer"
+        assert cache.contains("q", "ctx")
+        stats = cache.get_stats()
+        assert stats.hits == 1
+        assert stats.remote_hits == 1
+
+    async def test_aget_miss_in_both_tiers(self) -> None:
+        """Test that a miss in both tiers counts once."""
+        cache = SubCallCache(shared_tier=FakeSharedTier())
+
+        assert await cache.aget("q", "ctx") is None
+        assert cache.get_stats().misses == 1
+
+    async def test_redis_tier_swallows_errors(self) -> None:
+        """Test that Redis failures degrade to a cache miss."""
+        redis_client = AsyncMock()
+        redis_client.get.side_effect = ConnectionError("down")
+        redis_client.set.side_effect = ConnectionError("down")
+        tier = RedisSubCallCacheTier(redis_client, ttl_seconds=60)
+
+        assert await tier.get("key") is None
+        await tier.set("key", "value")
@@ -687,65 +687,3 @@ class TestArchitectAgentHelpers:
         )
 
         assert agent.validate_context(invalid_context) is False
-
-
-class TestArchitectAgentJsonParsing:
-    """Tests for JSON parsing in Architect Agent."""
-
-    def test_parse_direct_json(
-        self,
-        mock_llm_client: MagicMock,
-        mock_artifact_writer: MagicMock,
-        default_config: DesignConfig,
-    ) -> None:
-        """Test parsing direct JSON response."""
-        agent = ArchitectAgent(
-            llm_client=mock_llm_client,
-            artifact_writer=mock_artifact_writer,
-            config=default_config,
-        )
-
-        content = '{"components": []}'
-        result = agent._parse_json_from_response(content)
-
-        assert result == {"components": []}
-
-    def test_parse_json_in_code_block(
-        self,
-        mock_llm_client: MagicMock,
-        mock_artifact_writer: MagicMock,
-        default_config: DesignConfig,
-    ) -> None:
-        """Test parsing JSON from code block."""
-        agent = ArchitectAgent(
-            llm_client=mock_llm_client,
-            artifact_writer=mock_artifact_writer,
-            config=default_config,
-        )
-
-        content = """Here's the architecture:
-```json
-{"components": [{"name": "API"}]}
-```
-"""
-        result = agent._parse_json_from_response(content)
-
-        assert result == {"components": [{"name": "API"}]}
-
-    def test_parse_invalid_json(
-        self,
-        mock_llm_client: MagicMock,
-        mock_artifact_writer: MagicMock,
-        default_config: DesignConfig,
-    ) -> None:
-        """Test parsing invalid JSON returns None."""
-        agent = ArchitectAgent(
-            llm_client=mock_llm_client,
-            artifact_writer=mock_artifact_writer,
-            config=default_config,
-        )
-
-        content = "this is not json"
-        result = agent._parse_json_from_response(content)
-
-        assert result is None
@@ -288,6 +288,22 @@ class TestFactoryFunctions:
 
         assert isinstance(coordinator, DesignCoordinator)
 
+    def test_create_design_coordinator_publishes_progress(self) -> None:
+        """Test agents publish progress to Redis when a client is given."""
+        from src.infrastructure.llm.structured_output import RedisProgressPublisher
+        from src.workers.agents.design import create_design_coordinator
+
+        coordinator = create_design_coordinator(
+            llm_client=MagicMock(),
+            artifact_writer=MagicMock(),
+            redis_client=MagicMock(),
+        )
+
+        assert isinstance(coordinator.on_progress, RedisProgressPublisher)
+        assert coordinator._surveyor._on_progress is coordinator.on_progress
+        assert coordinator._architect._on_progress is coordinator.on_progress
+        assert coordinator._planner._on_progress is coordinator.on_progress
+
 
 class TestAllExports:
     """Tests for __all__ exports."""
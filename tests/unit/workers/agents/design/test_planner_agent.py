@@ -667,65 +667,3 @@ class TestPlannerAgentHelpers:
         )
 
         assert agent.validate_context(invalid_context) is False
-
-
-class TestPlannerAgentJsonParsing:
-    """Tests for JSON parsing in Planner Agent."""
-
-    def test_parse_direct_json(
-        self,
-        mock_llm_client: MagicMock,
-        mock_artifact_writer: MagicMock,
-        default_config: DesignConfig,
-    ) -> None:
-        """Test parsing direct JSON response."""
-        agent = PlannerAgent(
-            llm_client=mock_llm_client,
-            artifact_writer=mock_artifact_writer,
-            config=default_config,
-        )
-
-        content = '{"tasks": []}'
-        result = agent._parse_json_from_response(content)
-
-        assert result == {"tasks": []}
-
-    def test_parse_json_in_code_block(
-        self,
-        mock_llm_client: MagicMock,
-        mock_artifact_writer: MagicMock,
-        default_config: DesignConfig,
-    ) -> None:
-        """Test parsing JSON from code block."""
-        agent = PlannerAgent(
-            llm_client=mock_llm_client,
-            artifact_writer=mock_artifact_writer,
-            config=default_config,
-        )
-
-        content = """Here's the plan:
-```json
-{"tasks": [{"id": "T001"}]}
-```
-"""
-        result = agent._parse_json_from_response(content)
-
-        assert result == {"tasks": [{"id": "T001"}]}
-
-    def test_parse_invalid_json(
-        self,
-        mock_llm_client: MagicMock,
-        mock_artifact_writer: MagicMock,
-        default_config: DesignConfig,
-    ) -> None:
-        """Test parsing invalid JSON returns None."""
-        agent = PlannerAgent(
-            llm_client=mock_llm_client,
-            artifact_writer=mock_artifact_writer,
-            config=default_config,
-        )
-
-        content = "this is not json"
-        result = agent._parse_json_from_response(content)
-
-        assert result is None
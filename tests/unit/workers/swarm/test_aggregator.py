@@ -6,7 +6,9 @@ in the swarm result aggregator.
 
 from __future__ import annotations
 
+import random
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -591,6 +593,128 @@ class TestDeduplicationFlow:
         assert len(report.critical_findings) == 1
 
 
+def _pairwise_detect_duplicates(
+    aggregator: ResultAggregator, findings: list[ReviewFinding]
+) -> tuple[list[ReviewFinding], int]:
+    """Reference all-pairs deduplication, as implemented before indexing."""
+    unique: list[ReviewFinding] = []
+    removed = 0
+    for finding in findings:
+        for i, existing in enumerate(unique):
+            if aggregator._is_duplicate(finding, existing):
+                unique[i] = aggregator._merge_findings(existing, finding)
+                removed += 1
+                break
+        else:
+            unique.append(finding)
+    return unique, removed
+
+
+class TestIndexedDeduplication:
+    """Tests for bucketed, interval-indexed duplicate detection."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_pairwise_comparison(
+        self, aggregator: ResultAggregator, seed: int
+    ) -> None:
+        """Test that indexed dedupe gives the same result as all-pairs dedupe."""
+        rng = random.Random(seed)
+        titles = [
+            "SQL injection in query",
+            "SQL injection in query builder",
+            "Possible SQL injection",
+            "Unbounded loop over results",
+            "Unbounded loop over all results",
+            "Missing docstring",
+        ]
+        findings = []
+        for i in range(300):
+            line_start = rng.randint(1, 200)
+            findings.append(
+                ReviewFinding(
+                    id=f"finding-{i}",
+                    reviewer_type=rng.choice(["security", "performance", "style"]),
+                    severity=rng.choice(list(Severity)),
+                    category=rng.choice(["security/injection", "security", "perf", "", "/x"]),
+                    title=rng.choice(titles),
+                    description=f"Description {i}",
+                    file_path=rng.choice(["src/a.py", "src/b.py", "src/c.py"]),
+                    line_start=line_start,
+                    line_end=rng.choice([None, line_start + rng.randint(-2, 15)]),
+                    recommendation="Fix this issue",
+                    confidence=rng.random(),
+                )
+            )
+
+        assert aggregator._detect_duplicates(findings) == _pairwise_detect_duplicates(
+            aggregator, findings
+        )
+
+    def test_merges_into_first_matching_finding(
+        self, aggregator: ResultAggregator
+    ) -> None:
+        """Test that a finding merges into the earliest duplicate only."""
+        findings = [
+            create_finding(reviewer_type="security", line_start=20, line_end=30),
+            create_finding(reviewer_type="style", line_start=5, line_end=12),
+            create_finding(reviewer_type="performance", line_start=10, line_end=25),
+        ]
+
+        unique, removed = aggregator._detect_duplicates(findings)
+
+        assert removed == 1
+        assert unique[0].reviewer_type == "performance, security"
+        assert unique[0].line_start == 10
+        assert unique[1].reviewer_type == "style"
+
+    def test_uncategorized_finding_matches_any_category(
+        self, aggregator: ResultAggregator
+    ) -> None:
+        """Test that a finding without category can merge with any category."""
+        findings = [
+            create_finding(reviewer_type="security", category="security/injection"),
+            create_finding(reviewer_type="style", category=""),
+        ]
+
+        unique, removed = aggregator._detect_duplicates(findings)
+
+        assert removed == 1
+        assert unique[0].reviewer_type == "security, style"
+
+    def test_skips_title_comparison_for_distant_findings(
+        self, aggregator: ResultAggregator
+    ) -> None:
+        """Test that findings on other files or lines are never compared."""
+        findings = [
+            create_finding(file_path=f"src/{i % 10}.py", line_start=i * 10)
+            for i in range(200)
+        ]
+
+        with patch.object(aggregator, "_text_similarity") as similarity, patch(
+            "src.workers.swarm.aggregator.SequenceMatcher.ratio"
+        ) as ratio:
+            unique, removed = aggregator._detect_duplicates(findings)
+
+        assert (len(unique), removed) == (200, 0)
+        similarity.assert_not_called()
+        ratio.assert_not_called()
+
+    def test_quick_ratio_rejects_dissimilar_titles(
+        self, aggregator: ResultAggregator
+    ) -> None:
+        """Test that clearly different titles skip the full ratio."""
+        findings = [
+            create_finding(title="SQL injection"),
+            create_finding(title="Missing docstring on public helper function"),
+        ]
+
+        with patch("src.workers.swarm.aggregator.SequenceMatcher.ratio") as ratio:
+            unique, removed = aggregator._detect_duplicates(findings)
+
+        assert removed == 0
+        ratio.assert_not_called()
+
+
 class TestReportMetadata:
     """Tests for report metadata fields."""
 
@@ -50,7 +50,13 @@ def mock_redis() -> AsyncMock:
     mock.expire = AsyncMock(return_value=True)
     mock.sadd = AsyncMock(return_value=1)
     mock.smembers = AsyncMock(return_value=set())
-    mock.pipeline = MagicMock()
+    pipeline = AsyncMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipeline)
+    pipeline.__aexit__ = AsyncMock(return_value=None)
+    for command in ("hset", "sadd", "xadd", "expire"):
+        setattr(pipeline, command, MagicMock())
+    pipeline.execute = AsyncMock(return_value=[])
+    mock.pipeline = MagicMock(return_value=pipeline)
     return mock
 
 
@@ -223,7 +229,7 @@ class TestDispatchSwarm:
         await dispatcher.dispatch_swarm("src/workers/")
 
         session_manager.create_session.assert_called_once_with(
-            "src/workers/", None
+            "src/workers/", None, base_ref=None
         )
 
     @pytest.mark.asyncio
@@ -256,7 +262,7 @@ class TestDispatchSwarm:
         await dispatcher.dispatch_swarm("src/workers/", reviewer_types=["security"])
 
         session_manager.create_session.assert_called_once_with(
-            "src/workers/", ["security"]
+            "src/workers/", ["security"], base_ref=None
         )
 
     @pytest.mark.asyncio
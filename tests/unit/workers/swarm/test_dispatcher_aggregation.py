@@ -48,7 +48,13 @@ def mock_redis() -> AsyncMock:
     mock.expire = AsyncMock(return_value=True)
     mock.sadd = AsyncMock(return_value=1)
     mock.smembers = AsyncMock(return_value=set())
-    mock.pipeline = MagicMock()
+    pipeline = AsyncMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipeline)
+    pipeline.__aexit__ = AsyncMock(return_value=None)
+    for command in ("hset", "sadd", "xadd", "expire"):
+        setattr(pipeline, command, MagicMock())
+    pipeline.execute = AsyncMock(return_value=[])
+    mock.pipeline = MagicMock(return_value=pipeline)
     return mock
 
 
@@ -6,7 +6,10 @@ Tests cover code extraction from local paths, LLM response parsing
 
 from __future__ import annotations
 
+import asyncio
 import json
+import shutil
+import subprocess
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -24,9 +27,9 @@ from src.workers.swarm.executor import (
     ResponseParser,
     ReviewExecutor,
 )
+from src.workers.swarm.incremental import FindingCache, content_hash
 from src.workers.swarm.models import ReviewerResult, ReviewFinding, Severity
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -586,3 +589,372 @@ class TestReviewExecutor:
         # Checklist items must appear
         for item in reviewer.get_checklist():
             assert item in user_prompt
+
+
+# ---------------------------------------------------------------------------
+# Shared snapshots
+# ---------------------------------------------------------------------------
+
+
+class TestCodeContextSerialization:
+    """Tests for CodeContext round-tripping."""
+
+    def test_round_trip(self) -> None:
+        """to_dict/from_dict preserve files, line counts and errors."""
+        ctx = CodeContext(
+            files=[CodeFile(path="a.py", content="x = 1\n", lines=1)],
+            total_lines=1,
+            extraction_errors=["Skipped b.py"],
+        )
+
+        restored = CodeContext.from_dict(json.loads(json.dumps(ctx.to_dict())))
+
+        assert restored == ctx
+
+
+class TestConcurrentExtraction:
+    """Tests for windowed, threaded local extraction."""
+
+    @pytest.mark.asyncio
+    async def test_local_order_preserved_across_windows(
+        self, tmp_path: Path
+    ) -> None:
+        """Files come back in walk order regardless of read concurrency."""
+        for i in range(7):
+            (tmp_path / f"mod_{i}.py").write_text(f"x = {i}\n", encoding="utf-8")
+
+        extractor = CodeExtractor(workspace_root=str(tmp_path), max_concurrency=2)
+        ctx = await extractor.extract(".")
+
+        assert [Path(f.path).name for f in ctx.files] == [
+            f"mod_{i}.py" for i in range(7)
+        ]
+        assert ctx.total_lines == 7
+
+
+class TestReviewExecutorSharedSnapshot:
+    """Tests for sharing one extraction across a session's reviewers."""
+
+    @pytest.mark.asyncio
+    async def test_reviewers_in_session_extract_once(self, tmp_path: Path) -> None:
+        """Concurrent reviewers of one session trigger a single extraction."""
+        (tmp_path / "app.py").write_text("x = 1\n", encoding="utf-8")
+        client = AsyncMock()
+        client.generate.return_value = LLMResponse(
+            content='{"findings": []}', model="test-model"
+        )
+        factory = AsyncMock()
+        factory.get_client.return_value = client
+
+        executor = ReviewExecutor(factory=factory, workspace_root=str(tmp_path))
+        original_extract = executor._extractor.extract
+        with patch.object(
+            executor._extractor, "extract", side_effect=original_extract
+        ) as mock_extract:
+            results = await asyncio.gather(
+                *(
+                    executor.execute_review(
+                        "swarm-shared", "app.py", MockReviewer(reviewer_type=rt)
+                    )
+                    for rt in ("security", "performance", "style")
+                )
+            )
+
+        assert mock_extract.call_count == 1
+        assert all(r.files_reviewed == results[0].files_reviewed for r in results)
+        assert len(results[0].files_reviewed) == 1
+
+
+class TestShardedReview:
+    """Tests for map-reduce review of large targets."""
+
+    @staticmethod
+    def _write_files(root: Path, count: int, lines: int) -> None:
+        for i in range(count):
+            (root / f"mod_{i}.py").write_text(
+                "".join(f"value_{j} = {j}\n" for j in range(lines)),
+                encoding="utf-8",
+            )
+
+    @pytest.mark.asyncio
+    async def test_large_target_reviewed_per_shard(self, tmp_path: Path) -> None:
+        """Each shard gets its own LLM call and every file is reviewed."""
+        self._write_files(tmp_path, count=4, lines=40)
+        client = AsyncMock()
+        client.generate.return_value = LLMResponse(
+            content='{"findings": []}', model="test-model"
+        )
+        factory = AsyncMock()
+        factory.get_client.return_value = client
+
+        executor = ReviewExecutor(
+            factory=factory, workspace_root=str(tmp_path), shard_token_budget=200
+        )
+        result = await executor.execute_review("swarm-s1", ".", MockReviewer())
+
+        assert result.status == "success"
+        assert client.generate.await_count == 4
+        assert sorted(Path(p).name for p in result.files_reviewed) == [
+            f"mod_{i}.py" for i in range(4)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_shard_findings_are_merged(self, tmp_path: Path) -> None:
+        """Duplicate findings from different shards are merged."""
+        self._write_files(tmp_path, count=2, lines=40)
+        duplicate = json.dumps({"findings": [_make_finding_dict(file_path="x.py")]})
+        client = AsyncMock()
+        client.generate.return_value = LLMResponse(content=duplicate, model="m")
+        factory = AsyncMock()
+        factory.get_client.return_value = client
+
+        executor = ReviewExecutor(
+            factory=factory, workspace_root=str(tmp_path), shard_token_budget=200
+        )
+        result = await executor.execute_review("swarm-s2", ".", MockReviewer())
+
+        assert client.generate.await_count == 2
+        assert len(result.findings) == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_shard_failure_is_reported(self, tmp_path: Path) -> None:
+        """A failed shard is reported without discarding other shards."""
+        self._write_files(tmp_path, count=2, lines=40)
+        client = AsyncMock()
+        client.generate.side_effect = [
+            LLMResponse(
+                content=json.dumps({"findings": [_make_finding_dict()]}), model="m"
+            ),
+            RuntimeError("rate limited"),
+        ]
+        factory = AsyncMock()
+        factory.get_client.return_value = client
+
+        executor = ReviewExecutor(
+            factory=factory,
+            workspace_root=str(tmp_path),
+            shard_token_budget=200,
+            max_concurrent_calls=1,
+        )
+        result = await executor.execute_review("swarm-s3", ".", MockReviewer())
+
+        assert result.status == "success"
+        assert len(result.findings) == 1
+        assert len(result.files_reviewed) == 1
+        assert "1 of 2 shards failed" in (result.error_message or "")
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_cap(self, tmp_path: Path) -> None:
+        """No more than max_concurrent_calls LLM calls run at once."""
+        self._write_files(tmp_path, count=6, lines=40)
+        in_flight = 0
+        peak = 0
+
+        async def generate(**kwargs: object) -> LLMResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return LLMResponse(content='{"findings": []}', model="m")
+
+        client = AsyncMock()
+        client.generate.side_effect = generate
+        factory = AsyncMock()
+        factory.get_client.return_value = client
+
+        executor = ReviewExecutor(
+            factory=factory,
+            workspace_root=str(tmp_path),
+            shard_token_budget=200,
+            max_concurrent_calls=2,
+        )
+        await asyncio.gather(
+            executor.execute_review("swarm-s4", ".", MockReviewer("security")),
+            executor.execute_review("swarm-s4", ".", MockReviewer("style")),
+        )
+
+        assert client.generate.await_count == 12
+        assert peak == 2
+
+    def test_partial_file_prompt_shows_line_range(self) -> None:
+        """Line-range pieces are labelled with their position in the file."""
+        ctx = CodeContext(
+            files=[
+                CodeFile(
+                    path="big.py", content="x\n", lines=1, start_line=101, partial=True
+                )
+            ]
+        )
+
+        prompt = ReviewExecutor._build_user_prompt(ctx, MockReviewer())
+
+        assert "--- File: big.py (lines 101-101) ---" in prompt
+
+
+def _git(cwd: Path, *args: str) -> None:
+    """Run a git command in a test repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestIncrementalReview:
+    """Tests for diff-only reviews backed by the finding cache."""
+
+    @staticmethod
+    def _repo(root: Path) -> None:
+        _git(root, "init", "-q")
+        (root / "stable.py").write_text("x = 1\n", encoding="utf-8")
+        (root / "big.py").write_text(
+            "".join(f"value_{i} = {i}\n" for i in range(200)), encoding="utf-8"
+        )
+        _git(root, "add", ".")
+        _git(root, "commit", "-q", "-m", "base")
+
+    @staticmethod
+    def _factory(client: AsyncMock) -> AsyncMock:
+        factory = AsyncMock()
+        factory.get_client.return_value = client
+        return factory
+
+    async def test_full_review_populates_cache(self, tmp_path: Path) -> None:
+        """Findings of a full review are cached per file."""
+        self._repo(tmp_path)
+        client = AsyncMock()
+        client.generate.return_value = LLMResponse(
+            content=json.dumps(
+                {"findings": [_make_finding_dict(file_path="stable.py")]}
+            ),
+            model="m",
+        )
+        cache = FindingCache()
+        executor = ReviewExecutor(
+            factory=self._factory(client),
+            workspace_root=str(tmp_path),
+            finding_cache=cache,
+        )
+        reviewer = MockReviewer()
+
+        await executor.execute_review("swarm-i1", ".", reviewer)
+
+        hits = await cache.get_many(
+            "security",
+            executor._prompt_version(reviewer),
+            [content_hash("x = 1\n")],
+        )
+        assert [f.title for f in hits[content_hash("x = 1\n")]] == ["SQL Injection"]
+        assert cache.get_stats()["entries"] == 2
+
+    async def test_only_changed_hunks_are_sent(self, tmp_path: Path) -> None:
+        """Unchanged files come from the cache and only hunks reach the LLM."""
+        self._repo(tmp_path)
+        client = AsyncMock()
+        client.generate.return_value = LLMResponse(
+            content=json.dumps(
+                {"findings": [_make_finding_dict(file_path="stable.py")]}
+            ),
+            model="m",
+        )
+        cache = FindingCache()
+        executor = ReviewExecutor(
+            factory=self._factory(client),
+            workspace_root=str(tmp_path),
+            finding_cache=cache,
+            diff_context_lines=3,
+        )
+        await executor.execute_review("swarm-i2", ".", MockReviewer())
+
+        lines = (tmp_path / "big.py").read_text().splitlines(keepends=True)
+        lines[100] = "value_100 = eval(user_input)\n"
+        (tmp_path / "big.py").write_text("".join(lines), encoding="utf-8")
+        client.generate.reset_mock()
+        client.generate.return_value = LLMResponse(
+            content=json.dumps(
+                {"findings": [_make_finding_dict(title="Eval", file_path="big.py")]}
+            ),
+            model="m",
+        )
+
+        result = await executor.execute_review(
+            "swarm-i3", ".", MockReviewer(), base_ref="HEAD"
+        )
+
+        assert result.status == "success"
+        client.generate.assert_awaited_once()
+        prompt = client.generate.call_args.kwargs["prompt"]
+        assert "eval(user_input)" in prompt
+        assert "value_0 = 0" not in prompt
+        assert "x = 1" not in prompt
+        assert sorted(f.title for f in result.findings) == ["Eval", "SQL Injection"]
+        assert sorted(Path(p).name for p in result.files_reviewed) == [
+            "big.py",
+            "stable.py",
+        ]
+
+    async def test_no_changes_makes_no_llm_call(self, tmp_path: Path) -> None:
+        """A clean working tree is answered from the cache alone."""
+        self._repo(tmp_path)
+        client = AsyncMock()
+        client.generate.return_value = LLMResponse(
+            content='{"findings": []}', model="m"
+        )
+        executor = ReviewExecutor(
+            factory=self._factory(client),
+            workspace_root=str(tmp_path),
+            finding_cache=FindingCache(),
+        )
+        await executor.execute_review("swarm-i4", ".", MockReviewer())
+        client.generate.reset_mock()
+
+        result = await executor.execute_review(
+            "swarm-i5", ".", MockReviewer(), base_ref="HEAD"
+        )
+
+        client.generate.assert_not_awaited()
+        assert result.status == "success"
+        assert len(result.files_reviewed) == 2
+
+    async def test_changed_file_past_line_cap_is_reviewed(
+        self, tmp_path: Path
+    ) -> None:
+        """Changed files left out of the capped snapshot are still reviewed."""
+        from src.workers.swarm.snapshot import CodeSnapshotCache
+
+        self._repo(tmp_path)
+        (tmp_path / "zz_new.py").write_text("os.system(cmd)\n", encoding="utf-8")
+        client = AsyncMock()
+        client.generate.return_value = LLMResponse(
+            content='{"findings": []}', model="m"
+        )
+        executor = ReviewExecutor(
+            factory=self._factory(client),
+            snapshot_cache=CodeSnapshotCache(
+                CodeExtractor(str(tmp_path), max_total_lines=1)
+            ),
+        )
+
+        result = await executor.execute_review(
+            "swarm-i7", ".", MockReviewer(), base_ref="HEAD"
+        )
+
+        assert result.status == "success"
+        assert "os.system(cmd)" in client.generate.call_args.kwargs["prompt"]
+
+    async def test_bad_base_ref_fails_review(self, tmp_path: Path) -> None:
+        """An unknown base ref is reported as a failed review."""
+        self._repo(tmp_path)
+        executor = ReviewExecutor(
+            factory=self._factory(AsyncMock()), workspace_root=str(tmp_path)
+        )
+
+        result = await executor.execute_review(
+            "swarm-i6", ".", MockReviewer(), base_ref="no-such-ref"
+        )
+
+        assert result.status == "failed"
+        assert "git diff failed" in (result.error_message or "")
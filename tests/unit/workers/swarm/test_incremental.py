@@ -0,0 +1,249 @@
+"""Unit tests for incremental (diff-only) swarm reviews."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.workers.swarm.config import SwarmConfig
+from src.workers.swarm.executor import CodeFile
+from src.workers.swarm.incremental import (
+    FindingCache,
+    changed_line_ranges,
+    content_hash,
+    excerpt_file,
+    is_valid_base_ref,
+    parse_unified_diff,
+)
+from src.workers.swarm.models import ReviewFinding, Severity
+
+
+def _finding(title: str = "Issue", file_path: str = "a.py") -> ReviewFinding:
+    """Build a ReviewFinding."""
+    return ReviewFinding(
+        id=f"finding-{title}",
+        reviewer_type="security",
+        severity=Severity.MEDIUM,
+        category="security",
+        title=title,
+        description="desc",
+        file_path=file_path,
+        line_start=1,
+        recommendation="fix",
+        confidence=0.8,
+    )
+
+
+def _numbered_file(count: int, path: str = "a.py") -> CodeFile:
+    """Build a file whose line N reads 'line N'."""
+    return CodeFile(
+        path=path,
+        content="".join(f"line {i}\n" for i in range(1, count + 1)),
+        lines=count,
+    )
+
+
+class TestBaseRef:
+    """Tests for base ref validation."""
+
+    @pytest.mark.parametrize("ref", ["main", "HEAD~2", "origin/main", "v1.2.0", "a1b2c3d"])
+    def test_accepts_refs(self, ref: str) -> None:
+        """Branch names, tags, SHAs and ancestry refs are accepted."""
+        assert is_valid_base_ref(ref)
+
+    @pytest.mark.parametrize("ref", ["--output=x", "main..dev", "-p", "a b", ""])
+    def test_rejects_options_and_ranges(self, ref: str) -> None:
+        """Options, ranges and whitespace are rejected."""
+        assert not is_valid_base_ref(ref)
+
+
+class TestParseUnifiedDiff:
+    """Tests for extracting changed ranges from diff output."""
+
+    def test_hunks_per_file(self) -> None:
+        """Added and modified hunks become ranges in the new file."""
+        diff = (
+            "diff --git a/src/a.py b/src/a.py\n"
+            "--- a/src/a.py\n"
+            "+++ b/src/a.py\n"
+            "@@ -3 +3 @@\n"
+            "-old\n"
+            "+new\n"
+            "@@ -10,0 +11,3 @@\n"
+            "+x\n+y\n+z\n"
+            "diff --git a/src/b.py b/src/b.py\n"
+            "--- a/src/b.py\n"
+            "+++ b/src/b.py\n"
+            "@@ -5,2 +4,0 @@\n"
+            "-gone\n-gone\n"
+        )
+
+        changes = parse_unified_diff(diff)
+
+        assert changes == {"src/a.py": [(3, 3), (11, 13)], "src/b.py": [(4, 4)]}
+
+    def test_deleted_files_are_skipped(self) -> None:
+        """Files deleted since the base ref have nothing to review."""
+        diff = (
+            "diff --git a/old.py b/old.py\n"
+            "--- a/old.py\n"
+            "+++ /dev/null\n"
+            "@@ -1,2 +0,0 @@\n"
+            "-a\n-b\n"
+        )
+
+        assert parse_unified_diff(diff) == {}
+
+
+class TestExcerptFile:
+    """Tests for cutting changed hunks out of a file."""
+
+    def test_hunk_with_context(self) -> None:
+        """A hunk is returned with context lines on each side."""
+        pieces = excerpt_file(_numbered_file(100), [(50, 51)], context_lines=2)
+
+        assert len(pieces) == 1
+        assert pieces[0].partial
+        assert pieces[0].start_line == 48
+        assert pieces[0].lines == 6
+        assert pieces[0].content.splitlines() == [f"line {i}" for i in range(48, 54)]
+
+    def test_nearby_hunks_are_merged(self) -> None:
+        """Hunks whose context windows touch become one piece."""
+        pieces = excerpt_file(
+            _numbered_file(100), [(10, 10), (14, 14), (80, 80)], context_lines=2
+        )
+
+        assert [(p.start_line, p.lines) for p in pieces] == [(8, 9), (78, 5)]
+
+    def test_whole_file_returned_as_is(self) -> None:
+        """New files and fully covered files are not cut."""
+        code_file = _numbered_file(10)
+
+        assert excerpt_file(code_file, [], context_lines=2) == [code_file]
+        assert excerpt_file(code_file, [(4, 6)], context_lines=5) == [code_file]
+
+
+class TestFindingCache:
+    """Tests for the per-file finding cache."""
+
+    async def test_memory_round_trip(self) -> None:
+        """Stored findings, including empty results, are returned on lookup."""
+        cache = FindingCache()
+        await cache.put_many("security", "v1", {"d1": [_finding()], "d2": []})
+
+        hits = await cache.get_many("security", "v1", ["d1", "d2", "d3"])
+
+        assert [f.title for f in hits["d1"]] == ["Issue"]
+        assert hits["d2"] == []
+        assert "d3" not in hits
+        assert cache.get_stats()["misses"] == 1
+
+    async def test_keyed_by_reviewer_and_prompt_version(self) -> None:
+        """Another reviewer or prompt version does not see the entry."""
+        cache = FindingCache()
+        await cache.put_many("security", "v1", {"d1": [_finding()]})
+
+        assert await cache.get_many("style", "v1", ["d1"]) == {}
+        assert await cache.get_many("security", "v2", ["d1"]) == {}
+
+    async def test_redis_tier(self) -> None:
+        """Entries are written with a TTL and read back from Redis."""
+        pipeline = AsyncMock()
+        pipeline.__aenter__.return_value = pipeline
+        pipeline.set = MagicMock()
+        redis_client = AsyncMock()
+        redis_client.pipeline = MagicMock(return_value=pipeline)
+        writer = FindingCache(redis_client, key_prefix="test", ttl_seconds=60)
+
+        await writer.put_many("security", "v1", {"d1": [_finding()]})
+
+        pipeline.set.assert_called_once()
+        key, raw = pipeline.set.call_args.args
+        assert key == "test:findings:security:v1:d1"
+        assert pipeline.set.call_args.kwargs == {"ex": 60}
+
+        redis_client.mget.return_value = [raw]
+        reader = FindingCache(redis_client, key_prefix="test")
+        hits = await reader.get_many("security", "v1", ["d1"])
+
+        assert hits["d1"][0].title == "Issue"
+
+    async def test_redis_errors_are_misses(self) -> None:
+        """A failing Redis lookup is treated as a miss."""
+        redis_client = AsyncMock()
+        redis_client.mget.side_effect = ConnectionError("down")
+        cache = FindingCache(redis_client)
+
+        assert await cache.get_many("security", "v1", ["d1"]) == {}
+
+    async def test_corrupt_entries_are_ignored(self) -> None:
+        """Unparseable Redis entries are discarded."""
+        redis_client = AsyncMock()
+        redis_client.mget.return_value = ["not json", json.dumps([{"bad": 1}])]
+        cache = FindingCache(redis_client)
+
+        assert await cache.get_many("security", "v1", ["d1", "d2"]) == {}
+
+    def test_from_config_disabled_by_zero_ttl(self) -> None:
+        """A zero TTL disables the cache."""
+        assert FindingCache.from_config(SwarmConfig(finding_cache_ttl_seconds=0)) is None
+        assert FindingCache.from_config(SwarmConfig()) is not None
+
+
+def _git(cwd: Path, *args: str) -> None:
+    """Run a git command in a test repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestChangedLineRanges:
+    """Tests for reading changes from a real git repository."""
+
+    async def test_changed_and_untracked_files(self, tmp_path: Path) -> None:
+        """Modified lines and untracked files are reported; clean files are not."""
+        _git(tmp_path, "init", "-q")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("a = 1\nb = 2\nc = 3\n")
+        (tmp_path / "src" / "clean.py").write_text("x = 1\n")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", "base")
+
+        (tmp_path / "src" / "a.py").write_text("a = 1\nb = 20\nc = 3\n")
+        (tmp_path / "src" / "new.py").write_text("y = 2\n")
+        root = tmp_path.resolve()
+
+        changes = await changed_line_ranges(tmp_path / "src", "HEAD")
+
+        assert changes == {
+            str(root / "src" / "a.py"): [(2, 2)],
+            str(root / "src" / "new.py"): [],
+        }
+
+    async def test_unknown_ref_raises(self, tmp_path: Path) -> None:
+        """An unknown base ref is reported as a git failure."""
+        _git(tmp_path, "init", "-q")
+
+        with pytest.raises(RuntimeError):
+            await changed_line_ranges(tmp_path, "no-such-ref")
+
+    async def test_invalid_ref_rejected(self, tmp_path: Path) -> None:
+        """Refs that could be parsed as options never reach git."""
+        with pytest.raises(ValueError):
+            await changed_line_ranges(tmp_path, "--output=/tmp/x")
+
+
+def test_content_hash_is_stable() -> None:
+    """Equal content gives equal digests."""
+    assert content_hash("x = 1\n") == content_hash("x = 1\n")
+    assert content_hash("x = 1\n") != content_hash("x = 2\n")
@@ -1,13 +1,14 @@
 """Unit tests for SwarmRedisStore.
 
 Tests for Redis storage operations including session CRUD, result storage,
-and completion waiting functionality.
+session event streams, and completion waiting functionality.
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -32,7 +33,21 @@ def config() -> SwarmConfig:
 
 
 @pytest.fixture
-def mock_redis() -> AsyncMock:
+def mock_pipeline() -> AsyncMock:
+    """Create a mock Redis MULTI/EXEC pipeline."""
+    pipeline = AsyncMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipeline)
+    pipeline.__aexit__ = AsyncMock(return_value=None)
+    pipeline.hset = MagicMock()
+    pipeline.sadd = MagicMock()
+    pipeline.xadd = MagicMock()
+    pipeline.expire = MagicMock()
+    pipeline.execute = AsyncMock(return_value=[])
+    return pipeline
+
+
+@pytest.fixture
+def mock_redis(mock_pipeline: AsyncMock) -> AsyncMock:
     """Create a mock async Redis client."""
     mock = AsyncMock()
     # Set up default return values
@@ -42,10 +57,30 @@ def mock_redis() -> AsyncMock:
     mock.expire = AsyncMock(return_value=True)
     mock.sadd = AsyncMock(return_value=1)
     mock.smembers = AsyncMock(return_value=set())
-    mock.pipeline = MagicMock()
+    mock.xread = AsyncMock(side_effect=_blocking_xread([]))
+    mock.pipeline = MagicMock(return_value=mock_pipeline)
     return mock
 
 
+def _blocking_xread(batches: list[list[tuple[str, dict]]]):
+    """Build an XREAD stand-in that returns batches, then blocks empty."""
+    pending = list(batches)
+
+    async def xread(streams: dict[str, str], block: int | None = None) -> list:
+        if pending:
+            messages = pending.pop(0)
+            return [(next(iter(streams)), messages)]
+        await asyncio.sleep((block or 0) / 1000)
+        return []
+
+    return xread
+
+
+def _reviewer_event(event_id: str, reviewer: str) -> tuple[str, dict]:
+    """Build a reviewer_complete stream entry."""
+    return event_id, {"event": "reviewer_complete", "reviewer": reviewer, "status": "success"}
+
+
 @pytest.fixture
 def sample_session() -> SwarmSession:
     """Create a sample swarm session for testing."""
@@ -298,10 +333,30 @@ class TestUpdateSessionStatus:
 class TestStoreReviewerResult:
     """Tests for SwarmRedisStore.store_reviewer_result()."""
 
+    @pytest.mark.asyncio
+    async def test_store_reviewer_result_uses_transaction(
+        self,
+        mock_redis: AsyncMock,
+        mock_pipeline: AsyncMock,
+        config: SwarmConfig,
+        sample_result: ReviewerResult,
+    ) -> None:
+        """Test that all writes go through a single MULTI/EXEC pipeline."""
+        store = SwarmRedisStore(mock_redis, config)
+
+        await store.store_reviewer_result("swarm-abc12345", "security", sample_result)
+
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        mock_pipeline.execute.assert_awaited_once()
+        mock_redis.hset.assert_not_called()
+        mock_redis.sadd.assert_not_called()
+        mock_redis.expire.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_store_reviewer_result_stores_in_results_hash(
         self,
         mock_redis: AsyncMock,
+        mock_pipeline: AsyncMock,
         config: SwarmConfig,
         sample_result: ReviewerResult,
     ) -> None:
@@ -311,7 +366,7 @@ class TestStoreReviewerResult:
         await store.store_reviewer_result("swarm-abc12345", "security", sample_result)
 
         # Verify result is stored in results hash
-        mock_redis.hset.assert_any_call(
+        mock_pipeline.hset.assert_any_call(
             "test_swarm:results:swarm-abc12345",
             "security",
             sample_result.model_dump_json(),
@@ -321,6 +376,7 @@ class TestStoreReviewerResult:
     async def test_store_reviewer_result_adds_to_progress_set(
         self,
         mock_redis: AsyncMock,
+        mock_pipeline: AsyncMock,
         config: SwarmConfig,
         sample_result: ReviewerResult,
     ) -> None:
@@ -330,15 +386,39 @@ class TestStoreReviewerResult:
         await store.store_reviewer_result("swarm-abc12345", "security", sample_result)
 
         # Verify reviewer is added to progress set
-        mock_redis.sadd.assert_called_with(
+        mock_pipeline.sadd.assert_called_with(
             "test_swarm:progress:swarm-abc12345",
             "security",
         )
 
+    @pytest.mark.asyncio
+    async def test_store_reviewer_result_publishes_event(
+        self,
+        mock_redis: AsyncMock,
+        mock_pipeline: AsyncMock,
+        config: SwarmConfig,
+        sample_result: ReviewerResult,
+    ) -> None:
+        """Test that a reviewer_complete event is added to the session stream."""
+        store = SwarmRedisStore(mock_redis, config)
+
+        await store.store_reviewer_result("swarm-abc12345", "security", sample_result)
+
+        mock_pipeline.xadd.assert_called_once()
+        key, fields = mock_pipeline.xadd.call_args[0]
+        assert key == "test_swarm:events:swarm-abc12345"
+        assert fields["event"] == "reviewer_complete"
+        assert fields["reviewer"] == "security"
+        assert fields["status"] == "success"
+        assert fields["findings"] == "1"
+        assert fields["files_reviewed"] == "2"
+        assert mock_pipeline.xadd.call_args[1]["approximate"] is True
+
     @pytest.mark.asyncio
     async def test_store_reviewer_result_sets_ttl_on_results(
         self,
         mock_redis: AsyncMock,
+        mock_pipeline: AsyncMock,
         config: SwarmConfig,
         sample_result: ReviewerResult,
     ) -> None:
@@ -348,9 +428,106 @@ class TestStoreReviewerResult:
         await store.store_reviewer_result("swarm-abc12345", "security", sample_result)
 
         # Verify TTL is set
-        expire_calls = mock_redis.expire.call_args_list
+        expire_calls = mock_pipeline.expire.call_args_list
         keys_with_ttl = [call[0][0] for call in expire_calls]
         assert "test_swarm:results:swarm-abc12345" in keys_with_ttl
+        assert "test_swarm:progress:swarm-abc12345" in keys_with_ttl
+        assert "test_swarm:events:swarm-abc12345" in keys_with_ttl
+
+
+class TestSessionEvents:
+    """Tests for publishing and reading session events."""
+
+    @pytest.mark.asyncio
+    async def test_publish_status_adds_status_event(
+        self,
+        mock_redis: AsyncMock,
+        mock_pipeline: AsyncMock,
+        config: SwarmConfig,
+    ) -> None:
+        """Test that publish_status appends a status event with a TTL."""
+        store = SwarmRedisStore(mock_redis, config)
+
+        await store.publish_status("swarm-abc12345", SwarmStatus.AGGREGATING)
+
+        key, fields = mock_pipeline.xadd.call_args[0]
+        assert key == "test_swarm:events:swarm-abc12345"
+        assert fields == {"event": "status", "status": "aggregating"}
+        mock_pipeline.expire.assert_called_once_with(
+            "test_swarm:events:swarm-abc12345", 3600
+        )
+        mock_pipeline.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_read_events_flattens_xread_response(
+        self, mock_redis: AsyncMock, config: SwarmConfig
+    ) -> None:
+        """Test that read_events returns (id, fields) pairs after last_id."""
+        mock_redis.xread = AsyncMock(
+            return_value=[
+                (
+                    "test_swarm:events:swarm-abc12345",
+                    [_reviewer_event("1-0", "security"), _reviewer_event("2-0", "style")],
+                )
+            ]
+        )
+        store = SwarmRedisStore(mock_redis, config)
+
+        events = await store.read_events("swarm-abc12345", "0-5", block_ms=100)
+
+        assert [event_id for event_id, _ in events] == ["1-0", "2-0"]
+        mock_redis.xread.assert_awaited_once_with(
+            {"test_swarm:events:swarm-abc12345": "0-5"}, block=100
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_events_defaults_block_to_config(
+        self, mock_redis: AsyncMock, config: SwarmConfig
+    ) -> None:
+        """Test that read_events blocks for config.event_block_ms by default."""
+        mock_redis.xread = AsyncMock(return_value=[])
+        store = SwarmRedisStore(mock_redis, config)
+
+        assert await store.read_events("swarm-abc12345") == []
+        assert mock_redis.xread.call_args[1]["block"] == config.event_block_ms
+
+    @pytest.mark.asyncio
+    async def test_iter_events_stops_after_terminal_status(
+        self, mock_redis: AsyncMock, config: SwarmConfig
+    ) -> None:
+        """Test that iter_events ends once the session completes."""
+        mock_redis.xread = AsyncMock(
+            side_effect=_blocking_xread(
+                [
+                    [_reviewer_event("1-0", "security")],
+                    [("2-0", {"event": "status", "status": "complete"})],
+                    [_reviewer_event("3-0", "late")],
+                ]
+            )
+        )
+        store = SwarmRedisStore(mock_redis, config)
+
+        events = [event async for event in store.iter_events("swarm-abc12345")]
+
+        assert [event_id for event_id, _ in events] == ["1-0", "2-0"]
+        # The second read resumes after the first event
+        assert mock_redis.xread.call_args_list[1][0][0] == {
+            "test_swarm:events:swarm-abc12345": "1-0"
+        }
+
+    @pytest.mark.asyncio
+    async def test_iter_events_stops_on_timeout(
+        self, mock_redis: AsyncMock, config: SwarmConfig
+    ) -> None:
+        """Test that iter_events ends when nothing arrives before the timeout."""
+        store = SwarmRedisStore(mock_redis, config)
+
+        events = [
+            event
+            async for event in store.iter_events("swarm-abc12345", timeout_seconds=0.05)
+        ]
+
+        assert events == []
 
 
 class TestGetReviewerResult:
@@ -518,6 +695,7 @@ class TestWaitForCompletion:
         )
 
         assert result is True
+        mock_redis.xread.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_wait_for_completion_returns_false_on_timeout(
@@ -537,95 +715,108 @@ class TestWaitForCompletion:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_wait_for_completion_polls_until_complete(
+    async def test_wait_for_completion_wakes_on_events(
         self, mock_redis: AsyncMock, config: SwarmConfig
     ) -> None:
-        """Test that wait_for_completion polls progress set."""
-        # Simulate gradual completion
-        call_count = [0]
-
-        async def mock_smembers(key: str) -> set:
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return {"security"}
-            elif call_count[0] == 2:
-                return {"security", "performance"}
-            else:
-                return {"security", "performance", "style"}
-
-        mock_redis.smembers = mock_smembers
+        """Test that completions arrive through the event stream, not polling."""
+        mock_redis.smembers.return_value = {"security"}
+        mock_redis.xread = AsyncMock(
+            side_effect=_blocking_xread(
+                [
+                    [_reviewer_event("1-0", "security"), _reviewer_event("2-0", "performance")],
+                    [_reviewer_event("3-0", "style")],
+                ]
+            )
+        )
         store = SwarmRedisStore(mock_redis, config)
 
         result = await store.wait_for_completion(
             "swarm-abc12345",
             ["security", "performance", "style"],
             timeout_seconds=10,
-            poll_interval=0.01,  # Fast polling for test
         )
 
         assert result is True
-        assert call_count[0] >= 3  # Should have polled at least 3 times
+        assert mock_redis.smembers.await_count == 1
+        assert mock_redis.xread.await_count == 2
 
     @pytest.mark.asyncio
-    async def test_wait_for_completion_uses_asyncio_sleep(
+    async def test_wait_for_completion_reads_stream_from_start(
         self, mock_redis: AsyncMock, config: SwarmConfig
     ) -> None:
-        """Test that wait_for_completion uses asyncio.sleep for non-blocking wait."""
-        mock_redis.smembers.return_value = set()
+        """Test that events published before the wait began are not missed."""
+        mock_redis.xread = AsyncMock(
+            side_effect=_blocking_xread([[_reviewer_event("1-0", "security")]])
+        )
         store = SwarmRedisStore(mock_redis, config)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            # Short timeout to avoid long test
-            await store.wait_for_completion(
-                "swarm-abc12345",
-                ["security"],
-                timeout_seconds=0.05,
-                poll_interval=0.01,
+        assert await store.wait_for_completion("swarm-abc12345", ["security"], 10)
+        assert mock_redis.xread.call_args_list[0][0][0] == {
+            "test_swarm:events:swarm-abc12345": "0-0"
+        }
+
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_ignores_status_events(
+        self, mock_redis: AsyncMock, config: SwarmConfig
+    ) -> None:
+        """Test that only reviewer_complete events count towards completion."""
+        mock_redis.xread = AsyncMock(
+            side_effect=_blocking_xread(
+                [
+                    [("1-0", {"event": "status", "status": "in_progress"})],
+                    [_reviewer_event("2-0", "security")],
+                ]
             )
+        )
+        store = SwarmRedisStore(mock_redis, config)
 
-            # Should have called asyncio.sleep at least once
-            assert mock_sleep.called
+        assert await store.wait_for_completion("swarm-abc12345", ["security"], 10)
+        # The second read resumes after the status event
+        assert mock_redis.xread.call_args_list[1][0][0] == {
+            "test_swarm:events:swarm-abc12345": "1-0"
+        }
 
     @pytest.mark.asyncio
-    async def test_wait_for_completion_respects_poll_interval(
+    async def test_wait_for_completion_rechecks_progress_when_idle(
         self, mock_redis: AsyncMock, config: SwarmConfig
     ) -> None:
-        """Test that wait_for_completion respects the poll interval."""
-        call_count = [0]
+        """Test that an idle blocking read falls back to the progress set."""
+        mock_redis.smembers = AsyncMock(side_effect=[set(), {"security"}])
+        store = SwarmRedisStore(mock_redis, config)
 
-        async def mock_smembers(key: str) -> set:
-            call_count[0] += 1
-            return set()  # Never complete
+        result = await store.wait_for_completion(
+            "swarm-abc12345", ["security"], timeout_seconds=10, block_ms=10
+        )
+
+        assert result is True
+        assert mock_redis.smembers.await_count == 2
 
-        mock_redis.smembers = mock_smembers
+    @pytest.mark.asyncio
+    async def test_wait_for_completion_caps_block_at_remaining_time(
+        self, mock_redis: AsyncMock, config: SwarmConfig
+    ) -> None:
+        """Test that no blocking read outlasts the timeout or block_ms."""
         store = SwarmRedisStore(mock_redis, config)
 
         await store.wait_for_completion(
-            "swarm-abc12345",
-            ["security"],
-            timeout_seconds=0.1,
-            poll_interval=0.03,
+            "swarm-abc12345", ["security"], timeout_seconds=0.05, block_ms=30
         )
 
-        # With 0.1s timeout and 0.03s interval, should poll roughly 3-4 times
-        assert call_count[0] >= 2
-        assert call_count[0] <= 5
+        blocks = [call[1]["block"] for call in mock_redis.xread.call_args_list]
+        assert blocks
+        assert all(1 <= block <= 30 for block in blocks)
 
     @pytest.mark.asyncio
-    async def test_wait_for_completion_default_poll_interval(
-        self, mock_redis: AsyncMock, config: SwarmConfig
+    async def test_wait_for_completion_default_block_from_config(
+        self, mock_redis: AsyncMock
     ) -> None:
-        """Test that wait_for_completion uses default 1s poll interval."""
-        mock_redis.smembers.return_value = {"security", "performance", "style"}
+        """Test that the blocking read defaults to config.event_block_ms."""
+        config = SwarmConfig(key_prefix="test_swarm", event_block_ms=20)
         store = SwarmRedisStore(mock_redis, config)
 
-        # Should complete immediately since all are already done
-        result = await store.wait_for_completion(
-            "swarm-abc12345",
-            ["security", "performance", "style"],
-        )
+        await store.wait_for_completion("swarm-abc12345", ["security"], timeout_seconds=1)
 
-        assert result is True
+        assert mock_redis.xread.call_args_list[0][1]["block"] == 20
 
 
 class TestKeyPatterns:
@@ -660,3 +851,13 @@ class TestKeyPatterns:
         key = store._progress_key("swarm-abc123")
 
         assert key == "test_swarm:progress:swarm-abc123"
+
+    def test_events_key_pattern(
+        self, mock_redis: AsyncMock, config: SwarmConfig
+    ) -> None:
+        """Test that events key follows {prefix}:events:{id} pattern."""
+        store = SwarmRedisStore(mock_redis, config)
+
+        key = store._events_key("swarm-abc123")
+
+        assert key == "test_swarm:events:swarm-abc123"
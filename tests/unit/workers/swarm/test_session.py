@@ -38,7 +38,13 @@ def mock_redis() -> AsyncMock:
     mock.expire = AsyncMock(return_value=True)
     mock.sadd = AsyncMock(return_value=1)
     mock.smembers = AsyncMock(return_value=set())
-    mock.pipeline = MagicMock()
+    pipeline = AsyncMock()
+    pipeline.__aenter__ = AsyncMock(return_value=pipeline)
+    pipeline.__aexit__ = AsyncMock(return_value=None)
+    for command in ("hset", "sadd", "xadd", "expire"):
+        setattr(pipeline, command, MagicMock())
+    pipeline.execute = AsyncMock(return_value=[])
+    mock.pipeline = MagicMock(return_value=pipeline)
     return mock
 
 
@@ -305,6 +311,24 @@ class TestUpdateStatus:
             "failed",
         )
 
+    @pytest.mark.asyncio
+    async def test_update_status_publishes_status_event(
+        self,
+        session_manager: SwarmSessionManager,
+        mock_redis: AsyncMock,
+    ) -> None:
+        """Test that status changes are published to the session event stream."""
+        await session_manager.update_status(
+            "swarm-abc12345",
+            SwarmStatus.AGGREGATING,
+        )
+
+        pipeline = mock_redis.pipeline.return_value
+        pipeline.xadd.assert_called_once()
+        key, fields = pipeline.xadd.call_args[0]
+        assert key == "test_swarm:events:swarm-abc12345"
+        assert fields == {"event": "status", "status": "aggregating"}
+
     @pytest.mark.asyncio
     async def test_update_status_to_aggregating(
         self,
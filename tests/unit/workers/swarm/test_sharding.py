@@ -0,0 +1,79 @@
+"""Unit tests for token-budgeted review sharding."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.workers.swarm.executor import CodeContext, CodeFile
+from src.workers.swarm.sharding import estimate_tokens, plan_shards
+
+
+def _file(path: str, tokens: int) -> CodeFile:
+    """Build a file of roughly *tokens* estimated tokens (one per line)."""
+    content = "abc\n" * tokens
+    return CodeFile(path=path, content=content, lines=tokens)
+
+
+def _context(*files: CodeFile) -> CodeContext:
+    """Wrap files in a CodeContext."""
+    return CodeContext(files=list(files), total_lines=sum(f.lines for f in files))
+
+
+class TestEstimateTokens:
+    """Tests for the token estimator."""
+
+    def test_rounds_up(self) -> None:
+        """Partial tokens count as a whole token."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("a") == 1
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+
+class TestPlanShards:
+    """Tests for plan_shards."""
+
+    def test_small_target_is_one_shard(self) -> None:
+        """Everything within budget stays in a single shard."""
+        shards = plan_shards(_context(_file("a.py", 10), _file("b.py", 10)), 100)
+
+        assert len(shards) == 1
+        assert shards[0].paths == ["a.py", "b.py"]
+        assert shards[0].estimated_tokens == 20
+
+    def test_shards_respect_budget_and_keep_every_file(self) -> None:
+        """No shard exceeds the budget and no file is dropped."""
+        files = [_file(f"pkg/m{i}.py", 30) for i in range(10)]
+
+        shards = plan_shards(_context(*files), 100)
+
+        assert all(s.estimated_tokens <= 100 for s in shards)
+        assert [p for s in shards for p in s.paths] == [f.path for f in files]
+        assert [s.index for s in shards] == list(range(len(shards)))
+
+    def test_directory_boundary_closes_half_full_shard(self) -> None:
+        """Files from a new directory start a new shard once half full."""
+        shards = plan_shards(
+            _context(_file("a/x.py", 60), _file("b/y.py", 10), _file("b/z.py", 10)),
+            100,
+        )
+
+        assert [s.paths for s in shards] == [["a/x.py"], ["b/y.py", "b/z.py"]]
+
+    def test_oversized_file_is_split_into_line_ranges(self) -> None:
+        """A file larger than the budget is split, not dropped."""
+        big = _file("big.py", 250)
+
+        shards = plan_shards(_context(_file("a.py", 5), big), 100)
+
+        pieces = [f for s in shards for f in s.files if f.path == "big.py"]
+        assert len(pieces) == 3
+        assert all(p.partial for p in pieces)
+        assert [p.start_line for p in pieces] == [1, 101, 201]
+        assert "".join(p.content for p in pieces) == big.content
+        assert sum(p.lines for p in pieces) == big.lines
+
+    def test_rejects_non_positive_budget(self) -> None:
+        """A zero budget is a programming error."""
+        with pytest.raises(ValueError):
+            plan_shards(_context(_file("a.py", 1)), 0)
@@ -0,0 +1,162 @@
+"""Unit tests for CodeSnapshotCache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.workers.swarm.config import SwarmConfig
+from src.workers.swarm.executor import CodeContext, CodeExtractor, CodeFile
+from src.workers.swarm.snapshot import CodeSnapshotCache
+
+
+def _context(name: str = "a.py") -> CodeContext:
+    """Build a one-file CodeContext."""
+    return CodeContext(
+        files=[CodeFile(path=name, content="x = 1\n", lines=1)], total_lines=1
+    )
+
+
+def _slow_extractor(context: CodeContext | None = None) -> MagicMock:
+    """Create an extractor whose extract() yields to the loop before returning."""
+    extractor = MagicMock(spec=CodeExtractor)
+
+    async def extract(target_path: str) -> CodeContext:
+        await asyncio.sleep(0.01)
+        return context or _context()
+
+    extractor.extract = AsyncMock(side_effect=extract)
+    return extractor
+
+
+class TestCodeSnapshotCache:
+    """Tests for in-memory snapshot sharing."""
+
+    async def test_concurrent_gets_share_one_extraction(self) -> None:
+        """Concurrent requests for a snapshot wait on one extraction."""
+        extractor = _slow_extractor()
+        cache = CodeSnapshotCache(extractor)
+
+        contexts = await asyncio.gather(
+            *(cache.get("swarm-1", "src/") for _ in range(5))
+        )
+
+        extractor.extract.assert_awaited_once_with("src/")
+        assert all(c is contexts[0] for c in contexts)
+        assert cache.get_stats()["hits"] == 4
+
+    async def test_sessions_are_isolated(self) -> None:
+        """Different sessions extract independently."""
+        extractor = _slow_extractor()
+        cache = CodeSnapshotCache(extractor)
+
+        await cache.get("swarm-1", "src/")
+        await cache.get("swarm-2", "src/")
+
+        assert extractor.extract.await_count == 2
+
+    async def test_failed_extraction_is_not_cached(self) -> None:
+        """An extraction error propagates and the next get retries."""
+        extractor = MagicMock(spec=CodeExtractor)
+        extractor.extract = AsyncMock(side_effect=[RuntimeError("boom"), _context()])
+        cache = CodeSnapshotCache(extractor)
+
+        with pytest.raises(RuntimeError):
+            await cache.get("swarm-1", "src/")
+        context = await cache.get("swarm-1", "src/")
+
+        assert context.files[0].path == "a.py"
+        assert extractor.extract.await_count == 2
+
+    async def test_expired_snapshot_is_extracted_again(self) -> None:
+        """Snapshots older than the TTL are discarded."""
+        extractor = _slow_extractor()
+        cache = CodeSnapshotCache(extractor, ttl_seconds=1)
+
+        await cache.get("swarm-1", "src/")
+        key = ("swarm-1", "src/")
+        created, future = cache._entries[key]
+        cache._entries[key] = (created - 5, future)
+        await cache.get("swarm-1", "src/")
+
+        assert extractor.extract.await_count == 2
+
+    async def test_release_drops_session(self) -> None:
+        """release() removes a session's snapshots from memory."""
+        cache = CodeSnapshotCache(_slow_extractor())
+        await cache.get("swarm-1", "src/")
+        await cache.get("swarm-2", "src/")
+
+        cache.release("swarm-1")
+
+        assert cache.get_stats()["entries"] == 1
+
+    async def test_max_entries_bounds_memory(self) -> None:
+        """Least recently used snapshots are evicted."""
+        cache = CodeSnapshotCache(_slow_extractor(), max_entries=2)
+
+        for i in range(4):
+            await cache.get(f"swarm-{i}", "src/")
+
+        assert cache.get_stats()["entries"] == 2
+
+
+class TestCodeSnapshotCacheRedis:
+    """Tests for the shared Redis tier."""
+
+    async def test_stores_snapshot_in_redis_with_ttl(self) -> None:
+        """Extracted snapshots are written to Redis with the session TTL."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        cache = CodeSnapshotCache(
+            _slow_extractor(), redis_client, key_prefix="sw", ttl_seconds=120
+        )
+
+        await cache.get("swarm-1", "src/")
+
+        key, payload = redis_client.set.await_args.args
+        assert key.startswith("sw:snapshot:swarm-1:")
+        assert redis_client.set.await_args.kwargs["ex"] == 120
+        assert CodeContext.from_dict(json.loads(payload)) == _context()
+
+    async def test_redis_hit_skips_extraction(self) -> None:
+        """A snapshot stored by another worker is reused."""
+        redis_client = AsyncMock()
+        redis_client.get.return_value = json.dumps(_context("remote.py").to_dict())
+        extractor = _slow_extractor()
+        cache = CodeSnapshotCache(extractor, redis_client)
+
+        context = await cache.get("swarm-1", "src/")
+
+        assert context.files[0].path == "remote.py"
+        extractor.extract.assert_not_awaited()
+        assert cache.get_stats()["remote_hits"] == 1
+
+    async def test_redis_errors_fall_back_to_extraction(self) -> None:
+        """Redis failures do not fail the review."""
+        redis_client = AsyncMock()
+        redis_client.get.side_effect = ConnectionError("down")
+        redis_client.set.side_effect = ConnectionError("down")
+        extractor = _slow_extractor()
+        cache = CodeSnapshotCache(extractor, redis_client)
+
+        context = await cache.get("swarm-1", "src/")
+
+        assert context == _context()
+        extractor.extract.assert_awaited_once()
+
+    def test_from_config(self) -> None:
+        """from_config applies the snapshot settings."""
+        config = SwarmConfig(
+            key_prefix="x", snapshot_ttl_seconds=60, snapshot_fetch_concurrency=3
+        )
+
+        cache = CodeSnapshotCache.from_config(config, workspace_root="/ws")
+
+        assert cache._ttl_seconds == 60
+        assert cache._key_prefix == "x"
+        assert cache.extractor._max_concurrency == 3
+        assert cache.extractor._workspace_root == "/ws"
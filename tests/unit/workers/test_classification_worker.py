@@ -22,9 +22,27 @@ from src.workers.classification_worker import (
     ClassificationJobStatus,
     REDIS_QUEUE_KEY,
     REDIS_JOB_KEY_PREFIX,
+    REDIS_JOB_TTL_SECONDS,
+    REDIS_LEGACY_JOB_KEY_PREFIX,
 )
 
 
+def _mock_redis() -> AsyncMock:
+    """Create a mocked Redis client whose pipelines record commands."""
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    pipe.execute = AsyncMock(return_value=[1, 1, [b"3", b"1", b"0"]])
+    mock_redis = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    return mock_redis
+
+
+def _pipe(mock_redis: AsyncMock) -> MagicMock:
+    """Get the pipeline of a mocked Redis client."""
+    return mock_redis.pipeline.return_value
+
+
 class TestClassificationWorkerInit:
     """Tests for ClassificationWorker initialization."""
 
@@ -60,7 +78,7 @@ class TestEnqueue:
     @pytest.fixture
     def worker(self) -> ClassificationWorker:
         """Create a worker instance with mocked dependencies."""
-        mock_redis = AsyncMock()
+        mock_redis = _mock_redis()
         mock_service = AsyncMock()
         return ClassificationWorker(
             redis_client=mock_redis,
@@ -75,9 +93,11 @@ class TestEnqueue:
         assert job_id is not None
         assert job_id.startswith("job-")
 
-        # Verify Redis was called
-        worker._redis_client.lpush.assert_called_once()
-        worker._redis_client.set.assert_called_once()
+        # Verify metadata and queue entry were written in one pipeline
+        pipe = _pipe(worker._redis_client)
+        pipe.lpush.assert_called_once()
+        pipe.hset.assert_called_once()
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_enqueue_with_force_flag(self, worker: ClassificationWorker) -> None:
@@ -85,7 +105,7 @@ class TestEnqueue:
         job_id = await worker.enqueue("idea-123", force=True)
 
         # Verify the job data includes force flag
-        call_args = worker._redis_client.lpush.call_args
+        call_args = _pipe(worker._redis_client).lpush.call_args
         job_data = json.loads(call_args[0][1])
 
         assert job_data["force"] is True
@@ -107,7 +127,7 @@ class TestEnqueueBatch:
     @pytest.fixture
     def worker(self) -> ClassificationWorker:
         """Create a worker instance with mocked dependencies."""
-        mock_redis = AsyncMock()
+        mock_redis = _mock_redis()
         mock_service = AsyncMock()
         return ClassificationWorker(
             redis_client=mock_redis,
@@ -134,15 +154,29 @@ class TestEnqueueBatch:
         job_id = await worker.enqueue_batch(idea_ids)
 
         # Verify job metadata was stored
-        worker._redis_client.set.assert_called()
-        call_args = worker._redis_client.set.call_args
+        pipe = _pipe(worker._redis_client)
+        call_args = pipe.hset.call_args
         key = call_args[0][0]
-        job_data = json.loads(call_args[0][1])
+        job_data = call_args.kwargs["mapping"]
 
-        assert REDIS_JOB_KEY_PREFIX in key
+        assert key == f"{REDIS_JOB_KEY_PREFIX}{job_id}"
         assert job_data["total"] == 3
         assert job_data["completed"] == 0
         assert job_data["status"] == ClassificationJobStatus.PENDING.value
+        pipe.expire.assert_called_once_with(key, REDIS_JOB_TTL_SECONDS)
+
+    @pytest.mark.asyncio
+    async def test_enqueue_batch_pushes_all_ideas_at_once(
+        self, worker: ClassificationWorker
+    ) -> None:
+        """All ideas of a batch are queued with a single LPUSH."""
+        await worker.enqueue_batch(["idea-1", "idea-2", "idea-3"])
+
+        pipe = _pipe(worker._redis_client)
+        pipe.lpush.assert_called_once()
+        queued = [json.loads(job) for job in pipe.lpush.call_args.args[1:]]
+        assert [job["idea_id"] for job in queued] == ["idea-1", "idea-2", "idea-3"]
+        worker._redis_client.lpush.assert_not_called()
 
 
 class TestGetJobStatus:
@@ -151,7 +185,7 @@ class TestGetJobStatus:
     @pytest.fixture
     def worker(self) -> ClassificationWorker:
         """Create a worker instance with mocked dependencies."""
-        mock_redis = AsyncMock()
+        mock_redis = _mock_redis()
         mock_service = AsyncMock()
         return ClassificationWorker(
             redis_client=mock_redis,
@@ -162,14 +196,19 @@ class TestGetJobStatus:
     async def test_get_job_status_found(self, worker: ClassificationWorker) -> None:
         """Test getting status of an existing job."""
         job_data = {
-            "job_id": "job-123",
-            "status": "processing",
-            "total": 5,
-            "completed": 2,
-            "failed": 0,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            b"job_id": b"job-123",
+            b"status": b"processing",
+            b"total": b"5",
+            b"completed": b"2",
+            b"failed": b"1",
+            b"idea_ids": b'["idea-1"]',
+            b"created_at": datetime.now(timezone.utc).isoformat().encode(),
         }
-        worker._redis_client.get.return_value = json.dumps(job_data)
+        _pipe(worker._redis_client).execute.return_value = [
+            job_data,
+            [b'{"idea_id": "idea-1", "classification": "functional"}'],
+            [b'{"idea_id": "idea-2", "error": "boom"}'],
+        ]
 
         status = await worker.get_job_status("job-123")
 
@@ -178,18 +217,38 @@ class TestGetJobStatus:
         assert status["status"] == "processing"
         assert status["total"] == 5
         assert status["completed"] == 2
+        assert status["failed"] == 1
+        assert status["results"][0]["idea_id"] == "idea-1"
+        assert status["errors"][0]["error"] == "boom"
 
     @pytest.mark.asyncio
     async def test_get_job_status_not_found(
         self, worker: ClassificationWorker
     ) -> None:
         """Test getting status of non-existent job."""
+        _pipe(worker._redis_client).execute.return_value = [{}, [], []]
         worker._redis_client.get.return_value = None
 
         status = await worker.get_job_status("nonexistent")
 
         assert status is None
 
+    @pytest.mark.asyncio
+    async def test_get_job_status_reads_legacy_json_jobs(
+        self, worker: ClassificationWorker
+    ) -> None:
+        """Jobs stored as JSON strings before job hashes are still found."""
+        legacy = {"job_id": "job-old", "status": "completed", "total": 1}
+        _pipe(worker._redis_client).execute.return_value = [{}, [], []]
+        worker._redis_client.get.return_value = json.dumps(legacy).encode()
+
+        status = await worker.get_job_status("job-old")
+
+        assert status == legacy
+        worker._redis_client.get.assert_awaited_once_with(
+            f"{REDIS_LEGACY_JOB_KEY_PREFIX}job-old"
+        )
+
 
 class TestProcessQueue:
     """Tests for process_queue method."""
@@ -197,7 +256,7 @@ class TestProcessQueue:
     @pytest.fixture
     def worker(self) -> ClassificationWorker:
         """Create a worker instance with mocked dependencies."""
-        mock_redis = AsyncMock()
+        mock_redis = _mock_redis()
         mock_service = AsyncMock()
         return ClassificationWorker(
             redis_client=mock_redis,
@@ -269,8 +328,10 @@ class TestProcessQueue:
         except asyncio.CancelledError:
             pass
 
-        # Verify job was marked as failed (set called to update status)
-        assert worker._redis_client.set.called
+        # Verify the failure was counted on the job
+        _pipe(worker._redis_client).hincrby.assert_called_with(
+            f"{REDIS_JOB_KEY_PREFIX}job-123", "failed", 1
+        )
 
 
 class TestRetryLogic:
@@ -279,7 +340,7 @@ class TestRetryLogic:
     @pytest.fixture
     def worker(self) -> ClassificationWorker:
         """Create a worker instance with mocked dependencies."""
-        mock_redis = AsyncMock()
+        mock_redis = _mock_redis()
         mock_service = AsyncMock()
         return ClassificationWorker(
             redis_client=mock_redis,
@@ -327,7 +388,7 @@ class TestGracefulShutdown:
     @pytest.fixture
     def worker(self) -> ClassificationWorker:
         """Create a worker instance with mocked dependencies."""
-        mock_redis = AsyncMock()
+        mock_redis = _mock_redis()
         mock_service = AsyncMock()
         return ClassificationWorker(
             redis_client=mock_redis,
@@ -365,7 +426,7 @@ class TestBatchProcessing:
     @pytest.fixture
     def worker(self) -> ClassificationWorker:
         """Create a worker instance with mocked dependencies."""
-        mock_redis = AsyncMock()
+        mock_redis = _mock_redis()
         mock_service = AsyncMock()
         return ClassificationWorker(
             redis_client=mock_redis,
@@ -382,5 +443,279 @@ class TestBatchProcessing:
         job_id = await worker.enqueue_batch(idea_ids)
 
         # Get the stored job data
-        set_calls = worker._redis_client.set.call_args_list
-        assert len(set_calls) > 0
+        hset_calls = _pipe(worker._redis_client).hset.call_args_list
+        assert len(hset_calls) > 0
+
+    @pytest.mark.asyncio
+    async def test_outcomes_are_counted_atomically(
+        self, worker: ClassificationWorker
+    ) -> None:
+        """Each outcome is an HINCRBY in a transaction, not a rewrite."""
+        result = ClassificationResult(
+            idea_id="idea-1",
+            classification=ClassificationType.FUNCTIONAL,
+            confidence=0.9,
+            labels=[],
+        )
+
+        await worker._mark_job_success("job-1", "idea-1", result)
+
+        key = f"{REDIS_JOB_KEY_PREFIX}job-1"
+        worker._redis_client.pipeline.assert_called_with(transaction=True)
+        pipe = _pipe(worker._redis_client)
+        pipe.hincrby.assert_called_once_with(key, "completed", 1)
+        entry = json.loads(pipe.rpush.call_args.args[1])
+        assert entry["idea_id"] == "idea-1"
+        worker._redis_client.set.assert_not_called()
+        # 1 of 3 done: the job is still running
+        worker._redis_client.hset.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("counts", "status"),
+        [
+            ([b"2", b"1", b"1"], ClassificationJobStatus.COMPLETED),
+            ([b"2", b"0", b"2"], ClassificationJobStatus.FAILED),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_last_outcome_sets_final_status(
+        self,
+        worker: ClassificationWorker,
+        counts: list[bytes],
+        status: ClassificationJobStatus,
+    ) -> None:
+        """The outcome that completes the job sets its final status."""
+        _pipe(worker._redis_client).execute.return_value = [1, 1, counts]
+
+        await worker._mark_job_failed("job-1", "idea-2", "boom")
+
+        worker._redis_client.hset.assert_called_once_with(
+            f"{REDIS_JOB_KEY_PREFIX}job-1", "status", status.value
+        )
+
+
+class TestLLMBatchMode:
+    """Tests for classifying batch jobs in offline LLM batches."""
+
+    @pytest.fixture
+    def batch_manager(self) -> MagicMock:
+        """Create a mocked LLM batch manager."""
+        from src.infrastructure.llm.batch import BatchConfig
+
+        manager = MagicMock()
+        manager.config = BatchConfig(enabled=True, min_items=2)
+        manager.submit = AsyncMock(return_value=["batch-1"])
+        return manager
+
+    @pytest.fixture
+    def worker(self, batch_manager: MagicMock) -> ClassificationWorker:
+        """Create a worker instance with an LLM batch manager."""
+        from src.infrastructure.llm.batch import BatchRequest
+
+        mock_redis = _mock_redis()
+        mock_service = AsyncMock()
+        mock_service.prepare_batch_request.side_effect = (
+            lambda idea_id, force, metadata: BatchRequest(
+                custom_id=idea_id, prompt="p", metadata={**metadata, "idea_id": idea_id}
+            )
+        )
+        return ClassificationWorker(
+            redis_client=mock_redis,
+            classification_service=mock_service,
+            batch_manager=batch_manager,
+        )
+
+    async def _enqueue_and_process(
+        self, worker: ClassificationWorker, idea_ids: list[str]
+    ) -> str:
+        """Enqueue a job, then process the single queue entry it records."""
+        job_id = await worker.enqueue_batch(idea_ids)
+        [queued] = _pipe(worker._redis_client).lpush.call_args.args[1:]
+        _pipe(worker._redis_client).lpush.reset_mock()
+        await worker._process_jobs([json.loads(queued)])
+        return job_id
+
+    @pytest.mark.asyncio
+    async def test_enqueue_only_records_large_jobs(
+        self, worker: ClassificationWorker, batch_manager: MagicMock
+    ) -> None:
+        """A large job is queued as one entry without preparing any idea."""
+        await worker.enqueue_batch(["idea-1", "idea-2", "idea-3"])
+
+        [queued] = _pipe(worker._redis_client).lpush.call_args.args[1:]
+        job = json.loads(queued)
+        assert job["llm_batch"] is True
+        assert job["idea_ids"] == ["idea-1", "idea-2", "idea-3"]
+        worker._classification_service.prepare_batch_request.assert_not_called()
+        batch_manager.submit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_jobs_are_submitted_as_llm_batch(
+        self, worker: ClassificationWorker, batch_manager: MagicMock
+    ) -> None:
+        """The worker sends the ideas of a large job to the batch manager."""
+        job_id = await self._enqueue_and_process(worker, ["idea-1", "idea-2", "idea-3"])
+
+        requests = batch_manager.submit.call_args.args[0]
+        assert [r.custom_id for r in requests] == ["idea-1", "idea-2", "idea-3"]
+        assert requests[0].metadata["job_id"] == job_id
+        _pipe(worker._redis_client).lpush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ideas_are_prepared_concurrently(
+        self, worker: ClassificationWorker
+    ) -> None:
+        """Preparing the ideas of a job overlaps."""
+        from src.infrastructure.llm.batch import BatchRequest
+
+        active = 0
+        peak = 0
+
+        async def prepare(idea_id: str, force: bool, metadata: dict) -> BatchRequest:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return BatchRequest(custom_id=idea_id, prompt="p", metadata=metadata)
+
+        worker._classification_service.prepare_batch_request.side_effect = prepare
+
+        await self._enqueue_and_process(worker, ["idea-1", "idea-2", "idea-3"])
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_small_jobs_use_the_queue(
+        self, worker: ClassificationWorker, batch_manager: MagicMock
+    ) -> None:
+        """Jobs below the minimum size are classified from the queue."""
+        await worker.enqueue_batch(["idea-1"])
+
+        batch_manager.submit.assert_not_called()
+        [queued] = _pipe(worker._redis_client).lpush.call_args.args[1:]
+        assert json.loads(queued)["idea_id"] == "idea-1"
+
+    @pytest.mark.asyncio
+    async def test_submit_failure_falls_back_to_queue(
+        self, worker: ClassificationWorker, batch_manager: MagicMock
+    ) -> None:
+        """Ideas are queued when the LLM batch cannot be submitted."""
+        batch_manager.submit.side_effect = ConnectionError("provider down")
+
+        await self._enqueue_and_process(worker, ["idea-1", "idea-2"])
+
+        queued = _pipe(worker._redis_client).lpush.call_args.args[1:]
+        assert [json.loads(job)["idea_id"] for job in queued] == ["idea-1", "idea-2"]
+
+    @pytest.mark.asyncio
+    async def test_batch_results_update_job(self, worker: ClassificationWorker) -> None:
+        """Each batch result is stored and counted on its job."""
+        from src.infrastructure.llm.batch import BatchItemResult
+
+        worker._classification_service.complete_batch_result.return_value = (
+            ClassificationResult(
+                idea_id="idea-1",
+                classification=ClassificationType.FUNCTIONAL,
+                confidence=0.9,
+                labels=[],
+            )
+        )
+
+        await worker._handle_batch_result(
+            BatchItemResult(
+                custom_id="idea-1", metadata={"job_id": "job-1", "idea_id": "idea-1"}
+            )
+        )
+
+        pipe = _pipe(worker._redis_client)
+        pipe.hincrby.assert_called_once_with(f"{REDIS_JOB_KEY_PREFIX}job-1", "completed", 1)
+        assert json.loads(pipe.rpush.call_args.args[1])["idea_id"] == "idea-1"
+
+
+class TestConcurrentProcessing:
+    """Tests for processing several jobs at once."""
+
+    def _jobs(self, count: int) -> list[str]:
+        return [
+            json.dumps({
+                "job_id": f"job-{i}",
+                "idea_id": f"idea-{i}",
+                "force": False,
+                "retry_count": 0,
+            })
+            for i in range(count)
+        ]
+
+    def _result(self, idea_id: str) -> ClassificationResult:
+        return ClassificationResult(
+            idea_id=idea_id,
+            classification=ClassificationType.FUNCTIONAL,
+            confidence=0.9,
+            labels=[],
+        )
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_up_to_concurrency(self) -> None:
+        """Jobs overlap, but no more than the concurrency limit at once."""
+        queue = self._jobs(5)
+        active = 0
+        peak = 0
+
+        async def brpop(key: str, timeout: int) -> tuple[str, str] | None:
+            if not queue:
+                worker._running = False
+                return None
+            return (key, queue.pop(0))
+
+        async def classify_idea(idea_id: str, force: bool) -> ClassificationResult:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return self._result(idea_id)
+
+        mock_redis = _mock_redis()
+        mock_redis.brpop.side_effect = brpop
+        mock_service = AsyncMock()
+        mock_service.classify_idea.side_effect = classify_idea
+        worker = ClassificationWorker(mock_redis, mock_service, concurrency=2)
+        worker._running = True
+
+        await worker.process_queue()
+
+        assert mock_service.classify_idea.call_count == 5
+        assert peak == 2
+        assert not worker._in_flight
+
+    @pytest.mark.asyncio
+    async def test_micro_batch_classifies_jobs_together(self) -> None:
+        """Queued jobs are taken in groups and classified in one call."""
+        first, *rest = self._jobs(3)
+        mock_redis = _mock_redis()
+        mock_redis.brpop.side_effect = [
+            (REDIS_QUEUE_KEY, first),
+            asyncio.CancelledError(),
+        ]
+        mock_redis.rpop.return_value = rest
+        mock_service = AsyncMock()
+        # idea-2 is left out of the grouped result
+        mock_service.classify_ideas.return_value = {
+            "idea-0": self._result("idea-0"),
+            "idea-1": self._result("idea-1"),
+        }
+        mock_service.classify_idea.return_value = self._result("idea-2")
+        worker = ClassificationWorker(mock_redis, mock_service, micro_batch_size=3)
+        worker._running = True
+
+        with pytest.raises(asyncio.CancelledError):
+            await worker.process_queue()
+
+        mock_redis.rpop.assert_called_once_with(REDIS_QUEUE_KEY, 2)
+        mock_service.classify_ideas.assert_called_once_with(
+            ["idea-0", "idea-1", "idea-2"], force=False, group_size=3
+        )
+        mock_service.classify_idea.assert_called_once_with("idea-2", force=False)
+        counted = [c.args[0] for c in _pipe(mock_redis).hincrby.call_args_list]
+        assert counted == [f"{REDIS_JOB_KEY_PREFIX}job-{i}" for i in range(3)]
@@ -0,0 +1,135 @@
+"""Unit tests for Correlation Worker."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.orchestrator.services.correlation_service import CorrelationConfig
+from src.workers.correlation_worker import (
+    RECOMPUTE_CHECK_INTERVAL,
+    RECOMPUTE_RETRY_DELAY,
+    REDIS_QUEUE_KEY,
+    REDIS_RECOMPUTE_LOCK_KEY,
+    CorrelationWorker,
+)
+
+
+def _service() -> MagicMock:
+    """Create a mocked correlation service."""
+    service = MagicMock()
+    service.config = CorrelationConfig(batch_size=3, recompute_interval_seconds=3600)
+    service.correlate_ideas = AsyncMock()
+    service.recompute_all = AsyncMock(return_value=10)
+    return service
+
+
+def _worker(queue: list[bytes]) -> CorrelationWorker:
+    """Create a worker reading a fixed queue, stopping when it is empty."""
+
+    async def brpop(key: str, timeout: int) -> tuple[str, bytes] | None:
+        if not queue:
+            worker._running = False
+            return None
+        return (key, queue.pop(0))
+
+    async def rpop(key: str, count: int) -> list[bytes] | None:
+        taken = queue[:count]
+        del queue[:count]
+        return taken or None
+
+    redis_client = AsyncMock()
+    redis_client.brpop.side_effect = brpop
+    redis_client.rpop.side_effect = rpop
+    worker = CorrelationWorker(redis_client, _service())
+    worker._running = True
+    return worker
+
+
+class TestCorrelationWorker:
+    """Tests for CorrelationWorker."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_pushes_ids(self) -> None:
+        """Ideas are queued with one push."""
+        worker = CorrelationWorker(AsyncMock(), _service())
+
+        await worker.enqueue(["idea-1", "idea-2"])
+        await worker.enqueue([])
+
+        worker._redis_client.lpush.assert_awaited_once_with(REDIS_QUEUE_KEY, "idea-1", "idea-2")
+
+    @pytest.mark.asyncio
+    async def test_correlates_queue_in_batches(self) -> None:
+        """Queued ideas are correlated a batch at a time without repeats."""
+        worker = _worker([b"idea-1", b"idea-2", b"idea-1", b"idea-3"])
+
+        await worker.process_queue()
+
+        calls = [c.args[0] for c in worker._correlation_service.correlate_ideas.call_args_list]
+        assert calls == [["idea-1", "idea-2"], ["idea-3"]]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_does_not_stop_worker(self) -> None:
+        """A batch that fails is logged and the next one still runs."""
+        worker = _worker([b"idea-1", b"idea-2", b"idea-3", b"idea-4"])
+        worker._correlation_service.correlate_ideas.side_effect = [
+            RuntimeError("es down"),
+            None,
+        ]
+
+        await worker.process_queue()
+
+        assert worker._correlation_service.correlate_ideas.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_recompute_runs_once_per_interval(self) -> None:
+        """Only the worker taking the lock recomputes."""
+        worker = CorrelationWorker(AsyncMock(), _service())
+        worker._redis_client.set.side_effect = [True, None]
+
+        assert await worker.recompute() is True
+        assert await worker.recompute() is False
+
+        worker._correlation_service.recompute_all.assert_awaited_once()
+        worker._redis_client.set.assert_awaited_with(
+            REDIS_RECOMPUTE_LOCK_KEY, "1", nx=True, ex=3600
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_recompute_shortens_lock(self) -> None:
+        """A failed recompute can be retried before the interval ends."""
+        worker = CorrelationWorker(AsyncMock(), _service())
+        worker._redis_client.set.return_value = True
+        worker._correlation_service.recompute_all.side_effect = RuntimeError("es down")
+
+        with pytest.raises(RuntimeError):
+            await worker.recompute()
+
+        worker._redis_client.expire.assert_awaited_once_with(
+            REDIS_RECOMPUTE_LOCK_KEY, RECOMPUTE_RETRY_DELAY
+        )
+
+    @pytest.mark.asyncio
+    async def test_periodic_recompute_checks_at_once_then_on_tick(self) -> None:
+        """The first check runs at start; later ones every check interval."""
+        worker = CorrelationWorker(AsyncMock(), _service())
+        worker._redis_client.set.side_effect = [True, None]
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                raise asyncio.CancelledError
+
+        with (
+            patch("src.workers.correlation_worker.asyncio.sleep", fake_sleep),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await worker._recompute_periodically()
+
+        worker._correlation_service.recompute_all.assert_awaited_once()
+        assert worker._redis_client.set.await_count == 2
+        assert sleeps == [RECOMPUTE_CHECK_INTERVAL, RECOMPUTE_CHECK_INTERVAL]
@@ -315,6 +315,90 @@ class TestWorkerPoolEventProcessing:
         assert any("agent_error" in str(c) for c in xadd_calls)
 
 
+    async def test_attaches_context_pack_from_repo_mapper(
+        self, mock_redis, config
+    ):
+        """Events with a task description get a context pack from the service."""
+        agent = MagicMock(spec=["agent_type", "execute"])
+        agent.agent_type = "stub"
+        agent.execute = AsyncMock(
+            return_value=AgentResult(success=True, agent_type="stub", task_id="task-123")
+        )
+        dispatcher = AgentDispatcher()
+        dispatcher.register(agent)
+
+        pack = MagicMock()
+        pack.to_dict.return_value = {"files": []}
+        client = MagicMock()
+        client.generate_context_pack = AsyncMock(return_value=pack)
+
+        event = self._create_event()
+        event.metadata["task_description"] = "Add login endpoint"
+        mock_redis.xreadgroup.side_effect = [
+            [("asdlc:events", [(event.event_id, event.to_stream_dict())])],
+            [],
+        ]
+        mock_redis.xadd.return_value = "new-evt-id"
+
+        pool = WorkerPool(
+            redis_client=mock_redis,
+            config=config,
+            dispatcher=dispatcher,
+            workspace_path="/app/workspace",
+            repo_mapper_client=client,
+        )
+
+        task = asyncio.create_task(pool.start())
+        await asyncio.sleep(0.1)
+        await pool.stop()
+        await task
+
+        client.generate_context_pack.assert_awaited_once_with(
+            task_description="Add login endpoint", target_files=None
+        )
+        context = agent.execute.call_args.args[0]
+        assert context.context_pack == {"files": []}
+
+    async def test_dispatches_without_context_pack_on_connection_reset(
+        self, mock_redis, config
+    ):
+        """A repo mapper failure mid-request does not hold back the task."""
+        agent = MagicMock(spec=["agent_type", "execute"])
+        agent.agent_type = "stub"
+        agent.execute = AsyncMock(
+            return_value=AgentResult(success=True, agent_type="stub", task_id="task-123")
+        )
+        dispatcher = AgentDispatcher()
+        dispatcher.register(agent)
+
+        client = MagicMock()
+        client.generate_context_pack = AsyncMock(side_effect=ConnectionResetError())
+
+        event = self._create_event()
+        event.metadata["task_description"] = "Add login endpoint"
+        mock_redis.xreadgroup.side_effect = [
+            [("asdlc:events", [(event.event_id, event.to_stream_dict())])],
+            [],
+        ]
+        mock_redis.xadd.return_value = "new-evt-id"
+
+        pool = WorkerPool(
+            redis_client=mock_redis,
+            config=config,
+            dispatcher=dispatcher,
+            workspace_path="/app/workspace",
+            repo_mapper_client=client,
+        )
+
+        task = asyncio.create_task(pool.start())
+        await asyncio.sleep(0.1)
+        await pool.stop()
+        await task
+
+        context = agent.execute.call_args.args[0]
+        assert context.context_pack is None
+
+
 class TestWorkerPoolMetrics:
     """Tests for WorkerPool metrics and monitoring."""
 